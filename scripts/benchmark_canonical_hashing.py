@@ -0,0 +1,129 @@
+"""Benchmark canonical hashing with key exclusion against the copy-then-serialize path.
+
+The legacy path deep-copies the payload through ``strip_keys``, renders one ``canonical_json``
+string for the whole document, and hashes it. ``hash_canonical_payload(..., exclude=...)``
+skips excluded keys while walking the payload and feeds large lists and mappings to SHA-256
+member by member.
+Both paths must produce the same digest; the script fails if they do not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.common.canonical import (  # noqa: E402
+    canonical_json,
+    hash_canonical_payload,
+    strip_keys,
+)
+
+DEFAULT_ITERATIONS = 20
+DEFAULT_POSITIONS = 2000
+EXCLUDED_KEYS = {"created_at", "artifact_hash", "correlation_id"}
+
+
+def build_artifact_payload(*, positions: int) -> dict[str, Any]:
+    holdings = [
+        {
+            "instrument_id": f"EQ_{index:05d}",
+            "quantity": str(10 + index),
+            "value": {"amount": f"{1000 + index}.25", "currency": "USD"},
+            "weight": f"0.{index:06d}",
+            "created_at": "2026-06-19T00:00:00+00:00",
+            "tags": ["EQUITY", f"ISS_{index % 40}"],
+        }
+        for index in range(positions)
+    ]
+    return {
+        "artifact_id": "pa_benchmark",
+        "created_at": "2026-06-19T00:00:00+00:00",
+        "correlation_id": "corr-benchmark",
+        "portfolio_impact": {"before": {"holdings": holdings}, "after": {"holdings": holdings}},
+        "allocation": {f"EQ_{index:05d}": f"0.{index:06d}" for index in range(positions)},
+        "evidence_bundle": {"hashes": {"artifact_hash": "", "request_hash": "sha256:abc"}},
+    }
+
+
+def legacy_hash(payload: Any, *, exclude: set[str]) -> str:
+    stripped = strip_keys(payload, exclude=exclude)
+    digest = hashlib.sha256(canonical_json(stripped).encode("utf-8")).hexdigest()
+    return f"sha256:{digest}"
+
+
+def streaming_hash(payload: Any, *, exclude: set[str]) -> str:
+    return hash_canonical_payload(payload, exclude=exclude)
+
+
+def time_hasher(
+    hasher: Callable[..., str],
+    payload: Any,
+    *,
+    exclude: set[str],
+    iterations: int,
+) -> dict[str, float]:
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        hasher(payload, exclude=exclude)
+        samples.append(time.perf_counter() - started_at)
+    return {
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+    }
+
+
+def benchmark_payload(name: str, payload: Any, *, iterations: int) -> dict[str, Any]:
+    for exclude in (set(), EXCLUDED_KEYS):
+        if legacy_hash(payload, exclude=exclude) != streaming_hash(payload, exclude=exclude):
+            raise RuntimeError(f"CANONICAL_HASH_MISMATCH: {name}")
+    legacy = time_hasher(legacy_hash, payload, exclude=EXCLUDED_KEYS, iterations=iterations)
+    streaming = time_hasher(streaming_hash, payload, exclude=EXCLUDED_KEYS, iterations=iterations)
+    return {
+        "payload": name,
+        "legacy": legacy,
+        "streaming": streaming,
+        "speedup": round(legacy["mean_ms"] / streaming["mean_ms"], 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--positions", type=int, default=DEFAULT_POSITIONS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    payloads = [("synthetic_artifact", build_artifact_payload(positions=args.positions))]
+    for path in sorted((REPO_ROOT / "docs" / "demo").glob("*.json")):
+        payloads.append((str(path.relative_to(REPO_ROOT)), json.loads(path.read_text("utf-8"))))
+
+    report = {
+        "iterations": args.iterations,
+        "excluded_keys": sorted(EXCLUDED_KEYS),
+        "results": [
+            benchmark_payload(name, payload, iterations=args.iterations)
+            for name, payload in payloads
+        ],
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
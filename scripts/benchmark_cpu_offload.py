@@ -0,0 +1,209 @@
+"""Benchmark lightweight-request latency under concurrent CPU-bound simulations.
+
+Runs the same mixed load twice: local simulations inline on request threads, then through the
+``ADVISORY_CPU_OFFLOAD_WORKERS`` process pool. A probe thread meanwhile runs a small canonical
+hash every few milliseconds, standing in for a lightweight route, and records the latency from
+when each probe was due to when it finished.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.advisory_engine import run_proposal_simulation  # noqa: E402
+from src.core.common.canonical import hash_canonical_payload  # noqa: E402
+from src.core.common.cpu_offload import (  # noqa: E402
+    ADVISORY_CPU_OFFLOAD_WORKERS_ENV,
+    configure_cpu_offload_observer,
+    run_cpu_bound,
+    shutdown_cpu_offload_pool,
+)
+from src.core.models import (  # noqa: E402
+    CashBalance,
+    EngineOptions,
+    MarketDataSnapshot,
+    PortfolioSnapshot,
+    Position,
+    Price,
+    ShelfEntry,
+)
+
+DEFAULT_CONCURRENCY = 25
+DEFAULT_SIMULATIONS = 100
+DEFAULT_POSITIONS = 300
+DEFAULT_PROBE_INTERVAL_SECONDS = 0.002
+
+
+def build_simulation_kwargs(*, positions: int) -> dict[str, Any]:
+    instrument_ids = [f"EQ_{index:04d}" for index in range(positions)]
+    return {
+        "portfolio": PortfolioSnapshot(
+            portfolio_id="pf_benchmark",
+            base_currency="USD",
+            positions=[
+                Position(instrument_id=instrument_id, quantity=Decimal("10"))
+                for instrument_id in instrument_ids
+            ],
+            cash_balances=[CashBalance(currency="USD", amount=Decimal("10000"))],
+        ),
+        "market_data": MarketDataSnapshot(
+            prices=[
+                Price(instrument_id=instrument_id, price=Decimal("100"), currency="USD")
+                for instrument_id in instrument_ids
+            ],
+            fx_rates=[],
+        ),
+        "shelf": [
+            ShelfEntry(
+                instrument_id=instrument_id,
+                status="APPROVED",
+                asset_class="EQUITY",
+                issuer_id=f"ISS_{index % 40}",
+            )
+            for index, instrument_id in enumerate(instrument_ids)
+        ],
+        "options": EngineOptions(enable_proposal_simulation=True),
+        "proposed_cash_flows": [],
+        "proposed_trades": [
+            {"side": "BUY", "instrument_id": instrument_ids[0], "quantity": "1"},
+            {"side": "SELL", "instrument_id": instrument_ids[-1], "quantity": "1"},
+        ],
+        "request_hash": "proposal_hash_benchmark",
+        "correlation_id": "corr-benchmark",
+    }
+
+
+def run_mixed_load(
+    *,
+    workers: int,
+    concurrency: int,
+    simulations: int,
+    positions: int,
+    probe_interval_seconds: float,
+) -> dict[str, Any]:
+    os.environ[ADVISORY_CPU_OFFLOAD_WORKERS_ENV] = str(workers)
+    shutdown_cpu_offload_pool()
+    queue_seconds: list[float] = []
+    configure_cpu_offload_observer(_QueueRecorder(queue_seconds))
+    kwargs = build_simulation_kwargs(positions=positions)
+    if workers:
+        # Warm the pool so worker start-up is not attributed to the first requests.
+        for _ in range(workers):
+            run_cpu_bound("simulation", run_proposal_simulation, **kwargs)
+        queue_seconds.clear()
+
+    stop = threading.Event()
+    probe_latencies: list[float] = []
+    probe = threading.Thread(
+        target=_probe,
+        args=(stop, probe_latencies, probe_interval_seconds),
+        daemon=True,
+    )
+    started_at = time.perf_counter()
+    probe.start()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(
+                lambda _index: run_cpu_bound("simulation", run_proposal_simulation, **kwargs),
+                range(simulations),
+            )
+        )
+    elapsed_seconds = time.perf_counter() - started_at
+    stop.set()
+    probe.join()
+    configure_cpu_offload_observer(None)
+    shutdown_cpu_offload_pool()
+    return {
+        "workers": workers,
+        "simulations_per_second": round(simulations / elapsed_seconds, 2),
+        "probe": _percentiles(probe_latencies),
+        "offload_queue": _percentiles(queue_seconds) if workers else None,
+    }
+
+
+class _QueueRecorder:
+    def __init__(self, queue_seconds: list[float]) -> None:
+        self._queue_seconds = queue_seconds
+
+    def __call__(self, *, stage: str, mode: str, queue_seconds: float, run_seconds: float) -> None:
+        if mode == "process":
+            self._queue_seconds.append(queue_seconds)
+
+
+def _probe(stop: threading.Event, latencies: list[float], interval_seconds: float) -> None:
+    # Latency runs from when the probe was due, so time spent waiting for the GIL is included.
+    sequence = 0
+    due_at = time.perf_counter()
+    while not stop.is_set():
+        hash_canonical_payload({"probe": sequence, "route": "lightweight"})
+        finished_at = time.perf_counter()
+        latencies.append(finished_at - due_at)
+        sequence += 1
+        time.sleep(interval_seconds)
+        due_at = finished_at + interval_seconds
+
+
+def _percentiles(samples: list[float]) -> dict[str, float] | None:
+    if len(samples) < 2:
+        return None
+    cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "count": len(samples),
+        "p50_ms": round(cut_points[49] * 1000, 3),
+        "p95_ms": round(cut_points[94] * 1000, 3),
+        "p99_ms": round(cut_points[98] * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--simulations", type=int, default=DEFAULT_SIMULATIONS)
+    parser.add_argument("--positions", type=int, default=DEFAULT_POSITIONS)
+    parser.add_argument(
+        "--probe-interval-seconds", type=float, default=DEFAULT_PROBE_INTERVAL_SECONDS
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = {
+        "concurrency": args.concurrency,
+        "simulations": args.simulations,
+        "positions": args.positions,
+        "cpu_count": os.cpu_count(),
+        "runs": [
+            run_mixed_load(
+                workers=workers,
+                concurrency=args.concurrency,
+                simulations=args.simulations,
+                positions=args.positions,
+                probe_interval_seconds=args.probe_interval_seconds,
+            )
+            for workers in (0, args.workers)
+        ],
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
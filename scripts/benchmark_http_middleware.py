@@ -0,0 +1,187 @@
+"""Benchmark per-request middleware overhead on lightweight routes.
+
+Sends sequential in-process ASGI requests to ``/health/live`` and ``/platform/capabilities`` on
+the service app, built three ways:
+
+- ``bare``: the routes with no user middleware.
+- ``layered``: each pipeline stage and the security headers in their own ``BaseHTTPMiddleware``,
+  the way the app was assembled before the single pipeline.
+- ``pipeline``: the shipped single pure-ASGI ``HttpPipelineMiddleware``.
+
+Overhead is each variant's latency minus the bare latency at the same percentile.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+from starlette.types import ASGIApp  # noqa: E402
+
+from src.api.http_pipeline import (  # noqa: E402
+    HttpPipelineConfig,
+    HttpPipelineMiddleware,
+    HttpPipelineStage,
+)
+from src.api.main import app  # noqa: E402
+
+DEFAULT_PATHS = ("/health/live", "/platform/capabilities")
+DEFAULT_REQUESTS = 2000
+DEFAULT_WARMUP_REQUESTS = 200
+
+
+class _LayeredStageMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, *, stage: HttpPipelineStage) -> None:
+        super().__init__(app)
+        self._stage = stage
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        opened = self._stage.open(request)
+        if isinstance(opened, Response):
+            return opened
+        response: Response | None = None
+        try:
+            response = await call_next(request)
+            opened.on_response_start(response.status_code, response.headers)  # type: ignore[arg-type]
+            return response
+        finally:
+            opened.close(response.status_code if response is not None else None)
+
+
+class _LayeredHeadersMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, *, headers: dict[str, str]) -> None:
+        super().__init__(app)
+        self._headers = headers
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        for name, value in self._headers.items():
+            response.headers.setdefault(name, value)
+        return response
+
+
+class _GuardMiddleware:
+    def __init__(self, app: ASGIApp, *, guard: Any) -> None:
+        self._guarded = guard(app)
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        await self._guarded(scope, receive, send)
+
+
+def _build_variant(variant: str) -> list[Middleware]:
+    config: HttpPipelineConfig = app.state.http_pipeline
+    inner = [
+        middleware
+        for middleware in app.user_middleware
+        if middleware.cls is not HttpPipelineMiddleware
+    ]
+    if variant == "bare":
+        return []
+    if variant == "pipeline":
+        return [Middleware(HttpPipelineMiddleware, config=config), *inner]
+    # Outermost first, mirroring the old add_middleware order.
+    layered = [Middleware(_LayeredHeadersMiddleware, headers=config.default_response_headers)]
+    layered += [Middleware(_GuardMiddleware, guard=guard) for guard in config.guards]
+    layered += [Middleware(_LayeredStageMiddleware, stage=stage) for stage in config.stages]
+    return [*layered, *inner]
+
+
+async def _measure(*, variant: str, path: str, requests: int, warmup: int) -> list[float]:
+    original_middleware = list(app.user_middleware)
+    app.user_middleware[:] = _build_variant(variant)
+    app.middleware_stack = None
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            for _ in range(warmup):
+                await client.get(path)
+            samples: list[float] = []
+            for _ in range(requests):
+                started_at = time.perf_counter()
+                response = await client.get(path)
+                samples.append(time.perf_counter() - started_at)
+                if response.status_code != 200:
+                    raise RuntimeError(f"BENCHMARK_UNEXPECTED_STATUS:{path}:{response.status_code}")
+        return samples
+    finally:
+        app.user_middleware[:] = original_middleware
+        app.middleware_stack = None
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_us": round(cut_points[49] * 1_000_000, 1),
+        "p95_us": round(cut_points[94] * 1_000_000, 1),
+        "p99_us": round(cut_points[98] * 1_000_000, 1),
+    }
+
+
+async def _run(*, paths: tuple[str, ...], requests: int, warmup: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for path in paths:
+        by_variant = {
+            variant: _percentiles(
+                await _measure(variant=variant, path=path, requests=requests, warmup=warmup)
+            )
+            for variant in ("bare", "layered", "pipeline")
+        }
+        bare = by_variant["bare"]
+        results[path] = {
+            "latency": by_variant,
+            "overhead": {
+                variant: {key: round(value - bare[key], 1) for key, value in latency.items()}
+                for variant, latency in by_variant.items()
+                if variant != "bare"
+            },
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--warmup-requests", type=int, default=DEFAULT_WARMUP_REQUESTS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    # Access logs are emitted per request; silence them so log I/O does not dominate.
+    logging.getLogger().setLevel(logging.WARNING)
+    report = {
+        "requests": args.requests,
+        "paths": asyncio.run(
+            _run(
+                paths=tuple(args.paths or DEFAULT_PATHS),
+                requests=args.requests,
+                warmup=args.warmup_requests,
+            )
+        ),
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
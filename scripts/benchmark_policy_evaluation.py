@@ -0,0 +1,195 @@
+"""Benchmark policy-pack evaluation throughput with and without the compiled evaluation plan.
+
+The cached path evaluates against the shared plan that activation compiles once per policy pack
+version. The uncached path drops the plan before every evaluation, which is what each request paid
+when selector sets and the rule dispatch were rebuilt per call. The pack is the SG reference pack
+with its rules repeated up to ``--rules`` so the pack size stays fixed between runs. Both paths
+must produce the same evaluation; the script fails if they do not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.policy_packs.catalog import PolicyPackCatalogStore  # noqa: E402
+from src.core.policy_packs.catalog_models import PolicyPackDetailResponse  # noqa: E402
+from src.core.policy_packs.catalog_reference_packs import reference_policy_packs  # noqa: E402
+from src.core.policy_packs.evaluation import evaluate_active_policy_pack_detail  # noqa: E402
+from src.core.policy_packs.evaluation_models import PolicyPackEvaluationResponse  # noqa: E402
+from src.core.policy_packs.evaluation_plan import (  # noqa: E402
+    clear_policy_pack_evaluation_plans,
+    compile_policy_pack_evaluation_plan,
+)
+
+DEFAULT_EVALUATIONS = 2000
+DEFAULT_RULES = 24
+DEFAULT_REPEATS = 5
+POLICY_PACK_ID = "SG_PRIVATE_BANKING_REFERENCE"
+POLICY_VERSION = "2026.05"
+
+
+def build_policy_pack_detail(*, rules: int) -> PolicyPackDetailResponse:
+    detail = PolicyPackCatalogStore(reference_policy_packs()).get_policy_pack_version(
+        policy_pack_id=POLICY_PACK_ID,
+        policy_version=POLICY_VERSION,
+    )
+    return detail.model_copy(
+        update={
+            "policy_pack": detail.policy_pack.model_copy(update={"activation_state": "ACTIVE"}),
+            "rules": list(islice(cycle(detail.rules), rules)),
+        }
+    )
+
+
+def build_evidence_bundle() -> dict[str, Any]:
+    return {
+        "context_resolution": {
+            "advisory_policy_context": {
+                "jurisdiction": "SG",
+                "client_classification": "ACCREDITED_INVESTOR",
+                "booking_center_code": "SG",
+                "legal_entity_code": "REFERENCE",
+                "mandate_id": "MANDATE-BALANCED-001",
+                "objectives": ["capital_preservation", "balanced_growth"],
+                "restrictions": ["no_single_name_above_10pct"],
+            },
+        },
+        "inputs": {
+            "portfolio_snapshot": {
+                "portfolio_id": "PB_SG_GLOBAL_BAL_001",
+                "positions": [{"instrument_id": "US_EQ_ETF", "quantity": "100"}],
+                "cash_balances": [{"currency": "USD", "amount": "50000"}],
+            },
+            "market_data_snapshot": {
+                "prices": [{"instrument_id": "US_EQ_ETF", "price": "100", "currency": "USD"}],
+                "fx_rates": [{"pair": "USD/SGD", "rate": "1.35"}],
+            },
+            "shelf_entries": [
+                {
+                    "instrument_id": "US_EQ_ETF",
+                    "eligibility": {"jurisdictions": ["SG"]},
+                    "target_market": {"client_segments": ["ACCREDITED_INVESTOR"]},
+                    "complexity": "NON_COMPLEX",
+                    "private_asset": False,
+                    "structured_product": False,
+                }
+            ],
+            "proposed_trades": [{"instrument_id": "US_EQ_ETF", "side": "BUY"}],
+        },
+        "artifact": {
+            "assumptions_and_limits": {
+                "costs_and_fees": {"included": True, "notes": "Estimated costs captured."},
+            },
+            "disclosures": {
+                "risk_disclaimer": "Risk disclosure captured.",
+                "product_docs": [{"instrument_id": "US_EQ_ETF", "doc_ref": "Factsheet"}],
+            },
+        },
+        "conflict_evidence": {"material_conflict": False, "review_ref": "conflict-review-001"},
+    }
+
+
+def evaluate_with_plan(
+    detail: PolicyPackDetailResponse, evidence_bundle: dict[str, Any]
+) -> PolicyPackEvaluationResponse:
+    return evaluate_active_policy_pack_detail(evidence_bundle=evidence_bundle, detail=detail)
+
+
+def evaluate_without_plan(
+    detail: PolicyPackDetailResponse, evidence_bundle: dict[str, Any]
+) -> PolicyPackEvaluationResponse:
+    clear_policy_pack_evaluation_plans()
+    return evaluate_with_plan(detail, evidence_bundle)
+
+
+def time_evaluations(
+    evaluate: Callable[[PolicyPackDetailResponse, dict[str, Any]], PolicyPackEvaluationResponse],
+    detail: PolicyPackDetailResponse,
+    evidence_bundle: dict[str, Any],
+    *,
+    evaluations: int,
+    repeats: int,
+) -> dict[str, float]:
+    rates = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for _ in range(evaluations):
+            evaluate(detail, evidence_bundle)
+        rates.append(evaluations / (time.perf_counter() - started_at))
+    return {
+        "evaluations_per_second": round(statistics.fmean(rates), 1),
+        "best_evaluations_per_second": round(max(rates), 1),
+    }
+
+
+def time_compile(detail: PolicyPackDetailResponse, *, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        compile_policy_pack_evaluation_plan(detail)
+        samples.append(time.perf_counter() - started_at)
+    return round(statistics.fmean(samples) * 1000, 4)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--evaluations", type=int, default=DEFAULT_EVALUATIONS)
+    parser.add_argument("--rules", type=int, default=DEFAULT_RULES)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    detail = build_policy_pack_detail(rules=args.rules)
+    evidence_bundle = build_evidence_bundle()
+    uncached_result = evaluate_without_plan(detail, evidence_bundle).model_dump(mode="json")
+    if uncached_result != evaluate_with_plan(detail, evidence_bundle).model_dump(mode="json"):
+        raise RuntimeError("POLICY_EVALUATION_PLAN_RESULT_MISMATCH")
+
+    uncached = time_evaluations(
+        evaluate_without_plan,
+        detail,
+        evidence_bundle,
+        evaluations=args.evaluations,
+        repeats=args.repeats,
+    )
+    evaluate_with_plan(detail, evidence_bundle)
+    cached = time_evaluations(
+        evaluate_with_plan,
+        detail,
+        evidence_bundle,
+        evaluations=args.evaluations,
+        repeats=args.repeats,
+    )
+    report = {
+        "policy_pack_id": POLICY_PACK_ID,
+        "policy_version": POLICY_VERSION,
+        "rules": len(detail.rules),
+        "evaluations": args.evaluations,
+        "repeats": args.repeats,
+        "compile_ms": time_compile(detail, repeats=args.repeats),
+        "uncached_plan": uncached,
+        "cached_plan": cached,
+        "speedup": round(cached["evaluations_per_second"] / uncached["evaluations_per_second"], 2),
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""Export proposal lineage and audit evidence as a hash-chained NDJSON or tar bundle.
+
+Walks every proposal of a portfolio or created-at window with keyset pages and streams its
+versions, workflow events, approvals, memos, memo events and copilot runs, followed by the policy
+evaluations in the same scope, to ``--output``. Memory use does not grow with the size of the
+scope. The summary on stderr carries the export id and head hash; keep it apart from the bundle.
+``--verify`` recomputes the hash chain of an NDJSON bundle instead of exporting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+from uuid import uuid4
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.replay.evidence_export import (  # noqa: E402
+    EvidenceExportVerification,
+    iter_evidence_export_entries,
+    normalize_evidence_export_scope,
+    render_evidence_export,
+    report_evidence_export_head,
+    verify_evidence_export_ndjson,
+)
+from src.runtime.advisory_copilot_repositories import (  # noqa: E402
+    build_advisory_copilot_repository,
+)
+from src.runtime.policy_repositories import build_policy_evaluation_repository  # noqa: E402
+from src.runtime.proposal_repositories import build_repository, proposal_postgres_dsn  # noqa: E402
+
+
+def _write_chunks(chunks: Iterable[bytes], output: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        output.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _export(args: argparse.Namespace) -> int:
+    scope = normalize_evidence_export_scope(
+        portfolio_id=args.portfolio_id,
+        created_from=args.created_from,
+        created_to=args.created_to,
+        page_size=args.page_size,
+    )
+    exported_at = datetime.now(UTC)
+    export_id = f"evx_{uuid4().hex}"
+    copilot_dsn = os.getenv("ADVISORY_COPILOT_POSTGRES_DSN", "").strip() or proposal_postgres_dsn()
+    summary: dict[str, Any] = {"export_id": export_id, "exported_at": exported_at.isoformat()}
+
+    def _record_head(head: EvidenceExportVerification) -> None:
+        summary.update(entry_count=head.entry_count, head_hash=head.head_hash)
+
+    entries = report_evidence_export_head(
+        iter_evidence_export_entries(
+            scope=scope,
+            proposals=build_repository(),
+            exported_at=exported_at,
+            policy_evaluations=(
+                None if args.skip_policy_evaluations else build_policy_evaluation_repository()
+            ),
+            copilot_runs=(
+                None
+                if args.skip_copilot_runs
+                else build_advisory_copilot_repository(dsn=copilot_dsn)
+            ),
+            export_id=export_id,
+        ),
+        on_complete=_record_head,
+    )
+    chunks = render_evidence_export(entries, export_format=args.format, exported_at=exported_at)
+    if args.output == "-":
+        written = _write_chunks(chunks, sys.stdout.buffer)
+    else:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("wb") as handle:
+            written = _write_chunks(chunks, handle)
+    summary["bytes_written"] = written
+    print(json.dumps(summary, sort_keys=True), file=sys.stderr)
+    return 0
+
+
+def _verify(path: Path) -> int:
+    with path.open("rb") as lines:
+        verification = verify_evidence_export_ndjson(lines)
+    print(json.dumps(verification.to_dict(), indent=2, sort_keys=True))
+    return 0 if verification.valid else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--portfolio-id")
+    parser.add_argument("--created-from", type=datetime.fromisoformat)
+    parser.add_argument("--created-to", type=datetime.fromisoformat)
+    parser.add_argument("--format", choices=("ndjson", "tar"), default="ndjson")
+    parser.add_argument("--page-size", type=int, default=None)
+    parser.add_argument("--output", default="-", help="bundle path, or - for standard output")
+    parser.add_argument("--skip-policy-evaluations", action="store_true")
+    parser.add_argument("--skip-copilot-runs", action="store_true")
+    parser.add_argument("--verify", type=Path, help="verify an NDJSON bundle instead of exporting")
+    args = parser.parse_args(argv)
+
+    if args.verify is not None:
+        return _verify(args.verify)
+    return _export(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""Bulk-import historical proposals from NDJSON into the proposal store.
+
+Each input line holds one proposal with its versions, workflow events and approvals. Lines are
+validated, staged in batches with COPY, checked against stored history in SQL, and merged in one
+transaction per batch. Proposals whose rows conflict with stored rows are rejected and reported;
+rows that are already stored unchanged are skipped, so a run can be repeated safely. Apply the
+proposal migrations before the first run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.proposals.history_import import (  # noqa: E402
+    DEFAULT_PROPOSAL_HISTORY_IMPORT_BATCH_SIZE,
+    ProposalHistoryImportReport,
+    import_proposal_history_ndjson,
+)
+from src.runtime.proposal_repositories import build_proposal_history_importer  # noqa: E402
+
+
+def _print_progress(report: ProposalHistoryImportReport) -> None:
+    progress = report.to_dict()
+    progress.pop("rejections")
+    print(json.dumps(progress, sort_keys=True), file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", required=True, help="NDJSON file, or - for standard input")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_PROPOSAL_HISTORY_IMPORT_BATCH_SIZE
+    )
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--quiet", action="store_true", help="do not print per-batch progress")
+    args = parser.parse_args(argv)
+
+    repository = build_proposal_history_importer()
+    on_batch = None if args.quiet else _print_progress
+    if args.input == "-":
+        report = import_proposal_history_ndjson(
+            lines=sys.stdin.buffer,
+            repository=repository,
+            batch_size=args.batch_size,
+            on_batch=on_batch,
+        )
+    else:
+        with Path(args.input).open("rb") as lines:
+            report = import_proposal_history_ndjson(
+                lines=lines,
+                repository=repository,
+                batch_size=args.batch_size,
+                on_batch=on_batch,
+            )
+    rendered = json.dumps(report.to_dict(), indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 1 if report.rejection_counts else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""Re-evaluate existing proposals against a newly activated policy-pack version.
+
+Walks the policy evaluation records of the pack, evaluates each affected proposal version's
+stored evidence against the active version in parallel chunks, and writes every chunk in one
+transaction. With ``--checkpoint`` the progress after each committed chunk is written to that file
+and read back on the next run, so an interrupted run resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.policy_packs import (  # noqa: E402
+    configure_policy_pack_catalog_repository,
+)
+from src.core.policy_packs.re_evaluation import (  # noqa: E402
+    PolicyReEvaluationCheckpoint,
+    PolicyReEvaluationPrincipal,
+    proposal_version_evidence_loader,
+    run_policy_re_evaluation,
+)
+from src.runtime.policy_re_evaluation import policy_re_evaluation_settings  # noqa: E402
+from src.runtime.policy_repositories import (  # noqa: E402
+    build_policy_evaluation_repository,
+    build_policy_pack_catalog_repository,
+)
+from src.runtime.proposal_repositories import build_repository  # noqa: E402
+
+
+def _read_checkpoint(path: Path | None) -> PolicyReEvaluationCheckpoint | None:
+    if path is None or not path.exists():
+        return None
+    return PolicyReEvaluationCheckpoint.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staged = path.with_suffix(path.suffix + ".tmp")
+    staged.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    staged.replace(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--policy-pack-id", required=True)
+    parser.add_argument("--policy-version", required=True)
+    parser.add_argument("--tenant-id", required=True)
+    parser.add_argument("--legal-entity-code", required=True)
+    parser.add_argument(
+        "--service-identity",
+        default=os.getenv("POLICY_RE_EVALUATION_SERVICE_IDENTITY", "lotus-advise"),
+    )
+    parser.add_argument("--correlation-id", default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--max-chunks", type=int, default=None)
+    parser.add_argument("--checkpoint", type=Path)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    settings = policy_re_evaluation_settings(
+        chunk_size=args.chunk_size,
+        max_workers=args.max_workers,
+        max_chunks=args.max_chunks,
+    )
+    configure_policy_pack_catalog_repository(build_policy_pack_catalog_repository())
+    checkpoint_path: Path | None = args.checkpoint
+    report = run_policy_re_evaluation(
+        policy_pack_id=args.policy_pack_id,
+        policy_version=args.policy_version,
+        principal=PolicyReEvaluationPrincipal(
+            tenant_id=args.tenant_id,
+            legal_entity_code=args.legal_entity_code,
+            service_identity=args.service_identity,
+            correlation_id=args.correlation_id or f"policy-re-evaluation-{uuid.uuid4()}",
+        ),
+        load_evidence=proposal_version_evidence_loader(build_repository()),
+        repository=build_policy_evaluation_repository(),
+        settings=settings,
+        checkpoint=_read_checkpoint(checkpoint_path),
+        on_checkpoint=(
+            (lambda checkpoint: _write_json(checkpoint_path, checkpoint.to_dict()))
+            if checkpoint_path is not None
+            else None
+        ),
+    )
+    rendered = json.dumps(report.to_dict(), indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
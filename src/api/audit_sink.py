@@ -0,0 +1,204 @@
+"""Bounded background writer for enterprise audit events.
+
+``emit_audit_event`` used to format and write each event on the request path. While a sink is
+active, the event is redacted and turned into a log record on the caller, then queued. A daemon
+thread drains the queue in batches and dispatches each record through its logger, inside a copy
+of the caller's context so correlation, request, and trace ids still reach the formatter. When
+the queue is full, ``ENTERPRISE_AUDIT_OVERFLOW_POLICY`` decides what happens. ``inline`` (the
+default) writes the event on the caller, which gives backpressure without losing the event.
+``drop`` discards the event and counts it. ``close`` drains every queued event before it
+returns.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Literal
+
+from src.api.observability import record_audit_sink_batch, record_audit_sink_event
+
+AuditOverflowPolicy = Literal["inline", "drop"]
+
+DEFAULT_AUDIT_QUEUE_SIZE = 10_000
+DEFAULT_AUDIT_BATCH_SIZE = 256
+DEFAULT_AUDIT_CLOSE_TIMEOUT_SECONDS = 10.0
+
+_AUDIT_OVERFLOW_POLICIES: frozenset[str] = frozenset({"inline", "drop"})
+
+
+@dataclass(frozen=True)
+class _QueuedAuditEvent:
+    context: contextvars.Context
+    logger: logging.Logger
+    record: logging.LogRecord
+
+
+class AuditEventSink:
+    def __init__(
+        self,
+        *,
+        queue_size: int = DEFAULT_AUDIT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_AUDIT_BATCH_SIZE,
+        overflow_policy: AuditOverflowPolicy = "inline",
+    ) -> None:
+        self._queue: queue.Queue[_QueuedAuditEvent | None] = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._overflow_policy = overflow_policy
+        self._lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._drain, name="enterprise-audit-sink", daemon=True
+        )
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def submit(self, logger: logging.Logger, record: logging.LogRecord) -> None:
+        event = _QueuedAuditEvent(context=contextvars.copy_context(), logger=logger, record=record)
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    pass
+                else:
+                    record_audit_sink_event(outcome="queued")
+                    return
+        # Events submitted during shutdown are always written rather than dropped.
+        if self._overflow_policy == "drop" and not closed:
+            record_audit_sink_event(outcome="dropped")
+            return
+        _write_event(event)
+        record_audit_sink_event(outcome="inline")
+
+    def close(self, timeout_seconds: float = DEFAULT_AUDIT_CLOSE_TIMEOUT_SECONDS) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if not self._writer.is_alive():
+            self._drain_pending()
+            return
+        # The writer stops at the sentinel, after everything queued before it.
+        self._queue.put(None)
+        self._writer.join(timeout_seconds)
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            events = [event for event in batch if event is not None]
+            for event in events:
+                _write_event(event)
+            if events:
+                record_audit_sink_batch(size=len(events))
+            if len(events) != len(batch):
+                return
+
+    def _drain_pending(self) -> None:
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if event is not None:
+                _write_event(event)
+
+
+def _write_event(event: _QueuedAuditEvent) -> None:
+    try:
+        event.context.run(event.logger.handle, event.record)
+    except Exception:  # pragma: no cover - handlers report their own errors
+        logging.getLogger(__name__).exception("enterprise_audit_sink_write_failed")
+
+
+def audit_sink_enabled() -> bool:
+    return os.getenv("ENTERPRISE_AUDIT_ASYNC_ENABLED", "true").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def audit_sink_queue_size() -> int:
+    return _positive_env_int("ENTERPRISE_AUDIT_QUEUE_SIZE", DEFAULT_AUDIT_QUEUE_SIZE)
+
+
+def audit_sink_batch_size() -> int:
+    return _positive_env_int("ENTERPRISE_AUDIT_BATCH_SIZE", DEFAULT_AUDIT_BATCH_SIZE)
+
+
+def audit_sink_overflow_policy() -> AuditOverflowPolicy:
+    raw_value = os.getenv("ENTERPRISE_AUDIT_OVERFLOW_POLICY", "inline").strip().lower()
+    if raw_value not in _AUDIT_OVERFLOW_POLICIES:
+        raise RuntimeError("ENTERPRISE_AUDIT_OVERFLOW_POLICY_INVALID")
+    return "drop" if raw_value == "drop" else "inline"
+
+
+def _positive_env_int(name: str, default: int) -> int:
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError(f"{name}_INVALID") from exc
+    if value <= 0:
+        raise RuntimeError(f"{name}_INVALID")
+    return value
+
+
+_ACTIVE_SINK: AuditEventSink | None = None
+
+
+def current_audit_event_sink() -> AuditEventSink | None:
+    return _ACTIVE_SINK
+
+
+def start_audit_event_sink() -> AuditEventSink | None:
+    global _ACTIVE_SINK
+    if not audit_sink_enabled():
+        return None
+    sink = AuditEventSink(
+        queue_size=audit_sink_queue_size(),
+        batch_size=audit_sink_batch_size(),
+        overflow_policy=audit_sink_overflow_policy(),
+    )
+    sink.start()
+    _ACTIVE_SINK = sink
+    return sink
+
+
+def stop_audit_event_sink(sink: AuditEventSink | None) -> None:
+    global _ACTIVE_SINK
+    if sink is None:
+        return
+    if _ACTIVE_SINK is sink:
+        _ACTIVE_SINK = None
+    sink.close()
+
+
+__all__ = [
+    "DEFAULT_AUDIT_BATCH_SIZE",
+    "DEFAULT_AUDIT_QUEUE_SIZE",
+    "AuditEventSink",
+    "AuditOverflowPolicy",
+    "audit_sink_batch_size",
+    "audit_sink_enabled",
+    "audit_sink_overflow_policy",
+    "audit_sink_queue_size",
+    "current_audit_event_sink",
+    "start_audit_event_sink",
+    "stop_audit_event_sink",
+]
@@ -0,0 +1,251 @@
+"""Compiled enterprise authorization and feature-flag policy.
+
+The enterprise middleware runs on every request, so capability rules and feature flags are
+parsed once into an immutable ``EnterprisePolicySnapshot``: a per-method path-segment trie for
+capability lookup and flat tenant/role tables for flags. ``current_enterprise_policy`` compares
+the raw environment values with the ones the snapshot was compiled from and recompiles when any
+of them changes, so configuration updates apply without a restart.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from src.api.observability import record_enterprise_policy_reload
+
+ENTERPRISE_POLICY_ENV_NAMES: tuple[str, ...] = (
+    "ENTERPRISE_ENFORCE_AUTHZ",
+    "ENTERPRISE_POLICY_VERSION",
+    "ENTERPRISE_CAPABILITY_RULES_JSON",
+    "ENTERPRISE_FEATURE_FLAGS_JSON",
+    "ENTERPRISE_MAX_WRITE_PAYLOAD_BYTES",
+    "ENTERPRISE_MAX_STREAMED_UPLOAD_BYTES",
+    "ENTERPRISE_MAX_BULK_SIMULATION_PAYLOAD_BYTES",
+)
+DEFAULT_POLICY_VERSION = "1.0.0"
+DEFAULT_MAX_WRITE_PAYLOAD_BYTES = 1_048_576
+DEFAULT_MAX_STREAMED_UPLOAD_BYTES = 134_217_728
+DEFAULT_MAX_BULK_SIMULATION_PAYLOAD_BYTES = 67_108_864
+
+_ENABLED_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def env_value_enabled(raw: str | None, default: str) -> bool:
+    return (default if raw is None else raw).strip().lower() in _ENABLED_VALUES
+
+
+def env_value_int(raw: str | None, default: int) -> int:
+    try:
+        return int(str(default) if raw is None else raw)
+    except ValueError:
+        return default
+
+
+def parse_json_map(raw: str | None) -> dict[str, Any]:
+    try:
+        parsed = json.loads("{}" if raw is None else raw)
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def json_map_issue(raw: str | None, issue: str) -> str | None:
+    if raw is None or not raw.strip():
+        return None
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return issue
+    return None if isinstance(parsed, dict) else issue
+
+
+def normalize_capability_rules(rules: Mapping[Any, Any]) -> dict[str, str]:
+    normalized: dict[str, str] = {}
+    for key, value in rules.items():
+        if not isinstance(key, str):
+            continue
+        capability_rule = key.strip()
+        capability = str(value).strip()
+        if capability_rule and capability:
+            normalized[capability_rule] = capability
+    return normalized
+
+
+class _CapabilityTrieNode:
+    __slots__ = ("children", "rule")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _CapabilityTrieNode] = {}
+        # (rule position, capability); the lowest position wins, as in a linear rule scan.
+        self.rule: tuple[int, str] | None = None
+
+
+class CapabilityRouteTrie:
+    """Method and path-segment trie over ``"METHOD /path/prefix": capability`` rules.
+
+    A rule applies to its own path and every path below it. When several rules apply, the one
+    listed first in the configuration wins, matching the original first-match rule scan.
+    """
+
+    def __init__(self, rules: Mapping[str, str]) -> None:
+        self._roots: dict[str, _CapabilityTrieNode] = {}
+        for position, (key, capability) in enumerate(rules.items()):
+            method, separator, rule_path = key.partition(" ")
+            if not separator:
+                continue
+            node = self._roots.setdefault(method.upper(), _CapabilityTrieNode())
+            for segment in _path_segments(rule_path):
+                node = node.children.setdefault(segment, _CapabilityTrieNode())
+            if node.rule is None:
+                node.rule = (position, capability)
+
+    def required_capability(self, method: str, path: str) -> str | None:
+        node = self._roots.get(method.upper())
+        if node is None:
+            return None
+        best: tuple[int, str] | None = None
+        for segment in _path_segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            if node.rule is not None and (best is None or node.rule[0] < best[0]):
+                best = node.rule
+        return None if best is None else best[1]
+
+
+def _path_segments(path: str) -> list[str]:
+    return path.rstrip("/").split("/")
+
+
+class FeatureFlagTable:
+    """Flattened ``feature -> tenant -> role`` flags with tenant and global ``*`` fallbacks."""
+
+    def __init__(self, flags: Mapping[str, Any]) -> None:
+        self._explicit: dict[tuple[str, str, str], bool] = {}
+        self._tenant_defaults: dict[tuple[str, str], bool] = {}
+        self._global_defaults: dict[str, bool] = {}
+        for feature_key, tenants in flags.items():
+            if not isinstance(tenants, dict):
+                continue
+            for tenant_id, roles in tenants.items():
+                if not isinstance(roles, dict):
+                    continue
+                for role, enabled in roles.items():
+                    if isinstance(enabled, bool):
+                        self._explicit[(feature_key, tenant_id, role)] = enabled
+                tenant_default = roles.get("*")
+                if isinstance(tenant_default, bool):
+                    self._tenant_defaults[(feature_key, tenant_id)] = tenant_default
+                    if tenant_id == "*":
+                        self._global_defaults[feature_key] = tenant_default
+
+    def is_enabled(self, feature_key: str, tenant_id: str, role: str) -> bool:
+        explicit = self._explicit.get((feature_key, tenant_id, role))
+        if explicit is not None:
+            return explicit
+        tenant_default = self._tenant_defaults.get((feature_key, tenant_id))
+        if tenant_default is not None:
+            return tenant_default
+        return self._global_defaults.get(feature_key, False)
+
+
+@dataclass(frozen=True)
+class EnterprisePolicySnapshot:
+    source: tuple[str | None, ...]
+    enforce_authz: bool
+    policy_version: str
+    capability_rules: Mapping[str, str]
+    capability_rules_issue: str | None
+    capability_trie: CapabilityRouteTrie
+    feature_flags: FeatureFlagTable
+    max_write_payload_bytes: int
+    max_streamed_upload_bytes: int
+    max_bulk_simulation_payload_bytes: int
+
+    def required_capability(self, method: str, path: str) -> str | None:
+        return self.capability_trie.required_capability(method, path)
+
+    def is_feature_enabled(self, feature_key: str, tenant_id: str, role: str) -> bool:
+        return self.feature_flags.is_enabled(feature_key, tenant_id, role)
+
+
+def compile_enterprise_policy(source: tuple[str | None, ...]) -> EnterprisePolicySnapshot:
+    """Compile raw values ordered as ``ENTERPRISE_POLICY_ENV_NAMES`` into a snapshot."""
+    raw = dict(zip(ENTERPRISE_POLICY_ENV_NAMES, source, strict=True))
+    raw_rules = raw["ENTERPRISE_CAPABILITY_RULES_JSON"]
+    capability_rules = normalize_capability_rules(parse_json_map(raw_rules))
+    return EnterprisePolicySnapshot(
+        source=source,
+        enforce_authz=env_value_enabled(raw["ENTERPRISE_ENFORCE_AUTHZ"], "false"),
+        policy_version=(
+            DEFAULT_POLICY_VERSION
+            if raw["ENTERPRISE_POLICY_VERSION"] is None
+            else raw["ENTERPRISE_POLICY_VERSION"]
+        ),
+        capability_rules=capability_rules,
+        capability_rules_issue=json_map_issue(raw_rules, "invalid_capability_rules_json"),
+        capability_trie=CapabilityRouteTrie(capability_rules),
+        feature_flags=FeatureFlagTable(parse_json_map(raw["ENTERPRISE_FEATURE_FLAGS_JSON"])),
+        max_write_payload_bytes=env_value_int(
+            raw["ENTERPRISE_MAX_WRITE_PAYLOAD_BYTES"], DEFAULT_MAX_WRITE_PAYLOAD_BYTES
+        ),
+        max_streamed_upload_bytes=env_value_int(
+            raw["ENTERPRISE_MAX_STREAMED_UPLOAD_BYTES"], DEFAULT_MAX_STREAMED_UPLOAD_BYTES
+        ),
+        max_bulk_simulation_payload_bytes=env_value_int(
+            raw["ENTERPRISE_MAX_BULK_SIMULATION_PAYLOAD_BYTES"],
+            DEFAULT_MAX_BULK_SIMULATION_PAYLOAD_BYTES,
+        ),
+    )
+
+
+_SNAPSHOT_LOCK = Lock()
+_SNAPSHOT: EnterprisePolicySnapshot | None = None
+
+
+def current_enterprise_policy() -> EnterprisePolicySnapshot:
+    """Return the compiled policy, recompiling it when a source environment value changed."""
+    global _SNAPSHOT
+    source = tuple(os.environ.get(name) for name in ENTERPRISE_POLICY_ENV_NAMES)
+    snapshot = _SNAPSHOT
+    if snapshot is not None and snapshot.source == source:
+        return snapshot
+    with _SNAPSHOT_LOCK:
+        snapshot = _SNAPSHOT
+        if snapshot is None or snapshot.source != source:
+            snapshot = compile_enterprise_policy(source)
+            _SNAPSHOT = snapshot
+            record_enterprise_policy_reload()
+    return snapshot
+
+
+def reset_enterprise_policy_for_tests() -> None:
+    global _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = None
+
+
+__all__ = [
+    "DEFAULT_MAX_BULK_SIMULATION_PAYLOAD_BYTES",
+    "DEFAULT_MAX_STREAMED_UPLOAD_BYTES",
+    "DEFAULT_MAX_WRITE_PAYLOAD_BYTES",
+    "DEFAULT_POLICY_VERSION",
+    "ENTERPRISE_POLICY_ENV_NAMES",
+    "CapabilityRouteTrie",
+    "EnterprisePolicySnapshot",
+    "FeatureFlagTable",
+    "compile_enterprise_policy",
+    "current_enterprise_policy",
+    "env_value_enabled",
+    "env_value_int",
+    "json_map_issue",
+    "normalize_capability_rules",
+    "parse_json_map",
+    "reset_enterprise_policy_for_tests",
+]
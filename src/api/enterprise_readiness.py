@@ -1,25 +1,42 @@
-import json
 import logging
 import os
+import time
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable
+from typing import Any
 
-from fastapi import Request, Response
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-
+from starlette.datastructures import MutableHeaders
+
+from src.api.audit_sink import current_audit_event_sink
+from src.api.enterprise_policy import (
+    EnterprisePolicySnapshot,
+    current_enterprise_policy,
+    env_value_enabled,
+    env_value_int,
+    json_map_issue,
+    parse_json_map,
+)
 from src.api.http_boundary import http_boundary_config_issues
-from src.api.observability import http_operation_name, request_route_template
+from src.api.http_pipeline import http_pipeline_config
+from src.api.observability import (
+    http_operation_name,
+    record_enterprise_policy_middleware,
+    request_route_template,
+)
 from src.core.proposals.correlation import (
     MAX_CORRELATION_ID_LENGTH,
     normalize_optional_correlation_id,
 )
 
 logger = logging.getLogger("enterprise_readiness")
-MiddlewareNext = Callable[[Request], Awaitable[Response]]
-MiddlewareCallable = Callable[[Request, MiddlewareNext], Awaitable[Response]]
 
 _SERVICE_NAME = "lotus-advise"
 _WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# NDJSON upload routes that read their body incrementally get a separate, larger payload limit.
+_STREAMED_UPLOAD_PATHS = frozenset({"/advisory/tactical-house-view/cohorts/evaluate-stream"})
+# Bulk simulation carries up to 5000 portfolio snapshots in one JSON body.
+_BULK_SIMULATION_PATHS = frozenset({"/advisory/proposals/simulate/bulk"})
 _REQUIRED_HEADERS = {"x-actor-id", "x-tenant-id", "x-role", "x-correlation-id"}
 _REDACT_FIELD_MARKERS = frozenset(
     {
@@ -41,38 +58,19 @@ _REDACTED_VALUE = "***REDACTED***"
 
 
 def _env_enabled(name: str, default: str = "true") -> bool:
-    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
-
-
-def _load_json_map(name: str) -> dict[str, Any]:
-    raw = os.getenv(name, "{}")
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        return {}
-    return parsed if isinstance(parsed, dict) else {}
+    return env_value_enabled(os.getenv(name), default)
 
 
 def _json_map_config_issue(name: str, issue: str) -> str | None:
-    raw = os.getenv(name)
-    if raw is None or not raw.strip():
-        return None
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        return issue
-    return None if isinstance(parsed, dict) else issue
+    return json_map_issue(os.getenv(name), issue)
 
 
 def _env_int(name: str, default: int) -> int:
-    try:
-        return int(os.getenv(name, str(default)))
-    except ValueError:
-        return default
+    return env_value_int(os.getenv(name), default)
 
 
 def enterprise_policy_version() -> str:
-    return os.getenv("ENTERPRISE_POLICY_VERSION", "1.0.0")
+    return current_enterprise_policy().policy_version
 
 
 def validate_enterprise_runtime_config() -> list[str]:
@@ -127,69 +125,44 @@ def _append_json_map_issue(issues: list[str], name: str, issue_code: str) -> Non
 
 
 def load_feature_flags() -> dict[str, dict[str, dict[str, bool]]]:
-    return _load_json_map("ENTERPRISE_FEATURE_FLAGS_JSON")
+    return parse_json_map(os.getenv("ENTERPRISE_FEATURE_FLAGS_JSON"))
 
 
 def load_capability_rules() -> dict[str, str]:
-    rules = _load_json_map("ENTERPRISE_CAPABILITY_RULES_JSON")
-    normalized: dict[str, str] = {}
-    for key, value in rules.items():
-        if not isinstance(key, str):
-            continue
-        capability_rule = key.strip()
-        capability = str(value).strip()
-        if capability_rule and capability:
-            normalized[capability_rule] = capability
-    return normalized
+    return dict(current_enterprise_policy().capability_rules)
 
 
 def is_feature_enabled(feature_key: str, tenant_id: str, role: str) -> bool:
-    flags = load_feature_flags()
-    feature = flags.get(feature_key, {})
-    tenant = feature.get(tenant_id, {})
-    explicit = tenant.get(role)
-    if isinstance(explicit, bool):
-        return explicit
-    tenant_default = tenant.get("*")
-    if isinstance(tenant_default, bool):
-        return tenant_default
-    global_default = feature.get("*", {}).get("*")
-    return bool(global_default) if isinstance(global_default, bool) else False
+    return current_enterprise_policy().is_feature_enabled(feature_key, tenant_id, role)
 
 
 def _required_capability(method: str, path: str) -> str | None:
-    method = method.upper()
-    for key, capability in load_capability_rules().items():
-        prefix = f"{method} "
-        if key.upper().startswith(prefix) and _path_matches_capability_rule(
-            request_path=path,
-            rule_path=key[len(prefix) :],
-        ):
-            return capability
-    return None
-
-
-def _path_matches_capability_rule(*, request_path: str, rule_path: str) -> bool:
-    normalized_rule = rule_path.rstrip("/")
-    normalized_request = request_path.rstrip("/")
-    return normalized_request == normalized_rule or normalized_request.startswith(
-        f"{normalized_rule}/"
-    )
+    return current_enterprise_policy().required_capability(method, path)
 
 
 def authorize_write_request(
     method: str, path: str, headers: dict[str, str]
 ) -> tuple[bool, str | None]:
-    if not _should_enforce_write_authorization(method):
+    return _authorize_write_request(current_enterprise_policy(), method, path, headers)
+
+
+def _authorize_write_request(
+    policy: EnterprisePolicySnapshot,
+    method: str,
+    path: str,
+    headers: dict[str, str],
+) -> tuple[bool, str | None]:
+    if not _should_enforce_write_authorization(policy, method):
         return True, None
 
-    denial_reason = _write_authorization_denial_reason(method, path, headers)
+    denial_reason = _write_authorization_denial_reason(policy, method, path, headers)
     if denial_reason is not None:
         return False, denial_reason
     return True, None
 
 
 def _write_authorization_denial_reason(
+    policy: EnterprisePolicySnapshot,
     method: str,
     path: str,
     headers: dict[str, str],
@@ -202,19 +175,18 @@ def _write_authorization_denial_reason(
     if not _has_service_identity(normalized):
         return "missing_service_identity"
 
-    capability_rule_issue = _capability_rule_config_issue()
-    if capability_rule_issue is not None:
-        return capability_rule_issue
+    if policy.capability_rules_issue is not None:
+        return policy.capability_rules_issue
 
-    missing_capability = _missing_required_capability(method, path, normalized)
+    missing_capability = _missing_required_capability(policy, method, path, normalized)
     if missing_capability is not None:
         return f"missing_capability:{missing_capability}"
 
     return None
 
 
-def _should_enforce_write_authorization(method: str) -> bool:
-    return method.upper() in _WRITE_METHODS and _env_enabled("ENTERPRISE_ENFORCE_AUTHZ", "false")
+def _should_enforce_write_authorization(policy: EnterprisePolicySnapshot, method: str) -> bool:
+    return method.upper() in _WRITE_METHODS and policy.enforce_authz
 
 
 def _normalize_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -229,19 +201,13 @@ def _has_service_identity(headers: dict[str, str]) -> bool:
     return bool(headers.get("x-service-identity") or headers.get("authorization"))
 
 
-def _capability_rule_config_issue() -> str | None:
-    return _json_map_config_issue(
-        "ENTERPRISE_CAPABILITY_RULES_JSON",
-        "invalid_capability_rules_json",
-    )
-
-
 def _missing_required_capability(
+    policy: EnterprisePolicySnapshot,
     method: str,
     path: str,
     headers: dict[str, str],
 ) -> str | None:
-    required_capability = _required_capability(method, path)
+    required_capability = policy.required_capability(method, path)
     if required_capability is None:
         return None
 
@@ -308,34 +274,69 @@ def emit_audit_event(
     correlation_id: str | None,
     metadata: dict[str, Any],
 ) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     normalized_correlation_id = normalize_optional_correlation_id(correlation_id)
-    logger.info(
-        "enterprise_audit_event",
-        extra={
-            "audit": {
-                "service": _SERVICE_NAME,
-                "action": action,
-                "actor_id": _normalize_audit_identity(actor_id, default="unknown"),
-                "tenant_id": _normalize_audit_identity(tenant_id, default="default"),
-                "role": _normalize_audit_identity(role, default="unknown"),
-                "correlation_id": normalized_correlation_id or "",
-                "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                "policy_version": enterprise_policy_version(),
-                "metadata": redact_sensitive(metadata),
-            }
-        },
+    audit = {
+        "service": _SERVICE_NAME,
+        "action": action,
+        "actor_id": _normalize_audit_identity(actor_id, default="unknown"),
+        "tenant_id": _normalize_audit_identity(tenant_id, default="default"),
+        "role": _normalize_audit_identity(role, default="unknown"),
+        "correlation_id": normalized_correlation_id or "",
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "policy_version": enterprise_policy_version(),
+        # Redaction copies the metadata, so later caller changes cannot reach a queued event.
+        "metadata": redact_sensitive(metadata),
+    }
+    sink = current_audit_event_sink()
+    if sink is None:
+        logger.info("enterprise_audit_event", extra={"audit": audit})
+        return
+    sink.submit(
+        logger,
+        logger.makeRecord(
+            logger.name,
+            logging.INFO,
+            __file__,
+            0,
+            "enterprise_audit_event",
+            (),
+            None,
+            func="emit_audit_event",
+            extra={"audit": audit},
+        ),
     )
 
 
-def _enterprise_policy_response(*, status_code: int, content: dict[str, Any]) -> JSONResponse:
+def _enterprise_policy_response(
+    *, policy: EnterprisePolicySnapshot, status_code: int, content: dict[str, Any]
+) -> JSONResponse:
     response = JSONResponse(status_code=status_code, content=content)
-    response.headers["X-Enterprise-Policy-Version"] = enterprise_policy_version()
+    response.headers["X-Enterprise-Policy-Version"] = policy.policy_version
     return response
 
 
-def build_enterprise_audit_middleware() -> MiddlewareCallable:
-    async def middleware(request: Request, call_next: MiddlewareNext) -> Response:
-        max_write_payload_bytes = _env_int("ENTERPRISE_MAX_WRITE_PAYLOAD_BYTES", 1_048_576)
+def _max_write_payload_bytes(policy: EnterprisePolicySnapshot, path: str) -> int:
+    if path in _STREAMED_UPLOAD_PATHS:
+        return policy.max_streamed_upload_bytes
+    if path in _BULK_SIMULATION_PATHS:
+        return policy.max_bulk_simulation_payload_bytes
+    return policy.max_write_payload_bytes
+
+
+def install_enterprise_audit(app: FastAPI) -> None:
+    http_pipeline_config(app).add_stage(EnterpriseAuditStage())
+
+
+class EnterpriseAuditStage:
+    """Payload limits, write authorization, policy-version headers, and write audit events."""
+
+    def open(self, request: Request) -> "_EnterpriseAuditExchange | Response":
+        # Overhead is timed around the policy work only; the downstream handler is excluded.
+        started_at = time.perf_counter()
+        policy = current_enterprise_policy()
+        max_write_payload_bytes = _max_write_payload_bytes(policy, request.url.path)
         operation_name = http_operation_name(request)
         route_template = request_route_template(request)
         try:
@@ -358,13 +359,18 @@ def build_enterprise_audit_middleware() -> MiddlewareCallable:
                     "max_write_payload_bytes": max_write_payload_bytes,
                 },
             )
-            return _enterprise_policy_response(
+            denied = _enterprise_policy_response(
+                policy=policy,
                 status_code=413,
                 content={"detail": "payload_too_large"},
             )
+            record_enterprise_policy_middleware(
+                decision="payload_too_large", seconds=time.perf_counter() - started_at
+            )
+            return denied
 
-        authorized, reason = authorize_write_request(
-            request.method, request.url.path, dict(request.headers)
+        authorized, reason = _authorize_write_request(
+            policy, request.method, request.url.path, dict(request.headers)
         )
         if not authorized:
             emit_audit_event(
@@ -380,26 +386,63 @@ def build_enterprise_audit_middleware() -> MiddlewareCallable:
                     "operation_name": operation_name,
                 },
             )
-            return _enterprise_policy_response(
-                status_code=403, content={"detail": "authorization_policy_denied", "reason": reason}
+            denied = _enterprise_policy_response(
+                policy=policy,
+                status_code=403,
+                content={"detail": "authorization_policy_denied", "reason": reason},
+            )
+            record_enterprise_policy_middleware(
+                decision="denied", seconds=time.perf_counter() - started_at
             )
+            return denied
+
+        return _EnterpriseAuditExchange(
+            request=request,
+            policy=policy,
+            route_template=route_template,
+            operation_name=operation_name,
+            policy_seconds=time.perf_counter() - started_at,
+        )
+
 
-        response = await call_next(request)
-        response.headers["X-Enterprise-Policy-Version"] = enterprise_policy_version()
+class _EnterpriseAuditExchange:
+    def __init__(
+        self,
+        *,
+        request: Request,
+        policy: EnterprisePolicySnapshot,
+        route_template: str,
+        operation_name: str,
+        policy_seconds: float,
+    ) -> None:
+        self._request = request
+        self._policy = policy
+        self._route_template = route_template
+        self._operation_name = operation_name
+        self._policy_seconds = policy_seconds
+
+    def on_response_start(self, status_code: int, headers: MutableHeaders) -> None:
+        resumed_at = time.perf_counter()
+        request = self._request
+        headers["X-Enterprise-Policy-Version"] = self._policy.policy_version
         if request.method in _WRITE_METHODS:
             emit_audit_event(
-                action=operation_name,
+                action=self._operation_name,
                 actor_id=request.headers.get("X-Actor-Id", "unknown"),
                 tenant_id=request.headers.get("X-Tenant-Id", "default"),
                 role=request.headers.get("X-Role", "unknown"),
                 correlation_id=request.headers.get("X-Correlation-Id"),
                 metadata={
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "http_method": request.method,
-                    "route_template": route_template,
-                    "operation_name": operation_name,
+                    "route_template": self._route_template,
+                    "operation_name": self._operation_name,
                 },
             )
-        return response
+        record_enterprise_policy_middleware(
+            decision="allowed",
+            seconds=self._policy_seconds + time.perf_counter() - resumed_at,
+        )
 
-    return middleware
+    def close(self, status_code: int | None) -> None:
+        return None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Any, Mapping, Sequence
+
+from src.api.enterprise_readiness import emit_audit_event
+from src.api.observability import record_event_partition_maintenance
+from src.runtime.event_partitions import (
+    build_event_partition_maintainers,
+    event_partition_maintenance_enabled,
+    event_partition_maintenance_interval_seconds,
+    event_partition_months_ahead,
+    event_partition_retention_months,
+)
+
+EVENT_PARTITION_MAINTENANCE_ACTOR = "system:event-partition-maintenance"
+
+logger = logging.getLogger(__name__)
+
+
+def run_event_partition_maintenance(
+    *,
+    maintainers: Sequence[Any],
+    months_ahead: int,
+    retention_months_by_table: Mapping[str, int],
+    as_of: datetime | None = None,
+) -> list[Any]:
+    maintained_at = as_of or datetime.now(timezone.utc)
+    reports: list[Any] = []
+    for maintainer in maintainers:
+        reports.extend(
+            maintainer.maintain(
+                as_of=maintained_at,
+                months_ahead=months_ahead,
+                retention_months_by_table=retention_months_by_table,
+            )
+        )
+    for report in reports:
+        record_event_partition_maintenance(
+            record_table=report.table,
+            created=len(report.created_partitions),
+            dropped=len(report.dropped_partitions),
+            blocked=len(report.audit_events) - len(report.dropped_partitions),
+        )
+        for audit_event in report.audit_events:
+            emit_audit_event(
+                action=str(audit_event["event_type"]),
+                actor_id=EVENT_PARTITION_MAINTENANCE_ACTOR,
+                tenant_id="default",
+                role="SYSTEM",
+                correlation_id=None,
+                metadata=audit_event,
+            )
+    return reports
+
+
+def start_event_partition_maintenance() -> asyncio.Task[None] | None:
+    if not event_partition_maintenance_enabled():
+        return None
+    return asyncio.create_task(
+        _event_partition_maintenance_loop(
+            maintainers=build_event_partition_maintainers(),
+            months_ahead=event_partition_months_ahead(),
+            retention_months_by_table=event_partition_retention_months(),
+            interval_seconds=event_partition_maintenance_interval_seconds(),
+        )
+    )
+
+
+async def stop_event_partition_maintenance(task: asyncio.Task[None] | None) -> None:
+    if task is None:
+        return
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+async def _event_partition_maintenance_loop(
+    *,
+    maintainers: Sequence[Any],
+    months_ahead: int,
+    retention_months_by_table: Mapping[str, int],
+    interval_seconds: int,
+) -> None:
+    while True:
+        try:
+            await asyncio.to_thread(
+                run_event_partition_maintenance,
+                maintainers=maintainers,
+                months_ahead=months_ahead,
+                retention_months_by_table=retention_months_by_table,
+            )
+        except Exception:
+            logger.exception("Event partition maintenance failed")
+        await asyncio.sleep(interval_seconds)
+
+
+__all__ = [
+    "run_event_partition_maintenance",
+    "start_event_partition_maintenance",
+    "stop_event_partition_maintenance",
+]
@@ -6,11 +6,11 @@ import os
 from collections.abc import Iterable
 
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from src.api.http_pipeline import http_pipeline_config
 
 _PRODUCTION_LIKE_ENVIRONMENTS = frozenset({"prod", "production", "staging", "uat"})
 _DEFAULT_LOCAL_TRUSTED_HOSTS = (
@@ -51,30 +51,25 @@ _SECURITY_HEADERS = {
 }
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-        apply_security_headers(response)
-        return response
-
-
 def install_http_boundary(app: FastAPI) -> None:
+    """Add the trusted-host and CORS guards and default security headers to the pipeline."""
+    trusted_hosts = list(configured_trusted_hosts())
     allowed_origins = configured_allowed_origins()
-    app.add_middleware(TrustedHostMiddleware, allowed_hosts=list(configured_trusted_hosts()))
+    pipeline = http_pipeline_config(app)
+    pipeline.add_guard(lambda inner: TrustedHostMiddleware(inner, allowed_hosts=trusted_hosts))
     if allowed_origins:
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=list(allowed_origins),
-            allow_methods=list(_CORS_ALLOW_METHODS),
-            allow_headers=list(_CORS_ALLOW_HEADERS),
-            allow_credentials=False,
-        )
-    app.add_middleware(SecurityHeadersMiddleware)
-
-
-def apply_security_headers(response: Response) -> None:
-    for header, value in _SECURITY_HEADERS.items():
-        response.headers.setdefault(header, value)
+        pipeline.add_guard(lambda inner: _cors_guard(inner, allowed_origins))
+    pipeline.add_default_response_headers(_SECURITY_HEADERS)
+
+
+def _cors_guard(app: ASGIApp, allowed_origins: tuple[str, ...]) -> ASGIApp:
+    return CORSMiddleware(
+        app,
+        allow_origins=list(allowed_origins),
+        allow_methods=list(_CORS_ALLOW_METHODS),
+        allow_headers=list(_CORS_ALLOW_HEADERS),
+        allow_credentials=False,
+    )
 
 
 def approved_security_headers() -> dict[str, str]:
@@ -0,0 +1,143 @@
+"""Single pure-ASGI middleware for the Lotus Advise request pipeline.
+
+The HTTP boundary, enterprise policy, and request observability controls used to be separate
+``BaseHTTPMiddleware`` layers. Each layer ran the rest of the app in its own task and re-wrapped
+the response stream. They now plug into one ``HttpPipelineMiddleware`` that passes ASGI messages
+straight through, so streaming routes stream and each request pays for one middleware hop.
+
+The nesting of the old layers is kept, outermost first:
+
+1. Default response headers, applied with ``setdefault`` to every HTTP response the app sends.
+2. Guards: pure-ASGI wrappers such as trusted-host and CORS, in the order they were added.
+3. Stages: per-request hooks that may answer early, see the response start, and close after the
+   app returns or raises. The stage installed last runs first, as ``app.middleware`` did.
+
+Installers call ``http_pipeline_config(app)`` to register their part before the app starts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+HttpPipelineGuard = Callable[[ASGIApp], ASGIApp]
+
+
+class HttpStageExchange(Protocol):
+    def on_response_start(self, status_code: int, headers: MutableHeaders) -> None: ...
+
+    def close(self, status_code: int | None) -> None: ...
+
+
+class HttpPipelineStage(Protocol):
+    def open(self, request: Request) -> HttpStageExchange | Response:
+        """Start the stage for one request, or return a response that answers it early."""
+        ...
+
+
+@dataclass
+class HttpPipelineConfig:
+    default_response_headers: dict[str, str] = field(default_factory=dict)
+    guards: list[HttpPipelineGuard] = field(default_factory=list)
+    stages: list[HttpPipelineStage] = field(default_factory=list)
+
+    def add_default_response_headers(self, headers: Mapping[str, str]) -> None:
+        self.default_response_headers.update(headers)
+
+    def add_guard(self, guard: HttpPipelineGuard) -> None:
+        self.guards.insert(0, guard)
+
+    def add_stage(self, stage: HttpPipelineStage) -> None:
+        self.stages.insert(0, stage)
+
+
+def http_pipeline_config(app: FastAPI) -> HttpPipelineConfig:
+    """Return the app's pipeline configuration and keep the pipeline the outermost middleware."""
+    config = getattr(app.state, "http_pipeline", None)
+    if not isinstance(config, HttpPipelineConfig):
+        config = HttpPipelineConfig()
+        app.state.http_pipeline = config
+    app.user_middleware[:] = [
+        middleware
+        for middleware in app.user_middleware
+        if middleware.cls is not HttpPipelineMiddleware
+    ]
+    app.add_middleware(HttpPipelineMiddleware, config=config)
+    return config
+
+
+class HttpPipelineMiddleware:
+    def __init__(self, app: ASGIApp, *, config: HttpPipelineConfig) -> None:
+        self._app = app
+        self._default_response_headers = tuple(config.default_response_headers.items())
+        self._stages = tuple(config.stages)
+        guarded: ASGIApp = self._run_stages
+        for guard in reversed(config.guards):
+            guarded = guard(guarded)
+        self._guarded = guarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._default_response_headers:
+            await self._guarded(scope, receive, send)
+            return
+
+        async def send_with_default_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self._default_response_headers:
+                    headers.setdefault(name, value)
+            await send(message)
+
+        await self._guarded(scope, receive, send_with_default_headers)
+
+    async def _run_stages(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._stages:
+            await self._app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        exchanges: list[HttpStageExchange] = []
+        status_code: int | None = None
+
+        async def send_through_stages(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                # Inner stages see the response first, as nested middleware did.
+                for exchange in reversed(exchanges):
+                    exchange.on_response_start(message["status"], headers)
+            await send(message)
+
+        try:
+            early_response: Response | None = None
+            for stage in self._stages:
+                opened = stage.open(request)
+                if isinstance(opened, Response):
+                    early_response = opened
+                    break
+                exchanges.append(opened)
+            if early_response is not None:
+                await early_response(scope, receive, send_through_stages)
+            else:
+                await self._app(scope, receive, send_through_stages)
+        finally:
+            for exchange in reversed(exchanges):
+                exchange.close(status_code)
+
+
+__all__ = [
+    "HttpPipelineConfig",
+    "HttpPipelineGuard",
+    "HttpPipelineMiddleware",
+    "HttpPipelineStage",
+    "HttpStageExchange",
+    "http_pipeline_config",
+]
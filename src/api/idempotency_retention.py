@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Sequence
+
+from src.api.enterprise_readiness import emit_audit_event
+from src.api.observability import record_idempotency_retention_decisions
+from src.core.record_lifecycle.idempotency_retention import (
+    IDEMPOTENCY_RETENTION_SWEEPER_ACTOR,
+    IdempotencyRetentionSettings,
+    IdempotencyRetentionStore,
+    IdempotencyRetentionSweepReport,
+    UtcNow,
+    sweep_idempotency_records,
+)
+from src.runtime.idempotency_retention import (
+    build_idempotency_retention_stores,
+    idempotency_retention_interval_seconds,
+    idempotency_retention_settings,
+    idempotency_retention_sweeper_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_idempotency_retention_sweep(
+    *,
+    stores: Sequence[IdempotencyRetentionStore],
+    settings: IdempotencyRetentionSettings,
+    now: UtcNow | None = None,
+) -> IdempotencyRetentionSweepReport:
+    report = sweep_idempotency_records(stores=stores, settings=settings, now=now)
+    for table_report in report.tables:
+        record_idempotency_retention_decisions(
+            record_table=table_report.table,
+            decision_counts=table_report.decision_counts,
+            purged=table_report.purged,
+        )
+    for audit_event in report.audit_events:
+        emit_audit_event(
+            action="ADVISORY_RECORD_PURGE_EXECUTED",
+            actor_id=IDEMPOTENCY_RETENTION_SWEEPER_ACTOR,
+            tenant_id="default",
+            role="SYSTEM",
+            correlation_id=None,
+            metadata=audit_event,
+        )
+    return report
+
+
+def start_idempotency_retention_sweeper() -> asyncio.Task[None] | None:
+    if not idempotency_retention_sweeper_enabled():
+        return None
+    return asyncio.create_task(
+        _idempotency_retention_sweeper_loop(
+            stores=build_idempotency_retention_stores(),
+            settings=idempotency_retention_settings(),
+            interval_seconds=idempotency_retention_interval_seconds(),
+        )
+    )
+
+
+async def stop_idempotency_retention_sweeper(task: asyncio.Task[None] | None) -> None:
+    if task is None:
+        return
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+async def _idempotency_retention_sweeper_loop(
+    *,
+    stores: Sequence[IdempotencyRetentionStore],
+    settings: IdempotencyRetentionSettings,
+    interval_seconds: int,
+) -> None:
+    while True:
+        try:
+            await asyncio.to_thread(
+                run_idempotency_retention_sweep,
+                stores=stores,
+                settings=settings,
+            )
+        except Exception:
+            logger.exception("Idempotency retention sweep failed")
+        await asyncio.sleep(interval_seconds)
+
+
+__all__ = [
+    "run_idempotency_retention_sweep",
+    "start_idempotency_retention_sweeper",
+    "stop_idempotency_retention_sweeper",
+]
@@ -9,16 +9,26 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 
+from src.api.audit_sink import start_audit_event_sink, stop_audit_event_sink
 from src.api.enterprise_readiness import (
-    build_enterprise_audit_middleware,
+    install_enterprise_audit,
     validate_enterprise_runtime_config,
 )
+from src.api.event_partitions import (
+    start_event_partition_maintenance,
+    stop_event_partition_maintenance,
+)
 from src.api.http_boundary import install_http_boundary
 from src.api.http_status import HTTP_422_UNPROCESSABLE
+from src.api.idempotency_retention import (
+    start_idempotency_retention_sweeper,
+    stop_idempotency_retention_sweeper,
+)
 from src.api.observability import correlation_id_var, setup_observability
 from src.api.openapi_enrichment import enrich_openapi_schema
 from src.api.openapi_tags import OPENAPI_TAGS
 from src.api.problem_details import build_problem_detail_response
+from src.api.proposals.copilot_streaming import shutdown_copilot_stream_executor
 from src.api.proposals.router import (
     ensure_proposal_runtime_ready,
     recover_proposal_async_runtime,
@@ -35,11 +45,16 @@ from src.api.routers.integration_capabilities import (
     router as integration_capabilities_router,
 )
 from src.api.routers.tactical_house_view import router as tactical_house_view_router
+from src.api.routers.target_generation import router as target_generation_router
 from src.api.runtime_persistence import validate_advisory_runtime_persistence
 from src.api.sensitive_error_details import contains_sensitive_error_detail
 from src.api.workspaces.router import router as workspace_router
 from src.core.advisory.provider_ports import AdvisorySimulationUnavailableError
+from src.core.common.cpu_offload import shutdown_cpu_offload_pool
+from src.core.proposals.event_journal import close_event_journals
+from src.core.proposals.memo_materialization import shutdown_memo_evidence_pack_materializer
 from src.core.proposals.models import ProposalReportResponse
+from src.core.target_batch import shutdown_target_batch_pool
 from src.core.workspace.input_models import WorkspaceStatefulInput
 from src.integrations.lotus_core.context_resolution import (
     LotusCoreResolvedAdvisoryContext,
@@ -67,7 +82,22 @@ async def _app_lifespan(_app: FastAPI) -> AsyncIterator[None]:
     validate_advisory_runtime_persistence()
     ensure_proposal_runtime_ready()
     recover_proposal_async_runtime()
-    yield
+    audit_sink = start_audit_event_sink()
+    retention_sweeper = start_idempotency_retention_sweeper()
+    partition_maintenance = start_event_partition_maintenance()
+    try:
+        yield
+    finally:
+        await stop_event_partition_maintenance(partition_maintenance)
+        await stop_idempotency_retention_sweeper(retention_sweeper)
+        # Materialization builds run through the CPU offload pool, so stop them first.
+        shutdown_memo_evidence_pack_materializer()
+        shutdown_cpu_offload_pool()
+        shutdown_target_batch_pool()
+        shutdown_copilot_stream_executor()
+        close_event_journals()
+        # Stopped last so audit events from the other shutdown steps are flushed.
+        stop_audit_event_sink(audit_sink)
 
 
 app = FastAPI(
@@ -83,7 +113,7 @@ LOTUS_CORE_SIMULATION_UNAVAILABLE_DETAIL = "LOTUS_CORE_SIMULATION_UNAVAILABLE"
 READINESS_CHECK_FAILED_DETAIL = "READINESS_CHECK_FAILED"
 setup_observability(app)
 validate_enterprise_runtime_config()
-app.middleware("http")(build_enterprise_audit_middleware())
+install_enterprise_audit(app)
 install_http_boundary(app)
 
 app.include_router(proposal_lifecycle_router)
@@ -91,6 +121,7 @@ app.include_router(advisory_simulation_router)
 app.include_router(bank_demo_proof_router)
 app.include_router(integration_capabilities_router)
 app.include_router(tactical_house_view_router)
+app.include_router(target_generation_router)
 app.include_router(workspace_router)
 
 
@@ -6,23 +6,53 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from importlib.metadata import PackageNotFoundError, version
-from typing import Awaitable, Callable
+from typing import Iterator
 from uuid import uuid4
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from packaging.version import InvalidVersion, Version
-from prometheus_client import Counter
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    Metric,
+    SummaryMetricFamily,
+)
+from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator, routing
+from starlette.datastructures import MutableHeaders
 from starlette.routing import Match, Mount
 
+from src.api.http_pipeline import http_pipeline_config
 from src.api.observability_contracts import (
+    ADVISORY_COPILOT_DRAFT_CACHE_METRIC_LABELS,
+    ADVISORY_COPILOT_STREAM_METRIC_LABELS,
     ADVISORY_SUPPORTABILITY_METRIC_LABELS,
+    AUDIT_SINK_EVENT_METRIC_LABELS,
+    CPU_OFFLOAD_QUEUE_METRIC_LABELS,
+    CPU_OFFLOAD_RUN_METRIC_LABELS,
+    ENTERPRISE_POLICY_MIDDLEWARE_METRIC_LABELS,
+    EVENT_JOURNAL_METRIC_LABELS,
+    EVENT_PARTITION_MAINTENANCE_METRIC_LABELS,
+    IDEMPOTENCY_RETENTION_METRIC_LABELS,
+    MEMO_MATERIALIZATION_METRIC_LABELS,
     POLICY_EVALUATION_OPERATION_METRIC_LABELS,
+    PROPOSAL_BULK_SIMULATION_METRIC_LABELS,
+    REQUEST_MODEL_SERIALIZATION_METRIC_LABELS,
+    SIMULATION_BASELINE_CACHE_METRIC_LABELS,
+    TARGET_BATCH_METRIC_LABELS,
+    TARGET_SOLVER_PROBLEM_CACHE_METRIC_LABELS,
 )
+from src.core.advisory.simulation_baseline import get_simulation_baseline_cache_stats
+from src.core.common.cpu_offload import configure_cpu_offload_observer
+from src.core.common.serialization_memo import request_serialization_scope
 from src.core.proposals.correlation import (
     normalize_optional_correlation_id,
     resolve_correlation_id,
 )
+from src.core.proposals.event_journal import configure_event_journal_observer
+from src.core.proposals.memo_materialization import configure_memo_materialization_observer
+from src.core.target_solver_cache import get_target_solver_problem_cache_stats
 
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -38,6 +68,168 @@ POLICY_EVALUATION_OPERATIONS_TOTAL = Counter(
     "Count of policy-evaluation workflow operation outcomes.",
     POLICY_EVALUATION_OPERATION_METRIC_LABELS,
 )
+IDEMPOTENCY_RETENTION_RECORDS_TOTAL = Counter(
+    "lotus_advise_idempotency_retention_records_total",
+    "Count of idempotency retention sweep decisions and purged records by table.",
+    IDEMPOTENCY_RETENTION_METRIC_LABELS,
+)
+EVENT_PARTITION_MAINTENANCE_TOTAL = Counter(
+    "lotus_advise_event_partition_maintenance_total",
+    "Count of event table partitions created, dropped, or retained by purge controls.",
+    EVENT_PARTITION_MAINTENANCE_METRIC_LABELS,
+)
+ADVISORY_COPILOT_DRAFT_CACHE_TOTAL = Counter(
+    "lotus_advise_advisory_copilot_draft_cache_total",
+    "Count of advisory copilot runs replayed from, stored into, or bypassing the draft cache.",
+    ADVISORY_COPILOT_DRAFT_CACHE_METRIC_LABELS,
+)
+ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_TOKENS_TOTAL = Counter(
+    "lotus_advise_advisory_copilot_draft_cache_avoided_tokens_total",
+    "Estimated lotus-ai input and output tokens avoided by advisory copilot draft cache hits.",
+)
+ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_LATENCY_MS_TOTAL = Counter(
+    "lotus_advise_advisory_copilot_draft_cache_avoided_latency_ms_total",
+    "Source workflow-pack latency in milliseconds avoided by advisory copilot draft cache hits.",
+)
+ADVISORY_COPILOT_STREAM_LATENCY_SECONDS = Histogram(
+    "lotus_advise_advisory_copilot_stream_latency_seconds",
+    "Streaming advisory copilot latency from request start to first byte, each section, and "
+    "the final persisted run event.",
+    ADVISORY_COPILOT_STREAM_METRIC_LABELS,
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 1.5, 2.5, 5.0, 10.0),
+)
+TARGET_BATCH_PORTFOLIOS_TOTAL = Counter(
+    "lotus_advise_target_batch_portfolios_total",
+    "Count of batch target-generation portfolio solves by target status.",
+    TARGET_BATCH_METRIC_LABELS,
+)
+PROPOSAL_BULK_SIMULATION_ITEMS_TOTAL = Counter(
+    "lotus_advise_proposal_bulk_simulation_items_total",
+    "Count of bulk proposal simulation portfolios by proposal status or isolated error.",
+    PROPOSAL_BULK_SIMULATION_METRIC_LABELS,
+)
+TARGET_BATCH_DURATION_SECONDS = Histogram(
+    "lotus_advise_target_batch_duration_seconds",
+    "Wall-clock duration of batch target-generation runs.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+CPU_OFFLOAD_QUEUE_SECONDS = Histogram(
+    "lotus_advise_cpu_offload_queue_seconds",
+    "Time CPU-bound stages wait for a free process-pool worker.",
+    CPU_OFFLOAD_QUEUE_METRIC_LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+CPU_OFFLOAD_RUN_SECONDS = Histogram(
+    "lotus_advise_cpu_offload_run_seconds",
+    "Execution time of CPU-bound stages, inline or in a process-pool worker.",
+    CPU_OFFLOAD_RUN_METRIC_LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+REQUEST_MODEL_SERIALIZATIONS_TOTAL = Counter(
+    "lotus_advise_request_model_serializations_total",
+    "Count of JSON-mode model dumps and hashes per route, performed or reused from the "
+    "request-scoped serialization memo.",
+    REQUEST_MODEL_SERIALIZATION_METRIC_LABELS,
+)
+ENTERPRISE_POLICY_MIDDLEWARE_SECONDS = Histogram(
+    "lotus_advise_enterprise_policy_middleware_seconds",
+    "Time the enterprise policy middleware spends per request, excluding the downstream handler.",
+    ENTERPRISE_POLICY_MIDDLEWARE_METRIC_LABELS,
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05),
+)
+ENTERPRISE_POLICY_RELOADS_TOTAL = Counter(
+    "lotus_advise_enterprise_policy_reloads_total",
+    "Count of enterprise policy snapshot compilations after a configuration change.",
+)
+AUDIT_SINK_EVENTS_TOTAL = Counter(
+    "lotus_advise_audit_sink_events_total",
+    "Count of enterprise audit events queued, written inline on overflow or shutdown, or "
+    "dropped by the audit sink overflow policy.",
+    AUDIT_SINK_EVENT_METRIC_LABELS,
+)
+AUDIT_SINK_BATCH_SIZE = Histogram(
+    "lotus_advise_audit_sink_batch_size",
+    "Number of audit events the background audit writer drained per batch.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 256, 512, 1024),
+)
+MEMO_MATERIALIZATION_TOTAL = Counter(
+    "lotus_advise_memo_evidence_pack_materialization_total",
+    "Count of background memo evidence-pack materializations and memo-time lookups of "
+    "materialized packs, by outcome.",
+    MEMO_MATERIALIZATION_METRIC_LABELS,
+)
+EVENT_JOURNAL_EVENTS_TOTAL = Counter(
+    "lotus_advise_event_journal_events_total",
+    "Count of write-behind audit events queued, written inline when the journal is full or "
+    "closed, flushed in background batches, or failed after the per-event retry, by family.",
+    EVENT_JOURNAL_METRIC_LABELS,
+)
+
+
+class SimulationBaselineCacheCollector(Collector):
+    """Expose the in-process simulation baseline cache counters at scrape time."""
+
+    def collect(self) -> Iterator[Metric]:
+        stats = get_simulation_baseline_cache_stats()
+        lookups = CounterMetricFamily(
+            "lotus_advise_simulation_baseline_cache_lookups",
+            "Count of simulation baseline cache lookups by outcome.",
+            labels=SIMULATION_BASELINE_CACHE_METRIC_LABELS,
+        )
+        for outcome, count in (
+            ("hit", stats.hits),
+            ("miss", stats.misses),
+            ("bypass", stats.bypasses),
+        ):
+            lookups.add_metric([outcome], count)
+        yield lookups
+        yield CounterMetricFamily(
+            "lotus_advise_simulation_baseline_cache_evictions",
+            "Count of simulation baselines evicted from the bounded LRU cache.",
+            value=stats.evictions,
+        )
+        yield GaugeMetricFamily(
+            "lotus_advise_simulation_baseline_cache_entries",
+            "Number of simulation baselines currently cached.",
+            value=stats.size,
+        )
+
+
+REGISTRY.register(SimulationBaselineCacheCollector())
+
+
+class TargetSolverProblemCacheCollector(Collector):
+    """Expose the compiled target-solver problem cache and solve timings at scrape time."""
+
+    def collect(self) -> Iterator[Metric]:
+        stats = get_target_solver_problem_cache_stats()
+        lookups = CounterMetricFamily(
+            "lotus_advise_target_solver_problem_cache_lookups",
+            "Count of compiled target-solver problem lookups by outcome.",
+            labels=TARGET_SOLVER_PROBLEM_CACHE_METRIC_LABELS,
+        )
+        lookups.add_metric(["hit"], stats.hits)
+        lookups.add_metric(["miss"], stats.misses)
+        yield lookups
+        yield CounterMetricFamily(
+            "lotus_advise_target_solver_problem_cache_evictions",
+            "Count of compiled target-solver problems evicted from the bounded LRU cache.",
+            value=stats.evictions,
+        )
+        yield GaugeMetricFamily(
+            "lotus_advise_target_solver_problem_cache_entries",
+            "Number of compiled target-solver problems currently cached.",
+            value=stats.size,
+        )
+        yield SummaryMetricFamily(
+            "lotus_advise_target_solver_solve_seconds",
+            "Wall-clock time spent in target-solver solves, including fallback attempts.",
+            count_value=stats.solves,
+            sum_value=stats.solve_seconds,
+        )
+
+
+REGISTRY.register(TargetSolverProblemCacheCollector())
 
 _INSTRUMENTATOR_INCLUDE_CONTEXT_ROUTE_VERSION = Version("8.0.1")
 
@@ -123,61 +315,85 @@ def setup_observability(app: FastAPI) -> None:
 
     _install_instrumentator_route_compatibility()
     Instrumentator().instrument(app).expose(app)
+    configure_cpu_offload_observer(record_cpu_offload_task)
+    configure_memo_materialization_observer(record_memo_materialization)
+    configure_event_journal_observer(record_event_journal_events)
+
+    http_pipeline_config(app).add_stage(RequestObservabilityStage())
+
 
-    @app.middleware("http")
-    async def _request_observability_middleware(
-        request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        logger = logging.getLogger("http.access")
-        started = time.perf_counter()
+class RequestObservabilityStage:
+    """Correlation ids, serialization memo, response trace headers, and the access log."""
 
-        correlation_id = resolve_correlation_id(request.headers.get("X-Correlation-Id"))
-        request_id = _resolve_request_id(request.headers.get("X-Request-Id"))
+    def open(self, request: Request) -> "_RequestObservabilityExchange":
+        return _RequestObservabilityExchange(request)
+
+
+class _RequestObservabilityExchange:
+    def __init__(self, request: Request) -> None:
+        self._request = request
+        self._started = time.perf_counter()
+        self._latency_ms: float | None = None
+        self._correlation_id = resolve_correlation_id(request.headers.get("X-Correlation-Id"))
+        self._request_id = _resolve_request_id(request.headers.get("X-Request-Id"))
         traceparent = _meaningful_header(request.headers.get("traceparent")) or ""
-        trace_id = uuid4().hex
-        route_template = request_route_template(request)
-        operation_name = http_operation_name(request)
-        response: Response | None = None
+        self._trace_id = uuid4().hex
+        self._route_template = request_route_template(request)
+        self._operation_name = http_operation_name(request)
         if traceparent:
             parts = traceparent.split("-")
             if len(parts) >= 4 and len(parts[1]) == 32:
-                trace_id = parts[1]
+                self._trace_id = parts[1]
+
+        self._correlation_token = correlation_id_var.set(self._correlation_id)
+        self._request_token = request_id_var.set(self._request_id)
+        self._trace_token = trace_id_var.set(self._trace_id)
+        self._serialization_scope = request_serialization_scope()
+        self._serialization_memo = self._serialization_scope.__enter__()
+
+    def on_response_start(self, status_code: int, headers: MutableHeaders) -> None:
+        # Latency is time to the response start, so streamed bodies do not inflate it.
+        self._latency_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        headers["X-Correlation-Id"] = (
+            normalize_optional_correlation_id(headers.get("X-Correlation-Id"))
+            or self._correlation_id
+        )
+        headers["X-Request-Id"] = self._request_id
+        headers["X-Trace-Id"] = self._trace_id
+        headers["traceparent"] = f"00-{self._trace_id}-0000000000000001-01"
 
-        correlation_token = correlation_id_var.set(correlation_id)
-        request_token = request_id_var.set(request_id)
-        trace_token = trace_id_var.set(trace_id)
+    def close(self, status_code: int | None) -> None:
         try:
-            response = await call_next(request)
-        finally:
-            latency_ms = round((time.perf_counter() - started) * 1000, 2)
-            status_code = response.status_code if response is not None else 500
-            logger.info(
+            self._serialization_scope.__exit__(None, None, None)
+            serialization_counts = self._serialization_memo.counts()
+            # Routing has populated the scope by now, so the handler label names the route.
+            record_request_model_serializations(
+                handler=request_route_template(self._request),
+                serialized=serialization_counts.serialized,
+                reused=serialization_counts.reused,
+            )
+            latency_ms = self._latency_ms
+            if latency_ms is None:
+                latency_ms = round((time.perf_counter() - self._started) * 1000, 2)
+            resolved_status_code = status_code if status_code is not None else 500
+            logging.getLogger("http.access").info(
                 "request.completed",
                 extra={
                     "extra_fields": {
-                        "http_method": request.method,
-                        "endpoint": route_template,
-                        "route_template": route_template,
-                        "operation_name": operation_name,
-                        "http_status_code": status_code,
-                        "http_status_class": _http_status_class(status_code),
+                        "http_method": self._request.method,
+                        "endpoint": self._route_template,
+                        "route_template": self._route_template,
+                        "operation_name": self._operation_name,
+                        "http_status_code": resolved_status_code,
+                        "http_status_class": _http_status_class(resolved_status_code),
                         "latency_ms": latency_ms,
                     }
                 },
             )
-            correlation_id_var.reset(correlation_token)
-            request_id_var.reset(request_token)
-            trace_id_var.reset(trace_token)
-
-        response_correlation_id = (
-            normalize_optional_correlation_id(response.headers.get("X-Correlation-Id"))
-            or correlation_id
-        )
-        response.headers["X-Correlation-Id"] = response_correlation_id
-        response.headers["X-Request-Id"] = request_id
-        response.headers["X-Trace-Id"] = trace_id
-        response.headers["traceparent"] = f"00-{trace_id}-0000000000000001-01"
-        return response
+        finally:
+            correlation_id_var.reset(self._correlation_token)
+            request_id_var.reset(self._request_token)
+            trace_id_var.reset(self._trace_token)
 
 
 def request_route_template(request: Request) -> str:
@@ -244,6 +460,117 @@ def record_policy_evaluation_operation(
     )
 
 
+def record_idempotency_retention_decisions(
+    *,
+    record_table: str,
+    decision_counts: dict[str, int],
+    purged: int,
+) -> None:
+    for decision, count in decision_counts.items():
+        IDEMPOTENCY_RETENTION_RECORDS_TOTAL.labels(
+            record_table=record_table,
+            decision=decision.lower(),
+        ).inc(count)
+    if purged:
+        IDEMPOTENCY_RETENTION_RECORDS_TOTAL.labels(
+            record_table=record_table,
+            decision="purged",
+        ).inc(purged)
+
+
+def record_event_partition_maintenance(
+    *,
+    record_table: str,
+    created: int,
+    dropped: int,
+    blocked: int,
+) -> None:
+    for outcome, count in (("created", created), ("dropped", dropped), ("blocked", blocked)):
+        if count:
+            EVENT_PARTITION_MAINTENANCE_TOTAL.labels(
+                record_table=record_table,
+                outcome=outcome,
+            ).inc(count)
+
+
+def record_advisory_copilot_draft_cache(
+    *,
+    outcome: str,
+    avoided_token_estimate: int = 0,
+    avoided_latency_ms: int = 0,
+) -> None:
+    ADVISORY_COPILOT_DRAFT_CACHE_TOTAL.labels(outcome=outcome).inc()
+    if avoided_token_estimate > 0:
+        ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_TOKENS_TOTAL.inc(avoided_token_estimate)
+    if avoided_latency_ms > 0:
+        ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_LATENCY_MS_TOTAL.inc(avoided_latency_ms)
+
+
+def record_advisory_copilot_stream_latency(*, phase: str, seconds: float) -> None:
+    ADVISORY_COPILOT_STREAM_LATENCY_SECONDS.labels(phase=phase).observe(max(seconds, 0.0))
+
+
+def record_target_batch_portfolio(*, status: str) -> None:
+    TARGET_BATCH_PORTFOLIOS_TOTAL.labels(
+        status=_bounded_policy_operation_value(status, default="unknown")
+    ).inc()
+
+
+def record_proposal_bulk_simulation_item(*, outcome: str) -> None:
+    PROPOSAL_BULK_SIMULATION_ITEMS_TOTAL.labels(
+        outcome=_bounded_policy_operation_value(outcome, default="unknown")
+    ).inc()
+
+
+def record_target_batch_duration(*, seconds: float) -> None:
+    TARGET_BATCH_DURATION_SECONDS.observe(max(seconds, 0.0))
+
+
+def record_cpu_offload_task(
+    *,
+    stage: str,
+    mode: str,
+    queue_seconds: float,
+    run_seconds: float,
+) -> None:
+    if mode == "process":
+        CPU_OFFLOAD_QUEUE_SECONDS.labels(stage=stage).observe(max(queue_seconds, 0.0))
+    CPU_OFFLOAD_RUN_SECONDS.labels(stage=stage, mode=mode).observe(max(run_seconds, 0.0))
+
+
+def record_memo_materialization(*, event: str, outcome: str) -> None:
+    MEMO_MATERIALIZATION_TOTAL.labels(event=event, outcome=outcome).inc()
+
+
+def record_event_journal_events(*, family: str, outcome: str, count: int) -> None:
+    EVENT_JOURNAL_EVENTS_TOTAL.labels(family=family, outcome=outcome).inc(count)
+
+
+def record_request_model_serializations(*, handler: str, serialized: int, reused: int) -> None:
+    if serialized > 0:
+        REQUEST_MODEL_SERIALIZATIONS_TOTAL.labels(handler=handler, outcome="serialized").inc(
+            serialized
+        )
+    if reused > 0:
+        REQUEST_MODEL_SERIALIZATIONS_TOTAL.labels(handler=handler, outcome="reused").inc(reused)
+
+
+def record_enterprise_policy_middleware(*, decision: str, seconds: float) -> None:
+    ENTERPRISE_POLICY_MIDDLEWARE_SECONDS.labels(decision=decision).observe(max(seconds, 0.0))
+
+
+def record_enterprise_policy_reload() -> None:
+    ENTERPRISE_POLICY_RELOADS_TOTAL.inc()
+
+
+def record_audit_sink_event(*, outcome: str) -> None:
+    AUDIT_SINK_EVENTS_TOTAL.labels(outcome=outcome).inc()
+
+
+def record_audit_sink_batch(*, size: int) -> None:
+    AUDIT_SINK_BATCH_SIZE.observe(size)
+
+
 def _bounded_policy_operation_value(value: str, *, default: str) -> str:
     normalized = str(value or "").strip().lower().replace("-", "_").replace(".", "_")
     normalized = "".join(char for char in normalized if char.isalnum() or char == "_")
@@ -11,6 +11,32 @@ POLICY_EVALUATION_OPERATION_METRIC_LABELS: tuple[str, ...] = (
     "dependency",
 )
 
+IDEMPOTENCY_RETENTION_METRIC_LABELS: tuple[str, ...] = (
+    "record_table",
+    "decision",
+)
+
+EVENT_PARTITION_MAINTENANCE_METRIC_LABELS: tuple[str, ...] = (
+    "record_table",
+    "outcome",
+)
+
+ADVISORY_COPILOT_DRAFT_CACHE_METRIC_LABELS: tuple[str, ...] = ("outcome",)
+
+ADVISORY_COPILOT_STREAM_METRIC_LABELS: tuple[str, ...] = ("phase",)
+
+SIMULATION_BASELINE_CACHE_METRIC_LABELS: tuple[str, ...] = ("outcome",)
+TARGET_SOLVER_PROBLEM_CACHE_METRIC_LABELS: tuple[str, ...] = ("outcome",)
+TARGET_BATCH_METRIC_LABELS: tuple[str, ...] = ("status",)
+PROPOSAL_BULK_SIMULATION_METRIC_LABELS: tuple[str, ...] = ("outcome",)
+CPU_OFFLOAD_QUEUE_METRIC_LABELS: tuple[str, ...] = ("stage",)
+CPU_OFFLOAD_RUN_METRIC_LABELS: tuple[str, ...] = ("stage", "mode")
+REQUEST_MODEL_SERIALIZATION_METRIC_LABELS: tuple[str, ...] = ("handler", "outcome")
+ENTERPRISE_POLICY_MIDDLEWARE_METRIC_LABELS: tuple[str, ...] = ("decision",)
+AUDIT_SINK_EVENT_METRIC_LABELS: tuple[str, ...] = ("outcome",)
+MEMO_MATERIALIZATION_METRIC_LABELS: tuple[str, ...] = ("event", "outcome")
+EVENT_JOURNAL_METRIC_LABELS: tuple[str, ...] = ("family", "outcome")
+
 POLICY_EVALUATION_OPERATION_FORBIDDEN_LABEL_FIELDS: tuple[str, ...] = (
     "evaluation_id",
     "proposal_id",
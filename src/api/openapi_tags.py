@@ -97,6 +97,13 @@ OPENAPI_TAGS: list[dict[str, str]] = [
             "affected-portfolio evaluation."
         ),
     },
+    {
+        "name": "Advisory Target Generation",
+        "description": (
+            "Batch target-generation endpoints that solve constrained per-portfolio target "
+            "weights against a shared reference model for model rebalancing waves."
+        ),
+    },
     {
         "name": "Health",
         "description": "Operational liveness and readiness probes for runtime health verification.",
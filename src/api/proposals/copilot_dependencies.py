@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import logging
+from datetime import timedelta
+from functools import partial
 from typing import cast
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 
 from src.api.proposals.copilot_errors import copilot_repository_unavailable_exception
 from src.api.proposals.router import get_proposal_repository
@@ -11,14 +14,20 @@ from src.core.advisory_copilot.application import (
     AdvisoryCopilotApplicationService,
     AdvisoryCopilotDraftGenerator,
 )
+from src.core.advisory_copilot.draft_cache import AdvisoryCopilotDraftCache
 from src.core.advisory_copilot.repository import AdvisoryCopilotRepository
 from src.core.policy_packs.persistence import list_policy_evaluation_records
 from src.core.proposals.repository import ProposalRepository
 from src.integrations.lotus_ai import generate_advisory_copilot_draft_with_lotus_ai
-from src.runtime.advisory_copilot_repositories import build_advisory_copilot_repository
+from src.runtime.advisory_copilot_repositories import (
+    advisory_copilot_draft_cache_ttl_seconds,
+    build_advisory_copilot_repository,
+)
 
 _COPILOT_REPOSITORY: AdvisoryCopilotRepository | None = None
 
+logger = logging.getLogger(__name__)
+
 
 def get_advisory_copilot_repository() -> AdvisoryCopilotRepository:
     global _COPILOT_REPOSITORY
@@ -31,6 +40,18 @@ def get_advisory_copilot_repository() -> AdvisoryCopilotRepository:
     return _COPILOT_REPOSITORY
 
 
+def get_optional_advisory_copilot_repository() -> AdvisoryCopilotRepository | None:
+    """Copilot store for reads that can leave copilot data out; None while it is unavailable."""
+    try:
+        return get_advisory_copilot_repository()
+    except HTTPException as exc:
+        logger.warning(
+            "Advisory copilot repository unavailable; copilot data omitted",
+            extra={"detail": exc.detail},
+        )
+        return None
+
+
 def reset_advisory_copilot_repository_for_tests() -> None:
     global _COPILOT_REPOSITORY
     _COPILOT_REPOSITORY = None
@@ -41,10 +62,7 @@ def get_advisory_copilot_application_service(
 ) -> AdvisoryCopilotApplicationService:
     return AdvisoryCopilotApplicationService(
         repository=repository,
-        draft_generator=cast(
-            AdvisoryCopilotDraftGenerator,
-            generate_advisory_copilot_draft_with_lotus_ai,
-        ),
+        draft_generator=_advisory_copilot_draft_generator(repository),
         policy_evaluation_loader=list_policy_evaluation_records,
     )
 
@@ -55,6 +73,24 @@ def get_advisory_proposal_repository(
     return repository
 
 
+def _advisory_copilot_draft_generator(
+    repository: AdvisoryCopilotRepository,
+) -> AdvisoryCopilotDraftGenerator:
+    ttl_seconds = advisory_copilot_draft_cache_ttl_seconds()
+    if ttl_seconds == 0:
+        return cast(AdvisoryCopilotDraftGenerator, generate_advisory_copilot_draft_with_lotus_ai)
+    return cast(
+        AdvisoryCopilotDraftGenerator,
+        partial(
+            generate_advisory_copilot_draft_with_lotus_ai,
+            draft_cache=AdvisoryCopilotDraftCache(
+                repository=repository,
+                ttl=timedelta(seconds=ttl_seconds),
+            ),
+        ),
+    )
+
+
 def _advisory_copilot_postgres_dsn() -> str:
     import os
 
@@ -40,12 +40,17 @@ def run_copilot_operation(
 
 
 def raise_copilot_http_exception(exc: ValueError) -> NoReturn:
+    status_code, detail = copilot_error_status(exc)
+    raise HTTPException(status_code=status_code, detail=detail) from exc
+
+
+def copilot_error_status(exc: ValueError) -> tuple[int, str]:
     detail = safe_copilot_error_detail(str(exc))
     if detail.endswith("_NOT_FOUND"):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from exc
+        return status.HTTP_404_NOT_FOUND, detail
     if "CONFLICT" in detail or "TERMINAL" in detail:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from exc
-    raise HTTPException(status_code=HTTP_422_UNPROCESSABLE, detail=detail) from exc
+        return status.HTTP_409_CONFLICT, detail
+    return HTTP_422_UNPROCESSABLE, detail
 
 
 def safe_copilot_error_detail(error_detail: str) -> str:
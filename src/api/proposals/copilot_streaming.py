@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastapi import status
+
+from src.api.observability import record_advisory_copilot_stream_latency
+from src.api.proposals.copilot_errors import copilot_error_status
+from src.core.advisory_copilot.api_response_models import AdvisoryCopilotRunResponse
+from src.core.advisory_copilot.application import AdvisoryCopilotSectionListener
+
+COPILOT_STREAM_MEDIA_TYPE = "text/event-stream"
+COPILOT_STREAM_EVENT_STARTED = "run.started"
+COPILOT_STREAM_EVENT_SECTION = "section.grounded"
+COPILOT_STREAM_EVENT_COMPLETED = "run.completed"
+COPILOT_STREAM_EVENT_FAILED = "run.failed"
+COPILOT_STREAM_FAILED_DETAIL = "ADVISORY_COPILOT_STREAM_FAILED"
+COPILOT_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+COPILOT_STREAM_WORKERS_ENV = "ADVISORY_COPILOT_STREAM_WORKERS"
+DEFAULT_COPILOT_STREAM_WORKERS = 8
+COPILOT_STREAM_QUEUE_MAX_EVENTS = 32
+COPILOT_STREAM_POLL_SECONDS = 0.5
+
+CopilotStreamRunAction = Callable[[AdvisoryCopilotSectionListener], AdvisoryCopilotRunResponse]
+CopilotStreamDisconnectProbe = Callable[[], Awaitable[bool]]
+_StreamEvent = tuple[str, dict[str, Any]]
+
+logger = logging.getLogger(__name__)
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def advisory_copilot_stream_workers() -> int:
+    raw_value = os.getenv(COPILOT_STREAM_WORKERS_ENV)
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_COPILOT_STREAM_WORKERS
+    try:
+        workers = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("ADVISORY_COPILOT_STREAM_WORKERS_INVALID") from exc
+    if workers < 1:
+        raise RuntimeError("ADVISORY_COPILOT_STREAM_WORKERS_INVALID")
+    return workers
+
+
+def shutdown_copilot_stream_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def stream_advisory_copilot_run_events(
+    *,
+    run_action: CopilotStreamRunAction,
+    started: dict[str, Any],
+    on_completed: Callable[[AdvisoryCopilotRunResponse], None] | None = None,
+    is_disconnected: CopilotStreamDisconnectProbe | None = None,
+) -> AsyncIterator[str]:
+    """Yield Server-Sent Events for one copilot run executed on the shared stream executor.
+
+    The final ``run.completed`` event carries the same persisted run response as the blocking
+    route; section events are previews of that run and never replace it. A run that has not
+    started when the client disconnects, or the response is closed early, is skipped. A run that
+    has started may already have called lotus-ai, so it finishes and persists without publishing.
+    """
+    started_at = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    events: queue.Queue[_StreamEvent | None] = queue.Queue(maxsize=COPILOT_STREAM_QUEUE_MAX_EVENTS)
+    ready = asyncio.Event()
+    cancelled = threading.Event()
+
+    def _publish(item: _StreamEvent | None) -> bool:
+        # The queue is bounded, so a slow client holds the producer back instead of letting
+        # events pile up; a cancelled stream releases it and later events are dropped.
+        while not cancelled.is_set():
+            try:
+                events.put(item, timeout=COPILOT_STREAM_POLL_SECONDS)
+            except queue.Full:
+                continue
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                cancelled.set()
+                return False
+            return True
+        return False
+
+    def _on_section(section: dict[str, Any]) -> None:
+        _publish((COPILOT_STREAM_EVENT_SECTION, section))
+
+    def _run() -> None:
+        outcome: _StreamEvent | None = None
+        try:
+            if cancelled.is_set():
+                logger.info("Advisory copilot stream run skipped after client disconnect")
+                return
+            response = run_action(_on_section)
+            if on_completed is not None:
+                on_completed(response)
+            if cancelled.is_set():
+                logger.info("Advisory copilot stream run persisted after client disconnect")
+            outcome = (COPILOT_STREAM_EVENT_COMPLETED, response.model_dump(mode="json"))
+        except ValueError as exc:
+            status_code, detail = copilot_error_status(exc)
+            outcome = (COPILOT_STREAM_EVENT_FAILED, _failure(status_code, detail))
+        except Exception:
+            logger.exception("Advisory copilot stream run failed")
+            outcome = (
+                COPILOT_STREAM_EVENT_FAILED,
+                _failure(status.HTTP_500_INTERNAL_SERVER_ERROR, COPILOT_STREAM_FAILED_DETAIL),
+            )
+        finally:
+            if outcome is not None:
+                _publish(outcome)
+            _publish(None)
+
+    _resolve_executor().submit(contextvars.copy_context().run, _run)
+    try:
+        sequence = 0
+        yield format_copilot_stream_event(
+            event=COPILOT_STREAM_EVENT_STARTED,
+            sequence=sequence,
+            data=started,
+        )
+        record_advisory_copilot_stream_latency(
+            phase="first_byte",
+            seconds=time.perf_counter() - started_at,
+        )
+        section_index = 0
+        while True:
+            try:
+                item = events.get_nowait()
+            except queue.Empty:
+                ready.clear()
+                if events.empty():
+                    if not await _wait_for_event(ready=ready, is_disconnected=is_disconnected):
+                        return
+                continue
+            if item is None:
+                return
+            event, data = item
+            sequence += 1
+            elapsed = time.perf_counter() - started_at
+            if event == COPILOT_STREAM_EVENT_SECTION:
+                data = _section_event(section=data, section_index=section_index, elapsed=elapsed)
+                section_index += 1
+                record_advisory_copilot_stream_latency(phase="section", seconds=elapsed)
+            elif event == COPILOT_STREAM_EVENT_COMPLETED:
+                record_advisory_copilot_stream_latency(phase="completed", seconds=elapsed)
+            yield format_copilot_stream_event(event=event, sequence=sequence, data=data)
+    finally:
+        # Runs on normal completion, on client disconnect, and on task cancellation.
+        cancelled.set()
+
+
+def format_copilot_stream_event(*, event: str, sequence: int, data: dict[str, Any]) -> str:
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {sequence}\nevent: {event}\ndata: {payload}\n\n"
+
+
+async def _wait_for_event(
+    *,
+    ready: asyncio.Event,
+    is_disconnected: CopilotStreamDisconnectProbe | None,
+) -> bool:
+    """Wait for the producer; return ``False`` once the client is known to be gone."""
+    try:
+        await asyncio.wait_for(ready.wait(), timeout=COPILOT_STREAM_POLL_SECONDS)
+    except TimeoutError:
+        if is_disconnected is not None and await is_disconnected():
+            return False
+    return True
+
+
+def _resolve_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=advisory_copilot_stream_workers(),
+                thread_name_prefix="advisory-copilot-stream",
+            )
+        return _EXECUTOR
+
+
+def _section_event(
+    *,
+    section: dict[str, Any],
+    section_index: int,
+    elapsed: float,
+) -> dict[str, Any]:
+    return {
+        "section_index": section_index,
+        "section_key": section.get("section_key"),
+        "grounding_status": section.get("grounding_status"),
+        "review_state": section.get("review_state"),
+        "elapsed_ms": int(elapsed * 1000),
+        "section": section,
+    }
+
+
+def _failure(status_code: int, detail: str) -> dict[str, Any]:
+    return {"status_code": status_code, "detail": detail}
+
+
+__all__ = [
+    "COPILOT_STREAM_WORKERS_ENV",
+    "COPILOT_STREAM_EVENT_COMPLETED",
+    "COPILOT_STREAM_EVENT_FAILED",
+    "COPILOT_STREAM_EVENT_SECTION",
+    "COPILOT_STREAM_EVENT_STARTED",
+    "COPILOT_STREAM_HEADERS",
+    "COPILOT_STREAM_MEDIA_TYPE",
+    "COPILOT_STREAM_QUEUE_MAX_EVENTS",
+    "DEFAULT_COPILOT_STREAM_WORKERS",
+    "advisory_copilot_stream_workers",
+    "format_copilot_stream_event",
+    "shutdown_copilot_stream_executor",
+    "stream_advisory_copilot_run_events",
+]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Query
+
+from src.core.replay.evidence_export import (
+    EVIDENCE_EXPORT_MAX_PAGE_SIZE,
+    EvidenceExportFormat,
+)
+
+EvidenceExportPortfolioIdQuery = Annotated[
+    str | None,
+    Query(
+        description="Export every proposal of this portfolio. Required unless both bounds are set.",
+        examples=["PB_SG_GLOBAL_BAL_001"],
+    ),
+]
+
+EvidenceExportCreatedFromQuery = Annotated[
+    datetime | None,
+    Query(
+        description="Proposal created-at lower bound in UTC ISO8601.",
+        examples=["2026-01-01T00:00:00Z"],
+    ),
+]
+
+EvidenceExportCreatedToQuery = Annotated[
+    datetime | None,
+    Query(
+        description="Proposal created-at upper bound in UTC ISO8601.",
+        examples=["2026-07-01T00:00:00Z"],
+    ),
+]
+
+EvidenceExportFormatQuery = Annotated[
+    EvidenceExportFormat,
+    Query(
+        description="Bundle encoding: `ndjson` (one entry per line) or `tar` (one file per entry).",
+        examples=["ndjson"],
+    ),
+]
+
+EvidenceExportPageSizeQuery = Annotated[
+    int | None,
+    Query(
+        description="Records read per repository page while streaming.",
+        ge=1,
+        le=EVIDENCE_EXPORT_MAX_PAGE_SIZE,
+        examples=[100],
+    ),
+]
+
+EvidenceExportIncludeCopilotRunsQuery = Annotated[
+    bool,
+    Query(
+        description=(
+            "Include copilot runs. When false, or when the copilot store is unavailable, the "
+            "header records `sections.copilot_runs: false` and no copilot runs are exported."
+        ),
+        examples=[True],
+    ),
+]
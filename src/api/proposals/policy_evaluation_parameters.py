@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import Header, Path, Query
 
+from src.core.policy_packs.record_query import (
+    POLICY_EVALUATION_DEFAULT_PAGE_SIZE,
+    POLICY_EVALUATION_MAX_PAGE_SIZE,
+)
+
 PolicyEvaluationProposalIdPath = Annotated[
     str,
     Path(
@@ -50,6 +56,61 @@ PolicyEvaluationPortfolioIdQuery = Annotated[
     ),
 ]
 
+PolicyEvaluationJurisdictionQuery = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Optional jurisdiction filter matched against the jurisdiction selector the policy "
+            "pack applied to. Matching is case-insensitive."
+        ),
+        examples=["SG"],
+    ),
+]
+
+PolicyEvaluationGeneratedAfterQuery = Annotated[
+    datetime | None,
+    Query(
+        description=(
+            "Optional inclusive lower bound on evaluation generation time. Timestamps without an "
+            "offset are read as UTC."
+        ),
+        examples=["2026-05-01T00:00:00+00:00"],
+    ),
+]
+
+PolicyEvaluationGeneratedBeforeQuery = Annotated[
+    datetime | None,
+    Query(
+        description=(
+            "Optional exclusive upper bound on evaluation generation time, used to read records "
+            "older than a review age. Timestamps without an offset are read as UTC."
+        ),
+        examples=["2026-05-26T00:00:00+00:00"],
+    ),
+]
+
+PolicyEvaluationPageLimitQuery = Annotated[
+    int | None,
+    Query(
+        ge=1,
+        le=POLICY_EVALUATION_MAX_PAGE_SIZE,
+        description=(
+            "Optional page size. Defaults to "
+            f"{POLICY_EVALUATION_DEFAULT_PAGE_SIZE} records per page."
+        ),
+        examples=[POLICY_EVALUATION_DEFAULT_PAGE_SIZE],
+    ),
+]
+
+PolicyEvaluationPageCursorQuery = Annotated[
+    str | None,
+    Query(
+        max_length=512,
+        description="Optional opaque `next_cursor` returned by the previous page.",
+        examples=["eyJldmFsdWF0aW9uX2lkIjoicGV2XzEyM2FiYyJ9"],
+    ),
+]
+
 PolicyEvaluationIdPath = Annotated[
     str,
     Path(description="Policy evaluation record identifier.", examples=["pev_123abc"]),
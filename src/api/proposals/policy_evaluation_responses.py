@@ -28,7 +28,10 @@ POLICY_EVALUATION_CREATE_RESPONSES = {
 }
 
 POLICY_REVIEW_QUEUE_RESPONSES = {
-    status.HTTP_200_OK: {"description": "Policy review queue returned."}
+    status.HTTP_200_OK: {"description": "Policy review queue returned."},
+    HTTP_422_UNPROCESSABLE: {
+        "description": "Review queue cursor, page size, or generation-time window is invalid."
+    },
 }
 
 POLICY_EVALUATION_READ_RESPONSES = {
@@ -24,6 +24,11 @@ from src.core.policy_packs.repositories import (
 )
 from src.core.proposals import ProposalWorkflowService
 from src.core.proposals.repository import ProposalRepository
+from src.core.tactical_house_view import (
+    clear_tactical_house_view_affected_cohorts_for_tests,
+    configure_tactical_house_view_cohort_repository,
+)
+from src.core.tactical_house_view_repository import TacticalHouseViewCohortRepository
 
 router = APIRouter()
 
@@ -32,10 +37,12 @@ _SERVICE: Optional[ProposalWorkflowService] = None
 _POLICY_EVALUATION_REPOSITORY: Optional[PolicyEvaluationRepository] = None
 _POLICY_PACK_CATALOG_REPOSITORY: Optional[PolicyPackCatalogRepository] = None
 _POLICY_EVIDENCE_SERVICE: Optional[PolicyEvidenceApplicationService] = None
+_TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY: Optional[TacticalHouseViewCohortRepository] = None
 _ROUTE_MODULES = (
     "src.api.proposals.routes_lifecycle",
     "src.api.proposals.routes_async",
     "src.api.proposals.routes_support",
+    "src.api.proposals.routes_evidence_export",
     "src.api.proposals.routes_delivery",
     "src.api.proposals.routes_memo",
     "src.api.proposals.routes_policy_packs",
@@ -102,10 +109,21 @@ def _resolve_policy_pack_catalog_repository() -> PolicyPackCatalogRepository:
     return _POLICY_PACK_CATALOG_REPOSITORY
 
 
+def _resolve_tactical_house_view_cohort_repository() -> TacticalHouseViewCohortRepository:
+    global _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY
+    if _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY is None:
+        _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY = (
+            runtime.build_tactical_house_view_cohort_repository()
+        )
+        configure_tactical_house_view_cohort_repository(_TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY)
+    return _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY
+
+
 def ensure_proposal_runtime_ready() -> None:
     _ = _resolve_repository()
     _ = _resolve_policy_pack_catalog_repository()
     _ = _resolve_policy_evaluation_repository()
+    _ = _resolve_tactical_house_view_cohort_repository()
 
 
 def recover_proposal_async_runtime() -> int:
@@ -118,13 +136,16 @@ def reset_proposal_workflow_service_for_tests() -> None:
     global _POLICY_EVALUATION_REPOSITORY
     global _POLICY_PACK_CATALOG_REPOSITORY
     global _POLICY_EVIDENCE_SERVICE
+    global _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY
     _REPOSITORY = None
     _SERVICE = None
     _POLICY_EVALUATION_REPOSITORY = None
     _POLICY_PACK_CATALOG_REPOSITORY = None
     _POLICY_EVIDENCE_SERVICE = None
+    _TACTICAL_HOUSE_VIEW_COHORT_REPOSITORY = None
     reset_policy_pack_catalog_for_tests()
     reset_policy_evaluation_store_for_tests()
+    clear_tactical_house_view_affected_cohorts_for_tests()
 
 
 def _assert_lifecycle_enabled() -> None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
-from fastapi import Depends, status
+from fastapi import Depends, Request, status
+from fastapi.responses import StreamingResponse
 
+from src.api.observability import record_advisory_copilot_draft_cache
 from src.api.proposals import router as shared
 from src.api.proposals.copilot_dependencies import (
     get_advisory_copilot_application_service,
@@ -28,6 +30,11 @@ from src.api.proposals.copilot_parameters import (
 from src.api.proposals.copilot_review_principal import (
     require_advisory_copilot_review_principal,
 )
+from src.api.proposals.copilot_streaming import (
+    COPILOT_STREAM_HEADERS,
+    COPILOT_STREAM_MEDIA_TYPE,
+    stream_advisory_copilot_run_events,
+)
 from src.core.advisory_copilot.api_request_models import (
     AdvisoryCopilotActionRequest,
     AdvisoryCopilotEvidencePacketCreateRequest,
@@ -43,6 +50,11 @@ from src.core.advisory_copilot.api_response_models import (
 )
 from src.core.advisory_copilot.application import (
     AdvisoryCopilotApplicationService,
+    AdvisoryCopilotSectionListener,
+)
+from src.core.advisory_copilot.draft_cache import (
+    DRAFT_CACHE_LINEAGE_FIELD,
+    advisory_copilot_draft_cache_outcome,
 )
 from src.core.advisory_copilot.review_authority import CopilotReviewPrincipal
 from src.core.advisory_copilot.supportability import (
@@ -153,7 +165,7 @@ def run_advisory_copilot_action(
     correlation_id: AdvisoryCopilotCorrelationIdHeader = None,
     service: AdvisoryCopilotApplicationService = Depends(get_advisory_copilot_application_service),
 ) -> AdvisoryCopilotRunResponse:
-    return cast(
+    response = cast(
         AdvisoryCopilotRunResponse,
         run_copilot_operation(
             lambda: service.run_action(
@@ -163,6 +175,76 @@ def run_advisory_copilot_action(
             )
         ),
     )
+    if not response.replayed:
+        _record_draft_cache_outcome(response.run.lineage_json)
+    return response
+
+
+@shared.router.post(
+    "/advisory/copilot/actions/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["Advisory Copilot"],
+    summary="Stream Governed Advisory Copilot Action",
+    description=(
+        "Executes the same governed advisory copilot action as `POST /advisory/copilot/actions` "
+        "and streams Server-Sent Events: `run.started` immediately, one `section.grounded` "
+        "event per output section once its claims are aligned to evidence, then "
+        "`run.completed` with the persisted run record or `run.failed` with the error status "
+        "and detail. Section events are review-gated previews; the completed run is "
+        "authoritative. A client that disconnects before the run starts skips it; a started "
+        "run still completes and persists, so a retry with the same Idempotency-Key replays it."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Server-Sent Events stream for the copilot run.",
+            "content": {COPILOT_STREAM_MEDIA_TYPE: {}},
+        },
+    },
+)
+def stream_advisory_copilot_action(
+    payload: AdvisoryCopilotActionRequest,
+    request: Request,
+    idempotency_key: AdvisoryCopilotOptionalIdempotencyKeyHeader = None,
+    correlation_id: AdvisoryCopilotCorrelationIdHeader = None,
+    service: AdvisoryCopilotApplicationService = Depends(get_advisory_copilot_application_service),
+) -> StreamingResponse:
+    def _run_action(section_listener: AdvisoryCopilotSectionListener) -> AdvisoryCopilotRunResponse:
+        return service.run_action(
+            payload=payload,
+            correlation_id=correlation_id,
+            idempotency_key=idempotency_key,
+            section_listener=section_listener,
+        )
+
+    def _on_completed(response: AdvisoryCopilotRunResponse) -> None:
+        if not response.replayed:
+            _record_draft_cache_outcome(response.run.lineage_json)
+
+    return StreamingResponse(
+        stream_advisory_copilot_run_events(
+            run_action=_run_action,
+            started={
+                "evidence_packet_id": payload.evidence_packet_id,
+                "audience": payload.audience,
+                "requested_outputs": list(payload.requested_outputs),
+            },
+            on_completed=_on_completed,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type=COPILOT_STREAM_MEDIA_TYPE,
+        headers=COPILOT_STREAM_HEADERS,
+    )
+
+
+def _record_draft_cache_outcome(lineage: dict[str, Any]) -> None:
+    hit = lineage.get(DRAFT_CACHE_LINEAGE_FIELD)
+    hit = hit if isinstance(hit, dict) else {}
+    record_advisory_copilot_draft_cache(
+        outcome=advisory_copilot_draft_cache_outcome(lineage),
+        avoided_token_estimate=int(hit.get("avoided_token_estimate") or 0),
+        avoided_latency_ms=int(hit.get("avoided_latency_ms") or 0),
+    )
 
 
 @shared.router.get(
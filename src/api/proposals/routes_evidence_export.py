@@ -0,0 +1,147 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from fastapi import Depends, Request, status
+from fastapi.responses import StreamingResponse
+
+import src.api.proposals.router as shared
+from src.api.enterprise_readiness import emit_audit_event
+from src.api.http_status import HTTP_422_UNPROCESSABLE
+from src.api.proposals.copilot_dependencies import get_optional_advisory_copilot_repository
+from src.api.proposals.errors import run_proposal_operation
+from src.api.proposals.evidence_export_parameters import (
+    EvidenceExportCreatedFromQuery,
+    EvidenceExportCreatedToQuery,
+    EvidenceExportFormatQuery,
+    EvidenceExportIncludeCopilotRunsQuery,
+    EvidenceExportPageSizeQuery,
+    EvidenceExportPortfolioIdQuery,
+)
+from src.api.proposals.support_responses import SUPPORT_RUNTIME_UNAVAILABLE_RESPONSE
+from src.core.advisory_copilot.repository import AdvisoryCopilotRepository
+from src.core.policy_packs.persistence import get_policy_evaluation_repository
+from src.core.proposals.repository import ProposalRepository
+from src.core.replay.evidence_export import (
+    EVIDENCE_EXPORT_MEDIA_TYPES,
+    EvidenceExportFormat,
+    EvidenceExportScope,
+    EvidenceExportVerification,
+    iter_evidence_export_entries,
+    normalize_evidence_export_scope,
+    render_evidence_export,
+    report_evidence_export_head,
+)
+
+EVIDENCE_EXPORT_ID_HEADER = "X-Evidence-Export-Id"
+EVIDENCE_EXPORT_AUDIT_ACTION = "PROPOSAL_EVIDENCE_EXPORTED"
+
+
+@shared.router.get(
+    "/advisory/proposals/exports/evidence",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["Advisory Operations & Support"],
+    summary="Stream Proposal Evidence Export",
+    description=(
+        "Streams the lineage and audit evidence of every proposal in a portfolio or created-at "
+        "window: proposals, versions, workflow events, approvals, memos, memo events and copilot "
+        "runs, followed by the policy evaluations and their audit events in the same scope. "
+        "Each entry carries the hash of the previous entry, so editing, removing or reordering "
+        "entries breaks the chain. The last entry is an `export_trailer`; a bundle without it "
+        "was cut short. The export id is returned in `X-Evidence-Export-Id` and in the header "
+        "entry, and the head hash is written to the service audit log under that id, so a "
+        "rebuilt bundle can be told apart from the one that was served. Copilot runs are left "
+        "out, and the header says so, when `include_copilot_runs` is false or the copilot store "
+        "is unavailable."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Hash-chained evidence bundle.",
+            "content": {media_type: {} for media_type in EVIDENCE_EXPORT_MEDIA_TYPES.values()},
+        },
+        HTTP_422_UNPROCESSABLE: {
+            "description": "The export scope is missing, or the created-at window is empty."
+        },
+        **SUPPORT_RUNTIME_UNAVAILABLE_RESPONSE,
+    },
+)
+def stream_proposal_evidence_export(
+    request: Request,
+    portfolio_id: EvidenceExportPortfolioIdQuery = None,
+    created_from: EvidenceExportCreatedFromQuery = None,
+    created_to: EvidenceExportCreatedToQuery = None,
+    export_format: EvidenceExportFormatQuery = "ndjson",
+    page_size: EvidenceExportPageSizeQuery = None,
+    include_copilot_runs: EvidenceExportIncludeCopilotRunsQuery = True,
+    proposals: ProposalRepository = Depends(shared.get_proposal_repository),
+    copilot_runs: AdvisoryCopilotRepository | None = Depends(
+        get_optional_advisory_copilot_repository
+    ),
+) -> StreamingResponse:
+    shared._assert_lifecycle_enabled()
+    shared._assert_support_apis_enabled()
+    scope = run_proposal_operation(
+        lambda: normalize_evidence_export_scope(
+            portfolio_id=portfolio_id,
+            created_from=created_from,
+            created_to=created_to,
+            page_size=page_size,
+        )
+    )
+    exported_at = datetime.now(UTC)
+    export_id = f"evx_{uuid4().hex}"
+
+    def _audit_head(head: EvidenceExportVerification) -> None:
+        _emit_export_audit_event(
+            request=request,
+            export_id=export_id,
+            scope=scope,
+            export_format=export_format,
+            head=head,
+        )
+
+    entries = report_evidence_export_head(
+        iter_evidence_export_entries(
+            scope=scope,
+            proposals=proposals,
+            exported_at=exported_at,
+            policy_evaluations=get_policy_evaluation_repository(),
+            copilot_runs=copilot_runs if include_copilot_runs else None,
+            export_id=export_id,
+        ),
+        on_complete=_audit_head,
+    )
+    filename = f"advisory-evidence-{exported_at:%Y%m%dT%H%M%SZ}.{export_format}"
+    return StreamingResponse(
+        render_evidence_export(entries, export_format=export_format, exported_at=exported_at),
+        media_type=EVIDENCE_EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Cache-Control": "no-store",
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            EVIDENCE_EXPORT_ID_HEADER: export_id,
+        },
+    )
+
+
+def _emit_export_audit_event(
+    *,
+    request: Request,
+    export_id: str,
+    scope: EvidenceExportScope,
+    export_format: EvidenceExportFormat,
+    head: EvidenceExportVerification,
+) -> None:
+    emit_audit_event(
+        action=EVIDENCE_EXPORT_AUDIT_ACTION,
+        actor_id=request.headers.get("X-Actor-Id", "unknown"),
+        tenant_id=request.headers.get("X-Tenant-Id", "default"),
+        role=request.headers.get("X-Role", "unknown"),
+        correlation_id=request.headers.get("X-Correlation-Id"),
+        metadata={
+            "export_id": export_id,
+            "export_format": export_format,
+            "scope": scope.to_dict(),
+            "entry_count": head.entry_count,
+            "head_hash": head.head_hash,
+        },
+    )
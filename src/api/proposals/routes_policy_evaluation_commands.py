@@ -35,9 +35,11 @@ from src.core.policy_packs import (
     PolicyEvaluationPersistenceResult,
 )
 from src.core.proposals.exceptions import ProposalIdempotencyConflictError, ProposalValidationError
+from src.core.proposals.models import ProposalVersionPayloadSection
 
 _POLICY_EVALUATION_REPAIR_INTENT_KEY = "system_repair_intent"
 _TRUSTED_LEGAL_ENTITY_BINDING_REPAIR_CODE = "POLICY_EVALUATION_TRUSTED_LEGAL_ENTITY_BINDING_REPAIR"
+_EVIDENCE_BUNDLE_SECTIONS: tuple[ProposalVersionPayloadSection, ...] = ("evidence_bundle",)
 
 
 @shared.router.post(
@@ -179,14 +181,24 @@ def _bind_policy_evaluation_proposal_evidence(
     proposal_version_id: str,
     evidence_bundle: dict[str, Any],
 ) -> dict[str, Any]:
-    version = next(
+    repository = shared.get_proposal_repository()
+    header = next(
         (
             candidate
-            for candidate in shared.get_proposal_repository().list_versions(proposal_id=proposal_id)
+            for candidate in repository.list_version_headers(proposal_id=proposal_id)
             if candidate.proposal_version_id == proposal_version_id
         ),
         None,
     )
+    version = (
+        repository.get_version_sections(
+            proposal_id=proposal_id,
+            version_no=header.version_no,
+            sections=_EVIDENCE_BUNDLE_SECTIONS,
+        )
+        if header is not None
+        else None
+    )
     if version is None:
         return deepcopy(evidence_bundle)
     if not isinstance(version.evidence_bundle_json, dict):
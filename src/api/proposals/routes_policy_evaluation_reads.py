@@ -5,7 +5,12 @@ from fastapi import status
 import src.api.proposals.router as shared
 from src.api.proposals.errors import run_proposal_operation
 from src.api.proposals.policy_evaluation_parameters import (
+    PolicyEvaluationGeneratedAfterQuery,
+    PolicyEvaluationGeneratedBeforeQuery,
     PolicyEvaluationIdPath,
+    PolicyEvaluationJurisdictionQuery,
+    PolicyEvaluationPageCursorQuery,
+    PolicyEvaluationPageLimitQuery,
     PolicyEvaluationPortfolioIdQuery,
     PolicyEvaluationStatusQuery,
 )
@@ -31,19 +36,36 @@ from src.core.policy_packs import (
     tags=["Advisory Policy Evaluation"],
     summary="Read Policy Review Queue",
     description=(
-        "Returns finalized policy evaluation records filtered by aggregate policy posture. This is "
-        "the Advise source queue for later Gateway and Workbench review surfaces, not a "
-        "client-ready release queue."
+        "Returns finalized policy evaluation records filtered by aggregate policy posture, "
+        "portfolio, jurisdiction, and generation time, one keyset page at a time with total and "
+        "per-status counts. This is the Advise source queue for later Gateway and Workbench "
+        "review surfaces, not a client-ready release queue."
     ),
     responses=POLICY_REVIEW_QUEUE_RESPONSES,
 )
 def read_policy_review_queue(
     evaluation_status: PolicyEvaluationStatusQuery = "PENDING_REVIEW",
     portfolio_id: PolicyEvaluationPortfolioIdQuery = None,
+    jurisdiction: PolicyEvaluationJurisdictionQuery = None,
+    generated_after: PolicyEvaluationGeneratedAfterQuery = None,
+    generated_before: PolicyEvaluationGeneratedBeforeQuery = None,
+    limit: PolicyEvaluationPageLimitQuery = None,
+    cursor: PolicyEvaluationPageCursorQuery = None,
 ) -> PolicyEvaluationReviewQueueResponse:
-    return shared.get_policy_evidence_application_service().get_policy_evaluation_review_queue(
-        evaluation_status=evaluation_status,
-        portfolio_id=portfolio_id,
+    service = shared.get_policy_evidence_application_service()
+    return cast(
+        PolicyEvaluationReviewQueueResponse,
+        run_proposal_operation(
+            lambda: service.get_policy_evaluation_review_queue(
+                evaluation_status=evaluation_status,
+                portfolio_id=portfolio_id,
+                jurisdiction=jurisdiction,
+                generated_after=generated_after,
+                generated_before=generated_before,
+                limit=limit,
+                cursor=cursor,
+            )
+        ),
     )
 
 
@@ -3,7 +3,12 @@ from src.core.policy_packs.repositories import (
     PolicyPackCatalogRepository,
 )
 from src.core.proposals.repository import ProposalRepository
-from src.runtime import policy_repositories, proposal_repositories
+from src.core.tactical_house_view_repository import TacticalHouseViewCohortRepository
+from src.runtime import (
+    policy_repositories,
+    proposal_repositories,
+    tactical_house_view_repositories,
+)
 
 
 def proposal_store_backend_name() -> str:
@@ -36,3 +41,7 @@ def build_policy_evaluation_repository() -> PolicyEvaluationRepository:
 
 def build_policy_pack_catalog_repository() -> PolicyPackCatalogRepository:
     return policy_repositories.build_policy_pack_catalog_repository()
+
+
+def build_tactical_house_view_cohort_repository() -> TacticalHouseViewCohortRepository:
+    return tactical_house_view_repositories.build_tactical_house_view_cohort_repository()
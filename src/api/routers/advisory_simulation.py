@@ -1,20 +1,31 @@
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
 
 from src.api.routers.advisory_simulation_parameters import (
     ProposalArtifactCorrelationIdHeader,
     ProposalArtifactIdempotencyKeyHeader,
+    ProposalBulkSimulationCorrelationIdHeader,
+    ProposalBulkSimulationIdempotencyKeyHeader,
     ProposalSimulationCorrelationIdHeader,
     ProposalSimulationIdempotencyKeyHeader,
 )
 from src.api.routers.advisory_simulation_responses import (
     PROPOSAL_ARTIFACT_RESPONSES,
+    PROPOSAL_BULK_SIMULATION_MEDIA_TYPE,
+    PROPOSAL_BULK_SIMULATION_RESPONSES,
     PROPOSAL_SIMULATION_RESPONSES,
 )
 from src.api.services import advisory_simulation_service as service
+from src.api.services.advisory_bulk_simulation_service import (
+    plan_bulk_proposal_simulation,
+    stream_bulk_proposal_simulation,
+)
 from src.core.advisory.artifact import build_proposal_artifact
 from src.core.advisory.artifact_models import ProposalArtifact
+from src.core.common.cpu_offload import run_cpu_bound
 from src.core.proposal_result_models import ProposalResult
 from src.core.proposals import ProposalSimulationRequest
+from src.core.proposals.bulk_simulation_models import ProposalBulkSimulationRequest
 
 router = APIRouter()
 
@@ -56,6 +67,45 @@ def simulate_proposal(
     )
 
 
+@router.post(
+    "/advisory/proposals/simulate/bulk",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["Advisory Simulation"],
+    summary="Simulate an Advisory Proposal Template Across Portfolios",
+    description=(
+        "Runs one proposal template (trades and cash flows) across a list of portfolios through "
+        "the same simulation path as `POST /advisory/proposals/simulate`, with bounded "
+        "concurrency. Portfolios are either stateless `portfolio_snapshot` entries sharing the "
+        "template market data, shelf, and options, or `stateful_input` entries resolved from "
+        "Lotus Core.\\n\\n"
+        "The response is newline-delimited JSON in completion order: one `RESULT` record with a "
+        "proposal result summary or one `ERROR` record per portfolio, then a `SUMMARY` record. "
+        "A failing portfolio never stops the others.\\n\\n"
+        "Every record carries a `cursor`. Resubmit the same body and `Idempotency-Key` with that "
+        "`cursor` to resume; portfolios before it are skipped and any already simulated after "
+        "it replay from per-portfolio idempotency keys derived from the request key.\\n\\n"
+        "Required header: `Idempotency-Key`.\\n"
+        "Optional header: `X-Correlation-Id` (auto-generated when omitted)."
+    ),
+    responses=PROPOSAL_BULK_SIMULATION_RESPONSES,
+)
+def simulate_proposal_bulk(
+    request: ProposalBulkSimulationRequest,
+    idempotency_key: ProposalBulkSimulationIdempotencyKeyHeader,
+    correlation_id: ProposalBulkSimulationCorrelationIdHeader = None,
+) -> StreamingResponse:
+    plan = plan_bulk_proposal_simulation(
+        request=request,
+        idempotency_key=idempotency_key,
+        correlation_id=correlation_id,
+    )
+    return StreamingResponse(
+        stream_bulk_proposal_simulation(plan),
+        media_type=PROPOSAL_BULK_SIMULATION_MEDIA_TYPE,
+    )
+
+
 @router.post(
     "/advisory/proposals/artifact",
     response_model=ProposalArtifact,
@@ -84,7 +134,9 @@ def build_proposal_artifact_endpoint(
         correlation_id=correlation_id,
         resolved_request=resolved_request,
     )
-    return build_proposal_artifact(
+    return run_cpu_bound(
+        "proposal_artifact",
+        build_proposal_artifact,
         request=resolved_request.simulate_request,
         proposal_result=proposal_result,
     )
@@ -39,3 +39,24 @@ ProposalArtifactCorrelationIdHeader = Annotated[
         examples=["corr-proposal-artifact-1234"],
     ),
 ]
+
+ProposalBulkSimulationIdempotencyKeyHeader = Annotated[
+    str,
+    Header(
+        alias="Idempotency-Key",
+        description=(
+            "Required campaign idempotency key; per-portfolio keys and resume cursors derive "
+            "from it."
+        ),
+        examples=["proposal-bulk-idem-001"],
+    ),
+]
+
+ProposalBulkSimulationCorrelationIdHeader = Annotated[
+    str | None,
+    Header(
+        alias="X-Correlation-Id",
+        description="Optional trace/correlation identifier shared by every portfolio in the run.",
+        examples=["corr-proposal-bulk-1234"],
+    ),
+]
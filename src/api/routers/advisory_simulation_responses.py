@@ -10,6 +10,8 @@ from src.api.simulation_examples import (
     PROPOSAL_READY_EXAMPLE,
 )
 
+PROPOSAL_BULK_SIMULATION_MEDIA_TYPE = "application/x-ndjson"
+
 PROPOSAL_SIMULATION_RESPONSES = {
     status.HTTP_200_OK: {
         "description": "Proposal simulation completed with domain status in payload.",
@@ -42,3 +44,13 @@ PROPOSAL_ARTIFACT_RESPONSES = {
         "description": "Validation error (invalid payload or missing required headers)."
     },
 }
+
+PROPOSAL_BULK_SIMULATION_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Newline-delimited JSON stream of portfolio and summary records.",
+        "content": {PROPOSAL_BULK_SIMULATION_MEDIA_TYPE: {}},
+    },
+    HTTP_422_UNPROCESSABLE: {
+        "description": "Validation error (invalid payload, resume cursor, or missing headers)."
+    },
+}
@@ -1,16 +1,59 @@
 """API routes for tactical house-view source cohorts."""
 
-from fastapi import APIRouter, status
+from typing import Annotated
 
+from fastapi import APIRouter, Path, Query, Request, status
+
+from src.api.http_status import HTTP_422_UNPROCESSABLE
+from src.api.routers.tactical_house_view_errors import (
+    run_tactical_house_view_cohort_page_operation,
+)
+from src.api.services.tactical_house_view_stream_service import (
+    TACTICAL_HOUSE_VIEW_STREAM_MEDIA_TYPE,
+    build_tactical_house_view_cohort_from_stream,
+    record_tactical_house_view_cohort_summary,
+)
 from src.core.tactical_house_view import (
+    TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE,
     TacticalHouseViewAffectedCohort,
+    TacticalHouseViewAffectedCohortSummary,
+    TacticalHouseViewAffectedPortfolioPage,
     TacticalHouseViewCohortRequest,
+    TacticalHouseViewExcludedPortfolioPage,
     build_tactical_house_view_affected_cohort,
+    page_tactical_house_view_affected_portfolios,
+    page_tactical_house_view_excluded_portfolios,
     record_tactical_house_view_affected_cohort,
 )
+from src.core.tactical_house_view_models import TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE
 
 router = APIRouter(prefix="/advisory/tactical-house-view", tags=["Tactical House View"])
 
+TacticalHouseViewCohortIdPath = Annotated[
+    str,
+    Path(description="Stored tactical house-view cohort identifier.", min_length=1),
+]
+TacticalHouseViewCohortPageLimitQuery = Annotated[
+    int,
+    Query(
+        description=(
+            f"Bounded page size. Default is {TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE}; "
+            f"maximum is {TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE}."
+        ),
+        ge=1,
+        le=TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE,
+    ),
+]
+TacticalHouseViewCohortPageCursorQuery = Annotated[
+    str | None,
+    Query(description="Opaque cursor from a previous page of the same cohort list."),
+]
+
+_COHORT_PAGE_RESPONSES: dict[int | str, dict[str, object]] = {
+    status.HTTP_404_NOT_FOUND: {"description": "Stored tactical house-view cohort not found."},
+    HTTP_422_UNPROCESSABLE: {"description": "Invalid page size or cursor."},
+}
+
 
 @router.post(
     "/cohorts/evaluate",
@@ -36,3 +79,101 @@ def evaluate_tactical_house_view_cohort(
     return record_tactical_house_view_affected_cohort(
         build_tactical_house_view_affected_cohort(request)
     )
+
+
+@router.post(
+    "/cohorts/evaluate-stream",
+    response_model=TacticalHouseViewAffectedCohortSummary,
+    status_code=status.HTTP_200_OK,
+    summary="Evaluate tactical house-view affected cohort from a streamed candidate upload",
+    description=(
+        "What: Build the same TacticalHouseViewAffectedCohort:v1 source product as the JSON "
+        "evaluation route from a newline-delimited JSON upload sized for bank-wide tactical "
+        "views.\\n"
+        "When: Use when the candidate universe is too large for one JSON body, such as a tactical "
+        "view across tens of thousands of discretionary portfolios.\\n"
+        "How: The first line carries the tactical view, eligible portfolio types, minimum "
+        "exposure weight, and correlation id; every following line is one source-backed "
+        "candidate portfolio. Candidates are classified as they arrive and the cohort and "
+        "content hashes equal those of the JSON route for the same candidates. The cohort is "
+        "stored and the response returns its summary; affected and excluded portfolios are read "
+        "through the paginated cohort portfolio routes."
+    ),
+    responses={
+        HTTP_422_UNPROCESSABLE: {
+            "description": "Invalid header or candidate line; `loc` names the failing line.",
+        },
+        413: {"description": "Upload exceeds the streamed upload payload limit."},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                TACTICAL_HOUSE_VIEW_STREAM_MEDIA_TYPE: {
+                    "schema": {"type": "string", "format": "binary"},
+                }
+            },
+        }
+    },
+)
+async def evaluate_tactical_house_view_cohort_stream(
+    request: Request,
+) -> TacticalHouseViewAffectedCohortSummary:
+    cohort = await build_tactical_house_view_cohort_from_stream(request.stream())
+    return await record_tactical_house_view_cohort_summary(cohort)
+
+
+@router.get(
+    "/cohorts/{cohort_id}/affected-portfolios",
+    response_model=TacticalHouseViewAffectedPortfolioPage,
+    status_code=status.HTTP_200_OK,
+    summary="List affected portfolios of a stored tactical house-view cohort",
+    description=(
+        "What: Page through the affected portfolios of a stored tactical house-view cohort.\\n"
+        "When: Use after a streamed cohort evaluation, or whenever a cohort is too large to "
+        "consume in one response.\\n"
+        "How: Portfolios are ordered by portfolio identifier; pass `next_cursor` back as "
+        "`cursor` until it is null."
+    ),
+    responses=_COHORT_PAGE_RESPONSES,
+)
+def list_tactical_house_view_cohort_affected_portfolios(
+    cohort_id: TacticalHouseViewCohortIdPath,
+    limit: TacticalHouseViewCohortPageLimitQuery = TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE,
+    cursor: TacticalHouseViewCohortPageCursorQuery = None,
+) -> TacticalHouseViewAffectedPortfolioPage:
+    return run_tactical_house_view_cohort_page_operation(
+        lambda: page_tactical_house_view_affected_portfolios(
+            cohort_id=cohort_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    )
+
+
+@router.get(
+    "/cohorts/{cohort_id}/excluded-portfolios",
+    response_model=TacticalHouseViewExcludedPortfolioPage,
+    status_code=status.HTTP_200_OK,
+    summary="List excluded portfolios of a stored tactical house-view cohort",
+    description=(
+        "What: Page through the excluded portfolios of a stored tactical house-view cohort with "
+        "their exclusion reason codes.\\n"
+        "When: Use after a streamed cohort evaluation to review why candidates were excluded.\\n"
+        "How: Portfolios are ordered by portfolio identifier; pass `next_cursor` back as "
+        "`cursor` until it is null."
+    ),
+    responses=_COHORT_PAGE_RESPONSES,
+)
+def list_tactical_house_view_cohort_excluded_portfolios(
+    cohort_id: TacticalHouseViewCohortIdPath,
+    limit: TacticalHouseViewCohortPageLimitQuery = TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE,
+    cursor: TacticalHouseViewCohortPageCursorQuery = None,
+) -> TacticalHouseViewExcludedPortfolioPage:
+    return run_tactical_house_view_cohort_page_operation(
+        lambda: page_tactical_house_view_excluded_portfolios(
+            cohort_id=cohort_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from fastapi import HTTPException, status
+
+from src.api.http_status import HTTP_422_UNPROCESSABLE
+
+TACTICAL_HOUSE_VIEW_COHORT_NOT_FOUND = "TACTICAL_HOUSE_VIEW_COHORT_NOT_FOUND"
+
+_CohortPage = TypeVar("_CohortPage")
+
+
+def run_tactical_house_view_cohort_page_operation(
+    operation: Callable[[], _CohortPage | None],
+) -> _CohortPage:
+    try:
+        page = operation()
+    except ValueError as exc:
+        raise HTTPException(status_code=HTTP_422_UNPROCESSABLE, detail=str(exc)) from exc
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=TACTICAL_HOUSE_VIEW_COHORT_NOT_FOUND,
+        )
+    return page
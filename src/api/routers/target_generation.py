@@ -0,0 +1,60 @@
+"""API routes for batch model-rebalancing target generation."""
+
+from collections.abc import Iterator
+
+from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+
+from src.api.observability import record_target_batch_duration, record_target_batch_portfolio
+from src.core.target_batch import stream_target_batch
+from src.core.target_batch_models import (
+    TargetBatchPortfolioError,
+    TargetBatchPortfolioResult,
+    TargetBatchRequest,
+)
+
+TARGET_BATCH_MEDIA_TYPE = "application/x-ndjson"
+
+router = APIRouter(prefix="/advisory/target-generation", tags=["Advisory Target Generation"])
+
+
+@router.post(
+    "/batches",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream batch target generation for a model rebalancing wave",
+    description=(
+        "What: Solve constrained target weights for many portfolios that share one reference "
+        "model, product shelf, and engine options.\\n"
+        "When: Use after a reference model change to prepare per-portfolio targets for a "
+        "rebalancing wave before individual proposals are simulated.\\n"
+        "How: The model, shelf, and options are read once and per-portfolio solves fan out to a "
+        "bounded process pool shared by all batches. The response is newline-delimited JSON: one "
+        "`PORTFOLIO` record per portfolio in completion order, carrying its request `sequence`, "
+        "target trace, status, and infeasibility hints, or an `ERROR` record when that "
+        "portfolio's solve fails, followed by one `SUMMARY` record with status and error counts "
+        "and throughput in portfolios per second. It does not create proposals or trades."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Newline-delimited JSON stream of portfolio and summary records.",
+            "content": {TARGET_BATCH_MEDIA_TYPE: {}},
+        },
+    },
+)
+def stream_target_generation_batch(request: TargetBatchRequest) -> StreamingResponse:
+    return StreamingResponse(
+        _target_batch_lines(request),
+        media_type=TARGET_BATCH_MEDIA_TYPE,
+    )
+
+
+def _target_batch_lines(request: TargetBatchRequest) -> Iterator[str]:
+    for record in stream_target_batch(request):
+        if isinstance(record, TargetBatchPortfolioResult):
+            record_target_batch_portfolio(status=record.status)
+        elif isinstance(record, TargetBatchPortfolioError):
+            record_target_batch_portfolio(status="ERROR")
+        else:
+            record_target_batch_duration(seconds=float(record.elapsed_seconds))
+        yield record.model_dump_json() + "\n"
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import cast
+
+from fastapi import HTTPException, status
+
+from src.api.observability import record_proposal_bulk_simulation_item
+from src.api.services import advisory_simulation_service as service
+from src.api.services.advisory_simulation_errors import simulation_validation_exception
+from src.api.services.advisory_simulation_validation import normalize_simulation_idempotency_key
+from src.core.common.serialization_memo import request_serialization_scope
+from src.core.portfolio_models import PortfolioSnapshot
+from src.core.proposal_result_models import ProposalResult
+from src.core.proposals.bulk_simulation import (
+    BulkSimulationProgress,
+    apply_bulk_simulation_template,
+    build_bulk_stateless_simulation_request,
+    bulk_simulation_fingerprint,
+    bulk_simulation_item_idempotency_key,
+    decode_bulk_simulation_cursor,
+    summarize_bulk_simulation_result,
+)
+from src.core.proposals.bulk_simulation_models import (
+    ProposalBulkSimulationItemError,
+    ProposalBulkSimulationItemRecord,
+    ProposalBulkSimulationPortfolio,
+    ProposalBulkSimulationRequest,
+    ProposalBulkSimulationResultSummary,
+)
+from src.core.proposals.correlation import resolve_correlation_id
+from src.core.proposals.models import ProposalSimulationRequest
+
+DEFAULT_PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY = 4
+PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY_ENV = "PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY"
+PROPOSAL_BULK_SIMULATION_ITEM_FAILED_DETAIL = "PROPOSAL_BULK_SIMULATION_ITEM_FAILED"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkSimulationPlan:
+    request: ProposalBulkSimulationRequest
+    idempotency_key: str
+    correlation_id: str
+    progress: BulkSimulationProgress
+    start_sequence: int
+    max_concurrency: int
+
+
+def proposal_bulk_simulation_max_concurrency() -> int:
+    raw_value = os.getenv(PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY_ENV)
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY
+    try:
+        max_concurrency = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY_INVALID") from exc
+    if max_concurrency < 1:
+        raise RuntimeError("PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY_INVALID")
+    return max_concurrency
+
+
+def plan_bulk_proposal_simulation(
+    *,
+    request: ProposalBulkSimulationRequest,
+    idempotency_key: str,
+    correlation_id: str | None,
+) -> BulkSimulationPlan:
+    """Validate the bulk envelope and cursor before any response bytes are sent."""
+    idempotency_key = normalize_simulation_idempotency_key(idempotency_key)
+    fingerprint = bulk_simulation_fingerprint(request=request, idempotency_key=idempotency_key)
+    try:
+        start_sequence = decode_bulk_simulation_cursor(
+            request.cursor,
+            fingerprint=fingerprint,
+            portfolio_count=len(request.portfolios),
+        )
+    except ValueError as exc:
+        raise simulation_validation_exception(str(exc)) from exc
+    return BulkSimulationPlan(
+        request=request,
+        idempotency_key=idempotency_key,
+        correlation_id=resolve_correlation_id(correlation_id),
+        progress=BulkSimulationProgress(
+            fingerprint=fingerprint,
+            start_sequence=start_sequence,
+            portfolio_count=len(request.portfolios),
+        ),
+        start_sequence=start_sequence,
+        max_concurrency=proposal_bulk_simulation_max_concurrency(),
+    )
+
+
+def stream_bulk_proposal_simulation(plan: BulkSimulationPlan) -> Iterator[str]:
+    """Simulate the remaining portfolios with bounded concurrency as NDJSON lines.
+
+    Item records arrive in completion order. At most ``max_concurrency`` portfolios are in
+    flight, so memory stays bounded regardless of campaign size. Cursors advance only when a
+    record is emitted, so a client that resumes never skips a portfolio it did not receive.
+    """
+    pending = iter(list(enumerate(plan.request.portfolios))[plan.start_sequence :])
+    with ThreadPoolExecutor(
+        max_workers=plan.max_concurrency,
+        thread_name_prefix="proposal-bulk-simulation",
+    ) as executor:
+        in_flight: set[Future[_BulkItemOutcome]] = set()
+        try:
+            _fill(executor=executor, plan=plan, pending=pending, in_flight=in_flight)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.difference_update(done)
+                for outcome in sorted((future.result() for future in done), key=_sequence):
+                    yield _item_record(plan=plan, outcome=outcome).model_dump_json() + "\n"
+                _fill(executor=executor, plan=plan, pending=pending, in_flight=in_flight)
+        finally:
+            for future in in_flight:
+                future.cancel()
+    yield plan.progress.summary().model_dump_json() + "\n"
+
+
+@dataclass(frozen=True)
+class _BulkItemOutcome:
+    sequence: int
+    portfolio_id: str
+    idempotency_key: str
+    result: ProposalBulkSimulationResultSummary | None
+    error: ProposalBulkSimulationItemError | None
+
+
+def _sequence(outcome: _BulkItemOutcome) -> int:
+    return outcome.sequence
+
+
+def _item_record(
+    *,
+    plan: BulkSimulationPlan,
+    outcome: _BulkItemOutcome,
+) -> ProposalBulkSimulationItemRecord:
+    item_status = outcome.result.status if outcome.result is not None else None
+    record_proposal_bulk_simulation_item(outcome=item_status or "error")
+    return ProposalBulkSimulationItemRecord(
+        record_type="RESULT" if outcome.result is not None else "ERROR",
+        sequence=outcome.sequence,
+        portfolio_id=outcome.portfolio_id,
+        idempotency_key=outcome.idempotency_key,
+        result=outcome.result,
+        error=outcome.error,
+        cursor=plan.progress.complete(outcome.sequence, status=item_status),
+    )
+
+
+def _fill(
+    *,
+    executor: ThreadPoolExecutor,
+    plan: BulkSimulationPlan,
+    pending: Iterator[tuple[int, ProposalBulkSimulationPortfolio]],
+    in_flight: set[Future[_BulkItemOutcome]],
+) -> None:
+    while len(in_flight) < plan.max_concurrency:
+        next_item = next(pending, None)
+        if next_item is None:
+            return
+        sequence, portfolio = next_item
+        in_flight.add(
+            executor.submit(
+                contextvars.copy_context().run,
+                _simulate_bulk_item,
+                plan,
+                sequence,
+                portfolio,
+            )
+        )
+
+
+def _simulate_bulk_item(
+    plan: BulkSimulationPlan,
+    sequence: int,
+    portfolio: ProposalBulkSimulationPortfolio,
+) -> _BulkItemOutcome:
+    item_key = bulk_simulation_item_idempotency_key(
+        idempotency_key=plan.idempotency_key,
+        portfolio_id=portfolio.portfolio_id,
+    )
+    result: ProposalBulkSimulationResultSummary | None = None
+    error: ProposalBulkSimulationItemError | None = None
+    try:
+        # Each portfolio gets its own memo so sealed dumps are released when the item finishes.
+        with request_serialization_scope():
+            result = summarize_bulk_simulation_result(
+                _simulate_portfolio(plan=plan, portfolio=portfolio, idempotency_key=item_key)
+            )
+    except HTTPException as exc:
+        error = ProposalBulkSimulationItemError(status_code=exc.status_code, detail=str(exc.detail))
+    except Exception:
+        logger.exception("Bulk proposal simulation item failed")
+        error = ProposalBulkSimulationItemError(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=PROPOSAL_BULK_SIMULATION_ITEM_FAILED_DETAIL,
+        )
+    return _BulkItemOutcome(
+        sequence=sequence,
+        portfolio_id=portfolio.portfolio_id,
+        idempotency_key=item_key,
+        result=result,
+        error=error,
+    )
+
+
+def _simulate_portfolio(
+    *,
+    plan: BulkSimulationPlan,
+    portfolio: ProposalBulkSimulationPortfolio,
+    idempotency_key: str,
+) -> ProposalResult:
+    template = plan.request.template
+    if portfolio.stateful_input is not None:
+        request = ProposalSimulationRequest(
+            input_mode="stateful",
+            stateful_input=portfolio.stateful_input,
+        )
+        resolved = service.resolve_simulation_input(request)
+        resolved = replace(
+            resolved,
+            simulate_request=apply_bulk_simulation_template(
+                resolved.simulate_request,
+                template=template,
+            ),
+        )
+        return service.simulate_proposal_response(
+            request=request,
+            idempotency_key=idempotency_key,
+            correlation_id=plan.correlation_id,
+            resolved_request=resolved,
+        )
+    return service.simulate_proposal_response(
+        request=build_bulk_stateless_simulation_request(
+            template=template,
+            portfolio_snapshot=cast(PortfolioSnapshot, portfolio.portfolio_snapshot),
+        ),
+        idempotency_key=idempotency_key,
+        correlation_id=plan.correlation_id,
+    )
+
+
+__all__ = [
+    "DEFAULT_PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY",
+    "PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY_ENV",
+    "BulkSimulationPlan",
+    "plan_bulk_proposal_simulation",
+    "proposal_bulk_simulation_max_concurrency",
+    "stream_bulk_proposal_simulation",
+]
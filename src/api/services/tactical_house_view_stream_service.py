@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from src.core.tactical_house_view import (
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewAffectedCohortSummary,
+    TacticalHouseViewCandidatePortfolio,
+    TacticalHouseViewCohortBuilder,
+    TacticalHouseViewCohortStreamHeader,
+    record_tactical_house_view_affected_cohort,
+    summarize_tactical_house_view_affected_cohort,
+)
+
+TACTICAL_HOUSE_VIEW_STREAM_MEDIA_TYPE = "application/x-ndjson"
+TACTICAL_HOUSE_VIEW_STREAM_MAX_CANDIDATES = 100_000
+
+
+class _CohortStreamConsumer:
+    """Parse NDJSON lines into a cohort builder: one header line, then one candidate per line."""
+
+    def __init__(self) -> None:
+        self.builder: TacticalHouseViewCohortBuilder | None = None
+        self.line_number = 0
+
+    def consume(self, lines: list[bytes]) -> None:
+        for line in lines:
+            self.line_number += 1
+            if not line.strip():
+                continue
+            if self.builder is None:
+                header = self._parse(line, TacticalHouseViewCohortStreamHeader.model_validate_json)
+                self.builder = TacticalHouseViewCohortBuilder.from_stream_header(header)
+                continue
+            if self.builder.evaluated_candidate_count >= TACTICAL_HOUSE_VIEW_STREAM_MAX_CANDIDATES:
+                raise _stream_error(
+                    loc=("body", "line", self.line_number),
+                    msg=(
+                        "candidate stream exceeds "
+                        f"{TACTICAL_HOUSE_VIEW_STREAM_MAX_CANDIDATES} candidate portfolios"
+                    ),
+                )
+            self.builder.add_candidate(
+                self._parse(line, TacticalHouseViewCandidatePortfolio.model_validate_json)
+            )
+
+    def _parse(self, line: bytes, validate: Callable[[bytes], Any]) -> Any:
+        try:
+            return validate(line)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": error["type"],
+                        "loc": ("body", "line", self.line_number, *error["loc"]),
+                        "msg": error["msg"],
+                    }
+                    for error in exc.errors()
+                ]
+            ) from exc
+
+
+async def build_tactical_house_view_cohort_from_stream(
+    chunks: AsyncIterator[bytes],
+    *,
+    generated_at: datetime | None = None,
+) -> TacticalHouseViewAffectedCohort:
+    """Classify an NDJSON candidate upload as it arrives and build the hashed cohort.
+
+    Only the current chunk and the compact classified portfolios are held in memory; candidate
+    payloads are discarded once classified. Parsing and classification run off the event loop.
+    """
+    consumer = _CohortStreamConsumer()
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        if lines:
+            await run_in_threadpool(consumer.consume, lines)
+    if pending:
+        await run_in_threadpool(consumer.consume, [pending])
+    if consumer.builder is None:
+        raise _stream_error(
+            loc=("body",),
+            msg="NDJSON stream must start with a tactical house-view cohort header line",
+        )
+    if consumer.builder.evaluated_candidate_count == 0:
+        raise _stream_error(
+            loc=("body",),
+            msg="candidate_portfolios must contain at least one candidate",
+        )
+    cohort: TacticalHouseViewAffectedCohort = await run_in_threadpool(
+        consumer.builder.build,
+        generated_at=generated_at or datetime.now(timezone.utc),
+    )
+    return cohort
+
+
+async def record_tactical_house_view_cohort_summary(
+    cohort: TacticalHouseViewAffectedCohort,
+) -> TacticalHouseViewAffectedCohortSummary:
+    """Store a streamed cohort and summarize it off the event loop.
+
+    A durable save writes every member row of the cohort, so it must not block other requests.
+    """
+    summary: TacticalHouseViewAffectedCohortSummary = await run_in_threadpool(
+        _record_and_summarize, cohort
+    )
+    return summary
+
+
+def _record_and_summarize(
+    cohort: TacticalHouseViewAffectedCohort,
+) -> TacticalHouseViewAffectedCohortSummary:
+    return summarize_tactical_house_view_affected_cohort(
+        record_tactical_house_view_affected_cohort(cohort)
+    )
+
+
+def _stream_error(*, loc: tuple[str | int, ...], msg: str) -> RequestValidationError:
+    return RequestValidationError([{"type": "value_error", "loc": loc, "msg": msg}])
+
+
+__all__ = [
+    "TACTICAL_HOUSE_VIEW_STREAM_MAX_CANDIDATES",
+    "TACTICAL_HOUSE_VIEW_STREAM_MEDIA_TYPE",
+    "build_tactical_house_view_cohort_from_stream",
+    "record_tactical_house_view_cohort_summary",
+]
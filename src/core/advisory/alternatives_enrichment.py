@@ -9,7 +9,11 @@ from src.core.advisory.alternatives_models import (
 )
 from src.core.advisory.alternatives_normalizer import NormalizedProposalAlternativesRequest
 from src.core.advisory.alternatives_strategies import AlternativeCandidateSeed
-from src.core.common.canonical import hash_canonical_payload
+from src.core.common.serialization_memo import (
+    dump_model_json,
+    hash_model_json,
+    seal_request_models,
+)
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposal_result_models import ProposalResult
 
@@ -57,11 +61,18 @@ def build_alternative_simulate_request(
     candidate: AlternativeCandidateSeed,
 ) -> ProposalSimulateRequest:
     proposed_cash_flows, proposed_trades = split_candidate_simulation_intents(candidate)
-    payload = base_request.model_dump(mode="json")
-    payload["proposed_cash_flows"] = proposed_cash_flows
-    payload["proposed_trades"] = proposed_trades
-    payload["alternatives_request"] = None
-    return cast(ProposalSimulateRequest, ProposalSimulateRequest.model_validate(payload))
+    # The base dump may be shared through the request memo, so only a shallow copy is changed.
+    payload = {
+        **dump_model_json(base_request),
+        "proposed_cash_flows": proposed_cash_flows,
+        "proposed_trades": proposed_trades,
+        "alternatives_request": None,
+    }
+    candidate_request = cast(
+        ProposalSimulateRequest, ProposalSimulateRequest.model_validate(payload)
+    )
+    seal_request_models(candidate_request)
+    return candidate_request
 
 
 def split_candidate_simulation_intents(
@@ -181,7 +192,7 @@ def evaluate_alternative_candidates_batch(
             )
             continue
 
-        candidate_request_hash = hash_canonical_payload(candidate_request.model_dump(mode="json"))
+        candidate_request_hash = hash_model_json(candidate_request)
         cached_result = cached_results.get(candidate_request_hash)
         cached_record = cached_records.get(candidate_request_hash)
 
@@ -8,7 +8,7 @@ from src.core.advisory.artifact_evidence_models import (
 )
 from src.core.advisory.artifact_models import ProposalArtifact
 from src.core.advisory.narrative import build_deterministic_proposal_narrative
-from src.core.common.canonical import hash_canonical_payload, strip_keys
+from src.core.common.canonical import hash_canonical_payload
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposal_result_models import ProposalResult
 
@@ -55,11 +55,8 @@ def finalize_artifact_evidence_hashes(
     *, artifact: ProposalArtifact, request: ProposalSimulateRequest
 ) -> ProposalArtifact:
     payload = artifact.model_dump(mode="json")
-    base_canonical_payload = strip_keys(
-        payload, exclude={"created_at", "artifact_hash", "proposal_narrative"}
-    )
     payload["evidence_bundle"]["hashes"]["artifact_hash"] = hash_canonical_payload(
-        base_canonical_payload
+        payload, exclude={"created_at", "artifact_hash", "proposal_narrative"}
     )
     artifact = ProposalArtifact.model_validate(payload)
 
@@ -70,9 +67,8 @@ def finalize_artifact_evidence_hashes(
         )
         payload = artifact.model_dump(mode="json")
         payload["proposal_narrative"] = narrative.model_dump(mode="json")
-        narrative_canonical_payload = strip_keys(payload, exclude={"created_at", "artifact_hash"})
         payload["evidence_bundle"]["hashes"]["artifact_hash"] = hash_canonical_payload(
-            narrative_canonical_payload
+            payload, exclude={"created_at", "artifact_hash"}
         )
 
     return cast(ProposalArtifact, ProposalArtifact.model_validate(payload))
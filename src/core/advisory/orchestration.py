@@ -17,6 +17,7 @@ from src.core.advisory.provider_ports import (
     simulate_with_advisory_simulation_provider,
 )
 from src.core.advisory_engine import run_proposal_simulation
+from src.core.common.cpu_offload import run_cpu_bound
 from src.core.common.idempotency import normalize_optional_idempotency_key
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposal_result_models import ProposalResult
@@ -182,7 +183,9 @@ def _run_local_fallback_simulation(
 
     proposal_result = cast(
         ProposalResult,
-        run_proposal_simulation(
+        run_cpu_bound(
+            "simulation",
+            run_proposal_simulation,
             portfolio=request.portfolio_snapshot,
             market_data=request.market_data_snapshot,
             shelf=request.shelf_entries,
@@ -0,0 +1,216 @@
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from threading import RLock
+from types import MappingProxyType
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.common.diagnostics import make_empty_data_quality_log
+from src.core.common.drift_analytics import allocation_weight_map
+from src.core.common.suitability import compute_baseline_suitability_issues
+from src.core.common.suitability_policy import IssueCandidate
+from src.core.diagnostics_models import DiagnosticsData
+from src.core.engine_options_models import EngineOptions
+from src.core.portfolio_models import MarketDataSnapshot, PortfolioSnapshot, ShelfEntry
+from src.core.simulation_state_models import SimulatedState
+from src.core.valuation import build_simulated_state
+
+DEFAULT_SIMULATION_BASELINE_CACHE_MAX_ENTRIES = 256
+SIMULATION_BASELINE_CACHE_MAX_ENTRIES_ENV = "SIMULATION_BASELINE_CACHE_MAX_ENTRIES"
+
+SimulationBaselineKey = tuple[str | None, str | None, str]
+
+
+@dataclass(frozen=True)
+class SimulationBaseline:
+    """Trade-independent "before" analytics shared by every simulation of the same inputs.
+
+    Cached instances are shared across requests and must be treated as read-only.
+    """
+
+    state: SimulatedState
+    data_quality: Mapping[str, tuple[str, ...]]
+    warnings: tuple[str, ...]
+    asset_class_weights: Mapping[str, Decimal]
+    instrument_weights: Mapping[str, Decimal]
+    suitability_issues: Mapping[str, IssueCandidate] | None
+
+    def replay_diagnostics(self, diagnostics: DiagnosticsData) -> None:
+        for key, values in self.data_quality.items():
+            diagnostics.data_quality.setdefault(key, []).extend(values)
+        diagnostics.warnings.extend(self.warnings)
+
+
+@dataclass(frozen=True)
+class SimulationBaselineCacheStats:
+    hits: int
+    misses: int
+    bypasses: int
+    evictions: int
+    size: int
+
+
+class SimulationBaselineCache:
+    def __init__(self, *, max_entries: Callable[[], int]) -> None:
+        self._max_entries = max_entries
+        self._lock = RLock()
+        self._values: OrderedDict[SimulationBaselineKey, SimulationBaseline] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+        self._evictions = 0
+
+    def resolve(
+        self,
+        *,
+        portfolio: PortfolioSnapshot,
+        market_data: MarketDataSnapshot,
+        shelf: list[ShelfEntry],
+        options: EngineOptions,
+    ) -> SimulationBaseline:
+        max_entries = self._max_entries()
+        if max_entries <= 0:
+            with self._lock:
+                self._bypasses += 1
+            return build_simulation_baseline(
+                portfolio=portfolio,
+                market_data=market_data,
+                shelf=shelf,
+                options=options,
+            )
+        key = simulation_baseline_key(
+            portfolio=portfolio,
+            market_data=market_data,
+            shelf=shelf,
+            options=options,
+        )
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None:
+                self._values.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        baseline = build_simulation_baseline(
+            portfolio=portfolio,
+            market_data=market_data,
+            shelf=shelf,
+            options=options,
+        )
+        with self._lock:
+            self._values[key] = baseline
+            self._values.move_to_end(key)
+            while len(self._values) > max_entries:
+                self._values.popitem(last=False)
+                self._evictions += 1
+        return baseline
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._hits = 0
+            self._misses = 0
+            self._bypasses = 0
+            self._evictions = 0
+
+    def stats(self) -> SimulationBaselineCacheStats:
+        with self._lock:
+            return SimulationBaselineCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypasses=self._bypasses,
+                evictions=self._evictions,
+                size=len(self._values),
+            )
+
+
+def simulation_baseline_key(
+    *,
+    portfolio: PortfolioSnapshot,
+    market_data: MarketDataSnapshot,
+    shelf: list[ShelfEntry],
+    options: EngineOptions,
+) -> SimulationBaselineKey:
+    # Snapshot ids are caller-supplied on stateless requests, so the hash also covers the
+    # snapshot contents; two payloads reusing one id never share a baseline.
+    inputs_hash = hash_canonical_payload(
+        {
+            "portfolio": portfolio.model_dump(mode="json"),
+            "market_data": market_data.model_dump(mode="json"),
+            "shelf": [entry.model_dump(mode="json") for entry in shelf],
+            "options": options.model_dump(mode="json"),
+        }
+    )
+    return portfolio.snapshot_id, market_data.snapshot_id, inputs_hash
+
+
+def build_simulation_baseline(
+    *,
+    portfolio: PortfolioSnapshot,
+    market_data: MarketDataSnapshot,
+    shelf: list[ShelfEntry],
+    options: EngineOptions,
+) -> SimulationBaseline:
+    data_quality = make_empty_data_quality_log()
+    warnings: list[str] = []
+    state = build_simulated_state(portfolio, market_data, shelf, data_quality, warnings, options)
+    suitability_issues = (
+        MappingProxyType(
+            compute_baseline_suitability_issues(before=state, shelf=shelf, options=options)
+        )
+        if options.enable_suitability_scanner
+        else None
+    )
+    return SimulationBaseline(
+        state=state,
+        data_quality=MappingProxyType({key: tuple(values) for key, values in data_quality.items()}),
+        warnings=tuple(warnings),
+        asset_class_weights=MappingProxyType(
+            allocation_weight_map(state.allocation_by_asset_class)
+        ),
+        instrument_weights=MappingProxyType(allocation_weight_map(state.allocation_by_instrument)),
+        suitability_issues=suitability_issues,
+    )
+
+
+def simulation_baseline_cache_max_entries() -> int:
+    raw_value = os.getenv(SIMULATION_BASELINE_CACHE_MAX_ENTRIES_ENV)
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_SIMULATION_BASELINE_CACHE_MAX_ENTRIES
+    try:
+        max_entries = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("SIMULATION_BASELINE_CACHE_MAX_ENTRIES_INVALID") from exc
+    if max_entries < 0:
+        raise RuntimeError("SIMULATION_BASELINE_CACHE_MAX_ENTRIES_INVALID")
+    return max_entries
+
+
+SIMULATION_BASELINE_CACHE = SimulationBaselineCache(
+    max_entries=simulation_baseline_cache_max_entries,
+)
+
+
+def get_simulation_baseline_cache_stats() -> SimulationBaselineCacheStats:
+    return SIMULATION_BASELINE_CACHE.stats()
+
+
+def reset_simulation_baseline_cache_for_tests() -> None:
+    SIMULATION_BASELINE_CACHE.clear()
+
+
+__all__ = [
+    "DEFAULT_SIMULATION_BASELINE_CACHE_MAX_ENTRIES",
+    "SIMULATION_BASELINE_CACHE",
+    "SIMULATION_BASELINE_CACHE_MAX_ENTRIES_ENV",
+    "SimulationBaseline",
+    "SimulationBaselineCache",
+    "SimulationBaselineCacheStats",
+    "build_simulation_baseline",
+    "get_simulation_baseline_cache_stats",
+    "reset_simulation_baseline_cache_for_tests",
+    "simulation_baseline_cache_max_entries",
+    "simulation_baseline_key",
+]
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Literal
 
+from src.core.advisory.simulation_baseline import SimulationBaseline
 from src.core.advisory.simulation_intent_plan import SimulationIntentPlan
 from src.core.common.drift_analytics import compute_drift_analysis
 from src.core.common.suitability import compute_suitability_result
@@ -40,6 +41,7 @@ def build_simulation_decision_support(
     rule_results: list[RuleResult],
     reference_model: ReferenceModel | None,
     policy_context: dict[str, Any] | None,
+    baseline: SimulationBaseline | None = None,
 ) -> SimulationDecisionSupport:
     drift_analysis = _build_drift_analysis(
         portfolio=portfolio,
@@ -49,6 +51,7 @@ def build_simulation_decision_support(
         after=after,
         intent_plan=intent_plan,
         reference_model=reference_model,
+        baseline=baseline,
     )
     suitability = _build_suitability(
         portfolio=portfolio,
@@ -59,6 +62,7 @@ def build_simulation_decision_support(
         after=after,
         intent_plan=intent_plan,
         policy_context=policy_context,
+        baseline=baseline,
     )
     gate_decision = _build_gate_decision(
         options=options,
@@ -84,6 +88,7 @@ def _build_drift_analysis(
     after: SimulatedState,
     intent_plan: SimulationIntentPlan,
     reference_model: ReferenceModel | None,
+    baseline: SimulationBaseline | None,
 ) -> DriftAnalysis | None:
     if not options.enable_drift_analytics or reference_model is None:
         return None
@@ -102,6 +107,8 @@ def _build_drift_analysis(
         reference_model=reference_model,
         traded_instruments=traded_instruments,
         options=options,
+        before_asset_class_weights=baseline.asset_class_weights if baseline else None,
+        before_instrument_weights=baseline.instrument_weights if baseline else None,
     )
 
 
@@ -115,6 +122,7 @@ def _build_suitability(
     after: SimulatedState,
     intent_plan: SimulationIntentPlan,
     policy_context: dict[str, Any] | None,
+    baseline: SimulationBaseline | None,
 ) -> SuitabilityResult | None:
     if not options.enable_suitability_scanner:
         return None
@@ -127,6 +135,7 @@ def _build_suitability(
         market_data_snapshot_id=market_data.snapshot_id or "md",
         proposed_trades=intent_plan.trades,
         policy_context=policy_context,
+        before_issues=baseline.suitability_issues if baseline else None,
     )
 
 
@@ -17,6 +17,7 @@ from src.core.advisory_copilot.catalog_models import (
     CopilotBusinessProjection,
 )
 from src.core.advisory_copilot.claim_grounding import (
+    CopilotClaimGroundingAligner,
     align_copilot_output_claims_to_evidence,
     copilot_source_ref_identity,
 )
@@ -170,6 +171,7 @@ __all__ = [
     "CopilotActionFamily",
     "CopilotAudience",
     "CopilotBusinessProjection",
+    "CopilotClaimGroundingAligner",
     "CopilotClientReadyPosture",
     "CopilotEvidenceAccessClass",
     "CopilotEvidencePacket",
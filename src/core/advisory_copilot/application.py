@@ -56,6 +56,10 @@ class AdvisoryCopilotDraft(Protocol):
     guardrail_reasons: tuple[str, ...]
 
 
+class AdvisoryCopilotSectionListener(Protocol):
+    def __call__(self, section: dict[str, Any]) -> None: ...
+
+
 class AdvisoryCopilotDraftGenerator(Protocol):
     def __call__(
         self,
@@ -67,6 +71,7 @@ class AdvisoryCopilotDraftGenerator(Protocol):
         reason: dict[str, Any],
         requested_intents: tuple[str, ...] = (),
         user_instruction: str = "",
+        on_section: AdvisoryCopilotSectionListener | None = None,
     ) -> AdvisoryCopilotDraft: ...
 
 
@@ -157,6 +162,7 @@ class AdvisoryCopilotApplicationService:
         payload: AdvisoryCopilotActionRequest,
         idempotency_key: str | None,
         correlation_id: str | None,
+        section_listener: AdvisoryCopilotSectionListener | None = None,
     ) -> AdvisoryCopilotRunResponse:
         idempotency_key = normalize_optional_idempotency_key(idempotency_key)
         evidence_packet = load_advisory_copilot_evidence_packet(
@@ -188,6 +194,7 @@ class AdvisoryCopilotApplicationService:
             reason=payload.reason,
             requested_intents=payload.requested_intents,
             user_instruction=payload.user_instruction,
+            on_section=section_listener,
         )
         result = persist_advisory_copilot_run(
             repository=self._repository,
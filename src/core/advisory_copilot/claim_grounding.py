@@ -53,31 +53,47 @@ def align_copilot_output_claims_to_evidence(
     raw_sections: Any,
     output_sections: tuple[dict[str, Any], ...],
 ) -> tuple[tuple[dict[str, Any], ...], dict[str, Any]]:
-    packet_refs, section_refs = _source_ref_indexes(evidence_packet)
-    raw_section_by_key = _raw_section_index(raw_sections)
-    seen_claim_ids: set[str] = set()
-    grounded_sections: list[dict[str, Any]] = []
-    total_claims = 0
-    grounded_claims = 0
-    unsupported_claims = 0
-    unverifiable_claims = 0
-    unknown_source_refs: set[str] = set()
-
-    for section in output_sections:
+    aligner = CopilotClaimGroundingAligner(
+        evidence_packet=evidence_packet,
+        raw_sections=raw_sections,
+    )
+    grounded_sections = tuple(aligner.ground_section(section) for section in output_sections)
+    return grounded_sections, aligner.summary()
+
+
+class CopilotClaimGroundingAligner:
+    """Ground output sections one at a time so callers can publish each section as it settles.
+
+    Claim ids are de-duplicated across the whole output, so sections must be grounded in output
+    order through a single aligner.
+    """
+
+    def __init__(self, *, evidence_packet: CopilotEvidencePacket, raw_sections: Any) -> None:
+        self._packet_refs, self._section_refs = _source_ref_indexes(evidence_packet)
+        self._raw_section_by_key = _raw_section_index(raw_sections)
+        self._seen_claim_ids: set[str] = set()
+        self._total_sections = 0
+        self._total_claims = 0
+        self._grounded_claims = 0
+        self._unsupported_claims = 0
+        self._unverifiable_claims = 0
+        self._unknown_source_refs: set[str] = set()
+
+    def ground_section(self, section: dict[str, Any]) -> dict[str, Any]:
         section_key = str(section.get("section_key") or "")
-        raw_section = raw_section_by_key.get(section_key, {})
         claim_grounding = _claim_grounding_for_section(
-            raw_section=raw_section,
+            raw_section=self._raw_section_by_key.get(section_key, {}),
             section_key=section_key,
-            packet_refs=packet_refs,
-            section_refs=section_refs.get(section_key, set()),
-            seen_claim_ids=seen_claim_ids,
+            packet_refs=self._packet_refs,
+            section_refs=self._section_refs.get(section_key, set()),
+            seen_claim_ids=self._seen_claim_ids,
         )
-        total_claims += len(claim_grounding)
-        grounded_claims += _count_claims(claim_grounding, GROUNDING_STATUS_GROUNDED)
-        unsupported_claims += _count_claims(claim_grounding, GROUNDING_STATUS_UNSUPPORTED)
-        unverifiable_claims += _count_claims(claim_grounding, GROUNDING_STATUS_UNVERIFIABLE)
-        unknown_source_refs.update(
+        self._total_sections += 1
+        self._total_claims += len(claim_grounding)
+        self._grounded_claims += _count_claims(claim_grounding, GROUNDING_STATUS_GROUNDED)
+        self._unsupported_claims += _count_claims(claim_grounding, GROUNDING_STATUS_UNSUPPORTED)
+        self._unverifiable_claims += _count_claims(claim_grounding, GROUNDING_STATUS_UNVERIFIABLE)
+        self._unknown_source_refs.update(
             ref
             for claim in claim_grounding
             for ref in claim.get("unknown_source_refs", ())
@@ -89,23 +105,26 @@ def align_copilot_output_claims_to_evidence(
         grounded_section["claim_grounding"] = claim_grounding
         if section_status != GROUNDING_STATUS_GROUNDED:
             grounded_section["review_state"] = "UNSUPPORTED"
-        grounded_sections.append(grounded_section)
+        return grounded_section
 
-    ready_for_review = (
-        bool(output_sections) and total_claims > 0 and (total_claims == grounded_claims)
-    )
-    return tuple(grounded_sections), {
-        "grounding_status": (
-            GROUNDING_STATUS_GROUNDED if ready_for_review else GROUNDING_STATUS_UNSUPPORTED
-        ),
-        "ready_for_review": ready_for_review,
-        "total_sections": len(output_sections),
-        "total_claims": total_claims,
-        "grounded_claims": grounded_claims,
-        "unsupported_claims": unsupported_claims,
-        "unverifiable_claims": unverifiable_claims,
-        "unknown_source_refs": sorted(unknown_source_refs),
-    }
+    def summary(self) -> dict[str, Any]:
+        ready_for_review = (
+            self._total_sections > 0
+            and self._total_claims > 0
+            and self._total_claims == self._grounded_claims
+        )
+        return {
+            "grounding_status": (
+                GROUNDING_STATUS_GROUNDED if ready_for_review else GROUNDING_STATUS_UNSUPPORTED
+            ),
+            "ready_for_review": ready_for_review,
+            "total_sections": self._total_sections,
+            "total_claims": self._total_claims,
+            "grounded_claims": self._grounded_claims,
+            "unsupported_claims": self._unsupported_claims,
+            "unverifiable_claims": self._unverifiable_claims,
+            "unknown_source_refs": sorted(self._unknown_source_refs),
+        }
 
 
 def _source_ref_indexes(
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from src.core.advisory_copilot.repository import AdvisoryCopilotRepository
+from src.core.advisory_copilot.request_hashing import canonical_json_hash
+from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
+from src.core.advisory_copilot.type_models import (
+    CopilotActionFamily,
+    CopilotAudience,
+    CopilotReviewPosture,
+)
+
+ADVISORY_COPILOT_DRAFT_CACHE_CONTRACT_VERSION = "advisory-copilot-draft-cache.v1"
+DEFAULT_ADVISORY_COPILOT_DRAFT_CACHE_TTL = timedelta(hours=24)
+DRAFT_CACHE_KEY_LINEAGE_FIELD = "draft_cache_key"
+DRAFT_CACHE_LINEAGE_FIELD = "draft_cache"
+REUSABLE_DRAFT_CACHE_REVIEW_POSTURES: tuple[CopilotReviewPosture, ...] = (
+    "REVIEW_REQUIRED",
+    "APPROVED_FOR_INTERNAL_USE",
+)
+
+UtcNow = Callable[[], datetime]
+
+
+def build_advisory_copilot_draft_cache_key(
+    *,
+    evidence_packet_hash: str,
+    action_family: CopilotActionFamily,
+    audience: CopilotAudience,
+    requested_outputs: tuple[str, ...],
+    workflow_pack_id: str,
+    workflow_pack_version: str,
+    approved_instruction_set: str,
+    prompt_template_version: str,
+    output_schema_version: str,
+    evaluation_pack_ref: str,
+    model_provider_id: str,
+    model_version: str,
+    model_approval_reference: str,
+) -> str:
+    """Hash every input that shapes generated sections, excluding actor and audit context."""
+    return canonical_json_hash(
+        {
+            "contract_version": ADVISORY_COPILOT_DRAFT_CACHE_CONTRACT_VERSION,
+            "evidence_packet_hash": evidence_packet_hash,
+            "action_family": action_family,
+            "audience": audience,
+            "requested_outputs": list(requested_outputs),
+            "workflow_pack_id": workflow_pack_id,
+            "workflow_pack_version": workflow_pack_version,
+            "approved_instruction_set": approved_instruction_set,
+            "prompt_template_version": prompt_template_version,
+            "output_schema_version": output_schema_version,
+            "evaluation_pack_ref": evaluation_pack_ref,
+            "model_provider_id": model_provider_id,
+            "model_version": model_version,
+            "model_approval_reference": model_approval_reference,
+        }
+    )
+
+
+class AdvisoryCopilotDraftCache:
+    def __init__(
+        self,
+        *,
+        repository: AdvisoryCopilotRepository,
+        ttl: timedelta = DEFAULT_ADVISORY_COPILOT_DRAFT_CACHE_TTL,
+        now: UtcNow | None = None,
+    ) -> None:
+        if ttl <= timedelta(0):
+            raise ValueError("COPILOT_DRAFT_CACHE_TTL_INVALID")
+        self._repository = repository
+        self._ttl = ttl
+        self._now = now or (lambda: datetime.now(timezone.utc))
+
+    def lookup(self, *, draft_cache_key: str) -> AdvisoryCopilotRunRecord | None:
+        now = self._now()
+        run = self._repository.find_reusable_run(
+            draft_cache_key=draft_cache_key,
+            review_postures=REUSABLE_DRAFT_CACHE_REVIEW_POSTURES,
+            created_after=now - self._ttl,
+        )
+        if run is None or not is_reusable_advisory_copilot_run(run, as_of=now):
+            return None
+        return run
+
+
+def is_reusable_advisory_copilot_run(run: AdvisoryCopilotRunRecord, *, as_of: datetime) -> bool:
+    grounding = run.lineage_json.get("claim_grounding_summary")
+    return bool(
+        run.review_posture in REUSABLE_DRAFT_CACHE_REVIEW_POSTURES
+        and (run.retention_expires_at is None or run.retention_expires_at > as_of)
+        and run.output_sections_json
+        and DRAFT_CACHE_LINEAGE_FIELD not in run.lineage_json
+        and isinstance(grounding, dict)
+        and grounding.get("ready_for_review") is True
+    )
+
+
+def advisory_copilot_draft_cache_hit_lineage(
+    source_run: AdvisoryCopilotRunRecord,
+) -> dict[str, Any]:
+    telemetry = source_run.lineage_json.get("runtime_budget_telemetry")
+    telemetry = telemetry if isinstance(telemetry, dict) else {}
+    return {
+        "contract_version": ADVISORY_COPILOT_DRAFT_CACHE_CONTRACT_VERSION,
+        "status": "HIT",
+        "source_run_id": source_run.run_id,
+        "source_workflow_run_id": source_run.lotus_ai_workflow_run_id,
+        "source_created_at": source_run.created_at.isoformat(),
+        "source_review_posture": source_run.review_posture,
+        "avoided_token_estimate": _non_negative_int(telemetry.get("input_token_estimate"))
+        + _non_negative_int(telemetry.get("output_token_estimate")),
+        "avoided_latency_ms": _non_negative_int(telemetry.get("latency_ms")),
+    }
+
+
+def advisory_copilot_draft_cache_outcome(lineage: dict[str, Any]) -> str:
+    if isinstance(lineage.get(DRAFT_CACHE_LINEAGE_FIELD), dict):
+        return "hit"
+    if lineage.get(DRAFT_CACHE_KEY_LINEAGE_FIELD):
+        return "stored"
+    return "bypass"
+
+
+def _non_negative_int(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return 0
+    return max(value, 0)
+
+
+__all__ = [
+    "ADVISORY_COPILOT_DRAFT_CACHE_CONTRACT_VERSION",
+    "DEFAULT_ADVISORY_COPILOT_DRAFT_CACHE_TTL",
+    "DRAFT_CACHE_KEY_LINEAGE_FIELD",
+    "DRAFT_CACHE_LINEAGE_FIELD",
+    "REUSABLE_DRAFT_CACHE_REVIEW_POSTURES",
+    "AdvisoryCopilotDraftCache",
+    "advisory_copilot_draft_cache_hit_lineage",
+    "advisory_copilot_draft_cache_outcome",
+    "build_advisory_copilot_draft_cache_key",
+    "is_reusable_advisory_copilot_run",
+]
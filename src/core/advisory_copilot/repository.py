@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol
 
 from src.core.advisory_copilot.idempotency_records import AdvisoryCopilotRunIdempotencyRecord
 from src.core.advisory_copilot.packet_records import AdvisoryCopilotEvidencePacketRecord
 from src.core.advisory_copilot.review_records import AdvisoryCopilotReviewRecord
 from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
+from src.core.advisory_copilot.type_models import CopilotReviewPosture
 
 
 class AdvisoryCopilotRepository(Protocol):
@@ -49,3 +51,11 @@ class AdvisoryCopilotRepository(Protocol):
         limit: int,
         cursor: str | None,
     ) -> tuple[list[AdvisoryCopilotRunRecord], str | None]: ...
+
+    def find_reusable_run(
+        self,
+        *,
+        draft_cache_key: str,
+        review_postures: tuple[CopilotReviewPosture, ...],
+        created_after: datetime,
+    ) -> AdvisoryCopilotRunRecord | None: ...
@@ -1,6 +1,10 @@
 from typing import Any, Optional
 
 from src.core.advisory.ids import proposal_run_id_from_request_hash
+from src.core.advisory.simulation_baseline import (
+    SIMULATION_BASELINE_CACHE,
+    SimulationBaselineCache,
+)
 from src.core.advisory.simulation_decision_support import build_simulation_decision_support
 from src.core.advisory.simulation_intent_plan import build_simulation_intent_plan
 from src.core.advisory.simulation_review import evaluate_simulation_review
@@ -35,19 +39,20 @@ def run_proposal_simulation(
     correlation_id: str = "c_none",
     simulation_contract_version: Optional[str] = None,
     policy_context: Optional[dict[str, Any]] = None,
+    baseline_cache: SimulationBaselineCache = SIMULATION_BASELINE_CACHE,
 ) -> ProposalResult:
     idempotency_key = normalize_optional_idempotency_key(idempotency_key)
     run_id = proposal_run_id_from_request_hash(request_hash)
     diagnostics = make_diagnostics_data()
 
-    before = build_simulated_state(
-        portfolio,
-        market_data,
-        shelf,
-        diagnostics.data_quality,
-        diagnostics.warnings,
-        options,
+    baseline = baseline_cache.resolve(
+        portfolio=portfolio,
+        market_data=market_data,
+        shelf=shelf,
+        options=options,
     )
+    baseline.replay_diagnostics(diagnostics)
+    before = baseline.state.model_copy()
     reference_model_validated = (
         ReferenceModel.model_validate(reference_model) if reference_model is not None else None
     )
@@ -95,6 +100,7 @@ def run_proposal_simulation(
         rule_results=review.rule_results,
         reference_model=reference_model_validated,
         policy_context=policy_context,
+        baseline=baseline,
     )
 
     return ProposalResult(
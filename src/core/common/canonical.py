@@ -1,16 +1,157 @@
 import hashlib
 import json
+from collections.abc import Collection, Iterable, Mapping
 from copy import deepcopy
+from json.encoder import encode_basestring_ascii as _encode_string
 from typing import Any
 
+_ENCODE = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+# Containers with more members than this are fed to SHA-256 member by member, so hashing a
+# large payload never builds one JSON string for the whole document.
+_STREAM_MIN_MEMBERS = 32
+# Streamed fragments are buffered and hashed once this many are pending.
+_FLUSH_MIN_PARTS = 1024
 
-def canonical_json(payload: Any) -> str:
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
 
+def canonical_json(payload: Any, *, exclude: Collection[str] = ()) -> str:
+    if not exclude:
+        return _ENCODE(payload)
+    chunks = _EncodedChunks()
+    _update_canonical(chunks, payload, frozenset(exclude))
+    return b"".join(chunks).decode("utf-8")
 
-def hash_canonical_payload(payload: Any) -> str:
-    digest = hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
-    return f"sha256:{digest}"
+
+def hash_canonical_payload(payload: Any, *, exclude: Collection[str] = ()) -> str:
+    """Hash ``canonical_json(payload)``, skipping mapping keys in ``exclude`` at any depth.
+
+    The digest equals hashing ``canonical_json(strip_keys(payload, exclude=...))``, but excluded
+    keys are skipped while walking the payload. The document is neither copied nor encoded as one
+    string; only a small mapping that loses one of its own keys is re-keyed, sharing its members.
+    """
+    digest = hashlib.sha256()
+    _update_canonical(digest, payload, frozenset(exclude))
+    return f"sha256:{digest.hexdigest()}"
+
+
+def hash_canonical_mapping(
+    fields: Mapping[str, Any],
+    *,
+    encoded_sequences: Mapping[str, Iterable[bytes]],
+) -> str:
+    """Hash a JSON object whose large list members arrive as pre-encoded canonical items.
+
+    The digest equals ``hash_canonical_payload`` of the assembled object, but each list item
+    is fed to SHA-256 as already-encoded ``canonical_json`` bytes instead of being copied
+    into one payload and re-serialized.
+    """
+    digest = hashlib.sha256(b"{")
+    for index, key in enumerate(sorted([*fields, *encoded_sequences])):
+        if index:
+            digest.update(b",")
+        digest.update(canonical_json(key).encode("utf-8") + b":")
+        if key in encoded_sequences:
+            _update_encoded_sequence(digest, encoded_sequences[key])
+        else:
+            _update_canonical(digest, fields[key])
+    digest.update(b"}")
+    return f"sha256:{digest.hexdigest()}"
+
+
+class _EncodedChunks(list[bytes]):
+    def update(self, chunk: bytes) -> None:
+        self.append(chunk)
+
+
+class _CanonicalWriter:
+    """Collects encoded fragments and feeds them to ``sink`` in batches of bounded size."""
+
+    __slots__ = ("parts", "sink")
+
+    def __init__(self, sink: Any) -> None:
+        self.parts: list[str] = []
+        self.sink = sink
+
+    def flush(self) -> None:
+        if self.parts:
+            self.sink.update("".join(self.parts).encode("utf-8"))
+            self.parts.clear()
+
+
+def _update_canonical(digest: Any, payload: Any, exclude: frozenset[str] = frozenset()) -> None:
+    writer = _CanonicalWriter(digest)
+    _write_canonical(writer, payload, exclude)
+    writer.flush()
+
+
+def _write_canonical(writer: _CanonicalWriter, payload: Any, exclude: frozenset[str]) -> None:
+    # Large containers are streamed member by member, and so are small ones that hold an
+    # excluded key below their own members. Everything else is encoded in one call.
+    write = writer.parts.append
+    if isinstance(payload, list) and (
+        len(payload) > _STREAM_MIN_MEMBERS or (exclude and not _members_clean(payload, exclude))
+    ):
+        write("[")
+        for index, item in enumerate(payload):
+            if index:
+                write(",")
+            _write_member(writer, item, exclude)
+        write("]")
+    elif isinstance(payload, dict) and (
+        (len(payload) > _STREAM_MIN_MEMBERS and all(isinstance(key, str) for key in payload))
+        or (exclude and not _members_clean(payload.values(), exclude))
+    ):
+        write("{")
+        for index, key in enumerate(sorted(key for key in payload if key not in exclude)):
+            write(
+                ("," if index else "")
+                + (_encode_string(key) if isinstance(key, str) else _encode_key(key))
+                + ":"
+            )
+            _write_member(writer, payload[key], exclude)
+        write("}")
+    elif isinstance(payload, dict) and not exclude.isdisjoint(payload):
+        # Only this mapping's own keys are excluded; its members are shared, not copied.
+        write(_ENCODE({key: value for key, value in payload.items() if key not in exclude}))
+        return
+    else:
+        write(_ENCODE(payload))
+        return
+    if len(writer.parts) > _FLUSH_MIN_PARTS:
+        writer.flush()
+
+
+def _write_member(writer: _CanonicalWriter, value: Any, exclude: frozenset[str]) -> None:
+    if isinstance(value, str):
+        writer.parts.append(_encode_string(value))
+    elif isinstance(value, (dict, list)):
+        _write_canonical(writer, value, exclude)
+    else:
+        writer.parts.append(_ENCODE(value))
+
+
+def _members_clean(members: Iterable[Any], exclude: frozenset[str]) -> bool:
+    """Return whether no mapping inside ``members`` has an excluded key."""
+    return all(
+        exclude.isdisjoint(member) and _members_clean(member.values(), exclude)
+        if isinstance(member, dict)
+        else _members_clean(member, exclude)
+        for member in members
+        if isinstance(member, (dict, list))
+    )
+
+
+def _encode_key(key: Any) -> str:
+    # Non-string keys take the encoder's own coercion, e.g. ``1`` -> ``"1"``.
+    return _ENCODE({key: None})[1:-6]
+
+
+def _update_encoded_sequence(digest: Any, items: Iterable[bytes]) -> None:
+    digest.update(b"[")
+    for index, item in enumerate(items):
+        if index:
+            digest.update(b",")
+        digest.update(item)
+    digest.update(b"]")
 
 
 def strip_keys(payload: Any, *, exclude: set[str]) -> Any:
@@ -0,0 +1,197 @@
+"""Optional process-pool execution for pure CPU-bound advisory stages.
+
+Sync routes run on the AnyIO threadpool, so pure-Python simulation and artifact work holds the
+GIL and stalls unrelated requests. When ``ADVISORY_CPU_OFFLOAD_WORKERS`` is positive, the stages
+below run in worker processes and the request thread only waits on the result. The default of
+``0`` keeps every stage inline.
+
+Offloaded callables must be module-level functions whose arguments and results are picklable
+models or plain data; provider ports and process-local caches are not visible in workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Literal, ParamSpec, Protocol, TypeVar, cast
+
+ADVISORY_CPU_OFFLOAD_WORKERS_ENV = "ADVISORY_CPU_OFFLOAD_WORKERS"
+DEFAULT_ADVISORY_CPU_OFFLOAD_WORKERS = 0
+CPU_OFFLOAD_BROKEN_POOL_ATTEMPTS = 2
+
+CpuOffloadStage = Literal[
+    "simulation",
+    "proposal_artifact",
+    "proposal_materialization",
+    "memo_evidence_pack",
+]
+CpuOffloadMode = Literal["inline", "process"]
+
+
+class CpuOffloadObserver(Protocol):
+    def __call__(
+        self,
+        *,
+        stage: CpuOffloadStage,
+        mode: CpuOffloadMode,
+        queue_seconds: float,
+        run_seconds: float,
+    ) -> None: ...
+
+
+logger = logging.getLogger(__name__)
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+_POOL_LOCK = Lock()
+_POOL: ProcessPoolExecutor | None = None
+_OBSERVER: CpuOffloadObserver | None = None
+
+
+def advisory_cpu_offload_workers() -> int:
+    raw_value = os.getenv(ADVISORY_CPU_OFFLOAD_WORKERS_ENV)
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_ADVISORY_CPU_OFFLOAD_WORKERS
+    try:
+        workers = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("ADVISORY_CPU_OFFLOAD_WORKERS_INVALID") from exc
+    if workers < 0:
+        raise RuntimeError("ADVISORY_CPU_OFFLOAD_WORKERS_INVALID")
+    return workers
+
+
+def run_cpu_bound(
+    stage: CpuOffloadStage,
+    function: Callable[_P, _R],
+    /,
+    *args: _P.args,
+    **kwargs: _P.kwargs,
+) -> _R:
+    """Run ``function`` inline or in the worker pool and report queue and run time."""
+    pool = _resolve_pool()
+    if pool is None:
+        started_at = time.monotonic()
+        result = function(*args, **kwargs)
+        _observe(
+            stage=stage, mode="inline", queue_seconds=0.0, run_seconds=time.monotonic() - started_at
+        )
+        return result
+    submitted_at = time.monotonic()
+    result, worker_started_at, run_seconds = _run_in_pool(pool, function, args, kwargs)
+    # CLOCK_MONOTONIC is host-wide, so worker start times compare with the submit time.
+    _observe(
+        stage=stage,
+        mode="process",
+        queue_seconds=max(0.0, worker_started_at - submitted_at),
+        run_seconds=run_seconds,
+    )
+    return cast(_R, result)
+
+
+def configure_cpu_offload_observer(observer: CpuOffloadObserver | None) -> None:
+    global _OBSERVER
+    _OBSERVER = observer
+
+
+def shutdown_cpu_offload_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def reset_cpu_offload_for_tests() -> None:
+    shutdown_cpu_offload_pool()
+
+
+def _resolve_pool() -> ProcessPoolExecutor | None:
+    global _POOL
+    if _POOL is not None:
+        return _POOL
+    workers = advisory_cpu_offload_workers()
+    if workers == 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn avoids forking a process that holds threadpool and connection locks.
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def _run_in_pool(
+    pool: ProcessPoolExecutor,
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[Any, float, float]:
+    # A worker that dies (OOM kill, segfault) breaks the whole executor, and every later submit
+    # would raise. Replace the pool and retry once; a second break is raised to the caller.
+    for attempt in range(CPU_OFFLOAD_BROKEN_POOL_ATTEMPTS):
+        try:
+            return pool.submit(_run_in_worker, function, args, kwargs).result()
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            if attempt + 1 == CPU_OFFLOAD_BROKEN_POOL_ATTEMPTS:
+                raise
+            logger.warning("CPU offload pool broke; retrying on a new pool")
+            replacement = _resolve_pool()
+            if replacement is None:
+                break
+            pool = replacement
+    return _run_in_worker(function, args, kwargs)
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_worker(
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[Any, float, float]:
+    started_at = time.monotonic()
+    result = function(*args, **kwargs)
+    return result, started_at, time.monotonic() - started_at
+
+
+def _observe(
+    *,
+    stage: CpuOffloadStage,
+    mode: CpuOffloadMode,
+    queue_seconds: float,
+    run_seconds: float,
+) -> None:
+    if _OBSERVER is not None:
+        _OBSERVER(stage=stage, mode=mode, queue_seconds=queue_seconds, run_seconds=run_seconds)
+
+
+__all__ = [
+    "ADVISORY_CPU_OFFLOAD_WORKERS_ENV",
+    "CPU_OFFLOAD_BROKEN_POOL_ATTEMPTS",
+    "DEFAULT_ADVISORY_CPU_OFFLOAD_WORKERS",
+    "CpuOffloadMode",
+    "CpuOffloadObserver",
+    "CpuOffloadStage",
+    "advisory_cpu_offload_workers",
+    "configure_cpu_offload_observer",
+    "reset_cpu_offload_for_tests",
+    "run_cpu_bound",
+    "shutdown_cpu_offload_pool",
+]
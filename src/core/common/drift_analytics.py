@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from decimal import Decimal
 from typing import cast
 
@@ -23,7 +23,7 @@ from src.core.simulation_state_models import (
 )
 
 
-def _to_weight_map(allocations: Sequence[AllocationMetric]) -> dict[str, Decimal]:
+def allocation_weight_map(allocations: Sequence[AllocationMetric]) -> dict[str, Decimal]:
     return {allocation.key: allocation.weight for allocation in allocations}
 
 
@@ -37,9 +37,9 @@ def _to_instrument_target_map(targets: Sequence[ReferenceInstrumentTarget]) -> d
 
 def _build_dimension(
     *,
-    before_weights: dict[str, Decimal],
-    after_weights: dict[str, Decimal],
-    model_weights: dict[str, Decimal],
+    before_weights: Mapping[str, Decimal],
+    after_weights: Mapping[str, Decimal],
+    model_weights: Mapping[str, Decimal],
     buckets: Iterable[str],
     top_limit: int,
 ) -> DriftDimensionAnalysis:
@@ -167,9 +167,15 @@ def compute_drift_analysis(
     reference_model: ReferenceModel,
     traded_instruments: set[str],
     options: EngineOptions,
+    before_asset_class_weights: Mapping[str, Decimal] | None = None,
+    before_instrument_weights: Mapping[str, Decimal] | None = None,
 ) -> DriftAnalysis:
-    before_by_asset_class = _to_weight_map(before.allocation_by_asset_class)
-    after_by_asset_class = _to_weight_map(after.allocation_by_asset_class)
+    before_by_asset_class = (
+        before_asset_class_weights
+        if before_asset_class_weights is not None
+        else allocation_weight_map(before.allocation_by_asset_class)
+    )
+    after_by_asset_class = allocation_weight_map(after.allocation_by_asset_class)
     model_by_asset_class = _to_asset_class_target_map(reference_model.asset_class_targets)
     asset_class_buckets = (
         set(before_by_asset_class.keys())
@@ -188,8 +194,12 @@ def compute_drift_analysis(
     instrument = None
     details_for_highlights = asset_class.buckets
     if options.enable_instrument_drift and reference_model.instrument_targets:
-        before_by_instrument = _to_weight_map(before.allocation_by_instrument)
-        after_by_instrument = _to_weight_map(after.allocation_by_instrument)
+        before_by_instrument = (
+            before_instrument_weights
+            if before_instrument_weights is not None
+            else allocation_weight_map(before.allocation_by_instrument)
+        )
+        after_by_instrument = allocation_weight_map(after.allocation_by_instrument)
         model_by_instrument = _to_instrument_target_map(reference_model.instrument_targets)
         instrument_buckets = (
             set(before_by_instrument.keys())
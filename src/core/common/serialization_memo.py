@@ -0,0 +1,151 @@
+"""Request-scoped memo for JSON-mode model dumps and canonical hashes.
+
+A single request serializes the same simulate request and resolved context several times: for
+the request hash, the context-resolution evidence, the lotus-core payload, and alternative
+candidates. Inside ``request_serialization_scope`` a model that has been sealed with
+``seal_request_models`` is dumped and hashed at most once; the frozen resolved-context records
+seal their models on construction. Sealed models must not be mutated for the rest of the scope,
+and dumps returned from the memo are shared, so callers must copy before changing them.
+
+Outside a scope, or for models that were never sealed, the helpers dump on every call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from src.core.common.canonical import hash_canonical_payload
+
+_DumpKey = tuple[int, bool]
+
+
+@dataclass(frozen=True)
+class SerializationCounts:
+    serialized: int
+    reused: int
+
+
+class RequestSerializationMemo:
+    def __init__(self, parent: RequestSerializationMemo | None) -> None:
+        self._lock = Lock()
+        self._parent = parent
+        self._sealed: dict[int, BaseModel] = {}
+        self._dumps: dict[_DumpKey, dict[str, Any]] = {}
+        self._hashes: dict[_DumpKey, str] = {}
+        self._serialized = 0
+        self._reused = 0
+        self._closed = False
+
+    def seal(self, model: BaseModel) -> None:
+        with self._lock:
+            if not self._closed:
+                # Holding the model keeps its id from being reused by another object.
+                self._sealed[id(model)] = model
+
+    def dump(self, model: BaseModel, *, exclude_none: bool) -> dict[str, Any]:
+        key = (id(model), exclude_none)
+        with self._lock:
+            memoized = self._dumps.get(key)
+            if memoized is not None:
+                self._reused += 1
+                return memoized
+            self._serialized += 1
+        payload = cast(dict[str, Any], model.model_dump(mode="json", exclude_none=exclude_none))
+        self._remember(self._dumps, key, payload)
+        return payload
+
+    def hash(self, model: BaseModel, *, exclude_none: bool) -> str:
+        key = (id(model), exclude_none)
+        with self._lock:
+            memoized = self._hashes.get(key)
+            if memoized is not None:
+                self._reused += 1
+                return memoized
+        digest = cast(str, hash_canonical_payload(self.dump(model, exclude_none=exclude_none)))
+        self._remember(self._hashes, key, digest)
+        return digest
+
+    def close(self) -> SerializationCounts:
+        with self._lock:
+            self._closed = True
+            self._sealed.clear()
+            self._dumps.clear()
+            self._hashes.clear()
+            counts = SerializationCounts(serialized=self._serialized, reused=self._reused)
+        if self._parent is not None:
+            self._parent._add_counts(counts)
+        return counts
+
+    def counts(self) -> SerializationCounts:
+        with self._lock:
+            return SerializationCounts(serialized=self._serialized, reused=self._reused)
+
+    def _add_counts(self, counts: SerializationCounts) -> None:
+        with self._lock:
+            self._serialized += counts.serialized
+            self._reused += counts.reused
+
+    def _remember(self, entries: dict[_DumpKey, Any], key: _DumpKey, value: Any) -> None:
+        with self._lock:
+            if not self._closed and key[0] in self._sealed:
+                entries.setdefault(key, value)
+
+
+_ACTIVE_MEMO: ContextVar[RequestSerializationMemo | None] = ContextVar(
+    "request_serialization_memo", default=None
+)
+
+
+@contextmanager
+def request_serialization_scope() -> Iterator[RequestSerializationMemo]:
+    """Open a memo for one request; nested scopes add their counts to the enclosing scope."""
+    memo = RequestSerializationMemo(parent=_ACTIVE_MEMO.get())
+    token = _ACTIVE_MEMO.set(memo)
+    try:
+        yield memo
+    finally:
+        _ACTIVE_MEMO.reset(token)
+        memo.close()
+
+
+def seal_request_models(*models: BaseModel | None) -> None:
+    memo = _ACTIVE_MEMO.get()
+    if memo is None:
+        return
+    for model in models:
+        if model is not None:
+            memo.seal(model)
+
+
+def dump_model_json(model: BaseModel, *, exclude_none: bool = False) -> dict[str, Any]:
+    memo = _ACTIVE_MEMO.get()
+    if memo is None:
+        return cast(dict[str, Any], model.model_dump(mode="json", exclude_none=exclude_none))
+    return memo.dump(model, exclude_none=exclude_none)
+
+
+def hash_model_json(model: BaseModel, *, exclude_none: bool = False) -> str:
+    memo = _ACTIVE_MEMO.get()
+    if memo is None:
+        return cast(
+            str,
+            hash_canonical_payload(model.model_dump(mode="json", exclude_none=exclude_none)),
+        )
+    return memo.hash(model, exclude_none=exclude_none)
+
+
+__all__ = [
+    "RequestSerializationMemo",
+    "SerializationCounts",
+    "dump_model_json",
+    "hash_model_json",
+    "request_serialization_scope",
+    "seal_request_models",
+]
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import Any
 
 from src.core.engine_options_models import EngineOptions
@@ -43,15 +44,17 @@ def compute_suitability_result(
     evidence_as_of: str | None = None,
     proposed_trades: list[Any] | None = None,
     policy_context: dict[str, Any] | None = None,
+    before_issues: Mapping[str, IssueCandidate] | None = None,
 ) -> SuitabilityResult:
     policy_pack = _GLOBAL_PRIVATE_BANKING_BASELINE_PACK
     shelf_by_instrument = shelf_index(shelf)
-    before_issues, after_issues = scan_before_after_issues(
+    scanned_before_issues, after_issues = scan_before_after_issues(
         before=before,
         after=after,
         shelf_by_instrument=shelf_by_instrument,
         options=options,
         policy_pack=policy_pack,
+        before_issues=before_issues,
     )
     append_post_trade_issues(
         before=before,
@@ -64,7 +67,7 @@ def compute_suitability_result(
         policy_pack=policy_pack,
     )
     issues = classify_issues(
-        before_issues=before_issues,
+        before_issues=scanned_before_issues,
         after_issues=after_issues,
         evidence=suitability_evidence(
             evidence_as_of=evidence_as_of,
@@ -93,13 +96,18 @@ def scan_before_after_issues(
     shelf_by_instrument: dict[str, ShelfEntry],
     options: EngineOptions,
     policy_pack: _SuitabilityPolicyPack,
+    before_issues: Mapping[str, IssueCandidate] | None = None,
 ) -> tuple[dict[str, IssueCandidate], dict[str, IssueCandidate]]:
-    before_issues = scan_state_issues(
-        target_state=before,
-        before_state=before,
-        shelf_by_instrument=shelf_by_instrument,
-        options=options,
-        policy_pack=policy_pack,
+    scanned_before_issues = (
+        dict(before_issues)
+        if before_issues is not None
+        else scan_state_issues(
+            target_state=before,
+            before_state=before,
+            shelf_by_instrument=shelf_by_instrument,
+            options=options,
+            policy_pack=policy_pack,
+        )
     )
     after_issues = scan_state_issues(
         target_state=after,
@@ -108,7 +116,22 @@ def scan_before_after_issues(
         options=options,
         policy_pack=policy_pack,
     )
-    return before_issues, after_issues
+    return scanned_before_issues, after_issues
+
+
+def compute_baseline_suitability_issues(
+    *,
+    before: SimulatedState,
+    shelf: list[ShelfEntry],
+    options: EngineOptions,
+) -> dict[str, IssueCandidate]:
+    return scan_state_issues(
+        target_state=before,
+        before_state=before,
+        shelf_by_instrument=shelf_index(shelf),
+        options=options,
+        policy_pack=_GLOBAL_PRIVATE_BANKING_BASELINE_PACK,
+    )
 
 
 def append_post_trade_issues(
@@ -37,6 +37,10 @@ from src.core.policy_packs.evaluation_models import (
     PolicyPackEvaluationResponse,
     PolicyRuleEvaluationResult,
 )
+from src.core.policy_packs.evaluation_plan import (
+    PolicyPackEvaluationPlan,
+    policy_pack_evaluation_plan,
+)
 from src.core.policy_packs.persistence import (
     append_policy_evaluation_event,
     configure_policy_evaluation_repository,
@@ -47,10 +51,15 @@ from src.core.policy_packs.persistence import (
     get_policy_evaluation_review_queue,
     get_policy_evaluation_sign_off_package,
     list_policy_evaluation_events,
+    list_policy_evaluation_record_page,
     list_policy_evaluation_records,
     replay_policy_evaluation_record,
     reset_policy_evaluation_store_for_tests,
 )
+from src.core.policy_packs.persistence_batch import (
+    PolicyEvaluationFinalizeItem,
+    PolicyEvaluationFinalizeOutcome,
+)
 from src.core.policy_packs.persistence_models import (
     PolicyEvaluationAuditEvent,
     PolicyEvaluationCreateRequest,
@@ -67,6 +76,17 @@ from src.core.policy_packs.projection_models import (
     PolicyEvaluationReviewQueueResponse,
     PolicyEvaluationSignOffPackageResponse,
 )
+from src.core.policy_packs.re_evaluation import (
+    PolicyReEvaluationCheckpoint,
+    PolicyReEvaluationPrincipal,
+    PolicyReEvaluationReport,
+    PolicyReEvaluationSettings,
+    run_policy_re_evaluation,
+)
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+)
 from src.core.policy_packs.reporting import request_policy_evaluation_report_package
 from src.core.policy_packs.reporting_models import (
     PolicyEvaluationReportPackageRequest,
@@ -103,9 +123,13 @@ __all__ = [
     "PolicyEvaluationDiagnosticsResponse",
     "PolicyEvaluationEventRequest",
     "PolicyEvaluationEventType",
+    "PolicyEvaluationFinalizeItem",
+    "PolicyEvaluationFinalizeOutcome",
     "PolicyEvaluationLineageResponse",
     "PolicyEvaluationPersistenceResult",
     "PolicyEvaluationRecord",
+    "PolicyEvaluationRecordPage",
+    "PolicyEvaluationRecordQuery",
     "PolicyEvaluationReportPackageRequest",
     "PolicyEvaluationReportPackageResponse",
     "PolicyEvaluationReplayResponse",
@@ -118,9 +142,14 @@ __all__ = [
     "PolicyEvaluationWorkflowResponse",
     "PolicyEvaluationWorkflowMetadata",
     "PolicyEvaluationWorkflowReplayMetadata",
+    "PolicyPackEvaluationPlan",
     "PolicyPackEvaluationResponse",
     "PolicyPackListResponse",
     "PolicyPackSummary",
+    "PolicyReEvaluationCheckpoint",
+    "PolicyReEvaluationPrincipal",
+    "PolicyReEvaluationReport",
+    "PolicyReEvaluationSettings",
     "PolicyRuleEvaluationResult",
     "PolicyPackValidationRequest",
     "PolicyPackValidationResponse",
@@ -142,11 +171,14 @@ __all__ = [
     "list_policy_pack_events",
     "list_policy_pack_versions",
     "list_policy_evaluation_events",
+    "list_policy_evaluation_record_page",
     "list_policy_evaluation_records",
+    "policy_pack_evaluation_plan",
     "replay_policy_evaluation_record",
     "request_policy_evaluation_ai_evidence",
     "request_policy_evaluation_report_package",
     "record_policy_evaluation_sign_off_decision",
+    "run_policy_re_evaluation",
     "reset_policy_evaluation_store_for_tests",
     "reset_policy_pack_catalog_for_tests",
     "validate_policy_pack_version",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from src.core.policy_packs.ai import request_policy_evaluation_ai_evidence
@@ -150,11 +151,24 @@ class PolicyEvidenceApplicationService:
         )
 
     def get_policy_evaluation_review_queue(
-        self, *, evaluation_status: str | None, portfolio_id: str | None
+        self,
+        *,
+        evaluation_status: str | None,
+        portfolio_id: str | None,
+        jurisdiction: str | None = None,
+        generated_after: datetime | None = None,
+        generated_before: datetime | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> PolicyEvaluationReviewQueueResponse:
         return get_policy_evaluation_review_queue(
             evaluation_status=evaluation_status,
             portfolio_id=portfolio_id,
+            jurisdiction=jurisdiction,
+            generated_after=generated_after,
+            generated_before=generated_before,
+            limit=limit,
+            cursor=cursor,
         )
 
     def get_policy_evaluation_record(self, *, evaluation_id: str) -> PolicyEvaluationRecord:
@@ -22,6 +22,10 @@ from src.core.policy_packs.catalog_models import (
 )
 from src.core.policy_packs.catalog_projection import build_policy_pack_detail_response
 from src.core.policy_packs.catalog_reference_packs import reference_policy_packs
+from src.core.policy_packs.evaluation_plan import (
+    clear_policy_pack_evaluation_plans,
+    policy_pack_evaluation_plan,
+)
 from src.core.policy_packs.repositories import PolicyPackCatalogRepository
 from src.core.proposals.exceptions import ProposalNotFoundError, ProposalValidationError
 from src.core.proposals.idempotency_validation import require_proposal_idempotency_key
@@ -68,7 +72,7 @@ def activate_policy_pack_version(
     reason: dict[str, Any],
 ) -> PolicyPackActivationResponse:
     idempotency_key = require_proposal_idempotency_key(idempotency_key)
-    return _repository().activate_policy_pack_version(
+    response = _repository().activate_policy_pack_version(
         policy_pack_id=policy_pack_id,
         policy_version=policy_version,
         activated_by=activated_by,
@@ -76,6 +80,10 @@ def activate_policy_pack_version(
         idempotency_key=idempotency_key,
         reason=reason,
     )
+    policy_pack_evaluation_plan(
+        get_policy_pack_version(policy_pack_id=policy_pack_id, policy_version=policy_version)
+    )
+    return response
 
 
 def list_policy_pack_events(
@@ -90,6 +98,7 @@ def list_policy_pack_events(
 def configure_policy_pack_catalog_repository(repository: PolicyPackCatalogRepository) -> None:
     global _REPOSITORY
     _REPOSITORY = repository
+    clear_policy_pack_evaluation_plans()
 
 
 def get_policy_pack_catalog_repository() -> PolicyPackCatalogRepository:
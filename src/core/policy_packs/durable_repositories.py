@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Any, Protocol
 
@@ -12,6 +13,10 @@ from src.core.policy_packs.catalog_models import (
     PolicyPackValidationResponse,
 )
 from src.core.policy_packs.event_authority import PolicyEvaluationEventAuthority
+from src.core.policy_packs.persistence_batch import (
+    PolicyEvaluationFinalizeItem,
+    PolicyEvaluationFinalizeOutcome,
+)
 from src.core.policy_packs.persistence_models import (
     PolicyEvaluationAuditEvent,
     PolicyEvaluationEventType,
@@ -25,6 +30,10 @@ from src.core.policy_packs.projection_models import (
     PolicyEvaluationReviewQueueResponse,
     PolicyEvaluationSignOffPackageResponse,
 )
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+)
 
 
 class PolicyEvaluationStateStore(Protocol):
@@ -93,6 +102,16 @@ class DurablePolicyEvaluationRepository:
         self._save_store(store)
         return result
 
+    def finalize_policy_evaluation_records(
+        self, *, items: Sequence[PolicyEvaluationFinalizeItem]
+    ) -> list[PolicyEvaluationFinalizeOutcome]:
+        # One snapshot load and one save for the whole batch instead of one per record.
+        store = self._load_store()
+        outcomes = store.finalize_policy_evaluation_records(items=items)
+        if any(outcome.result is not None and not outcome.result.replayed for outcome in outcomes):
+            self._save_store(store)
+        return outcomes
+
     def get_policy_evaluation_record(self, *, evaluation_id: str) -> PolicyEvaluationRecord:
         return self._load_store().get_policy_evaluation_record(evaluation_id=evaluation_id)
 
@@ -109,18 +128,27 @@ class DurablePolicyEvaluationRepository:
     ) -> list[PolicyEvaluationAuditEvent]:
         return self._load_store().list_policy_evaluation_events(evaluation_id=evaluation_id)
 
+    def list_policy_evaluation_events_by_evaluation(
+        self, *, evaluation_ids: Sequence[str]
+    ) -> dict[str, list[PolicyEvaluationAuditEvent]]:
+        return self._load_store().list_policy_evaluation_events_by_evaluation(
+            evaluation_ids=evaluation_ids
+        )
+
     def get_policy_evaluation_lineage(
         self, *, evaluation_id: str
     ) -> PolicyEvaluationLineageResponse:
         return self._load_store().get_policy_evaluation_lineage(evaluation_id=evaluation_id)
 
+    def list_policy_evaluation_record_page(
+        self, *, query: PolicyEvaluationRecordQuery
+    ) -> PolicyEvaluationRecordPage:
+        return self._load_store().list_policy_evaluation_record_page(query=query)
+
     def get_policy_evaluation_review_queue(
-        self, *, evaluation_status: str | None, portfolio_id: str | None
+        self, *, query: PolicyEvaluationRecordQuery
     ) -> PolicyEvaluationReviewQueueResponse:
-        return self._load_store().get_policy_evaluation_review_queue(
-            evaluation_status=evaluation_status,
-            portfolio_id=portfolio_id,
-        )
+        return self._load_store().get_policy_evaluation_review_queue(query=query)
 
     def get_policy_evaluation_sign_off_package(
         self, *, evaluation_id: str
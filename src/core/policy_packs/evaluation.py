@@ -4,12 +4,17 @@ from copy import deepcopy
 from typing import Any, cast
 
 from src.core.policy_packs.catalog import get_policy_pack_version
-from src.core.policy_packs.evaluation_applicability import evaluate_policy_pack_applicability
+from src.core.policy_packs.catalog_models import PolicyPackDetailResponse
+from src.core.policy_packs.evaluation_applicability import (
+    evaluate_compiled_policy_pack_applicability,
+)
 from src.core.policy_packs.evaluation_models import (
     PolicyPackEvaluationResponse,
     PolicyRuleEvaluationResult,
 )
-from src.core.policy_packs.evaluation_rules import evaluate_policy_rule
+from src.core.policy_packs.evaluation_plan import policy_pack_evaluation_plan
+from src.core.policy_packs.evaluation_rules import evaluate_compiled_policy_rule
+from src.core.policy_packs.evaluation_source_rules import sections_by_key
 from src.core.policy_packs.supportability import (
     POLICY_EVALUATION_ENGINE_CONTRACT_VERSION,
     policy_runtime_supportability,
@@ -39,6 +44,19 @@ def evaluate_policy_pack_version(
         policy_pack_id=policy_pack_id,
         policy_version=policy_version,
     )
+    return evaluate_active_policy_pack_detail(evidence_bundle=evidence_bundle, detail=detail)
+
+
+def evaluate_active_policy_pack_detail(
+    *,
+    evidence_bundle: dict[str, Any],
+    detail: PolicyPackDetailResponse,
+) -> PolicyPackEvaluationResponse:
+    """Evaluate a policy pack version the caller already loaded from the catalog.
+
+    Bulk callers load the detail once per run instead of once per evidence bundle.
+    """
+
     _require_active_policy_version(activation_state=detail.policy_pack.activation_state)
     return _evaluate_policy_pack_detail(evidence_bundle=evidence_bundle, detail=detail)
 
@@ -61,13 +79,13 @@ def evaluate_policy_pack_version_for_replay(
 def _evaluate_policy_pack_detail(
     *,
     evidence_bundle: dict[str, Any],
-    detail: Any,
+    detail: PolicyPackDetailResponse,
 ) -> PolicyPackEvaluationResponse:
-
+    plan = policy_pack_evaluation_plan(detail)
     source_posture = _source_posture(evidence_bundle)
-    applicability = evaluate_policy_pack_applicability(
+    applicability = evaluate_compiled_policy_pack_applicability(
         evidence_bundle=evidence_bundle,
-        applicability=detail.applicability,
+        scope=plan.applicability,
     )
     if applicability.status != "APPLICABLE":
         return PolicyPackEvaluationResponse(
@@ -82,15 +100,19 @@ def _evaluate_policy_pack_detail(
             supportability=_supportability(),
         )
 
+    source_sections = sections_by_key(source_posture)
+    jurisdiction = applicability.matched_selectors.get("jurisdiction", "")
+    client_segment = applicability.matched_selectors.get("client_segment", "")
     results = [
-        evaluate_policy_rule(
-            rule=rule,
+        evaluate_compiled_policy_rule(
+            compiled=compiled,
             evidence_bundle=evidence_bundle,
             source_posture=source_posture,
-            jurisdiction=applicability.matched_selectors.get("jurisdiction", ""),
-            client_segment=applicability.matched_selectors.get("client_segment", ""),
+            source_sections=source_sections,
+            jurisdiction=jurisdiction,
+            client_segment=client_segment,
         )
-        for rule in detail.rules
+        for compiled in plan.rules
     ]
     return PolicyPackEvaluationResponse(
         contract_version=_EVALUATION_CONTRACT_VERSION,
@@ -21,6 +21,14 @@ PRIVATE_BANKING_CLIENT_CLASSIFICATIONS = {
     "PRIVATE_BANKING",
 }
 
+_SCOPE_KEYS = (
+    "jurisdiction_scope",
+    BOOKING_LOCATION_SCOPE_KEY,
+    LEGAL_ENTITY_SCOPE_KEY,
+    "client_segment_scope",
+    PRODUCT_SCOPE_KEY,
+)
+
 _MISSING_REASON_CODES = {
     "jurisdiction": "POLICY_APPLICABILITY_JURISDICTION_SOURCE_MISSING",
     BOOKING_LOCATION_SOURCE_KEY: "POLICY_APPLICABILITY_BOOKING_LOCATION_SOURCE_MISSING",
@@ -59,11 +67,46 @@ class PolicyApplicabilityContext:
         return selectors
 
 
+@dataclass(frozen=True)
+class PolicyApplicabilityScope:
+    """Applicability selector sets of one policy pack version, normalized once."""
+
+    jurisdictions: frozenset[str]
+    booking_location_codes: frozenset[str]
+    legal_entity_codes: frozenset[str]
+    client_segments: frozenset[str]
+    product_scopes: frozenset[str]
+    required_scope_keys: frozenset[str]
+
+
+def compile_policy_pack_applicability(applicability: dict[str, Any]) -> PolicyApplicabilityScope:
+    scopes = {key: _normalized_scope(applicability, key) for key in _SCOPE_KEYS}
+    return PolicyApplicabilityScope(
+        jurisdictions=scopes["jurisdiction_scope"],
+        booking_location_codes=scopes[BOOKING_LOCATION_SCOPE_KEY],
+        legal_entity_codes=scopes[LEGAL_ENTITY_SCOPE_KEY],
+        client_segments=scopes["client_segment_scope"],
+        product_scopes=scopes[PRODUCT_SCOPE_KEY],
+        required_scope_keys=frozenset(
+            key for key, scope in scopes.items() if _requires_selector(scope)
+        ),
+    )
+
+
 def evaluate_policy_pack_applicability(
     *, evidence_bundle: dict[str, Any], applicability: dict[str, Any]
+) -> PolicyPackApplicabilityResult:
+    return evaluate_compiled_policy_pack_applicability(
+        evidence_bundle=evidence_bundle,
+        scope=compile_policy_pack_applicability(applicability),
+    )
+
+
+def evaluate_compiled_policy_pack_applicability(
+    *, evidence_bundle: dict[str, Any], scope: PolicyApplicabilityScope
 ) -> PolicyPackApplicabilityResult:
     context = _applicability_context(evidence_bundle)
-    missing = _missing_applicability_evidence(context=context, applicability=applicability)
+    missing = _missing_applicability_evidence(context=context, scope=scope)
     if missing:
         return PolicyPackApplicabilityResult(
             status="BLOCKED",
@@ -71,35 +114,31 @@ def evaluate_policy_pack_applicability(
             reason_codes=_missing_reason_codes(missing),
         )
 
-    if not _matches_scope(context.jurisdiction, list_at(applicability, "jurisdiction_scope")):
+    if not _matches_scope(context.jurisdiction, scope.jurisdictions):
         return _not_applicable_result(
             matched_selectors={"jurisdiction": context.jurisdiction},
             reason_code="POLICY_PACK_JURISDICTION_NOT_APPLICABLE",
         )
     if context.booking_location_code and not _matches_scope(
-        context.booking_location_code, list_at(applicability, BOOKING_LOCATION_SCOPE_KEY)
+        context.booking_location_code, scope.booking_location_codes
     ):
         return _not_applicable_result(
             matched_selectors=context.matched_selectors(),
             reason_code="POLICY_PACK_BOOKING_LOCATION_NOT_APPLICABLE",
         )
     if context.legal_entity_code and not _matches_scope(
-        context.legal_entity_code, list_at(applicability, LEGAL_ENTITY_SCOPE_KEY)
+        context.legal_entity_code, scope.legal_entity_codes
     ):
         return _not_applicable_result(
             matched_selectors=context.matched_selectors(),
             reason_code="POLICY_PACK_LEGAL_ENTITY_NOT_APPLICABLE",
         )
-    if not _client_segment_matches_scope(
-        context.client_segment, list_at(applicability, "client_segment_scope")
-    ):
+    if not _client_segment_matches_scope(context.client_segment, scope.client_segments):
         return _not_applicable_result(
             matched_selectors=context.matched_selectors(),
             reason_code="POLICY_PACK_CLIENT_SEGMENT_NOT_APPLICABLE",
         )
-    if not _product_scope_matches_scope(
-        context.product_scopes, list_at(applicability, PRODUCT_SCOPE_KEY)
-    ):
+    if not _product_scope_matches_scope(context.product_scopes, scope.product_scopes):
         return _not_applicable_result(
             matched_selectors=context.matched_selectors(),
             reason_code="POLICY_PACK_PRODUCT_SCOPE_NOT_APPLICABLE",
@@ -112,6 +151,35 @@ def evaluate_policy_pack_applicability(
     )
 
 
+def policy_pack_selectors_may_apply(
+    *, matched_selectors: dict[str, Any], applicability: dict[str, Any]
+) -> bool:
+    """Return False when recorded selectors already fall outside a pack's applicability scope.
+
+    Selectors missing from ``matched_selectors`` cannot rule a pack out, so only the evidence
+    bundle can settle those cases.
+    """
+    scope = compile_policy_pack_applicability(applicability)
+    jurisdiction = _normalized_selector(matched_selectors.get("jurisdiction"))
+    if jurisdiction and not _matches_scope(jurisdiction, scope.jurisdictions):
+        return False
+    booking_location_code = _normalized_selector(matched_selectors.get(BOOKING_LOCATION_SOURCE_KEY))
+    if booking_location_code and not _matches_scope(
+        booking_location_code, scope.booking_location_codes
+    ):
+        return False
+    legal_entity_code = _normalized_selector(matched_selectors.get(LEGAL_ENTITY_SOURCE_KEY))
+    if legal_entity_code and not _matches_scope(legal_entity_code, scope.legal_entity_codes):
+        return False
+    client_segment = _normalized_selector(matched_selectors.get("client_segment"))
+    if client_segment and not _client_segment_matches_scope(client_segment, scope.client_segments):
+        return False
+    product_scope = matched_selectors.get(PRODUCT_SCOPE_KEY)
+    if isinstance(product_scope, str) and product_scope:
+        return _product_scope_matches_scope(tuple(product_scope.split("|")), scope.product_scopes)
+    return True
+
+
 def _applicability_context(evidence_bundle: dict[str, Any]) -> PolicyApplicabilityContext:
     context = dict_at(dict_at(evidence_bundle, "context_resolution"), "advisory_policy_context")
     return PolicyApplicabilityContext(
@@ -124,13 +192,12 @@ def _applicability_context(evidence_bundle: dict[str, Any]) -> PolicyApplicabili
 
 
 def _missing_applicability_evidence(
-    *, context: PolicyApplicabilityContext, applicability: dict[str, Any]
+    *, context: PolicyApplicabilityContext, scope: PolicyApplicabilityScope
 ) -> list[str]:
     return [
         requirement.evidence_key
         for requirement in _selector_requirements(context)
-        if _requires_selector(applicability, requirement.scope_key)
-        and not requirement.context_value
+        if requirement.scope_key in scope.required_scope_keys and not requirement.context_value
     ]
 
 
@@ -182,35 +249,32 @@ def _not_applicable_result(
     )
 
 
-def _matches_scope(value: str, scope: list[Any]) -> bool:
-    normalized_scope = {str(item) for item in scope}
-    return "GLOBAL" in normalized_scope or value in normalized_scope
+def _matches_scope(value: str, scope: frozenset[str]) -> bool:
+    return "GLOBAL" in scope or value in scope
 
 
-def _client_segment_matches_scope(value: str, scope: list[Any]) -> bool:
-    normalized_scope = {str(item) for item in scope}
+def _client_segment_matches_scope(value: str, scope: frozenset[str]) -> bool:
     return (
-        "GLOBAL" in normalized_scope
-        or value in normalized_scope
-        or (
-            "PRIVATE_BANKING" in normalized_scope
-            and value in PRIVATE_BANKING_CLIENT_CLASSIFICATIONS
-        )
+        "GLOBAL" in scope
+        or value in scope
+        or ("PRIVATE_BANKING" in scope and value in PRIVATE_BANKING_CLIENT_CLASSIFICATIONS)
     )
 
 
-def _product_scope_matches_scope(product_scopes: tuple[str, ...], scope: list[Any]) -> bool:
-    normalized_scope = {str(item) for item in scope}
-    if "GLOBAL" in normalized_scope:
+def _product_scope_matches_scope(product_scopes: tuple[str, ...], scope: frozenset[str]) -> bool:
+    if "GLOBAL" in scope:
         return True
-    return bool(set(product_scopes).intersection(normalized_scope))
+    return not scope.isdisjoint(product_scopes)
 
 
-def _requires_selector(applicability: dict[str, Any], scope_key: str) -> bool:
-    scope = {str(item) for item in list_at(applicability, scope_key)}
+def _requires_selector(scope: frozenset[str]) -> bool:
     return bool(scope) and "GLOBAL" not in scope
 
 
+def _normalized_scope(applicability: dict[str, Any], scope_key: str) -> frozenset[str]:
+    return frozenset(str(item) for item in list_at(applicability, scope_key))
+
+
 def _product_scopes(evidence_bundle: dict[str, Any]) -> tuple[str, ...]:
     scopes: set[str] = set()
     for shelf in proposed_shelf_rows(evidence_bundle).values():
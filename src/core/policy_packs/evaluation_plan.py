@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass
+from threading import Lock
+
+from src.core.policy_packs.catalog_models import PolicyPackDetailResponse
+from src.core.policy_packs.evaluation_applicability import (
+    PolicyApplicabilityScope,
+    compile_policy_pack_applicability,
+)
+from src.core.policy_packs.evaluation_rules import CompiledPolicyRule, compile_policy_rule
+
+
+@dataclass(frozen=True)
+class PolicyPackEvaluationPlan:
+    """Immutable evaluation plan compiled from one policy pack version.
+
+    The plan holds everything about a pack version that does not depend on the evidence bundle:
+    normalized applicability selector sets and the rule dispatch table. A plan is keyed by pack id
+    and version and pinned to the content hash it was compiled from, so it is rebuilt whenever the
+    catalog returns different content for the same version.
+    """
+
+    policy_pack_id: str
+    policy_version: str
+    content_hash: str
+    applicability: PolicyApplicabilityScope
+    rules: tuple[CompiledPolicyRule, ...]
+
+
+_PLANS: dict[tuple[str, str], PolicyPackEvaluationPlan] = {}
+_PLANS_LOCK = Lock()
+
+
+def compile_policy_pack_evaluation_plan(
+    detail: PolicyPackDetailResponse,
+) -> PolicyPackEvaluationPlan:
+    return PolicyPackEvaluationPlan(
+        policy_pack_id=detail.policy_pack.policy_pack_id,
+        policy_version=detail.policy_pack.policy_version,
+        content_hash=detail.policy_pack.content_hash,
+        applicability=compile_policy_pack_applicability(detail.applicability),
+        rules=tuple(compile_policy_rule(rule) for rule in deepcopy(detail.rules)),
+    )
+
+
+def policy_pack_evaluation_plan(detail: PolicyPackDetailResponse) -> PolicyPackEvaluationPlan:
+    """Return the shared plan for a pack version, compiling it on first use."""
+    key = (detail.policy_pack.policy_pack_id, detail.policy_pack.policy_version)
+    plan = _PLANS.get(key)
+    if plan is not None and plan.content_hash == detail.policy_pack.content_hash:
+        return plan
+    compiled = compile_policy_pack_evaluation_plan(detail)
+    with _PLANS_LOCK:
+        _PLANS[key] = compiled
+    return compiled
+
+
+def clear_policy_pack_evaluation_plans() -> None:
+    """Drop every cached plan; the catalog calls this when its repository is replaced."""
+    with _PLANS_LOCK:
+        _PLANS.clear()
+
+
+__all__ = [
+    "PolicyPackEvaluationPlan",
+    "clear_policy_pack_evaluation_plans",
+    "compile_policy_pack_evaluation_plan",
+    "policy_pack_evaluation_plan",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from src.core.policy_packs.evaluation_models import PolicyRuleEvaluationResult
@@ -26,7 +27,13 @@ from src.core.policy_packs.evaluation_source_rules import (
     evaluate_mandate_rule as _evaluate_mandate_rule,
 )
 from src.core.policy_packs.evaluation_source_rules import (
-    required_source_result as _required_source_result,
+    required_source_result_for_fields as _required_source_result_for_fields,
+)
+from src.core.policy_packs.evaluation_source_rules import (
+    sections_by_key as _sections_by_key,
+)
+from src.core.policy_packs.evaluation_source_rules import (
+    source_evidence_fields as _source_evidence_fields,
 )
 
 _RuleEvaluator = Callable[
@@ -116,21 +123,14 @@ _SPECIALIZED_RULE_EVALUATORS: dict[str, _RuleEvaluator] = {
 }
 
 
-def evaluate_policy_rule(
-    *,
+def _unspecialized_rule_result(
     rule: dict[str, Any],
     evidence_bundle: dict[str, Any],
     source_posture: dict[str, Any],
     jurisdiction: str,
     client_segment: str,
 ) -> PolicyRuleEvaluationResult:
-    rule_id = str(rule["rule_id"])
-    required = _required_source_result(rule=rule, source_posture=source_posture)
-    if required is not None:
-        return required
-    evaluator = _SPECIALIZED_RULE_EVALUATORS.get(rule_id)
-    if evaluator is not None:
-        return evaluator(rule, evidence_bundle, source_posture, jurisdiction, client_segment)
+    del evidence_bundle, source_posture, jurisdiction, client_segment
     return _rule_pending(
         rule,
         outcome=str(rule.get("outcome_mapping") or "POLICY_RULE_REVIEW_REQUIRED"),
@@ -138,3 +138,62 @@ def evaluate_policy_rule(
         reason_codes=["POLICY_RULE_EVALUATOR_NOT_SPECIALIZED"],
         required_actions=["POLICY_STEWARD_REVIEW"],
     )
+
+
+@dataclass(frozen=True)
+class CompiledPolicyRule:
+    """A policy rule with its evaluator and source-evidence fields resolved up front."""
+
+    rule: dict[str, Any]
+    source_fields: tuple[str, ...]
+    evaluator: _RuleEvaluator
+
+
+def compile_policy_rule(rule: dict[str, Any]) -> CompiledPolicyRule:
+    return CompiledPolicyRule(
+        rule=rule,
+        source_fields=_source_evidence_fields(rule),
+        evaluator=_SPECIALIZED_RULE_EVALUATORS.get(
+            str(rule["rule_id"]), _unspecialized_rule_result
+        ),
+    )
+
+
+def evaluate_policy_rule(
+    *,
+    rule: dict[str, Any],
+    evidence_bundle: dict[str, Any],
+    source_posture: dict[str, Any],
+    jurisdiction: str,
+    client_segment: str,
+) -> PolicyRuleEvaluationResult:
+    return evaluate_compiled_policy_rule(
+        compiled=compile_policy_rule(rule),
+        evidence_bundle=evidence_bundle,
+        source_posture=source_posture,
+        source_sections=_sections_by_key(source_posture),
+        jurisdiction=jurisdiction,
+        client_segment=client_segment,
+    )
+
+
+def evaluate_compiled_policy_rule(
+    *,
+    compiled: CompiledPolicyRule,
+    evidence_bundle: dict[str, Any],
+    source_posture: dict[str, Any],
+    source_sections: dict[str, dict[str, Any]],
+    jurisdiction: str,
+    client_segment: str,
+) -> PolicyRuleEvaluationResult:
+    required = _required_source_result_for_fields(
+        rule=compiled.rule,
+        source_fields=compiled.source_fields,
+        source_posture=source_posture,
+        sections=source_sections,
+    )
+    if required is not None:
+        return required
+    return compiled.evaluator(
+        compiled.rule, evidence_bundle, source_posture, jurisdiction, client_segment
+    )
@@ -33,9 +33,24 @@ class _SourceEvidenceCollection:
 def required_source_result(
     *, rule: dict[str, Any], source_posture: dict[str, Any]
 ) -> PolicyRuleEvaluationResult | None:
-    sections = sections_by_key(source_posture)
+    return required_source_result_for_fields(
+        rule=rule,
+        source_fields=source_evidence_fields(rule),
+        source_posture=source_posture,
+        sections=sections_by_key(source_posture),
+    )
+
+
+def required_source_result_for_fields(
+    *,
+    rule: dict[str, Any],
+    source_fields: tuple[str, ...],
+    source_posture: dict[str, Any],
+    sections: dict[str, dict[str, Any]],
+) -> PolicyRuleEvaluationResult | None:
+    """Check a rule's source evidence with fields and sections the caller resolved once."""
     collection = _SourceEvidenceCollection(missing=[], reasons=[])
-    for field_key in _source_evidence_fields(rule):
+    for field_key in source_fields:
         if field_key.startswith(_POLICY_SOURCE_READINESS_PREFIX):
             _collect_policy_source_readiness_evidence(source_posture, collection)
             continue
@@ -51,12 +66,12 @@ def sections_by_key(source_posture: dict[str, Any]) -> dict[str, dict[str, Any]]
     }
 
 
-def _source_evidence_fields(rule: dict[str, Any]) -> list[str]:
-    return [
+def source_evidence_fields(rule: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(
         FIELD_TO_SOURCE_SECTION.get(field_key, field_key)
         for field_key in _required_evidence_field_keys(rule)
         if not _is_advisory_review_only_field(field_key)
-    ]
+    )
 
 
 def _required_evidence_field_keys(rule: dict[str, Any]) -> list[str]:
@@ -152,6 +167,9 @@ def sections_with_status(source_posture: dict[str, Any], status: str) -> list[di
 __all__ = [
     "evaluate_mandate_rule",
     "required_source_result",
+    "required_source_result_for_fields",
     "section",
+    "sections_by_key",
     "sections_with_status",
+    "source_evidence_fields",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from src.core.common.idempotency import normalize_optional_idempotency_key
@@ -17,6 +18,10 @@ from src.core.policy_packs.projection_models import (
     PolicyEvaluationReviewQueueResponse,
     PolicyEvaluationSignOffPackageResponse,
 )
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    normalize_policy_evaluation_record_query,
+)
 from src.core.policy_packs.repositories import PolicyEvaluationRepository
 from src.core.policy_packs.supportability import (
     POLICY_EVALUATION_PERSISTENCE_CONTRACT_VERSION,
@@ -73,12 +78,49 @@ def get_policy_evaluation_lineage(*, evaluation_id: str) -> PolicyEvaluationLine
     return _repository().get_policy_evaluation_lineage(evaluation_id=evaluation_id)
 
 
+def list_policy_evaluation_record_page(
+    *,
+    evaluation_status: str | None = None,
+    portfolio_id: str | None = None,
+    jurisdiction: str | None = None,
+    generated_after: datetime | None = None,
+    generated_before: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> PolicyEvaluationRecordPage:
+    return _repository().list_policy_evaluation_record_page(
+        query=normalize_policy_evaluation_record_query(
+            evaluation_status=evaluation_status,
+            portfolio_id=portfolio_id,
+            jurisdiction=jurisdiction,
+            generated_after=generated_after,
+            generated_before=generated_before,
+            limit=limit,
+            cursor=cursor,
+        )
+    )
+
+
 def get_policy_evaluation_review_queue(
-    *, evaluation_status: str | None = "PENDING_REVIEW", portfolio_id: str | None = None
+    *,
+    evaluation_status: str | None = "PENDING_REVIEW",
+    portfolio_id: str | None = None,
+    jurisdiction: str | None = None,
+    generated_after: datetime | None = None,
+    generated_before: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> PolicyEvaluationReviewQueueResponse:
     return _repository().get_policy_evaluation_review_queue(
-        evaluation_status=evaluation_status,
-        portfolio_id=portfolio_id,
+        query=normalize_policy_evaluation_record_query(
+            evaluation_status=evaluation_status,
+            portfolio_id=portfolio_id,
+            jurisdiction=jurisdiction,
+            generated_after=generated_after,
+            generated_before=generated_before,
+            limit=limit,
+            cursor=cursor,
+        )
     )
 
 
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.policy_packs.evaluation_models import PolicyPackEvaluationResponse
+from src.core.policy_packs.persistence_models import PolicyEvaluationPersistenceResult
+
+
+@dataclass(frozen=True)
+class PolicyEvaluationFinalizeItem:
+    """One finalize request in a batch written with a single repository save.
+
+    ``evaluation`` may carry a result computed outside the store, for example by a re-evaluation
+    job that evaluates a chunk in parallel. It must come from the same active policy version.
+    """
+
+    evidence_bundle: dict[str, Any]
+    policy_pack_id: str
+    policy_version: str
+    proposal_id: str
+    proposal_version_id: str
+    created_by: str
+    idempotency_key: str
+    reason: dict[str, Any]
+    observed_trace_id: str | None = None
+    evaluation: PolicyPackEvaluationResponse | None = None
+
+
+@dataclass(frozen=True)
+class PolicyEvaluationFinalizeOutcome:
+    idempotency_key: str
+    result: PolicyEvaluationPersistenceResult | None = None
+    error_code: str | None = None
+
+
+__all__ = [
+    "PolicyEvaluationFinalizeItem",
+    "PolicyEvaluationFinalizeOutcome",
+]
@@ -7,7 +7,11 @@ from src.core.policy_packs.persistence_models import (
     PolicyEvaluationAuditEvent,
     PolicyEvaluationRecord,
 )
-from src.core.policy_packs.projection_models import PolicyEvaluationLineageResponse
+from src.core.policy_packs.projection_models import (
+    PolicyEvaluationLineageResponse,
+    PolicyEvaluationReviewQueueResponse,
+)
+from src.core.policy_packs.record_query import PolicyEvaluationRecordPage
 from src.core.policy_packs.supportability import policy_runtime_supportability
 
 
@@ -47,3 +51,15 @@ def build_policy_evaluation_lineage_response(
 
 def policy_evaluation_api_posture() -> dict[str, Any]:
     return dict(policy_runtime_supportability())
+
+
+def build_policy_evaluation_review_queue_response(
+    page: PolicyEvaluationRecordPage,
+) -> PolicyEvaluationReviewQueueResponse:
+    return PolicyEvaluationReviewQueueResponse(
+        items=page.items,
+        queue_posture=policy_evaluation_api_posture(),
+        next_cursor=page.next_cursor,
+        total_count=page.total_count,
+        status_counts=page.status_counts,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from datetime import UTC, datetime
 from typing import Any
@@ -8,10 +8,15 @@ from typing import Any
 from src.core.common.canonical import hash_canonical_payload
 from src.core.policy_packs.catalog import get_policy_pack_version
 from src.core.policy_packs.evaluation import evaluate_policy_pack_version
+from src.core.policy_packs.evaluation_models import PolicyPackEvaluationResponse
 from src.core.policy_packs.event_authority import (
     PolicyEvaluationEventAuthority,
     validate_policy_evaluation_event_authority,
 )
+from src.core.policy_packs.persistence_batch import (
+    PolicyEvaluationFinalizeItem,
+    PolicyEvaluationFinalizeOutcome,
+)
 from src.core.policy_packs.persistence_models import (
     PolicyEvaluationAuditEvent,
     PolicyEvaluationEventType,
@@ -22,7 +27,7 @@ from src.core.policy_packs.persistence_models import (
 from src.core.policy_packs.persistence_projection import (
     attach_policy_evaluation_event,
     build_policy_evaluation_lineage_response,
-    policy_evaluation_api_posture,
+    build_policy_evaluation_review_queue_response,
 )
 from src.core.policy_packs.persistence_record_builder import build_policy_evaluation_record
 from src.core.policy_packs.persistence_replay import build_policy_evaluation_replay_response
@@ -37,6 +42,11 @@ from src.core.policy_packs.receipt_identity import (
     receipt_identity_from_record,
     replay_safe_reason,
 )
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+    page_policy_evaluation_records,
+)
 from src.core.policy_packs.supportability import (
     POLICY_EVALUATION_PERSISTENCE_CONTRACT_VERSION,
     policy_sign_off_package_posture,
@@ -44,6 +54,7 @@ from src.core.policy_packs.supportability import (
 from src.core.proposals.exceptions import (
     ProposalIdempotencyConflictError,
     ProposalNotFoundError,
+    ProposalValidationError,
 )
 
 _PERSISTENCE_CONTRACT_VERSION = POLICY_EVALUATION_PERSISTENCE_CONTRACT_VERSION
@@ -128,6 +139,54 @@ class PolicyEvaluationRecordStore:
         reason: dict[str, Any],
         observed_trace_id: str | None = None,
     ) -> PolicyEvaluationPersistenceResult:
+        return self._finalize_item(
+            PolicyEvaluationFinalizeItem(
+                evidence_bundle=evidence_bundle,
+                policy_pack_id=policy_pack_id,
+                policy_version=policy_version,
+                proposal_id=proposal_id,
+                proposal_version_id=proposal_version_id,
+                created_by=created_by,
+                idempotency_key=idempotency_key,
+                reason=reason,
+                observed_trace_id=observed_trace_id,
+            )
+        )
+
+    def finalize_policy_evaluation_records(
+        self, *, items: Sequence[PolicyEvaluationFinalizeItem]
+    ) -> list[PolicyEvaluationFinalizeOutcome]:
+        # Each item only mutates the store after it succeeds, so a rejected item leaves no
+        # partial state and later items in the batch still see every earlier success.
+        outcomes: list[PolicyEvaluationFinalizeOutcome] = []
+        for item in items:
+            try:
+                result = self._finalize_item(item)
+            except (ProposalIdempotencyConflictError, ProposalValidationError) as exc:
+                outcomes.append(
+                    PolicyEvaluationFinalizeOutcome(
+                        idempotency_key=item.idempotency_key,
+                        error_code=str(exc),
+                    )
+                )
+                continue
+            outcomes.append(
+                PolicyEvaluationFinalizeOutcome(idempotency_key=item.idempotency_key, result=result)
+            )
+        return outcomes
+
+    def _finalize_item(
+        self, item: PolicyEvaluationFinalizeItem
+    ) -> PolicyEvaluationPersistenceResult:
+        evidence_bundle = item.evidence_bundle
+        policy_pack_id = item.policy_pack_id
+        policy_version = item.policy_version
+        proposal_id = item.proposal_id
+        proposal_version_id = item.proposal_version_id
+        created_by = item.created_by
+        idempotency_key = item.idempotency_key
+        reason = item.reason
+        observed_trace_id = item.observed_trace_id
         source_evidence_hash = hash_canonical_payload(evidence_bundle)
         request_hash = hash_canonical_payload(
             {
@@ -180,15 +239,23 @@ class PolicyEvaluationRecordStore:
                 audit_event=deepcopy(event),
             )
 
-        evaluation = evaluate_policy_pack_version(
-            evidence_bundle=deepcopy(evidence_bundle),
-            policy_pack_id=policy_pack_id,
-            policy_version=policy_version,
-        )
-        detail = get_policy_pack_version(
-            policy_pack_id=policy_pack_id,
-            policy_version=policy_version,
-        )
+        evaluation = item.evaluation
+        if evaluation is None:
+            evaluation = evaluate_policy_pack_version(
+                evidence_bundle=deepcopy(evidence_bundle),
+                policy_pack_id=policy_pack_id,
+                policy_version=policy_version,
+            )
+            policy_content_hash = get_policy_pack_version(
+                policy_pack_id=policy_pack_id,
+                policy_version=policy_version,
+            ).policy_pack.content_hash
+        else:
+            policy_content_hash = _precomputed_policy_content_hash(
+                evaluation,
+                policy_pack_id=policy_pack_id,
+                policy_version=policy_version,
+            )
         record = build_policy_evaluation_record(
             evaluation=evaluation,
             evidence_bundle=evidence_bundle,
@@ -196,7 +263,7 @@ class PolicyEvaluationRecordStore:
             proposal_version_id=proposal_version_id,
             created_by=created_by,
             source_evidence_hash=source_evidence_hash,
-            policy_content_hash=detail.policy_pack.content_hash,
+            policy_content_hash=policy_content_hash,
             idempotency_key=idempotency_key,
             reason=reason,
             observed_trace_id=observed_trace_id,
@@ -253,6 +320,14 @@ class PolicyEvaluationRecordStore:
         self._load_record(evaluation_id)
         return [deepcopy(event) for event in self._events[evaluation_id]]
 
+    def list_policy_evaluation_events_by_evaluation(
+        self, *, evaluation_ids: Sequence[str]
+    ) -> dict[str, list[PolicyEvaluationAuditEvent]]:
+        return {
+            evaluation_id: self.list_policy_evaluation_events(evaluation_id=evaluation_id)
+            for evaluation_id in evaluation_ids
+        }
+
     def get_policy_evaluation_lineage(
         self, *, evaluation_id: str
     ) -> PolicyEvaluationLineageResponse:
@@ -262,15 +337,16 @@ class PolicyEvaluationRecordStore:
             audit_events=self._events[evaluation_id],
         )
 
+    def list_policy_evaluation_record_page(
+        self, *, query: PolicyEvaluationRecordQuery
+    ) -> PolicyEvaluationRecordPage:
+        return page_policy_evaluation_records(self._records.values(), query=query)
+
     def get_policy_evaluation_review_queue(
-        self, *, evaluation_status: str | None, portfolio_id: str | None
+        self, *, query: PolicyEvaluationRecordQuery
     ) -> PolicyEvaluationReviewQueueResponse:
-        return PolicyEvaluationReviewQueueResponse(
-            items=self.list_policy_evaluation_records(
-                evaluation_status=evaluation_status,
-                portfolio_id=portfolio_id,
-            ),
-            queue_posture=policy_evaluation_api_posture(),
+        return build_policy_evaluation_review_queue_response(
+            self.list_policy_evaluation_record_page(query=query)
         )
 
     def get_policy_evaluation_sign_off_package(
@@ -453,6 +529,20 @@ class PolicyEvaluationRecordStore:
         return record, event
 
 
+def _precomputed_policy_content_hash(
+    evaluation: PolicyPackEvaluationResponse,
+    *,
+    policy_pack_id: str,
+    policy_version: str,
+) -> str:
+    policy_pack = evaluation.policy_pack
+    if policy_pack.policy_pack_id != policy_pack_id or policy_pack.policy_version != policy_version:
+        raise ProposalValidationError("POLICY_EVALUATION_PRECOMPUTED_RESULT_MISMATCH")
+    if policy_pack.activation_state != "ACTIVE":
+        raise ProposalValidationError("POLICY_PACK_VERSION_NOT_ACTIVE_FOR_EVALUATION")
+    return policy_pack.content_hash
+
+
 def _filtered_policy_evaluation_records(
     records: Iterable[PolicyEvaluationRecord],
     *,
@@ -78,6 +78,27 @@ class PolicyEvaluationReviewQueueResponse(BaseModel):
             }
         ],
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description=(
+            "Opaque keyset cursor for the next page, ordered oldest first by generation time. "
+            "Null when this page is the last one."
+        ),
+        examples=["eyJldmFsdWF0aW9uX2lkIjoicGV2XzEyM2FiYyJ9"],
+    )
+    total_count: int = Field(
+        default=0,
+        description="Number of records matching every filter, across all pages.",
+        examples=[128],
+    )
+    status_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Record counts by aggregate policy posture for the portfolio, jurisdiction, and age "
+            "filters, ignoring the status filter so reviewers can see every queue at once."
+        ),
+        examples=[{"PENDING_REVIEW": 128, "READY": 2043, "BLOCKED": 7}],
+    )
 
 
 class PolicyEvaluationSignOffPackageResponse(BaseModel):
@@ -0,0 +1,474 @@
+"""Bulk re-evaluation of existing proposals after a policy-pack version is activated.
+
+Activating a new version leaves earlier evaluations pinned to the superseded version. This job
+walks the evaluation records of the pack in keyset order, skips proposals the new version cannot
+apply to, evaluates the rest in parallel chunks against the active version, and writes each chunk
+through one repository save. The keyset cursor after each committed chunk is the checkpoint, so an
+interrupted run resumes where it stopped and re-runs replay through deterministic idempotency keys.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Literal
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.policy_packs.catalog import get_policy_pack_version
+from src.core.policy_packs.catalog_models import PolicyPackDetailResponse
+from src.core.policy_packs.evaluation import evaluate_active_policy_pack_detail
+from src.core.policy_packs.evaluation_applicability import policy_pack_selectors_may_apply
+from src.core.policy_packs.persistence import get_policy_evaluation_repository
+from src.core.policy_packs.persistence_batch import PolicyEvaluationFinalizeItem
+from src.core.policy_packs.persistence_models import PolicyEvaluationRecord
+from src.core.policy_packs.record_query import (
+    POLICY_EVALUATION_MAX_PAGE_SIZE,
+    PolicyEvaluationRecordQuery,
+    decode_policy_evaluation_record_cursor,
+)
+from src.core.policy_packs.repositories import PolicyEvaluationRepository
+from src.core.proposals.exceptions import ProposalValidationError
+from src.core.proposals.models import ProposalVersionPayloadSection
+from src.core.proposals.repository import ProposalRepository
+from src.core.proposals.source_readiness_common import dict_at
+
+DEFAULT_POLICY_RE_EVALUATION_CHUNK_SIZE = 100
+DEFAULT_POLICY_RE_EVALUATION_MAX_WORKERS = 4
+POLICY_RE_EVALUATION_ACTOR = "system:policy-re-evaluation"
+POLICY_RE_EVALUATION_ROLE = "POLICY_RE_EVALUATION_JOB"
+POLICY_RE_EVALUATION_CAPABILITY = "advisory.policy_evaluation.re_evaluate"
+
+_EVIDENCE_BUNDLE_SECTIONS: tuple[ProposalVersionPayloadSection, ...] = ("evidence_bundle",)
+
+PolicyReEvaluationOutcome = Literal[
+    "created",
+    "replayed",
+    "current",
+    "duplicate",
+    "out_of_scope",
+    "not_applicable",
+    "missing_evidence",
+    "failed",
+]
+# Returns the stored evidence bundle for (proposal_id, proposal_version_id), or None. It is called
+# from worker threads, so it must not share one connection across calls.
+PolicyReEvaluationEvidenceLoader = Callable[[str, str], dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class PolicyReEvaluationSettings:
+    chunk_size: int = DEFAULT_POLICY_RE_EVALUATION_CHUNK_SIZE
+    max_workers: int = DEFAULT_POLICY_RE_EVALUATION_MAX_WORKERS
+    max_chunks: int | None = None
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.chunk_size <= POLICY_EVALUATION_MAX_PAGE_SIZE:
+            raise ValueError("POLICY_RE_EVALUATION_CHUNK_SIZE_INVALID")
+        if self.max_workers < 0:
+            raise ValueError("POLICY_RE_EVALUATION_MAX_WORKERS_INVALID")
+        if self.max_chunks is not None and self.max_chunks < 1:
+            raise ValueError("POLICY_RE_EVALUATION_MAX_CHUNKS_INVALID")
+
+
+@dataclass(frozen=True)
+class PolicyReEvaluationPrincipal:
+    """Trusted system principal the job finalizes records under, scoped to one legal entity."""
+
+    tenant_id: str
+    legal_entity_code: str
+    service_identity: str
+    correlation_id: str
+    actor_id: str = POLICY_RE_EVALUATION_ACTOR
+
+    def audit_metadata(self) -> dict[str, str]:
+        return {
+            "subject": self.actor_id,
+            "role": POLICY_RE_EVALUATION_ROLE,
+            "tenant_id": self.tenant_id,
+            "legal_entity_code": self.legal_entity_code.upper(),
+            "correlation_id": self.correlation_id,
+            "service_identity": self.service_identity,
+            "capability": POLICY_RE_EVALUATION_CAPABILITY,
+        }
+
+
+@dataclass(frozen=True)
+class PolicyReEvaluationCheckpoint:
+    policy_pack_id: str
+    policy_version: str
+    cursor: str | None = None
+    chunks: int = 0
+    completed: bool = False
+    outcome_counts: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "policy_pack_id": self.policy_pack_id,
+            "policy_version": self.policy_version,
+            "cursor": self.cursor,
+            "chunks": self.chunks,
+            "completed": self.completed,
+            "outcome_counts": dict(sorted(self.outcome_counts.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> PolicyReEvaluationCheckpoint:
+        try:
+            checkpoint = cls(
+                policy_pack_id=str(payload["policy_pack_id"]),
+                policy_version=str(payload["policy_version"]),
+                cursor=payload.get("cursor"),
+                chunks=int(payload.get("chunks", 0)),
+                completed=bool(payload.get("completed", False)),
+                outcome_counts={
+                    str(key): int(value)
+                    for key, value in dict(payload.get("outcome_counts", {})).items()
+                },
+            )
+            decode_policy_evaluation_record_cursor(checkpoint.cursor)
+        except (KeyError, TypeError, ValueError, ProposalValidationError) as exc:
+            raise ValueError("POLICY_RE_EVALUATION_CHECKPOINT_INVALID") from exc
+        return checkpoint
+
+
+@dataclass(frozen=True)
+class PolicyReEvaluationReport:
+    checkpoint: PolicyReEvaluationCheckpoint
+    scanned: int
+    chunks: int
+    outcome_counts: dict[str, int]
+    error_counts: dict[str, int]
+    worker_count: int
+    elapsed_seconds: Decimal
+    records_per_second: Decimal
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "checkpoint": self.checkpoint.to_dict(),
+            "scanned": self.scanned,
+            "chunks": self.chunks,
+            "outcome_counts": self.outcome_counts,
+            "error_counts": self.error_counts,
+            "worker_count": self.worker_count,
+            "elapsed_seconds": str(self.elapsed_seconds),
+            "records_per_second": str(self.records_per_second),
+        }
+
+
+@dataclass(frozen=True)
+class _PreparedCandidate:
+    outcome: PolicyReEvaluationOutcome | None
+    item: PolicyEvaluationFinalizeItem | None = None
+    error_code: str | None = None
+
+
+def proposal_version_evidence_loader(
+    repository: ProposalRepository,
+) -> PolicyReEvaluationEvidenceLoader:
+    """Load the evidence bundle stored on the proposal version a record was finalized for."""
+
+    def load(proposal_id: str, proposal_version_id: str) -> dict[str, Any] | None:
+        header = next(
+            (
+                candidate
+                for candidate in repository.list_version_headers(proposal_id=proposal_id)
+                if candidate.proposal_version_id == proposal_version_id
+            ),
+            None,
+        )
+        if header is None:
+            return None
+        version = repository.get_version_sections(
+            proposal_id=proposal_id,
+            version_no=header.version_no,
+            sections=_EVIDENCE_BUNDLE_SECTIONS,
+        )
+        if version is None or not isinstance(version.evidence_bundle_json, dict):
+            return None
+        return version.evidence_bundle_json
+
+    return load
+
+
+def run_policy_re_evaluation(
+    *,
+    policy_pack_id: str,
+    policy_version: str,
+    principal: PolicyReEvaluationPrincipal,
+    load_evidence: PolicyReEvaluationEvidenceLoader,
+    repository: PolicyEvaluationRepository | None = None,
+    settings: PolicyReEvaluationSettings | None = None,
+    checkpoint: PolicyReEvaluationCheckpoint | None = None,
+    on_checkpoint: Callable[[PolicyReEvaluationCheckpoint], None] | None = None,
+) -> PolicyReEvaluationReport:
+    """Re-evaluate proposals pinned to earlier versions of a pack against its active version.
+
+    ``on_checkpoint`` is called after every committed chunk. Passing the last checkpoint back in
+    resumes the walk after the last committed record.
+    """
+
+    started_at = time.perf_counter()
+    settings = settings or PolicyReEvaluationSettings()
+    repository = repository or get_policy_evaluation_repository()
+    detail = get_policy_pack_version(policy_pack_id=policy_pack_id, policy_version=policy_version)
+    if detail.policy_pack.activation_state != "ACTIVE":
+        raise ProposalValidationError("POLICY_PACK_VERSION_NOT_ACTIVE_FOR_EVALUATION")
+    current = checkpoint or PolicyReEvaluationCheckpoint(
+        policy_pack_id=policy_pack_id,
+        policy_version=policy_version,
+    )
+    if (current.policy_pack_id, current.policy_version) != (policy_pack_id, policy_version):
+        raise ValueError("POLICY_RE_EVALUATION_CHECKPOINT_MISMATCH")
+
+    outcome_counts: Counter[str] = Counter()
+    error_counts: Counter[str] = Counter()
+    seen: set[tuple[str, str]] = set()
+    scanned = 0
+    chunks = 0
+    with _candidate_executor(settings.max_workers) as map_candidates:
+        while not current.completed and (
+            settings.max_chunks is None or chunks < settings.max_chunks
+        ):
+            page = repository.list_policy_evaluation_record_page(
+                query=PolicyEvaluationRecordQuery(
+                    policy_pack_id=policy_pack_id,
+                    limit=settings.chunk_size,
+                    cursor=decode_policy_evaluation_record_cursor(current.cursor),
+                )
+            )
+            chunk_counts = _re_evaluate_chunk(
+                records=page.items,
+                detail=detail,
+                principal=principal,
+                load_evidence=load_evidence,
+                repository=repository,
+                map_candidates=map_candidates,
+                seen=seen,
+                error_counts=error_counts,
+            )
+            scanned += len(page.items)
+            chunks += 1
+            outcome_counts.update(chunk_counts)
+            current = PolicyReEvaluationCheckpoint(
+                policy_pack_id=policy_pack_id,
+                policy_version=policy_version,
+                cursor=page.next_cursor or current.cursor,
+                chunks=current.chunks + 1,
+                completed=page.next_cursor is None,
+                outcome_counts=dict(Counter(current.outcome_counts) + chunk_counts),
+            )
+            if on_checkpoint is not None:
+                on_checkpoint(current)
+
+    elapsed = Decimal(str(max(time.perf_counter() - started_at, 1e-6)))
+    return PolicyReEvaluationReport(
+        checkpoint=current,
+        scanned=scanned,
+        chunks=chunks,
+        outcome_counts=dict(sorted(outcome_counts.items())),
+        error_counts=dict(sorted(error_counts.items())),
+        worker_count=settings.max_workers,
+        elapsed_seconds=elapsed.quantize(Decimal("0.001")),
+        records_per_second=(Decimal(scanned) / elapsed).quantize(Decimal("0.01")),
+    )
+
+
+_CandidateMapper = Callable[
+    [Callable[[PolicyEvaluationRecord], _PreparedCandidate], Sequence[PolicyEvaluationRecord]],
+    Iterator[_PreparedCandidate],
+]
+
+
+@contextmanager
+def _candidate_executor(max_workers: int) -> Iterator[_CandidateMapper]:
+    # Threads, not processes: evaluation reads the process-configured catalog repository, and
+    # evidence loading is the I/O-bound share of each candidate.
+    if max_workers <= 1:
+        yield lambda prepare, records: iter(map(prepare, records))
+        return
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="policy-re-evaluation"
+    ) as executor:
+        yield lambda prepare, records: executor.map(prepare, records)
+
+
+def _re_evaluate_chunk(
+    *,
+    records: list[PolicyEvaluationRecord],
+    detail: PolicyPackDetailResponse,
+    principal: PolicyReEvaluationPrincipal,
+    load_evidence: PolicyReEvaluationEvidenceLoader,
+    repository: PolicyEvaluationRepository,
+    map_candidates: _CandidateMapper,
+    seen: set[tuple[str, str]],
+    error_counts: Counter[str],
+) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    candidates: list[PolicyEvaluationRecord] = []
+    for record in records:
+        skipped = _skip_outcome(record, detail=detail, principal=principal, seen=seen)
+        if skipped is not None:
+            counts[skipped] += 1
+            continue
+        seen.add((record.proposal_id, record.proposal_version_id))
+        candidates.append(record)
+
+    items: list[PolicyEvaluationFinalizeItem] = []
+    for prepared in map_candidates(
+        lambda record: _prepare_candidate(
+            record,
+            detail=detail,
+            principal=principal,
+            load_evidence=load_evidence,
+        ),
+        candidates,
+    ):
+        if prepared.item is not None:
+            items.append(prepared.item)
+            continue
+        if prepared.outcome is not None:
+            counts[prepared.outcome] += 1
+        if prepared.error_code is not None:
+            error_counts[prepared.error_code] += 1
+
+    if items:
+        for outcome in repository.finalize_policy_evaluation_records(items=items):
+            if outcome.result is None:
+                counts["failed"] += 1
+                error_counts[outcome.error_code or "POLICY_RE_EVALUATION_FAILED"] += 1
+            elif outcome.result.replayed or not outcome.result.created:
+                counts["replayed"] += 1
+            else:
+                counts["created"] += 1
+    return counts
+
+
+def _skip_outcome(
+    record: PolicyEvaluationRecord,
+    *,
+    detail: PolicyPackDetailResponse,
+    principal: PolicyReEvaluationPrincipal,
+    seen: set[tuple[str, str]],
+) -> PolicyReEvaluationOutcome | None:
+    if record.policy_version == detail.policy_pack.policy_version:
+        return "current"
+    if (record.proposal_id, record.proposal_version_id) in seen:
+        return "duplicate"
+    selectors = _matched_selectors(record)
+    if not _legal_entity_in_scope(selectors.get("legal_entity_code"), principal=principal):
+        return "out_of_scope"
+    if not policy_pack_selectors_may_apply(
+        matched_selectors=selectors,
+        applicability=detail.applicability,
+    ):
+        return "not_applicable"
+    return None
+
+
+def _prepare_candidate(
+    record: PolicyEvaluationRecord,
+    *,
+    detail: PolicyPackDetailResponse,
+    principal: PolicyReEvaluationPrincipal,
+    load_evidence: PolicyReEvaluationEvidenceLoader,
+) -> _PreparedCandidate:
+    evidence_bundle = load_evidence(record.proposal_id, record.proposal_version_id)
+    if not evidence_bundle:
+        return _PreparedCandidate(outcome="missing_evidence")
+    policy_context = dict_at(
+        dict_at(evidence_bundle, "context_resolution"), "advisory_policy_context"
+    )
+    if not _legal_entity_in_scope(
+        policy_context.get("legal_entity_code"), principal=principal
+    ) or policy_context.get("tenant_id") not in {None, "", principal.tenant_id}:
+        return _PreparedCandidate(outcome="out_of_scope")
+    try:
+        evaluation = evaluate_active_policy_pack_detail(
+            evidence_bundle=deepcopy(evidence_bundle),
+            detail=detail,
+        )
+    except ProposalValidationError as exc:
+        return _PreparedCandidate(outcome="failed", error_code=str(exc))
+    if evaluation.evaluation_status == "NOT_APPLICABLE":
+        return _PreparedCandidate(outcome="not_applicable")
+    policy_pack = detail.policy_pack
+    return _PreparedCandidate(
+        outcome=None,
+        item=PolicyEvaluationFinalizeItem(
+            evidence_bundle=evidence_bundle,
+            policy_pack_id=policy_pack.policy_pack_id,
+            policy_version=policy_pack.policy_version,
+            proposal_id=record.proposal_id,
+            proposal_version_id=record.proposal_version_id,
+            created_by=principal.actor_id,
+            idempotency_key=_re_evaluation_idempotency_key(
+                record=record,
+                detail=detail,
+                evidence_bundle=evidence_bundle,
+            ),
+            reason={
+                "purpose": "POLICY_PACK_VERSION_RE_EVALUATION",
+                "trigger": "POLICY_PACK_VERSION_ACTIVATED",
+                "trusted_principal": principal.audit_metadata(),
+            },
+            observed_trace_id=principal.correlation_id,
+            evaluation=evaluation,
+        ),
+    )
+
+
+def _re_evaluation_idempotency_key(
+    *,
+    record: PolicyEvaluationRecord,
+    detail: PolicyPackDetailResponse,
+    evidence_bundle: dict[str, Any],
+) -> str:
+    # Deterministic per proposal version, target version, and evidence, so resumed or repeated
+    # runs replay instead of writing a second record.
+    key_hash = hash_canonical_payload(
+        {
+            "operation": "POLICY_PACK_VERSION_RE_EVALUATION",
+            "policy_pack_id": detail.policy_pack.policy_pack_id,
+            "policy_version": detail.policy_pack.policy_version,
+            "proposal_id": record.proposal_id,
+            "proposal_version_id": record.proposal_version_id,
+            "source_evidence_hash": hash_canonical_payload(evidence_bundle),
+        }
+    )
+    return f"policy-re-evaluation:{key_hash.removeprefix('sha256:')[:40]}"
+
+
+def _matched_selectors(record: PolicyEvaluationRecord) -> dict[str, Any]:
+    applicability = record.evaluation_json.get("applicability")
+    if not isinstance(applicability, dict):
+        return {}
+    selectors = applicability.get("matched_selectors")
+    return selectors if isinstance(selectors, dict) else {}
+
+
+def _legal_entity_in_scope(value: Any, *, principal: PolicyReEvaluationPrincipal) -> bool:
+    if not isinstance(value, str) or not value.strip():
+        return True
+    return value.strip().upper() == principal.legal_entity_code.strip().upper()
+
+
+__all__ = [
+    "DEFAULT_POLICY_RE_EVALUATION_CHUNK_SIZE",
+    "DEFAULT_POLICY_RE_EVALUATION_MAX_WORKERS",
+    "POLICY_RE_EVALUATION_ACTOR",
+    "POLICY_RE_EVALUATION_CAPABILITY",
+    "PolicyReEvaluationCheckpoint",
+    "PolicyReEvaluationEvidenceLoader",
+    "PolicyReEvaluationOutcome",
+    "PolicyReEvaluationPrincipal",
+    "PolicyReEvaluationReport",
+    "PolicyReEvaluationSettings",
+    "proposal_version_evidence_loader",
+    "run_policy_re_evaluation",
+]
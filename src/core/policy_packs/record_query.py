@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections import Counter
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.core.policy_packs.persistence_models import PolicyEvaluationRecord
+from src.core.proposals.exceptions import ProposalValidationError
+
+POLICY_EVALUATION_DEFAULT_PAGE_SIZE = 50
+POLICY_EVALUATION_MAX_PAGE_SIZE = 200
+_INVALID_CURSOR = "POLICY_EVALUATION_CURSOR_INVALID"
+_INVALID_PAGE_SIZE = "POLICY_EVALUATION_PAGE_SIZE_INVALID"
+_INVALID_GENERATED_WINDOW = "POLICY_EVALUATION_GENERATED_WINDOW_INVALID"
+
+
+@dataclass(frozen=True)
+class PolicyEvaluationRecordCursor:
+    generated_at: str
+    evaluation_id: str
+
+
+@dataclass(frozen=True)
+class PolicyEvaluationRecordQuery:
+    """Filters and keyset position for one page of policy evaluation records.
+
+    Records are ordered oldest first by ``(generated_at, evaluation_id)``. ``generated_at`` is
+    stored as a UTC ISO-8601 string, so the age bounds are compared as normalized UTC strings,
+    which keeps the in-memory and Postgres orderings identical.
+    """
+
+    evaluation_status: str | None = None
+    portfolio_id: str | None = None
+    jurisdiction: str | None = None
+    generated_after: str | None = None
+    generated_before: str | None = None
+    limit: int = POLICY_EVALUATION_DEFAULT_PAGE_SIZE
+    cursor: PolicyEvaluationRecordCursor | None = None
+    policy_pack_id: str | None = None
+
+
+@dataclass(frozen=True)
+class PolicyEvaluationRecordPage:
+    items: list[PolicyEvaluationRecord]
+    next_cursor: str | None
+    total_count: int
+    status_counts: dict[str, int] = field(default_factory=dict)
+
+
+def normalize_policy_evaluation_record_query(
+    *,
+    evaluation_status: str | None = None,
+    portfolio_id: str | None = None,
+    jurisdiction: str | None = None,
+    generated_after: datetime | None = None,
+    generated_before: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    policy_pack_id: str | None = None,
+) -> PolicyEvaluationRecordQuery:
+    after = _normalized_generated_bound(generated_after)
+    before = _normalized_generated_bound(generated_before)
+    if after is not None and before is not None and after >= before:
+        raise ProposalValidationError(_INVALID_GENERATED_WINDOW)
+    return PolicyEvaluationRecordQuery(
+        evaluation_status=_normalized_filter(evaluation_status),
+        portfolio_id=_normalized_filter(portfolio_id),
+        jurisdiction=_normalized_jurisdiction(jurisdiction),
+        generated_after=after,
+        generated_before=before,
+        limit=normalize_policy_evaluation_page_size(limit),
+        cursor=decode_policy_evaluation_record_cursor(cursor),
+        policy_pack_id=_normalized_filter(policy_pack_id),
+    )
+
+
+def normalize_policy_evaluation_page_size(limit: int | None) -> int:
+    if limit is None:
+        return POLICY_EVALUATION_DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ProposalValidationError(_INVALID_PAGE_SIZE)
+    return min(limit, POLICY_EVALUATION_MAX_PAGE_SIZE)
+
+
+def encode_policy_evaluation_record_cursor(record: PolicyEvaluationRecord) -> str:
+    payload = {"evaluation_id": record.evaluation_id, "generated_at": record.generated_at}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def decode_policy_evaluation_record_cursor(
+    cursor: str | None,
+) -> PolicyEvaluationRecordCursor | None:
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + ("=" * (-len(cursor) % 4))
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as exc:
+        raise ProposalValidationError(_INVALID_CURSOR) from exc
+    if not isinstance(payload, dict):
+        raise ProposalValidationError(_INVALID_CURSOR)
+    generated_at = payload.get("generated_at")
+    evaluation_id = payload.get("evaluation_id")
+    if not isinstance(generated_at, str) or not isinstance(evaluation_id, str):
+        raise ProposalValidationError(_INVALID_CURSOR)
+    if not generated_at.strip() or not evaluation_id.strip():
+        raise ProposalValidationError(_INVALID_CURSOR)
+    return PolicyEvaluationRecordCursor(generated_at=generated_at, evaluation_id=evaluation_id)
+
+
+def policy_evaluation_record_jurisdiction(record: PolicyEvaluationRecord) -> str | None:
+    applicability = record.evaluation_json.get("applicability")
+    if not isinstance(applicability, dict):
+        return None
+    selectors = applicability.get("matched_selectors")
+    if not isinstance(selectors, dict):
+        return None
+    jurisdiction = selectors.get("jurisdiction")
+    return jurisdiction if isinstance(jurisdiction, str) else None
+
+
+def page_policy_evaluation_records(
+    records: Iterable[PolicyEvaluationRecord], *, query: PolicyEvaluationRecordQuery
+) -> PolicyEvaluationRecordPage:
+    """Page records held in memory with the same semantics as the Postgres queue query."""
+    scoped = [record for record in records if _matches_scope(record, query=query)]
+    status_counts = dict(Counter(record.evaluation_status for record in scoped))
+    if query.evaluation_status:
+        matching = [
+            record for record in scoped if record.evaluation_status == query.evaluation_status
+        ]
+    else:
+        matching = scoped
+    matching.sort(key=_record_sort_key)
+    if query.cursor is not None:
+        position = (query.cursor.generated_at, query.cursor.evaluation_id)
+        after_cursor = [record for record in matching if _record_sort_key(record) > position]
+    else:
+        after_cursor = matching
+    page = after_cursor[: query.limit]
+    return PolicyEvaluationRecordPage(
+        items=[deepcopy(record) for record in page],
+        next_cursor=(
+            encode_policy_evaluation_record_cursor(page[-1])
+            if len(after_cursor) > query.limit and page
+            else None
+        ),
+        total_count=len(matching),
+        status_counts=dict(sorted(status_counts.items())),
+    )
+
+
+def _matches_scope(record: PolicyEvaluationRecord, *, query: PolicyEvaluationRecordQuery) -> bool:
+    # Status is deliberately not part of the scope: status_counts cover every status in scope.
+    if query.portfolio_id and record.portfolio_id != query.portfolio_id:
+        return False
+    if query.policy_pack_id and record.policy_pack_id != query.policy_pack_id:
+        return False
+    if query.jurisdiction and policy_evaluation_record_jurisdiction(record) != query.jurisdiction:
+        return False
+    if query.generated_after and record.generated_at < query.generated_after:
+        return False
+    return not (query.generated_before and record.generated_at >= query.generated_before)
+
+
+def _record_sort_key(record: PolicyEvaluationRecord) -> tuple[str, str]:
+    return record.generated_at, record.evaluation_id
+
+
+def _normalized_filter(value: str | None) -> str | None:
+    if value is None:
+        return None
+    normalized = value.strip()
+    return normalized or None
+
+
+def _normalized_jurisdiction(value: str | None) -> str | None:
+    normalized = _normalized_filter(value)
+    return normalized.upper() if normalized else None
+
+
+def _normalized_generated_bound(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+    aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    return aware.astimezone(UTC).isoformat()
+
+
+__all__ = [
+    "POLICY_EVALUATION_DEFAULT_PAGE_SIZE",
+    "POLICY_EVALUATION_MAX_PAGE_SIZE",
+    "PolicyEvaluationRecordCursor",
+    "PolicyEvaluationRecordPage",
+    "PolicyEvaluationRecordQuery",
+    "decode_policy_evaluation_record_cursor",
+    "encode_policy_evaluation_record_cursor",
+    "normalize_policy_evaluation_page_size",
+    "normalize_policy_evaluation_record_query",
+    "page_policy_evaluation_records",
+    "policy_evaluation_record_jurisdiction",
+]
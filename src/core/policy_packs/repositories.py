@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from src.core.policy_packs.catalog_models import (
@@ -10,6 +11,10 @@ from src.core.policy_packs.catalog_models import (
     PolicyPackValidationResponse,
 )
 from src.core.policy_packs.event_authority import PolicyEvaluationEventAuthority
+from src.core.policy_packs.persistence_batch import (
+    PolicyEvaluationFinalizeItem,
+    PolicyEvaluationFinalizeOutcome,
+)
 from src.core.policy_packs.persistence_models import (
     PolicyEvaluationAuditEvent,
     PolicyEvaluationEventType,
@@ -22,6 +27,10 @@ from src.core.policy_packs.projection_models import (
     PolicyEvaluationReviewQueueResponse,
     PolicyEvaluationSignOffPackageResponse,
 )
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+)
 
 
 class PolicyEvaluationRepository(Protocol):
@@ -39,6 +48,10 @@ class PolicyEvaluationRepository(Protocol):
         observed_trace_id: str | None = None,
     ) -> PolicyEvaluationPersistenceResult: ...
 
+    def finalize_policy_evaluation_records(
+        self, *, items: Sequence[PolicyEvaluationFinalizeItem]
+    ) -> list[PolicyEvaluationFinalizeOutcome]: ...
+
     def get_policy_evaluation_record(self, *, evaluation_id: str) -> PolicyEvaluationRecord: ...
 
     def list_policy_evaluation_records(
@@ -49,12 +62,20 @@ class PolicyEvaluationRepository(Protocol):
         self, *, evaluation_id: str
     ) -> list[PolicyEvaluationAuditEvent]: ...
 
+    def list_policy_evaluation_events_by_evaluation(
+        self, *, evaluation_ids: Sequence[str]
+    ) -> dict[str, list[PolicyEvaluationAuditEvent]]: ...
+
     def get_policy_evaluation_lineage(
         self, *, evaluation_id: str
     ) -> PolicyEvaluationLineageResponse: ...
 
+    def list_policy_evaluation_record_page(
+        self, *, query: PolicyEvaluationRecordQuery
+    ) -> PolicyEvaluationRecordPage: ...
+
     def get_policy_evaluation_review_queue(
-        self, *, evaluation_status: str | None, portfolio_id: str | None
+        self, *, query: PolicyEvaluationRecordQuery
     ) -> PolicyEvaluationReviewQueueResponse: ...
 
     def get_policy_evaluation_sign_off_package(
@@ -8,6 +8,7 @@ from src.core.proposals.models import (
     ProposalWorkflowEventRecord,
 )
 from src.core.proposals.repository import ProposalRepository
+from src.core.replay.service import PROPOSAL_VERSION_REPLAY_SECTIONS
 
 
 @dataclass(frozen=True)
@@ -65,7 +66,10 @@ def _load_succeeded_version(
     if result_version is not None:
         return result_version
 
-    return repository.get_current_version(proposal_id=proposal_id)
+    return repository.get_current_version_sections(
+        proposal_id=proposal_id,
+        sections=PROPOSAL_VERSION_REPLAY_SECTIONS,
+    )
 
 
 def _load_result_version(
@@ -78,9 +82,10 @@ def _load_result_version(
     if version_no is None:
         return None
 
-    return repository.get_version(
+    return repository.get_version_sections(
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=PROPOSAL_VERSION_REPLAY_SECTIONS,
     )
 
 
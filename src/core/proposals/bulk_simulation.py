@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from collections import Counter
+from typing import cast
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.portfolio_models import PortfolioSnapshot
+from src.core.proposal_request_models import ProposalSimulateRequest
+from src.core.proposal_result_models import ProposalResult
+from src.core.proposals.bulk_simulation_models import (
+    ProposalBulkSimulationRequest,
+    ProposalBulkSimulationResultSummary,
+    ProposalBulkSimulationSummary,
+    ProposalBulkSimulationTemplate,
+)
+from src.core.proposals.input_context_models import ProposalStatelessInput
+from src.core.proposals.input_request_models import ProposalSimulationRequest
+
+_INVALID_CURSOR = "PROPOSAL_BULK_SIMULATION_CURSOR_INVALID"
+_CURSOR_MISMATCH = "PROPOSAL_BULK_SIMULATION_CURSOR_MISMATCH"
+
+
+def bulk_simulation_fingerprint(
+    *,
+    request: ProposalBulkSimulationRequest,
+    idempotency_key: str,
+) -> str:
+    """Identify a bulk request independently of its resume cursor."""
+    return cast(
+        str,
+        hash_canonical_payload(
+            {
+                "idempotency_key": idempotency_key,
+                "request": request.model_dump(mode="json", exclude={"cursor"}),
+            }
+        ),
+    )
+
+
+def bulk_simulation_item_idempotency_key(*, idempotency_key: str, portfolio_id: str) -> str:
+    digest = hashlib.sha256(f"{idempotency_key}\x1f{portfolio_id}".encode("utf-8")).hexdigest()
+    return f"bulk_{digest[:40]}"
+
+
+def encode_bulk_simulation_cursor(*, fingerprint: str, next_sequence: int) -> str:
+    payload = {"fingerprint": fingerprint, "next_sequence": next_sequence}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def decode_bulk_simulation_cursor(
+    cursor: str | None,
+    *,
+    fingerprint: str,
+    portfolio_count: int,
+) -> int:
+    if cursor is None:
+        return 0
+    try:
+        padded = cursor + ("=" * (-len(cursor) % 4))
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError(_INVALID_CURSOR) from exc
+    if not isinstance(payload, dict):
+        raise ValueError(_INVALID_CURSOR)
+    next_sequence = payload.get("next_sequence")
+    if (
+        not isinstance(next_sequence, int)
+        or isinstance(next_sequence, bool)
+        or not 0 <= next_sequence <= portfolio_count
+    ):
+        raise ValueError(_INVALID_CURSOR)
+    if payload.get("fingerprint") != fingerprint:
+        raise ValueError(_CURSOR_MISMATCH)
+    return next_sequence
+
+
+def build_bulk_stateless_simulation_request(
+    *,
+    template: ProposalBulkSimulationTemplate,
+    portfolio_snapshot: PortfolioSnapshot,
+) -> ProposalSimulationRequest:
+    return ProposalSimulationRequest(
+        input_mode="stateless",
+        stateless_input=ProposalStatelessInput(
+            simulate_request=ProposalSimulateRequest(
+                portfolio_snapshot=portfolio_snapshot,
+                market_data_snapshot=template.market_data_snapshot,
+                shelf_entries=template.shelf_entries,
+                options=template.options,
+                proposed_cash_flows=template.proposed_cash_flows,
+                proposed_trades=template.proposed_trades,
+                reference_model=template.reference_model,
+            )
+        ),
+    )
+
+
+def apply_bulk_simulation_template(
+    simulate_request: ProposalSimulateRequest,
+    *,
+    template: ProposalBulkSimulationTemplate,
+) -> ProposalSimulateRequest:
+    """Overlay the campaign trades and cash flows onto a resolved stateful payload."""
+    return cast(
+        ProposalSimulateRequest,
+        simulate_request.model_copy(
+            update={
+                "proposed_trades": [trade.model_copy() for trade in template.proposed_trades],
+                "proposed_cash_flows": [flow.model_copy() for flow in template.proposed_cash_flows],
+            }
+        ),
+    )
+
+
+def summarize_bulk_simulation_result(
+    result: ProposalResult,
+) -> ProposalBulkSimulationResultSummary:
+    gate_decision = result.gate_decision
+    return ProposalBulkSimulationResultSummary(
+        proposal_run_id=result.proposal_run_id,
+        status=result.status,
+        gate=gate_decision.gate if gate_decision is not None else None,
+        recommended_next_step=(
+            gate_decision.recommended_next_step if gate_decision is not None else None
+        ),
+        failed_rule_ids=[rule.rule_id for rule in result.rule_results if rule.status == "FAIL"],
+        warnings=list(result.diagnostics.warnings),
+        before_total_value=result.before.total_value,
+        after_total_value=result.after_simulated.total_value,
+        request_hash=result.lineage.request_hash,
+    )
+
+
+class BulkSimulationProgress:
+    """Track emitted records that may arrive out of order and expose a gap-free resume cursor."""
+
+    def __init__(self, *, fingerprint: str, start_sequence: int, portfolio_count: int) -> None:
+        self._fingerprint = fingerprint
+        self._next_sequence = start_sequence
+        self._portfolio_count = portfolio_count
+        self._skipped_count = start_sequence
+        self._completed: set[int] = set()
+        self._status_counts: Counter[str] = Counter()
+        self._error_count = 0
+
+    def complete(self, sequence: int, *, status: str | None) -> str:
+        if status is None:
+            self._error_count += 1
+        else:
+            self._status_counts[status] += 1
+        self._completed.add(sequence)
+        while self._next_sequence in self._completed:
+            self._completed.remove(self._next_sequence)
+            self._next_sequence += 1
+        return self._cursor()
+
+    def summary(self) -> ProposalBulkSimulationSummary:
+        return ProposalBulkSimulationSummary(
+            portfolio_count=self._portfolio_count,
+            skipped_count=self._skipped_count,
+            status_counts=dict(sorted(self._status_counts.items())),
+            error_count=self._error_count,
+            cursor=self._cursor(),
+        )
+
+    def _cursor(self) -> str:
+        return encode_bulk_simulation_cursor(
+            fingerprint=self._fingerprint,
+            next_sequence=self._next_sequence,
+        )
+
+
+__all__ = [
+    "BulkSimulationProgress",
+    "apply_bulk_simulation_template",
+    "build_bulk_stateless_simulation_request",
+    "bulk_simulation_fingerprint",
+    "bulk_simulation_item_idempotency_key",
+    "decode_bulk_simulation_cursor",
+    "encode_bulk_simulation_cursor",
+    "summarize_bulk_simulation_result",
+]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from typing import List, Literal, Optional, cast
+
+from pydantic import BaseModel, Field, model_validator
+
+from src.core.engine_options_models import EngineOptions
+from src.core.portfolio_models import (
+    MarketDataSnapshot,
+    Money,
+    PortfolioSnapshot,
+    ReferenceModel,
+    ShelfEntry,
+)
+from src.core.proposal_request_models import ProposedCashFlow, ProposedTrade
+from src.core.proposals.input_context_models import ProposalStatefulInput
+
+PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS = 5000
+
+
+class ProposalBulkSimulationTemplate(BaseModel):
+    proposed_trades: List[ProposedTrade] = Field(
+        default_factory=list,
+        description="Manual security trades applied to every portfolio in the campaign.",
+        examples=[
+            [
+                {
+                    "intent_type": "SECURITY_TRADE",
+                    "side": "BUY",
+                    "instrument_id": "EQ_GROWTH",
+                    "quantity": "40",
+                }
+            ]
+        ],
+    )
+    proposed_cash_flows: List[ProposedCashFlow] = Field(
+        default_factory=list,
+        description="Cash flows applied to every portfolio in the campaign.",
+        examples=[[{"intent_type": "CASH_FLOW", "currency": "USD", "amount": "2000.00"}]],
+    )
+    market_data_snapshot: Optional[MarketDataSnapshot] = Field(
+        default=None,
+        description="Shared price and FX snapshot; required when any portfolio is stateless.",
+    )
+    shelf_entries: Optional[List[ShelfEntry]] = Field(
+        default=None,
+        description="Shared product shelf; required when any portfolio is stateless.",
+    )
+    options: EngineOptions = Field(
+        default_factory=lambda: EngineOptions(enable_proposal_simulation=True),
+        description="Shared engine options for stateless portfolios.",
+    )
+    reference_model: Optional[ReferenceModel] = Field(
+        default=None,
+        description="Optional shared reference model for stateless drift analytics.",
+    )
+
+
+class ProposalBulkSimulationPortfolio(BaseModel):
+    portfolio_snapshot: Optional[PortfolioSnapshot] = Field(
+        default=None,
+        description="Caller-supplied holdings for a stateless simulation.",
+    )
+    stateful_input: Optional[ProposalStatefulInput] = Field(
+        default=None,
+        description="Identifiers for authoritative Lotus Core context resolution.",
+        examples=[{"portfolio_id": "PB_SG_GLOBAL_BAL_001", "as_of": "2026-03-25"}],
+    )
+
+    @model_validator(mode="after")
+    def validate_exclusive_portfolio_source(self) -> "ProposalBulkSimulationPortfolio":
+        if (self.portfolio_snapshot is None) == (self.stateful_input is None):
+            raise ValueError(
+                "bulk portfolios require exactly one of portfolio_snapshot or stateful_input"
+            )
+        return self
+
+    @property
+    def portfolio_id(self) -> str:
+        if self.stateful_input is not None:
+            return self.stateful_input.portfolio_id
+        return cast(PortfolioSnapshot, self.portfolio_snapshot).portfolio_id
+
+
+class ProposalBulkSimulationRequest(BaseModel):
+    template: ProposalBulkSimulationTemplate = Field(
+        description="Trade and cash-flow template shared by every portfolio."
+    )
+    portfolios: List[ProposalBulkSimulationPortfolio] = Field(
+        min_length=1,
+        max_length=PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS,
+        description="Portfolios to simulate against the shared template.",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Resume cursor from a previous stream of the same request; portfolios before the "
+            "cursor are skipped."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_bulk_portfolios(self) -> "ProposalBulkSimulationRequest":
+        portfolio_ids = [portfolio.portfolio_id for portfolio in self.portfolios]
+        if len(set(portfolio_ids)) != len(portfolio_ids):
+            raise ValueError("bulk portfolios must have unique portfolio ids")
+        has_stateless = any(portfolio.portfolio_snapshot for portfolio in self.portfolios)
+        if has_stateless and (
+            self.template.market_data_snapshot is None or self.template.shelf_entries is None
+        ):
+            raise ValueError(
+                "stateless bulk portfolios require template market_data_snapshot and shelf_entries"
+            )
+        return self
+
+
+class ProposalBulkSimulationResultSummary(BaseModel):
+    proposal_run_id: str = Field(description="Proposal run identifier.")
+    status: Literal["READY", "BLOCKED", "PENDING_REVIEW"] = Field(
+        description="Proposal simulation status."
+    )
+    gate: Optional[str] = Field(default=None, description="Gate decision when evaluated.")
+    recommended_next_step: Optional[str] = Field(
+        default=None,
+        description="Gate recommended next step when evaluated.",
+    )
+    failed_rule_ids: List[str] = Field(
+        default_factory=list,
+        description="Rule ids that failed for this portfolio.",
+    )
+    warnings: List[str] = Field(default_factory=list, description="Run-level warning codes.")
+    before_total_value: Money = Field(description="Before-state total value.")
+    after_total_value: Money = Field(description="After-state total value.")
+    request_hash: str = Field(description="Canonical request hash for replay lookups.")
+
+
+class ProposalBulkSimulationItemError(BaseModel):
+    status_code: int = Field(description="HTTP status the single-portfolio route would return.")
+    detail: str = Field(description="Support-safe error detail.")
+
+
+class ProposalBulkSimulationItemRecord(BaseModel):
+    record_type: Literal["RESULT", "ERROR"] = Field(description="Stream record discriminator.")
+    sequence: int = Field(description="Zero-based position of the portfolio in the request.")
+    portfolio_id: str = Field(description="Portfolio identifier.")
+    idempotency_key: str = Field(description="Derived per-portfolio idempotency key.")
+    result: Optional[ProposalBulkSimulationResultSummary] = Field(
+        default=None,
+        description="Proposal result summary for successful simulations.",
+    )
+    error: Optional[ProposalBulkSimulationItemError] = Field(
+        default=None,
+        description="Isolated failure for this portfolio; other portfolios continue.",
+    )
+    cursor: str = Field(
+        description=(
+            "Resume cursor covering every portfolio that has completed so far without gaps."
+        )
+    )
+
+
+class ProposalBulkSimulationSummary(BaseModel):
+    record_type: Literal["SUMMARY"] = Field(
+        default="SUMMARY",
+        description="Stream record discriminator.",
+    )
+    portfolio_count: int = Field(description="Portfolios in the request.")
+    skipped_count: int = Field(description="Portfolios skipped because of the resume cursor.")
+    status_counts: dict[str, int] = Field(description="Simulated portfolios by proposal status.")
+    error_count: int = Field(description="Portfolios that failed with an isolated error.")
+    cursor: str = Field(description="Final cursor; resuming with it simulates nothing.")
+
+
+__all__ = [
+    "PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS",
+    "ProposalBulkSimulationItemError",
+    "ProposalBulkSimulationItemRecord",
+    "ProposalBulkSimulationPortfolio",
+    "ProposalBulkSimulationRequest",
+    "ProposalBulkSimulationResultSummary",
+    "ProposalBulkSimulationSummary",
+    "ProposalBulkSimulationTemplate",
+]
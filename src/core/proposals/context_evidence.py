@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from src.core.advisory.policy_context import build_advisory_policy_context
+from src.core.common.serialization_memo import dump_model_json
 from src.core.proposals.context_resolution import (
     ResolvedProposalContext,
     ResolvedSimulationContext,
@@ -16,7 +17,7 @@ def build_context_resolution_evidence(
         "input_mode": resolved.input_mode,
         "resolution_source": resolved.resolution_source,
         "used_legacy_contract": resolved.used_legacy_contract,
-        "resolved_context": resolved.resolved_context.model_dump(mode="json"),
+        "resolved_context": dump_model_json(resolved.resolved_context),
         "advisory_policy_context": build_advisory_policy_context(
             input_mode=resolved.input_mode,
             resolution_source=resolved.resolution_source,
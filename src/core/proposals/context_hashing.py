@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, cast
 
 from src.core.common.canonical import hash_canonical_payload
+from src.core.common.serialization_memo import dump_model_json
 from src.core.proposals.context_resolution import (
     ResolvedProposalContext,
     ResolvedSimulationContext,
@@ -31,12 +32,12 @@ def canonicalize_create_request_payload(
 ) -> dict[str, Any]:
     return {
         "created_by": payload.created_by,
-        "metadata": resolved.metadata.model_dump(mode="json"),
+        "metadata": dump_model_json(resolved.metadata),
         "advisory_context": {
             "input_mode": resolved.input_mode,
             "resolution_source": resolved.resolution_source,
-            "resolved_context": resolved.resolved_context.model_dump(mode="json"),
-            "simulate_request": resolved.simulate_request.model_dump(mode="json"),
+            "resolved_context": dump_model_json(resolved.resolved_context),
+            "simulate_request": dump_model_json(resolved.simulate_request),
         },
     }
 
@@ -62,8 +63,8 @@ def canonicalize_simulation_request_payload(
         "advisory_context": {
             "input_mode": resolved.input_mode,
             "resolution_source": resolved.resolution_source,
-            "resolved_context": resolved.resolved_context.model_dump(mode="json"),
-            "simulate_request": resolved.simulate_request.model_dump(mode="json"),
+            "resolved_context": dump_model_json(resolved.resolved_context),
+            "simulate_request": dump_model_json(resolved.simulate_request),
         }
     }
 
@@ -86,8 +87,8 @@ def canonicalize_version_request_payload(
         "advisory_context": {
             "input_mode": resolved.input_mode,
             "resolution_source": resolved.resolution_source,
-            "resolved_context": resolved.resolved_context.model_dump(mode="json"),
-            "simulate_request": resolved.simulate_request.model_dump(mode="json"),
+            "resolved_context": dump_model_json(resolved.resolved_context),
+            "simulate_request": dump_model_json(resolved.simulate_request),
         },
     }
 
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import cast
 
 from src.core.advisory.policy_context import ProposalPolicySelectors
+from src.core.common.serialization_memo import seal_request_models
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposals.context_ports import (
     ProposalStatefulContextResolutionUnavailableError,
@@ -35,6 +36,9 @@ class ResolvedProposalContext:
     policy_selectors: ProposalPolicySelectors
     used_legacy_contract: bool
 
+    def __post_init__(self) -> None:
+        seal_request_models(self.simulate_request, self.resolved_context, self.metadata)
+
 
 @dataclass(frozen=True)
 class ResolvedSimulationContext:
@@ -45,6 +49,9 @@ class ResolvedSimulationContext:
     policy_selectors: ProposalPolicySelectors
     used_legacy_contract: bool
 
+    def __post_init__(self) -> None:
+        seal_request_models(self.simulate_request, self.resolved_context)
+
 
 def resolve_create_request(payload: ProposalCreateRequest) -> ResolvedProposalContext:
     if payload.input_mode == "stateful":
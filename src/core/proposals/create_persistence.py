@@ -1,3 +1,6 @@
+from src.core.proposals.memo_materialization import (
+    schedule_memo_evidence_pack_materialization,
+)
 from src.core.proposals.models import (
     ProposalRecord,
     ProposalVersionRecord,
@@ -19,6 +22,7 @@ def persist_created_proposal(
         event=command_state.created_event,
         idempotency=command_state.idempotency_record,
     )
+    schedule_memo_evidence_pack_materialization(repository=repository, version=version)
 
 
 def persist_created_proposal_version(
@@ -36,3 +40,4 @@ def persist_created_proposal_version(
         expected_current_state=event.from_state,
         expected_current_version_no=version.version_no - 1,
     )
+    schedule_memo_evidence_pack_materialization(repository=repository, version=version)
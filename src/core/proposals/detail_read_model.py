@@ -1,6 +1,12 @@
+from collections.abc import Collection
 from dataclasses import dataclass
 
-from src.core.proposals.models import ProposalRecord, ProposalVersionRecord
+from src.core.proposals.models import (
+    PROPOSAL_VERSION_PAYLOAD_SECTIONS,
+    ProposalRecord,
+    ProposalVersionPayloadSection,
+    ProposalVersionRecord,
+)
 from src.core.proposals.repository import ProposalRepository
 
 
@@ -14,6 +20,7 @@ def load_proposal_detail_read_model(
     *,
     repository: ProposalRepository,
     proposal_id: str,
+    sections: Collection[ProposalVersionPayloadSection] = PROPOSAL_VERSION_PAYLOAD_SECTIONS,
 ) -> ProposalDetailReadModel:
     proposal = repository.get_proposal(proposal_id=proposal_id)
     if proposal is None:
@@ -21,5 +28,8 @@ def load_proposal_detail_read_model(
 
     return ProposalDetailReadModel(
         proposal=proposal,
-        current_version=repository.get_current_version(proposal_id=proposal_id),
+        current_version=repository.get_current_version_sections(
+            proposal_id=proposal_id,
+            sections=sections,
+        ),
     )
@@ -0,0 +1,98 @@
+"""Durability policy for proposal audit events and the lifecycle of write-behind journals.
+
+Each event family is either ``synchronous`` (committed before the command returns) or
+``write_behind`` (buffered in-process and committed in batches by a repository-owned journal).
+Governed lifecycle events are always synchronous. A journal registers itself here when it starts
+so the application can flush every journal at shutdown without knowing the storage adapter.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
+from typing import Literal, Mapping, Protocol
+
+from src.core.proposals.memo_persistence_models import ProposalMemoEventType
+
+EventDurability = Literal["synchronous", "write_behind"]
+EventJournalOutcome = Literal["queued", "inline", "flushed", "failed"]
+
+MEMO_EVENT_JOURNAL_FAMILY = "memo_event"
+
+MEMO_EVENT_DURABILITY: Mapping[ProposalMemoEventType, EventDurability] = MappingProxyType(
+    {
+        "MEMO_DRAFT_CREATED": "synchronous",
+        "MEMO_FINALIZED": "synchronous",
+        "MEMO_REVIEW_RECORDED": "synchronous",
+        "MEMO_ARCHIVE_RECORDED": "synchronous",
+        "MEMO_REPORT_PACKAGE_RECORDED": "write_behind",
+        "MEMO_AI_REFERENCE_RECORDED": "write_behind",
+    }
+)
+
+
+@dataclass(frozen=True)
+class EventJournalSettings:
+    max_pending: int
+    batch_size: int
+    flush_interval_seconds: float
+
+
+class EventJournal(Protocol):
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class EventJournalObserver(Protocol):
+    def __call__(self, *, family: str, outcome: EventJournalOutcome, count: int) -> None: ...
+
+
+_JOURNALS_LOCK = Lock()
+_JOURNALS: list[EventJournal] = []
+_OBSERVER: EventJournalObserver | None = None
+
+
+def memo_event_durability(event_type: ProposalMemoEventType) -> EventDurability:
+    return MEMO_EVENT_DURABILITY.get(event_type, "synchronous")
+
+
+def register_event_journal(journal: EventJournal) -> None:
+    with _JOURNALS_LOCK:
+        _JOURNALS.append(journal)
+
+
+def close_event_journals() -> None:
+    """Flush and stop every registered journal; events submitted afterwards are written inline."""
+    with _JOURNALS_LOCK:
+        journals = list(_JOURNALS)
+        _JOURNALS.clear()
+    for journal in journals:
+        journal.close()
+
+
+def configure_event_journal_observer(observer: EventJournalObserver | None) -> None:
+    global _OBSERVER
+    _OBSERVER = observer
+
+
+def observe_event_journal(*, family: str, outcome: EventJournalOutcome, count: int = 1) -> None:
+    if _OBSERVER is not None and count > 0:
+        _OBSERVER(family=family, outcome=outcome, count=count)
+
+
+__all__ = [
+    "MEMO_EVENT_DURABILITY",
+    "MEMO_EVENT_JOURNAL_FAMILY",
+    "EventDurability",
+    "EventJournal",
+    "EventJournalObserver",
+    "EventJournalOutcome",
+    "EventJournalSettings",
+    "close_event_journals",
+    "configure_event_journal_observer",
+    "memo_event_durability",
+    "observe_event_journal",
+    "register_event_journal",
+]
@@ -0,0 +1,290 @@
+"""Bulk import of historical proposals from NDJSON.
+
+Each line holds one proposal with all of its versions, workflow events and approvals. Lines are
+validated on their own first: identities must point at the same proposal, version numbers must run
+from 1 to ``current_version_no``, and the stored simulation and artifact hashes must match the
+payloads they describe. Valid lines are grouped into batches. The repository stages each batch,
+checks it against stored history as a set, and merges it in one transaction. A proposal whose
+rows conflict with stored rows is rejected as a whole and reported once, under the first conflict
+reason in code order. Rows that are already stored unchanged are skipped, so re-running an
+import is safe.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.proposals.exceptions import ProposalValidationError
+from src.core.proposals.models import (
+    ProposalApprovalRecordData,
+    ProposalRecord,
+    ProposalVersionRecord,
+    ProposalWorkflowEventRecord,
+)
+from src.core.proposals.versions import SIMULATION_HASH_EXCLUDED_KEYS
+
+DEFAULT_PROPOSAL_HISTORY_IMPORT_BATCH_SIZE = 500
+PROPOSAL_HISTORY_IMPORT_MAX_BATCH_SIZE = 5000
+MAX_REPORTED_PROPOSAL_HISTORY_REJECTIONS = 1000
+
+
+class ProposalHistoryImportRecord(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    proposal: ProposalRecord
+    versions: list[ProposalVersionRecord] = Field(min_length=1)
+    workflow_events: list[ProposalWorkflowEventRecord] = Field(default_factory=list)
+    approvals: list[ProposalApprovalRecordData] = Field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ProposalHistoryImportConflict:
+    proposal_id: str
+    reason_code: str
+
+
+@dataclass(frozen=True)
+class ProposalHistoryImportBatchResult:
+    proposals_imported: int = 0
+    versions_imported: int = 0
+    workflow_events_imported: int = 0
+    approvals_imported: int = 0
+    conflicts: tuple[ProposalHistoryImportConflict, ...] = ()
+
+
+@dataclass(frozen=True)
+class ProposalHistoryImportRejection:
+    line_no: int
+    proposal_id: str | None
+    reason_code: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "line_no": self.line_no,
+            "proposal_id": self.proposal_id,
+            "reason_code": self.reason_code,
+        }
+
+
+@dataclass
+class ProposalHistoryImportReport:
+    lines_read: int = 0
+    batches: int = 0
+    proposals_staged: int = 0
+    proposals_imported: int = 0
+    proposals_unchanged: int = 0
+    versions_imported: int = 0
+    workflow_events_imported: int = 0
+    approvals_imported: int = 0
+    elapsed_seconds: float = 0.0
+    rejection_counts: Counter[str] = field(default_factory=Counter)
+    rejections: list[ProposalHistoryImportRejection] = field(default_factory=list)
+
+    def reject(self, rejection: ProposalHistoryImportRejection) -> None:
+        self.rejection_counts[rejection.reason_code] += 1
+        if len(self.rejections) < MAX_REPORTED_PROPOSAL_HISTORY_REJECTIONS:
+            self.rejections.append(rejection)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lines_read": self.lines_read,
+            "batches": self.batches,
+            "proposals_staged": self.proposals_staged,
+            "proposals_imported": self.proposals_imported,
+            "proposals_unchanged": self.proposals_unchanged,
+            "proposals_rejected": sum(self.rejection_counts.values()),
+            "versions_imported": self.versions_imported,
+            "workflow_events_imported": self.workflow_events_imported,
+            "approvals_imported": self.approvals_imported,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "versions_per_minute": (
+                round(self.versions_imported * 60 / self.elapsed_seconds, 1)
+                if self.elapsed_seconds > 0
+                else 0.0
+            ),
+            "rejection_counts": dict(sorted(self.rejection_counts.items())),
+            "rejections": [rejection.to_dict() for rejection in self.rejections],
+        }
+
+
+class ProposalHistoryImportRepository(Protocol):
+    def import_proposal_history_batch(
+        self, records: Sequence[ProposalHistoryImportRecord]
+    ) -> ProposalHistoryImportBatchResult: ...
+
+
+def validate_proposal_history_record(record: ProposalHistoryImportRecord) -> None:
+    proposal = record.proposal
+    proposal_id = proposal.proposal_id
+    version_nos = sorted(version.version_no for version in record.versions)
+    if any(version.proposal_id != proposal_id for version in record.versions):
+        raise ProposalValidationError("PROPOSAL_HISTORY_VERSION_PROPOSAL_MISMATCH")
+    if version_nos != list(range(1, proposal.current_version_no + 1)):
+        raise ProposalValidationError("PROPOSAL_HISTORY_VERSION_SEQUENCE_INVALID")
+    for version in record.versions:
+        _validate_version_hashes(version)
+    known_versions = set(version_nos)
+    for event in record.workflow_events:
+        if event.proposal_id != proposal_id:
+            raise ProposalValidationError("PROPOSAL_HISTORY_EVENT_PROPOSAL_MISMATCH")
+        if event.related_version_no is not None and event.related_version_no not in known_versions:
+            raise ProposalValidationError("PROPOSAL_HISTORY_EVENT_VERSION_UNKNOWN")
+    for approval in record.approvals:
+        if approval.proposal_id != proposal_id:
+            raise ProposalValidationError("PROPOSAL_HISTORY_APPROVAL_PROPOSAL_MISMATCH")
+        if (
+            approval.related_version_no is not None
+            and approval.related_version_no not in known_versions
+        ):
+            raise ProposalValidationError("PROPOSAL_HISTORY_APPROVAL_VERSION_UNKNOWN")
+    if len({event.event_id for event in record.workflow_events}) != len(record.workflow_events):
+        raise ProposalValidationError("PROPOSAL_HISTORY_DUPLICATE_EVENT_ID")
+    if len({approval.approval_id for approval in record.approvals}) != len(record.approvals):
+        raise ProposalValidationError("PROPOSAL_HISTORY_DUPLICATE_APPROVAL_ID")
+    if record.workflow_events:
+        latest = max(record.workflow_events, key=lambda event: (event.occurred_at, event.event_id))
+        if latest.to_state != proposal.current_state:
+            raise ProposalValidationError("PROPOSAL_HISTORY_STATE_MISMATCH")
+
+
+def import_proposal_history_ndjson(
+    *,
+    lines: Iterable[str | bytes],
+    repository: ProposalHistoryImportRepository,
+    batch_size: int = DEFAULT_PROPOSAL_HISTORY_IMPORT_BATCH_SIZE,
+    on_batch: Callable[[ProposalHistoryImportReport], None] | None = None,
+) -> ProposalHistoryImportReport:
+    """Stream NDJSON proposal history into the repository and report what was merged."""
+    if not 1 <= batch_size <= PROPOSAL_HISTORY_IMPORT_MAX_BATCH_SIZE:
+        raise ProposalValidationError("PROPOSAL_HISTORY_IMPORT_BATCH_SIZE_INVALID")
+    report = ProposalHistoryImportReport()
+    started_at = time.perf_counter()
+    batch: dict[str, tuple[int, ProposalHistoryImportRecord]] = {}
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        report.lines_read += 1
+        record = _parse_line(line, line_no=line_no, report=report)
+        if record is None:
+            continue
+        proposal_id = record.proposal.proposal_id
+        if proposal_id in batch:
+            report.reject(
+                ProposalHistoryImportRejection(
+                    line_no=line_no,
+                    proposal_id=proposal_id,
+                    reason_code="PROPOSAL_HISTORY_DUPLICATE_PROPOSAL",
+                )
+            )
+            continue
+        batch[proposal_id] = (line_no, record)
+        if len(batch) >= batch_size:
+            _import_batch(batch, repository=repository, report=report)
+            batch = {}
+            _report_progress(report, started_at=started_at, on_batch=on_batch)
+    if batch:
+        _import_batch(batch, repository=repository, report=report)
+        _report_progress(report, started_at=started_at, on_batch=on_batch)
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+def _validate_version_hashes(version: ProposalVersionRecord) -> None:
+    simulation_hash = hash_canonical_payload(
+        version.proposal_result_json,
+        exclude=SIMULATION_HASH_EXCLUDED_KEYS,
+    )
+    if simulation_hash != version.simulation_hash:
+        raise ProposalValidationError("PROPOSAL_HISTORY_SIMULATION_HASH_MISMATCH")
+    evidence_bundle = version.artifact_json.get("evidence_bundle")
+    hashes = evidence_bundle.get("hashes") if isinstance(evidence_bundle, dict) else None
+    if not isinstance(hashes, dict) or hashes.get("artifact_hash") != version.artifact_hash:
+        raise ProposalValidationError("PROPOSAL_HISTORY_ARTIFACT_HASH_MISMATCH")
+
+
+def _parse_line(
+    line: str | bytes, *, line_no: int, report: ProposalHistoryImportReport
+) -> ProposalHistoryImportRecord | None:
+    try:
+        record: ProposalHistoryImportRecord = ProposalHistoryImportRecord.model_validate_json(line)
+    except ValidationError:
+        report.reject(
+            ProposalHistoryImportRejection(
+                line_no=line_no, proposal_id=None, reason_code="PROPOSAL_HISTORY_RECORD_INVALID"
+            )
+        )
+        return None
+    try:
+        validate_proposal_history_record(record)
+    except ProposalValidationError as exc:
+        report.reject(
+            ProposalHistoryImportRejection(
+                line_no=line_no, proposal_id=record.proposal.proposal_id, reason_code=str(exc)
+            )
+        )
+        return None
+    return record
+
+
+def _import_batch(
+    batch: dict[str, tuple[int, ProposalHistoryImportRecord]],
+    *,
+    repository: ProposalHistoryImportRepository,
+    report: ProposalHistoryImportReport,
+) -> None:
+    result = repository.import_proposal_history_batch([record for _, record in batch.values()])
+    conflicted: set[str] = set()
+    for conflict in sorted(
+        result.conflicts,
+        key=lambda item: (batch[item.proposal_id][0], item.reason_code),
+    ):
+        if conflict.proposal_id in conflicted:
+            continue
+        conflicted.add(conflict.proposal_id)
+        report.reject(
+            ProposalHistoryImportRejection(
+                line_no=batch[conflict.proposal_id][0],
+                proposal_id=conflict.proposal_id,
+                reason_code=conflict.reason_code,
+            )
+        )
+    report.batches += 1
+    report.proposals_staged += len(batch)
+    report.proposals_imported += result.proposals_imported
+    report.proposals_unchanged += len(batch) - len(conflicted) - result.proposals_imported
+    report.versions_imported += result.versions_imported
+    report.workflow_events_imported += result.workflow_events_imported
+    report.approvals_imported += result.approvals_imported
+
+
+def _report_progress(
+    report: ProposalHistoryImportReport,
+    *,
+    started_at: float,
+    on_batch: Callable[[ProposalHistoryImportReport], None] | None,
+) -> None:
+    report.elapsed_seconds = time.perf_counter() - started_at
+    if on_batch is not None:
+        on_batch(report)
+
+
+__all__ = [
+    "DEFAULT_PROPOSAL_HISTORY_IMPORT_BATCH_SIZE",
+    "MAX_REPORTED_PROPOSAL_HISTORY_REJECTIONS",
+    "PROPOSAL_HISTORY_IMPORT_MAX_BATCH_SIZE",
+    "ProposalHistoryImportBatchResult",
+    "ProposalHistoryImportConflict",
+    "ProposalHistoryImportRecord",
+    "ProposalHistoryImportRejection",
+    "ProposalHistoryImportReport",
+    "ProposalHistoryImportRepository",
+    "import_proposal_history_ndjson",
+    "validate_proposal_history_record",
+]
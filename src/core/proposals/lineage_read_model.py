@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 
-from src.core.proposals.models import ProposalRecord, ProposalVersionRecord
+from src.core.proposals.models import ProposalRecord, ProposalVersionHeaderRecord
 from src.core.proposals.repository import ProposalRepository
 
 
 @dataclass(frozen=True)
 class ProposalLineageReadModel:
     proposal: ProposalRecord | None
-    versions_by_number: dict[int, ProposalVersionRecord | None]
+    versions_by_number: dict[int, ProposalVersionHeaderRecord | None]
 
 
 def load_proposal_lineage_read_model(
@@ -23,6 +23,6 @@ def load_proposal_lineage_read_model(
         proposal=proposal,
         versions_by_number={
             version.version_no: version
-            for version in repository.list_versions(proposal_id=proposal_id)
+            for version in repository.list_version_headers(proposal_id=proposal_id)
         },
     )
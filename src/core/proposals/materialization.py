@@ -4,6 +4,7 @@ from typing import Any
 
 from src.core.advisory.artifact import build_proposal_artifact
 from src.core.advisory.artifact_models import ProposalArtifact
+from src.core.common.cpu_offload import run_cpu_bound
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposal_result_models import ProposalResult
 from src.core.proposals.evidence import build_proposal_evidence_bundle
@@ -23,6 +24,27 @@ def build_proposal_version_materialization(
     context_resolution: dict[str, Any],
     context_resolution_override: dict[str, Any] | None = None,
     replay_lineage: dict[str, Any] | None = None,
+) -> ProposalVersionMaterialization:
+    return run_cpu_bound(
+        "proposal_materialization",
+        _materialize_proposal_version,
+        request=request,
+        proposal_result=proposal_result,
+        created_at=created_at,
+        context_resolution=context_resolution,
+        context_resolution_override=context_resolution_override,
+        replay_lineage=replay_lineage,
+    )
+
+
+def _materialize_proposal_version(
+    *,
+    request: ProposalSimulateRequest,
+    proposal_result: ProposalResult,
+    created_at: datetime,
+    context_resolution: dict[str, Any],
+    context_resolution_override: dict[str, Any] | None,
+    replay_lineage: dict[str, Any] | None,
 ) -> ProposalVersionMaterialization:
     artifact = build_proposal_artifact(
         request=request,
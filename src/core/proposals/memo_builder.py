@@ -23,6 +23,9 @@ from src.core.proposals.memo_section_groups import (
 )
 
 _MEMO_VERSION = "advisory-proposal-memo-evidence-pack.v1"
+# Stored with materialized packs. Bump the builder suffix whenever pack content changes for the
+# same inputs, so packs built by an older release are ignored instead of reused.
+MEMO_EVIDENCE_PACK_BUILDER_VERSION = f"{_MEMO_VERSION}+builder.1"
 
 
 def build_advisory_proposal_memo_evidence_pack(
@@ -43,8 +46,8 @@ def build_advisory_proposal_memo_evidence_pack(
         "proposal_id": proposal_id,
         "proposal_version_no": proposal_version_no,
         "proposal_version_id": proposal_version_id,
-        "artifact": deepcopy(artifact_json),
-        "evidence_bundle": deepcopy(evidence_bundle),
+        "artifact": artifact_json,
+        "evidence_bundle": evidence_bundle,
     }
     source_input_hash = hash_canonical_payload(memo_input)
     source_manifest = _build_source_authority_manifest(evidence_bundle)
@@ -0,0 +1,252 @@
+"""Optional eager materialization of memo evidence packs after proposal version creation.
+
+The memo evidence pack is a pure projection over the artifact and evidence bundle stored on a
+proposal version, so it can be built as soon as the version exists. When
+``PROPOSAL_MEMO_MATERIALIZATION_WORKERS`` is positive, version creation queues that build on a
+background thread pool and stores the pack keyed by its ``source_input_hash``. Memo creation then
+loads the stored pack instead of building it, and memo replay reuses its evidence-bundle hash. The
+default of ``0`` keeps memo evidence packs on demand and skips the lookup. A missing or mismatched
+pack, including one from another builder version, always falls back to the on-demand build, so
+materialization never changes memo content.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime, timezone
+from threading import BoundedSemaphore, Lock
+from typing import Literal, Protocol
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.common.cpu_offload import run_cpu_bound
+from src.core.proposals.memo_builder import (
+    MEMO_EVIDENCE_PACK_BUILDER_VERSION,
+    build_advisory_proposal_memo_evidence_pack,
+)
+from src.core.proposals.memo_models import AdvisoryProposalMemoEvidencePack
+from src.core.proposals.models import ProposalMemoEvidencePackRecord, ProposalVersionRecord
+from src.core.proposals.repository import ProposalRepository
+
+PROPOSAL_MEMO_MATERIALIZATION_WORKERS_ENV = "PROPOSAL_MEMO_MATERIALIZATION_WORKERS"
+DEFAULT_PROPOSAL_MEMO_MATERIALIZATION_WORKERS = 0
+MEMO_MATERIALIZATION_PENDING_PER_WORKER = 32
+
+MemoMaterializationEvent = Literal["materialization", "lookup"]
+MemoMaterializationOutcome = Literal[
+    "materialized",
+    "skipped_backlog",
+    "failed",
+    "hit",
+    "miss",
+    "stale",
+]
+
+
+class MemoMaterializationObserver(Protocol):
+    def __call__(
+        self, *, event: MemoMaterializationEvent, outcome: MemoMaterializationOutcome
+    ) -> None: ...
+
+
+class _MemoMaterializer:
+    def __init__(self, *, workers: int) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="memo-materialization"
+        )
+        self.pending = BoundedSemaphore(workers * MEMO_MATERIALIZATION_PENDING_PER_WORKER)
+
+
+logger = logging.getLogger(__name__)
+
+_MATERIALIZER_LOCK = Lock()
+_MATERIALIZER: _MemoMaterializer | None = None
+_OBSERVER: MemoMaterializationObserver | None = None
+
+
+def memo_materialization_workers() -> int:
+    raw_value = os.getenv(PROPOSAL_MEMO_MATERIALIZATION_WORKERS_ENV)
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_PROPOSAL_MEMO_MATERIALIZATION_WORKERS
+    try:
+        workers = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("PROPOSAL_MEMO_MATERIALIZATION_WORKERS_INVALID") from exc
+    if workers < 0:
+        raise RuntimeError("PROPOSAL_MEMO_MATERIALIZATION_WORKERS_INVALID")
+    return workers
+
+
+def build_memo_evidence_pack_for_version(
+    version: ProposalVersionRecord,
+) -> AdvisoryProposalMemoEvidencePack:
+    return run_cpu_bound(
+        "memo_evidence_pack",
+        build_advisory_proposal_memo_evidence_pack,
+        proposal_id=version.proposal_id,
+        proposal_version_no=version.version_no,
+        proposal_version_id=version.proposal_version_id,
+        artifact_json=deepcopy(version.artifact_json),
+        evidence_bundle=deepcopy(version.evidence_bundle_json),
+    )
+
+
+def materialize_memo_evidence_pack(
+    *,
+    repository: ProposalRepository,
+    version: ProposalVersionRecord,
+    materialized_at: datetime | None = None,
+) -> ProposalMemoEvidencePackRecord:
+    """Build the memo evidence pack of a proposal version and store it."""
+    pack = build_memo_evidence_pack_for_version(version)
+    record = ProposalMemoEvidencePackRecord(
+        source_input_hash=pack.source_input_hash,
+        proposal_id=version.proposal_id,
+        proposal_version_no=version.version_no,
+        proposal_version_id=version.proposal_version_id,
+        artifact_hash=version.artifact_hash,
+        simulation_hash=version.simulation_hash,
+        evidence_bundle_hash=hash_canonical_payload(version.evidence_bundle_json),
+        memo_hash=pack.memo_hash,
+        builder_version=MEMO_EVIDENCE_PACK_BUILDER_VERSION,
+        pack_json=pack.model_dump(mode="json"),
+        materialized_at=materialized_at or datetime.now(timezone.utc),
+    )
+    repository.save_memo_evidence_pack(record)
+    return record
+
+
+def load_materialized_memo_evidence_pack(
+    *, repository: ProposalRepository, version: ProposalVersionRecord
+) -> ProposalMemoEvidencePackRecord | None:
+    """Return the stored pack for a version, or None when it is absent or was built elsewhere.
+
+    Nothing is read while materialization is disabled, and a pack from another builder version
+    counts as stale.
+    """
+    if memo_materialization_workers() == 0:
+        return None
+    record = repository.get_memo_evidence_pack(
+        proposal_id=version.proposal_id,
+        proposal_version_no=version.version_no,
+    )
+    if record is None:
+        _observe(event="lookup", outcome="miss")
+        return None
+    if (
+        record.proposal_version_id != version.proposal_version_id
+        or record.artifact_hash != version.artifact_hash
+        or record.simulation_hash != version.simulation_hash
+        or record.builder_version != MEMO_EVIDENCE_PACK_BUILDER_VERSION
+    ):
+        _observe(event="lookup", outcome="stale")
+        return None
+    _observe(event="lookup", outcome="hit")
+    return record
+
+
+def schedule_memo_evidence_pack_materialization(
+    *, repository: ProposalRepository, version: ProposalVersionRecord
+) -> bool:
+    """Queue materialization for a newly created version; return False when it was not queued.
+
+    A full backlog skips the version instead of blocking version creation; its memo is then built
+    on demand.
+    """
+    materializer = _resolve_materializer()
+    if materializer is None:
+        return False
+    if not materializer.pending.acquire(blocking=False):
+        _observe(event="materialization", outcome="skipped_backlog")
+        return False
+    context = contextvars.copy_context()
+    try:
+        materializer.executor.submit(
+            context.run, _materialize_in_background, materializer, repository, version
+        )
+    except RuntimeError:
+        materializer.pending.release()
+        return False
+    return True
+
+
+def configure_memo_materialization_observer(
+    observer: MemoMaterializationObserver | None,
+) -> None:
+    global _OBSERVER
+    _OBSERVER = observer
+
+
+def shutdown_memo_evidence_pack_materializer() -> None:
+    """Stop the pool, finishing running builds and dropping queued ones."""
+    global _MATERIALIZER
+    with _MATERIALIZER_LOCK:
+        materializer, _MATERIALIZER = _MATERIALIZER, None
+    if materializer is not None:
+        materializer.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def reset_memo_materialization_for_tests() -> None:
+    shutdown_memo_evidence_pack_materializer()
+
+
+def _resolve_materializer() -> _MemoMaterializer | None:
+    global _MATERIALIZER
+    if _MATERIALIZER is not None:
+        return _MATERIALIZER
+    workers = memo_materialization_workers()
+    if workers == 0:
+        return None
+    with _MATERIALIZER_LOCK:
+        if _MATERIALIZER is None:
+            _MATERIALIZER = _MemoMaterializer(workers=workers)
+        return _MATERIALIZER
+
+
+def _materialize_in_background(
+    materializer: _MemoMaterializer,
+    repository: ProposalRepository,
+    version: ProposalVersionRecord,
+) -> None:
+    try:
+        materialize_memo_evidence_pack(repository=repository, version=version)
+    except Exception:
+        logger.warning(
+            "Memo evidence-pack materialization failed",
+            extra={
+                "proposal_id": version.proposal_id,
+                "proposal_version_no": version.version_no,
+            },
+            exc_info=True,
+        )
+        _observe(event="materialization", outcome="failed")
+    else:
+        _observe(event="materialization", outcome="materialized")
+    finally:
+        materializer.pending.release()
+
+
+def _observe(*, event: MemoMaterializationEvent, outcome: MemoMaterializationOutcome) -> None:
+    if _OBSERVER is not None:
+        _OBSERVER(event=event, outcome=outcome)
+
+
+__all__ = [
+    "DEFAULT_PROPOSAL_MEMO_MATERIALIZATION_WORKERS",
+    "MEMO_MATERIALIZATION_PENDING_PER_WORKER",
+    "PROPOSAL_MEMO_MATERIALIZATION_WORKERS_ENV",
+    "MemoMaterializationEvent",
+    "MemoMaterializationObserver",
+    "MemoMaterializationOutcome",
+    "build_memo_evidence_pack_for_version",
+    "configure_memo_materialization_observer",
+    "load_materialized_memo_evidence_pack",
+    "materialize_memo_evidence_pack",
+    "memo_materialization_workers",
+    "reset_memo_materialization_for_tests",
+    "schedule_memo_evidence_pack_materialization",
+    "shutdown_memo_evidence_pack_materializer",
+]
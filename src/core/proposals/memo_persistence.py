@@ -7,9 +7,14 @@ from typing import Any, cast
 from pydantic import BaseModel, Field
 
 from src.core.common.canonical import hash_canonical_payload
-from src.core.proposals.memo_builder import build_advisory_proposal_memo_evidence_pack
+from src.core.proposals.memo_materialization import (
+    build_memo_evidence_pack_for_version,
+    load_materialized_memo_evidence_pack,
+)
+from src.core.proposals.memo_models import AdvisoryProposalMemoEvidencePack
 from src.core.proposals.models import (
     ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoIdempotencyRecord,
     ProposalMemoLifecycleStatus,
     ProposalMemoRecord,
@@ -37,7 +42,9 @@ def build_memo_persistence_request_hash(
     version: ProposalVersionRecord,
     lifecycle_status: str,
     reason: dict[str, Any] | None = None,
+    evidence_bundle_hash: str | None = None,
 ) -> str:
+    """Hash a memo create request; ``evidence_bundle_hash`` skips rehashing a known bundle."""
     return cast(
         str,
         hash_canonical_payload(
@@ -48,7 +55,8 @@ def build_memo_persistence_request_hash(
                 "artifact_hash": version.artifact_hash,
                 "simulation_hash": version.simulation_hash,
                 "request_hash": version.request_hash,
-                "evidence_bundle_hash": hash_canonical_payload(version.evidence_bundle_json),
+                "evidence_bundle_hash": evidence_bundle_hash
+                or hash_canonical_payload(version.evidence_bundle_json),
                 "lifecycle_status": lifecycle_status,
                 "reason": reason or {},
             }
@@ -68,10 +76,12 @@ def create_or_replay_proposal_memo(
     reason: dict[str, Any] | None = None,
 ) -> ProposalMemoPersistenceResult:
     memo_lifecycle_status = _memo_lifecycle_status(lifecycle_status)
+    materialized = load_materialized_memo_evidence_pack(repository=repository, version=version)
     request_hash = build_memo_persistence_request_hash(
         version=version,
         lifecycle_status=memo_lifecycle_status,
         reason=reason,
+        evidence_bundle_hash=materialized.evidence_bundle_hash if materialized else None,
     )
     replay_result = _replay_memo_result(
         repository=repository,
@@ -96,6 +106,7 @@ def create_or_replay_proposal_memo(
     return _create_memo_result(
         repository=repository,
         version=version,
+        materialized=materialized,
         lifecycle_status=memo_lifecycle_status,
         idempotency_key=idempotency_key,
         request_hash=request_hash,
@@ -164,6 +175,7 @@ def _create_memo_result(
     *,
     repository: ProposalRepository,
     version: ProposalVersionRecord,
+    materialized: ProposalMemoEvidencePackRecord | None,
     lifecycle_status: ProposalMemoLifecycleStatus,
     idempotency_key: str | None,
     request_hash: str,
@@ -174,6 +186,7 @@ def _create_memo_result(
 ) -> ProposalMemoPersistenceResult:
     memo_record = _build_memo_record(
         version=version,
+        materialized=materialized,
         created_by=created_by,
         created_at=created_at,
         lifecycle_status=lifecycle_status,
@@ -265,6 +278,7 @@ def _find_replayed_memo(
 def _build_memo_record(
     *,
     version: ProposalVersionRecord,
+    materialized: ProposalMemoEvidencePackRecord | None,
     created_by: str,
     created_at: datetime,
     lifecycle_status: ProposalMemoLifecycleStatus,
@@ -272,13 +286,10 @@ def _build_memo_record(
     request_hash: str,
     reason: dict[str, Any] | None,
 ) -> ProposalMemoRecord:
-    evidence_bundle = deepcopy(version.evidence_bundle_json)
-    pack = build_advisory_proposal_memo_evidence_pack(
-        proposal_id=version.proposal_id,
-        proposal_version_no=version.version_no,
-        proposal_version_id=version.proposal_version_id,
-        artifact_json=deepcopy(version.artifact_json),
-        evidence_bundle=evidence_bundle,
+    pack = (
+        AdvisoryProposalMemoEvidencePack.model_validate(materialized.pack_json)
+        if materialized is not None
+        else build_memo_evidence_pack_for_version(version)
     )
     if lifecycle_status == "FINALIZED" and pack.status != "READY":
         raise ProposalMemoPersistenceError("MEMO_FINALIZATION_BLOCKED_BY_EVIDENCE_POSTURE")
@@ -67,6 +67,30 @@ class ProposalMemoRecord(BaseModel):
     )
 
 
+class ProposalMemoEvidencePackRecord(BaseModel):
+    source_input_hash: str = Field(
+        description="Canonical hash of the memo input evidence; identifies the stored pack."
+    )
+    proposal_id: str = Field(description="Internal proposal identifier.", examples=["pp_001"])
+    proposal_version_no: int = Field(description="Immutable proposal version number.", examples=[1])
+    proposal_version_id: Optional[str] = Field(
+        default=None,
+        description="Immutable proposal version identifier when available.",
+        examples=["ppv_001"],
+    )
+    artifact_hash: str = Field(description="Artifact hash of the source proposal version.")
+    simulation_hash: str = Field(description="Simulation hash of the source proposal version.")
+    evidence_bundle_hash: str = Field(
+        description="Canonical hash of the source proposal version evidence bundle."
+    )
+    memo_hash: str = Field(description="Canonical hash of the materialized memo evidence pack.")
+    builder_version: str = Field(
+        description="Memo evidence-pack builder version that produced the stored pack."
+    )
+    pack_json: Dict[str, Any] = Field(description="Materialized memo evidence-pack JSON.")
+    materialized_at: datetime = Field(description="Memo evidence-pack materialization timestamp.")
+
+
 class ProposalMemoIdempotencyRecord(BaseModel):
     idempotency_key: str = Field(description="Internal memo idempotency key.")
     request_hash: str = Field(description="Canonical request hash mapped to this memo key.")
@@ -25,17 +25,21 @@ from src.core.proposals.input_request_models import (
 from src.core.proposals.memo_persistence_models import (
     ProposalMemoEventRecord,
     ProposalMemoEventType,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoIdempotencyRecord,
     ProposalMemoLifecycleStatus,
     ProposalMemoRecord,
 )
 from src.core.proposals.persistence_models import (
+    PROPOSAL_VERSION_PAYLOAD_SECTIONS,
     ProposalApprovalRecordData,
     ProposalAsyncOperationRecord,
     ProposalIdempotencyRecord,
     ProposalRecord,
     ProposalSimulationIdempotencyRecord,
     ProposalTransitionResult,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -156,6 +160,9 @@ __all__ = [
     "ProposalApprovalRequest",
     "ProposalStateTransitionResponse",
     "ProposalRecord",
+    "PROPOSAL_VERSION_PAYLOAD_SECTIONS",
+    "ProposalVersionHeaderRecord",
+    "ProposalVersionPayloadSection",
     "ProposalVersionRecord",
     "ProposalWorkflowEventRecord",
     "ProposalApprovalRecordData",
@@ -165,6 +172,7 @@ __all__ = [
     "ProposalAsyncOperationRecord",
     "ProposalMemoLifecycleStatus",
     "ProposalMemoEventType",
+    "ProposalMemoEvidencePackRecord",
     "ProposalMemoRecord",
     "ProposalMemoIdempotencyRecord",
     "ProposalMemoEventRecord",
@@ -14,6 +14,7 @@ from src.core.proposals.models import (
     ProposalNarrativeRegenerationRequest,
     ProposalNarrativeRegenerationResponse,
     ProposalNarrativeReviewResponse,
+    ProposalVersionPayloadSection,
 )
 from src.core.proposals.narrative_read_model import (
     build_narrative_read_response,
@@ -26,6 +27,8 @@ from src.core.proposals.narrative_review import (
 from src.core.proposals.proposal_replay import load_proposal_version_replay_referents
 from src.core.proposals.repository import ProposalRepository
 
+_NARRATIVE_VERSION_SECTIONS: tuple[ProposalVersionPayloadSection, ...] = ("artifact",)
+
 
 def build_narrative_view(
     *,
@@ -37,6 +40,7 @@ def build_narrative_view(
         repository=repository,
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=_NARRATIVE_VERSION_SECTIONS,
     )
     if referents.proposal is None:
         raise ProposalNotFoundError("PROPOSAL_NOT_FOUND")
@@ -63,6 +67,7 @@ def regenerate_narrative_view(
         repository=repository,
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=_NARRATIVE_VERSION_SECTIONS,
     )
     if referents.proposal is None:
         raise ProposalNotFoundError("PROPOSAL_NOT_FOUND")
@@ -93,6 +98,7 @@ def record_narrative_review(
         repository=repository,
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=_NARRATIVE_VERSION_SECTIONS,
     )
     if referents.proposal is None:
         raise ProposalNotFoundError("PROPOSAL_NOT_FOUND")
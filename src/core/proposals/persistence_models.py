@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,20 @@ from src.core.proposals.memo_persistence_models import (
 )
 from src.core.proposals.memo_persistence_models import ProposalMemoRecord as ProposalMemoRecord
 
+ProposalVersionPayloadSection = Literal[
+    "proposal_result",
+    "artifact",
+    "evidence_bundle",
+    "gate_decision",
+]
+
+PROPOSAL_VERSION_PAYLOAD_SECTIONS: tuple[ProposalVersionPayloadSection, ...] = (
+    "proposal_result",
+    "artifact",
+    "evidence_bundle",
+    "gate_decision",
+)
+
 
 class ProposalRecord(BaseModel):
     proposal_id: str = Field(description="Internal proposal identifier.", examples=["pp_001"])
@@ -71,7 +85,7 @@ class ProposalRecord(BaseModel):
     )
 
 
-class ProposalVersionRecord(BaseModel):
+class ProposalVersionHeaderRecord(BaseModel):
     proposal_version_id: str = Field(
         description="Internal version identifier.", examples=["ppv_001"]
     )
@@ -86,6 +100,9 @@ class ProposalVersionRecord(BaseModel):
     status_at_creation: ProposalCreationStatus = Field(
         description="Internal simulation status.", examples=["READY"]
     )
+
+
+class ProposalVersionRecord(ProposalVersionHeaderRecord):
     proposal_result_json: Dict[str, Any] = Field(
         description="Internal proposal-result JSON.", examples=[{"status": "READY"}]
     )
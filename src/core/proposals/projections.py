@@ -17,7 +17,9 @@ from src.core.proposals.models import (
     ProposalRecord,
     ProposalSummary,
     ProposalVersionDetail,
+    ProposalVersionHeaderRecord,
     ProposalVersionLineageItem,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEvent,
     ProposalWorkflowEventRecord,
@@ -53,6 +55,12 @@ def build_proposal_list_response(
     )
 
 
+def version_detail_sections(*, include_evidence: bool) -> tuple[ProposalVersionPayloadSection, ...]:
+    if include_evidence:
+        return ("proposal_result", "artifact", "evidence_bundle", "gate_decision")
+    return ("proposal_result", "artifact", "gate_decision")
+
+
 def to_version_detail(
     version: ProposalVersionRecord, *, include_evidence: bool
 ) -> ProposalVersionDetail:
@@ -145,7 +153,7 @@ def to_idempotency_lookup_response(
 def build_proposal_lineage_response(
     *,
     proposal: ProposalRecord,
-    versions_by_number: dict[int, ProposalVersionRecord | None],
+    versions_by_number: dict[int, ProposalVersionHeaderRecord | None],
 ) -> ProposalLineageResponse:
     versions: list[ProposalVersionLineageItem] = []
     missing_version_numbers: list[int] = []
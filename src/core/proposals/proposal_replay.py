@@ -1,7 +1,10 @@
+from collections.abc import Collection
 from dataclasses import dataclass
 
 from src.core.proposals.models import (
+    PROPOSAL_VERSION_PAYLOAD_SECTIONS,
     ProposalRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -20,12 +23,17 @@ def load_proposal_version_replay_referents(
     repository: ProposalRepository,
     proposal_id: str,
     version_no: int,
+    sections: Collection[ProposalVersionPayloadSection] = PROPOSAL_VERSION_PAYLOAD_SECTIONS,
 ) -> ProposalVersionReplayReferents:
     proposal = repository.get_proposal(proposal_id=proposal_id)
     if proposal is None:
         return ProposalVersionReplayReferents(proposal=None, version=None, events=[])
 
-    version = repository.get_version(proposal_id=proposal_id, version_no=version_no)
+    version = repository.get_version_sections(
+        proposal_id=proposal_id,
+        version_no=version_no,
+        sections=sections,
+    )
     if version is None:
         return ProposalVersionReplayReferents(proposal=proposal, version=None, events=[])
 
@@ -23,6 +23,7 @@ from src.core.proposals.projections import (
     to_idempotency_lookup_response,
     to_proposal_summary,
     to_version_detail,
+    version_detail_sections,
 )
 from src.core.proposals.repository import ProposalRepository
 from src.core.proposals.version_read_model import load_proposal_version_read_model
@@ -37,6 +38,7 @@ def build_proposal_detail_view(
     detail = load_proposal_detail_read_model(
         repository=repository,
         proposal_id=proposal_id,
+        sections=version_detail_sections(include_evidence=include_evidence),
     )
     if detail.proposal is None:
         raise ProposalNotFoundError("PROPOSAL_NOT_FOUND")
@@ -140,6 +142,7 @@ def build_proposal_version_view(
         repository=repository,
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=version_detail_sections(include_evidence=include_evidence),
     )
     if read_model.version is None:
         raise ProposalNotFoundError("PROPOSAL_VERSION_NOT_FOUND")
@@ -6,7 +6,10 @@ from src.core.proposals.projections import build_create_response_from_referents
 from src.core.proposals.proposal_replay import load_proposal_version_replay_referents
 from src.core.proposals.repository import ProposalRepository
 from src.core.replay.models import AdvisoryReplayEvidenceResponse
-from src.core.replay.service import build_proposal_version_replay_response
+from src.core.replay.service import (
+    PROPOSAL_VERSION_REPLAY_SECTIONS,
+    build_proposal_version_replay_response,
+)
 
 
 def build_create_response_from_replay_referents(
@@ -40,6 +43,7 @@ def build_proposal_version_replay_view(
         repository=repository,
         proposal_id=proposal_id,
         version_no=version_no,
+        sections=PROPOSAL_VERSION_REPLAY_SECTIONS,
     )
     if referents.proposal is None:
         raise ProposalNotFoundError("PROPOSAL_NOT_FOUND")
@@ -1,9 +1,11 @@
+from collections.abc import Collection
 from datetime import datetime
 from typing import Optional, Protocol
 
 from src.core.proposals.contract_types import ProposalWorkflowState
 from src.core.proposals.memo_persistence_models import (
     ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoIdempotencyRecord,
     ProposalMemoRecord,
 )
@@ -14,6 +16,8 @@ from src.core.proposals.models import (
     ProposalRecord,
     ProposalSimulationIdempotencyRecord,
     ProposalTransitionResult,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -54,6 +58,12 @@ class ProposalRepository(Protocol):
 
     def list_memos(self, *, proposal_id: str) -> list[ProposalMemoRecord]: ...
 
+    def save_memo_evidence_pack(self, record: ProposalMemoEvidencePackRecord) -> None: ...
+
+    def get_memo_evidence_pack(
+        self, *, proposal_id: str, proposal_version_no: int
+    ) -> Optional[ProposalMemoEvidencePackRecord]: ...
+
     def list_memos_for_proposals(self, *, proposal_ids: list[str]) -> list[ProposalMemoRecord]: ...
 
     def append_memo_event(self, event: ProposalMemoEventRecord) -> None: ...
@@ -123,6 +133,23 @@ class ProposalRepository(Protocol):
 
     def get_current_version(self, *, proposal_id: str) -> Optional[ProposalVersionRecord]: ...
 
+    def list_version_headers(self, *, proposal_id: str) -> list[ProposalVersionHeaderRecord]: ...
+
+    def get_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        version_no: int,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]: ...
+
+    def get_current_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]: ...
+
     def append_event(self, event: ProposalWorkflowEventRecord) -> None: ...
 
     def list_events(self, *, proposal_id: str) -> list[ProposalWorkflowEventRecord]: ...
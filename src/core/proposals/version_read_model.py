@@ -1,6 +1,11 @@
+from collections.abc import Collection
 from dataclasses import dataclass
 
-from src.core.proposals.models import ProposalVersionRecord
+from src.core.proposals.models import (
+    PROPOSAL_VERSION_PAYLOAD_SECTIONS,
+    ProposalVersionPayloadSection,
+    ProposalVersionRecord,
+)
 from src.core.proposals.repository import ProposalRepository
 
 
@@ -14,7 +19,12 @@ def load_proposal_version_read_model(
     repository: ProposalRepository,
     proposal_id: str,
     version_no: int,
+    sections: Collection[ProposalVersionPayloadSection] = PROPOSAL_VERSION_PAYLOAD_SECTIONS,
 ) -> ProposalVersionReadModel:
     return ProposalVersionReadModel(
-        version=repository.get_version(proposal_id=proposal_id, version_no=version_no),
+        version=repository.get_version_sections(
+            proposal_id=proposal_id,
+            version_no=version_no,
+            sections=sections,
+        ),
     )
@@ -3,7 +3,7 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Any
 
-from src.core.common.canonical import hash_canonical_payload, strip_keys
+from src.core.common.canonical import hash_canonical_payload
 from src.core.proposal_result_models import ProposalResult
 from src.core.proposals.lifecycle_events import build_new_version_created_event
 from src.core.proposals.models import (
@@ -12,6 +12,8 @@ from src.core.proposals.models import (
     ProposalWorkflowEventRecord,
 )
 
+SIMULATION_HASH_EXCLUDED_KEYS = frozenset({"correlation_id", "idempotency_key"})
+
 
 class ProposalVersionEligibilityError(Exception):
     pass
@@ -69,11 +71,10 @@ def build_proposal_version_record(
     store_evidence_bundle: bool,
 ) -> ProposalVersionRecord:
     simulation_payload = proposal_result.model_dump(mode="json", warnings=False)
-    simulation_hash_payload = strip_keys(
+    simulation_hash = hash_canonical_payload(
         simulation_payload,
-        exclude={"correlation_id", "idempotency_key"},
+        exclude=SIMULATION_HASH_EXCLUDED_KEYS,
     )
-    simulation_hash = hash_canonical_payload(simulation_hash_payload)
     artifact_hash = artifact["evidence_bundle"]["hashes"]["artifact_hash"]
     return ProposalVersionRecord(
         proposal_version_id=proposal_version_id,
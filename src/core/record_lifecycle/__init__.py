@@ -7,13 +7,33 @@ from src.core.record_lifecycle.advisory_records import (
     build_legal_hold_audit_event,
     evaluate_advisory_record_purge,
 )
+from src.core.record_lifecycle.idempotency_retention import (
+    DEFAULT_IDEMPOTENCY_RETENTION_TTLS,
+    IDEMPOTENCY_RETENTION_TABLES,
+    IdempotencyRetentionCandidate,
+    IdempotencyRetentionSettings,
+    IdempotencyRetentionStore,
+    IdempotencyRetentionSweepReport,
+    IdempotencyRetentionTable,
+    IdempotencyRetentionTableReport,
+    sweep_idempotency_records,
+)
 
 __all__ = [
     "ADVISORY_RECORD_RETENTION_POLICIES",
+    "DEFAULT_IDEMPOTENCY_RETENTION_TTLS",
+    "IDEMPOTENCY_RETENTION_TABLES",
     "AdvisoryRecordFamily",
     "AdvisoryRecordLifecycleState",
     "AdvisoryRecordPurgeDecision",
+    "IdempotencyRetentionCandidate",
+    "IdempotencyRetentionSettings",
+    "IdempotencyRetentionStore",
+    "IdempotencyRetentionSweepReport",
+    "IdempotencyRetentionTable",
+    "IdempotencyRetentionTableReport",
     "advisory_record_retention_policy",
     "build_legal_hold_audit_event",
     "evaluate_advisory_record_purge",
+    "sweep_idempotency_records",
 ]
@@ -15,6 +15,8 @@ AdvisoryRecordFamily = Literal[
     "ADVISORY_COPILOT_EVIDENCE_PACKET",
     "ADVISORY_COPILOT_RUN",
     "ADVISORY_COPILOT_REVIEW",
+    "ADVISORY_WORKSPACE_EVENT",
+    "IDEMPOTENCY_REPLAY",
 ]
 
 
@@ -104,6 +106,20 @@ ADVISORY_RECORD_RETENTION_POLICIES: dict[AdvisoryRecordFamily, AdvisoryRecordRet
         purge_policy="retain_review_audit_until_parent_run_purge",
         immutable_correction_model="append_compensating_review_event",
     ),
+    "ADVISORY_WORKSPACE_EVENT": AdvisoryRecordRetentionPolicy(
+        record_family="ADVISORY_WORKSPACE_EVENT",
+        retention_class="ADVISORY_WORKSPACE_RECORD",
+        owner="advisory-workspace",
+        purge_policy="retain_append_only_event_until_parent_workspace_purge",
+        immutable_correction_model="append_compensating_workspace_event",
+    ),
+    "IDEMPOTENCY_REPLAY": AdvisoryRecordRetentionPolicy(
+        record_family="IDEMPOTENCY_REPLAY",
+        retention_class="ADVISORY_IDEMPOTENCY_REPLAY_RECORD",
+        owner="advisory-platform",
+        purge_policy="delete_after_ttl_unless_legal_hold_or_in_flight_dependency",
+        immutable_correction_model="append_new_request_with_fresh_idempotency_key",
+    ),
 }
 
 
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Protocol, cast
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.record_lifecycle.advisory_records import (
+    AdvisoryRecordLifecycleState,
+    advisory_record_retention_policy,
+    evaluate_advisory_record_purge,
+)
+
+IdempotencyRetentionTable = Literal[
+    "proposal_simulation_idempotency",
+    "proposal_idempotency",
+    "proposal_memo_idempotency",
+    "advisor_cockpit_acknowledgement_idempotency",
+    "advisory_workspace_idempotency",
+    "policy_evaluation_idempotency",
+    "policy_pack_catalog_idempotency",
+    "advisory_copilot_run_idempotency",
+]
+
+IDEMPOTENCY_RETENTION_TABLES: tuple[IdempotencyRetentionTable, ...] = (
+    "proposal_simulation_idempotency",
+    "proposal_idempotency",
+    "proposal_memo_idempotency",
+    "advisor_cockpit_acknowledgement_idempotency",
+    "advisory_workspace_idempotency",
+    "policy_evaluation_idempotency",
+    "policy_pack_catalog_idempotency",
+    "advisory_copilot_run_idempotency",
+)
+
+DEFAULT_IDEMPOTENCY_RETENTION_TTLS: dict[IdempotencyRetentionTable, timedelta] = {
+    "proposal_simulation_idempotency": timedelta(days=7),
+    "proposal_idempotency": timedelta(days=30),
+    "proposal_memo_idempotency": timedelta(days=30),
+    "advisor_cockpit_acknowledgement_idempotency": timedelta(days=30),
+    "advisory_workspace_idempotency": timedelta(days=30),
+    "policy_evaluation_idempotency": timedelta(days=30),
+    "policy_pack_catalog_idempotency": timedelta(days=90),
+    "advisory_copilot_run_idempotency": timedelta(days=30),
+}
+DEFAULT_IDEMPOTENCY_RETENTION_BATCH_SIZE = 500
+DEFAULT_IDEMPOTENCY_RETENTION_MAX_BATCHES = 20
+IDEMPOTENCY_RETENTION_SWEEPER_ACTOR = "system:idempotency-retention-sweeper"
+
+UtcNow = Callable[[], datetime]
+
+
+@dataclass(frozen=True)
+class IdempotencyRetentionSettings:
+    ttl_by_table: Mapping[IdempotencyRetentionTable, timedelta] = field(
+        default_factory=lambda: dict(DEFAULT_IDEMPOTENCY_RETENTION_TTLS)
+    )
+    batch_size: int = DEFAULT_IDEMPOTENCY_RETENTION_BATCH_SIZE
+    max_batches_per_table: int = DEFAULT_IDEMPOTENCY_RETENTION_MAX_BATCHES
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError("IDEMPOTENCY_RETENTION_BATCH_SIZE_INVALID")
+        if self.max_batches_per_table < 1:
+            raise ValueError("IDEMPOTENCY_RETENTION_MAX_BATCHES_INVALID")
+        if any(ttl <= timedelta(0) for ttl in self.ttl_by_table.values()):
+            raise ValueError("IDEMPOTENCY_RETENTION_TTL_INVALID")
+
+
+@dataclass(frozen=True)
+class IdempotencyRetentionCandidate:
+    idempotency_key: str
+    created_at: str
+    legal_hold: bool = False
+    dependent_record_refs: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class IdempotencyRetentionTableReport:
+    table: IdempotencyRetentionTable
+    created_before: str
+    scanned: int
+    purged: int
+    decision_counts: dict[str, int]
+    batches: int
+    exhausted: bool
+
+
+@dataclass(frozen=True)
+class IdempotencyRetentionSweepReport:
+    swept_at: str
+    tables: tuple[IdempotencyRetentionTableReport, ...]
+    audit_events: tuple[dict[str, object], ...]
+
+    @property
+    def purged(self) -> int:
+        return sum(table.purged for table in self.tables)
+
+
+class IdempotencyRetentionStore(Protocol):
+    def idempotency_retention_tables(self) -> tuple[IdempotencyRetentionTable, ...]: ...
+
+    def list_idempotency_retention_candidates(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        created_before: str,
+        after: IdempotencyRetentionCandidate | None,
+        limit: int,
+    ) -> list[IdempotencyRetentionCandidate]: ...
+
+    def delete_idempotency_records(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        idempotency_keys: Sequence[str],
+        created_before: str,
+    ) -> int: ...
+
+
+def sweep_idempotency_records(
+    *,
+    stores: Sequence[IdempotencyRetentionStore],
+    settings: IdempotencyRetentionSettings,
+    now: UtcNow | None = None,
+) -> IdempotencyRetentionSweepReport:
+    swept_at = (now or _utc_now)()
+    table_reports: list[IdempotencyRetentionTableReport] = []
+    audit_events: list[dict[str, object]] = []
+    for store in stores:
+        for table in store.idempotency_retention_tables():
+            ttl = settings.ttl_by_table.get(table)
+            if ttl is None:
+                continue
+            table_report, table_events = _sweep_table(
+                store=store,
+                table=table,
+                ttl=ttl,
+                swept_at=swept_at,
+                settings=settings,
+            )
+            table_reports.append(table_report)
+            audit_events.extend(table_events)
+    return IdempotencyRetentionSweepReport(
+        swept_at=swept_at.isoformat(),
+        tables=tuple(table_reports),
+        audit_events=tuple(audit_events),
+    )
+
+
+def _sweep_table(
+    *,
+    store: IdempotencyRetentionStore,
+    table: IdempotencyRetentionTable,
+    ttl: timedelta,
+    swept_at: datetime,
+    settings: IdempotencyRetentionSettings,
+) -> tuple[IdempotencyRetentionTableReport, list[dict[str, object]]]:
+    created_before = (swept_at - ttl).isoformat()
+    after: IdempotencyRetentionCandidate | None = None
+    decision_counts: Counter[str] = Counter()
+    audit_events: list[dict[str, object]] = []
+    scanned = 0
+    purged = 0
+    batches = 0
+    exhausted = False
+    while batches < settings.max_batches_per_table:
+        candidates = store.list_idempotency_retention_candidates(
+            table=table,
+            created_before=created_before,
+            after=after,
+            limit=settings.batch_size,
+        )
+        if not candidates:
+            exhausted = True
+            break
+        batches += 1
+        scanned += len(candidates)
+        after = candidates[-1]
+        eligible_keys, batch_counts, purged_ref_hashes = _batch_decisions(
+            table=table, candidates=candidates, ttl=ttl, swept_at=swept_at
+        )
+        decision_counts.update(batch_counts)
+        deleted = (
+            store.delete_idempotency_records(
+                table=table,
+                idempotency_keys=eligible_keys,
+                created_before=created_before,
+            )
+            if eligible_keys
+            else 0
+        )
+        purged += deleted
+        audit_events.append(
+            _purge_audit_event(
+                table=table,
+                created_before=created_before,
+                swept_at=swept_at,
+                deleted=deleted,
+                decision_counts=dict(batch_counts),
+                purged_ref_hashes=purged_ref_hashes,
+            )
+        )
+        if len(candidates) < settings.batch_size:
+            exhausted = True
+            break
+    return (
+        IdempotencyRetentionTableReport(
+            table=table,
+            created_before=created_before,
+            scanned=scanned,
+            purged=purged,
+            decision_counts=dict(sorted(decision_counts.items())),
+            batches=batches,
+            exhausted=exhausted,
+        ),
+        audit_events,
+    )
+
+
+def _batch_decisions(
+    *,
+    table: IdempotencyRetentionTable,
+    candidates: Sequence[IdempotencyRetentionCandidate],
+    ttl: timedelta,
+    swept_at: datetime,
+) -> tuple[list[str], Counter[str], list[str]]:
+    policy = advisory_record_retention_policy("IDEMPOTENCY_REPLAY")
+    eligible_keys: list[str] = []
+    purged_ref_hashes: list[str] = []
+    counts: Counter[str] = Counter()
+    for candidate in candidates:
+        decision = evaluate_advisory_record_purge(
+            record=AdvisoryRecordLifecycleState(
+                record_family="IDEMPOTENCY_REPLAY",
+                record_id=f"{table}:{candidate.idempotency_key}",
+                retention_class=policy.retention_class,
+                retention_expires_at=_retention_expires_at(candidate.created_at, ttl=ttl),
+                legal_hold=candidate.legal_hold,
+                dependent_record_refs=candidate.dependent_record_refs,
+            ),
+            as_of=swept_at,
+            authorized=True,
+            requested_by=IDEMPOTENCY_RETENTION_SWEEPER_ACTOR,
+            idempotency_key=f"{table}:{candidate.idempotency_key}:{swept_at.isoformat()}",
+        )
+        counts[decision.reason_code] += 1
+        if decision.eligible:
+            eligible_keys.append(candidate.idempotency_key)
+            purged_ref_hashes.append(cast(str, decision.audit_event["record_ref_hash"]))
+    return eligible_keys, counts, purged_ref_hashes
+
+
+def _purge_audit_event(
+    *,
+    table: IdempotencyRetentionTable,
+    created_before: str,
+    swept_at: datetime,
+    deleted: int,
+    decision_counts: dict[str, int],
+    purged_ref_hashes: list[str],
+) -> dict[str, object]:
+    policy = advisory_record_retention_policy("IDEMPOTENCY_REPLAY")
+    return {
+        "event_type": "ADVISORY_RECORD_PURGE_EXECUTED",
+        "record_family": policy.record_family,
+        "record_table": table,
+        "retention_class": policy.retention_class,
+        "policy_owner": policy.owner,
+        "purge_policy": policy.purge_policy,
+        "created_before": created_before,
+        "occurred_at": swept_at.isoformat(),
+        "purged_count": deleted,
+        "decision_counts": dict(sorted(decision_counts.items())),
+        "purged_record_refs_hash": hash_canonical_payload(sorted(purged_ref_hashes)),
+        "append_only": True,
+    }
+
+
+def _retention_expires_at(created_at: str, *, ttl: timedelta) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(created_at)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed + ttl
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
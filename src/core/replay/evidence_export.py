@@ -0,0 +1,453 @@
+"""Streaming, hash-chained export of proposal lineage and audit evidence.
+
+The export walks the proposals in scope page by page with the repositories' keyset cursors. It
+yields one entry per stored record: the proposal, each version, its workflow events, approvals,
+memos and memo events, and its copilot runs. The policy evaluations in the same scope follow,
+each with its audit events. Every entry carries the hash of the entry before it, and its own
+``entry_hash`` covers its sequence number, record type, payload and that previous hash. Removing,
+reordering or editing any entry therefore breaks the chain from that point on. The trailer is
+written last, so an export without a trailer was cut short. The chain alone cannot show that a
+whole bundle was rebuilt and re-chained, so callers record the head hash outside the bundle as
+well, keyed by the ``export_id`` in the header.
+
+Memory use is bounded by one page of proposals plus the records of one proposal, whatever the
+size of the scope. Only one version payload is held at a time. Policy evaluations are read one
+page at a time, with the audit events of that page fetched in one batch.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from src.core.advisory_copilot.repository import AdvisoryCopilotRepository
+from src.core.common.canonical import canonical_json, hash_canonical_payload
+from src.core.policy_packs.record_query import (
+    decode_policy_evaluation_record_cursor,
+    normalize_policy_evaluation_record_query,
+)
+from src.core.policy_packs.repositories import PolicyEvaluationRepository
+from src.core.proposals.exceptions import ProposalValidationError
+from src.core.proposals.models import ProposalRecord
+from src.core.proposals.repository import ProposalRepository
+
+EvidenceExportFormat = Literal["ndjson", "tar"]
+EvidenceExportRecordType = Literal[
+    "export_header",
+    "proposal",
+    "proposal_version",
+    "workflow_event",
+    "approval",
+    "memo",
+    "memo_event",
+    "copilot_run",
+    "policy_evaluation",
+    "policy_evaluation_event",
+    "export_trailer",
+]
+
+EVIDENCE_EXPORT_SCHEMA_VERSION = "advisory-evidence-export.v1"
+EVIDENCE_EXPORT_GENESIS_HASH = "sha256:" + "0" * 64
+DEFAULT_EVIDENCE_EXPORT_PAGE_SIZE = 100
+EVIDENCE_EXPORT_MAX_PAGE_SIZE = 500
+EVIDENCE_EXPORT_CHUNK_BYTES = 64 * 1024
+EVIDENCE_EXPORT_MEDIA_TYPES: dict[EvidenceExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "tar": "application/x-tar",
+}
+
+
+@dataclass(frozen=True)
+class EvidenceExportScope:
+    portfolio_id: str | None
+    created_from: datetime | None
+    created_to: datetime | None
+    page_size: int = DEFAULT_EVIDENCE_EXPORT_PAGE_SIZE
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "portfolio_id": self.portfolio_id,
+            "created_from": self.created_from.isoformat() if self.created_from else None,
+            "created_to": self.created_to.isoformat() if self.created_to else None,
+        }
+
+
+@dataclass(frozen=True)
+class EvidenceExportEntry:
+    sequence: int
+    record_type: EvidenceExportRecordType
+    payload: dict[str, Any]
+    previous_hash: str
+    entry_hash: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sequence": self.sequence,
+            "record_type": self.record_type,
+            "payload": self.payload,
+            "previous_hash": self.previous_hash,
+            "entry_hash": self.entry_hash,
+        }
+
+    def to_json(self) -> str:
+        return canonical_json(self.to_dict())
+
+
+@dataclass(frozen=True)
+class EvidenceExportVerification:
+    entry_count: int
+    head_hash: str
+    complete: bool
+    broken_at_sequence: int | None = None
+
+    @property
+    def valid(self) -> bool:
+        return self.complete and self.broken_at_sequence is None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "entry_count": self.entry_count,
+            "head_hash": self.head_hash,
+            "complete": self.complete,
+            "broken_at_sequence": self.broken_at_sequence,
+            "valid": self.valid,
+        }
+
+
+def normalize_evidence_export_scope(
+    *,
+    portfolio_id: str | None,
+    created_from: datetime | None,
+    created_to: datetime | None,
+    page_size: int | None = None,
+) -> EvidenceExportScope:
+    """Validate an export scope; a portfolio or a complete created-at window is required."""
+    portfolio = (portfolio_id or "").strip() or None
+    start = _utc(created_from)
+    end = _utc(created_to)
+    if portfolio is None and (start is None or end is None):
+        raise ProposalValidationError("EVIDENCE_EXPORT_SCOPE_REQUIRED")
+    if start is not None and end is not None and start >= end:
+        raise ProposalValidationError("EVIDENCE_EXPORT_DATE_RANGE_INVALID")
+    size = DEFAULT_EVIDENCE_EXPORT_PAGE_SIZE if page_size is None else page_size
+    if not 1 <= size <= EVIDENCE_EXPORT_MAX_PAGE_SIZE:
+        raise ProposalValidationError("EVIDENCE_EXPORT_PAGE_SIZE_INVALID")
+    return EvidenceExportScope(
+        portfolio_id=portfolio, created_from=start, created_to=end, page_size=size
+    )
+
+
+def iter_evidence_export_entries(
+    *,
+    scope: EvidenceExportScope,
+    proposals: ProposalRepository,
+    exported_at: datetime,
+    policy_evaluations: PolicyEvaluationRepository | None = None,
+    copilot_runs: AdvisoryCopilotRepository | None = None,
+    export_id: str | None = None,
+) -> Iterator[EvidenceExportEntry]:
+    """Yield the hash-chained entries of one export, header first and trailer last."""
+    chain = _EvidenceChain()
+    yield chain.append(
+        "export_header",
+        {
+            "schema_version": EVIDENCE_EXPORT_SCHEMA_VERSION,
+            "export_id": export_id,
+            "exported_at": exported_at.astimezone(UTC).isoformat(),
+            "scope": scope.to_dict(),
+            "sections": {
+                "copilot_runs": copilot_runs is not None,
+                "policy_evaluations": policy_evaluations is not None,
+            },
+        },
+    )
+    for proposal in _iter_scoped_proposals(scope=scope, repository=proposals):
+        yield from _proposal_entries(
+            chain, proposal=proposal, repository=proposals, scope=scope, copilot_runs=copilot_runs
+        )
+    if policy_evaluations is not None:
+        yield from _policy_evaluation_entries(chain, scope=scope, repository=policy_evaluations)
+    yield chain.append(
+        "export_trailer",
+        {
+            "entry_count": chain.sequence,
+            "record_counts": dict(sorted(chain.record_counts.items())),
+        },
+    )
+
+
+def report_evidence_export_head(
+    entries: Iterable[EvidenceExportEntry],
+    *,
+    on_complete: Callable[[EvidenceExportVerification], None],
+) -> Iterator[EvidenceExportEntry]:
+    """Pass entries through and report the head hash just before the trailer is yielded."""
+    for entry in entries:
+        if entry.record_type == "export_trailer":
+            on_complete(
+                EvidenceExportVerification(
+                    entry_count=entry.sequence + 1,
+                    head_hash=entry.entry_hash,
+                    complete=True,
+                )
+            )
+        yield entry
+
+
+def render_evidence_export_ndjson(entries: Iterable[EvidenceExportEntry]) -> Iterator[bytes]:
+    """Encode entries as NDJSON, grouped into chunks of about ``EVIDENCE_EXPORT_CHUNK_BYTES``."""
+    buffer = bytearray()
+    for entry in entries:
+        buffer += entry.to_json().encode("utf-8") + b"\n"
+        if len(buffer) >= EVIDENCE_EXPORT_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def render_evidence_export_tar(
+    entries: Iterable[EvidenceExportEntry], *, exported_at: datetime
+) -> Iterator[bytes]:
+    """Encode entries as a streamed tar archive with one JSON member per entry."""
+    sink = io.BytesIO()
+    with tarfile.open(fileobj=sink, mode="w|") as archive:
+        for entry in entries:
+            data = (entry.to_json() + "\n").encode("utf-8")
+            member = tarfile.TarInfo(f"evidence/{entry.sequence:08d}-{entry.record_type}.json")
+            member.size = len(data)
+            member.mtime = int(exported_at.timestamp())
+            member.mode = 0o644
+            archive.addfile(member, io.BytesIO(data))
+            if sink.tell() >= EVIDENCE_EXPORT_CHUNK_BYTES:
+                yield _drain(sink)
+    if sink.tell():
+        yield _drain(sink)
+
+
+def render_evidence_export(
+    entries: Iterable[EvidenceExportEntry],
+    *,
+    export_format: EvidenceExportFormat,
+    exported_at: datetime,
+) -> Iterator[bytes]:
+    if export_format == "tar":
+        return render_evidence_export_tar(entries, exported_at=exported_at)
+    return render_evidence_export_ndjson(entries)
+
+
+def verify_evidence_export_ndjson(lines: Iterable[str | bytes]) -> EvidenceExportVerification:
+    """Recompute the hash chain of an NDJSON export and report where it first breaks."""
+    previous_hash = EVIDENCE_EXPORT_GENESIS_HASH
+    entry_count = 0
+    complete = False
+    for line in lines:
+        if not line.strip():
+            continue
+        if complete:
+            return _broken(entry_count, previous_hash)
+        try:
+            entry = json.loads(line)
+            valid = (
+                entry["sequence"] == entry_count
+                and entry["previous_hash"] == previous_hash
+                and _entry_hash(
+                    sequence=entry["sequence"],
+                    record_type=entry["record_type"],
+                    payload=entry["payload"],
+                    previous_hash=previous_hash,
+                )
+                == entry["entry_hash"]
+            )
+        except (KeyError, TypeError, ValueError):
+            valid = False
+        if not valid:
+            return _broken(entry_count, previous_hash)
+        previous_hash = entry["entry_hash"]
+        entry_count += 1
+        complete = entry["record_type"] == "export_trailer"
+    return EvidenceExportVerification(
+        entry_count=entry_count, head_hash=previous_hash, complete=complete
+    )
+
+
+class _EvidenceChain:
+    def __init__(self) -> None:
+        self.sequence = 0
+        self.previous_hash = EVIDENCE_EXPORT_GENESIS_HASH
+        self.record_counts: Counter[str] = Counter()
+
+    def append(
+        self, record_type: EvidenceExportRecordType, payload: dict[str, Any]
+    ) -> EvidenceExportEntry:
+        entry = EvidenceExportEntry(
+            sequence=self.sequence,
+            record_type=record_type,
+            payload=payload,
+            previous_hash=self.previous_hash,
+            entry_hash=_entry_hash(
+                sequence=self.sequence,
+                record_type=record_type,
+                payload=payload,
+                previous_hash=self.previous_hash,
+            ),
+        )
+        self.sequence += 1
+        self.previous_hash = entry.entry_hash
+        self.record_counts[record_type] += 1
+        return entry
+
+    def append_record(
+        self, record_type: EvidenceExportRecordType, record: BaseModel
+    ) -> EvidenceExportEntry:
+        return self.append(record_type, record.model_dump(mode="json"))
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    chunk = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return chunk
+
+
+def _entry_hash(
+    *, sequence: int, record_type: str, payload: dict[str, Any], previous_hash: str
+) -> str:
+    return hash_canonical_payload(
+        {
+            "sequence": sequence,
+            "record_type": record_type,
+            "payload": payload,
+            "previous_hash": previous_hash,
+        }
+    )
+
+
+def _iter_scoped_proposals(
+    *, scope: EvidenceExportScope, repository: ProposalRepository
+) -> Iterator[ProposalRecord]:
+    cursor: str | None = None
+    while True:
+        page, cursor = repository.list_proposals(
+            portfolio_id=scope.portfolio_id,
+            state=None,
+            created_by=None,
+            created_from=scope.created_from,
+            created_to=scope.created_to,
+            limit=scope.page_size,
+            cursor=cursor,
+        )
+        yield from page
+        if cursor is None:
+            return
+
+
+def _proposal_entries(
+    chain: _EvidenceChain,
+    *,
+    proposal: ProposalRecord,
+    repository: ProposalRepository,
+    scope: EvidenceExportScope,
+    copilot_runs: AdvisoryCopilotRepository | None,
+) -> Iterator[EvidenceExportEntry]:
+    proposal_id = proposal.proposal_id
+    yield chain.append_record("proposal", proposal)
+    for header in repository.list_version_headers(proposal_id=proposal_id):
+        version = repository.get_version(proposal_id=proposal_id, version_no=header.version_no)
+        if version is not None:
+            yield chain.append_record("proposal_version", version)
+    for event in repository.list_events(proposal_id=proposal_id):
+        yield chain.append_record("workflow_event", event)
+    for approval in repository.list_approvals(proposal_id=proposal_id):
+        yield chain.append_record("approval", approval)
+    for memo in repository.list_memos(proposal_id=proposal_id):
+        yield chain.append_record("memo", memo)
+        for memo_event in repository.list_memo_events(memo_id=memo.memo_id):
+            yield chain.append_record("memo_event", memo_event)
+    if copilot_runs is None:
+        return
+    cursor: str | None = None
+    while True:
+        runs, cursor = copilot_runs.list_runs_for_proposal_version(
+            proposal_id=proposal_id,
+            proposal_version_id=None,
+            proposal_version_no=None,
+            limit=scope.page_size,
+            cursor=cursor,
+        )
+        for run in runs:
+            yield chain.append_record("copilot_run", run)
+        if cursor is None:
+            return
+
+
+def _policy_evaluation_entries(
+    chain: _EvidenceChain,
+    *,
+    scope: EvidenceExportScope,
+    repository: PolicyEvaluationRepository,
+) -> Iterator[EvidenceExportEntry]:
+    query = normalize_policy_evaluation_record_query(
+        portfolio_id=scope.portfolio_id,
+        generated_after=scope.created_from,
+        generated_before=scope.created_to,
+        limit=scope.page_size,
+    )
+    while True:
+        page = repository.list_policy_evaluation_record_page(query=query)
+        events = repository.list_policy_evaluation_events_by_evaluation(
+            evaluation_ids=[record.evaluation_id for record in page.items]
+        )
+        for record in page.items:
+            yield chain.append_record("policy_evaluation", record)
+            for event in events[record.evaluation_id]:
+                yield chain.append_record("policy_evaluation_event", event)
+        if page.next_cursor is None:
+            return
+        query = replace(query, cursor=decode_policy_evaluation_record_cursor(page.next_cursor))
+
+
+def _broken(entry_count: int, head_hash: str) -> EvidenceExportVerification:
+    return EvidenceExportVerification(
+        entry_count=entry_count,
+        head_hash=head_hash,
+        complete=False,
+        broken_at_sequence=entry_count,
+    )
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    return aware.astimezone(UTC)
+
+
+__all__ = [
+    "DEFAULT_EVIDENCE_EXPORT_PAGE_SIZE",
+    "EVIDENCE_EXPORT_CHUNK_BYTES",
+    "EVIDENCE_EXPORT_GENESIS_HASH",
+    "EVIDENCE_EXPORT_MAX_PAGE_SIZE",
+    "EVIDENCE_EXPORT_MEDIA_TYPES",
+    "EVIDENCE_EXPORT_SCHEMA_VERSION",
+    "EvidenceExportEntry",
+    "EvidenceExportFormat",
+    "EvidenceExportRecordType",
+    "EvidenceExportScope",
+    "EvidenceExportVerification",
+    "iter_evidence_export_entries",
+    "normalize_evidence_export_scope",
+    "render_evidence_export",
+    "report_evidence_export_head",
+    "render_evidence_export_ndjson",
+    "render_evidence_export_tar",
+    "verify_evidence_export_ndjson",
+]
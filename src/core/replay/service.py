@@ -4,6 +4,7 @@ from src.core.proposals.delivery_summary import build_delivery_summary_from_even
 from src.core.proposals.models import (
     ProposalAsyncOperationRecord,
     ProposalRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -18,6 +19,12 @@ from src.core.replay.models import (
 from src.core.workspace.session_models import WorkspaceSession
 from src.core.workspace.version_models import WorkspaceSavedVersion
 
+PROPOSAL_VERSION_REPLAY_SECTIONS: tuple[ProposalVersionPayloadSection, ...] = (
+    "proposal_result",
+    "artifact",
+    "evidence_bundle",
+)
+
 
 def build_workspace_saved_version_replay_response(
     *,
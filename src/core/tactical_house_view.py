@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import cast
 
-from src.core.common.canonical import hash_canonical_payload, strip_keys
+from src.core.tactical_house_view_cohort_builder import (
+    TacticalHouseViewCohortBuilder as TacticalHouseViewCohortBuilder,
+)
 from src.core.tactical_house_view_models import (
     TacticalHouseViewAction as TacticalHouseViewAction,
 )
 from src.core.tactical_house_view_models import (
     TacticalHouseViewAffectedCohort as TacticalHouseViewAffectedCohort,
 )
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewAffectedCohortSummary as TacticalHouseViewAffectedCohortSummary,
+)
 from src.core.tactical_house_view_models import (
     TacticalHouseViewAffectedPortfolio as TacticalHouseViewAffectedPortfolio,
 )
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewAffectedPortfolioPage as TacticalHouseViewAffectedPortfolioPage,
+)
 from src.core.tactical_house_view_models import (
     TacticalHouseViewAlignment as TacticalHouseViewAlignment,
 )
@@ -25,12 +32,18 @@ from src.core.tactical_house_view_models import (
 from src.core.tactical_house_view_models import (
     TacticalHouseViewCohortRequest as TacticalHouseViewCohortRequest,
 )
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewCohortStreamHeader as TacticalHouseViewCohortStreamHeader,
+)
 from src.core.tactical_house_view_models import (
     TacticalHouseViewDefinition as TacticalHouseViewDefinition,
 )
 from src.core.tactical_house_view_models import (
     TacticalHouseViewExcludedPortfolio as TacticalHouseViewExcludedPortfolio,
 )
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewExcludedPortfolioPage as TacticalHouseViewExcludedPortfolioPage,
+)
 from src.core.tactical_house_view_models import (
     TacticalHouseViewSourceRef as TacticalHouseViewSourceRef,
 )
@@ -40,188 +53,177 @@ from src.core.tactical_house_view_models import (
 from src.core.tactical_house_view_models import (
     TacticalHouseViewSupportabilityState as TacticalHouseViewSupportabilityState,
 )
-from src.core.tactical_house_view_rules import (
-    candidate_exclusion_reasons,
-    candidate_inclusion_reason_codes,
-    dedupe_source_refs,
-    normalize_portfolio_type,
-    supportability,
+from src.core.tactical_house_view_pagination import (
+    TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE as TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE,
+)
+from src.core.tactical_house_view_pagination import (
+    TacticalHouseViewCohortMembership,
+    decode_cohort_portfolio_cursor,
+    encode_cohort_portfolio_cursor,
+)
+from src.core.tactical_house_view_repository import (
+    InMemoryTacticalHouseViewCohortRepository as InMemoryTacticalHouseViewCohortRepository,
+)
+from src.core.tactical_house_view_repository import (
+    TacticalHouseViewCohortRepository as TacticalHouseViewCohortRepository,
 )
 
-_COHORT_STORE: dict[str, TacticalHouseViewAffectedCohort] = {}
-
-
-def _eligible_portfolio_types(request: TacticalHouseViewCohortRequest) -> set[str]:
-    return {normalize_portfolio_type(value) for value in request.eligible_portfolio_types}
 
+def build_tactical_house_view_affected_cohort(
+    request: TacticalHouseViewCohortRequest,
+    *,
+    generated_at: datetime | None = None,
+) -> TacticalHouseViewAffectedCohort:
+    """Build a deterministic tactical house-view cohort without source-fact recalculation."""
 
-def _affected_portfolio(
-    candidate: TacticalHouseViewCandidatePortfolio,
-) -> TacticalHouseViewAffectedPortfolio:
-    return TacticalHouseViewAffectedPortfolio(
-        portfolio_id=candidate.portfolio_id,
-        mandate_id=candidate.mandate_id,
-        inclusion_reason_codes=candidate_inclusion_reason_codes(candidate),
-        source_refs=candidate.source_refs,
+    return TacticalHouseViewCohortBuilder.from_request(request).build(
+        generated_at=generated_at or datetime.now(timezone.utc)
     )
 
 
-def _excluded_portfolio(
-    candidate: TacticalHouseViewCandidatePortfolio,
-    exclusion_reason_codes: list[str],
-) -> TacticalHouseViewExcludedPortfolio:
-    return TacticalHouseViewExcludedPortfolio(
-        portfolio_id=candidate.portfolio_id,
-        exclusion_reason_codes=exclusion_reason_codes,
-        source_refs=candidate.source_refs,
-    )
+def record_tactical_house_view_affected_cohort(
+    cohort: TacticalHouseViewAffectedCohort,
+) -> TacticalHouseViewAffectedCohort:
+    _REPOSITORY.save_cohort(cohort)
+    return cohort
 
 
-def _classify_candidate(
-    candidate: TacticalHouseViewCandidatePortfolio,
+def list_tactical_house_view_affected_cohorts(
     *,
-    eligible_types: set[str],
-    min_exposure_weight: Decimal | None,
-) -> tuple[TacticalHouseViewAffectedPortfolio | None, TacticalHouseViewExcludedPortfolio | None]:
-    exclusion_reasons = candidate_exclusion_reasons(
-        candidate=candidate,
-        eligible_types=eligible_types,
-        min_exposure_weight=min_exposure_weight,
-    )
-    if exclusion_reasons:
-        return None, _excluded_portfolio(candidate, exclusion_reasons)
-    return _affected_portfolio(candidate), None
+    portfolio_id: str | None,
+    limit: int,
+) -> list[TacticalHouseViewAffectedCohort]:
+    """Return the newest cohort projections, optionally only those affecting one portfolio."""
+    return _REPOSITORY.list_cohorts(portfolio_id=portfolio_id, limit=limit)
 
 
-def _classify_candidates(
-    request: TacticalHouseViewCohortRequest,
-) -> tuple[list[TacticalHouseViewAffectedPortfolio], list[TacticalHouseViewExcludedPortfolio]]:
-    affected: list[TacticalHouseViewAffectedPortfolio] = []
-    excluded: list[TacticalHouseViewExcludedPortfolio] = []
-    eligible_types = _eligible_portfolio_types(request)
-
-    for candidate in request.candidate_portfolios:
-        affected_portfolio, excluded_portfolio = _classify_candidate(
-            candidate,
-            eligible_types=eligible_types,
-            min_exposure_weight=request.min_exposure_weight,
-        )
-        if affected_portfolio is not None:
-            affected.append(affected_portfolio)
-        if excluded_portfolio is not None:
-            excluded.append(excluded_portfolio)
-
-    return affected, excluded
-
-
-def _cohort_source_refs(
-    request: TacticalHouseViewCohortRequest,
-) -> list[TacticalHouseViewSourceRef]:
-    return dedupe_source_refs(
-        [*request.tactical_view.source_refs]
-        + [ref for candidate in request.candidate_portfolios for ref in candidate.source_refs]
-    )
+def get_tactical_house_view_affected_cohort(
+    cohort_id: str,
+) -> TacticalHouseViewAffectedCohort | None:
+    return _REPOSITORY.get_cohort(cohort_id=cohort_id)
 
 
-def _finalize_cohort_identity(
+def summarize_tactical_house_view_affected_cohort(
     cohort: TacticalHouseViewAffectedCohort,
-) -> TacticalHouseViewAffectedCohort:
-    payload = cohort.model_dump(mode="json")
-    payload["content_hash"] = hash_canonical_payload(strip_keys(payload, exclude={"content_hash"}))
-    payload["cohort_id"] = hash_canonical_payload(
-        strip_keys(payload, exclude={"cohort_id", "content_hash", "generated_at"})
-    )
-    payload["content_hash"] = hash_canonical_payload(strip_keys(payload, exclude={"content_hash"}))
+) -> TacticalHouseViewAffectedCohortSummary:
     return cast(
-        TacticalHouseViewAffectedCohort,
-        TacticalHouseViewAffectedCohort.model_validate(payload),
+        TacticalHouseViewAffectedCohortSummary,
+        TacticalHouseViewAffectedCohortSummary.model_validate(
+            cohort.model_dump(exclude={"affected_portfolios", "excluded_portfolios"})
+        ),
     )
 
 
-def build_tactical_house_view_affected_cohort(
-    request: TacticalHouseViewCohortRequest,
+def page_tactical_house_view_affected_portfolios(
     *,
-    generated_at: datetime | None = None,
-) -> TacticalHouseViewAffectedCohort:
-    """Build a deterministic tactical house-view cohort without source-fact recalculation."""
-
-    generated_at = generated_at or datetime.now(timezone.utc)
-    affected, excluded = _classify_candidates(request)
-
-    cohort_supportability = supportability(
-        evaluated_candidate_count=len(request.candidate_portfolios),
-        affected_count=len(affected),
-        excluded_count=len(excluded),
-    )
-    cohort = TacticalHouseViewAffectedCohort(
-        cohort_id="",
-        tactical_view_id=request.tactical_view.tactical_view_id,
-        tactical_view_version=request.tactical_view.tactical_view_version,
-        theme_id=request.tactical_view.theme_id,
-        as_of_date=request.tactical_view.as_of_date,
-        target_action=request.tactical_view.target_action,
-        affected_portfolios=sorted(affected, key=lambda item: item.portfolio_id),
-        excluded_portfolios=sorted(excluded, key=lambda item: item.portfolio_id),
-        supportability=cohort_supportability,
-        source_refs=_cohort_source_refs(request),
-        content_hash="",
-        generated_at=generated_at.isoformat(),
-        correlation_id=request.correlation_id,
+    cohort_id: str,
+    limit: int,
+    cursor: str | None,
+) -> TacticalHouseViewAffectedPortfolioPage | None:
+    offset = decode_cohort_portfolio_cursor(cursor, cohort_id=cohort_id, membership="affected")
+    page = _REPOSITORY.page_affected_portfolios(cohort_id=cohort_id, offset=offset, limit=limit)
+    if page is None:
+        return None
+    items, total_count = page
+    return TacticalHouseViewAffectedPortfolioPage(
+        cohort_id=cohort_id,
+        items=items,
+        total_count=total_count,
+        next_cursor=_next_cursor(
+            cohort_id=cohort_id,
+            membership="affected",
+            next_offset=offset + limit,
+            total_count=total_count,
+        ),
     )
-    return _finalize_cohort_identity(cohort)
-
 
-def record_tactical_house_view_affected_cohort(
-    cohort: TacticalHouseViewAffectedCohort,
-) -> TacticalHouseViewAffectedCohort:
-    _COHORT_STORE[cohort.cohort_id] = cohort.model_copy(deep=True)
-    return cohort
 
-
-def list_tactical_house_view_affected_cohorts(
+def page_tactical_house_view_excluded_portfolios(
     *,
-    portfolio_id: str | None,
+    cohort_id: str,
     limit: int,
-) -> list[TacticalHouseViewAffectedCohort]:
-    cohorts = _stored_cohorts_by_recency()
-    if portfolio_id is not None:
-        cohorts = [cohort for cohort in cohorts if _cohort_contains_portfolio(cohort, portfolio_id)]
-    return [cohort.model_copy(deep=True) for cohort in cohorts[:limit]]
+    cursor: str | None,
+) -> TacticalHouseViewExcludedPortfolioPage | None:
+    offset = decode_cohort_portfolio_cursor(cursor, cohort_id=cohort_id, membership="excluded")
+    page = _REPOSITORY.page_excluded_portfolios(cohort_id=cohort_id, offset=offset, limit=limit)
+    if page is None:
+        return None
+    items, total_count = page
+    return TacticalHouseViewExcludedPortfolioPage(
+        cohort_id=cohort_id,
+        items=items,
+        total_count=total_count,
+        next_cursor=_next_cursor(
+            cohort_id=cohort_id,
+            membership="excluded",
+            next_offset=offset + limit,
+            total_count=total_count,
+        ),
+    )
 
 
-def _stored_cohorts_by_recency() -> list[TacticalHouseViewAffectedCohort]:
-    return sorted(
-        _COHORT_STORE.values(),
-        key=lambda item: (item.generated_at, item.cohort_id),
-        reverse=True,
+def _next_cursor(
+    *,
+    cohort_id: str,
+    membership: TacticalHouseViewCohortMembership,
+    next_offset: int,
+    total_count: int,
+) -> str | None:
+    if next_offset >= total_count:
+        return None
+    return encode_cohort_portfolio_cursor(
+        cohort_id=cohort_id,
+        membership=membership,
+        offset=next_offset,
     )
 
 
-def _cohort_contains_portfolio(
-    cohort: TacticalHouseViewAffectedCohort,
-    portfolio_id: str,
-) -> bool:
-    return any(affected.portfolio_id == portfolio_id for affected in cohort.affected_portfolios)
+def configure_tactical_house_view_cohort_repository(
+    repository: TacticalHouseViewCohortRepository,
+) -> None:
+    global _REPOSITORY
+    _REPOSITORY = repository
+
+
+def get_tactical_house_view_cohort_repository() -> TacticalHouseViewCohortRepository:
+    return _REPOSITORY
 
 
 def clear_tactical_house_view_affected_cohorts_for_tests() -> None:
-    _COHORT_STORE.clear()
+    configure_tactical_house_view_cohort_repository(InMemoryTacticalHouseViewCohortRepository())
+
+
+_REPOSITORY: TacticalHouseViewCohortRepository = InMemoryTacticalHouseViewCohortRepository()
 
 
 __all__ = [
+    "TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE",
+    "InMemoryTacticalHouseViewCohortRepository",
     "TacticalHouseViewAction",
     "TacticalHouseViewAffectedCohort",
+    "TacticalHouseViewAffectedCohortSummary",
     "TacticalHouseViewAffectedPortfolio",
+    "TacticalHouseViewAffectedPortfolioPage",
     "TacticalHouseViewAlignment",
     "TacticalHouseViewCandidatePortfolio",
+    "TacticalHouseViewCohortBuilder",
+    "TacticalHouseViewCohortRepository",
     "TacticalHouseViewCohortRequest",
+    "TacticalHouseViewCohortStreamHeader",
     "TacticalHouseViewDefinition",
     "TacticalHouseViewExcludedPortfolio",
+    "TacticalHouseViewExcludedPortfolioPage",
     "TacticalHouseViewSourceRef",
     "TacticalHouseViewSupportability",
     "TacticalHouseViewSupportabilityState",
     "build_tactical_house_view_affected_cohort",
     "clear_tactical_house_view_affected_cohorts_for_tests",
+    "configure_tactical_house_view_cohort_repository",
+    "get_tactical_house_view_affected_cohort",
+    "get_tactical_house_view_cohort_repository",
     "list_tactical_house_view_affected_cohorts",
+    "page_tactical_house_view_affected_portfolios",
+    "page_tactical_house_view_excluded_portfolios",
     "record_tactical_house_view_affected_cohort",
+    "summarize_tactical_house_view_affected_cohort",
 ]
@@ -0,0 +1,213 @@
+"""Incremental tactical house-view cohort classification and identity hashing."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Generic, TypeVar
+
+from src.core.common.canonical import canonical_json, hash_canonical_mapping, strip_keys
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewAffectedPortfolio,
+    TacticalHouseViewCandidatePortfolio,
+    TacticalHouseViewCohortRequest,
+    TacticalHouseViewCohortStreamHeader,
+    TacticalHouseViewDefinition,
+    TacticalHouseViewExcludedPortfolio,
+    TacticalHouseViewSourceRef,
+)
+from src.core.tactical_house_view_rules import (
+    candidate_exclusion_reasons,
+    candidate_inclusion_reason_codes,
+    dedupe_source_refs,
+    normalize_portfolio_type,
+    supportability,
+)
+
+_PORTFOLIO_SEQUENCES = ("affected_portfolios", "excluded_portfolios")
+_CONTENT_HASH_EXCLUDED_KEYS = frozenset({"content_hash"})
+# cohort_id and generated_at only exist at the top level, so portfolio items encoded without
+# content_hash serve both the identity hash and the content hash.
+_IDENTITY_EXCLUDED_KEYS = frozenset({"cohort_id", "content_hash", "generated_at"})
+
+_SourceRefKey = tuple[str, str, str, str | None]
+
+
+_PortfolioT = TypeVar(
+    "_PortfolioT",
+    TacticalHouseViewAffectedPortfolio,
+    TacticalHouseViewExcludedPortfolio,
+)
+
+
+@dataclass(frozen=True)
+class _ClassifiedPortfolio(Generic[_PortfolioT]):
+    portfolio: _PortfolioT
+    canonical_item: bytes
+
+
+class TacticalHouseViewCohortBuilder:
+    """Classify candidates one at a time and hash the cohort without re-serializing it.
+
+    Each classified portfolio is encoded to canonical JSON once, when it is added. The cohort
+    and content hashes then stream those encodings through SHA-256, so they equal the canonical
+    hash of the full cohort payload without building payload copies.
+    """
+
+    def __init__(
+        self,
+        *,
+        tactical_view: TacticalHouseViewDefinition,
+        eligible_portfolio_types: list[str],
+        min_exposure_weight: Decimal | None,
+        correlation_id: str,
+    ) -> None:
+        self._tactical_view = tactical_view
+        self._eligible_types = {
+            normalize_portfolio_type(value) for value in eligible_portfolio_types
+        }
+        self._min_exposure_weight = min_exposure_weight
+        self._correlation_id = correlation_id
+        self._affected: list[_ClassifiedPortfolio[TacticalHouseViewAffectedPortfolio]] = []
+        self._excluded: list[_ClassifiedPortfolio[TacticalHouseViewExcludedPortfolio]] = []
+        self._source_refs: dict[_SourceRefKey, TacticalHouseViewSourceRef] = {}
+        self._evaluated_candidate_count = 0
+        self._add_source_refs(tactical_view.source_refs)
+
+    @classmethod
+    def from_stream_header(
+        cls,
+        header: TacticalHouseViewCohortStreamHeader,
+    ) -> TacticalHouseViewCohortBuilder:
+        return cls(
+            tactical_view=header.tactical_view,
+            eligible_portfolio_types=header.eligible_portfolio_types,
+            min_exposure_weight=header.min_exposure_weight,
+            correlation_id=header.correlation_id,
+        )
+
+    @classmethod
+    def from_request(
+        cls, request: TacticalHouseViewCohortRequest
+    ) -> TacticalHouseViewCohortBuilder:
+        builder = cls(
+            tactical_view=request.tactical_view,
+            eligible_portfolio_types=request.eligible_portfolio_types,
+            min_exposure_weight=request.min_exposure_weight,
+            correlation_id=request.correlation_id,
+        )
+        for candidate in request.candidate_portfolios:
+            builder.add_candidate(candidate)
+        return builder
+
+    @property
+    def evaluated_candidate_count(self) -> int:
+        return self._evaluated_candidate_count
+
+    def add_candidate(self, candidate: TacticalHouseViewCandidatePortfolio) -> None:
+        self._evaluated_candidate_count += 1
+        self._add_source_refs(candidate.source_refs)
+        exclusion_reasons = candidate_exclusion_reasons(
+            candidate=candidate,
+            eligible_types=self._eligible_types,
+            min_exposure_weight=self._min_exposure_weight,
+        )
+        if exclusion_reasons:
+            self._excluded.append(
+                _classified(
+                    TacticalHouseViewExcludedPortfolio(
+                        portfolio_id=candidate.portfolio_id,
+                        exclusion_reason_codes=exclusion_reasons,
+                        source_refs=candidate.source_refs,
+                    )
+                )
+            )
+            return
+        self._affected.append(
+            _classified(
+                TacticalHouseViewAffectedPortfolio(
+                    portfolio_id=candidate.portfolio_id,
+                    mandate_id=candidate.mandate_id,
+                    inclusion_reason_codes=candidate_inclusion_reason_codes(candidate),
+                    source_refs=candidate.source_refs,
+                )
+            )
+        )
+
+    def build(self, *, generated_at: datetime) -> TacticalHouseViewAffectedCohort:
+        """Return the cohort with deterministic ``cohort_id`` and ``content_hash`` identities."""
+        affected = sorted(self._affected, key=_portfolio_id)
+        excluded = sorted(self._excluded, key=_portfolio_id)
+        cohort = TacticalHouseViewAffectedCohort(
+            cohort_id="",
+            tactical_view_id=self._tactical_view.tactical_view_id,
+            tactical_view_version=self._tactical_view.tactical_view_version,
+            theme_id=self._tactical_view.theme_id,
+            as_of_date=self._tactical_view.as_of_date,
+            target_action=self._tactical_view.target_action,
+            affected_portfolios=[item.portfolio for item in affected],
+            excluded_portfolios=[item.portfolio for item in excluded],
+            supportability=supportability(
+                evaluated_candidate_count=self._evaluated_candidate_count,
+                affected_count=len(affected),
+                excluded_count=len(excluded),
+            ),
+            source_refs=dedupe_source_refs(list(self._source_refs.values())),
+            content_hash="",
+            generated_at=generated_at.isoformat(),
+            correlation_id=self._correlation_id,
+        )
+        envelope = strip_keys(
+            cohort.model_dump(mode="json", exclude={*_PORTFOLIO_SEQUENCES}),
+            exclude=set(_CONTENT_HASH_EXCLUDED_KEYS),
+        )
+        cohort.cohort_id = _hash_cohort(
+            {key: value for key, value in envelope.items() if key not in _IDENTITY_EXCLUDED_KEYS},
+            affected=affected,
+            excluded=excluded,
+        )
+        envelope["cohort_id"] = cohort.cohort_id
+        cohort.content_hash = _hash_cohort(envelope, affected=affected, excluded=excluded)
+        return cohort
+
+    def _add_source_refs(self, refs: list[TacticalHouseViewSourceRef]) -> None:
+        for ref in refs:
+            self._source_refs[
+                (ref.source_system, ref.source_type, ref.source_id, ref.source_version)
+            ] = ref
+
+
+def _classified(portfolio: _PortfolioT) -> _ClassifiedPortfolio[_PortfolioT]:
+    return _ClassifiedPortfolio(
+        portfolio=portfolio,
+        canonical_item=canonical_json(
+            portfolio.model_dump(mode="json"), exclude=_CONTENT_HASH_EXCLUDED_KEYS
+        ).encode("utf-8"),
+    )
+
+
+def _portfolio_id(
+    item: _ClassifiedPortfolio[TacticalHouseViewAffectedPortfolio]
+    | _ClassifiedPortfolio[TacticalHouseViewExcludedPortfolio],
+) -> str:
+    return item.portfolio.portfolio_id
+
+
+def _hash_cohort(
+    fields: dict[str, Any],
+    *,
+    affected: list[_ClassifiedPortfolio[TacticalHouseViewAffectedPortfolio]],
+    excluded: list[_ClassifiedPortfolio[TacticalHouseViewExcludedPortfolio]],
+) -> str:
+    return hash_canonical_mapping(
+        fields,
+        encoded_sequences={
+            "affected_portfolios": (item.canonical_item for item in affected),
+            "excluded_portfolios": (item.canonical_item for item in excluded),
+        },
+    )
+
+
+__all__ = ["TacticalHouseViewCohortBuilder"]
@@ -9,6 +9,8 @@ TacticalHouseViewAction = Literal["INCREASE", "REDUCE", "REVIEW", "EXCLUDE"]
 TacticalHouseViewAlignment = Literal["OVERWEIGHT", "UNDERWEIGHT", "ALIGNED", "UNKNOWN"]
 TacticalHouseViewSupportabilityState = Literal["READY", "EMPTY", "BLOCKED"]
 
+TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE = 500
+
 
 class TacticalHouseViewSourceRef(BaseModel):
     source_system: str = Field(
@@ -136,6 +138,29 @@ class TacticalHouseViewCohortRequest(BaseModel):
         return self
 
 
+class TacticalHouseViewCohortStreamHeader(BaseModel):
+    tactical_view: TacticalHouseViewDefinition = Field(
+        description="Governed bank tactical house-view instruction."
+    )
+    eligible_portfolio_types: list[str] = Field(
+        default_factory=lambda: ["DISCRETIONARY", "MANAGED"],
+        description="Portfolio types eligible for downstream portfolio-management consumption.",
+    )
+    min_exposure_weight: Decimal | None = Field(
+        default=None,
+        ge=Decimal("0"),
+        le=Decimal("1"),
+        description="Optional minimum source-owned exposure weight required for inclusion.",
+    )
+    correlation_id: str = Field(description="Caller correlation identifier.")
+
+    @model_validator(mode="after")
+    def validate_header(self) -> "TacticalHouseViewCohortStreamHeader":
+        if not self.eligible_portfolio_types:
+            raise ValueError("eligible_portfolio_types must contain at least one value")
+        return self
+
+
 class TacticalHouseViewAffectedPortfolio(BaseModel):
     portfolio_id: str = Field(description="Affected portfolio identifier.")
     mandate_id: str | None = Field(default=None, description="Mandate identifier when available.")
@@ -189,15 +214,71 @@ class TacticalHouseViewAffectedCohort(BaseModel):
     correlation_id: str = Field(description="Correlation identifier.")
 
 
+class TacticalHouseViewAffectedCohortSummary(BaseModel):
+    product_name: Literal["TacticalHouseViewAffectedCohort"] = Field(
+        default="TacticalHouseViewAffectedCohort",
+        description="Domain data product emitted by lotus-advise.",
+    )
+    product_version: Literal["v1"] = Field(default="v1", description="Product version.")
+    cohort_id: str = Field(description="Stable content-addressed cohort identifier.")
+    tactical_view_id: str = Field(description="Bank tactical house-view identifier.")
+    tactical_view_version: str = Field(description="House-view version.")
+    theme_id: str = Field(description="Tactical theme identifier.")
+    as_of_date: str = Field(description="Cohort business as-of date.")
+    target_action: TacticalHouseViewAction = Field(description="Tactical action evaluated.")
+    supportability: TacticalHouseViewSupportability = Field(
+        description="Product supportability posture, including affected and excluded counts."
+    )
+    source_refs: list[TacticalHouseViewSourceRef] = Field(
+        description="House-view and candidate source refs preserved for consumers."
+    )
+    content_hash: str = Field(
+        description="Canonical hash of the full stored cohort payload, including all portfolios."
+    )
+    generated_at: str = Field(description="UTC generation timestamp.")
+    correlation_id: str = Field(description="Correlation identifier.")
+
+
+class TacticalHouseViewAffectedPortfolioPage(BaseModel):
+    cohort_id: str = Field(description="Stored cohort identifier.")
+    items: list[TacticalHouseViewAffectedPortfolio] = Field(
+        description="Affected portfolios ordered by portfolio identifier.",
+        max_length=TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE,
+    )
+    total_count: int = Field(ge=0, description="Affected portfolios in the stored cohort.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor to request the next page, or null when the page is complete.",
+    )
+
+
+class TacticalHouseViewExcludedPortfolioPage(BaseModel):
+    cohort_id: str = Field(description="Stored cohort identifier.")
+    items: list[TacticalHouseViewExcludedPortfolio] = Field(
+        description="Excluded portfolios ordered by portfolio identifier.",
+        max_length=TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE,
+    )
+    total_count: int = Field(ge=0, description="Excluded portfolios in the stored cohort.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor to request the next page, or null when the page is complete.",
+    )
+
+
 __all__ = [
+    "TACTICAL_HOUSE_VIEW_COHORT_PAGE_MAX_SIZE",
     "TacticalHouseViewAction",
     "TacticalHouseViewAffectedCohort",
+    "TacticalHouseViewAffectedCohortSummary",
     "TacticalHouseViewAffectedPortfolio",
+    "TacticalHouseViewAffectedPortfolioPage",
     "TacticalHouseViewAlignment",
     "TacticalHouseViewCandidatePortfolio",
     "TacticalHouseViewCohortRequest",
+    "TacticalHouseViewCohortStreamHeader",
     "TacticalHouseViewDefinition",
     "TacticalHouseViewExcludedPortfolio",
+    "TacticalHouseViewExcludedPortfolioPage",
     "TacticalHouseViewSourceRef",
     "TacticalHouseViewSupportability",
     "TacticalHouseViewSupportabilityState",
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Literal
+
+TacticalHouseViewCohortMembership = Literal["affected", "excluded"]
+
+TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE = 100
+_INVALID_CURSOR = "TACTICAL_HOUSE_VIEW_COHORT_CURSOR_INVALID"
+
+
+def encode_cohort_portfolio_cursor(
+    *,
+    cohort_id: str,
+    membership: TacticalHouseViewCohortMembership,
+    offset: int,
+) -> str:
+    payload = {"cohort_id": cohort_id, "membership": membership, "offset": offset}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def decode_cohort_portfolio_cursor(
+    cursor: str | None,
+    *,
+    cohort_id: str,
+    membership: TacticalHouseViewCohortMembership,
+) -> int:
+    """Return the page offset for a cursor issued for the same cohort and membership list."""
+    if cursor is None:
+        return 0
+    try:
+        padded = cursor + ("=" * (-len(cursor) % 4))
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, ValueError, UnicodeError) as exc:
+        raise ValueError(_INVALID_CURSOR) from exc
+    if not isinstance(payload, dict):
+        raise ValueError(_INVALID_CURSOR)
+    offset = payload.get("offset")
+    if (
+        payload.get("cohort_id") != cohort_id
+        or payload.get("membership") != membership
+        or not isinstance(offset, int)
+        or isinstance(offset, bool)
+        or offset < 0
+    ):
+        raise ValueError(_INVALID_CURSOR)
+    return offset
+
+
+__all__ = [
+    "TACTICAL_HOUSE_VIEW_COHORT_DEFAULT_PAGE_SIZE",
+    "TacticalHouseViewCohortMembership",
+    "decode_cohort_portfolio_cursor",
+    "encode_cohort_portfolio_cursor",
+]
@@ -0,0 +1,171 @@
+"""Tactical house-view cohort persistence port and indexed in-memory adapter."""
+
+from __future__ import annotations
+
+from bisect import insort
+from itertools import islice
+from threading import RLock
+from typing import Protocol
+
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewAffectedPortfolio,
+    TacticalHouseViewExcludedPortfolio,
+)
+
+_RecencyKey = tuple[str, str]
+
+
+class TacticalHouseViewCohortRepository(Protocol):
+    """Cohort store keyed by ``cohort_id`` with portfolio and recency indexes.
+
+    ``list_cohorts`` returns cohort projections, not full cohorts: excluded portfolios are
+    omitted, and when ``portfolio_id`` is given only that portfolio's affected entries are
+    kept. Callers that need every member use ``get_cohort`` or the page methods.
+    """
+
+    def save_cohort(self, cohort: TacticalHouseViewAffectedCohort) -> None: ...
+
+    def get_cohort(self, *, cohort_id: str) -> TacticalHouseViewAffectedCohort | None: ...
+
+    def list_cohorts(
+        self,
+        *,
+        portfolio_id: str | None,
+        limit: int,
+    ) -> list[TacticalHouseViewAffectedCohort]: ...
+
+    def page_affected_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewAffectedPortfolio], int] | None: ...
+
+    def page_excluded_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewExcludedPortfolio], int] | None: ...
+
+
+class InMemoryTacticalHouseViewCohortRepository:
+    """Process-local cohort store with the same indexes as the Postgres tables.
+
+    A portfolio-to-cohort index and a sorted recency list let portfolio lookups touch only
+    the cohorts that contain the portfolio instead of scanning every stored cohort.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._cohorts: dict[str, TacticalHouseViewAffectedCohort] = {}
+        self._recency: list[_RecencyKey] = []
+        self._portfolio_index: dict[str, set[str]] = {}
+
+    def save_cohort(self, cohort: TacticalHouseViewAffectedCohort) -> None:
+        stored = cohort.model_copy(deep=True)
+        with self._lock:
+            existing = self._cohorts.get(stored.cohort_id)
+            if existing is not None:
+                self._recency.remove(_recency_key(existing))
+            else:
+                for affected in stored.affected_portfolios:
+                    self._portfolio_index.setdefault(affected.portfolio_id, set()).add(
+                        stored.cohort_id
+                    )
+            self._cohorts[stored.cohort_id] = stored
+            insort(self._recency, _recency_key(stored))
+
+    def get_cohort(self, *, cohort_id: str) -> TacticalHouseViewAffectedCohort | None:
+        with self._lock:
+            cohort = self._cohorts.get(cohort_id)
+        return cohort.model_copy(deep=True) if cohort is not None else None
+
+    def list_cohorts(
+        self,
+        *,
+        portfolio_id: str | None,
+        limit: int,
+    ) -> list[TacticalHouseViewAffectedCohort]:
+        with self._lock:
+            if portfolio_id is None:
+                keys = list(islice(reversed(self._recency), limit))
+            else:
+                keys = sorted(
+                    (
+                        _recency_key(self._cohorts[cohort_id])
+                        for cohort_id in self._portfolio_index.get(portfolio_id, ())
+                    ),
+                    reverse=True,
+                )[:limit]
+            cohorts = [self._cohorts[cohort_id] for _generated_at, cohort_id in keys]
+        return [project_cohort_listing(cohort, portfolio_id=portfolio_id) for cohort in cohorts]
+
+    def page_affected_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewAffectedPortfolio], int] | None:
+        with self._lock:
+            cohort = self._cohorts.get(cohort_id)
+        if cohort is None:
+            return None
+        portfolios = cohort.affected_portfolios
+        return (
+            [item.model_copy(deep=True) for item in portfolios[offset : offset + limit]],
+            len(portfolios),
+        )
+
+    def page_excluded_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewExcludedPortfolio], int] | None:
+        with self._lock:
+            cohort = self._cohorts.get(cohort_id)
+        if cohort is None:
+            return None
+        portfolios = cohort.excluded_portfolios
+        return (
+            [item.model_copy(deep=True) for item in portfolios[offset : offset + limit]],
+            len(portfolios),
+        )
+
+
+def project_cohort_listing(
+    cohort: TacticalHouseViewAffectedCohort,
+    *,
+    portfolio_id: str | None,
+) -> TacticalHouseViewAffectedCohort:
+    """Return the listing projection of a cohort described on the repository protocol."""
+    projected: TacticalHouseViewAffectedCohort = cohort.model_copy(
+        update={
+            "affected_portfolios": [
+                affected.model_copy(deep=True)
+                for affected in cohort.affected_portfolios
+                if portfolio_id is None or affected.portfolio_id == portfolio_id
+            ],
+            "excluded_portfolios": [],
+            "supportability": cohort.supportability.model_copy(deep=True),
+            "source_refs": [ref.model_copy(deep=True) for ref in cohort.source_refs],
+        }
+    )
+    return projected
+
+
+def _recency_key(cohort: TacticalHouseViewAffectedCohort) -> _RecencyKey:
+    return (cohort.generated_at, cohort.cohort_id)
+
+
+__all__ = [
+    "InMemoryTacticalHouseViewCohortRepository",
+    "TacticalHouseViewCohortRepository",
+    "project_cohort_listing",
+]
@@ -0,0 +1,312 @@
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import islice
+from threading import Lock
+
+from src.core.common.diagnostics import make_empty_data_quality_log
+from src.core.diagnostics_models import DiagnosticsData
+from src.core.engine_options_models import EngineOptions
+from src.core.portfolio_models import ModelPortfolio, ShelfEntry
+from src.core.target_batch_models import (
+    TargetBatchPortfolio,
+    TargetBatchPortfolioError,
+    TargetBatchPortfolioResult,
+    TargetBatchRequest,
+    TargetBatchSummary,
+)
+from src.core.target_generation import generate_targets_solver
+
+DEFAULT_TARGET_BATCH_MAX_WORKERS = 4
+TARGET_BATCH_MAX_WORKERS_ENV = "TARGET_BATCH_MAX_WORKERS"
+TARGET_BATCH_CHUNKS_PER_WORKER = 4
+TARGET_BATCH_ITEM_FAILED = "TARGET_BATCH_ITEM_FAILED"
+
+TargetBatchItemRecord = TargetBatchPortfolioResult | TargetBatchPortfolioError
+TargetBatchRecord = TargetBatchItemRecord | TargetBatchSummary
+_IndexedPortfolio = tuple[int, TargetBatchPortfolio]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TargetBatchSharedInputs:
+    """Model, shelf, and options read once per batch and shipped once with each worker chunk."""
+
+    model: ModelPortfolio
+    shelf: list[ShelfEntry]
+    options: EngineOptions
+
+
+_POOL_LOCK = Lock()
+_POOL: ProcessPoolExecutor | None = None
+
+
+def target_batch_max_workers() -> int:
+    raw_value = os.getenv(TARGET_BATCH_MAX_WORKERS_ENV)
+    if raw_value is None or not raw_value.strip():
+        return min(DEFAULT_TARGET_BATCH_MAX_WORKERS, os.cpu_count() or 1)
+    try:
+        max_workers = int(raw_value.strip())
+    except ValueError as exc:
+        raise RuntimeError("TARGET_BATCH_MAX_WORKERS_INVALID") from exc
+    if max_workers < 0:
+        raise RuntimeError("TARGET_BATCH_MAX_WORKERS_INVALID")
+    return max_workers
+
+
+def solve_target_batch_portfolio(
+    *,
+    shared: TargetBatchSharedInputs,
+    sequence: int,
+    portfolio: TargetBatchPortfolio,
+) -> TargetBatchPortfolioResult:
+    started_at = time.perf_counter()
+    diagnostics = DiagnosticsData(data_quality=make_empty_data_quality_log())
+    targets, status = generate_targets_solver(
+        model=shared.model,
+        eligible_targets=dict(portfolio.eligible_targets),
+        buy_list=list(portfolio.buy_list),
+        sell_only_excess=portfolio.sell_only_excess,
+        shelf=shared.shelf,
+        options=shared.options,
+        total_val=portfolio.total_value.amount,
+        base_ccy=portfolio.total_value.currency,
+        diagnostics=diagnostics,
+    )
+    return TargetBatchPortfolioResult(
+        sequence=sequence,
+        portfolio_id=portfolio.portfolio_id,
+        status=status,
+        targets=targets,
+        warnings=diagnostics.warnings,
+        solve_ms=int((time.perf_counter() - started_at) * 1000),
+    )
+
+
+def stream_target_batch(
+    request: TargetBatchRequest,
+    *,
+    max_workers: int | None = None,
+) -> Iterator[TargetBatchRecord]:
+    """Solve every portfolio against the shared model and shelf, yielding results as they finish.
+
+    Portfolio records arrive in completion order and carry their request ``sequence``. A
+    portfolio whose solve fails yields an ``ERROR`` record instead, and the batch carries on.
+    The final record is always the batch summary.
+    """
+    started_at = time.perf_counter()
+    shared = TargetBatchSharedInputs(
+        model=request.model,
+        shelf=request.shelf,
+        options=request.options,
+    )
+    pool_workers = target_batch_max_workers()
+    requested_workers = pool_workers if max_workers is None else min(max_workers, pool_workers)
+    worker_count = min(requested_workers, len(request.portfolios))
+    if worker_count <= 1:
+        worker_count = 0
+        records = _solve_in_process(shared=shared, portfolios=request.portfolios)
+    else:
+        records = _solve_in_process_pool(
+            pool=_resolve_pool(pool_workers),
+            shared=shared,
+            portfolios=request.portfolios,
+            worker_count=worker_count,
+        )
+
+    status_counts: Counter[str] = Counter()
+    error_count = 0
+    for record in records:
+        if isinstance(record, TargetBatchPortfolioError):
+            error_count += 1
+        else:
+            status_counts[record.status] += 1
+        yield record
+    yield _batch_summary(
+        status_counts=status_counts,
+        error_count=error_count,
+        worker_count=worker_count,
+        elapsed_seconds=time.perf_counter() - started_at,
+    )
+
+
+def shutdown_target_batch_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def reset_target_batch_pool_for_tests() -> None:
+    shutdown_target_batch_pool()
+
+
+def _resolve_pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # CVXPY and OSQP hold the GIL for most of a solve, so portfolios fan out to processes.
+            # Spawned workers avoid inheriting server threads and locks through fork.
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _solve_target_batch_item(
+    *,
+    shared: TargetBatchSharedInputs,
+    sequence: int,
+    portfolio: TargetBatchPortfolio,
+) -> TargetBatchItemRecord:
+    try:
+        return solve_target_batch_portfolio(shared=shared, sequence=sequence, portfolio=portfolio)
+    except Exception:
+        logger.exception("Target batch portfolio solve failed")
+        return _item_error(sequence=sequence, portfolio=portfolio)
+
+
+def _item_error(*, sequence: int, portfolio: TargetBatchPortfolio) -> TargetBatchPortfolioError:
+    return TargetBatchPortfolioError(
+        sequence=sequence,
+        portfolio_id=portfolio.portfolio_id,
+        error_code=TARGET_BATCH_ITEM_FAILED,
+    )
+
+
+def _solve_in_process(
+    *,
+    shared: TargetBatchSharedInputs,
+    portfolios: list[TargetBatchPortfolio],
+) -> Iterator[TargetBatchItemRecord]:
+    for sequence, portfolio in enumerate(portfolios):
+        yield _solve_target_batch_item(shared=shared, sequence=sequence, portfolio=portfolio)
+
+
+def _solve_in_process_pool(
+    *,
+    pool: ProcessPoolExecutor,
+    shared: TargetBatchSharedInputs,
+    portfolios: list[TargetBatchPortfolio],
+    worker_count: int,
+) -> Iterator[TargetBatchItemRecord]:
+    # The pool is shared by every request, so each request keeps at most ``worker_count`` chunks
+    # in flight. Chunks carry the shared inputs, which bounds how often they are pickled.
+    chunk_count = worker_count * TARGET_BATCH_CHUNKS_PER_WORKER
+    chunk_size = -(-len(portfolios) // chunk_count)
+    items = list(enumerate(portfolios))
+    chunks = iter([items[start : start + chunk_size] for start in range(0, len(items), chunk_size)])
+    in_flight: dict[Future[list[TargetBatchItemRecord]], list[_IndexedPortfolio]] = {}
+    try:
+        for chunk in islice(chunks, worker_count):
+            yield from _submit_chunk(pool=pool, shared=shared, chunk=chunk, in_flight=in_flight)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = in_flight.pop(future)
+                yield from _chunk_records(pool=pool, future=future, chunk=chunk)
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    yield from _submit_chunk(
+                        pool=pool, shared=shared, chunk=next_chunk, in_flight=in_flight
+                    )
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def _submit_chunk(
+    *,
+    pool: ProcessPoolExecutor,
+    shared: TargetBatchSharedInputs,
+    chunk: list[_IndexedPortfolio],
+    in_flight: dict[Future[list[TargetBatchItemRecord]], list[_IndexedPortfolio]],
+) -> Iterator[TargetBatchPortfolioError]:
+    try:
+        in_flight[pool.submit(_solve_chunk_in_worker, shared, chunk)] = chunk
+    except (BrokenProcessPool, RuntimeError):
+        logger.exception("Target batch chunk could not be submitted")
+        _discard_pool(pool)
+        for sequence, portfolio in chunk:
+            yield _item_error(sequence=sequence, portfolio=portfolio)
+
+
+def _chunk_records(
+    *,
+    pool: ProcessPoolExecutor,
+    future: Future[list[TargetBatchItemRecord]],
+    chunk: list[_IndexedPortfolio],
+) -> Iterator[TargetBatchItemRecord]:
+    try:
+        records = future.result()
+    except Exception as exc:
+        logger.exception("Target batch worker failed")
+        if isinstance(exc, BrokenProcessPool):
+            _discard_pool(pool)
+        records = [
+            _item_error(sequence=sequence, portfolio=portfolio) for sequence, portfolio in chunk
+        ]
+    yield from records
+
+
+def _solve_chunk_in_worker(
+    shared: TargetBatchSharedInputs,
+    chunk: list[_IndexedPortfolio],
+) -> list[TargetBatchItemRecord]:
+    return [
+        _solve_target_batch_item(shared=shared, sequence=sequence, portfolio=portfolio)
+        for sequence, portfolio in chunk
+    ]
+
+
+def _batch_summary(
+    *,
+    status_counts: Counter[str],
+    error_count: int,
+    worker_count: int,
+    elapsed_seconds: float,
+) -> TargetBatchSummary:
+    portfolio_count = sum(status_counts.values()) + error_count
+    elapsed = Decimal(str(max(elapsed_seconds, 1e-6)))
+    return TargetBatchSummary(
+        portfolio_count=portfolio_count,
+        status_counts=dict(sorted(status_counts.items())),
+        error_count=error_count,
+        worker_count=worker_count,
+        elapsed_seconds=elapsed.quantize(Decimal("0.001")),
+        portfolios_per_second=(Decimal(portfolio_count) / elapsed).quantize(Decimal("0.01")),
+    )
+
+
+__all__ = [
+    "DEFAULT_TARGET_BATCH_MAX_WORKERS",
+    "TARGET_BATCH_CHUNKS_PER_WORKER",
+    "TARGET_BATCH_ITEM_FAILED",
+    "TARGET_BATCH_MAX_WORKERS_ENV",
+    "TargetBatchItemRecord",
+    "TargetBatchRecord",
+    "TargetBatchSharedInputs",
+    "reset_target_batch_pool_for_tests",
+    "shutdown_target_batch_pool",
+    "solve_target_batch_portfolio",
+    "stream_target_batch",
+    "target_batch_max_workers",
+]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from src.core.engine_options_models import EngineOptions
+from src.core.portfolio_models import ModelPortfolio, Money, ShelfEntry
+from src.core.universe_target_models import TargetInstrument
+
+TARGET_BATCH_MAX_PORTFOLIOS = 1000
+
+
+class TargetBatchPortfolio(BaseModel):
+    portfolio_id: str = Field(
+        description="Portfolio identifier for the per-portfolio target solve.",
+        examples=["PB_SG_GLOBAL_BAL_001"],
+    )
+    total_value: Money = Field(description="Portfolio total value in base currency.")
+    eligible_targets: Dict[str, Decimal] = Field(
+        description=(
+            "Post-eligibility starting weights by instrument, including locked holdings that "
+            "the solver must keep."
+        ),
+        examples=[{"EQ_A": "0.40", "EQ_B": "0.40", "BOND_A": "0.20"}],
+    )
+    buy_list: List[str] = Field(
+        default_factory=list,
+        description="Instruments the solver may reweight; all other targets stay locked.",
+        examples=[["EQ_A", "EQ_B", "BOND_A"]],
+    )
+    sell_only_excess: Decimal = Field(
+        default=Decimal("0"),
+        ge=Decimal("0"),
+        description="Weight released by sell-only instruments to redistribute across buys.",
+        examples=["0"],
+    )
+
+
+class TargetBatchRequest(BaseModel):
+    model: ModelPortfolio = Field(description="Reference model shared by every portfolio.")
+    shelf: List[ShelfEntry] = Field(
+        description="Product shelf shared by every portfolio in the batch."
+    )
+    options: EngineOptions = Field(
+        default_factory=EngineOptions,
+        description="Engine options shared by every portfolio in the batch.",
+    )
+    portfolios: List[TargetBatchPortfolio] = Field(
+        min_length=1,
+        max_length=TARGET_BATCH_MAX_PORTFOLIOS,
+        description="Portfolios to solve against the shared model and shelf.",
+    )
+
+    model_config = {"protected_namespaces": ()}
+
+    @model_validator(mode="after")
+    def validate_unique_portfolio_ids(self) -> "TargetBatchRequest":
+        portfolio_ids = [portfolio.portfolio_id for portfolio in self.portfolios]
+        if len(set(portfolio_ids)) != len(portfolio_ids):
+            raise ValueError("portfolios must have unique portfolio_id values")
+        return self
+
+
+class TargetBatchPortfolioResult(BaseModel):
+    record_type: Literal["PORTFOLIO"] = Field(
+        default="PORTFOLIO",
+        description="Stream record discriminator.",
+    )
+    sequence: int = Field(description="Zero-based position of the portfolio in the request.")
+    portfolio_id: str = Field(description="Portfolio identifier.")
+    status: str = Field(
+        description="Target generation status.",
+        examples=["READY"],
+    )
+    targets: List[TargetInstrument] = Field(
+        default_factory=list,
+        description="Instrument-level target trace; empty when the solve is blocked.",
+    )
+    warnings: List[str] = Field(
+        default_factory=list,
+        description="Solver warnings, including infeasibility hints for blocked solves.",
+    )
+    solve_ms: int = Field(description="Wall-clock milliseconds spent on this portfolio.")
+
+
+class TargetBatchPortfolioError(BaseModel):
+    record_type: Literal["ERROR"] = Field(
+        default="ERROR",
+        description="Stream record discriminator.",
+    )
+    sequence: int = Field(description="Zero-based position of the portfolio in the request.")
+    portfolio_id: str = Field(description="Portfolio identifier.")
+    error_code: str = Field(
+        description="Support-safe reason the portfolio could not be solved.",
+        examples=["TARGET_BATCH_ITEM_FAILED"],
+    )
+
+
+class TargetBatchSummary(BaseModel):
+    record_type: Literal["SUMMARY"] = Field(
+        default="SUMMARY",
+        description="Stream record discriminator.",
+    )
+    portfolio_count: int = Field(description="Number of portfolios streamed, including errors.")
+    status_counts: Dict[str, int] = Field(description="Solved portfolio count by target status.")
+    error_count: int = Field(description="Portfolios that failed with an isolated error.")
+    worker_count: int = Field(description="Solver processes used; 0 means solved in-process.")
+    elapsed_seconds: Decimal = Field(description="Wall-clock seconds for the whole batch.")
+    portfolios_per_second: Decimal = Field(description="Batch throughput.")
+
+
+__all__ = [
+    "TARGET_BATCH_MAX_PORTFOLIOS",
+    "TargetBatchPortfolio",
+    "TargetBatchPortfolioError",
+    "TargetBatchPortfolioResult",
+    "TargetBatchRequest",
+    "TargetBatchSummary",
+]
@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
@@ -5,6 +6,12 @@ from typing import Any
 from src.core.diagnostics_models import DiagnosticsData
 from src.core.engine_options_models import EngineOptions
 from src.core.portfolio_models import Money, ShelfEntry
+from src.core.target_solver_cache import (
+    TARGET_SOLVER_PROBLEM_CACHE,
+    CompiledTargetSolverProblem,
+    TargetSolverProblemCache,
+    TargetSolverProblemStructure,
+)
 from src.core.universe_target_models import TargetInstrument
 
 _SOLVER_STATUS_OPTIMAL = {"optimal", "optimal_inaccurate"}
@@ -23,9 +30,12 @@ class _TargetSolverIndex:
 
 @dataclass(frozen=True)
 class _TargetSolverProblem:
-    variable: Any
-    objective: Any
-    constraints: list[Any]
+    structure: TargetSolverProblemStructure
+    model_weights: Any
+    invested_min: float
+    invested_max: float
+    single_position_cap: float | None
+    group_capacities: tuple[float, ...]
 
 
 @dataclass(frozen=True)
@@ -470,30 +480,14 @@ def _known_shelf_attr_keys(shelf_attrs_by_id: dict[str, dict[str, str]]) -> set[
     return {key for attrs in shelf_attrs_by_id.values() for key in attrs}
 
 
-def _append_cash_band_constraints(
+def _target_group_layout(
     *,
-    cp: Any,
-    w: Any,
-    constraints: list[Any],
-    locked_weight: Decimal,
-    options: EngineOptions,
-) -> None:
-    invested_min = Decimal("1.0") - options.cash_band_max_weight - locked_weight
-    invested_max = Decimal("1.0") - options.cash_band_min_weight - locked_weight
-    constraints.append(cp.sum(w) >= float(invested_min))
-    constraints.append(cp.sum(w) <= float(invested_max))
-
-
-def _append_group_constraints(
-    *,
-    cp: Any,
-    w: Any,
-    constraints: list[Any],
     solver_index: _TargetSolverIndex,
     eligible_targets: dict[str, Decimal],
     options: EngineOptions,
     diagnostics: DiagnosticsData,
-) -> None:
+) -> list[tuple[tuple[int, ...], Decimal]]:
+    layout: list[tuple[tuple[int, ...], Decimal]] = []
     for constraint_key in sorted(options.group_constraints.keys()):
         constraint = options.group_constraints[constraint_key]
         attr_key, attr_val = constraint_key.split(":", 1)
@@ -511,11 +505,11 @@ def _append_group_constraints(
         if not exposure.tradeable_ids and exposure.locked_weight == Decimal("0"):
             continue
 
-        group_locked_weight = exposure.locked_weight
-        group_expr = cp.sum(
-            [w[solver_index.indexed_tradeable[i_id]] for i_id in exposure.tradeable_ids]
-        ) + float(group_locked_weight)
-        constraints.append(group_expr <= float(constraint.max_weight))
+        member_indices = tuple(
+            solver_index.indexed_tradeable[i_id] for i_id in exposure.tradeable_ids
+        )
+        layout.append((member_indices, constraint.max_weight - exposure.locked_weight))
+    return layout
 
 
 def _solver_group_constraint_exposure(
@@ -543,7 +537,6 @@ def _solver_group_constraint_exposure(
 
 def _build_target_solver_problem(
     *,
-    cp: Any,
     np: Any,
     model: Any,
     solver_index: _TargetSolverIndex,
@@ -551,45 +544,80 @@ def _build_target_solver_problem(
     options: EngineOptions,
     diagnostics: DiagnosticsData,
 ) -> _TargetSolverProblem:
-    model_weights = {t.instrument_id: t.weight for t in model.targets}
-    w_model = np.array(
-        [float(model_weights.get(i_id, Decimal("0.0"))) for i_id in solver_index.tradeable_ids]
-    )
-    w = cp.Variable(len(solver_index.tradeable_ids))
+    """
+    Split the target QP into a cacheable structure and the per-call parameter values.
 
-    objective = cp.Minimize(cp.sum_squares(w - w_model))
-    constraints = [w >= 0]
-    _append_cash_band_constraints(
-        cp=cp,
-        w=w,
-        constraints=constraints,
-        locked_weight=solver_index.locked_weight,
+    Structure covers the tradeable universe size, whether a single-position cap applies, and
+    which tradeable indices each active group constraint spans; everything else is a value.
+    """
+    model_weights = {t.instrument_id: t.weight for t in model.targets}
+    invested_min, invested_max = invested_weight_bounds(
         options=options,
+        locked_weight=solver_index.locked_weight,
     )
-
-    if options.single_position_max_weight is not None:
-        constraints.append(w <= float(options.single_position_max_weight))
-
-    _append_group_constraints(
-        cp=cp,
-        w=w,
-        constraints=constraints,
+    single_position_cap = options.single_position_max_weight
+    group_layout = _target_group_layout(
         solver_index=solver_index,
         eligible_targets=eligible_targets,
         options=options,
         diagnostics=diagnostics,
     )
-    return _TargetSolverProblem(variable=w, objective=objective, constraints=constraints)
+    return _TargetSolverProblem(
+        structure=TargetSolverProblemStructure(
+            tradeable_count=len(solver_index.tradeable_ids),
+            single_position_capped=single_position_cap is not None,
+            group_member_indices=tuple(member_indices for member_indices, _ in group_layout),
+        ),
+        model_weights=np.array(
+            [float(model_weights.get(i_id, Decimal("0.0"))) for i_id in solver_index.tradeable_ids]
+        ),
+        invested_min=float(invested_min),
+        invested_max=float(invested_max),
+        single_position_cap=None if single_position_cap is None else float(single_position_cap),
+        group_capacities=tuple(float(capacity) for _, capacity in group_layout),
+    )
+
+
+def _bind_target_solver_parameters(
+    *,
+    compiled: CompiledTargetSolverProblem,
+    problem: _TargetSolverProblem,
+) -> None:
+    compiled.model_weights.value = problem.model_weights
+    compiled.invested_min.value = problem.invested_min
+    compiled.invested_max.value = problem.invested_max
+    if compiled.single_position_cap is not None:
+        compiled.single_position_cap.value = problem.single_position_cap
+    for parameter, capacity in zip(compiled.group_capacities, problem.group_capacities):
+        parameter.value = capacity
+
+
+def _solve_target_solver_problem(
+    *,
+    cp: Any,
+    problem: _TargetSolverProblem,
+    problem_cache: TargetSolverProblemCache,
+) -> tuple[bool, str | None, list[Any]]:
+    compiled = problem_cache.compiled(cp=cp, structure=problem.structure)
+    with compiled.lock:
+        _bind_target_solver_parameters(compiled=compiled, problem=problem)
+        started_at = time.perf_counter()
+        # Cold-start every solve: a warm start from the previous request's solution makes the
+        # rounded weights depend on call order.
+        solved, latest_status = _solve_with_fallbacks(compiled.problem, cp)
+        problem_cache.record_solve(started_at=started_at)
+        solution = list(compiled.variable.value) if solved else []
+    return solved, latest_status, solution
 
 
 def _apply_solved_weights(
     *,
     eligible_targets: dict[str, Decimal],
     solver_index: _TargetSolverIndex,
-    w: Any,
+    solution: list[Any],
 ) -> None:
     for idx, i_id in enumerate(solver_index.tradeable_ids):
-        solved_weight = Decimal(str(max(float(w.value[idx]), 0.0))).quantize(Decimal("0.0001"))
+        solved_weight = Decimal(str(max(float(solution[idx]), 0.0))).quantize(Decimal("0.0001"))
         eligible_targets[i_id] = solved_weight
 
 
@@ -603,6 +631,7 @@ def generate_targets_solver(
     total_val: Decimal,
     base_ccy: str,
     diagnostics: DiagnosticsData,
+    problem_cache: TargetSolverProblemCache = TARGET_SOLVER_PROBLEM_CACHE,
 ) -> tuple[list[TargetInstrument], str]:
     dependencies = load_target_solver_dependencies()
     if dependencies is None:
@@ -622,7 +651,6 @@ def generate_targets_solver(
         return build_target_trace(model, eligible_targets, buy_list, total_val, base_ccy), status
 
     problem = _build_target_solver_problem(
-        cp=cp,
         np=np,
         model=model,
         solver_index=solver_index,
@@ -630,8 +658,11 @@ def generate_targets_solver(
         options=options,
         diagnostics=diagnostics,
     )
-    prob = cp.Problem(problem.objective, problem.constraints)
-    solved, latest_status = _solve_with_fallbacks(prob, cp)
+    solved, latest_status, solution = _solve_target_solver_problem(
+        cp=cp,
+        problem=problem,
+        problem_cache=problem_cache,
+    )
 
     if not solved:
         reason = _solver_failure_reason(latest_status)
@@ -651,7 +682,7 @@ def generate_targets_solver(
     _apply_solved_weights(
         eligible_targets=eligible_targets,
         solver_index=solver_index,
-        w=problem.variable,
+        solution=solution,
     )
 
     return build_target_trace(model, eligible_targets, buy_list, total_val, base_ccy), status
@@ -0,0 +1,160 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock, RLock
+from typing import Any
+
+DEFAULT_TARGET_SOLVER_PROBLEM_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class TargetSolverProblemStructure:
+    """Shape of a target-generation QP; solves with equal structure share one compiled problem."""
+
+    tradeable_count: int
+    single_position_capped: bool
+    group_member_indices: tuple[tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class CompiledTargetSolverProblem:
+    problem: Any
+    variable: Any
+    model_weights: Any
+    invested_min: Any
+    invested_max: Any
+    single_position_cap: Any | None
+    group_capacities: tuple[Any, ...]
+    lock: Lock = field(default_factory=Lock, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class TargetSolverProblemCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    solves: int
+    solve_seconds: float
+
+
+def compile_target_solver_problem(
+    *,
+    cp: Any,
+    structure: TargetSolverProblemStructure,
+) -> CompiledTargetSolverProblem:
+    w = cp.Variable(structure.tradeable_count)
+    model_weights = cp.Parameter(structure.tradeable_count)
+    invested_min = cp.Parameter()
+    invested_max = cp.Parameter()
+    constraints = [w >= 0, cp.sum(w) >= invested_min, cp.sum(w) <= invested_max]
+
+    single_position_cap = None
+    if structure.single_position_capped:
+        single_position_cap = cp.Parameter()
+        constraints.append(w <= single_position_cap)
+
+    group_capacities = []
+    for member_indices in structure.group_member_indices:
+        capacity = cp.Parameter()
+        group_capacities.append(capacity)
+        if member_indices:
+            constraints.append(cp.sum(w[list(member_indices)]) <= capacity)
+        else:
+            constraints.append(cp.Constant(0) <= capacity)
+
+    return CompiledTargetSolverProblem(
+        problem=cp.Problem(cp.Minimize(cp.sum_squares(w - model_weights)), constraints),
+        variable=w,
+        model_weights=model_weights,
+        invested_min=invested_min,
+        invested_max=invested_max,
+        single_position_cap=single_position_cap,
+        group_capacities=tuple(group_capacities),
+    )
+
+
+class TargetSolverProblemCache:
+    def __init__(self, *, max_entries: int = DEFAULT_TARGET_SOLVER_PROBLEM_CACHE_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("TARGET_SOLVER_PROBLEM_CACHE_MAX_ENTRIES_INVALID")
+        self._max_entries = max_entries
+        self._lock = RLock()
+        self._problems: OrderedDict[TargetSolverProblemStructure, CompiledTargetSolverProblem] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._solves = 0
+        self._solve_seconds = 0.0
+
+    def compiled(
+        self,
+        *,
+        cp: Any,
+        structure: TargetSolverProblemStructure,
+    ) -> CompiledTargetSolverProblem:
+        with self._lock:
+            compiled = self._problems.get(structure)
+            if compiled is not None:
+                self._problems.move_to_end(structure)
+                self._hits += 1
+                return compiled
+            self._misses += 1
+            compiled = compile_target_solver_problem(cp=cp, structure=structure)
+            self._problems[structure] = compiled
+            while len(self._problems) > self._max_entries:
+                self._problems.popitem(last=False)
+                self._evictions += 1
+            return compiled
+
+    def record_solve(self, *, started_at: float) -> None:
+        elapsed = max(time.perf_counter() - started_at, 0.0)
+        with self._lock:
+            self._solves += 1
+            self._solve_seconds += elapsed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._problems.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._solves = 0
+            self._solve_seconds = 0.0
+
+    def stats(self) -> TargetSolverProblemCacheStats:
+        with self._lock:
+            return TargetSolverProblemCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._problems),
+                solves=self._solves,
+                solve_seconds=self._solve_seconds,
+            )
+
+
+TARGET_SOLVER_PROBLEM_CACHE = TargetSolverProblemCache()
+
+
+def get_target_solver_problem_cache_stats() -> TargetSolverProblemCacheStats:
+    return TARGET_SOLVER_PROBLEM_CACHE.stats()
+
+
+def reset_target_solver_problem_cache_for_tests() -> None:
+    TARGET_SOLVER_PROBLEM_CACHE.clear()
+
+
+__all__ = [
+    "DEFAULT_TARGET_SOLVER_PROBLEM_CACHE_MAX_ENTRIES",
+    "TARGET_SOLVER_PROBLEM_CACHE",
+    "CompiledTargetSolverProblem",
+    "TargetSolverProblemCache",
+    "TargetSolverProblemCacheStats",
+    "TargetSolverProblemStructure",
+    "compile_target_solver_problem",
+    "get_target_solver_problem_cache_stats",
+    "reset_target_solver_problem_cache_for_tests",
+]
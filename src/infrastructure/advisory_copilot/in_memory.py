@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from copy import deepcopy
+from datetime import datetime
 from threading import Lock
 
 from src.core.advisory_copilot.idempotency_records import AdvisoryCopilotRunIdempotencyRecord
@@ -18,6 +19,7 @@ from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
 from src.core.advisory_copilot.source_projection_packets import (
     can_refresh_source_projection_packet,
 )
+from src.core.advisory_copilot.type_models import CopilotReviewPosture
 
 
 class InMemoryAdvisoryCopilotRepository(AdvisoryCopilotRepository):
@@ -180,6 +182,26 @@ class InMemoryAdvisoryCopilotRepository(AdvisoryCopilotRepository):
             )
         return _copilot_run_page(runs=runs, limit=limit)
 
+    def find_reusable_run(
+        self,
+        *,
+        draft_cache_key: str,
+        review_postures: tuple[CopilotReviewPosture, ...],
+        created_after: datetime,
+    ) -> AdvisoryCopilotRunRecord | None:
+        with self._lock:
+            candidates = [
+                run
+                for run in self._runs.values()
+                if run.lineage_json.get("draft_cache_key") == draft_cache_key
+                and run.review_posture in review_postures
+                and run.created_at >= created_after
+            ]
+            if not candidates:
+                return None
+            latest = max(candidates, key=lambda run: (run.created_at, run.run_id))
+            return deepcopy(latest)
+
 
 def _runs_for_proposal_version(
     *,
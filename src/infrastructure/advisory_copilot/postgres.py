@@ -16,6 +16,7 @@ from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
 from src.core.advisory_copilot.source_projection_packets import (
     can_refresh_source_projection_packet,
 )
+from src.core.advisory_copilot.type_models import CopilotReviewPosture
 from src.infrastructure.advisory_copilot.postgres_records import (
     evidence_packet_from_row,
     json_dump,
@@ -334,6 +335,29 @@ class PostgresAdvisoryCopilotRepository:
         next_cursor = encode_copilot_run_cursor(page[-1]) if len(runs) > limit and page else None
         return page, next_cursor
 
+    def find_reusable_run(
+        self,
+        *,
+        draft_cache_key: str,
+        review_postures: tuple[CopilotReviewPosture, ...],
+        created_after: datetime,
+    ) -> AdvisoryCopilotRunRecord | None:
+        query = """
+            SELECT *
+            FROM advisory_copilot_runs
+            WHERE (lineage_json::jsonb ->> 'draft_cache_key') = %s
+              AND review_posture = ANY(%s)
+              AND created_at >= %s
+            ORDER BY created_at DESC, run_id DESC
+            LIMIT 1
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                query,
+                (draft_cache_key, list(review_postures), created_after.isoformat()),
+            ).fetchone()
+        return run_from_row(row) if row is not None else None
+
     def _connect(self) -> Any:
         import psycopg
         from psycopg.rows import dict_row
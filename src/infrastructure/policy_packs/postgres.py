@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from contextlib import closing
+from datetime import datetime, timezone
 from importlib.util import find_spec
 from typing import Any
 
@@ -8,10 +10,28 @@ from src.core.policy_packs.durable_repositories import (
     DurablePolicyEvaluationRepository,
     DurablePolicyPackCatalogRepository,
 )
+from src.core.policy_packs.persistence_batch import (
+    PolicyEvaluationFinalizeItem,
+    PolicyEvaluationFinalizeOutcome,
+)
+from src.core.policy_packs.persistence_models import PolicyEvaluationAuditEvent
+from src.core.policy_packs.persistence_projection import (
+    build_policy_evaluation_review_queue_response,
+)
+from src.core.policy_packs.persistence_store import PolicyEvaluationRecordStore
+from src.core.policy_packs.projection_models import PolicyEvaluationReviewQueueResponse
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+)
 from src.infrastructure.policy_packs.postgres_state import (
     PostgresPolicyEvaluationStateStore,
     PostgresPolicyPackCatalogStateStore,
 )
+from src.infrastructure.postgres_event_partitions import (
+    POLICY_EVENT_PARTITION_TABLES,
+    ensure_event_partitions,
+)
 from src.infrastructure.postgres_migrations import apply_postgres_migrations
 
 
@@ -19,7 +39,53 @@ class PostgresPolicyEvaluationRepository(DurablePolicyEvaluationRepository):
     def __init__(self, *, dsn: str) -> None:
         self._dsn = _validated_dsn(dsn)
         self._init_db()
-        super().__init__(state_store=PostgresPolicyEvaluationStateStore(connect=self._connect))
+        self._evaluation_state = PostgresPolicyEvaluationStateStore(connect=self._connect)
+        super().__init__(state_store=self._evaluation_state)
+
+    def finalize_policy_evaluation_records(
+        self, *, items: Sequence[PolicyEvaluationFinalizeItem]
+    ) -> list[PolicyEvaluationFinalizeOutcome]:
+        # Read and write only the batch's rows; the snapshot path rewrites every table.
+        store = PolicyEvaluationRecordStore.from_snapshot(
+            self._evaluation_state.load_finalize_snapshot(
+                idempotency_keys=[item.idempotency_key for item in items]
+            )
+        )
+        outcomes = store.finalize_policy_evaluation_records(items=items)
+        evaluation_ids: list[str] = []
+        idempotency_keys: list[str] = []
+        for outcome in outcomes:
+            if outcome.result is None or outcome.result.replayed:
+                continue
+            idempotency_keys.append(outcome.idempotency_key)
+            if outcome.result.created:
+                evaluation_ids.append(outcome.result.record.evaluation_id)
+        if idempotency_keys:
+            self._evaluation_state.save_finalized_rows(
+                store.snapshot(),
+                evaluation_ids=evaluation_ids,
+                idempotency_keys=idempotency_keys,
+            )
+        return outcomes
+
+    def list_policy_evaluation_record_page(
+        self, *, query: PolicyEvaluationRecordQuery
+    ) -> PolicyEvaluationRecordPage:
+        # Filter, page, and count in SQL instead of loading the whole evaluation snapshot.
+        return self._evaluation_state.load_record_page(query=query)
+
+    def list_policy_evaluation_events_by_evaluation(
+        self, *, evaluation_ids: Sequence[str]
+    ) -> dict[str, list[PolicyEvaluationAuditEvent]]:
+        # One indexed query per batch instead of loading the whole evaluation snapshot.
+        return self._evaluation_state.load_events(evaluation_ids=evaluation_ids)
+
+    def get_policy_evaluation_review_queue(
+        self, *, query: PolicyEvaluationRecordQuery
+    ) -> PolicyEvaluationReviewQueueResponse:
+        return build_policy_evaluation_review_queue_response(
+            self.list_policy_evaluation_record_page(query=query)
+        )
 
     def _connect(self) -> Any:
         psycopg, dict_row = _import_psycopg()
@@ -28,6 +94,11 @@ class PostgresPolicyEvaluationRepository(DurablePolicyEvaluationRepository):
     def _init_db(self) -> None:
         with closing(self._connect()) as connection:
             apply_postgres_migrations(connection=connection, namespace="policy_packs")
+            ensure_event_partitions(
+                connection=connection,
+                tables=POLICY_EVENT_PARTITION_TABLES,
+                as_of=datetime.now(timezone.utc).date(),
+            )
 
 
 class PostgresPolicyPackCatalogRepository(DurablePolicyPackCatalogRepository):
@@ -1,14 +1,125 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import closing
 from typing import Any
 
+from src.core.policy_packs.persistence_models import (
+    PolicyEvaluationAuditEvent,
+    PolicyEvaluationRecord,
+)
+from src.core.policy_packs.record_query import (
+    PolicyEvaluationRecordPage,
+    PolicyEvaluationRecordQuery,
+    encode_policy_evaluation_record_cursor,
+)
 from src.core.proposals.exceptions import ProposalIdempotencyConflictError
 from src.infrastructure.proposals.postgres_mappers import json_dump
 
 ConnectionFactory = Callable[[], Any]
+POLICY_EVALUATION_JURISDICTION_SQL = (
+    "((record_json::jsonb -> 'evaluation_json' -> 'applicability' -> 'matched_selectors') "
+    "->> 'jurisdiction')"
+)
+
+_POLICY_EVALUATION_RECORD_UPSERT = """
+    INSERT INTO policy_evaluation_records (
+        evaluation_id,
+        proposal_id,
+        proposal_version_id,
+        portfolio_id,
+        policy_pack_id,
+        policy_version,
+        generated_at,
+        evaluation_status,
+        source_evidence_hash,
+        policy_content_hash,
+        evaluation_hash,
+        record_json
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (evaluation_id) DO UPDATE SET
+        evaluation_status=excluded.evaluation_status,
+        record_json=excluded.record_json
+    WHERE policy_evaluation_records.evaluation_hash = excluded.evaluation_hash
+      AND (
+          SELECT COUNT(*)
+          FROM policy_evaluation_audit_events
+          WHERE policy_evaluation_audit_events.evaluation_id = excluded.evaluation_id
+      ) <= %s
+    """
+_POLICY_EVALUATION_EVENT_UPSERT = """
+    INSERT INTO policy_evaluation_audit_events (
+        evaluation_id,
+        event_id,
+        event_type,
+        actor_id,
+        occurred_at,
+        idempotency_key,
+        request_hash,
+        event_json
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (evaluation_id, event_id, occurred_at) DO UPDATE SET
+        event_json=policy_evaluation_audit_events.event_json
+    WHERE policy_evaluation_audit_events.request_hash = excluded.request_hash
+      AND policy_evaluation_audit_events.event_json = excluded.event_json
+    """
+_POLICY_EVALUATION_IDEMPOTENCY_UPSERT = """
+    INSERT INTO policy_evaluation_idempotency (
+        idempotency_key,
+        request_hash,
+        evaluation_id,
+        event_id,
+        created_at
+    ) VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (idempotency_key) DO UPDATE SET
+        request_hash=excluded.request_hash,
+        evaluation_id=excluded.evaluation_id,
+        event_id=excluded.event_id
+    WHERE (
+        policy_evaluation_idempotency.request_hash = excluded.request_hash
+        AND policy_evaluation_idempotency.evaluation_id = excluded.evaluation_id
+        AND policy_evaluation_idempotency.event_id = excluded.event_id
+    )
+    OR EXISTS (
+        SELECT 1
+        FROM policy_evaluation_records old_record
+        JOIN policy_evaluation_records new_record
+          ON new_record.evaluation_id = excluded.evaluation_id
+        WHERE old_record.evaluation_id = policy_evaluation_idempotency.evaluation_id
+          AND old_record.evaluation_status = 'BLOCKED'
+          AND new_record.evaluation_status <> 'BLOCKED'
+          AND old_record.proposal_id = new_record.proposal_id
+          AND old_record.proposal_version_id = new_record.proposal_version_id
+          AND old_record.portfolio_id = new_record.portfolio_id
+          AND old_record.policy_pack_id = new_record.policy_pack_id
+          AND old_record.policy_version = new_record.policy_version
+          AND old_record.record_json::jsonb #> '{replay_metadata_json,creation_reason}'
+              = new_record.record_json::jsonb #> '{replay_metadata_json,creation_reason}'
+          AND COALESCE(
+              (old_record.record_json::jsonb #> '{source_gaps}') ? 'legal_entity_code',
+              false
+          )
+          AND COALESCE(
+              (
+                  old_record.record_json::jsonb
+                  #> '{evaluation_json,applicability,reason_codes}'
+              ) ? 'POLICY_APPLICABILITY_LEGAL_ENTITY_SOURCE_MISSING',
+              false
+          )
+          AND NOT COALESCE(
+              (new_record.record_json::jsonb #> '{source_gaps}') ? 'legal_entity_code',
+              false
+          )
+          AND NOT COALESCE(
+              (
+                  new_record.record_json::jsonb
+                  #> '{evaluation_json,applicability,reason_codes}'
+              ) ? 'POLICY_APPLICABILITY_LEGAL_ENTITY_SOURCE_MISSING',
+              false
+          )
+    )
+    """
 
 
 class PostgresPolicyEvaluationStateStore:
@@ -69,6 +180,191 @@ class PostgresPolicyEvaluationStateStore:
                 connection.rollback()
                 raise
 
+    def load_finalize_snapshot(self, *, idempotency_keys: Sequence[str]) -> dict[str, Any]:
+        """Load the idempotency rows of a finalize batch and the evaluations they point at.
+
+        Finalizing consults nothing else: the identity index is not persisted, so the partial
+        snapshot decides each item exactly as the full one would.
+        """
+        with closing(self._connect()) as connection:
+            idempotency_rows = connection.execute(
+                """
+                SELECT idempotency_key, request_hash, evaluation_id, event_id
+                FROM policy_evaluation_idempotency
+                WHERE idempotency_key = ANY(%s)
+                ORDER BY idempotency_key ASC
+                """,
+                (list(idempotency_keys),),
+            ).fetchall()
+            evaluation_ids = sorted({str(row["evaluation_id"]) for row in idempotency_rows})
+            record_rows: list[Any] = []
+            event_rows: list[Any] = []
+            if evaluation_ids:
+                record_rows = connection.execute(
+                    """
+                    SELECT evaluation_id, record_json
+                    FROM policy_evaluation_records
+                    WHERE evaluation_id = ANY(%s)
+                    ORDER BY generated_at ASC, evaluation_id ASC
+                    """,
+                    (evaluation_ids,),
+                ).fetchall()
+                event_rows = connection.execute(
+                    """
+                    SELECT evaluation_id, event_json
+                    FROM policy_evaluation_audit_events
+                    WHERE evaluation_id = ANY(%s)
+                    ORDER BY evaluation_id ASC, occurred_at ASC, event_id ASC
+                    """,
+                    (evaluation_ids,),
+                ).fetchall()
+        return {
+            "records": _records_snapshot(record_rows),
+            "events": _events_snapshot(event_rows),
+            "idempotency": [dict(row) for row in idempotency_rows],
+            "identity_index": [],
+        }
+
+    def save_finalized_rows(
+        self,
+        snapshot: dict[str, Any],
+        *,
+        evaluation_ids: Sequence[str],
+        idempotency_keys: Sequence[str],
+    ) -> None:
+        """Write the given evaluations, their events and idempotency rows in one transaction.
+
+        Unlike ``save_snapshot`` this leaves every other row alone, so a batch costs I/O in
+        proportion to its own size and cannot overwrite rows committed by other writers.
+        """
+        records = snapshot.get("records", {})
+        events_by_evaluation = snapshot.get("events", {})
+        wanted_keys = set(idempotency_keys)
+        with closing(self._connect()) as connection:
+            try:
+                _execute_batch(
+                    connection,
+                    _POLICY_EVALUATION_RECORD_UPSERT,
+                    [
+                        _policy_evaluation_record_params(
+                            record=records[evaluation_id],
+                            event_count=len(events_by_evaluation.get(evaluation_id, [])),
+                        )
+                        for evaluation_id in evaluation_ids
+                    ],
+                    "POLICY_EVALUATION_RECORD_CONFLICT",
+                )
+                _execute_batch(
+                    connection,
+                    _POLICY_EVALUATION_EVENT_UPSERT,
+                    [
+                        _policy_evaluation_event_params(event)
+                        for evaluation_id in evaluation_ids
+                        for event in events_by_evaluation.get(evaluation_id, [])
+                    ],
+                    "POLICY_EVALUATION_EVENT_CONFLICT",
+                )
+                _execute_batch(
+                    connection,
+                    _POLICY_EVALUATION_IDEMPOTENCY_UPSERT,
+                    [
+                        _policy_evaluation_idempotency_params(
+                            idempotency=idempotency,
+                            created_at=_event_created_at(
+                                snapshot=snapshot, idempotency=idempotency
+                            ),
+                        )
+                        for idempotency in snapshot.get("idempotency", [])
+                        if idempotency["idempotency_key"] in wanted_keys
+                    ],
+                    "POLICY_EVALUATION_IDEMPOTENCY_KEY_CONFLICT",
+                )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+
+    def load_events(
+        self, *, evaluation_ids: Sequence[str]
+    ) -> dict[str, list[PolicyEvaluationAuditEvent]]:
+        events: dict[str, list[PolicyEvaluationAuditEvent]] = {
+            evaluation_id: [] for evaluation_id in evaluation_ids
+        }
+        if not events:
+            return events
+        with closing(self._connect()) as connection:
+            event_rows = connection.execute(
+                """
+                SELECT evaluation_id, event_json
+                FROM policy_evaluation_audit_events
+                WHERE evaluation_id = ANY(%s)
+                ORDER BY evaluation_id ASC, occurred_at ASC, event_id ASC
+                """,
+                (list(events),),
+            ).fetchall()
+        for row in event_rows:
+            events[str(row["evaluation_id"])].append(
+                PolicyEvaluationAuditEvent.model_validate(json.loads(row["event_json"]))
+            )
+        return events
+
+    def load_record_page(self, *, query: PolicyEvaluationRecordQuery) -> PolicyEvaluationRecordPage:
+        scope_clauses, scope_params = _policy_evaluation_scope_filters(query)
+        match_clauses = list(scope_clauses)
+        match_params = list(scope_params)
+        if query.evaluation_status:
+            match_clauses.append("evaluation_status = %s")
+            match_params.append(query.evaluation_status)
+        page_clauses = list(match_clauses)
+        page_params = list(match_params)
+        if query.cursor is not None:
+            page_clauses.append("(generated_at, evaluation_id) > (%s, %s)")
+            page_params.extend([query.cursor.generated_at, query.cursor.evaluation_id])
+        page_params.append(query.limit + 1)
+        with closing(self._connect()) as connection:
+            record_rows = connection.execute(
+                f"""
+                SELECT record_json
+                FROM policy_evaluation_records
+                {_where_sql(page_clauses)}
+                ORDER BY generated_at ASC, evaluation_id ASC
+                LIMIT %s
+                """,
+                tuple(page_params),
+            ).fetchall()
+            count_rows = connection.execute(
+                f"""
+                SELECT evaluation_status, COUNT(*) AS record_count
+                FROM policy_evaluation_records
+                {_where_sql(scope_clauses)}
+                GROUP BY evaluation_status
+                """,
+                tuple(scope_params),
+            ).fetchall()
+        records = [
+            PolicyEvaluationRecord.model_validate(json.loads(row["record_json"]))
+            for row in record_rows
+        ]
+        page = records[: query.limit]
+        status_counts = {
+            str(row["evaluation_status"]): int(row["record_count"])
+            for row in sorted(count_rows, key=lambda row: str(row["evaluation_status"]))
+        }
+        return PolicyEvaluationRecordPage(
+            items=page,
+            next_cursor=(
+                encode_policy_evaluation_record_cursor(page[-1])
+                if len(records) > query.limit and page
+                else None
+            ),
+            total_count=(
+                status_counts.get(query.evaluation_status, 0)
+                if query.evaluation_status
+                else sum(status_counts.values())
+            ),
+            status_counts=status_counts,
+        )
+
 
 class PostgresPolicyPackCatalogStateStore:
     def __init__(self, *, connect: ConnectionFactory) -> None:
@@ -134,6 +430,34 @@ class PostgresPolicyPackCatalogStateStore:
                 raise
 
 
+def _policy_evaluation_scope_filters(
+    query: PolicyEvaluationRecordQuery,
+) -> tuple[list[str], list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if query.portfolio_id:
+        clauses.append("portfolio_id = %s")
+        params.append(query.portfolio_id)
+    if query.policy_pack_id:
+        clauses.append("policy_pack_id = %s")
+        params.append(query.policy_pack_id)
+    if query.jurisdiction:
+        # Must match the expression index from policy_packs migration 0005 to use it.
+        clauses.append(f"{POLICY_EVALUATION_JURISDICTION_SQL} = %s")
+        params.append(query.jurisdiction)
+    if query.generated_after:
+        clauses.append("generated_at >= %s")
+        params.append(query.generated_after)
+    if query.generated_before:
+        clauses.append("generated_at < %s")
+        params.append(query.generated_before)
+    return clauses, params
+
+
+def _where_sql(clauses: list[str]) -> str:
+    return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
 def _records_snapshot(rows: list[Any]) -> dict[str, dict[str, Any]]:
     return {str(row["evaluation_id"]): json.loads(row["record_json"]) for row in rows}
 
@@ -149,154 +473,75 @@ def _upsert_policy_evaluation_record(
     *, connection: Any, record: dict[str, Any], event_count: int
 ) -> None:
     cursor = connection.execute(
-        """
-        INSERT INTO policy_evaluation_records (
-            evaluation_id,
-            proposal_id,
-            proposal_version_id,
-            portfolio_id,
-            policy_pack_id,
-            policy_version,
-            generated_at,
-            evaluation_status,
-            source_evidence_hash,
-            policy_content_hash,
-            evaluation_hash,
-            record_json
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (evaluation_id) DO UPDATE SET
-            evaluation_status=excluded.evaluation_status,
-            record_json=excluded.record_json
-        WHERE policy_evaluation_records.evaluation_hash = excluded.evaluation_hash
-          AND (
-              SELECT COUNT(*)
-              FROM policy_evaluation_audit_events
-              WHERE policy_evaluation_audit_events.evaluation_id = excluded.evaluation_id
-          ) <= %s
-        """,
-        (
-            record["evaluation_id"],
-            record["proposal_id"],
-            record["proposal_version_id"],
-            record["portfolio_id"],
-            record["policy_pack_id"],
-            record["policy_version"],
-            record["generated_at"],
-            record["evaluation_status"],
-            record["source_evidence_hash"],
-            record["policy_content_hash"],
-            record["evaluation_hash"],
-            json_dump(record),
-            event_count,
-        ),
+        _POLICY_EVALUATION_RECORD_UPSERT,
+        _policy_evaluation_record_params(record=record, event_count=event_count),
     )
     _raise_if_no_rows(cursor, "POLICY_EVALUATION_RECORD_CONFLICT")
 
 
+def _policy_evaluation_record_params(
+    *, record: dict[str, Any], event_count: int
+) -> tuple[Any, ...]:
+    return (
+        record["evaluation_id"],
+        record["proposal_id"],
+        record["proposal_version_id"],
+        record["portfolio_id"],
+        record["policy_pack_id"],
+        record["policy_version"],
+        record["generated_at"],
+        record["evaluation_status"],
+        record["source_evidence_hash"],
+        record["policy_content_hash"],
+        record["evaluation_hash"],
+        json_dump(record),
+        event_count,
+    )
+
+
 def _upsert_policy_evaluation_event(*, connection: Any, event: dict[str, Any]) -> None:
-    reason = event.get("reason_json", {})
     cursor = connection.execute(
-        """
-        INSERT INTO policy_evaluation_audit_events (
-            evaluation_id,
-            event_id,
-            event_type,
-            actor_id,
-            occurred_at,
-            idempotency_key,
-            request_hash,
-            event_json
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (evaluation_id, event_id) DO UPDATE SET
-            event_json=policy_evaluation_audit_events.event_json
-        WHERE policy_evaluation_audit_events.request_hash = excluded.request_hash
-          AND policy_evaluation_audit_events.event_json = excluded.event_json
-        """,
-        (
-            event["evaluation_id"],
-            event["event_id"],
-            event["event_type"],
-            event["actor_id"],
-            event["occurred_at"],
-            event.get("idempotency_key"),
-            reason.get("idempotency_request_hash", ""),
-            json_dump(event),
-        ),
+        _POLICY_EVALUATION_EVENT_UPSERT, _policy_evaluation_event_params(event)
     )
     _raise_if_no_rows(cursor, "POLICY_EVALUATION_EVENT_CONFLICT")
 
 
+def _policy_evaluation_event_params(event: dict[str, Any]) -> tuple[Any, ...]:
+    reason = event.get("reason_json", {})
+    return (
+        event["evaluation_id"],
+        event["event_id"],
+        event["event_type"],
+        event["actor_id"],
+        event["occurred_at"],
+        event.get("idempotency_key"),
+        reason.get("idempotency_request_hash", ""),
+        json_dump(event),
+    )
+
+
 def _upsert_policy_evaluation_idempotency(
     *, connection: Any, idempotency: dict[str, Any], created_at: str
 ) -> None:
     cursor = connection.execute(
-        """
-        INSERT INTO policy_evaluation_idempotency (
-            idempotency_key,
-            request_hash,
-            evaluation_id,
-            event_id,
-            created_at
-        ) VALUES (%s, %s, %s, %s, %s)
-        ON CONFLICT (idempotency_key) DO UPDATE SET
-            request_hash=excluded.request_hash,
-            evaluation_id=excluded.evaluation_id,
-            event_id=excluded.event_id
-        WHERE (
-            policy_evaluation_idempotency.request_hash = excluded.request_hash
-            AND policy_evaluation_idempotency.evaluation_id = excluded.evaluation_id
-            AND policy_evaluation_idempotency.event_id = excluded.event_id
-        )
-        OR EXISTS (
-            SELECT 1
-            FROM policy_evaluation_records old_record
-            JOIN policy_evaluation_records new_record
-              ON new_record.evaluation_id = excluded.evaluation_id
-            WHERE old_record.evaluation_id = policy_evaluation_idempotency.evaluation_id
-              AND old_record.evaluation_status = 'BLOCKED'
-              AND new_record.evaluation_status <> 'BLOCKED'
-              AND old_record.proposal_id = new_record.proposal_id
-              AND old_record.proposal_version_id = new_record.proposal_version_id
-              AND old_record.portfolio_id = new_record.portfolio_id
-              AND old_record.policy_pack_id = new_record.policy_pack_id
-              AND old_record.policy_version = new_record.policy_version
-              AND old_record.record_json::jsonb #> '{replay_metadata_json,creation_reason}'
-                  = new_record.record_json::jsonb #> '{replay_metadata_json,creation_reason}'
-              AND COALESCE(
-                  (old_record.record_json::jsonb #> '{source_gaps}') ? 'legal_entity_code',
-                  false
-              )
-              AND COALESCE(
-                  (
-                      old_record.record_json::jsonb
-                      #> '{evaluation_json,applicability,reason_codes}'
-                  ) ? 'POLICY_APPLICABILITY_LEGAL_ENTITY_SOURCE_MISSING',
-                  false
-              )
-              AND NOT COALESCE(
-                  (new_record.record_json::jsonb #> '{source_gaps}') ? 'legal_entity_code',
-                  false
-              )
-              AND NOT COALESCE(
-                  (
-                      new_record.record_json::jsonb
-                      #> '{evaluation_json,applicability,reason_codes}'
-                  ) ? 'POLICY_APPLICABILITY_LEGAL_ENTITY_SOURCE_MISSING',
-                  false
-              )
-        )
-        """,
-        (
-            idempotency["idempotency_key"],
-            idempotency["request_hash"],
-            idempotency["evaluation_id"],
-            idempotency["event_id"],
-            created_at,
-        ),
+        _POLICY_EVALUATION_IDEMPOTENCY_UPSERT,
+        _policy_evaluation_idempotency_params(idempotency=idempotency, created_at=created_at),
     )
     _raise_if_no_rows(cursor, "POLICY_EVALUATION_IDEMPOTENCY_KEY_CONFLICT")
 
 
+def _policy_evaluation_idempotency_params(
+    *, idempotency: dict[str, Any], created_at: str
+) -> tuple[Any, ...]:
+    return (
+        idempotency["idempotency_key"],
+        idempotency["request_hash"],
+        idempotency["evaluation_id"],
+        idempotency["event_id"],
+        created_at,
+    )
+
+
 def _upsert_policy_pack_catalog_version(
     *, connection: Any, definition: dict[str, Any], event_count: int
 ) -> None:
@@ -431,12 +676,25 @@ def _catalog_event_count(
     )
 
 
+def _execute_batch(
+    connection: Any, statement: str, params: list[tuple[Any, ...]], message: str
+) -> None:
+    if not params:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(statement, params)
+        # Every row of a batch must insert or pass its guarded update, as in the row path.
+        if cursor.rowcount != len(params):
+            raise ProposalIdempotencyConflictError(message)
+
+
 def _raise_if_no_rows(cursor: Any, message: str) -> None:
     if getattr(cursor, "rowcount", None) == 0:
         raise ProposalIdempotencyConflictError(message)
 
 
 __all__ = [
+    "POLICY_EVALUATION_JURISDICTION_SQL",
     "PostgresPolicyEvaluationStateStore",
     "PostgresPolicyPackCatalogStateStore",
 ]
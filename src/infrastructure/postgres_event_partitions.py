@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from importlib.util import find_spec
+from typing import Any, Literal
+
+from src.core.record_lifecycle.advisory_records import (
+    AdvisoryRecordFamily,
+    AdvisoryRecordLifecycleState,
+    advisory_record_retention_policy,
+    evaluate_advisory_record_purge,
+)
+
+ConnectionFactory = Callable[[], Any]
+
+EventPartitionTable = Literal[
+    "proposal_workflow_events",
+    "proposal_memo_events",
+    "policy_evaluation_audit_events",
+    "advisory_workspace_events",
+]
+
+DEFAULT_EVENT_PARTITION_MONTHS_AHEAD = 3
+EVENT_PARTITION_MAINTENANCE_ACTOR = "system:event-partition-maintenance"
+_MAX_DEPENDENCY_REFS = 100
+
+
+@dataclass(frozen=True)
+class EventPartitionSpec:
+    table: EventPartitionTable
+    record_family: AdvisoryRecordFamily
+    parent_ref_query: str
+
+
+# Each parent reference query lists parent ids that still exist for rows in one partition.
+# Append-only events are retained until their parent record is purged, which also carries any
+# legal hold placed on the parent.
+EVENT_PARTITION_SPECS: dict[EventPartitionTable, EventPartitionSpec] = {
+    "proposal_workflow_events": EventPartitionSpec(
+        table="proposal_workflow_events",
+        record_family="PROPOSAL_LIFECYCLE_EVENT",
+        parent_ref_query="""
+            SELECT DISTINCT e.proposal_id AS parent_ref
+            FROM {partition} e
+            JOIN proposal_records p ON p.proposal_id = e.proposal_id
+            LIMIT %s
+        """,
+    ),
+    "proposal_memo_events": EventPartitionSpec(
+        table="proposal_memo_events",
+        record_family="PROPOSAL_LIFECYCLE_EVENT",
+        parent_ref_query="""
+            SELECT DISTINCT e.memo_id AS parent_ref
+            FROM {partition} e
+            JOIN proposal_memos m ON m.memo_id = e.memo_id
+            LIMIT %s
+        """,
+    ),
+    "policy_evaluation_audit_events": EventPartitionSpec(
+        table="policy_evaluation_audit_events",
+        record_family="POLICY_EVALUATION",
+        parent_ref_query="""
+            SELECT DISTINCT e.evaluation_id AS parent_ref
+            FROM {partition} e
+            JOIN policy_evaluation_records r ON r.evaluation_id = e.evaluation_id
+            LIMIT %s
+        """,
+    ),
+    "advisory_workspace_events": EventPartitionSpec(
+        table="advisory_workspace_events",
+        record_family="ADVISORY_WORKSPACE_EVENT",
+        parent_ref_query="""
+            SELECT DISTINCT e.workspace_id AS parent_ref
+            FROM {partition} e
+            JOIN advisory_workspace_sessions s ON s.workspace_id = e.workspace_id
+            LIMIT %s
+        """,
+    ),
+}
+
+PROPOSAL_EVENT_PARTITION_TABLES: tuple[EventPartitionTable, ...] = (
+    "proposal_workflow_events",
+    "proposal_memo_events",
+)
+POLICY_EVENT_PARTITION_TABLES: tuple[EventPartitionTable, ...] = ("policy_evaluation_audit_events",)
+WORKSPACE_EVENT_PARTITION_TABLES: tuple[EventPartitionTable, ...] = ("advisory_workspace_events",)
+
+
+@dataclass(frozen=True)
+class EventPartitionMaintenanceReport:
+    table: EventPartitionTable
+    created_partitions: tuple[str, ...]
+    dropped_partitions: tuple[str, ...]
+    audit_events: tuple[dict[str, object], ...]
+
+
+def ensure_event_partitions(
+    *,
+    connection: Any,
+    tables: Sequence[EventPartitionTable],
+    as_of: date,
+    months_ahead: int = DEFAULT_EVENT_PARTITION_MONTHS_AHEAD,
+) -> list[str]:
+    created: list[str] = []
+    for table in tables:
+        connection.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            (f"event_partitions:{table}",),
+        )
+        months = set(_months_in_default_partition(connection=connection, table=table))
+        months.update(_months_from(_month_start(as_of), count=months_ahead + 1))
+        for month in sorted(months):
+            if _create_month_partition(connection=connection, table=table, month=month):
+                created.append(event_partition_name(table=table, month=month))
+    connection.commit()
+    return created
+
+
+def lock_event_identities(
+    *,
+    connection: Any,
+    table: EventPartitionTable,
+    event_ids: Iterable[str],
+) -> None:
+    """Serialize writers of the same event ids until the current transaction ends.
+
+    A partitioned primary key has to include ``occurred_at``, so it no longer makes ``event_id``
+    unique. Writers take this lock before checking for an existing row. Keys are locked in sorted
+    order so that two batches cannot deadlock.
+    """
+    lock_keys = sorted({f"{table}:{event_id}" for event_id in event_ids})
+    if not lock_keys:
+        return
+    connection.execute(
+        """
+        SELECT pg_advisory_xact_lock(hashtext(lock_key))
+        FROM unnest(%s::text[]) AS lock_key
+        ORDER BY lock_key
+        """,
+        (lock_keys,),
+    )
+
+
+def drop_expired_event_partitions(
+    *,
+    connection: Any,
+    table: EventPartitionTable,
+    retention_months: int,
+    as_of: datetime,
+) -> tuple[list[str], list[dict[str, object]]]:
+    if retention_months < 1:
+        raise ValueError("EVENT_PARTITION_RETENTION_MONTHS_INVALID")
+    spec = EVENT_PARTITION_SPECS[table]
+    policy = advisory_record_retention_policy(spec.record_family)
+    dropped: list[str] = []
+    audit_events: list[dict[str, object]] = []
+    for partition, month in _attached_month_partitions(connection=connection, table=table):
+        dependent_refs = _partition_parent_refs(
+            connection=connection, spec=spec, partition=partition
+        )
+        decision = evaluate_advisory_record_purge(
+            record=AdvisoryRecordLifecycleState(
+                record_family=spec.record_family,
+                record_id=partition,
+                retention_class=policy.retention_class,
+                retention_expires_at=datetime.combine(
+                    _add_months(month, retention_months + 1),
+                    datetime.min.time(),
+                    tzinfo=timezone.utc,
+                ),
+                dependent_record_refs=dependent_refs,
+            ),
+            as_of=as_of,
+            authorized=True,
+            requested_by=EVENT_PARTITION_MAINTENANCE_ACTOR,
+            idempotency_key=f"{partition}:{as_of.date().isoformat()}",
+        )
+        if decision.reason_code == "PURGE_BLOCKED_BY_RETENTION":
+            continue
+        if decision.eligible:
+            connection.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+            connection.execute(f"DROP TABLE {partition}")
+            dropped.append(partition)
+        audit_events.append(
+            {
+                **decision.audit_event,
+                "event_type": (
+                    "ADVISORY_RECORD_PURGE_EXECUTED"
+                    if decision.eligible
+                    else decision.audit_event["event_type"]
+                ),
+                "record_table": table,
+                "partition_month": month.strftime("%Y-%m"),
+                "purge_mechanism": "DETACH_AND_DROP_PARTITION",
+            }
+        )
+    connection.commit()
+    return dropped, audit_events
+
+
+def event_partition_name(*, table: EventPartitionTable, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+class PostgresEventPartitionMaintenance:
+    def __init__(
+        self,
+        *,
+        tables: Sequence[EventPartitionTable],
+        dsn: str = "",
+        connect: ConnectionFactory | None = None,
+    ) -> None:
+        if any(table not in EVENT_PARTITION_SPECS for table in tables):
+            raise ValueError("EVENT_PARTITION_TABLE_UNSUPPORTED")
+        if connect is None and not dsn:
+            raise RuntimeError("EVENT_PARTITION_POSTGRES_DSN_REQUIRED")
+        self._tables = tuple(tables)
+        self._dsn = dsn
+        self._connect = connect or self._connect_from_dsn
+
+    def maintain(
+        self,
+        *,
+        as_of: datetime,
+        months_ahead: int,
+        retention_months_by_table: Mapping[EventPartitionTable, int],
+    ) -> list[EventPartitionMaintenanceReport]:
+        reports: list[EventPartitionMaintenanceReport] = []
+        with closing(self._connect()) as connection:
+            for table in self._tables:
+                created = ensure_event_partitions(
+                    connection=connection,
+                    tables=(table,),
+                    as_of=as_of.date(),
+                    months_ahead=months_ahead,
+                )
+                dropped: list[str] = []
+                audit_events: list[dict[str, object]] = []
+                retention_months = retention_months_by_table.get(table)
+                if retention_months is not None:
+                    dropped, audit_events = drop_expired_event_partitions(
+                        connection=connection,
+                        table=table,
+                        retention_months=retention_months,
+                        as_of=as_of,
+                    )
+                reports.append(
+                    EventPartitionMaintenanceReport(
+                        table=table,
+                        created_partitions=tuple(created),
+                        dropped_partitions=tuple(dropped),
+                        audit_events=tuple(audit_events),
+                    )
+                )
+        return reports
+
+    def _connect_from_dsn(self) -> Any:
+        if find_spec("psycopg") is None:
+            raise RuntimeError("EVENT_PARTITION_POSTGRES_DRIVER_MISSING")
+        import psycopg
+        from psycopg.rows import dict_row
+
+        return psycopg.connect(self._dsn, row_factory=dict_row)
+
+
+def _create_month_partition(*, connection: Any, table: EventPartitionTable, month: date) -> bool:
+    partition = event_partition_name(table=table, month=month)
+    row = connection.execute("SELECT to_regclass(%s) AS partition_oid", (partition,)).fetchone()
+    if row is not None and row["partition_oid"] is not None:
+        return False
+    lower = month.strftime("%Y-%m")
+    upper = _add_months(month, 1).strftime("%Y-%m")
+    # Rows already written to the default partition for this month move with the new
+    # partition so ATTACH PARTITION does not fail default-partition validation.
+    connection.execute(
+        f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    connection.execute(
+        f"""
+        WITH moved AS (
+            DELETE FROM {table}_default
+            WHERE occurred_at >= %s AND occurred_at < %s
+            RETURNING *
+        )
+        INSERT INTO {partition} SELECT * FROM moved
+        """,
+        (lower, upper),
+    )
+    connection.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+    return True
+
+
+def _months_in_default_partition(*, connection: Any, table: EventPartitionTable) -> list[date]:
+    rows = connection.execute(
+        f"""
+        SELECT DISTINCT LEFT(occurred_at, 7) AS partition_month
+        FROM {table}_default
+        """
+    ).fetchall()
+    months: list[date] = []
+    for row in rows:
+        month = _parse_month(str(row["partition_month"]))
+        if month is not None:
+            months.append(month)
+    return months
+
+
+def _attached_month_partitions(
+    *, connection: Any, table: EventPartitionTable
+) -> list[tuple[str, date]]:
+    rows = connection.execute(
+        """
+        SELECT child.relname AS partition_name
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        ORDER BY child.relname ASC
+        """,
+        (table,),
+    ).fetchall()
+    prefix = f"{table}_p"
+    partitions: list[tuple[str, date]] = []
+    for row in rows:
+        name = str(row["partition_name"])
+        suffix = name[len(prefix) :] if name.startswith(prefix) else ""
+        month = _parse_month(f"{suffix[:4]}-{suffix[4:]}") if len(suffix) == 6 else None
+        if month is not None:
+            partitions.append((name, month))
+    return partitions
+
+
+def _partition_parent_refs(
+    *, connection: Any, spec: EventPartitionSpec, partition: str
+) -> tuple[str, ...]:
+    rows = connection.execute(
+        spec.parent_ref_query.format(partition=partition),
+        (_MAX_DEPENDENCY_REFS,),
+    ).fetchall()
+    return tuple(str(row["parent_ref"]) for row in rows)
+
+
+def _parse_month(value: str) -> date | None:
+    try:
+        parsed = datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        return None
+    return parsed.date()
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _months_from(start: date, *, count: int) -> list[date]:
+    return [_add_months(start, offset) for offset in range(count)]
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+__all__ = [
+    "DEFAULT_EVENT_PARTITION_MONTHS_AHEAD",
+    "EVENT_PARTITION_SPECS",
+    "POLICY_EVENT_PARTITION_TABLES",
+    "PROPOSAL_EVENT_PARTITION_TABLES",
+    "WORKSPACE_EVENT_PARTITION_TABLES",
+    "EventPartitionMaintenanceReport",
+    "EventPartitionSpec",
+    "EventPartitionTable",
+    "PostgresEventPartitionMaintenance",
+    "drop_expired_event_partitions",
+    "ensure_event_partitions",
+    "event_partition_name",
+    "lock_event_identities",
+]
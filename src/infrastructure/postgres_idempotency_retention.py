@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from contextlib import closing
+from importlib.util import find_spec
+from typing import Any
+
+from src.core.record_lifecycle.idempotency_retention import (
+    IdempotencyRetentionCandidate,
+    IdempotencyRetentionTable,
+)
+
+ConnectionFactory = Callable[[], Any]
+
+_NO_LEGAL_HOLD = "FALSE"
+_NO_DEPENDENCIES = "ARRAY[]::TEXT[]"
+
+# Legal hold and dependency expressions per table. Table names and expressions are fixed
+# allowlisted SQL fragments; only cutoff, cursor, and key values are bound as parameters.
+_CANDIDATE_SOURCES: dict[IdempotencyRetentionTable, tuple[str, str, str]] = {
+    "proposal_simulation_idempotency": (
+        "proposal_simulation_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "proposal_idempotency": (
+        "proposal_idempotency i",
+        _NO_LEGAL_HOLD,
+        """ARRAY(
+            SELECT o.operation_id
+            FROM proposal_async_operations o
+            WHERE o.idempotency_key = i.idempotency_key
+              AND o.status IN ('PENDING', 'RUNNING')
+        )""",
+    ),
+    "proposal_memo_idempotency": (
+        "proposal_memo_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "advisor_cockpit_acknowledgement_idempotency": (
+        "advisor_cockpit_acknowledgement_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "advisory_workspace_idempotency": (
+        "advisory_workspace_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "policy_evaluation_idempotency": (
+        "policy_evaluation_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "policy_pack_catalog_idempotency": (
+        "policy_pack_catalog_idempotency i",
+        _NO_LEGAL_HOLD,
+        _NO_DEPENDENCIES,
+    ),
+    "advisory_copilot_run_idempotency": (
+        "advisory_copilot_run_idempotency i "
+        "LEFT JOIN advisory_copilot_runs r ON r.run_id = i.run_id",
+        "COALESCE(r.legal_hold, FALSE)",
+        _NO_DEPENDENCIES,
+    ),
+}
+
+PROPOSAL_IDEMPOTENCY_RETENTION_TABLES: tuple[IdempotencyRetentionTable, ...] = (
+    "proposal_simulation_idempotency",
+    "proposal_idempotency",
+    "proposal_memo_idempotency",
+    "advisor_cockpit_acknowledgement_idempotency",
+)
+WORKSPACE_IDEMPOTENCY_RETENTION_TABLES: tuple[IdempotencyRetentionTable, ...] = (
+    "advisory_workspace_idempotency",
+)
+POLICY_IDEMPOTENCY_RETENTION_TABLES: tuple[IdempotencyRetentionTable, ...] = (
+    "policy_evaluation_idempotency",
+    "policy_pack_catalog_idempotency",
+)
+ADVISORY_COPILOT_IDEMPOTENCY_RETENTION_TABLES: tuple[IdempotencyRetentionTable, ...] = (
+    "advisory_copilot_run_idempotency",
+)
+
+
+class PostgresIdempotencyRetentionStore:
+    def __init__(
+        self,
+        *,
+        tables: Sequence[IdempotencyRetentionTable],
+        dsn: str = "",
+        connect: ConnectionFactory | None = None,
+    ) -> None:
+        unsupported = [table for table in tables if table not in _CANDIDATE_SOURCES]
+        if unsupported:
+            raise ValueError("IDEMPOTENCY_RETENTION_TABLE_UNSUPPORTED")
+        if connect is None and not dsn:
+            raise RuntimeError("IDEMPOTENCY_RETENTION_POSTGRES_DSN_REQUIRED")
+        self._tables = tuple(tables)
+        self._dsn = dsn
+        self._connect = connect or self._connect_from_dsn
+
+    def idempotency_retention_tables(self) -> tuple[IdempotencyRetentionTable, ...]:
+        return self._tables
+
+    def list_idempotency_retention_candidates(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        created_before: str,
+        after: IdempotencyRetentionCandidate | None,
+        limit: int,
+    ) -> list[IdempotencyRetentionCandidate]:
+        source, legal_hold, dependencies = _CANDIDATE_SOURCES[table]
+        after_created_at = after.created_at if after is not None else ""
+        after_key = after.idempotency_key if after is not None else ""
+        query = f"""
+            SELECT
+                i.idempotency_key,
+                i.created_at,
+                {legal_hold} AS legal_hold,
+                {dependencies} AS dependent_record_refs
+            FROM {source}
+            WHERE i.created_at < %s
+              AND (i.created_at, i.idempotency_key) > (%s, %s)
+            ORDER BY i.created_at ASC, i.idempotency_key ASC
+            LIMIT %s
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                query,
+                (created_before, after_created_at, after_key, limit),
+            ).fetchall()
+        return [_to_candidate(row) for row in rows]
+
+    def delete_idempotency_records(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        idempotency_keys: Sequence[str],
+        created_before: str,
+    ) -> int:
+        if table not in _CANDIDATE_SOURCES:
+            raise ValueError("IDEMPOTENCY_RETENTION_TABLE_UNSUPPORTED")
+        query = f"""
+            DELETE FROM {table}
+            WHERE idempotency_key = ANY(%s)
+              AND created_at < %s
+        """
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(query, (list(idempotency_keys), created_before))
+            connection.commit()
+        return int(cursor.rowcount or 0)
+
+    def _connect_from_dsn(self) -> Any:
+        psycopg, dict_row = _import_psycopg()
+        return psycopg.connect(self._dsn, row_factory=dict_row)
+
+
+def _to_candidate(row: Any) -> IdempotencyRetentionCandidate:
+    return IdempotencyRetentionCandidate(
+        idempotency_key=str(row["idempotency_key"]),
+        created_at=str(row["created_at"]),
+        legal_hold=bool(row["legal_hold"]),
+        dependent_record_refs=tuple(str(ref) for ref in row["dependent_record_refs"] or ()),
+    )
+
+
+def _import_psycopg() -> tuple[Any, Any]:
+    if find_spec("psycopg") is None:
+        raise RuntimeError("IDEMPOTENCY_RETENTION_POSTGRES_DRIVER_MISSING")
+    import psycopg
+    from psycopg.rows import dict_row
+
+    return psycopg, dict_row
+
+
+__all__ = [
+    "ADVISORY_COPILOT_IDEMPOTENCY_RETENTION_TABLES",
+    "POLICY_IDEMPOTENCY_RETENTION_TABLES",
+    "PROPOSAL_IDEMPOTENCY_RETENTION_TABLES",
+    "WORKSPACE_IDEMPOTENCY_RETENTION_TABLES",
+    "PostgresIdempotencyRetentionStore",
+]
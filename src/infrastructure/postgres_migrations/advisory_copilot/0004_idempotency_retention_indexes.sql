@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_advisory_copilot_run_idempotency_retention
+    ON advisory_copilot_run_idempotency (created_at ASC, idempotency_key ASC);
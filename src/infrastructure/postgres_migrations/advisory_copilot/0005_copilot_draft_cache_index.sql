@@ -0,0 +1,6 @@
+CREATE INDEX IF NOT EXISTS idx_advisory_copilot_runs_draft_cache_key
+    ON advisory_copilot_runs (
+        ((lineage_json::jsonb ->> 'draft_cache_key')),
+        created_at DESC,
+        run_id DESC
+    );
@@ -0,0 +1,5 @@
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_idempotency_retention
+    ON policy_evaluation_idempotency (created_at ASC, idempotency_key ASC);
+
+CREATE INDEX IF NOT EXISTS idx_policy_pack_catalog_idempotency_retention
+    ON policy_pack_catalog_idempotency (created_at ASC, idempotency_key ASC);
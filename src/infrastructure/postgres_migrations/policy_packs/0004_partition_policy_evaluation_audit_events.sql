@@ -0,0 +1,28 @@
+ALTER TABLE policy_evaluation_audit_events
+    RENAME TO policy_evaluation_audit_events_unpartitioned;
+
+ALTER INDEX policy_evaluation_audit_events_pkey
+    RENAME TO policy_evaluation_audit_events_unpartitioned_pkey;
+
+DROP INDEX IF EXISTS idx_policy_evaluation_events_lookup;
+
+CREATE TABLE policy_evaluation_audit_events (
+    LIKE policy_evaluation_audit_events_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (evaluation_id, event_id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+ALTER TABLE policy_evaluation_audit_events
+    ADD CONSTRAINT fk_policy_evaluation_audit_events_record
+    FOREIGN KEY (evaluation_id)
+    REFERENCES policy_evaluation_records (evaluation_id);
+
+CREATE TABLE policy_evaluation_audit_events_default
+    PARTITION OF policy_evaluation_audit_events DEFAULT;
+
+INSERT INTO policy_evaluation_audit_events
+SELECT * FROM policy_evaluation_audit_events_unpartitioned;
+
+DROP TABLE policy_evaluation_audit_events_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_events_lookup
+    ON policy_evaluation_audit_events (evaluation_id, occurred_at, event_id);
@@ -0,0 +1,17 @@
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_records_status_keyset
+    ON policy_evaluation_records (evaluation_status, generated_at, evaluation_id);
+
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_records_portfolio_keyset
+    ON policy_evaluation_records (portfolio_id, evaluation_status, generated_at, evaluation_id);
+
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_records_jurisdiction_keyset
+    ON policy_evaluation_records (
+        ((record_json::jsonb -> 'evaluation_json' -> 'applicability' -> 'matched_selectors')
+            ->> 'jurisdiction'),
+        evaluation_status,
+        generated_at,
+        evaluation_id
+    );
+
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_records_generated_keyset
+    ON policy_evaluation_records (generated_at, evaluation_id);
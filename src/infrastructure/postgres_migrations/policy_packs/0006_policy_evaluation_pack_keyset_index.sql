@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_policy_evaluation_records_pack_keyset
+    ON policy_evaluation_records (policy_pack_id, generated_at, evaluation_id);
@@ -0,0 +1,11 @@
+CREATE INDEX IF NOT EXISTS idx_proposal_idempotency_retention
+    ON proposal_idempotency (created_at ASC, idempotency_key ASC);
+
+CREATE INDEX IF NOT EXISTS idx_proposal_simulation_idempotency_retention
+    ON proposal_simulation_idempotency (created_at ASC, idempotency_key ASC);
+
+CREATE INDEX IF NOT EXISTS idx_proposal_memo_idempotency_retention
+    ON proposal_memo_idempotency (created_at ASC, idempotency_key ASC);
+
+CREATE INDEX IF NOT EXISTS idx_advisor_cockpit_acknowledgement_idempotency_retention
+    ON advisor_cockpit_acknowledgement_idempotency (created_at ASC, idempotency_key ASC);
@@ -0,0 +1,56 @@
+ALTER TABLE proposal_workflow_events RENAME TO proposal_workflow_events_unpartitioned;
+
+ALTER INDEX proposal_workflow_events_pkey
+    RENAME TO proposal_workflow_events_unpartitioned_pkey;
+
+DROP INDEX IF EXISTS idx_proposal_workflow_events_history;
+
+CREATE TABLE proposal_workflow_events (
+    LIKE proposal_workflow_events_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (event_id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+ALTER TABLE proposal_workflow_events
+    ADD CONSTRAINT fk_proposal_workflow_events_proposal
+    FOREIGN KEY (proposal_id)
+    REFERENCES proposal_records (proposal_id)
+    ON DELETE RESTRICT;
+
+ALTER TABLE proposal_workflow_events
+    ADD CONSTRAINT fk_proposal_workflow_events_related_version
+    FOREIGN KEY (proposal_id, related_version_no)
+    REFERENCES proposal_versions (proposal_id, version_no)
+    ON DELETE RESTRICT;
+
+CREATE TABLE proposal_workflow_events_default
+    PARTITION OF proposal_workflow_events DEFAULT;
+
+INSERT INTO proposal_workflow_events
+SELECT * FROM proposal_workflow_events_unpartitioned;
+
+DROP TABLE proposal_workflow_events_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_proposal_workflow_events_history
+    ON proposal_workflow_events (proposal_id, occurred_at ASC, event_id ASC);
+
+ALTER TABLE proposal_memo_events RENAME TO proposal_memo_events_unpartitioned;
+
+ALTER INDEX proposal_memo_events_pkey RENAME TO proposal_memo_events_unpartitioned_pkey;
+
+DROP INDEX IF EXISTS idx_proposal_memo_events_memo;
+
+CREATE TABLE proposal_memo_events (
+    LIKE proposal_memo_events_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (event_id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE proposal_memo_events_default
+    PARTITION OF proposal_memo_events DEFAULT;
+
+INSERT INTO proposal_memo_events
+SELECT * FROM proposal_memo_events_unpartitioned;
+
+DROP TABLE proposal_memo_events_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_proposal_memo_events_memo
+    ON proposal_memo_events (memo_id, occurred_at, event_id);
@@ -0,0 +1,25 @@
+CREATE TABLE IF NOT EXISTS tactical_house_view_cohorts (
+    cohort_id TEXT PRIMARY KEY,
+    tactical_view_id TEXT NOT NULL,
+    tactical_view_version TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    affected_count INTEGER NOT NULL,
+    excluded_count INTEGER NOT NULL,
+    summary_json TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tactical_house_view_cohort_portfolios (
+    cohort_id TEXT NOT NULL REFERENCES tactical_house_view_cohorts (cohort_id),
+    membership TEXT NOT NULL CHECK (membership IN ('affected', 'excluded')),
+    ordinal INTEGER NOT NULL,
+    portfolio_id TEXT NOT NULL,
+    portfolio_json TEXT NOT NULL,
+    PRIMARY KEY (cohort_id, membership, ordinal)
+);
+
+CREATE INDEX IF NOT EXISTS idx_tactical_house_view_cohorts_recency
+    ON tactical_house_view_cohorts (generated_at DESC, cohort_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_tactical_house_view_cohort_portfolios_portfolio
+    ON tactical_house_view_cohort_portfolios (portfolio_id, membership, cohort_id);
@@ -0,0 +1,13 @@
+CREATE TABLE IF NOT EXISTS proposal_memo_evidence_packs (
+    source_input_hash TEXT PRIMARY KEY,
+    proposal_id TEXT NOT NULL,
+    proposal_version_no INTEGER NOT NULL,
+    proposal_version_id TEXT NULL,
+    artifact_hash TEXT NOT NULL,
+    simulation_hash TEXT NOT NULL,
+    evidence_bundle_hash TEXT NOT NULL,
+    memo_hash TEXT NOT NULL,
+    pack_json TEXT NOT NULL,
+    materialized_at TEXT NOT NULL,
+    UNIQUE (proposal_id, proposal_version_no)
+);
@@ -0,0 +1,2 @@
+ALTER TABLE proposal_memo_evidence_packs
+ADD COLUMN IF NOT EXISTS builder_version TEXT NOT NULL DEFAULT '';
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_advisory_workspace_idempotency_retention
+    ON advisory_workspace_idempotency (created_at ASC, idempotency_key ASC);
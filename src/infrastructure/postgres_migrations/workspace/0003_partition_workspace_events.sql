@@ -0,0 +1,27 @@
+ALTER TABLE advisory_workspace_events RENAME TO advisory_workspace_events_unpartitioned;
+
+ALTER INDEX advisory_workspace_events_pkey
+    RENAME TO advisory_workspace_events_unpartitioned_pkey;
+
+DROP INDEX IF EXISTS idx_advisory_workspace_events_lookup;
+
+CREATE TABLE advisory_workspace_events (
+    LIKE advisory_workspace_events_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (workspace_id, event_id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+ALTER TABLE advisory_workspace_events
+    ADD CONSTRAINT fk_advisory_workspace_events_session
+    FOREIGN KEY (workspace_id)
+    REFERENCES advisory_workspace_sessions (workspace_id);
+
+CREATE TABLE advisory_workspace_events_default
+    PARTITION OF advisory_workspace_events DEFAULT;
+
+INSERT INTO advisory_workspace_events
+SELECT * FROM advisory_workspace_events_unpartitioned;
+
+DROP TABLE advisory_workspace_events_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_advisory_workspace_events_lookup
+    ON advisory_workspace_events (workspace_id, occurred_at, event_id);
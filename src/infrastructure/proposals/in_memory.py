@@ -1,3 +1,5 @@
+from bisect import insort
+from collections.abc import Collection
 from datetime import datetime
 from threading import Lock
 from typing import Optional
@@ -13,11 +15,14 @@ from src.core.proposals.models import (
     ProposalAsyncOperationRecord,
     ProposalIdempotencyRecord,
     ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoIdempotencyRecord,
     ProposalMemoRecord,
     ProposalRecord,
     ProposalSimulationIdempotencyRecord,
     ProposalTransitionResult,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -26,7 +31,6 @@ from src.infrastructure.proposals.in_memory_query import (
     control_operations,
     copy_optional,
     copy_record,
-    copy_records,
     current_version_for_proposal,
     filtered_proposal_page,
     ordered_approvals_for_proposals,
@@ -34,16 +38,30 @@ from src.infrastructure.proposals.in_memory_query import (
     ordered_memo_events,
     ordered_memos_for_proposal,
     ordered_memos_for_proposals,
+    ordered_version_headers_for_proposal,
     ordered_versions_for_proposal,
     recoverable_operations,
+    share_optional,
+    share_record,
+    share_records,
+    version_with_sections,
 )
 
 
 class InMemoryProposalRepository(ProposalRepository):
+    """Process-local proposal store with copy-on-write records and secondary indexes.
+
+    Writes store a deep copy that is never mutated afterwards; reads hand out shallow copies
+    that share nested payloads with the stored snapshot. Version, portfolio, and memo indexes
+    keep per-proposal and per-portfolio reads proportional to the result size.
+    """
+
     def __init__(self) -> None:
         self._lock = Lock()
         self._proposals: dict[str, ProposalRecord] = {}
         self._versions: dict[tuple[str, int], ProposalVersionRecord] = {}
+        self._version_nos_by_proposal: dict[str, list[int]] = {}
+        self._proposal_ids_by_portfolio: dict[str, set[str]] = {}
         self._events: dict[str, list[ProposalWorkflowEventRecord]] = {}
         self._approvals: dict[str, list[ProposalApprovalRecordData]] = {}
         self._idempotency: dict[str, ProposalIdempotencyRecord] = {}
@@ -54,7 +72,9 @@ class InMemoryProposalRepository(ProposalRepository):
         self._operation_by_idempotency: dict[str, str] = {}
         self._memos: dict[str, ProposalMemoRecord] = {}
         self._memo_by_proposal_version: dict[tuple[str, int], str] = {}
+        self._memo_ids_by_proposal: dict[str, list[str]] = {}
         self._memo_events: dict[str, list[ProposalMemoEventRecord]] = {}
+        self._memo_evidence_packs: dict[tuple[str, int], ProposalMemoEvidencePackRecord] = {}
         self._cockpit_acknowledgements: dict[str, CockpitAcknowledgementRecord] = {}
         self._cockpit_acknowledgement_idempotency: dict[
             str, CockpitAcknowledgementIdempotencyRecord
@@ -63,7 +83,7 @@ class InMemoryProposalRepository(ProposalRepository):
     def get_idempotency(self, *, idempotency_key: str) -> Optional[ProposalIdempotencyRecord]:
         with self._lock:
             record = self._idempotency.get(idempotency_key)
-            return copy_optional(record)
+            return share_optional(record)
 
     def save_idempotency(self, record: ProposalIdempotencyRecord) -> None:
         with self._lock:
@@ -74,7 +94,7 @@ class InMemoryProposalRepository(ProposalRepository):
     ) -> Optional[ProposalSimulationIdempotencyRecord]:
         with self._lock:
             record = self._simulation_idempotency.get(idempotency_key)
-            return copy_optional(record)
+            return share_optional(record)
 
     def save_simulation_idempotency(self, record: ProposalSimulationIdempotencyRecord) -> None:
         with self._lock:
@@ -85,7 +105,7 @@ class InMemoryProposalRepository(ProposalRepository):
     ) -> Optional[ProposalMemoIdempotencyRecord]:
         with self._lock:
             record = self._memo_idempotency.get(idempotency_key)
-            return copy_optional(record)
+            return share_optional(record)
 
     def save_memo_idempotency(self, record: ProposalMemoIdempotencyRecord) -> None:
         with self._lock:
@@ -109,8 +129,7 @@ class InMemoryProposalRepository(ProposalRepository):
                 if existing.memo_hash != memo.memo_hash:
                     raise ValueError("MEMO_HASH_CONFLICT")
                 return
-            self._memos[memo.memo_id] = copy_record(memo)
-            self._memo_by_proposal_version[proposal_version_key] = memo.memo_id
+            self._store_memo(copy_record(memo))
 
     def create_memo_with_idempotency_event(
         self,
@@ -167,9 +186,12 @@ class InMemoryProposalRepository(ProposalRepository):
     ) -> None:
         if memo.memo_id in self._memos:
             return
-        proposal_version_key = (memo.proposal_id, memo.proposal_version_no)
-        self._memos[memo.memo_id] = memo_copy
-        self._memo_by_proposal_version[proposal_version_key] = memo.memo_id
+        self._store_memo(memo_copy)
+
+    def _store_memo(self, memo: ProposalMemoRecord) -> None:
+        self._memos[memo.memo_id] = memo
+        self._memo_by_proposal_version[(memo.proposal_id, memo.proposal_version_no)] = memo.memo_id
+        self._memo_ids_by_proposal.setdefault(memo.proposal_id, []).append(memo.memo_id)
 
     def _store_memo_idempotency_if_absent(
         self,
@@ -194,7 +216,7 @@ class InMemoryProposalRepository(ProposalRepository):
     def get_memo(self, *, memo_id: str) -> Optional[ProposalMemoRecord]:
         with self._lock:
             memo = self._memos.get(memo_id)
-            return copy_optional(memo)
+            return share_optional(memo)
 
     def get_memo_by_proposal_version(
         self, *, proposal_id: str, proposal_version_no: int
@@ -204,18 +226,39 @@ class InMemoryProposalRepository(ProposalRepository):
             if memo_id is None:
                 return None
             memo = self._memos.get(memo_id)
-            return copy_optional(memo)
+            return share_optional(memo)
 
     def list_memos(self, *, proposal_id: str) -> list[ProposalMemoRecord]:
         with self._lock:
-            memos = list(self._memos.values())
+            memos = self._memos_for_proposals([proposal_id])
         return ordered_memos_for_proposal(memos, proposal_id=proposal_id)
 
     def list_memos_for_proposals(self, *, proposal_ids: list[str]) -> list[ProposalMemoRecord]:
         with self._lock:
-            memos = list(self._memos.values())
+            memos = self._memos_for_proposals(proposal_ids)
         return ordered_memos_for_proposals(memos, proposal_ids=proposal_ids)
 
+    def save_memo_evidence_pack(self, record: ProposalMemoEvidencePackRecord) -> None:
+        record_copy = copy_record(record)
+        with self._lock:
+            self._memo_evidence_packs.setdefault(
+                (record.proposal_id, record.proposal_version_no), record_copy
+            )
+
+    def get_memo_evidence_pack(
+        self, *, proposal_id: str, proposal_version_no: int
+    ) -> Optional[ProposalMemoEvidencePackRecord]:
+        with self._lock:
+            record = self._memo_evidence_packs.get((proposal_id, proposal_version_no))
+            return share_optional(record)
+
+    def _memos_for_proposals(self, proposal_ids: list[str]) -> list[ProposalMemoRecord]:
+        return [
+            self._memos[memo_id]
+            for proposal_id in dict.fromkeys(proposal_ids)
+            for memo_id in self._memo_ids_by_proposal.get(proposal_id, ())
+        ]
+
     def append_memo_event(self, event: ProposalMemoEventRecord) -> None:
         with self._lock:
             events = self._memo_events.setdefault(event.memo_id, [])
@@ -233,14 +276,14 @@ class InMemoryProposalRepository(ProposalRepository):
     ) -> Optional[CockpitAcknowledgementRecord]:
         with self._lock:
             record = self._cockpit_acknowledgements.get(action_item_id)
-            return copy_optional(record)
+            return share_optional(record)
 
     def list_cockpit_acknowledgements(
         self, *, action_item_ids: list[str]
     ) -> dict[str, CockpitAcknowledgementRecord]:
         with self._lock:
             return {
-                action_item_id: copy_record(record)
+                action_item_id: share_record(record)
                 for action_item_id in dict.fromkeys(action_item_ids)
                 if (record := self._cockpit_acknowledgements.get(action_item_id)) is not None
             }
@@ -273,7 +316,7 @@ class InMemoryProposalRepository(ProposalRepository):
     ) -> Optional[CockpitAcknowledgementIdempotencyRecord]:
         with self._lock:
             record = self._cockpit_acknowledgement_idempotency.get(idempotency_key)
-            return copy_optional(record)
+            return share_optional(record)
 
     def create_operation(self, operation: ProposalAsyncOperationRecord) -> None:
         with self._lock:
@@ -293,12 +336,13 @@ class InMemoryProposalRepository(ProposalRepository):
                 if existing_operation_id is not None:
                     existing = self._operations.get(existing_operation_id)
                     if existing is not None:
-                        return copy_record(existing), False
-            self._operations[operation.operation_id] = copy_record(operation)
+                        return share_record(existing), False
+            stored = copy_record(operation)
+            self._operations[operation.operation_id] = stored
             self._operation_by_correlation[operation.correlation_id] = operation.operation_id
             if operation.idempotency_key:
                 self._operation_by_idempotency[operation.idempotency_key] = operation.operation_id
-            return copy_record(operation), True
+            return share_record(stored), True
 
     def update_operation(self, operation: ProposalAsyncOperationRecord) -> None:
         with self._lock:
@@ -310,7 +354,7 @@ class InMemoryProposalRepository(ProposalRepository):
     def get_operation(self, *, operation_id: str) -> Optional[ProposalAsyncOperationRecord]:
         with self._lock:
             operation = self._operations.get(operation_id)
-            return copy_optional(operation)
+            return share_optional(operation)
 
     def get_operation_by_correlation(
         self, *, correlation_id: str
@@ -320,7 +364,7 @@ class InMemoryProposalRepository(ProposalRepository):
             if operation_id is None:
                 return None
             operation = self._operations.get(operation_id)
-            return copy_optional(operation)
+            return share_optional(operation)
 
     def get_operation_by_idempotency(
         self, *, idempotency_key: str
@@ -330,7 +374,7 @@ class InMemoryProposalRepository(ProposalRepository):
             if operation_id is None:
                 return None
             operation = self._operations.get(operation_id)
-            return copy_optional(operation)
+            return share_optional(operation)
 
     def list_recoverable_operations(
         self, *, as_of: datetime, limit: Optional[int] = None
@@ -349,7 +393,7 @@ class InMemoryProposalRepository(ProposalRepository):
 
     def create_proposal(self, proposal: ProposalRecord) -> None:
         with self._lock:
-            self._proposals[proposal.proposal_id] = copy_record(proposal)
+            self._store_proposal(copy_record(proposal))
 
     def create_proposal_with_version_event_idempotency(
         self,
@@ -364,19 +408,28 @@ class InMemoryProposalRepository(ProposalRepository):
         event_copy = copy_record(event)
         idempotency_copy = copy_record(idempotency)
         with self._lock:
-            self._proposals[proposal.proposal_id] = proposal_copy
-            self._versions[(version.proposal_id, version.version_no)] = version_copy
+            self._store_proposal(proposal_copy)
+            self._store_version(version_copy)
             self._events.setdefault(event.proposal_id, []).append(event_copy)
             self._idempotency[idempotency.idempotency_key] = idempotency_copy
 
     def update_proposal(self, proposal: ProposalRecord) -> None:
         with self._lock:
-            self._proposals[proposal.proposal_id] = copy_record(proposal)
+            self._store_proposal(copy_record(proposal))
+
+    def _store_proposal(self, proposal: ProposalRecord) -> None:
+        previous = self._proposals.get(proposal.proposal_id)
+        if previous is not None and previous.portfolio_id != proposal.portfolio_id:
+            self._proposal_ids_by_portfolio[previous.portfolio_id].discard(proposal.proposal_id)
+        self._proposals[proposal.proposal_id] = proposal
+        self._proposal_ids_by_portfolio.setdefault(proposal.portfolio_id, set()).add(
+            proposal.proposal_id
+        )
 
     def get_proposal(self, *, proposal_id: str) -> Optional[ProposalRecord]:
         with self._lock:
             proposal = self._proposals.get(proposal_id)
-            return copy_optional(proposal)
+            return share_optional(proposal)
 
     def list_proposals(
         self,
@@ -390,7 +443,13 @@ class InMemoryProposalRepository(ProposalRepository):
         cursor: Optional[str],
     ) -> tuple[list[ProposalRecord], Optional[str]]:
         with self._lock:
-            rows = list(self._proposals.values())
+            if portfolio_id is None:
+                rows = list(self._proposals.values())
+            else:
+                rows = [
+                    self._proposals[proposal_id]
+                    for proposal_id in self._proposal_ids_by_portfolio.get(portfolio_id, ())
+                ]
         return filtered_proposal_page(
             rows,
             portfolio_id=portfolio_id,
@@ -404,22 +463,68 @@ class InMemoryProposalRepository(ProposalRepository):
 
     def create_version(self, version: ProposalVersionRecord) -> None:
         with self._lock:
-            self._versions[(version.proposal_id, version.version_no)] = copy_record(version)
+            self._store_version(copy_record(version))
+
+    def _store_version(self, version: ProposalVersionRecord) -> None:
+        key = (version.proposal_id, version.version_no)
+        if key not in self._versions:
+            insort(self._version_nos_by_proposal.setdefault(version.proposal_id, []), key[1])
+        self._versions[key] = version
+
+    def _versions_for_proposal(self, proposal_id: str) -> list[ProposalVersionRecord]:
+        return [
+            self._versions[(proposal_id, version_no)]
+            for version_no in self._version_nos_by_proposal.get(proposal_id, ())
+        ]
+
+    def _current_version(self, proposal_id: str) -> Optional[ProposalVersionRecord]:
+        version_nos = self._version_nos_by_proposal.get(proposal_id)
+        if not version_nos:
+            return None
+        return self._versions[(proposal_id, version_nos[-1])]
 
     def get_version(self, *, proposal_id: str, version_no: int) -> Optional[ProposalVersionRecord]:
         with self._lock:
             version = self._versions.get((proposal_id, version_no))
-            return copy_optional(version)
+            return share_optional(version)
 
     def list_versions(self, *, proposal_id: str) -> list[ProposalVersionRecord]:
         with self._lock:
-            versions = list(self._versions.values())
+            versions = self._versions_for_proposal(proposal_id)
         return ordered_versions_for_proposal(versions, proposal_id=proposal_id)
 
     def get_current_version(self, *, proposal_id: str) -> Optional[ProposalVersionRecord]:
         with self._lock:
-            versions = list(self._versions.values())
-        return current_version_for_proposal(versions, proposal_id=proposal_id)
+            current = self._current_version(proposal_id)
+        return current_version_for_proposal(
+            [current] if current is not None else [], proposal_id=proposal_id
+        )
+
+    def list_version_headers(self, *, proposal_id: str) -> list[ProposalVersionHeaderRecord]:
+        with self._lock:
+            versions = self._versions_for_proposal(proposal_id)
+        return ordered_version_headers_for_proposal(versions, proposal_id=proposal_id)
+
+    def get_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        version_no: int,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]:
+        with self._lock:
+            version = self._versions.get((proposal_id, version_no))
+            return version_with_sections(version, sections=sections)
+
+    def get_current_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]:
+        with self._lock:
+            current = self._current_version(proposal_id)
+        return version_with_sections(current, sections=sections)
 
     def append_event(self, event: ProposalWorkflowEventRecord) -> None:
         with self._lock:
@@ -429,13 +534,17 @@ class InMemoryProposalRepository(ProposalRepository):
     def list_events(self, *, proposal_id: str) -> list[ProposalWorkflowEventRecord]:
         with self._lock:
             events = self._events.get(proposal_id, [])
-            return copy_records(events)
+            return share_records(events)
 
     def list_events_for_proposals(
         self, *, proposal_ids: list[str]
     ) -> list[ProposalWorkflowEventRecord]:
         with self._lock:
-            event_groups = list(self._events.values())
+            event_groups = [
+                list(self._events[proposal_id])
+                for proposal_id in dict.fromkeys(proposal_ids)
+                if proposal_id in self._events
+            ]
         return ordered_events_for_proposals(event_groups, proposal_ids=proposal_ids)
 
     def create_approval(self, approval: ProposalApprovalRecordData) -> None:
@@ -446,13 +555,17 @@ class InMemoryProposalRepository(ProposalRepository):
     def list_approvals(self, *, proposal_id: str) -> list[ProposalApprovalRecordData]:
         with self._lock:
             approvals = self._approvals.get(proposal_id, [])
-            return copy_records(approvals)
+            return share_records(approvals)
 
     def list_approvals_for_proposals(
         self, *, proposal_ids: list[str]
     ) -> list[ProposalApprovalRecordData]:
         with self._lock:
-            approval_groups = list(self._approvals.values())
+            approval_groups = [
+                list(self._approvals[proposal_id])
+                for proposal_id in dict.fromkeys(proposal_ids)
+                if proposal_id in self._approvals
+            ]
         return ordered_approvals_for_proposals(approval_groups, proposal_ids=proposal_ids)
 
     def transition_proposal(
@@ -478,13 +591,16 @@ class InMemoryProposalRepository(ProposalRepository):
                 raise ProposalStateConflictError(
                     "STATE_CONFLICT: proposal aggregate changed during transition"
                 )
-            self._events.setdefault(event.proposal_id, []).append(copy_record(event))
-            if approval is not None:
-                self._approvals.setdefault(approval.proposal_id, []).append(copy_record(approval))
-            self._proposals[proposal.proposal_id] = copy_record(proposal)
+            stored_event = copy_record(event)
+            stored_approval = copy_optional(approval)
+            stored_proposal = copy_record(proposal)
+            self._events.setdefault(event.proposal_id, []).append(stored_event)
+            if stored_approval is not None:
+                self._approvals.setdefault(stored_approval.proposal_id, []).append(stored_approval)
+            self._store_proposal(stored_proposal)
 
         return ProposalTransitionResult(
-            proposal=copy_record(proposal),
-            event=copy_record(event),
-            approval=copy_optional(approval),
+            proposal=share_record(stored_proposal),
+            event=share_record(stored_event),
+            approval=share_optional(stored_approval),
         )
@@ -1,6 +1,9 @@
+from collections.abc import Collection
 from copy import deepcopy
 from datetime import datetime
-from typing import Iterable, Optional, TypeVar, cast
+from typing import Any, Iterable, Optional, TypeVar, cast
+
+from pydantic import BaseModel
 
 from src.core.proposals.models import (
     ProposalApprovalRecordData,
@@ -8,11 +11,14 @@ from src.core.proposals.models import (
     ProposalMemoEventRecord,
     ProposalMemoRecord,
     ProposalRecord,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
 
 RecordT = TypeVar("RecordT")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def copy_optional(record: RecordT | None) -> RecordT | None:
@@ -27,6 +33,24 @@ def copy_records(records: Iterable[RecordT]) -> list[RecordT]:
     return [deepcopy(record) for record in records]
 
 
+def share_record(record: ModelT) -> ModelT:
+    """Return a reader-owned top-level record that shares nested payloads with the snapshot.
+
+    Records are deep-copied once when written and never mutated in the store afterwards, so a
+    shallow copy is enough for callers that reassign fields on what they read. Nested JSON
+    payloads are shared and must be treated as read-only.
+    """
+    return cast(ModelT, record.model_copy())
+
+
+def share_optional(record: ModelT | None) -> ModelT | None:
+    return record.model_copy() if record is not None else None
+
+
+def share_records(records: Iterable[ModelT]) -> list[ModelT]:
+    return [record.model_copy() for record in records]
+
+
 def filtered_proposal_page(
     rows: Iterable[ProposalRecord],
     *,
@@ -53,7 +77,7 @@ def filtered_proposal_page(
     ]
     filtered = _apply_proposal_cursor(filtered, cursor)
     page = filtered[:limit]
-    return copy_records(page), _next_page_cursor(filtered, page, limit)
+    return share_records(page), _next_page_cursor(filtered, page, limit)
 
 
 def _proposal_matches_filters(
@@ -139,7 +163,7 @@ def ordered_memos_for_proposal(
 ) -> list[ProposalMemoRecord]:
     filtered = [memo for memo in memos if memo.proposal_id == proposal_id]
     filtered.sort(key=lambda memo: (memo.proposal_version_no, memo.created_at, memo.memo_id))
-    return copy_records(filtered)
+    return share_records(filtered)
 
 
 def ordered_memos_for_proposals(
@@ -160,14 +184,14 @@ def ordered_memos_for_proposals(
             memo.memo_id,
         )
     )
-    return copy_records(filtered)
+    return share_records(filtered)
 
 
 def ordered_memo_events(
     events: Iterable[ProposalMemoEventRecord],
 ) -> list[ProposalMemoEventRecord]:
     sorted_events = sorted(events, key=lambda event: (event.occurred_at, event.event_id))
-    return copy_records(sorted_events)
+    return share_records(sorted_events)
 
 
 def ordered_events_for_proposals(
@@ -192,7 +216,7 @@ def ordered_events_for_proposals(
             event.event_id,
         )
     )
-    return copy_records(events)
+    return share_records(events)
 
 
 def ordered_approvals_for_proposals(
@@ -217,7 +241,7 @@ def ordered_approvals_for_proposals(
             approval.approval_id,
         )
     )
-    return copy_records(approvals)
+    return share_records(approvals)
 
 
 def ordered_versions_for_proposal(
@@ -227,7 +251,7 @@ def ordered_versions_for_proposal(
 ) -> list[ProposalVersionRecord]:
     filtered = [version for version in versions if version.proposal_id == proposal_id]
     filtered.sort(key=lambda version: version.version_no)
-    return copy_records(filtered)
+    return share_records(filtered)
 
 
 def current_version_for_proposal(
@@ -239,7 +263,58 @@ def current_version_for_proposal(
     if not filtered:
         return None
     filtered.sort(key=lambda version: version.version_no, reverse=True)
-    return copy_optional(filtered[0])
+    return share_record(filtered[0])
+
+
+def ordered_version_headers_for_proposal(
+    versions: Iterable[ProposalVersionRecord],
+    *,
+    proposal_id: str,
+) -> list[ProposalVersionHeaderRecord]:
+    filtered = [version for version in versions if version.proposal_id == proposal_id]
+    filtered.sort(key=lambda version: version.version_no)
+    return [version_header(version) for version in filtered]
+
+
+def version_header(version: ProposalVersionRecord) -> ProposalVersionHeaderRecord:
+    return ProposalVersionHeaderRecord(
+        proposal_version_id=version.proposal_version_id,
+        proposal_id=version.proposal_id,
+        version_no=version.version_no,
+        created_at=version.created_at,
+        request_hash=version.request_hash,
+        artifact_hash=version.artifact_hash,
+        simulation_hash=version.simulation_hash,
+        status_at_creation=version.status_at_creation,
+    )
+
+
+def version_with_sections(
+    version: ProposalVersionRecord | None,
+    *,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> ProposalVersionRecord | None:
+    if version is None:
+        return None
+    return ProposalVersionRecord(
+        **version_header(version).model_dump(),
+        proposal_result_json=_section_payload(
+            version.proposal_result_json, "proposal_result", sections
+        ),
+        artifact_json=_section_payload(version.artifact_json, "artifact", sections),
+        evidence_bundle_json=_section_payload(
+            version.evidence_bundle_json, "evidence_bundle", sections
+        ),
+        gate_decision_json=version.gate_decision_json if "gate_decision" in sections else None,
+    )
+
+
+def _section_payload(
+    payload: dict[str, Any],
+    section: ProposalVersionPayloadSection,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> dict[str, Any]:
+    return payload if section in sections else {}
 
 
 def recoverable_operations(
@@ -252,7 +327,7 @@ def recoverable_operations(
         return []
     recoverable = recoverable_operation_rows(operations, as_of=as_of)
     recoverable.sort(key=lambda operation: (operation.created_at, operation.operation_id))
-    return copy_records(limited_records(recoverable, limit))
+    return share_records(limited_records(recoverable, limit))
 
 
 def control_operations(
@@ -268,7 +343,7 @@ def control_operations(
         if operation.status in {"PENDING", "RUNNING", "FAILED"}
     ]
     control_rows.sort(key=lambda operation: (operation.created_at, operation.operation_id))
-    return copy_records(limited_records(control_rows, limit))
+    return share_records(limited_records(control_rows, limit))
 
 
 def non_positive_limit(limit: Optional[int]) -> bool:
@@ -324,6 +399,7 @@ __all__ = [
     "ordered_memo_events",
     "ordered_memos_for_proposal",
     "ordered_memos_for_proposals",
+    "ordered_version_headers_for_proposal",
     "ordered_versions_for_proposal",
     "limited_records",
     "non_positive_limit",
@@ -337,4 +413,9 @@ __all__ = [
     "recoverable_operations",
     "recoverable_operation_rows",
     "running_operation_lease_has_expired",
+    "share_optional",
+    "share_record",
+    "share_records",
+    "version_header",
+    "version_with_sections",
 ]
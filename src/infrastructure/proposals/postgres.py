@@ -1,6 +1,6 @@
 from contextlib import closing
 from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, timezone
 from importlib.util import find_spec
 from typing import Any, Optional, cast
 
@@ -9,6 +9,7 @@ from src.core.advisor_cockpit.persistence import (
     CockpitAcknowledgementRecord,
 )
 from src.core.proposals.contract_types import ProposalWorkflowState
+from src.core.proposals.event_journal import EventJournalSettings
 from src.core.proposals.exceptions import ProposalStateConflictError
 from src.core.proposals.models import (
     ProposalApprovalRecordData,
@@ -23,6 +24,10 @@ from src.core.proposals.models import (
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
+from src.infrastructure.postgres_event_partitions import (
+    PROPOSAL_EVENT_PARTITION_TABLES,
+    ensure_event_partitions,
+)
 from src.infrastructure.postgres_migrations import apply_postgres_migrations
 from src.infrastructure.proposals import postgres_approvals as _approvals
 from src.infrastructure.proposals import (
@@ -46,16 +51,28 @@ from src.infrastructure.proposals import (
 from src.infrastructure.proposals import (
     postgres_workflow_events as _workflow_events,
 )
+from src.infrastructure.proposals.postgres_event_journal import PostgresMemoEventsMixin
+from src.infrastructure.proposals.postgres_memo_evidence_packs import (
+    PostgresMemoEvidencePackMixin,
+)
+from src.infrastructure.proposals.postgres_version_reads import (
+    PostgresProposalVersionReadsMixin,
+)
 
 
-class PostgresProposalRepository:
-    def __init__(self, *, dsn: str) -> None:
+class PostgresProposalRepository(
+    PostgresProposalVersionReadsMixin,
+    PostgresMemoEvidencePackMixin,
+    PostgresMemoEventsMixin,
+):
+    def __init__(self, *, dsn: str, event_journal: EventJournalSettings | None = None) -> None:
         if not dsn:
             raise RuntimeError("PROPOSAL_POSTGRES_DSN_REQUIRED")
         if find_spec("psycopg") is None:
             raise RuntimeError("PROPOSAL_POSTGRES_DRIVER_MISSING")
         self._dsn = dsn
         self._init_db()
+        self._start_memo_event_journal(event_journal)
 
     def get_idempotency(self, *, idempotency_key: str) -> Optional[ProposalIdempotencyRecord]:
         return _idempotency.get_proposal_idempotency(
@@ -136,15 +153,6 @@ class PostgresProposalRepository:
             _memos.list_memos_for_proposals(connect=self._connect, proposal_ids=proposal_ids),
         )
 
-    def append_memo_event(self, event: ProposalMemoEventRecord) -> None:
-        _memos.append_memo_event(connect=self._connect, event=event)
-
-    def list_memo_events(self, *, memo_id: str) -> list[ProposalMemoEventRecord]:
-        return cast(
-            list[ProposalMemoEventRecord],
-            _memos.list_memo_events(connect=self._connect, memo_id=memo_id),
-        )
-
     def get_cockpit_acknowledgement(
         self, *, action_item_id: str
     ) -> Optional[CockpitAcknowledgementRecord]:
@@ -295,22 +303,6 @@ class PostgresProposalRepository:
     def create_version(self, version: ProposalVersionRecord) -> None:
         _versions.create_version(connect=self._connect, version=version)
 
-    def get_version(self, *, proposal_id: str, version_no: int) -> Optional[ProposalVersionRecord]:
-        return _versions.get_version(
-            connect=self._connect,
-            proposal_id=proposal_id,
-            version_no=version_no,
-        )
-
-    def list_versions(self, *, proposal_id: str) -> list[ProposalVersionRecord]:
-        return cast(
-            list[ProposalVersionRecord],
-            _versions.list_versions(connect=self._connect, proposal_id=proposal_id),
-        )
-
-    def get_current_version(self, *, proposal_id: str) -> Optional[ProposalVersionRecord]:
-        return _versions.get_current_version(connect=self._connect, proposal_id=proposal_id)
-
     def append_event(self, event: ProposalWorkflowEventRecord) -> None:
         _workflow_events.append_event(connect=self._connect, event=event)
 
@@ -389,6 +381,11 @@ class PostgresProposalRepository:
     def _init_db(self) -> None:
         with closing(self._connect()) as connection:
             apply_postgres_migrations(connection=connection, namespace="proposals")
+            ensure_event_partitions(
+                connection=connection,
+                tables=PROPOSAL_EVENT_PARTITION_TABLES,
+                as_of=datetime.now(timezone.utc).date(),
+            )
 
 
 def _import_psycopg() -> tuple[Any, Any]:
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, cast
+
+from src.core.proposals.event_journal import (
+    MEMO_EVENT_JOURNAL_FAMILY,
+    EventJournalSettings,
+    memo_event_durability,
+    observe_event_journal,
+    register_event_journal,
+)
+from src.core.proposals.models import ProposalMemoEventRecord
+from src.infrastructure.proposals import postgres_memos as _memos
+
+ConnectionFactory = Callable[[], Any]
+
+DEFAULT_EVENT_JOURNAL_CLOSE_TIMEOUT_SECONDS = 10.0
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresMemoEventJournal:
+    """Bounded write-behind buffer for supportability memo events.
+
+    Events are committed by a writer thread every flush interval, or sooner once a batch is full.
+    ``flush`` writes everything pending on the caller and returns once it is committed, which is
+    how reads in this process see their own writes. A full buffer, or a closed journal, writes the
+    event inline instead of dropping it. A batch that fails is retried one event at a time; an
+    event that still fails is logged and counted as ``failed``.
+    """
+
+    def __init__(self, *, connect: ConnectionFactory, settings: EventJournalSettings) -> None:
+        self._connect = connect
+        self._settings = settings
+        self._pending: list[ProposalMemoEventRecord] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._run, name="proposal-memo-event-journal", daemon=True
+        )
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def submit(self, event: ProposalMemoEventRecord) -> None:
+        batch_ready = False
+        with self._lock:
+            queued = not self._closed and len(self._pending) < self._settings.max_pending
+            if queued:
+                self._pending.append(event)
+                batch_ready = len(self._pending) >= self._settings.batch_size
+        if queued:
+            observe_event_journal(family=MEMO_EVENT_JOURNAL_FAMILY, outcome="queued")
+            if batch_ready:
+                self._wake.set()
+            return
+        _memos.append_memo_event(connect=self._connect, event=event)
+        observe_event_journal(family=MEMO_EVENT_JOURNAL_FAMILY, outcome="inline")
+
+    def flush(self) -> None:
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    batch = self._pending[: self._settings.batch_size]
+                    del self._pending[: len(batch)]
+                if not batch:
+                    return
+                self._write_batch(batch)
+
+    def close(self, timeout_seconds: float = DEFAULT_EVENT_JOURNAL_CLOSE_TIMEOUT_SECONDS) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        if self._writer.is_alive():
+            self._writer.join(timeout_seconds)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._settings.flush_interval_seconds)
+            self._wake.clear()
+            with self._lock:
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - _write_batch handles write failures
+                logger.exception("proposal_memo_event_journal_flush_failed")
+
+    def _write_batch(self, batch: list[ProposalMemoEventRecord]) -> None:
+        try:
+            _memos.insert_memo_events(connect=self._connect, events=batch)
+        except Exception:
+            logger.warning(
+                "proposal_memo_event_journal_batch_failed",
+                extra={"batch_size": len(batch)},
+                exc_info=True,
+            )
+        else:
+            observe_event_journal(
+                family=MEMO_EVENT_JOURNAL_FAMILY, outcome="flushed", count=len(batch)
+            )
+            return
+        for event in batch:
+            try:
+                _memos.append_memo_event(connect=self._connect, event=event)
+            except Exception:
+                logger.exception(
+                    "proposal_memo_event_journal_write_failed",
+                    extra={"event_id": event.event_id, "memo_id": event.memo_id},
+                )
+                observe_event_journal(family=MEMO_EVENT_JOURNAL_FAMILY, outcome="failed")
+            else:
+                observe_event_journal(family=MEMO_EVENT_JOURNAL_FAMILY, outcome="flushed")
+
+
+class PostgresMemoEventsMixin:
+    _memo_event_journal: PostgresMemoEventJournal | None = None
+
+    def append_memo_event(self, event: ProposalMemoEventRecord) -> None:
+        journal = self._memo_event_journal
+        if journal is not None and memo_event_durability(event.event_type) == "write_behind":
+            journal.submit(event)
+            return
+        _memos.append_memo_event(connect=self._memo_event_connect(), event=event)
+
+    def list_memo_events(self, *, memo_id: str) -> list[ProposalMemoEventRecord]:
+        if self._memo_event_journal is not None:
+            self._memo_event_journal.flush()
+        return cast(
+            list[ProposalMemoEventRecord],
+            _memos.list_memo_events(connect=self._memo_event_connect(), memo_id=memo_id),
+        )
+
+    def _start_memo_event_journal(self, settings: EventJournalSettings | None) -> None:
+        if settings is None:
+            return
+        journal = PostgresMemoEventJournal(connect=self._memo_event_connect(), settings=settings)
+        journal.start()
+        register_event_journal(journal)
+        self._memo_event_journal = journal
+
+    def _memo_event_connect(self) -> ConnectionFactory:
+        return cast(ConnectionFactory, getattr(self, "_connect"))
+
+
+__all__ = [
+    "DEFAULT_EVENT_JOURNAL_CLOSE_TIMEOUT_SECONDS",
+    "PostgresMemoEventJournal",
+    "PostgresMemoEventsMixin",
+]
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from contextlib import closing
+from importlib.util import find_spec
+from typing import Any
+
+from src.core.proposals.history_import import (
+    ProposalHistoryImportBatchResult,
+    ProposalHistoryImportConflict,
+    ProposalHistoryImportRecord,
+)
+from src.infrastructure.proposals.postgres_approvals import APPROVAL_COLUMNS
+from src.infrastructure.proposals.postgres_mappers import json_dump, optional_json
+from src.infrastructure.proposals.postgres_records import PROPOSAL_COLUMNS
+from src.infrastructure.proposals.postgres_versions import VERSION_COLUMNS
+from src.infrastructure.proposals.postgres_workflow_events import EVENT_COLUMNS
+
+PROPOSAL_HISTORY_IMPORT_LOCK_KEY = "proposal_history_import"
+
+_STAGE_RECORDS = "proposal_history_stage_records"
+_STAGE_VERSIONS = "proposal_history_stage_versions"
+_STAGE_EVENTS = "proposal_history_stage_workflow_events"
+_STAGE_APPROVALS = "proposal_history_stage_approvals"
+
+_STAGING_TABLES = (
+    (_STAGE_RECORDS, "proposal_records"),
+    (_STAGE_VERSIONS, "proposal_versions"),
+    (_STAGE_EVENTS, "proposal_workflow_events"),
+    (_STAGE_APPROVALS, "proposal_approvals"),
+)
+
+
+def _column_names(columns: str) -> tuple[str, ...]:
+    return tuple(column.strip() for column in columns.split(",") if column.strip())
+
+
+def _row(alias: str, columns: Iterable[str]) -> str:
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+_RECORD_COLUMNS = _column_names(PROPOSAL_COLUMNS)
+_VERSION_COLUMNS = _column_names(VERSION_COLUMNS)
+_EVENT_COLUMNS = _column_names(EVENT_COLUMNS)
+_APPROVAL_COLUMNS = _column_names(APPROVAL_COLUMNS)
+# Payload JSON is covered by the hashes, so version conflicts compare identity and hashes only.
+_VERSION_IDENTITY_COLUMNS = (
+    "proposal_version_id",
+    "created_at",
+    "request_hash",
+    "artifact_hash",
+    "simulation_hash",
+    "status_at_creation",
+)
+
+# One pass over the staged batch returns every proposal whose rows disagree with stored history or
+# reuse an identifier that another staged proposal also claims. Identical stored rows are not
+# conflicts; the merge skips them.
+_CONFLICT_QUERY = f"""
+    SELECT DISTINCT proposal_id, reason_code
+    FROM (
+        SELECT s.proposal_id, 'PROPOSAL_RECORD_IDENTITY_CONFLICT' AS reason_code
+        FROM {_STAGE_RECORDS} s
+        JOIN proposal_records p ON p.proposal_id = s.proposal_id
+        WHERE ({_row("s", _RECORD_COLUMNS)}) IS DISTINCT FROM ({_row("p", _RECORD_COLUMNS)})
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_VERSION_HASH_CONFLICT'
+        FROM {_STAGE_VERSIONS} s
+        JOIN proposal_versions v
+          ON v.proposal_id = s.proposal_id AND v.version_no = s.version_no
+        WHERE ({_row("s", _VERSION_IDENTITY_COLUMNS)})
+            IS DISTINCT FROM ({_row("v", _VERSION_IDENTITY_COLUMNS)})
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_VERSION_IDENTITY_CONFLICT'
+        FROM {_STAGE_VERSIONS} s
+        JOIN proposal_versions v ON v.proposal_version_id = s.proposal_version_id
+        WHERE (v.proposal_id, v.version_no) IS DISTINCT FROM (s.proposal_id, s.version_no)
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_VERSION_IDENTITY_CONFLICT'
+        FROM {_STAGE_VERSIONS} s
+        JOIN {_STAGE_VERSIONS} o
+          ON o.proposal_version_id = s.proposal_version_id
+         AND (o.proposal_id, o.version_no) <> (s.proposal_id, s.version_no)
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_WORKFLOW_EVENT_IDENTITY_CONFLICT'
+        FROM {_STAGE_EVENTS} s
+        JOIN proposal_workflow_events e ON e.event_id = s.event_id
+        WHERE ({_row("s", _EVENT_COLUMNS)}) IS DISTINCT FROM ({_row("e", _EVENT_COLUMNS)})
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_WORKFLOW_EVENT_IDENTITY_CONFLICT'
+        FROM {_STAGE_EVENTS} s
+        JOIN {_STAGE_EVENTS} o ON o.event_id = s.event_id AND o.proposal_id <> s.proposal_id
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_APPROVAL_IDENTITY_CONFLICT'
+        FROM {_STAGE_APPROVALS} s
+        JOIN proposal_approvals a ON a.approval_id = s.approval_id
+        WHERE ({_row("s", _APPROVAL_COLUMNS)}) IS DISTINCT FROM ({_row("a", _APPROVAL_COLUMNS)})
+        UNION ALL
+        SELECT s.proposal_id, 'PROPOSAL_APPROVAL_IDENTITY_CONFLICT'
+        FROM {_STAGE_APPROVALS} s
+        JOIN {_STAGE_APPROVALS} o
+          ON o.approval_id = s.approval_id AND o.proposal_id <> s.proposal_id
+    ) conflicts
+    ORDER BY proposal_id, reason_code
+"""
+
+# Parents merge before children so the foreign keys to proposals and versions hold.
+_MERGE_RECORDS = f"""
+    INSERT INTO proposal_records ({", ".join(_RECORD_COLUMNS)})
+    SELECT {_row("s", _RECORD_COLUMNS)}
+    FROM {_STAGE_RECORDS} s
+    WHERE NOT (s.proposal_id = ANY(%s))
+    ON CONFLICT (proposal_id) DO NOTHING
+"""
+_MERGE_VERSIONS = f"""
+    INSERT INTO proposal_versions ({", ".join(_VERSION_COLUMNS)})
+    SELECT {_row("s", _VERSION_COLUMNS)}
+    FROM {_STAGE_VERSIONS} s
+    WHERE NOT (s.proposal_id = ANY(%s))
+    ON CONFLICT (proposal_id, version_no) DO NOTHING
+"""
+# The partitioned key includes occurred_at, so stored event ids are excluded explicitly.
+_MERGE_EVENTS = f"""
+    INSERT INTO proposal_workflow_events ({", ".join(_EVENT_COLUMNS)})
+    SELECT {_row("s", _EVENT_COLUMNS)}
+    FROM {_STAGE_EVENTS} s
+    WHERE NOT (s.proposal_id = ANY(%s))
+      AND NOT EXISTS (SELECT 1 FROM proposal_workflow_events e WHERE e.event_id = s.event_id)
+    ON CONFLICT DO NOTHING
+"""
+_MERGE_APPROVALS = f"""
+    INSERT INTO proposal_approvals ({", ".join(_APPROVAL_COLUMNS)})
+    SELECT {_row("s", _APPROVAL_COLUMNS)}
+    FROM {_STAGE_APPROVALS} s
+    WHERE NOT (s.proposal_id = ANY(%s))
+    ON CONFLICT (approval_id) DO NOTHING
+"""
+
+
+class PostgresProposalHistoryImporter:
+    """Bulk loader for historical proposals, separate from the request-path repository."""
+
+    def __init__(self, *, dsn: str) -> None:
+        if not dsn:
+            raise RuntimeError("PROPOSAL_POSTGRES_DSN_REQUIRED")
+        if find_spec("psycopg") is None:
+            raise RuntimeError("PROPOSAL_POSTGRES_DRIVER_MISSING")
+        self._dsn = dsn
+
+    def import_proposal_history_batch(
+        self, records: Sequence[ProposalHistoryImportRecord]
+    ) -> ProposalHistoryImportBatchResult:
+        with closing(self._connect()) as connection:
+            result = import_proposal_history_batch(connection=connection, records=records)
+            connection.commit()
+        return result
+
+    def _connect(self) -> Any:
+        import psycopg
+        from psycopg.rows import dict_row
+
+        return psycopg.connect(self._dsn, row_factory=dict_row)
+
+
+def import_proposal_history_batch(
+    *, connection: Any, records: Sequence[ProposalHistoryImportRecord]
+) -> ProposalHistoryImportBatchResult:
+    """Stage one batch with COPY, reject conflicting proposals, and merge the rest.
+
+    The caller owns the transaction. Staging tables are dropped at commit.
+    """
+    connection.execute(
+        "SELECT pg_advisory_xact_lock(hashtext(%s))", (PROPOSAL_HISTORY_IMPORT_LOCK_KEY,)
+    )
+    for stage_table, source_table in _STAGING_TABLES:
+        connection.execute(
+            f"CREATE TEMP TABLE {stage_table} (LIKE {source_table} INCLUDING DEFAULTS) "
+            "ON COMMIT DROP"
+        )
+    _copy_rows(connection, _STAGE_RECORDS, _RECORD_COLUMNS, _record_rows(records))
+    _copy_rows(connection, _STAGE_VERSIONS, _VERSION_COLUMNS, _version_rows(records))
+    _copy_rows(connection, _STAGE_EVENTS, _EVENT_COLUMNS, _event_rows(records))
+    _copy_rows(connection, _STAGE_APPROVALS, _APPROVAL_COLUMNS, _approval_rows(records))
+    for stage_table, _ in _STAGING_TABLES:
+        connection.execute(f"ANALYZE {stage_table}")
+    conflicts = tuple(
+        ProposalHistoryImportConflict(
+            proposal_id=row["proposal_id"], reason_code=row["reason_code"]
+        )
+        for row in connection.execute(_CONFLICT_QUERY).fetchall()
+    )
+    excluded = sorted({conflict.proposal_id for conflict in conflicts})
+    return ProposalHistoryImportBatchResult(
+        proposals_imported=connection.execute(_MERGE_RECORDS, (excluded,)).rowcount,
+        versions_imported=connection.execute(_MERGE_VERSIONS, (excluded,)).rowcount,
+        workflow_events_imported=connection.execute(_MERGE_EVENTS, (excluded,)).rowcount,
+        approvals_imported=connection.execute(_MERGE_APPROVALS, (excluded,)).rowcount,
+        conflicts=conflicts,
+    )
+
+
+def _copy_rows(
+    connection: Any,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple[object, ...]],
+) -> None:
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+
+
+def _record_rows(
+    records: Sequence[ProposalHistoryImportRecord],
+) -> Iterable[tuple[object, ...]]:
+    for record in records:
+        proposal = record.proposal
+        yield (
+            proposal.proposal_id,
+            proposal.portfolio_id,
+            proposal.mandate_id,
+            proposal.jurisdiction,
+            proposal.created_by,
+            proposal.created_at.isoformat(),
+            proposal.last_event_at.isoformat(),
+            proposal.current_state,
+            proposal.current_version_no,
+            proposal.title,
+            proposal.advisor_notes,
+            proposal.lifecycle_origin,
+            proposal.source_workspace_id,
+        )
+
+
+def _version_rows(
+    records: Sequence[ProposalHistoryImportRecord],
+) -> Iterable[tuple[object, ...]]:
+    for record in records:
+        for version in record.versions:
+            yield (
+                version.proposal_version_id,
+                version.proposal_id,
+                version.version_no,
+                version.created_at.isoformat(),
+                version.request_hash,
+                version.artifact_hash,
+                version.simulation_hash,
+                version.status_at_creation,
+                json_dump(version.proposal_result_json),
+                json_dump(version.artifact_json),
+                json_dump(version.evidence_bundle_json),
+                optional_json(version.gate_decision_json),
+            )
+
+
+def _event_rows(
+    records: Sequence[ProposalHistoryImportRecord],
+) -> Iterable[tuple[object, ...]]:
+    for record in records:
+        for event in record.workflow_events:
+            yield (
+                event.event_id,
+                event.proposal_id,
+                event.event_type,
+                event.from_state,
+                event.to_state,
+                event.actor_id,
+                event.occurred_at.isoformat(),
+                json_dump(event.reason_json),
+                event.related_version_no,
+            )
+
+
+def _approval_rows(
+    records: Sequence[ProposalHistoryImportRecord],
+) -> Iterable[tuple[object, ...]]:
+    for record in records:
+        for approval in record.approvals:
+            yield (
+                approval.approval_id,
+                approval.proposal_id,
+                approval.approval_type,
+                approval.approved,
+                approval.actor_id,
+                approval.occurred_at.isoformat(),
+                json_dump(approval.details_json),
+                approval.related_version_no,
+            )
+
+
+__all__ = [
+    "PROPOSAL_HISTORY_IMPORT_LOCK_KEY",
+    "PostgresProposalHistoryImporter",
+    "import_proposal_history_batch",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Collection
 from datetime import datetime
 from typing import Any, Optional, cast
 
@@ -8,8 +9,11 @@ from src.core.proposals.models import (
     ProposalApprovalRecordData,
     ProposalAsyncOperationRecord,
     ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoRecord,
     ProposalRecord,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -116,6 +120,50 @@ def to_version(row: Any) -> Optional[ProposalVersionRecord]:
     )
 
 
+def to_version_header(row: Any) -> Optional[ProposalVersionHeaderRecord]:
+    if row is None:
+        return None
+    return ProposalVersionHeaderRecord(
+        proposal_version_id=row["proposal_version_id"],
+        proposal_id=row["proposal_id"],
+        version_no=int(row["version_no"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        request_hash=row["request_hash"],
+        artifact_hash=row["artifact_hash"],
+        simulation_hash=row["simulation_hash"],
+        status_at_creation=row["status_at_creation"],
+    )
+
+
+def to_version_sections(
+    row: Any,
+    *,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> Optional[ProposalVersionRecord]:
+    header = to_version_header(row)
+    if header is None:
+        return None
+    return ProposalVersionRecord(
+        **header.model_dump(),
+        proposal_result_json=_section_json(row, "proposal_result", sections),
+        artifact_json=_section_json(row, "artifact", sections),
+        evidence_bundle_json=_section_json(row, "evidence_bundle", sections),
+        gate_decision_json=(
+            optional_load_json(row["gate_decision_json"]) if "gate_decision" in sections else None
+        ),
+    )
+
+
+def _section_json(
+    row: Any,
+    section: ProposalVersionPayloadSection,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> dict[str, Any]:
+    if section not in sections:
+        return {}
+    return cast(dict[str, Any], json.loads(row[f"{section}_json"]))
+
+
 def to_memo(row: Any) -> Optional[ProposalMemoRecord]:
     if row is None:
         return None
@@ -155,6 +203,24 @@ def to_memo_event(row: Any) -> ProposalMemoEventRecord:
     )
 
 
+def to_memo_evidence_pack(row: Any) -> Optional[ProposalMemoEvidencePackRecord]:
+    if row is None:
+        return None
+    return ProposalMemoEvidencePackRecord(
+        source_input_hash=row["source_input_hash"],
+        proposal_id=row["proposal_id"],
+        proposal_version_no=int(row["proposal_version_no"]),
+        proposal_version_id=row["proposal_version_id"],
+        artifact_hash=row["artifact_hash"],
+        simulation_hash=row["simulation_hash"],
+        evidence_bundle_hash=row["evidence_bundle_hash"],
+        memo_hash=row["memo_hash"],
+        builder_version=row["builder_version"],
+        pack_json=optional_load_json(row["pack_json"]) or {},
+        materialized_at=datetime.fromisoformat(row["materialized_at"]),
+    )
+
+
 def to_event(row: Any) -> ProposalWorkflowEventRecord:
     return ProposalWorkflowEventRecord(
         event_id=row["event_id"],
@@ -194,7 +260,10 @@ __all__ = [
     "to_event",
     "to_memo",
     "to_memo_event",
+    "to_memo_evidence_pack",
     "to_operation",
     "to_proposal",
     "to_version",
+    "to_version_header",
+    "to_version_sections",
 ]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Optional, cast
+
+from src.core.proposals.models import ProposalMemoEvidencePackRecord
+from src.infrastructure.proposals import postgres_memos as _memos
+
+ConnectionFactory = Callable[[], Any]
+
+
+class PostgresMemoEvidencePackMixin:
+    def save_memo_evidence_pack(self, record: ProposalMemoEvidencePackRecord) -> None:
+        _memos.save_memo_evidence_pack(connect=self._memo_evidence_pack_connect(), record=record)
+
+    def get_memo_evidence_pack(
+        self, *, proposal_id: str, proposal_version_no: int
+    ) -> Optional[ProposalMemoEvidencePackRecord]:
+        return _memos.get_memo_evidence_pack(
+            connect=self._memo_evidence_pack_connect(),
+            proposal_id=proposal_id,
+            proposal_version_no=proposal_version_no,
+        )
+
+    def _memo_evidence_pack_connect(self) -> ConnectionFactory:
+        return cast(ConnectionFactory, getattr(self, "_connect"))
+
+
+__all__ = ["PostgresMemoEvidencePackMixin"]
@@ -4,12 +4,18 @@ from collections.abc import Callable
 from contextlib import closing
 from typing import Any, Optional
 
-from src.core.proposals.models import ProposalMemoEventRecord, ProposalMemoRecord
+from src.core.proposals.models import (
+    ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
+    ProposalMemoRecord,
+)
+from src.infrastructure.postgres_event_partitions import lock_event_identities
 from src.infrastructure.proposals.postgres_mappers import (
     json_dump,
     json_dump_list,
     to_memo,
     to_memo_event,
+    to_memo_evidence_pack,
 )
 
 ConnectionFactory = Callable[[], Any]
@@ -130,32 +136,56 @@ def append_memo_event(*, connect: ConnectionFactory, event: ProposalMemoEventRec
         connection.commit()
 
 
+MEMO_EVENT_INSERT = """
+    INSERT INTO proposal_memo_events (
+        event_id,
+        memo_id,
+        proposal_id,
+        proposal_version_no,
+        event_type,
+        actor_id,
+        occurred_at,
+        reason_json
+    )
+    SELECT %s, %s, %s, %s, %s, %s, %s, %s
+    WHERE NOT EXISTS (SELECT 1 FROM proposal_memo_events WHERE event_id = %s)
+    ON CONFLICT DO NOTHING
+"""
+
+
 def insert_memo_event(*, connection: Any, event: ProposalMemoEventRecord) -> None:
-    query = """
-        INSERT INTO proposal_memo_events (
-            event_id,
-            memo_id,
-            proposal_id,
-            proposal_version_no,
-            event_type,
-            actor_id,
-            occurred_at,
-            reason_json
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (event_id) DO NOTHING
-    """
-    connection.execute(
-        query,
-        (
-            event.event_id,
-            event.memo_id,
-            event.proposal_id,
-            event.proposal_version_no,
-            event.event_type,
-            event.actor_id,
-            event.occurred_at.isoformat(),
-            json_dump(event.reason_json),
-        ),
+    lock_event_identities(
+        connection=connection, table="proposal_memo_events", event_ids=[event.event_id]
+    )
+    connection.execute(MEMO_EVENT_INSERT, _memo_event_params(event))
+
+
+def insert_memo_events(
+    *, connect: ConnectionFactory, events: list[ProposalMemoEventRecord]
+) -> None:
+    """Write a batch of memo events in one pipelined transaction."""
+    with closing(connect()) as connection:
+        lock_event_identities(
+            connection=connection,
+            table="proposal_memo_events",
+            event_ids=[event.event_id for event in events],
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(MEMO_EVENT_INSERT, [_memo_event_params(event) for event in events])
+        connection.commit()
+
+
+def _memo_event_params(event: ProposalMemoEventRecord) -> tuple[object, ...]:
+    return (
+        event.event_id,
+        event.memo_id,
+        event.proposal_id,
+        event.proposal_version_no,
+        event.event_type,
+        event.actor_id,
+        event.occurred_at.isoformat(),
+        json_dump(event.reason_json),
+        event.event_id,
     )
 
 
@@ -183,6 +213,67 @@ def list_memo_events(
     return [to_memo_event(row) for row in rows]
 
 
+MEMO_EVIDENCE_PACK_COLUMNS = """
+    source_input_hash,
+    proposal_id,
+    proposal_version_no,
+    proposal_version_id,
+    artifact_hash,
+    simulation_hash,
+    evidence_bundle_hash,
+    memo_hash,
+    builder_version,
+    pack_json,
+    materialized_at
+"""
+
+
+def save_memo_evidence_pack(
+    *, connect: ConnectionFactory, record: ProposalMemoEvidencePackRecord
+) -> None:
+    query = f"""
+        INSERT INTO proposal_memo_evidence_packs (
+            {MEMO_EVIDENCE_PACK_COLUMNS}
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT DO NOTHING
+    """
+    with closing(connect()) as connection:
+        connection.execute(
+            query,
+            (
+                record.source_input_hash,
+                record.proposal_id,
+                record.proposal_version_no,
+                record.proposal_version_id,
+                record.artifact_hash,
+                record.simulation_hash,
+                record.evidence_bundle_hash,
+                record.memo_hash,
+                record.builder_version,
+                json_dump(record.pack_json),
+                record.materialized_at.isoformat(),
+            ),
+        )
+        connection.commit()
+
+
+def get_memo_evidence_pack(
+    *,
+    connect: ConnectionFactory,
+    proposal_id: str,
+    proposal_version_no: int,
+) -> Optional[ProposalMemoEvidencePackRecord]:
+    query = f"""
+        SELECT
+            {MEMO_EVIDENCE_PACK_COLUMNS}
+        FROM proposal_memo_evidence_packs
+        WHERE proposal_id = %s AND proposal_version_no = %s
+    """
+    with closing(connect()) as connection:
+        row = connection.execute(query, (proposal_id, proposal_version_no)).fetchone()
+    return to_memo_evidence_pack(row)
+
+
 def _memo_params(memo: ProposalMemoRecord) -> tuple[object, ...]:
     return (
         memo.memo_id,
@@ -212,9 +303,12 @@ __all__ = [
     "create_memo",
     "get_memo",
     "get_memo_by_proposal_version",
+    "get_memo_evidence_pack",
     "insert_memo",
     "insert_memo_event",
+    "insert_memo_events",
     "list_memo_events",
     "list_memos",
     "list_memos_for_proposals",
+    "save_memo_evidence_pack",
 ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from typing import Any, Optional, cast
+
+from src.core.proposals.models import (
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
+    ProposalVersionRecord,
+)
+from src.infrastructure.proposals import postgres_versions as _versions
+
+ConnectionFactory = Callable[[], Any]
+
+
+class PostgresProposalVersionReadsMixin:
+    def get_version(self, *, proposal_id: str, version_no: int) -> Optional[ProposalVersionRecord]:
+        return _versions.get_version(
+            connect=self._version_connect(),
+            proposal_id=proposal_id,
+            version_no=version_no,
+        )
+
+    def list_versions(self, *, proposal_id: str) -> list[ProposalVersionRecord]:
+        return _versions.list_versions(connect=self._version_connect(), proposal_id=proposal_id)
+
+    def get_current_version(self, *, proposal_id: str) -> Optional[ProposalVersionRecord]:
+        return _versions.get_current_version(
+            connect=self._version_connect(),
+            proposal_id=proposal_id,
+        )
+
+    def list_version_headers(self, *, proposal_id: str) -> list[ProposalVersionHeaderRecord]:
+        return _versions.list_version_headers(
+            connect=self._version_connect(),
+            proposal_id=proposal_id,
+        )
+
+    def get_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        version_no: int,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]:
+        return _versions.get_version_sections(
+            connect=self._version_connect(),
+            proposal_id=proposal_id,
+            version_no=version_no,
+            sections=sections,
+        )
+
+    def get_current_version_sections(
+        self,
+        *,
+        proposal_id: str,
+        sections: Collection[ProposalVersionPayloadSection],
+    ) -> Optional[ProposalVersionRecord]:
+        return _versions.get_current_version_sections(
+            connect=self._version_connect(),
+            proposal_id=proposal_id,
+            sections=sections,
+        )
+
+    def _version_connect(self) -> ConnectionFactory:
+        return cast(ConnectionFactory, getattr(self, "_connect"))
+
+
+__all__ = ["PostgresProposalVersionReadsMixin"]
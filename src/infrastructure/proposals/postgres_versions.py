@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from contextlib import closing
 from typing import Any, Optional
 
-from src.core.proposals.models import ProposalVersionRecord
-from src.infrastructure.proposals.postgres_mappers import json_dump, optional_json, to_version
+from src.core.proposals.models import (
+    PROPOSAL_VERSION_PAYLOAD_SECTIONS,
+    ProposalVersionHeaderRecord,
+    ProposalVersionPayloadSection,
+    ProposalVersionRecord,
+)
+from src.infrastructure.proposals.postgres_mappers import (
+    json_dump,
+    optional_json,
+    to_version,
+    to_version_header,
+    to_version_sections,
+)
 
 ConnectionFactory = Callable[[], Any]
 
@@ -25,6 +36,17 @@ VERSION_COLUMNS = """
     gate_decision_json
 """
 
+VERSION_HEADER_COLUMNS = """
+    proposal_version_id,
+    proposal_id,
+    version_no,
+    created_at,
+    request_hash,
+    artifact_hash,
+    simulation_hash,
+    status_at_creation
+"""
+
 
 def create_version(*, connect: ConnectionFactory, version: ProposalVersionRecord) -> None:
     with closing(connect()) as connection:
@@ -116,6 +138,67 @@ def get_current_version(
     return to_version(row)
 
 
+def list_version_headers(
+    *,
+    connect: ConnectionFactory,
+    proposal_id: str,
+) -> list[ProposalVersionHeaderRecord]:
+    query = f"""
+        SELECT
+            {VERSION_HEADER_COLUMNS}
+        FROM proposal_versions
+        WHERE proposal_id = %s
+        ORDER BY version_no ASC
+    """
+    with closing(connect()) as connection:
+        rows = connection.execute(query, (proposal_id,)).fetchall()
+    return [header for row in rows if (header := to_version_header(row)) is not None]
+
+
+def get_version_sections(
+    *,
+    connect: ConnectionFactory,
+    proposal_id: str,
+    version_no: int,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> Optional[ProposalVersionRecord]:
+    query = f"""
+        SELECT
+            {_version_section_columns(sections)}
+        FROM proposal_versions
+        WHERE proposal_id = %s AND version_no = %s
+    """
+    with closing(connect()) as connection:
+        row = connection.execute(query, (proposal_id, version_no)).fetchone()
+    return to_version_sections(row, sections=sections)
+
+
+def get_current_version_sections(
+    *,
+    connect: ConnectionFactory,
+    proposal_id: str,
+    sections: Collection[ProposalVersionPayloadSection],
+) -> Optional[ProposalVersionRecord]:
+    query = f"""
+        SELECT
+            {_version_section_columns(sections)}
+        FROM proposal_versions
+        WHERE proposal_id = %s
+        ORDER BY version_no DESC
+        LIMIT 1
+    """
+    with closing(connect()) as connection:
+        row = connection.execute(query, (proposal_id,)).fetchone()
+    return to_version_sections(row, sections=sections)
+
+
+def _version_section_columns(sections: Collection[ProposalVersionPayloadSection]) -> str:
+    section_columns = [
+        f"{section}_json" for section in PROPOSAL_VERSION_PAYLOAD_SECTIONS if section in sections
+    ]
+    return ",\n    ".join([VERSION_HEADER_COLUMNS.strip(), *section_columns])
+
+
 def _version_params(version: ProposalVersionRecord) -> tuple[object, ...]:
     return (
         version.proposal_version_id,
@@ -136,7 +219,10 @@ def _version_params(version: ProposalVersionRecord) -> tuple[object, ...]:
 __all__ = [
     "create_version",
     "get_current_version",
+    "get_current_version_sections",
     "get_version",
+    "get_version_sections",
     "insert_version",
+    "list_version_headers",
     "list_versions",
 ]
@@ -5,6 +5,7 @@ from contextlib import closing
 from typing import Any
 
 from src.core.proposals.models import ProposalWorkflowEventRecord
+from src.infrastructure.postgres_event_partitions import lock_event_identities
 from src.infrastructure.proposals.postgres_mappers import json_dump, to_event
 
 ConnectionFactory = Callable[[], Any]
@@ -75,11 +76,21 @@ def list_events_for_proposals(
 
 
 def insert_event(*, connection: Any, event: ProposalWorkflowEventRecord) -> None:
+    # The partitioned primary key includes occurred_at, so event identity is checked by
+    # event_id under a transaction lock; the untargeted conflict clause works on either key shape.
+    lock_event_identities(
+        connection=connection, table="proposal_workflow_events", event_ids=[event.event_id]
+    )
+    existing = _get_event(connection=connection, event_id=event.event_id)
+    if existing is not None:
+        if existing != event:
+            raise ValueError("PROPOSAL_WORKFLOW_EVENT_IDENTITY_CONFLICT")
+        return
     query = f"""
         INSERT INTO proposal_workflow_events (
             {EVENT_COLUMNS}
         ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (event_id) DO NOTHING
+        ON CONFLICT DO NOTHING
     """
     connection.execute(
         query,
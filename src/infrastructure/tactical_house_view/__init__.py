@@ -0,0 +1,5 @@
+from src.infrastructure.tactical_house_view.postgres import (
+    PostgresTacticalHouseViewCohortRepository,
+)
+
+__all__ = ["PostgresTacticalHouseViewCohortRepository"]
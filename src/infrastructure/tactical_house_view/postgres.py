@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from contextlib import closing
+from importlib.util import find_spec
+from typing import Any
+
+from src.core.tactical_house_view_models import (
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewAffectedPortfolio,
+    TacticalHouseViewExcludedPortfolio,
+)
+from src.core.tactical_house_view_pagination import TacticalHouseViewCohortMembership
+from src.infrastructure.postgres_migrations import apply_postgres_migrations
+
+_PORTFOLIO_SEQUENCES = {"affected_portfolios", "excluded_portfolios"}
+
+
+class PostgresTacticalHouseViewCohortRepository:
+    """Cohort store with one row per cohort and one indexed row per cohort member.
+
+    Portfolio lookups use the ``(portfolio_id, membership, cohort_id)`` index and recency
+    ordering uses the ``(generated_at, cohort_id)`` index, so neither reads whole cohorts.
+    """
+
+    def __init__(
+        self,
+        *,
+        dsn: str = "",
+        connect: Callable[[], Any] | None = None,
+        apply_migrations: bool = True,
+    ) -> None:
+        self._dsn = dsn
+        self._connect_factory = connect or self._connect_from_dsn
+        if connect is None:
+            if not dsn:
+                raise RuntimeError("TACTICAL_HOUSE_VIEW_POSTGRES_DSN_REQUIRED")
+            if find_spec("psycopg") is None:
+                raise RuntimeError("TACTICAL_HOUSE_VIEW_POSTGRES_DRIVER_MISSING")
+        if apply_migrations:
+            self._init_db()
+
+    def save_cohort(self, cohort: TacticalHouseViewAffectedCohort) -> None:
+        # cohort_id covers every member, so an existing cohort only refreshes its envelope. The
+        # upsert reports whether it inserted the row; a concurrent save of the same cohort waits
+        # on that row and then sees an update, and the member insert ignores rows already there.
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                """
+                INSERT INTO tactical_house_view_cohorts (
+                    cohort_id, tactical_view_id, tactical_view_version, content_hash,
+                    generated_at, affected_count, excluded_count, summary_json
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (cohort_id) DO UPDATE SET
+                    content_hash = EXCLUDED.content_hash,
+                    generated_at = EXCLUDED.generated_at,
+                    summary_json = EXCLUDED.summary_json
+                RETURNING (xmax = 0) AS inserted
+                """,
+                _cohort_values(cohort),
+            ).fetchone()
+            if row["inserted"]:
+                with connection.cursor() as cursor:
+                    cursor.executemany(
+                        """
+                        INSERT INTO tactical_house_view_cohort_portfolios (
+                            cohort_id, membership, ordinal, portfolio_id, portfolio_json
+                        ) VALUES (%s, %s, %s, %s, %s)
+                        ON CONFLICT (cohort_id, membership, ordinal) DO NOTHING
+                        """,
+                        list(_portfolio_values(cohort)),
+                    )
+            connection.commit()
+
+    def get_cohort(self, *, cohort_id: str) -> TacticalHouseViewAffectedCohort | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT summary_json FROM tactical_house_view_cohorts WHERE cohort_id = %s",
+                (cohort_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            portfolio_rows = connection.execute(
+                """
+                SELECT membership, portfolio_json
+                FROM tactical_house_view_cohort_portfolios
+                WHERE cohort_id = %s
+                ORDER BY membership ASC, ordinal ASC
+                """,
+                (cohort_id,),
+            ).fetchall()
+        return _cohort_from_rows(
+            row["summary_json"],
+            affected=[
+                item["portfolio_json"]
+                for item in portfolio_rows
+                if item["membership"] == "affected"
+            ],
+            excluded=[
+                item["portfolio_json"]
+                for item in portfolio_rows
+                if item["membership"] == "excluded"
+            ],
+        )
+
+    def list_cohorts(
+        self,
+        *,
+        portfolio_id: str | None,
+        limit: int,
+    ) -> list[TacticalHouseViewAffectedCohort]:
+        with closing(self._connect()) as connection:
+            if portfolio_id is None:
+                cohort_rows = connection.execute(
+                    """
+                    SELECT cohort_id, summary_json
+                    FROM tactical_house_view_cohorts
+                    ORDER BY generated_at DESC, cohort_id DESC
+                    LIMIT %s
+                    """,
+                    (limit,),
+                ).fetchall()
+            else:
+                cohort_rows = connection.execute(
+                    """
+                    SELECT cohort.cohort_id, cohort.summary_json
+                    FROM tactical_house_view_cohorts AS cohort
+                    WHERE cohort.cohort_id IN (
+                        SELECT member.cohort_id
+                        FROM tactical_house_view_cohort_portfolios AS member
+                        WHERE member.portfolio_id = %s AND member.membership = 'affected'
+                    )
+                    ORDER BY cohort.generated_at DESC, cohort.cohort_id DESC
+                    LIMIT %s
+                    """,
+                    (portfolio_id, limit),
+                ).fetchall()
+            if not cohort_rows:
+                return []
+            cohort_ids = [row["cohort_id"] for row in cohort_rows]
+            if portfolio_id is None:
+                member_rows = connection.execute(
+                    """
+                    SELECT cohort_id, portfolio_json
+                    FROM tactical_house_view_cohort_portfolios
+                    WHERE cohort_id = ANY(%s) AND membership = 'affected'
+                    ORDER BY cohort_id ASC, ordinal ASC
+                    """,
+                    (cohort_ids,),
+                ).fetchall()
+            else:
+                member_rows = connection.execute(
+                    """
+                    SELECT cohort_id, portfolio_json
+                    FROM tactical_house_view_cohort_portfolios
+                    WHERE portfolio_id = %s AND membership = 'affected' AND cohort_id = ANY(%s)
+                    ORDER BY cohort_id ASC, ordinal ASC
+                    """,
+                    (portfolio_id, cohort_ids),
+                ).fetchall()
+        affected_by_cohort: dict[str, list[str]] = {cohort_id: [] for cohort_id in cohort_ids}
+        for member in member_rows:
+            affected_by_cohort[member["cohort_id"]].append(member["portfolio_json"])
+        return [
+            _cohort_from_rows(
+                row["summary_json"],
+                affected=affected_by_cohort[row["cohort_id"]],
+                excluded=[],
+            )
+            for row in cohort_rows
+        ]
+
+    def page_affected_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewAffectedPortfolio], int] | None:
+        page = self._page_portfolios(
+            cohort_id=cohort_id,
+            membership="affected",
+            offset=offset,
+            limit=limit,
+        )
+        if page is None:
+            return None
+        rows, total_count = page
+        return (
+            [TacticalHouseViewAffectedPortfolio.model_validate_json(row) for row in rows],
+            total_count,
+        )
+
+    def page_excluded_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[TacticalHouseViewExcludedPortfolio], int] | None:
+        page = self._page_portfolios(
+            cohort_id=cohort_id,
+            membership="excluded",
+            offset=offset,
+            limit=limit,
+        )
+        if page is None:
+            return None
+        rows, total_count = page
+        return (
+            [TacticalHouseViewExcludedPortfolio.model_validate_json(row) for row in rows],
+            total_count,
+        )
+
+    def _page_portfolios(
+        self,
+        *,
+        cohort_id: str,
+        membership: TacticalHouseViewCohortMembership,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[str], int] | None:
+        with closing(self._connect()) as connection:
+            counts = connection.execute(
+                """
+                SELECT affected_count, excluded_count
+                FROM tactical_house_view_cohorts
+                WHERE cohort_id = %s
+                """,
+                (cohort_id,),
+            ).fetchone()
+            if counts is None:
+                return None
+            # Ordinals are dense, so the page is a primary-key range scan rather than an OFFSET.
+            rows = connection.execute(
+                """
+                SELECT portfolio_json
+                FROM tactical_house_view_cohort_portfolios
+                WHERE cohort_id = %s AND membership = %s AND ordinal >= %s
+                ORDER BY ordinal ASC
+                LIMIT %s
+                """,
+                (cohort_id, membership, offset, limit),
+            ).fetchall()
+        return [row["portfolio_json"] for row in rows], int(counts[f"{membership}_count"])
+
+    def _connect(self) -> Any:
+        return self._connect_factory()
+
+    def _connect_from_dsn(self) -> Any:
+        import psycopg
+        from psycopg.rows import dict_row
+
+        return psycopg.connect(self._dsn, row_factory=dict_row)
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as connection:
+            apply_postgres_migrations(connection=connection, namespace="proposals")
+
+
+def _cohort_values(cohort: TacticalHouseViewAffectedCohort) -> tuple[Any, ...]:
+    return (
+        cohort.cohort_id,
+        cohort.tactical_view_id,
+        cohort.tactical_view_version,
+        cohort.content_hash,
+        cohort.generated_at,
+        len(cohort.affected_portfolios),
+        len(cohort.excluded_portfolios),
+        json.dumps(
+            cohort.model_dump(mode="json", exclude=_PORTFOLIO_SEQUENCES),
+            sort_keys=True,
+            separators=(",", ":"),
+        ),
+    )
+
+
+def _portfolio_values(cohort: TacticalHouseViewAffectedCohort) -> Any:
+    for ordinal, affected in enumerate(cohort.affected_portfolios):
+        yield (
+            cohort.cohort_id,
+            "affected",
+            ordinal,
+            affected.portfolio_id,
+            affected.model_dump_json(),
+        )
+    for ordinal, excluded in enumerate(cohort.excluded_portfolios):
+        yield (
+            cohort.cohort_id,
+            "excluded",
+            ordinal,
+            excluded.portfolio_id,
+            excluded.model_dump_json(),
+        )
+
+
+def _cohort_from_rows(
+    summary_json: str,
+    *,
+    affected: list[str],
+    excluded: list[str],
+) -> TacticalHouseViewAffectedCohort:
+    cohort: TacticalHouseViewAffectedCohort = TacticalHouseViewAffectedCohort.model_validate(
+        {
+            **json.loads(summary_json),
+            "affected_portfolios": [
+                TacticalHouseViewAffectedPortfolio.model_validate_json(item) for item in affected
+            ],
+            "excluded_portfolios": [
+                TacticalHouseViewExcludedPortfolio.model_validate_json(item) for item in excluded
+            ],
+        }
+    )
+    return cohort
+
+
+__all__ = ["PostgresTacticalHouseViewCohortRepository"]
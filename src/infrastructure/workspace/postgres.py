@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import closing
+from datetime import datetime, timezone
 from importlib.util import find_spec
 from typing import Any
 
 from src.core.workspace.errors import WorkspaceNotFoundError
 from src.core.workspace.session_models import WorkspaceSession
+from src.infrastructure.postgres_event_partitions import (
+    WORKSPACE_EVENT_PARTITION_TABLES,
+    ensure_event_partitions,
+)
 from src.infrastructure.postgres_migrations import apply_postgres_migrations
 from src.infrastructure.workspace.postgres_records import (
     workspace_saved_version_values,
@@ -139,6 +144,11 @@ class PostgresWorkspaceSessionRepository:
     def _init_db(self) -> None:
         with closing(self._connect()) as connection:
             apply_postgres_migrations(connection=connection, namespace="workspace")
+            ensure_event_partitions(
+                connection=connection,
+                tables=WORKSPACE_EVENT_PARTITION_TABLES,
+                as_of=datetime.now(timezone.utc).date(),
+            )
 
 
 def _validated_dsn(dsn: str) -> str:
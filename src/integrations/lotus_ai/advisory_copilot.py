@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Callable
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, cast
 
 import httpx
@@ -13,6 +14,7 @@ from src.core.advisory_copilot import (
     AdvisoryCopilotRuntimeBudgetExceeded,
     AdvisoryCopilotRuntimeUsage,
     CopilotAudience,
+    CopilotClaimGroundingAligner,
     CopilotEvidencePacket,
     CopilotGuardrailPolicyInput,
     CopilotGuardrailReasonCode,
@@ -22,13 +24,19 @@ from src.core.advisory_copilot import (
     advisory_copilot_payload_usage,
     advisory_copilot_runtime_budget_controls,
     advisory_copilot_runtime_budget_telemetry,
-    align_copilot_output_claims_to_evidence,
     evaluate_copilot_guardrail_policy,
     validate_advisory_copilot_input_budget,
     validate_advisory_copilot_output_budget,
     workflow_pack_id_for_action,
     workflow_pack_version_for_action,
 )
+from src.core.advisory_copilot.draft_cache import (
+    DRAFT_CACHE_KEY_LINEAGE_FIELD,
+    DRAFT_CACHE_LINEAGE_FIELD,
+    AdvisoryCopilotDraftCache,
+    advisory_copilot_draft_cache_hit_lineage,
+    build_advisory_copilot_draft_cache_key,
+)
 from src.core.advisory_copilot.evaluation_gate import (
     AdvisoryCopilotEvaluationResult,
     evaluate_advisory_copilot_model_risk,
@@ -42,6 +50,7 @@ from src.core.advisory_copilot.model_governance import (
     advisory_copilot_model_approval_for_request,
     validate_advisory_copilot_model_response,
 )
+from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
 from src.integrations.lotus_ai.advisory_copilot_request import (
     build_advisory_copilot_workflow_pack_request,
     workflow_surface,
@@ -87,6 +96,7 @@ MAX_COPILOT_REVIEW_GUIDANCE_LENGTH = DEFAULT_AI_REVIEW_GUIDANCE_LENGTH
 MAX_COPILOT_LINEAGE_REF_LENGTH = 160
 _CONCURRENCY_LOCK = threading.Lock()
 _CONCURRENCY_LIMITS: dict[int, threading.BoundedSemaphore] = {}
+CopilotSectionCallback = Callable[[dict[str, Any]], None]
 _RETRYABLE_TRANSPORT_ERRORS = (
     httpx.ConnectError,
     httpx.ConnectTimeout,
@@ -120,6 +130,8 @@ def generate_advisory_copilot_draft_with_lotus_ai(
     reason: dict[str, Any],
     requested_intents: tuple[str, ...] = (),
     user_instruction: str = "",
+    draft_cache: AdvisoryCopilotDraftCache | None = None,
+    on_section: CopilotSectionCallback | None = None,
 ) -> AdvisoryCopilotAiDraft:
     preflight_rejection = _preflight_guardrail_rejection(
         evidence_packet=evidence_packet,
@@ -148,6 +160,25 @@ def generate_advisory_copilot_draft_with_lotus_ai(
             model_environment=environment,
         )
 
+    draft_cache_key: str | None = None
+    if draft_cache is not None:
+        draft_cache_key = _draft_cache_key(
+            evidence_packet=evidence_packet,
+            audience=audience,
+            requested_outputs=requested_outputs,
+            model_approval=approval_decision.approval,
+        )
+        cached_run = draft_cache.lookup(draft_cache_key=draft_cache_key)
+        if cached_run is not None:
+            draft = _draft_from_cached_run(
+                source_run=cached_run,
+                model_approval=approval_decision.approval,
+                model_environment=environment,
+            )
+            for section in draft.sections:
+                _publish_section(on_section, section)
+            return draft
+
     try:
         execution = _execute_workflow_pack(
             evidence_packet=evidence_packet,
@@ -185,13 +216,79 @@ def generate_advisory_copilot_draft_with_lotus_ai(
             runtime_budget_telemetry=runtime_budget_telemetry,
         )
 
-    return _draft_from_workflow_response(
+    draft = _draft_from_workflow_response(
         evidence_packet=evidence_packet,
         response_status=execution.response_status,
         payload=execution.payload,
         model_approval=approval_decision.approval,
         model_environment=environment,
         runtime_budget_telemetry=execution.runtime_budget_telemetry,
+        on_section=on_section,
+    )
+    if draft_cache_key is None or not _is_cacheable_draft(draft):
+        return draft
+    return replace(draft, lineage={**draft.lineage, DRAFT_CACHE_KEY_LINEAGE_FIELD: draft_cache_key})
+
+
+def _publish_section(on_section: CopilotSectionCallback | None, section: dict[str, Any]) -> None:
+    if on_section is not None:
+        on_section(dict(section))
+
+
+def _draft_cache_key(
+    *,
+    evidence_packet: CopilotEvidencePacket,
+    audience: CopilotAudience,
+    requested_outputs: list[str],
+    model_approval: AdvisoryCopilotModelApproval,
+) -> str:
+    return build_advisory_copilot_draft_cache_key(
+        evidence_packet_hash=evidence_packet.evidence_packet_hash,
+        action_family=evidence_packet.action_family,
+        audience=audience,
+        requested_outputs=tuple(requested_outputs),
+        workflow_pack_id=workflow_pack_id_for_action(evidence_packet.action_family),
+        workflow_pack_version=workflow_pack_version_for_action(evidence_packet.action_family),
+        approved_instruction_set=APPROVED_INSTRUCTION_SET,
+        prompt_template_version=PROMPT_TEMPLATE_VERSION,
+        output_schema_version=OUTPUT_SCHEMA_VERSION,
+        evaluation_pack_ref=EVALUATION_PACK_REF,
+        model_provider_id=model_approval.provider_id,
+        model_version=model_approval.model_version,
+        model_approval_reference=model_approval.approval_reference,
+    )
+
+
+def _is_cacheable_draft(draft: AdvisoryCopilotAiDraft) -> bool:
+    grounding = draft.lineage.get("claim_grounding_summary")
+    return bool(
+        draft.status == "REVIEW_REQUIRED"
+        and draft.sections
+        and isinstance(grounding, dict)
+        and grounding.get("ready_for_review") is True
+    )
+
+
+def _draft_from_cached_run(
+    *,
+    source_run: AdvisoryCopilotRunRecord,
+    model_approval: AdvisoryCopilotModelApproval,
+    model_environment: str,
+) -> AdvisoryCopilotAiDraft:
+    # Replayed drafts always re-enter human review; approval of the source run never transfers.
+    lineage = {
+        key: value
+        for key, value in source_run.lineage_json.items()
+        if key != DRAFT_CACHE_KEY_LINEAGE_FIELD
+    }
+    lineage.update(model_approval.lineage(environment=model_environment))
+    lineage[DRAFT_CACHE_LINEAGE_FIELD] = advisory_copilot_draft_cache_hit_lineage(source_run)
+    return AdvisoryCopilotAiDraft(
+        status="REVIEW_REQUIRED",
+        sections=tuple(dict(section) for section in source_run.output_sections_json),
+        lineage=lineage,
+        review_guidance=tuple(str(item) for item in source_run.review_guidance_json),
+        guardrail_reasons=(),
     )
 
 
@@ -372,6 +469,7 @@ def _draft_from_workflow_response(
     model_approval: AdvisoryCopilotModelApproval,
     model_environment: str,
     runtime_budget_telemetry: dict[str, Any],
+    on_section: CopilotSectionCallback | None = None,
 ) -> AdvisoryCopilotAiDraft:
     if response_status != 200:
         return build_advisory_copilot_unavailable_draft(
@@ -469,6 +567,7 @@ def _draft_from_workflow_response(
         provider_id=provider_id,
         model_version=model_version,
         runtime_budget_telemetry=runtime_budget_telemetry,
+        on_section=on_section,
     )
 
 
@@ -485,6 +584,7 @@ def _draft_from_completed_workflow_output(
     provider_id: str | None,
     model_version: str | None,
     runtime_budget_telemetry: dict[str, Any],
+    on_section: CopilotSectionCallback | None = None,
 ) -> AdvisoryCopilotAiDraft:
     output_reasons = evaluate_copilot_guardrail_policy(
         CopilotGuardrailPolicyInput(
@@ -511,11 +611,19 @@ def _draft_from_completed_workflow_output(
             },
         )
 
-    grounded_sections, grounding_summary = align_copilot_output_claims_to_evidence(
+    # The output guardrail covers the joined section text, so sections are only published once
+    # the whole output has passed it; grounding then settles and publishes one section at a time.
+    aligner = CopilotClaimGroundingAligner(
         evidence_packet=evidence_packet,
         raw_sections=raw_sections,
-        output_sections=sections,
     )
+    grounded_section_list: list[dict[str, Any]] = []
+    for section in sections:
+        grounded_section = aligner.ground_section(section)
+        grounded_section_list.append(grounded_section)
+        _publish_section(on_section, grounded_section)
+    grounded_sections = tuple(grounded_section_list)
+    grounding_summary = aligner.summary()
     evaluation_result = evaluate_advisory_copilot_model_risk(
         action_family=evidence_packet.action_family,
         workflow_pack_id=workflow_pack_id_for_action(evidence_packet.action_family),
@@ -9,6 +9,7 @@ from src.core.advisory.source_effects import (
     map_core_payload_to_projected_transaction_effects,
 )
 from src.core.common.idempotency import normalize_optional_idempotency_key
+from src.core.common.serialization_memo import dump_model_json
 from src.core.proposal_request_models import ProposalSimulateRequest
 from src.core.proposal_result_models import ProposalResult
 from src.core.proposals.correlation import resolve_correlation_id
@@ -154,7 +155,7 @@ def _post_simulation_request(
         with httpx.Client(timeout=_resolve_timeout()) as client:
             response = client.post(
                 url,
-                json=request.model_dump(mode="json"),
+                json=dump_model_json(request),
                 headers=_simulation_headers(
                     request_hash=request_hash,
                     idempotency_key=idempotency_key,
@@ -1,4 +1,5 @@
 import importlib
+import os
 from typing import Callable, cast
 
 from src.core.advisory_copilot.repository import AdvisoryCopilotRepository
@@ -7,6 +8,8 @@ AdvisoryCopilotRepositoryFactory = Callable[..., AdvisoryCopilotRepository]
 
 PostgresAdvisoryCopilotRepository: AdvisoryCopilotRepositoryFactory | None = None
 
+DEFAULT_ADVISORY_COPILOT_DRAFT_CACHE_TTL_SECONDS = 86400
+
 
 def _postgres_repository_factory() -> AdvisoryCopilotRepositoryFactory:
     if PostgresAdvisoryCopilotRepository is not None:
@@ -20,3 +23,17 @@ def _postgres_repository_factory() -> AdvisoryCopilotRepositoryFactory:
 
 def build_advisory_copilot_repository(*, dsn: str) -> AdvisoryCopilotRepository:
     return _postgres_repository_factory()(dsn=dsn)
+
+
+def advisory_copilot_draft_cache_ttl_seconds() -> int:
+    """Return the draft cache reuse window; zero disables content-addressed draft reuse."""
+    raw = os.getenv("ADVISORY_COPILOT_DRAFT_CACHE_TTL_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_ADVISORY_COPILOT_DRAFT_CACHE_TTL_SECONDS
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError("ADVISORY_COPILOT_DRAFT_CACHE_TTL_SECONDS_INVALID") from exc
+    if value < 0:
+        raise RuntimeError("ADVISORY_COPILOT_DRAFT_CACHE_TTL_SECONDS_INVALID")
+    return value
@@ -0,0 +1,103 @@
+import importlib
+import os
+from typing import Any
+
+from src.runtime.policy_repositories import policy_postgres_dsn
+from src.runtime.proposal_repositories import proposal_postgres_dsn, proposal_store_backend_name
+from src.runtime.workspace_repositories import workspace_postgres_dsn, workspace_store_backend_name
+
+DEFAULT_EVENT_PARTITION_MAINTENANCE_INTERVAL_SECONDS = 86400
+DEFAULT_EVENT_PARTITION_MONTHS_AHEAD = 3
+EVENT_PARTITION_TABLES: tuple[str, ...] = (
+    "proposal_workflow_events",
+    "proposal_memo_events",
+    "policy_evaluation_audit_events",
+    "advisory_workspace_events",
+)
+
+
+def event_partition_maintenance_enabled() -> bool:
+    value = os.getenv("EVENT_PARTITION_MAINTENANCE_ENABLED", "false")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def event_partition_maintenance_interval_seconds() -> int:
+    return _positive_int_env(
+        "EVENT_PARTITION_MAINTENANCE_INTERVAL_SECONDS",
+        DEFAULT_EVENT_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+    )
+
+
+def event_partition_months_ahead() -> int:
+    return _positive_int_env("EVENT_PARTITION_MONTHS_AHEAD", DEFAULT_EVENT_PARTITION_MONTHS_AHEAD)
+
+
+def event_partition_retention_months() -> dict[str, int]:
+    retention: dict[str, int] = {}
+    for table in EVENT_PARTITION_TABLES:
+        name = f"EVENT_PARTITION_RETENTION_MONTHS_{table.upper()}"
+        if os.getenv(name, "").strip():
+            retention[table] = _positive_int_env(name, 0)
+    return retention
+
+
+def build_event_partition_maintainers() -> list[Any]:
+    module = importlib.import_module("src.infrastructure.postgres_event_partitions")
+    maintainers: list[Any] = []
+    if proposal_store_backend_name() == "POSTGRES":
+        _append_maintainer(
+            maintainers,
+            module=module,
+            dsn=proposal_postgres_dsn(),
+            tables=module.PROPOSAL_EVENT_PARTITION_TABLES,
+        )
+    if workspace_store_backend_name() == "POSTGRES":
+        _append_maintainer(
+            maintainers,
+            module=module,
+            dsn=workspace_postgres_dsn(),
+            tables=module.WORKSPACE_EVENT_PARTITION_TABLES,
+        )
+    _append_maintainer(
+        maintainers,
+        module=module,
+        dsn=policy_postgres_dsn(),
+        tables=module.POLICY_EVENT_PARTITION_TABLES,
+    )
+    return maintainers
+
+
+def _append_maintainer(
+    maintainers: list[Any],
+    *,
+    module: Any,
+    dsn: str,
+    tables: tuple[str, ...],
+) -> None:
+    if dsn:
+        maintainers.append(module.PostgresEventPartitionMaintenance(dsn=dsn, tables=tables))
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"{name}_INVALID") from exc
+    if value < 1:
+        raise RuntimeError(f"{name}_INVALID")
+    return value
+
+
+__all__ = [
+    "DEFAULT_EVENT_PARTITION_MAINTENANCE_INTERVAL_SECONDS",
+    "DEFAULT_EVENT_PARTITION_MONTHS_AHEAD",
+    "EVENT_PARTITION_TABLES",
+    "build_event_partition_maintainers",
+    "event_partition_maintenance_enabled",
+    "event_partition_maintenance_interval_seconds",
+    "event_partition_months_ahead",
+    "event_partition_retention_months",
+]
@@ -0,0 +1,124 @@
+import importlib
+import os
+from datetime import timedelta
+from typing import Any, Sequence
+
+from src.core.record_lifecycle.idempotency_retention import (
+    DEFAULT_IDEMPOTENCY_RETENTION_BATCH_SIZE,
+    DEFAULT_IDEMPOTENCY_RETENTION_MAX_BATCHES,
+    DEFAULT_IDEMPOTENCY_RETENTION_TTLS,
+    IDEMPOTENCY_RETENTION_TABLES,
+    IdempotencyRetentionSettings,
+    IdempotencyRetentionStore,
+    IdempotencyRetentionTable,
+)
+from src.runtime.policy_repositories import policy_postgres_dsn
+from src.runtime.proposal_repositories import proposal_postgres_dsn, proposal_store_backend_name
+from src.runtime.workspace_repositories import workspace_postgres_dsn, workspace_store_backend_name
+
+DEFAULT_IDEMPOTENCY_RETENTION_INTERVAL_SECONDS = 3600
+
+
+def idempotency_retention_sweeper_enabled() -> bool:
+    value = os.getenv("IDEMPOTENCY_RETENTION_SWEEPER_ENABLED", "false")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def idempotency_retention_interval_seconds() -> int:
+    return _positive_int_env(
+        "IDEMPOTENCY_RETENTION_INTERVAL_SECONDS",
+        DEFAULT_IDEMPOTENCY_RETENTION_INTERVAL_SECONDS,
+    )
+
+
+def idempotency_retention_settings() -> IdempotencyRetentionSettings:
+    return IdempotencyRetentionSettings(
+        ttl_by_table={table: _table_ttl(table) for table in IDEMPOTENCY_RETENTION_TABLES},
+        batch_size=_positive_int_env(
+            "IDEMPOTENCY_RETENTION_BATCH_SIZE",
+            DEFAULT_IDEMPOTENCY_RETENTION_BATCH_SIZE,
+        ),
+        max_batches_per_table=_positive_int_env(
+            "IDEMPOTENCY_RETENTION_MAX_BATCHES",
+            DEFAULT_IDEMPOTENCY_RETENTION_MAX_BATCHES,
+        ),
+    )
+
+
+def build_idempotency_retention_stores() -> list[IdempotencyRetentionStore]:
+    module = importlib.import_module("src.infrastructure.postgres_idempotency_retention")
+    stores: list[IdempotencyRetentionStore] = []
+    if proposal_store_backend_name() == "POSTGRES":
+        _append_store(
+            stores,
+            module=module,
+            dsn=proposal_postgres_dsn(),
+            tables=module.PROPOSAL_IDEMPOTENCY_RETENTION_TABLES,
+        )
+    if workspace_store_backend_name() == "POSTGRES":
+        _append_store(
+            stores,
+            module=module,
+            dsn=workspace_postgres_dsn(),
+            tables=module.WORKSPACE_IDEMPOTENCY_RETENTION_TABLES,
+        )
+    _append_store(
+        stores,
+        module=module,
+        dsn=policy_postgres_dsn(),
+        tables=module.POLICY_IDEMPOTENCY_RETENTION_TABLES,
+    )
+    _append_store(
+        stores,
+        module=module,
+        dsn=os.getenv("ADVISORY_COPILOT_POSTGRES_DSN", "").strip() or proposal_postgres_dsn(),
+        tables=module.ADVISORY_COPILOT_IDEMPOTENCY_RETENTION_TABLES,
+    )
+    return stores
+
+
+def _append_store(
+    stores: list[IdempotencyRetentionStore],
+    *,
+    module: Any,
+    dsn: str,
+    tables: Sequence[IdempotencyRetentionTable],
+) -> None:
+    if dsn:
+        stores.append(module.PostgresIdempotencyRetentionStore(dsn=dsn, tables=tables))
+
+
+def _table_ttl(table: IdempotencyRetentionTable) -> timedelta:
+    name = f"IDEMPOTENCY_RETENTION_TTL_HOURS_{table.upper()}"
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return DEFAULT_IDEMPOTENCY_RETENTION_TTLS[table]
+    try:
+        hours = int(raw)
+    except ValueError as exc:
+        raise RuntimeError("IDEMPOTENCY_RETENTION_TTL_INVALID") from exc
+    if hours < 1:
+        raise RuntimeError("IDEMPOTENCY_RETENTION_TTL_INVALID")
+    return timedelta(hours=hours)
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"{name}_INVALID") from exc
+    if value < 1:
+        raise RuntimeError(f"{name}_INVALID")
+    return value
+
+
+__all__ = [
+    "DEFAULT_IDEMPOTENCY_RETENTION_INTERVAL_SECONDS",
+    "build_idempotency_retention_stores",
+    "idempotency_retention_interval_seconds",
+    "idempotency_retention_settings",
+    "idempotency_retention_sweeper_enabled",
+]
@@ -0,0 +1,49 @@
+import os
+
+from src.core.policy_packs.re_evaluation import (
+    DEFAULT_POLICY_RE_EVALUATION_CHUNK_SIZE,
+    DEFAULT_POLICY_RE_EVALUATION_MAX_WORKERS,
+    PolicyReEvaluationSettings,
+)
+
+
+def policy_re_evaluation_settings(
+    *,
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+    max_chunks: int | None = None,
+) -> PolicyReEvaluationSettings:
+    try:
+        return PolicyReEvaluationSettings(
+            chunk_size=(
+                chunk_size
+                if chunk_size is not None
+                else _int_env(
+                    "POLICY_RE_EVALUATION_CHUNK_SIZE", DEFAULT_POLICY_RE_EVALUATION_CHUNK_SIZE
+                )
+            ),
+            max_workers=(
+                max_workers
+                if max_workers is not None
+                else _int_env(
+                    "POLICY_RE_EVALUATION_MAX_WORKERS",
+                    min(DEFAULT_POLICY_RE_EVALUATION_MAX_WORKERS, os.cpu_count() or 1),
+                )
+            ),
+            max_chunks=max_chunks,
+        )
+    except ValueError as exc:
+        raise RuntimeError(str(exc)) from exc
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"{name}_INVALID") from exc
+
+
+__all__ = ["policy_re_evaluation_settings"]
@@ -2,10 +2,16 @@ import importlib
 import os
 from typing import Callable, cast
 
+from src.core.proposals.event_journal import EventJournalSettings
+from src.core.proposals.history_import import ProposalHistoryImportRepository
 from src.core.proposals.repository import ProposalRepository
 
 ProposalRepositoryFactory = Callable[..., ProposalRepository]
 
+DEFAULT_PROPOSAL_EVENT_JOURNAL_MAX_PENDING = 1000
+DEFAULT_PROPOSAL_EVENT_JOURNAL_BATCH_SIZE = 100
+DEFAULT_PROPOSAL_EVENT_JOURNAL_FLUSH_INTERVAL_MS = 200
+
 PostgresProposalRepository: ProposalRepositoryFactory | None = None
 
 
@@ -20,6 +26,38 @@ def proposal_postgres_dsn() -> str:
     return os.getenv("PROPOSAL_POSTGRES_DSN", "").strip()
 
 
+def proposal_event_journal_settings() -> EventJournalSettings | None:
+    enabled = os.getenv("PROPOSAL_EVENT_JOURNAL_ENABLED", "false").strip().lower()
+    if enabled not in {"1", "true", "yes", "on"}:
+        return None
+    return EventJournalSettings(
+        max_pending=_positive_int_env(
+            "PROPOSAL_EVENT_JOURNAL_MAX_PENDING", DEFAULT_PROPOSAL_EVENT_JOURNAL_MAX_PENDING
+        ),
+        batch_size=_positive_int_env(
+            "PROPOSAL_EVENT_JOURNAL_BATCH_SIZE", DEFAULT_PROPOSAL_EVENT_JOURNAL_BATCH_SIZE
+        ),
+        flush_interval_seconds=_positive_int_env(
+            "PROPOSAL_EVENT_JOURNAL_FLUSH_INTERVAL_MS",
+            DEFAULT_PROPOSAL_EVENT_JOURNAL_FLUSH_INTERVAL_MS,
+        )
+        / 1000,
+    )
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"{name}_INVALID") from exc
+    if value < 1:
+        raise RuntimeError(f"{name}_INVALID")
+    return value
+
+
 def _postgres_connection_exception_types() -> tuple[type[BaseException], ...]:
     types: list[type[BaseException]] = [
         ConnectionError,
@@ -49,9 +87,22 @@ def build_repository() -> ProposalRepository:
     dsn = proposal_postgres_dsn()
     if not dsn:
         raise RuntimeError("PROPOSAL_POSTGRES_DSN_REQUIRED")
+    event_journal = proposal_event_journal_settings()
     try:
-        return cast(ProposalRepository, _postgres_repository_factory()(dsn=dsn))
+        factory = _postgres_repository_factory()
+        if event_journal is None:
+            return cast(ProposalRepository, factory(dsn=dsn))
+        return cast(ProposalRepository, factory(dsn=dsn, event_journal=event_journal))
     except RuntimeError:
         raise
     except _postgres_connection_exception_types() as exc:
         raise RuntimeError("PROPOSAL_POSTGRES_CONNECTION_FAILED") from exc
+
+
+def build_proposal_history_importer() -> ProposalHistoryImportRepository:
+    _ = proposal_store_backend_name()
+    dsn = proposal_postgres_dsn()
+    if not dsn:
+        raise RuntimeError("PROPOSAL_POSTGRES_DSN_REQUIRED")
+    module = importlib.import_module("src.infrastructure.proposals.postgres_history_import")
+    return cast(ProposalHistoryImportRepository, module.PostgresProposalHistoryImporter(dsn=dsn))
@@ -0,0 +1,40 @@
+import importlib
+from typing import Callable, cast
+
+from src.core.tactical_house_view_repository import TacticalHouseViewCohortRepository
+from src.runtime.proposal_repositories import (
+    _postgres_connection_exception_types,
+    proposal_postgres_dsn,
+)
+
+TacticalHouseViewCohortRepositoryFactory = Callable[..., TacticalHouseViewCohortRepository]
+
+PostgresTacticalHouseViewCohortRepository: TacticalHouseViewCohortRepositoryFactory | None = None
+
+
+def _postgres_tactical_house_view_cohort_repository_factory() -> (
+    TacticalHouseViewCohortRepositoryFactory
+):
+    if PostgresTacticalHouseViewCohortRepository is not None:
+        return PostgresTacticalHouseViewCohortRepository
+    module = importlib.import_module("src.infrastructure.tactical_house_view")
+    return cast(
+        TacticalHouseViewCohortRepositoryFactory,
+        module.PostgresTacticalHouseViewCohortRepository,
+    )
+
+
+def build_tactical_house_view_cohort_repository() -> TacticalHouseViewCohortRepository:
+    """Build the cohort store in the proposals database; cohort tables share its namespace."""
+    dsn = proposal_postgres_dsn()
+    if not dsn:
+        raise RuntimeError("TACTICAL_HOUSE_VIEW_POSTGRES_DSN_REQUIRED")
+    try:
+        return cast(
+            TacticalHouseViewCohortRepository,
+            _postgres_tactical_house_view_cohort_repository_factory()(dsn=dsn),
+        )
+    except RuntimeError:
+        raise
+    except _postgres_connection_exception_types() as exc:
+        raise RuntimeError("TACTICAL_HOUSE_VIEW_POSTGRES_CONNECTION_FAILED") from exc
@@ -10,7 +10,9 @@ import pytest
 
 from src.api.proposals.router import reset_proposal_workflow_service_for_tests
 from src.core.advisory.provider_ports import configure_advisory_simulation_provider
+from src.core.advisory.simulation_baseline import reset_simulation_baseline_cache_for_tests
 from src.core.advisory_engine import run_proposal_simulation
+from src.core.common.cpu_offload import reset_cpu_offload_for_tests
 from src.core.models import CashBalance, EngineOptions, PortfolioSnapshot
 from src.core.policy_packs import (
     DurablePolicyEvaluationRepository,
@@ -18,6 +20,9 @@ from src.core.policy_packs import (
     InMemoryPolicyEvaluationStateStore,
     InMemoryPolicyPackCatalogStateStore,
 )
+from src.core.tactical_house_view_repository import InMemoryTacticalHouseViewCohortRepository
+from src.core.target_batch import reset_target_batch_pool_for_tests
+from src.core.target_solver_cache import reset_target_solver_problem_cache_for_tests
 from src.infrastructure.proposals.in_memory import InMemoryProposalRepository
 from src.infrastructure.workspace.in_memory import InMemoryWorkspaceSessionRepository
 from src.runtime.advisory_provider_ports import configure_advisory_stateful_context_provider_port
@@ -87,6 +92,10 @@ def postgres_runtime_test_harness(monkeypatch: pytest.MonkeyPatch):
         "src.runtime.policy_repositories.PostgresPolicyPackCatalogRepository",
         lambda **_kwargs: DurablePolicyPackCatalogRepository(state_store=policy_catalog_state),
     )
+    monkeypatch.setattr(
+        "src.runtime.tactical_house_view_repositories.PostgresTacticalHouseViewCohortRepository",
+        lambda **_kwargs: InMemoryTacticalHouseViewCohortRepository(),
+    )
     workspace_repository = InMemoryWorkspaceSessionRepository()
     monkeypatch.setattr(
         "src.runtime.workspace_repositories.PostgresWorkspaceSessionRepository",
@@ -125,7 +134,15 @@ def advisory_runtime_test_harness(monkeypatch: pytest.MonkeyPatch):
     configure_advisory_simulation_provider(_simulate_with_lotus_core)
     configure_advisory_stateful_context_provider_port()
     reset_proposal_workflow_service_for_tests()
+    reset_simulation_baseline_cache_for_tests()
+    reset_target_solver_problem_cache_for_tests()
+    reset_cpu_offload_for_tests()
+    reset_target_batch_pool_for_tests()
     yield
     configure_advisory_simulation_provider(None)
     configure_advisory_stateful_context_provider_port()
     reset_proposal_workflow_service_for_tests()
+    reset_simulation_baseline_cache_for_tests()
+    reset_target_solver_problem_cache_for_tests()
+    reset_cpu_offload_for_tests()
+    reset_target_batch_pool_for_tests()
@@ -1,4 +1,5 @@
 import os
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
@@ -7,7 +8,17 @@ from threading import Barrier
 
 import pytest
 
+from src.core.policy_packs import (
+    PolicyEvaluationFinalizeItem,
+    PolicyPackCatalogStore,
+    configure_policy_pack_catalog_repository,
+    reset_policy_pack_catalog_for_tests,
+)
 from src.core.proposals.exceptions import ProposalStateConflictError
+from src.core.proposals.history_import import (
+    ProposalHistoryImportBatchResult,
+    ProposalHistoryImportConflict,
+)
 from src.core.proposals.models import (
     ProposalApprovalRecordData,
     ProposalAsyncOperationRecord,
@@ -20,6 +31,7 @@ from src.core.proposals.models import (
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
+from src.infrastructure.policy_packs.postgres import PostgresPolicyEvaluationRepository
 from src.infrastructure.proposals import (
     postgres_idempotency,
     postgres_memos,
@@ -28,9 +40,29 @@ from src.infrastructure.proposals import (
     postgres_workflow_events,
 )
 from src.infrastructure.proposals.postgres import PostgresProposalRepository
+from src.infrastructure.proposals.postgres_history_import import (
+    PostgresProposalHistoryImporter,
+)
+from src.infrastructure.tactical_house_view.postgres import (
+    PostgresTacticalHouseViewCohortRepository,
+)
+from tests.unit.advisory.contracts.test_policy_pack_postgres_repository_boundary import (
+    _policy_evaluation_snapshot,
+)
+from tests.unit.advisory.engine.test_engine_policy_pack_persistence import (
+    _base_evidence_bundle,
+    _trusted_reason,
+    _two_version_global_policy_pack_definitions,
+)
+from tests.unit.advisory.engine.test_engine_proposal_history_import import (
+    _record as _history_record,
+)
 from tests.unit.advisory.engine.test_engine_proposal_repository_postgres import (
     _build_repository as _build_fake_repository,
 )
+from tests.unit.advisory.engine.test_tactical_house_view_postgres_repository import (
+    _cohort as _tactical_cohort,
+)
 
 _DSN = os.getenv("PROPOSAL_POSTGRES_INTEGRATION_DSN", "").strip()
 
@@ -962,6 +994,435 @@ def test_live_postgres_transition_compare_and_set_allows_one_approval_winner(
     assert stored_approvals[0].actor_id == stored_events[0].actor_id
 
 
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for event partition migration checks.",
+)
+def test_live_postgres_event_tables_are_partitioned_by_occurred_at_month(
+    repository: PostgresProposalRepository,
+) -> None:
+    now = datetime.now(timezone.utc)
+    suffix = uuid.uuid4().hex
+    proposal, version, event, idempotency = _proposal_create_records(now=now, suffix=suffix)
+    repository.create_proposal_with_version_event_idempotency(
+        proposal=proposal,
+        version=version,
+        event=event,
+        idempotency=idempotency,
+    )
+    memo_version = _create_proposal_version_for_memo(repository=repository, now=now, suffix=suffix)
+    memo, memo_idempotency, memo_event = _memo_create_records(
+        now=now, suffix=suffix, version=memo_version
+    )
+    repository.create_memo_with_idempotency_event(
+        memo=memo, idempotency=memo_idempotency, event=memo_event
+    )
+
+    with closing(repository._connect()) as connection:  # noqa: SLF001
+        partitioned = connection.execute(
+            """
+            SELECT c.relname
+            FROM pg_partitioned_table p
+            JOIN pg_class c ON c.oid = p.partrelid
+            WHERE c.relname IN ('proposal_workflow_events', 'proposal_memo_events')
+            ORDER BY c.relname
+            """
+        ).fetchall()
+        workflow_partition = connection.execute(
+            "SELECT tableoid::regclass::text AS partition FROM proposal_workflow_events "
+            "WHERE event_id = %s",
+            (event.event_id,),
+        ).fetchone()
+        memo_partition = connection.execute(
+            "SELECT tableoid::regclass::text AS partition FROM proposal_memo_events "
+            "WHERE event_id = %s",
+            (memo_event.event_id,),
+        ).fetchone()
+
+    assert [row["relname"] for row in partitioned] == [
+        "proposal_memo_events",
+        "proposal_workflow_events",
+    ]
+    assert workflow_partition["partition"] == f"proposal_workflow_events_p{now:%Y%m}"
+    assert memo_partition["partition"] == f"proposal_memo_events_p{now:%Y%m}"
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for event partition migration checks.",
+)
+def test_live_postgres_event_reads_include_events_before_parent_creation_month(
+    repository: PostgresProposalRepository,
+) -> None:
+    now = datetime.now(timezone.utc)
+    suffix = uuid.uuid4().hex
+    proposal, version, event, idempotency = _proposal_create_records(now=now, suffix=suffix)
+    repository.create_proposal_with_version_event_idempotency(
+        proposal=proposal,
+        version=version,
+        event=event,
+        idempotency=idempotency,
+    )
+    back_dated = event.model_copy(
+        update={
+            "event_id": f"pwe-imported-{suffix}",
+            "occurred_at": now - timedelta(days=400),
+        }
+    )
+    repository.append_event(back_dated)
+    memo_version = _create_proposal_version_for_memo(repository=repository, now=now, suffix=suffix)
+    memo, memo_idempotency, memo_event = _memo_create_records(
+        now=now, suffix=suffix, version=memo_version
+    )
+    repository.create_memo_with_idempotency_event(
+        memo=memo, idempotency=memo_idempotency, event=memo_event
+    )
+    back_dated_memo_event = memo_event.model_copy(
+        update={"event_id": f"pme-imported-{suffix}", "occurred_at": now - timedelta(days=400)}
+    )
+    repository.append_memo_event(back_dated_memo_event)
+
+    assert repository.list_events(proposal_id=proposal.proposal_id) == [back_dated, event]
+    assert repository.list_events_for_proposals(proposal_ids=[proposal.proposal_id]) == [
+        back_dated,
+        event,
+    ]
+    assert repository.list_memo_events(memo_id=memo.memo_id) == [
+        back_dated_memo_event,
+        memo_event,
+    ]
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for concurrent event identity checks.",
+)
+def test_live_postgres_concurrent_event_id_writes_keep_one_row_across_partitions(
+    repository: PostgresProposalRepository,
+) -> None:
+    now = datetime.now(timezone.utc)
+    suffix = uuid.uuid4().hex
+    proposal, version, event, idempotency = _proposal_create_records(now=now, suffix=suffix)
+    repository.create_proposal_with_version_event_idempotency(
+        proposal=proposal,
+        version=version,
+        event=event,
+        idempotency=idempotency,
+    )
+    duplicate_id = f"pwe-race-{suffix}"
+    first = event.model_copy(update={"event_id": duplicate_id})
+    # A different occurred_at month puts the second write in another partition, where the
+    # (event_id, occurred_at) primary key cannot see the first row.
+    second = first.model_copy(update={"occurred_at": now - timedelta(days=62)})
+    memo_version = _create_proposal_version_for_memo(repository=repository, now=now, suffix=suffix)
+    memo, memo_idempotency, memo_event = _memo_create_records(
+        now=now, suffix=suffix, version=memo_version
+    )
+    repository.create_memo_with_idempotency_event(
+        memo=memo, idempotency=memo_idempotency, event=memo_event
+    )
+    first_memo_event = memo_event.model_copy(update={"event_id": f"pme-race-{suffix}"})
+    second_memo_event = first_memo_event.model_copy(
+        update={"occurred_at": now - timedelta(days=62)}
+    )
+
+    def _append_second() -> str:
+        try:
+            repository.append_event(second)
+        except ValueError as exc:
+            return str(exc)
+        return "inserted"
+
+    with closing(repository._connect()) as holder:  # noqa: SLF001
+        postgres_workflow_events.insert_event(connection=holder, event=first)
+        postgres_memos.insert_memo_event(connection=holder, event=first_memo_event)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            workflow_outcome = executor.submit(_append_second)
+            memo_outcome = executor.submit(repository.append_memo_event, second_memo_event)
+            # Both writers must block on the event identity lock until the holder commits.
+            _wait_for_advisory_lock_waiters(repository=repository, count=2)
+            holder.commit()
+            assert workflow_outcome.result(timeout=10) == (
+                "PROPOSAL_WORKFLOW_EVENT_IDENTITY_CONFLICT"
+            )
+            memo_outcome.result(timeout=10)
+
+    with closing(repository._connect()) as connection:  # noqa: SLF001
+        workflow_rows = connection.execute(
+            "SELECT occurred_at FROM proposal_workflow_events WHERE event_id = %s",
+            (duplicate_id,),
+        ).fetchall()
+        memo_rows = connection.execute(
+            "SELECT occurred_at FROM proposal_memo_events WHERE event_id = %s",
+            (first_memo_event.event_id,),
+        ).fetchall()
+    assert [row["occurred_at"] for row in workflow_rows] == [first.occurred_at.isoformat()]
+    assert [row["occurred_at"] for row in memo_rows] == [first_memo_event.occurred_at.isoformat()]
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for concurrent cohort save checks.",
+)
+def test_live_postgres_concurrent_cohort_saves_write_members_once() -> None:
+    cohort_repository = PostgresTacticalHouseViewCohortRepository(dsn=_DSN)
+    suffix = uuid.uuid4().hex
+    cohort = _tactical_cohort(
+        [f"PB_RACE_{suffix}_{index}" for index in range(20)],
+        generated_at="2026-05-14T08:00:00+00:00",
+    )
+    writers = 4
+    barrier = Barrier(writers)
+
+    def _save() -> None:
+        barrier.wait(timeout=10)
+        cohort_repository.save_cohort(cohort)
+
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        for outcome in [executor.submit(_save) for _ in range(writers)]:
+            outcome.result(timeout=10)
+
+    with closing(cohort_repository._connect()) as connection:  # noqa: SLF001
+        member_count = connection.execute(
+            "SELECT COUNT(*) AS member_count FROM tactical_house_view_cohort_portfolios "
+            "WHERE cohort_id = %s",
+            (cohort.cohort_id,),
+        ).fetchone()["member_count"]
+    assert member_count == len(cohort.affected_portfolios) + len(cohort.excluded_portfolios)
+    assert cohort_repository.get_cohort(cohort_id=cohort.cohort_id) == cohort
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for policy evaluation event batch checks.",
+)
+def test_live_postgres_policy_evaluation_events_load_in_one_batch() -> None:
+    policy_repository = PostgresPolicyEvaluationRepository(dsn=_DSN)
+    suffix = uuid.uuid4().hex
+    template = _policy_evaluation_snapshot()
+    record = template["records"]["pev_txn_001"]
+    event = template["events"]["pev_txn_001"][0]
+    with_events = f"pev_{suffix}_a"
+    without_events = f"pev_{suffix}_b"
+    snapshot = {
+        "records": {
+            evaluation_id: {
+                **record,
+                "evaluation_id": evaluation_id,
+                "source_evidence_hash": f"sha256:{evaluation_id}",
+            }
+            for evaluation_id in (with_events, without_events)
+        },
+        "events": {
+            with_events: [
+                {
+                    **event,
+                    "evaluation_id": with_events,
+                    "event_id": f"peev_{index:06d}",
+                    "occurred_at": f"2026-05-26T00:00:0{index}+00:00",
+                    "idempotency_key": None,
+                    "reason_json": {},
+                }
+                for index in (1, 2)
+            ],
+        },
+        "idempotency": [],
+    }
+    policy_repository._evaluation_state.save_snapshot(snapshot)  # noqa: SLF001
+
+    events = policy_repository.list_policy_evaluation_events_by_evaluation(
+        evaluation_ids=[with_events, without_events]
+    )
+
+    assert [item.event_id for item in events[with_events]] == ["peev_000001", "peev_000002"]
+    assert events[without_events] == []
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for policy evaluation batch finalize checks.",
+)
+def test_live_postgres_policy_evaluation_batch_finalize_writes_only_the_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    configure_policy_pack_catalog_repository(
+        PolicyPackCatalogStore(_two_version_global_policy_pack_definitions())
+    )
+    policy_repository = PostgresPolicyEvaluationRepository(dsn=_DSN)
+    state = policy_repository._evaluation_state  # noqa: SLF001
+
+    def _full_snapshot_io(*args: object, **kwargs: object) -> None:
+        raise AssertionError("batch finalize must not read or rewrite the full snapshot")
+
+    monkeypatch.setattr(state, "load_snapshot", _full_snapshot_io)
+    monkeypatch.setattr(state, "save_snapshot", _full_snapshot_io)
+    suffix = uuid.uuid4().hex
+
+    def _item(index: int, *, version_suffix: str = "v1") -> PolicyEvaluationFinalizeItem:
+        return PolicyEvaluationFinalizeItem(
+            evidence_bundle=_base_evidence_bundle(),
+            policy_pack_id="GLOBAL_PRIVATE_BANKING_BASELINE",
+            policy_version="2026.05",
+            proposal_id=f"pp_{suffix}_{index}",
+            proposal_version_id=f"pp_{suffix}_{index}_{version_suffix}",
+            created_by="advisor_1",
+            idempotency_key=f"policy-eval-{suffix}-{index}",
+            reason=_trusted_reason("batch finalize"),
+        )
+
+    try:
+        created = policy_repository.finalize_policy_evaluation_records(items=[_item(0), _item(1)])
+        replayed = policy_repository.finalize_policy_evaluation_records(
+            items=[_item(0), _item(1, version_suffix="v2"), _item(2)]
+        )
+    finally:
+        reset_policy_pack_catalog_for_tests()
+
+    assert [outcome.result.created for outcome in created if outcome.result] == [True, True]
+    assert replayed[0].result is not None
+    assert replayed[0].result.replayed is True
+    assert replayed[0].result.record == created[0].result.record  # type: ignore[union-attr]
+    assert replayed[1].result is None
+    assert replayed[1].error_code == "POLICY_EVALUATION_IDEMPOTENCY_KEY_CONFLICT"
+    assert replayed[2].result is not None and replayed[2].result.created is True
+    evaluation_ids = [
+        outcome.result.record.evaluation_id
+        for outcome in (*created, replayed[2])
+        if outcome.result is not None
+    ]
+    events = policy_repository.list_policy_evaluation_events_by_evaluation(
+        evaluation_ids=evaluation_ids
+    )
+    assert [len(events[evaluation_id]) for evaluation_id in evaluation_ids] == [1, 1, 1]
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for history import SQL checks.",
+)
+def test_live_postgres_history_import_merges_clean_batch(
+    repository: PostgresProposalRepository,
+) -> None:
+    importer = PostgresProposalHistoryImporter(dsn=_DSN)
+    records = [_history_record(f"pp_hist_{uuid.uuid4().hex}") for _ in range(2)]
+
+    result = importer.import_proposal_history_batch(records)
+
+    assert result == ProposalHistoryImportBatchResult(
+        proposals_imported=2,
+        versions_imported=4,
+        workflow_events_imported=4,
+        approvals_imported=2,
+    )
+    for record in records:
+        proposal_id = record.proposal.proposal_id
+        assert repository.get_proposal(proposal_id=proposal_id) == record.proposal
+        assert repository.get_version(proposal_id=proposal_id, version_no=2) == record.versions[1]
+        assert repository.list_events(proposal_id=proposal_id) == record.workflow_events
+        assert repository.list_approvals(proposal_id=proposal_id) == record.approvals
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for history import SQL checks.",
+)
+def test_live_postgres_history_import_rerun_is_idempotent(
+    repository: PostgresProposalRepository,
+) -> None:
+    importer = PostgresProposalHistoryImporter(dsn=_DSN)
+    record = _history_record(f"pp_hist_{uuid.uuid4().hex}")
+    importer.import_proposal_history_batch([record])
+
+    rerun = importer.import_proposal_history_batch([record])
+
+    assert rerun == ProposalHistoryImportBatchResult()
+    proposal_id = record.proposal.proposal_id
+    assert repository.list_events(proposal_id=proposal_id) == record.workflow_events
+    assert repository.list_approvals(proposal_id=proposal_id) == record.approvals
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for history import SQL checks.",
+)
+def test_live_postgres_history_import_rejects_version_hash_conflict_and_merges_the_rest(
+    repository: PostgresProposalRepository,
+) -> None:
+    importer = PostgresProposalHistoryImporter(dsn=_DSN)
+    stored = _history_record(f"pp_hist_{uuid.uuid4().hex}")
+    importer.import_proposal_history_batch([stored])
+    drifted_version = stored.versions[1].model_copy(update={"request_hash": "sha256:drifted"})
+    drifted = stored.model_copy(
+        update={
+            "versions": [stored.versions[0], drifted_version],
+            "approvals": [
+                stored.approvals[0].model_copy(update={"approval_id": f"pap_{uuid.uuid4().hex}"})
+            ],
+        }
+    )
+    clean = _history_record(f"pp_hist_{uuid.uuid4().hex}")
+
+    result = importer.import_proposal_history_batch([drifted, clean])
+
+    assert result == ProposalHistoryImportBatchResult(
+        proposals_imported=1,
+        versions_imported=2,
+        workflow_events_imported=2,
+        approvals_imported=1,
+        conflicts=(
+            ProposalHistoryImportConflict(
+                proposal_id=stored.proposal.proposal_id,
+                reason_code="PROPOSAL_VERSION_HASH_CONFLICT",
+            ),
+        ),
+    )
+    proposal_id = stored.proposal.proposal_id
+    assert repository.get_version(proposal_id=proposal_id, version_no=2) == stored.versions[1]
+    assert repository.list_approvals(proposal_id=proposal_id) == stored.approvals
+    assert repository.get_proposal(proposal_id=clean.proposal.proposal_id) == clean.proposal
+
+
+@pytest.mark.skipif(
+    not _DSN,
+    reason="Live Postgres DSN required for history import SQL checks.",
+)
+def test_live_postgres_history_import_rejects_cross_proposal_duplicate_event_ids(
+    repository: PostgresProposalRepository,
+) -> None:
+    importer = PostgresProposalHistoryImporter(dsn=_DSN)
+    stored = _history_record(f"pp_hist_{uuid.uuid4().hex}")
+    importer.import_proposal_history_batch([stored])
+    # One proposal reuses a stored event id from another proposal; two staged proposals share a
+    # new event id.
+    reuses_stored = _history_record(f"pp_hist_{uuid.uuid4().hex}")
+    reuses_stored.workflow_events[0] = reuses_stored.workflow_events[0].model_copy(
+        update={"event_id": stored.workflow_events[0].event_id}
+    )
+    shared_event_id = f"pwe_shared_{uuid.uuid4().hex}"
+    first, second = (_history_record(f"pp_hist_{uuid.uuid4().hex}") for _ in range(2))
+    first.workflow_events[1] = first.workflow_events[1].model_copy(
+        update={"event_id": shared_event_id}
+    )
+    second.workflow_events[0] = second.workflow_events[0].model_copy(
+        update={"event_id": shared_event_id}
+    )
+
+    result = importer.import_proposal_history_batch([reuses_stored, first, second])
+
+    assert result.proposals_imported == 0
+    assert result.workflow_events_imported == 0
+    assert {conflict.reason_code for conflict in result.conflicts} == {
+        "PROPOSAL_WORKFLOW_EVENT_IDENTITY_CONFLICT"
+    }
+    assert sorted(conflict.proposal_id for conflict in result.conflicts) == sorted(
+        record.proposal.proposal_id for record in (reuses_stored, first, second)
+    )
+    assert repository.get_proposal(proposal_id=first.proposal.proposal_id) is None
+    assert repository.list_events(proposal_id=stored.proposal.proposal_id) == (
+        stored.workflow_events
+    )
+
+
 def test_live_postgres_update_proposal_contract(
     repository: PostgresProposalRepository,
 ) -> None:
@@ -1181,6 +1642,29 @@ def _memo_create_records(
     return memo, idempotency, event
 
 
+def _wait_for_advisory_lock_waiters(
+    *,
+    repository: PostgresProposalRepository,
+    count: int,
+    timeout_seconds: float = 5.0,
+) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    with closing(repository._connect()) as connection:  # noqa: SLF001
+        while True:
+            row = connection.execute(
+                "SELECT COUNT(*) AS waiters FROM pg_locks "
+                "WHERE locktype = 'advisory' AND NOT granted"
+            ).fetchone()
+            connection.rollback()
+            if row["waiters"] >= count:
+                return
+            if time.monotonic() > deadline:
+                raise AssertionError(
+                    f"Expected {count} advisory lock waiters, saw {row['waiters']}"
+                )
+            time.sleep(0.02)
+
+
 def _assert_statement_fails(connection, query: str, args: tuple[object, ...]) -> None:
     try:
         connection.execute(query, args)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
+import threading
 from datetime import UTC, datetime
 from typing import Any
 
@@ -11,12 +13,14 @@ from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
 import src.api.proposals.copilot_dependencies as copilot_dependencies
+import src.api.proposals.copilot_streaming as copilot_streaming
 import src.api.proposals.router as proposals_router
 import src.api.proposals.routes_advisory_copilot as copilot_routes
 from src.api.main import app
 from src.api.proposals.copilot_errors import raise_copilot_http_exception
 from src.api.proposals.router import reset_proposal_workflow_service_for_tests
 from src.core.advisory_copilot.api_request_models import (
+    AdvisoryCopilotActionRequest,
     AdvisoryCopilotEvidencePacketCreateRequest,
 )
 from src.core.advisory_copilot.api_response_models import (
@@ -419,6 +423,310 @@ def test_advisory_copilot_action_persists_review_gated_run(
     assert "Summarize the advisory evidence" not in str(read.json())
 
 
+def _stream_events(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_advisory_copilot_stream_emits_grounded_sections_before_persisted_run(
+    monkeypatch: pytest.MonkeyPatch,
+    copilot_repository: InMemoryAdvisoryCopilotRepository,
+) -> None:
+    _ = copilot_repository
+    sections = (
+        {
+            "section_key": "SUMMARY",
+            "title": "Advisor summary",
+            "text": "Policy review is required before client communication.",
+            "grounding_status": "GROUNDED",
+        },
+        {
+            "section_key": "POLICY_POSTURE",
+            "title": "Policy posture",
+            "text": "Compliance review remains open.",
+            "grounding_status": "GROUNDED",
+        },
+    )
+
+    def _draft(*, on_section: Any = None, **_: Any) -> AdvisoryCopilotAiDraft:
+        for section in sections:
+            if on_section is not None:
+                on_section(dict(section))
+        return AdvisoryCopilotAiDraft(
+            status="REVIEW_REQUIRED",
+            sections=sections,
+            lineage={
+                "workflow_pack_id": "advisory_copilot_proposal_explanation.pack",
+                "workflow_pack_version": "v1",
+                "workflow_run_id": "packrun_copilot_stream_001",
+                "model_version": "lotus-ai-governed-model.v1",
+            },
+            review_guidance=("Review source evidence before internal use.",),
+            guardrail_reasons=(),
+        )
+
+    monkeypatch.setattr(
+        copilot_dependencies,
+        "generate_advisory_copilot_draft_with_lotus_ai",
+        _draft,
+    )
+    action = {
+        "evidence_packet_id": "copilot_packet_pb_sg_001",
+        "audience": "ADVISOR",
+        "requested_outputs": ["advisor_review_summary"],
+        "requested_by": "advisor_123",
+        "reason": {"business_reason": "Prepare advisor review."},
+    }
+
+    with TestClient(app) as client:
+        client.post("/advisory/copilot/evidence-packets", json=_evidence_packet_payload())
+        streamed = client.post(
+            "/advisory/copilot/actions/stream",
+            json=action,
+            headers={"Idempotency-Key": "copilot-stream-idem-001"},
+        )
+        replay = client.post(
+            "/advisory/copilot/actions/stream",
+            json=action,
+            headers={"Idempotency-Key": "copilot-stream-idem-001"},
+        )
+        missing = client.post(
+            "/advisory/copilot/actions/stream",
+            json={**action, "evidence_packet_id": "copilot_packet_missing"},
+        )
+        events = _stream_events(streamed.text)
+        run = events[-1][1]["run"]
+        read = client.get(f"/advisory/copilot/actions/{run['run_id']}")
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("text/event-stream")
+    assert [event for event, _ in events] == [
+        "run.started",
+        "section.grounded",
+        "section.grounded",
+        "run.completed",
+    ]
+    assert events[0][1]["evidence_packet_id"] == "copilot_packet_pb_sg_001"
+    assert [data["section_key"] for _, data in events[1:3]] == ["SUMMARY", "POLICY_POSTURE"]
+    assert [data["section_index"] for _, data in events[1:3]] == [0, 1]
+    assert events[-1][1]["replayed"] is False
+    assert read.json()["run"] == run
+    assert [event for event, _ in _stream_events(replay.text)] == [
+        "run.started",
+        "run.completed",
+    ]
+    assert _stream_events(replay.text)[-1][1]["replayed"] is True
+    assert _stream_events(missing.text)[-1] == (
+        "run.failed",
+        {"status_code": 404, "detail": "COPILOT_EVIDENCE_PACKET_NOT_FOUND"},
+    )
+
+
+class _StubRunResponse:
+    def model_dump(self, *, mode: str) -> dict[str, Any]:
+        return {"run": {"run_id": "copilot_run_stub"}, "replayed": False}
+
+
+def _run_stream_until_disconnect(*, disconnect_after_sections: int) -> dict[str, Any]:
+    release_run = threading.Event()
+    run_finished = threading.Event()
+    observed: dict[str, Any] = {"completed": False}
+
+    def _run_action(section_listener: Any) -> Any:
+        try:
+            section_listener({"section_key": "SUMMARY", "title": "Advisor summary"})
+            release_run.wait(timeout=5)
+            section_listener({"section_key": "POLICY_POSTURE", "title": "Policy posture"})
+            return _StubRunResponse()
+        finally:
+            run_finished.set()
+
+    async def _is_disconnected() -> bool:
+        return True
+
+    async def _consume() -> list[str]:
+        stream = copilot_streaming.stream_advisory_copilot_run_events(
+            run_action=_run_action,
+            started={"evidence_packet_id": "copilot_packet_pb_sg_001"},
+            on_completed=lambda _: observed.update(completed=True),
+            is_disconnected=_is_disconnected,
+        )
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            if len(chunks) == 1 + disconnect_after_sections:
+                await stream.aclose()
+                break
+        return chunks
+
+    observed["events"] = [_stream_events(chunk)[0][0] for chunk in asyncio.run(_consume())]
+    release_run.set()
+    observed["finished"] = run_finished.wait(timeout=5)
+    return observed
+
+
+def test_advisory_copilot_stream_finishes_started_run_when_client_disconnects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(copilot_streaming, "COPILOT_STREAM_POLL_SECONDS", 0.01)
+
+    observed = _run_stream_until_disconnect(disconnect_after_sections=2)
+
+    assert observed["events"] == ["run.started", "section.grounded"]
+    assert observed["finished"] is True
+    assert observed["completed"] is True
+
+
+def test_advisory_copilot_stream_finishes_started_run_when_response_is_closed_early(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(copilot_streaming, "COPILOT_STREAM_POLL_SECONDS", 0.01)
+
+    observed = _run_stream_until_disconnect(disconnect_after_sections=1)
+
+    assert observed["events"] == ["run.started", "section.grounded"]
+    assert observed["finished"] is True
+    assert observed["completed"] is True
+
+
+def test_advisory_copilot_stream_skips_run_that_has_not_started_when_client_disconnects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queued: list[Any] = []
+
+    class _QueuedExecutor:
+        def submit(self, fn: Any, *args: Any) -> None:
+            queued.append(lambda: fn(*args))
+
+    monkeypatch.setattr(copilot_streaming, "_resolve_executor", lambda: _QueuedExecutor())
+    calls: list[Any] = []
+
+    async def _consume() -> None:
+        stream = copilot_streaming.stream_advisory_copilot_run_events(
+            run_action=calls.append,
+            started={"evidence_packet_id": "copilot_packet_pb_sg_001"},
+        )
+        await anext(stream)
+        await stream.aclose()
+
+    asyncio.run(_consume())
+    queued[0]()
+
+    assert calls == []
+
+
+def test_advisory_copilot_stream_persists_run_after_client_disconnects_mid_stream(
+    monkeypatch: pytest.MonkeyPatch,
+    copilot_repository: InMemoryAdvisoryCopilotRepository,
+) -> None:
+    monkeypatch.setattr(copilot_streaming, "COPILOT_STREAM_POLL_SECONDS", 0.01)
+    release_draft = threading.Event()
+    draft_calls: list[str] = []
+    sections = (
+        {"section_key": "SUMMARY", "title": "Advisor summary", "text": "Review required."},
+        {"section_key": "POLICY_POSTURE", "title": "Policy posture", "text": "Review open."},
+    )
+
+    def _draft(*, on_section: Any = None, **_: Any) -> AdvisoryCopilotAiDraft:
+        draft_calls.append("lotus-ai")
+        on_section(dict(sections[0]))
+        release_draft.wait(timeout=5)
+        on_section(dict(sections[1]))
+        return AdvisoryCopilotAiDraft(
+            status="REVIEW_REQUIRED",
+            sections=sections,
+            lineage={"workflow_pack_id": "advisory_copilot_proposal_explanation.pack"},
+            review_guidance=("Review source evidence before internal use.",),
+            guardrail_reasons=(),
+        )
+
+    monkeypatch.setattr(
+        copilot_dependencies,
+        "generate_advisory_copilot_draft_with_lotus_ai",
+        _draft,
+    )
+    action = {
+        "evidence_packet_id": "copilot_packet_pb_sg_001",
+        "audience": "ADVISOR",
+        "requested_outputs": ["advisor_review_summary"],
+        "requested_by": "advisor_123",
+        "reason": {"business_reason": "Prepare advisor review."},
+    }
+
+    class _DisconnectedRequest:
+        async def is_disconnected(self) -> bool:
+            return True
+
+    async def _consume_until_first_section() -> list[str]:
+        response = copilot_routes.stream_advisory_copilot_action(
+            payload=AdvisoryCopilotActionRequest(**action),
+            request=_DisconnectedRequest(),  # type: ignore[arg-type]
+            idempotency_key="copilot-stream-disconnect-001",
+            correlation_id=None,
+            service=copilot_dependencies.get_advisory_copilot_application_service(
+                repository=copilot_repository
+            ),
+        )
+        stream = response.body_iterator
+        chunks = [await anext(stream), await anext(stream)]
+        await stream.aclose()  # type: ignore[attr-defined]
+        return chunks
+
+    with TestClient(app) as client:
+        client.post("/advisory/copilot/evidence-packets", json=_evidence_packet_payload())
+        chunks = asyncio.run(_consume_until_first_section())
+        release_draft.set()
+        idempotency = None
+        for _ in range(500):
+            idempotency = copilot_repository.get_run_idempotency(
+                idempotency_key="copilot-stream-disconnect-001"
+            )
+            if idempotency is not None:
+                break
+            threading.Event().wait(0.01)
+        retry = client.post(
+            "/advisory/copilot/actions",
+            json=action,
+            headers={"Idempotency-Key": "copilot-stream-disconnect-001"},
+        )
+
+    assert [_stream_events(str(chunk))[0][0] for chunk in chunks] == [
+        "run.started",
+        "section.grounded",
+    ]
+    assert idempotency is not None
+    run = copilot_repository.get_run(run_id=idempotency.run_id)
+    assert run is not None
+    assert [section["section_key"] for section in run.output_sections_json] == [
+        "SUMMARY",
+        "POLICY_POSTURE",
+    ]
+    assert retry.json()["replayed"] is True
+    assert retry.json()["run"]["run_id"] == idempotency.run_id
+    assert draft_calls == ["lotus-ai"]
+
+
+def test_advisory_copilot_stream_workers_setting_is_validated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(copilot_streaming.COPILOT_STREAM_WORKERS_ENV, raising=False)
+    assert (
+        copilot_streaming.advisory_copilot_stream_workers()
+        == copilot_streaming.DEFAULT_COPILOT_STREAM_WORKERS
+    )
+
+    monkeypatch.setenv(copilot_streaming.COPILOT_STREAM_WORKERS_ENV, "3")
+    assert copilot_streaming.advisory_copilot_stream_workers() == 3
+
+    for raw_value in ("0", "many"):
+        monkeypatch.setenv(copilot_streaming.COPILOT_STREAM_WORKERS_ENV, raw_value)
+        with pytest.raises(RuntimeError, match="ADVISORY_COPILOT_STREAM_WORKERS_INVALID"):
+            copilot_streaming.advisory_copilot_stream_workers()
+
+
 def test_proposal_version_copilot_runs_are_paginated(
     monkeypatch: pytest.MonkeyPatch,
     copilot_repository: InMemoryAdvisoryCopilotRepository,
@@ -664,6 +972,7 @@ def test_advisory_copilot_openapi_is_action_specific() -> None:
 
     paths = schema["paths"]
     assert "/advisory/copilot/actions" in paths
+    assert "/advisory/copilot/actions/stream" in paths
     assert "/advisory/copilot/actions/{run_id}" in paths
     assert "/advisory/copilot/actions/{run_id}/reviews" in paths
     assert "/advisory/copilot/evidence-packets" in paths
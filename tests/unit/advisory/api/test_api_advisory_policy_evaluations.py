@@ -1685,6 +1685,63 @@ def test_policy_review_queue_filters_records_that_need_policy_review() -> None:
         assert ready_queue.json()["items"] == []
 
 
+def test_policy_review_queue_pages_by_keyset_cursor_with_counts() -> None:
+    with TestClient(app) as client:
+        _activate_sg_pack(client)
+        evaluation_ids = []
+        for index in (1, 2, 3):
+            created = client.post(
+                f"/advisory/proposals/pp_policy_page_00{index}/versions/"
+                f"ppv_policy_page_00{index}/policy-evaluations",
+                json=_sg_pending_payload(),
+                headers=_policy_evaluation_create_headers(
+                    proposal_id=f"pp_policy_page_00{index}",
+                    idempotency_key=f"api-policy-eval-page-00{index}",
+                ),
+            )
+            assert created.status_code == 200
+            evaluation_ids.append(created.json()["record"]["evaluation_id"])
+
+        first_page = client.get(
+            "/advisory/policy-evaluations/review-queue",
+            params={"limit": 2, "jurisdiction": "SG"},
+        )
+        assert first_page.status_code == 200
+        first_body = first_page.json()
+        second_page = client.get(
+            "/advisory/policy-evaluations/review-queue",
+            params={"limit": 2, "jurisdiction": "SG", "cursor": first_body["next_cursor"]},
+        )
+        assert second_page.status_code == 200
+        second_body = second_page.json()
+
+        assert [item["evaluation_id"] for item in first_body["items"]] == evaluation_ids[:2]
+        assert [item["evaluation_id"] for item in second_body["items"]] == evaluation_ids[2:]
+        assert second_body["next_cursor"] is None
+        assert first_body["total_count"] == 3
+        assert first_body["status_counts"] == {"PENDING_REVIEW": 3}
+
+        other_jurisdiction = client.get(
+            "/advisory/policy-evaluations/review-queue",
+            params={"generated_after": "2000-01-01T00:00:00Z", "jurisdiction": "HK"},
+        )
+        assert other_jurisdiction.json()["items"] == []
+        assert other_jurisdiction.json()["total_count"] == 0
+
+        invalid_cursor = client.get(
+            "/advisory/policy-evaluations/review-queue",
+            params={"cursor": "not-a-cursor"},
+        )
+        assert invalid_cursor.status_code == 422
+        assert invalid_cursor.json()["detail"] == "POLICY_EVALUATION_CURSOR_INVALID"
+
+        oversized_page = client.get(
+            "/advisory/policy-evaluations/review-queue",
+            params={"limit": 10_000},
+        )
+        assert oversized_page.status_code == 422
+
+
 def test_policy_evaluation_rejects_missing_portfolio_identity() -> None:
     payload = _create_payload()
     del payload["evidence_bundle"]["inputs"]["portfolio_snapshot"]["portfolio_id"]
@@ -1,3 +1,6 @@
+import io
+import json
+import tarfile
 import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
@@ -7,13 +10,17 @@ import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+import src.api.proposals.copilot_dependencies as copilot_dependencies
 import src.api.proposals.router as proposals_router
+import src.api.proposals.routes_evidence_export as evidence_export_routes
 from src.api.main import app
 from src.api.proposals.router import reset_proposal_workflow_service_for_tests
 from src.core.advisory.provider_ports import (
     AdvisoryRiskEnrichmentUnavailableError as LotusRiskEnrichmentUnavailableError,
 )
 from src.core.proposals import ProposalAsyncAcceptedResponse, ProposalIdempotencyConflictError
+from src.core.replay.evidence_export import verify_evidence_export_ndjson
+from src.infrastructure.advisory_copilot import InMemoryAdvisoryCopilotRepository
 from src.integrations.lotus_core.stateful_context import (
     get_stateful_context_fetch_stats_for_tests,
     reset_stateful_context_cache_for_tests,
@@ -3242,6 +3249,95 @@ def test_async_create_route_schedules_new_submission_once() -> None:
         app.dependency_overrides = original_overrides
 
 
+def test_evidence_export_streams_a_verifiable_portfolio_bundle(monkeypatch):
+    audit_events: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        evidence_export_routes, "emit_audit_event", lambda **event: audit_events.append(event)
+    )
+    original_overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[copilot_dependencies.get_optional_advisory_copilot_repository] = (
+        InMemoryAdvisoryCopilotRepository
+    )
+    try:
+        with TestClient(app) as client:
+            created = _create(
+                client, "lifecycle-evidence-export-1", _base_create_payload("pf_export")
+            )
+            _create(client, "lifecycle-evidence-export-2", _base_create_payload("pf_export_other"))
+
+            response = client.get(
+                "/advisory/proposals/exports/evidence", params={"portfolio_id": "pf_export"}
+            )
+            tar_response = client.get(
+                "/advisory/proposals/exports/evidence",
+                params={"portfolio_id": "pf_export", "export_format": "tar"},
+            )
+            missing_scope = client.get("/advisory/proposals/exports/evidence")
+    finally:
+        app.dependency_overrides = original_overrides
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"].endswith('.ndjson"')
+    lines = response.content.splitlines()
+    entries = [json.loads(line) for line in lines]
+    proposal_entries = [entry for entry in entries if entry["record_type"] == "proposal"]
+    assert [entry["payload"]["proposal_id"] for entry in proposal_entries] == [
+        created["proposal"]["proposal_id"]
+    ]
+    assert entries[-1]["record_type"] == "export_trailer"
+    verification = verify_evidence_export_ndjson(lines)
+    assert verification.valid is True
+    export_id = response.headers["x-evidence-export-id"]
+    assert entries[0]["payload"]["export_id"] == export_id
+    assert entries[0]["payload"]["sections"]["copilot_runs"] is True
+    assert audit_events[0]["action"] == "PROPOSAL_EVIDENCE_EXPORTED"
+    assert audit_events[0]["metadata"]["export_id"] == export_id
+    assert audit_events[0]["metadata"]["head_hash"] == verification.head_hash
+    assert audit_events[0]["metadata"]["entry_count"] == verification.entry_count
+    assert [event["metadata"]["export_format"] for event in audit_events] == ["ndjson", "tar"]
+    assert tar_response.status_code == 200
+    assert tar_response.headers["content-type"] == "application/x-tar"
+    with tarfile.open(fileobj=io.BytesIO(tar_response.content), mode="r:") as archive:
+        assert archive.getnames()[-1].endswith("-export_trailer.json")
+    assert missing_scope.status_code == 422
+    assert missing_scope.json()["detail"] == "EVIDENCE_EXPORT_SCOPE_REQUIRED"
+
+
+@pytest.mark.parametrize("copilot_store_available", [True, False])
+def test_evidence_export_omits_copilot_runs_when_skipped_or_unavailable(
+    monkeypatch, copilot_store_available
+):
+    def _build_copilot_repository(**_kwargs):
+        if not copilot_store_available:
+            raise RuntimeError("ADVISORY_COPILOT_POSTGRES_DSN_REQUIRED")
+        return InMemoryAdvisoryCopilotRepository()
+
+    monkeypatch.setattr(
+        copilot_dependencies, "build_advisory_copilot_repository", _build_copilot_repository
+    )
+    copilot_dependencies.reset_advisory_copilot_repository_for_tests()
+    params = {"portfolio_id": "pf_export_copilot"}
+    if copilot_store_available:
+        params["include_copilot_runs"] = "false"
+    try:
+        with TestClient(app) as client:
+            _create(
+                client,
+                f"lifecycle-evidence-export-copilot-{copilot_store_available}",
+                _base_create_payload("pf_export_copilot"),
+            )
+            response = client.get("/advisory/proposals/exports/evidence", params=params)
+    finally:
+        copilot_dependencies.reset_advisory_copilot_repository_for_tests()
+
+    assert response.status_code == 200
+    lines = response.content.splitlines()
+    header = json.loads(lines[0])
+    assert header["payload"]["sections"]["copilot_runs"] is False
+    assert verify_evidence_export_ndjson(lines).valid is True
+
+
 def test_proposal_version_and_async_replay_evidence_endpoints_return_normalized_lineage():
     with TestClient(app) as client:
         created = client.post(
@@ -3,6 +3,7 @@ from typing import Any
 import httpx
 import pytest
 from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
 
 import src.api.services.advisory_simulation_validation as advisory_simulation_validation
 from src.api.main import app
@@ -1735,3 +1736,28 @@ def test_advisory_proposal_simulate_allows_different_idempotency_keys(client):
     assert second.status_code == 200
     assert first.json()["proposal_run_id"] == second.json()["proposal_run_id"]
     assert first.json()["lineage"]["idempotency_key"] == "prop-cache-1"
+
+
+def test_advisory_proposal_simulate_records_request_model_serializations(client):
+    def sample(outcome: str) -> float:
+        return (
+            REGISTRY.get_sample_value(
+                "lotus_advise_request_model_serializations_total",
+                {"handler": "/advisory/proposals/simulate", "outcome": outcome},
+            )
+            or 0.0
+        )
+
+    reused_before = sample("reused")
+    serialized_before = sample("serialized")
+
+    response = client.post(
+        "/advisory/proposals/simulate",
+        json=_base_simulation_payload(),
+        headers={"Idempotency-Key": "prop-key-serialization-memo"},
+    )
+
+    assert response.status_code == 200
+    # The resolved context is dumped for the request hash and reused for the evidence.
+    assert sample("serialized") > serialized_before
+    assert sample("reused") > reused_before
@@ -0,0 +1,250 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import src.api.services.advisory_simulation_service as advisory_simulation_service
+from src.api.enterprise_policy import DEFAULT_MAX_WRITE_PAYLOAD_BYTES
+from src.api.main import app
+from src.api.proposals.router import reset_proposal_workflow_service_for_tests
+from src.core.proposals.bulk_simulation_models import PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS
+from src.integrations.lotus_core.stateful_context import reset_stateful_context_cache_for_tests
+from tests.shared.stateful_context_builders import build_resolved_stateful_context
+
+_BULK_PATH = "/advisory/proposals/simulate/bulk"
+
+
+@pytest.fixture(autouse=True)
+def reset_bulk_simulation_state(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY", "1")
+    reset_proposal_workflow_service_for_tests()
+    reset_stateful_context_cache_for_tests()
+    yield
+    reset_proposal_workflow_service_for_tests()
+    reset_stateful_context_cache_for_tests()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _portfolio(portfolio_id: str, cash_amount: str = "1000") -> dict:
+    return {
+        "portfolio_snapshot": {
+            "portfolio_id": portfolio_id,
+            "base_currency": "USD",
+            "positions": [],
+            "cash_balances": [{"currency": "USD", "amount": cash_amount}],
+        }
+    }
+
+
+def _payload(*portfolios: dict, cursor: str | None = None) -> dict:
+    return {
+        "template": {
+            "market_data_snapshot": {
+                "prices": [{"instrument_id": "EQ_1", "price": "100", "currency": "USD"}],
+                "fx_rates": [],
+            },
+            "shelf_entries": [{"instrument_id": "EQ_1", "status": "APPROVED"}],
+            "options": {"enable_proposal_simulation": True},
+            "proposed_cash_flows": [{"currency": "USD", "amount": "200"}],
+            "proposed_trades": [{"side": "BUY", "instrument_id": "EQ_1", "quantity": "2"}],
+        },
+        "portfolios": list(portfolios),
+        "cursor": cursor,
+    }
+
+
+def _records(response) -> list[dict]:  # noqa: ANN001
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_bulk_simulation_streams_result_summaries_and_isolates_item_errors(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    simulate = advisory_simulation_service.simulate_proposal_response
+
+    def _simulate(**kwargs):
+        portfolio_id = kwargs["request"].stateless_input.simulate_request.portfolio_snapshot
+        if portfolio_id.portfolio_id == "pf_bulk_invalid":
+            raise HTTPException(status_code=422, detail="PROPOSAL_SIMULATION_DISABLED")
+        if portfolio_id.portfolio_id == "pf_bulk_crash":
+            raise RuntimeError("unexpected")
+        return simulate(**kwargs)
+
+    monkeypatch.setattr(advisory_simulation_service, "simulate_proposal_response", _simulate)
+
+    response = client.post(
+        _BULK_PATH,
+        json=_payload(
+            _portfolio("pf_bulk_1"),
+            _portfolio("pf_bulk_invalid"),
+            _portfolio("pf_bulk_crash"),
+            _portfolio("pf_bulk_2", cash_amount="50"),
+        ),
+        headers={"Idempotency-Key": "bulk-campaign-001"},
+    )
+
+    records = _records(response)
+    assert [record["record_type"] for record in records] == [
+        "RESULT",
+        "ERROR",
+        "ERROR",
+        "RESULT",
+        "SUMMARY",
+    ]
+    first = records[0]
+    assert first["portfolio_id"] == "pf_bulk_1"
+    assert first["idempotency_key"].startswith("bulk_")
+    assert first["result"]["status"] == "READY"
+    assert first["result"]["before_total_value"]["amount"] == "1000"
+    assert first["result"]["after_total_value"]["amount"] == "1200.0"
+    assert records[1]["error"] == {"status_code": 422, "detail": "PROPOSAL_SIMULATION_DISABLED"}
+    assert records[2]["error"] == {
+        "status_code": 500,
+        "detail": "PROPOSAL_BULK_SIMULATION_ITEM_FAILED",
+    }
+    assert records[3]["result"]["status"] == "READY"
+    summary = records[-1]
+    assert summary["portfolio_count"] == 4
+    assert summary["skipped_count"] == 0
+    assert summary["error_count"] == 2
+    assert summary["status_counts"] == {"READY": 2}
+
+
+def test_bulk_simulation_resumes_from_cursor_and_replays_completed_items(client):
+    payload = _payload(_portfolio("pf_bulk_1"), _portfolio("pf_bulk_2"), _portfolio("pf_bulk_3"))
+    headers = {"Idempotency-Key": "bulk-campaign-002"}
+
+    first_pass = _records(client.post(_BULK_PATH, json=payload, headers=headers))
+    resumed = _records(
+        client.post(
+            _BULK_PATH,
+            json={**payload, "cursor": first_pass[0]["cursor"]},
+            headers=headers,
+        )
+    )
+
+    assert [record["portfolio_id"] for record in resumed[:-1]] == ["pf_bulk_2", "pf_bulk_3"]
+    assert [record["sequence"] for record in resumed[:-1]] == [1, 2]
+    assert resumed[0]["result"]["proposal_run_id"] == first_pass[1]["result"]["proposal_run_id"]
+    assert resumed[-1]["skipped_count"] == 1
+    finished = _records(
+        client.post(_BULK_PATH, json={**payload, "cursor": resumed[-1]["cursor"]}, headers=headers)
+    )
+    assert finished == [{**resumed[-1], "skipped_count": 3, "status_counts": {}}]
+
+
+def test_bulk_simulation_rejects_cursor_from_another_request(client):
+    payload = _payload(_portfolio("pf_bulk_1"), _portfolio("pf_bulk_2"))
+    first_pass = _records(
+        client.post(_BULK_PATH, json=payload, headers={"Idempotency-Key": "bulk-campaign-003"})
+    )
+
+    mismatch = client.post(
+        _BULK_PATH,
+        json={**payload, "cursor": first_pass[0]["cursor"]},
+        headers={"Idempotency-Key": "bulk-campaign-004"},
+    )
+    malformed = client.post(
+        _BULK_PATH,
+        json={**payload, "cursor": "%%%"},
+        headers={"Idempotency-Key": "bulk-campaign-003"},
+    )
+
+    assert mismatch.status_code == 422
+    assert mismatch.json()["detail"] == "PROPOSAL_BULK_SIMULATION_CURSOR_MISMATCH"
+    assert malformed.status_code == 422
+    assert malformed.json()["detail"] == "PROPOSAL_BULK_SIMULATION_CURSOR_INVALID"
+
+
+def test_bulk_simulation_applies_template_to_stateful_portfolios(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        "src.api.main.resolve_lotus_core_advisory_context",
+        lambda stateful_input: build_resolved_stateful_context(
+            stateful_input.portfolio_id,
+            stateful_input.as_of,
+            prices=[{"instrument_id": "EQ_1", "price": "100", "currency": "USD"}],
+            shelf_entries=[{"instrument_id": "EQ_1", "status": "APPROVED"}],
+        ),
+    )
+    payload = _payload({"stateful_input": {"portfolio_id": "pf_stateful", "as_of": "2026-03-25"}})
+
+    records = _records(
+        client.post(_BULK_PATH, json=payload, headers={"Idempotency-Key": "bulk-campaign-005"})
+    )
+
+    result = records[0]["result"]
+    assert records[0]["portfolio_id"] == "pf_stateful"
+    assert result["status"] == "READY"
+    assert result["after_total_value"]["amount"] == "1200.0"
+
+
+def test_bulk_simulation_bounds_concurrency_and_completes_every_portfolio(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY", "3")
+    payload = _payload(*(_portfolio(f"pf_bulk_{index}") for index in range(8)))
+
+    records = _records(
+        client.post(_BULK_PATH, json=payload, headers={"Idempotency-Key": "bulk-campaign-006"})
+    )
+
+    assert sorted(record["sequence"] for record in records[:-1]) == list(range(8))
+    assert records[-1]["status_counts"] == {"READY": 8}
+    resumed = _records(
+        client.post(
+            _BULK_PATH,
+            json={**payload, "cursor": records[-1]["cursor"]},
+            headers={"Idempotency-Key": "bulk-campaign-006"},
+        )
+    )
+    assert resumed[-1]["skipped_count"] == 8
+
+
+def test_bulk_simulation_accepts_the_supported_batch_size_above_the_write_payload_limit(
+    client,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("PROPOSAL_BULK_SIMULATION_MAX_CONCURRENCY", "4")
+    simulate = advisory_simulation_service.simulate_proposal_response
+    simulated: list = []
+
+    def _simulate_once(**kwargs):
+        # The size limit is under test here, not the engine; reuse one real result.
+        if not simulated:
+            simulated.append(simulate(**kwargs))
+        return simulated[0]
+
+    monkeypatch.setattr(advisory_simulation_service, "simulate_proposal_response", _simulate_once)
+    portfolios = []
+    for index in range(PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS):
+        portfolio = _portfolio(f"pf_bulk_size_{index:04d}")
+        portfolio["portfolio_snapshot"]["positions"] = [
+            {"instrument_id": f"EQ_HELD_{position}", "quantity": "10"} for position in range(3)
+        ]
+        portfolios.append(portfolio)
+    body = json.dumps(_payload(*portfolios)).encode("utf-8")
+    assert len(body) > DEFAULT_MAX_WRITE_PAYLOAD_BYTES
+
+    response = client.post(
+        _BULK_PATH,
+        content=body,
+        headers={"Content-Type": "application/json", "Idempotency-Key": "bulk-campaign-size"},
+    )
+
+    records = _records(response)
+    assert len(records) == PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS + 1
+    assert records[-1]["portfolio_count"] == PROPOSAL_BULK_SIMULATION_MAX_PORTFOLIOS
+    assert records[-1]["error_count"] == 0
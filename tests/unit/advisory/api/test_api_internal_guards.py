@@ -55,6 +55,7 @@ HTTP_EXCEPTION_ALLOWED_FILES = {
     Path("src/api/proposals/runtime_errors.py"),
     Path("src/api/routers/bank_demo_proof_errors.py"),
     Path("src/api/routers/runtime_utils.py"),
+    Path("src/api/routers/tactical_house_view_errors.py"),
     Path("src/api/services/advisory_simulation_errors.py"),
     Path("src/api/workspaces/errors.py"),
 }
@@ -431,7 +432,7 @@ def test_advisory_copilot_routes_use_shared_error_boundary():
 def test_advisory_copilot_routes_use_shared_parameter_contracts():
     source = Path("src/api/proposals/routes_advisory_copilot.py").read_text(encoding="utf-8")
 
-    assert "from fastapi import Depends, status" in source
+    assert "from fastapi import Depends, Request, status" in source
     assert "Query(" not in source
     assert "Header(" not in source
     assert "Path(" not in source
@@ -495,7 +496,7 @@ def test_policy_evaluation_routes_use_shared_proposal_error_boundary():
     assert "ProposalNotFoundError" not in combined_source
     assert "LotusReportUnavailableError" not in combined_source
     assert "run_lotus_report_operation" in package_source
-    assert combined_source.count("run_proposal_operation(") == 11
+    assert combined_source.count("run_proposal_operation(") == 12
 
 
 def test_policy_evaluation_routes_use_application_service_boundary():
@@ -612,6 +613,7 @@ def test_advisory_simulation_routes_use_shared_response_metadata():
     assert "responses={" not in source
     assert "responses=PROPOSAL_SIMULATION_RESPONSES" in source
     assert "responses=PROPOSAL_ARTIFACT_RESPONSES" in source
+    assert "responses=PROPOSAL_BULK_SIMULATION_RESPONSES" in source
 
 
 def test_advisory_simulation_routes_use_shared_parameter_contracts():
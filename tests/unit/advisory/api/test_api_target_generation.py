@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.api.main import app
+
+
+def _payload() -> dict:
+    return {
+        "model": {
+            "targets": [
+                {"instrument_id": "EQ_A", "weight": "0.60"},
+                {"instrument_id": "BOND_A", "weight": "0.40"},
+            ]
+        },
+        "shelf": [
+            {"instrument_id": "EQ_A", "status": "APPROVED"},
+            {"instrument_id": "BOND_A", "status": "APPROVED"},
+        ],
+        "options": {
+            "target_method": "SOLVER",
+            "cash_band_min_weight": "0",
+            "cash_band_max_weight": "0",
+            "single_position_max_weight": "0.55",
+        },
+        "portfolios": [
+            {
+                "portfolio_id": portfolio_id,
+                "total_value": {"amount": "250000", "currency": "SGD"},
+                "eligible_targets": {"EQ_A": "0.60", "BOND_A": "0.40"},
+                "buy_list": ["EQ_A", "BOND_A"],
+            }
+            for portfolio_id in ("PB_SG_GLOBAL_BAL_001", "PB_SG_GLOBAL_BAL_002")
+        ],
+    }
+
+
+def test_target_generation_batch_streams_ndjson_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", "0")
+    ready_before = _ready_portfolio_count()
+
+    with TestClient(app) as client:
+        response = client.post("/advisory/target-generation/batches", json=_payload())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["record_type"] for record in records] == ["PORTFOLIO", "PORTFOLIO", "SUMMARY"]
+    first = records[0]
+    assert first["portfolio_id"] == "PB_SG_GLOBAL_BAL_001"
+    assert first["status"] == "READY"
+    assert {target["instrument_id"]: target["final_weight"] for target in first["targets"]} == {
+        "EQ_A": "0.5500",
+        "BOND_A": "0.4500",
+    }
+    assert records[-1]["status_counts"] == {"READY": 2}
+    assert records[-1]["portfolio_count"] == 2
+    assert _ready_portfolio_count() == ready_before + 2
+
+
+def test_target_generation_batch_rejects_empty_portfolio_list() -> None:
+    payload = _payload()
+    payload["portfolios"] = []
+
+    with TestClient(app) as client:
+        response = client.post("/advisory/target-generation/batches", json=payload)
+
+    assert response.status_code == 422
+
+
+def _ready_portfolio_count() -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "lotus_advise_target_batch_portfolios_total",
+            {"status": "ready"},
+        )
+        or 0.0
+    )
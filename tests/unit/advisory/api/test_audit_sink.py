@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.api.audit_sink import (
+    AuditEventSink,
+    audit_sink_overflow_policy,
+    audit_sink_queue_size,
+    current_audit_event_sink,
+    start_audit_event_sink,
+    stop_audit_event_sink,
+)
+from src.api.enterprise_readiness import emit_audit_event
+from src.api.observability import JsonFormatter, correlation_id_var
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.setFormatter(JsonFormatter())
+        self.lines: list[dict[str, object]] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(json.loads(self.format(record)))
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def audit_handler():
+    audit_logger = logging.getLogger("enterprise_readiness")
+    handler = _RecordingHandler()
+    previous_level = audit_logger.level
+    audit_logger.addHandler(handler)
+    audit_logger.setLevel(logging.INFO)
+    yield handler
+    audit_logger.removeHandler(handler)
+    audit_logger.setLevel(previous_level)
+
+
+def _sink_events(outcome: str) -> float:
+    value = REGISTRY.get_sample_value("lotus_advise_audit_sink_events_total", {"outcome": outcome})
+    return value or 0.0
+
+
+def _emit(action: str, metadata: dict[str, object]) -> None:
+    emit_audit_event(
+        action=action,
+        actor_id="advisor-sg-001",
+        tenant_id="tenant-sg-001",
+        role="ADVISOR",
+        correlation_id="corr-audit-sink-001",
+        metadata=metadata,
+    )
+
+
+def test_audit_sink_writes_queued_events_off_the_caller_with_request_context(
+    monkeypatch, audit_handler
+) -> None:
+    monkeypatch.delenv("ENTERPRISE_AUDIT_ASYNC_ENABLED", raising=False)
+    sink = start_audit_event_sink()
+    assert sink is not None and current_audit_event_sink() is sink
+    metadata: dict[str, object] = {"api_key": "secret-value", "proposal_id": "pp_001"}
+    token = correlation_id_var.set("corr-context-001")
+    try:
+        _emit("POST /advisory/proposals", metadata)
+    finally:
+        correlation_id_var.reset(token)
+    metadata["proposal_id"] = "pp_changed_after_emit"
+
+    stop_audit_event_sink(sink)
+
+    assert current_audit_event_sink() is None
+    assert audit_handler.threads == {"enterprise-audit-sink"}
+    [line] = audit_handler.lines
+    assert line["correlation_id"] == "corr-context-001"
+    assert line["audit"]["metadata"] == {
+        "api_key": "***REDACTED***",
+        "proposal_id": "pp_001",
+    }
+
+
+def test_audit_sink_close_flushes_every_queued_event_in_order(audit_handler) -> None:
+    sink = AuditEventSink(queue_size=100, batch_size=7)
+    sink.start()
+    audit_logger = logging.getLogger("enterprise_readiness")
+    for index in range(40):
+        sink.submit(
+            audit_logger,
+            audit_logger.makeRecord(
+                audit_logger.name,
+                logging.INFO,
+                __file__,
+                0,
+                "enterprise_audit_event",
+                (),
+                None,
+                extra={"audit": {"action": f"event-{index}"}},
+            ),
+        )
+
+    sink.close()
+
+    assert [line["audit"]["action"] for line in audit_handler.lines] == [
+        f"event-{index}" for index in range(40)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_actions", "overflow_outcome"),
+    [
+        ("inline", ["overflow", "queued"], "inline"),
+        ("drop", ["queued"], "dropped"),
+    ],
+)
+def test_audit_sink_applies_overflow_policy_when_queue_is_full(
+    monkeypatch, audit_handler, overflow_policy, expected_actions, overflow_outcome
+) -> None:
+    # The writer is not started, so the single queue slot stays occupied.
+    sink = AuditEventSink(queue_size=1, batch_size=1, overflow_policy=overflow_policy)
+    monkeypatch.setattr("src.api.audit_sink._ACTIVE_SINK", sink)
+    queued_before = _sink_events("queued")
+    overflow_before = _sink_events(overflow_outcome)
+
+    _emit("queued", {})
+    _emit("overflow", {})
+    sink.close()
+
+    assert [line["audit"]["action"] for line in audit_handler.lines] == expected_actions
+    assert _sink_events("queued") == queued_before + 1
+    assert _sink_events(overflow_outcome) == overflow_before + 1
+
+
+def test_audit_sink_writes_inline_after_close(monkeypatch, audit_handler) -> None:
+    sink = AuditEventSink(queue_size=1, overflow_policy="drop")
+    monkeypatch.setattr("src.api.audit_sink._ACTIVE_SINK", sink)
+    sink.close()
+
+    _emit("after-close", {})
+
+    assert [line["audit"]["action"] for line in audit_handler.lines] == ["after-close"]
+
+
+def test_audit_sink_can_be_disabled(monkeypatch) -> None:
+    monkeypatch.setenv("ENTERPRISE_AUDIT_ASYNC_ENABLED", "false")
+
+    assert start_audit_event_sink() is None
+    assert current_audit_event_sink() is None
+
+
+@pytest.mark.parametrize(
+    ("env_name", "raw_value", "loader"),
+    [
+        ("ENTERPRISE_AUDIT_QUEUE_SIZE", "0", audit_sink_queue_size),
+        ("ENTERPRISE_AUDIT_QUEUE_SIZE", "many", audit_sink_queue_size),
+        ("ENTERPRISE_AUDIT_OVERFLOW_POLICY", "block", audit_sink_overflow_policy),
+    ],
+)
+def test_audit_sink_rejects_invalid_configuration(monkeypatch, env_name, raw_value, loader) -> None:
+    monkeypatch.setenv(env_name, raw_value)
+
+    with pytest.raises(RuntimeError, match=f"{env_name}_INVALID"):
+        loader()
@@ -6,12 +6,15 @@ import logging
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
 
+from src.api.enterprise_policy import CapabilityRouteTrie, current_enterprise_policy
 from src.api.enterprise_readiness import (
     _REDACT_FIELD_MARKERS,
     authorize_write_request,
-    build_enterprise_audit_middleware,
     emit_audit_event,
+    install_enterprise_audit,
+    is_feature_enabled,
     redact_sensitive,
     validate_enterprise_runtime_config,
 )
@@ -196,6 +199,116 @@ def test_authorize_write_request_does_not_match_sibling_capability_paths(monkeyp
     assert sibling_reason is None
 
 
+def test_capability_route_trie_keeps_first_configured_rule_precedence() -> None:
+    trie = CapabilityRouteTrie(
+        {
+            "POST /advisory/proposals/": "proposal.write",
+            "post /advisory/proposals/approvals": "proposal.approve",
+            "POST /advisory": "advisory.write",
+            "DELETE /": "admin.delete",
+            "POST": "ignored.without_path",
+        }
+    )
+
+    assert trie.required_capability("POST", "/advisory/proposals/approvals/") == "proposal.write"
+    assert trie.required_capability("post", "/advisory/proposals") == "proposal.write"
+    assert trie.required_capability("POST", "/advisory/workspaces") == "advisory.write"
+    assert trie.required_capability("POST", "/advisory-admin") is None
+    assert trie.required_capability("DELETE", "/anything/below/root") == "admin.delete"
+    assert trie.required_capability("PUT", "/advisory/proposals") is None
+
+
+def test_enterprise_policy_snapshot_hot_reloads_on_config_change(monkeypatch) -> None:
+    monkeypatch.setenv("ENTERPRISE_ENFORCE_AUTHZ", "true")
+    monkeypatch.setenv(
+        "ENTERPRISE_CAPABILITY_RULES_JSON",
+        json.dumps({"POST /advisory/proposals": "proposal.write"}),
+    )
+    headers = {
+        "X-Actor-Id": "advisor-sg-001",
+        "X-Tenant-Id": "tenant-sg-001",
+        "X-Role": "ADVISOR",
+        "X-Correlation-Id": "corr-reload-001",
+        "X-Service-Identity": "lotus-workbench",
+        "X-Capabilities": "proposal.write",
+    }
+    reloads_before = REGISTRY.get_sample_value("lotus_advise_enterprise_policy_reloads_total")
+
+    first = current_enterprise_policy()
+    assert current_enterprise_policy() is first
+    assert authorize_write_request("POST", "/advisory/proposals", headers) == (True, None)
+
+    monkeypatch.setenv(
+        "ENTERPRISE_CAPABILITY_RULES_JSON",
+        json.dumps({"POST /advisory/proposals": "proposal.submit"}),
+    )
+
+    assert current_enterprise_policy() is not first
+    assert authorize_write_request("POST", "/advisory/proposals", headers) == (
+        False,
+        "missing_capability:proposal.submit",
+    )
+    reloads_after = REGISTRY.get_sample_value("lotus_advise_enterprise_policy_reloads_total")
+    assert reloads_after is not None
+    assert reloads_after >= (reloads_before or 0.0) + 1
+
+
+def test_feature_flags_fall_back_from_role_to_tenant_to_global_default(monkeypatch) -> None:
+    monkeypatch.setenv(
+        "ENTERPRISE_FEATURE_FLAGS_JSON",
+        json.dumps(
+            {
+                "copilot": {
+                    "tenant-sg-001": {"ADVISOR": False, "*": True},
+                    "tenant-hk-001": {"ADVISOR": "yes"},
+                    "*": {"*": True},
+                },
+                "bulk_import": {"tenant-sg-001": {"OPS": True}},
+                "malformed": ["not", "a", "map"],
+            }
+        ),
+    )
+
+    assert is_feature_enabled("copilot", "tenant-sg-001", "ADVISOR") is False
+    assert is_feature_enabled("copilot", "tenant-sg-001", "OPS") is True
+    assert is_feature_enabled("copilot", "tenant-hk-001", "ADVISOR") is True
+    assert is_feature_enabled("bulk_import", "tenant-sg-001", "OPS") is True
+    assert is_feature_enabled("bulk_import", "tenant-sg-001", "ADVISOR") is False
+    assert is_feature_enabled("malformed", "tenant-sg-001", "ADVISOR") is False
+    assert is_feature_enabled("unknown", "tenant-sg-001", "ADVISOR") is False
+
+
+def test_enterprise_middleware_records_policy_overhead_by_decision(monkeypatch) -> None:
+    monkeypatch.setenv("ENTERPRISE_ENFORCE_AUTHZ", "true")
+
+    def _count(decision: str) -> float:
+        value = REGISTRY.get_sample_value(
+            "lotus_advise_enterprise_policy_middleware_seconds_count",
+            {"decision": decision},
+        )
+        return value or 0.0
+
+    allowed_before = _count("allowed")
+    denied_before = _count("denied")
+    client = _enterprise_test_client()
+
+    client.post("/advisory/proposals", json={"request": "blocked"})
+    client.post(
+        "/advisory/proposals",
+        json={"request": "allowed"},
+        headers={
+            "X-Actor-Id": "advisor-sg-001",
+            "X-Tenant-Id": "tenant-sg-001",
+            "X-Role": "ADVISOR",
+            "X-Correlation-Id": "corr-overhead-001",
+            "X-Service-Identity": "lotus-workbench",
+        },
+    )
+
+    assert _count("denied") == denied_before + 1
+    assert _count("allowed") == allowed_before + 1
+
+
 def test_redact_sensitive_covers_common_audit_metadata_key_variants() -> None:
     metadata = {
         "apiToken": "token-value",
@@ -345,6 +458,36 @@ def test_enterprise_middleware_audits_payload_too_large_denial(
     }
 
 
+def test_enterprise_middleware_applies_streamed_upload_limit_to_ndjson_routes(monkeypatch) -> None:
+    monkeypatch.setenv("ENTERPRISE_MAX_WRITE_PAYLOAD_BYTES", "8")
+    monkeypatch.setenv("ENTERPRISE_MAX_STREAMED_UPLOAD_BYTES", "16")
+    client = _enterprise_test_client()
+
+    accepted = client.post(
+        "/advisory/tactical-house-view/cohorts/evaluate-stream", content=b"0123456789"
+    )
+    rejected = client.post(
+        "/advisory/tactical-house-view/cohorts/evaluate-stream", content=b"0" * 17
+    )
+
+    assert accepted.status_code == 200
+    assert rejected.status_code == 413
+
+
+def test_enterprise_middleware_applies_bulk_simulation_limit_to_bulk_route(monkeypatch) -> None:
+    monkeypatch.setenv("ENTERPRISE_MAX_WRITE_PAYLOAD_BYTES", "8")
+    monkeypatch.setenv("ENTERPRISE_MAX_BULK_SIMULATION_PAYLOAD_BYTES", "16")
+    client = _enterprise_test_client()
+
+    accepted = client.post("/advisory/proposals/simulate/bulk", content=b"0123456789")
+    rejected = client.post("/advisory/proposals/simulate/bulk", content=b"0" * 17)
+    other_write = client.post("/advisory/proposals", content=b"0123456789")
+
+    assert accepted.status_code == 200
+    assert rejected.status_code == 413
+    assert other_write.status_code == 413
+
+
 def test_enterprise_middleware_audit_actions_use_route_templates_for_parameterized_routes(
     monkeypatch,
     caplog: pytest.LogCaptureFixture,
@@ -410,7 +553,7 @@ def test_enterprise_middleware_adds_policy_version_on_authorization_denial(
 
 def _enterprise_test_client() -> TestClient:
     app = FastAPI()
-    app.middleware("http")(build_enterprise_audit_middleware())
+    install_enterprise_audit(app)
 
     @app.post("/advisory/proposals")
     def _write_endpoint() -> dict[str, bool]:
@@ -420,6 +563,14 @@ def _enterprise_test_client() -> TestClient:
     def _parameterized_write_endpoint(proposal_id: str, version_no: int) -> dict[str, object]:
         return {"proposal_id": proposal_id, "version_no": version_no}
 
+    @app.post("/advisory/tactical-house-view/cohorts/evaluate-stream")
+    def _streamed_upload_endpoint() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/advisory/proposals/simulate/bulk")
+    def _bulk_simulation_endpoint() -> dict[str, bool]:
+        return {"ok": True}
+
     return TestClient(app)
 
 
@@ -3,7 +3,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.api.enterprise_readiness import (
-    build_enterprise_audit_middleware,
+    install_enterprise_audit,
     validate_enterprise_runtime_config,
 )
 from src.api.http_boundary import approved_security_headers, install_http_boundary
@@ -130,7 +130,7 @@ def _http_boundary_test_app(*, with_enterprise_audit: bool = False) -> FastAPI:
     app = FastAPI()
     setup_observability(app)
     if with_enterprise_audit:
-        app.middleware("http")(build_enterprise_audit_middleware())
+        install_enterprise_audit(app)
     install_http_boundary(app)
 
     @app.get("/health")
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+from src.api.enterprise_readiness import install_enterprise_audit
+from src.api.http_boundary import install_http_boundary
+from src.api.http_pipeline import HttpPipelineMiddleware, http_pipeline_config
+from src.api.main import app as advise_app
+from src.api.observability import setup_observability
+
+
+class _RecordingStage:
+    def __init__(self, name: str, events: list[str], *, deny: bool = False) -> None:
+        self._name = name
+        self._events = events
+        self._deny = deny
+
+    def open(self, request: Request) -> _RecordingExchange | Response:
+        self._events.append(f"{self._name}.open")
+        if self._deny:
+            return PlainTextResponse("denied", status_code=403)
+        return _RecordingExchange(self._name, self._events)
+
+
+class _RecordingExchange:
+    def __init__(self, name: str, events: list[str]) -> None:
+        self._name = name
+        self._events = events
+
+    def on_response_start(self, status_code: int, headers: MutableHeaders) -> None:
+        self._events.append(f"{self._name}.start:{status_code}")
+        headers[f"X-Stage-{self._name}"] = "seen"
+
+    def close(self, status_code: int | None) -> None:
+        self._events.append(f"{self._name}.close:{status_code}")
+
+
+def test_global_app_runs_a_single_outermost_pure_asgi_pipeline() -> None:
+    middleware_classes = [middleware.cls for middleware in advise_app.user_middleware]
+
+    assert middleware_classes[0] is HttpPipelineMiddleware
+    assert middleware_classes.count(HttpPipelineMiddleware) == 1
+    assert not any(
+        isinstance(cls, type) and issubclass(cls, BaseHTTPMiddleware) for cls in middleware_classes
+    )
+
+
+def test_pipeline_stages_nest_in_installation_order() -> None:
+    events: list[str] = []
+    app = FastAPI()
+    pipeline = http_pipeline_config(app)
+    pipeline.add_stage(_RecordingStage("inner", events))
+    pipeline.add_stage(_RecordingStage("outer", events))
+
+    @app.get("/ok")
+    def _ok() -> dict[str, bool]:
+        return {"ok": True}
+
+    response = TestClient(app).get("/ok")
+
+    assert response.headers["X-Stage-inner"] == "seen"
+    assert response.headers["X-Stage-outer"] == "seen"
+    assert events == [
+        "outer.open",
+        "inner.open",
+        "inner.start:200",
+        "outer.start:200",
+        "inner.close:200",
+        "outer.close:200",
+    ]
+
+
+def test_pipeline_early_response_skips_inner_stages_and_the_app() -> None:
+    events: list[str] = []
+    app = FastAPI()
+    pipeline = http_pipeline_config(app)
+    pipeline.add_stage(_RecordingStage("inner", events))
+    pipeline.add_stage(_RecordingStage("guard", events, deny=True))
+    pipeline.add_stage(_RecordingStage("outer", events))
+
+    @app.get("/ok")
+    def _ok() -> dict[str, bool]:
+        events.append("app")
+        return {"ok": True}
+
+    response = TestClient(app).get("/ok")
+
+    assert response.status_code == 403
+    assert events == ["outer.open", "guard.open", "outer.start:403", "outer.close:403"]
+
+
+def test_pipeline_closes_stages_when_the_app_raises() -> None:
+    events: list[str] = []
+    app = FastAPI()
+    http_pipeline_config(app).add_stage(_RecordingStage("stage", events))
+
+    @app.get("/boom")
+    def _boom() -> dict[str, bool]:
+        raise RuntimeError("boom")
+
+    response = TestClient(app, raise_server_exceptions=False).get("/boom")
+
+    assert response.status_code == 500
+    assert events == ["stage.open", "stage.close:None"]
+
+
+def test_pipeline_passes_streamed_chunks_through_before_the_body_completes() -> None:
+    app = FastAPI()
+    setup_observability(app)
+    install_enterprise_audit(app)
+    install_http_boundary(app)
+    first_chunk_sent = asyncio.Event()
+    messages: list[dict[str, object]] = []
+
+    async def _chunks():
+        yield b"first\n"
+        # Buffering middleware would wait for the whole body before sending anything.
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=2)
+        yield b"second\n"
+
+    @app.get("/stream")
+    def _stream() -> StreamingResponse:
+        return StreamingResponse(_chunks(), media_type="application/x-ndjson")
+
+    request_sent = False
+
+    async def _receive() -> dict[str, object]:
+        nonlocal request_sent
+        if request_sent:
+            # The client stays connected; the response task cancels this wait when it finishes.
+            await asyncio.Event().wait()
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message: dict[str, object]) -> None:
+        messages.append(message)
+        if message["type"] == "http.response.body" and message.get("body") == b"first\n":
+            first_chunk_sent.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(app(scope, _receive, _send))
+
+    start = messages[0]
+    headers = MutableHeaders(raw=start["headers"])  # type: ignore[arg-type]
+    assert headers["X-Content-Type-Options"] == "nosniff"
+    assert headers["X-Enterprise-Policy-Version"] == "1.0.0"
+    assert headers["X-Correlation-Id"]
+    bodies = [message.get("body") for message in messages[1:]]
+    assert bodies[:2] == [b"first\n", b"second\n"]
+
+
+def test_pipeline_enterprise_denials_keep_boundary_headers_without_trace_headers(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("ENTERPRISE_ENFORCE_AUTHZ", "true")
+    app = FastAPI()
+    setup_observability(app)
+    install_enterprise_audit(app)
+    install_http_boundary(app)
+
+    @app.post("/write")
+    def _write() -> dict[str, bool]:
+        return {"ok": True}
+
+    response = TestClient(app).post("/write", json={})
+
+    assert response.status_code == 403
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["X-Enterprise-Policy-Version"] == "1.0.0"
+    assert "X-Correlation-Id" not in response.headers
@@ -9,10 +9,13 @@ from src.core.advisory_copilot import (
     CopilotLineageRef,
     CopilotSourceRef,
 )
+from src.core.advisory_copilot.draft_cache import AdvisoryCopilotDraftCache
 from src.core.advisory_copilot.model_governance import (
     AdvisoryCopilotModelApproval,
     advisory_copilot_model_approval_for_request,
 )
+from src.core.advisory_copilot.run_persistence import persist_advisory_copilot_run
+from src.infrastructure.advisory_copilot import InMemoryAdvisoryCopilotRepository
 from src.integrations.lotus_ai.advisory_copilot import (
     MAX_COPILOT_OUTPUT_SECTIONS,
     _build_workflow_pack_request,
@@ -1613,3 +1616,169 @@ def test_generate_advisory_copilot_masks_invalid_lotus_ai_json(
     assert telemetry["attempt_count"] == 1
     assert telemetry["last_error_type"] == "ValueError"
     assert telemetry["fallback_reason"] == "LOTUS_AI_ADVISORY_COPILOT_UNAVAILABLE"
+
+
+def _grounded_completion(run_id: str) -> _FakeResponse:
+    return _FakeResponse(
+        200,
+        {
+            "execution": {
+                "status": "COMPLETED",
+                "result": {
+                    "provider_id": "lotus-ai",
+                    "model_version": "lotus-ai-governed-model.v1",
+                    "structured_output": {
+                        "state": "REVIEW_REQUIRED",
+                        "sections": [
+                            {
+                                "section_key": "POLICY_POSTURE",
+                                "title": "Policy posture",
+                                "text": "Policy evaluation requires compliance review.",
+                                "claims": [_grounded_claim()],
+                            }
+                        ],
+                        "review_guidance": ["Review against cited evidence."],
+                    },
+                },
+            },
+            "workflow_pack_run": {"run_id": run_id},
+        },
+    )
+
+
+def _persist_draft(repository: InMemoryAdvisoryCopilotRepository, draft, *, requested_by: str):
+    return persist_advisory_copilot_run(
+        repository=repository,
+        evidence_packet=_packet(),
+        audience="ADVISOR",
+        requested_outputs=("advisor_review_summary",),
+        requested_by=requested_by,
+        reason={"purpose": "advisor review"},
+        draft_status=draft.status,
+        output_sections=draft.sections,
+        lineage=draft.lineage,
+        review_guidance=draft.review_guidance,
+        guardrail_reasons=draft.guardrail_reasons,
+        correlation_id=f"corr-{requested_by}",
+    ).run
+
+
+def test_generate_advisory_copilot_replays_grounded_draft_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "http://lotus-ai.dev.lotus"
+    client = _SequencedClient([_grounded_completion("packrun_copilot_cached")])
+    monkeypatch.setenv("LOTUS_AI_BASE_URL", base_url)
+    monkeypatch.setattr(
+        "src.integrations.lotus_ai.advisory_copilot.httpx.Client",
+        lambda *args, **kwargs: client,
+    )
+    repository = InMemoryAdvisoryCopilotRepository()
+    draft_cache = AdvisoryCopilotDraftCache(repository=repository)
+
+    first = generate_advisory_copilot_draft_with_lotus_ai(
+        evidence_packet=_packet(),
+        audience="ADVISOR",
+        requested_outputs=["advisor_review_summary"],
+        requested_by="advisor_001",
+        reason={"purpose": "advisor review"},
+        draft_cache=draft_cache,
+    )
+    source_run = _persist_draft(repository, first, requested_by="advisor_001")
+    replay = generate_advisory_copilot_draft_with_lotus_ai(
+        evidence_packet=_packet(),
+        audience="ADVISOR",
+        requested_outputs=["advisor_review_summary"],
+        requested_by="advisor_002",
+        reason={"purpose": "second advisor review"},
+        draft_cache=draft_cache,
+    )
+    replay_run = _persist_draft(repository, replay, requested_by="advisor_002")
+
+    assert len(client.requests) == 1
+    assert first.lineage["draft_cache_key"].startswith("sha256:")
+    assert replay.status == "REVIEW_REQUIRED"
+    assert replay.sections == first.sections
+    assert replay.review_guidance == ("Review against cited evidence.",)
+    assert "draft_cache_key" not in replay.lineage
+    assert replay.lineage["workflow_run_id"] == "packrun_copilot_cached"
+    assert replay.lineage["draft_cache"]["status"] == "HIT"
+    assert replay.lineage["draft_cache"]["source_run_id"] == source_run.run_id
+    assert replay.lineage["draft_cache"]["source_workflow_run_id"] == "packrun_copilot_cached"
+    assert replay.lineage["draft_cache"]["avoided_token_estimate"] > 0
+    assert replay_run.run_id != source_run.run_id
+    assert replay_run.lotus_ai_workflow_run_id == "packrun_copilot_cached"
+
+
+def test_generate_advisory_copilot_skips_cache_for_rejected_or_different_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "http://lotus-ai.dev.lotus"
+    client = _SequencedClient(
+        [
+            _grounded_completion("packrun_copilot_source"),
+            _grounded_completion("packrun_copilot_other_audience"),
+            _grounded_completion("packrun_copilot_after_reject"),
+        ]
+    )
+    monkeypatch.setenv("LOTUS_AI_BASE_URL", base_url)
+    monkeypatch.setattr(
+        "src.integrations.lotus_ai.advisory_copilot.httpx.Client",
+        lambda *args, **kwargs: client,
+    )
+    repository = InMemoryAdvisoryCopilotRepository()
+    draft_cache = AdvisoryCopilotDraftCache(repository=repository)
+    request = {
+        "evidence_packet": _packet(),
+        "requested_outputs": ["advisor_review_summary"],
+        "requested_by": "advisor_001",
+        "reason": {"purpose": "advisor review"},
+        "draft_cache": draft_cache,
+    }
+
+    source = generate_advisory_copilot_draft_with_lotus_ai(audience="ADVISOR", **request)
+    source_run = _persist_draft(repository, source, requested_by="advisor_001")
+    other_audience = generate_advisory_copilot_draft_with_lotus_ai(
+        audience="COMPLIANCE_REVIEWER", **request
+    )
+    repository.update_run(source_run.model_copy(update={"review_posture": "REJECTED"}))
+    after_reject = generate_advisory_copilot_draft_with_lotus_ai(audience="ADVISOR", **request)
+
+    assert len(client.requests) == 3
+    assert other_audience.lineage["draft_cache_key"] != source.lineage["draft_cache_key"]
+    assert "draft_cache" not in after_reject.lineage
+    assert after_reject.lineage["workflow_run_id"] == "packrun_copilot_after_reject"
+
+
+def test_generate_advisory_copilot_publishes_grounded_sections_to_listener(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "http://lotus-ai.dev.lotus"
+    client = _SequencedClient([_grounded_completion("packrun_copilot_streamed")])
+    monkeypatch.setenv("LOTUS_AI_BASE_URL", base_url)
+    monkeypatch.setattr(
+        "src.integrations.lotus_ai.advisory_copilot.httpx.Client",
+        lambda *args, **kwargs: client,
+    )
+    repository = InMemoryAdvisoryCopilotRepository()
+    draft_cache = AdvisoryCopilotDraftCache(repository=repository)
+    published: list[dict[str, object]] = []
+    request = {
+        "evidence_packet": _packet(),
+        "audience": "ADVISOR",
+        "requested_outputs": ["advisor_review_summary"],
+        "requested_by": "advisor_001",
+        "reason": {"purpose": "advisor review"},
+        "draft_cache": draft_cache,
+        "on_section": published.append,
+    }
+
+    fresh = generate_advisory_copilot_draft_with_lotus_ai(**request)
+    _persist_draft(repository, fresh, requested_by="advisor_001")
+    replay = generate_advisory_copilot_draft_with_lotus_ai(**request)
+
+    assert list(fresh.sections) == published[:1]
+    assert published[0]["grounding_status"] == "GROUNDED"
+    assert published[0]["claim_grounding"][0]["claim_id"] == "policy_posture_claim_001"
+    assert list(replay.sections) == published[1:]
+    assert len(client.requests) == 1
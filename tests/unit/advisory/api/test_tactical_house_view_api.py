@@ -1,8 +1,17 @@
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+
+import httpx
 from fastapi.testclient import TestClient
 
 from src.api.main import app
 from src.core.tactical_house_view import (
+    InMemoryTacticalHouseViewCohortRepository,
+    TacticalHouseViewAffectedCohort,
     clear_tactical_house_view_affected_cohorts_for_tests,
+    configure_tactical_house_view_cohort_repository,
     list_tactical_house_view_affected_cohorts,
 )
 
@@ -103,3 +112,165 @@ def test_tactical_house_view_openapi_documents_route_and_boundaries() -> None:
         schemas["TacticalHouseViewAffectedCohort"]["properties"]["product_name"]["default"]
         == "TacticalHouseViewAffectedCohort"
     )
+
+
+def _stream_lines(payload: dict, *, candidate_count: int) -> list[str]:
+    header = {key: value for key, value in payload.items() if key != "candidate_portfolios"}
+    template = payload["candidate_portfolios"][0]
+    candidates = []
+    for index in range(candidate_count):
+        candidate = json.loads(json.dumps(template))
+        candidate["portfolio_id"] = f"PB_SG_DPM_{index:04d}"
+        if index % 3 == 0:
+            candidate["alignment_signal"] = "ALIGNED"
+        candidates.append(candidate)
+    return [json.dumps(header), *(json.dumps(candidate) for candidate in candidates)]
+
+
+def _chunked(lines: list[str]) -> Iterator[bytes]:
+    body = ("\n".join(lines) + "\n").encode("utf-8")
+    for start in range(0, len(body), 97):
+        yield body[start : start + 97]
+
+
+def test_tactical_house_view_stream_matches_json_route_and_pages_stored_cohort() -> None:
+    payload = _payload()
+    lines = _stream_lines(payload, candidate_count=25)
+    json_payload = {
+        **json.loads(lines[0]),
+        "candidate_portfolios": [json.loads(line) for line in lines[1:]],
+    }
+
+    with TestClient(app) as client:
+        streamed = client.post(
+            "/advisory/tactical-house-view/cohorts/evaluate-stream",
+            content=_chunked(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        evaluated = client.post(
+            "/advisory/tactical-house-view/cohorts/evaluate",
+            json=json_payload,
+        ).json()
+        cohort_id = streamed.json()["cohort_id"]
+        affected_ids: list[str] = []
+        cursor = None
+        while True:
+            params: dict[str, str | int] = {"limit": 7}
+            if cursor is not None:
+                params["cursor"] = cursor
+            page = client.get(
+                f"/advisory/tactical-house-view/cohorts/{cohort_id}/affected-portfolios",
+                params=params,
+            ).json()
+            affected_ids.extend(item["portfolio_id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        excluded = client.get(
+            f"/advisory/tactical-house-view/cohorts/{cohort_id}/excluded-portfolios"
+        ).json()
+
+    assert streamed.status_code == 200
+    summary = streamed.json()
+    assert "affected_portfolios" not in summary
+    assert summary["cohort_id"] == evaluated["cohort_id"]
+    assert summary["supportability"] == evaluated["supportability"]
+    assert summary["supportability"]["evaluated_candidate_count"] == 25
+    assert affected_ids == [item["portfolio_id"] for item in evaluated["affected_portfolios"]]
+    assert page["total_count"] == 16
+    assert excluded["total_count"] == 9
+    assert excluded["next_cursor"] is None
+    assert excluded["items"] == evaluated["excluded_portfolios"]
+
+
+def test_tactical_house_view_stream_reports_failing_line() -> None:
+    lines = _stream_lines(_payload(), candidate_count=3)
+    lines[2] = json.dumps({**json.loads(lines[2]), "source_refs": []})
+
+    with TestClient(app) as client:
+        invalid_candidate = client.post(
+            "/advisory/tactical-house-view/cohorts/evaluate-stream",
+            content="\n".join(lines).encode("utf-8"),
+        )
+        header_only = client.post(
+            "/advisory/tactical-house-view/cohorts/evaluate-stream",
+            content=lines[0].encode("utf-8"),
+        )
+        empty = client.post("/advisory/tactical-house-view/cohorts/evaluate-stream", content=b"")
+
+    assert invalid_candidate.status_code == 422
+    assert invalid_candidate.json()["detail"][0]["loc"][:3] == ["body", "line", 3]
+    assert header_only.status_code == 422
+    assert "at least one candidate" in header_only.json()["detail"][0]["msg"]
+    assert empty.status_code == 422
+    assert "header line" in empty.json()["detail"][0]["msg"]
+
+
+def test_tactical_house_view_cohort_pages_reject_unknown_cohort_and_foreign_cursor() -> None:
+    lines = _stream_lines(_payload(), candidate_count=4)
+    with TestClient(app) as client:
+        cohort_id = client.post(
+            "/advisory/tactical-house-view/cohorts/evaluate-stream",
+            content="\n".join(lines).encode("utf-8"),
+        ).json()["cohort_id"]
+        affected_cursor = client.get(
+            f"/advisory/tactical-house-view/cohorts/{cohort_id}/affected-portfolios",
+            params={"limit": 1},
+        ).json()["next_cursor"]
+        foreign_cursor = client.get(
+            f"/advisory/tactical-house-view/cohorts/{cohort_id}/excluded-portfolios",
+            params={"cursor": affected_cursor},
+        )
+        missing = client.get(
+            "/advisory/tactical-house-view/cohorts/sha256:missing/affected-portfolios"
+        )
+
+    assert affected_cursor is not None
+    assert foreign_cursor.status_code == 422
+    assert foreign_cursor.json()["detail"] == "TACTICAL_HOUSE_VIEW_COHORT_CURSOR_INVALID"
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "TACTICAL_HOUSE_VIEW_COHORT_NOT_FOUND"
+
+
+class _SlowSaveCohortRepository(InMemoryTacticalHouseViewCohortRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.save_started = threading.Event()
+        self.release_save = threading.Event()
+
+    def save_cohort(self, cohort: TacticalHouseViewAffectedCohort) -> None:
+        self.save_started.set()
+        assert self.release_save.wait(timeout=10)
+        super().save_cohort(cohort)
+
+
+def test_tactical_house_view_stream_saves_cohort_off_the_event_loop() -> None:
+    repository = _SlowSaveCohortRepository()
+    configure_tactical_house_view_cohort_repository(repository)
+    body = ("\n".join(_stream_lines(_payload(), candidate_count=5)) + "\n").encode("utf-8")
+
+    async def _scenario() -> tuple[httpx.Response, httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            upload = asyncio.create_task(
+                client.post(
+                    "/advisory/tactical-house-view/cohorts/evaluate-stream",
+                    content=body,
+                    headers={"Content-Type": "application/x-ndjson"},
+                )
+            )
+            try:
+                assert await asyncio.to_thread(repository.save_started.wait, 5)
+                health = await asyncio.wait_for(client.get("/health/live"), timeout=5)
+            finally:
+                repository.release_save.set()
+            return health, await upload
+
+    try:
+        health, streamed = asyncio.run(_scenario())
+    finally:
+        clear_tactical_house_view_affected_cohorts_for_tests()
+
+    assert health.status_code == 200
+    assert streamed.status_code == 200
+    assert repository.get_cohort(cohort_id=streamed.json()["cohort_id"]) is not None
@@ -1,10 +1,17 @@
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from src.core.policy_packs.persistence_models import PolicyEvaluationRecord
+from src.core.policy_packs.record_query import (
+    encode_policy_evaluation_record_cursor,
+    normalize_policy_evaluation_record_query,
+)
 from src.core.proposals.exceptions import ProposalIdempotencyConflictError
 from src.infrastructure.policy_packs.postgres_state import (
+    POLICY_EVALUATION_JURISDICTION_SQL,
     PostgresPolicyEvaluationStateStore,
     PostgresPolicyPackCatalogStateStore,
 )
@@ -23,6 +30,25 @@ class _Cursor:
         return self._rows
 
 
+class _BatchCursor:
+    def __init__(self, connection: "_Connection") -> None:
+        self._connection = connection
+        self.rowcount = 0
+
+    def __enter__(self) -> "_BatchCursor":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def executemany(self, query, params_seq) -> None:
+        sql = " ".join(str(query).split())
+        params = list(params_seq)
+        self._connection.batches.append((sql, params))
+        conflict = self._connection.conflict_statement
+        self.rowcount = len(params) - (1 if conflict and conflict in sql else 0)
+
+
 class _Connection:
     def __init__(
         self,
@@ -35,6 +61,7 @@ class _Connection:
         self.conflict_statement = conflict_statement
         self.rows_by_statement = rows_by_statement or {}
         self.executed: list[tuple[str, tuple | None]] = []
+        self.batches: list[tuple[str, list[tuple]]] = []
         self.commits = 0
         self.rollbacks = 0
         self.closed = False
@@ -50,6 +77,9 @@ class _Connection:
                 return _Cursor(rows=rows, rowcount=rowcount)
         return _Cursor(rowcount=rowcount)
 
+    def cursor(self) -> _BatchCursor:
+        return _BatchCursor(self)
+
     def commit(self) -> None:
         self.commits += 1
 
@@ -184,6 +214,225 @@ def test_policy_evaluation_postgres_snapshot_rolls_back_on_idempotency_conflict(
     assert connection.closed is True
 
 
+def test_policy_evaluation_postgres_events_load_one_batch_for_requested_ids() -> None:
+    event = _policy_evaluation_snapshot()["events"]["pev_txn_001"][0]
+    later_event = {
+        **event,
+        "event_id": "peev_000002",
+        "event_type": "POLICY_EVALUATION_REVIEW_RECORDED",
+    }
+    connection = _Connection(
+        rows_by_statement={
+            "FROM policy_evaluation_audit_events": [
+                {"evaluation_id": "pev_txn_001", "event_json": _json_text(event)},
+                {"evaluation_id": "pev_txn_001", "event_json": _json_text(later_event)},
+            ]
+        }
+    )
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    events = store.load_events(evaluation_ids=["pev_txn_001", "pev_txn_002"])
+
+    ((sql, args),) = connection.executed
+    assert "WHERE evaluation_id = ANY(%s)" in sql
+    assert "FROM policy_evaluation_records" not in sql
+    assert args == (["pev_txn_001", "pev_txn_002"],)
+    assert [item.event_id for item in events["pev_txn_001"]] == ["peev_000001", "peev_000002"]
+    assert events["pev_txn_002"] == []
+    assert connection.closed is True
+    assert store.load_events(evaluation_ids=[]) == {}
+    assert len(connection.executed) == 1
+
+
+def test_policy_evaluation_postgres_finalize_snapshot_loads_only_the_batch_rows() -> None:
+    snapshot = _policy_evaluation_snapshot()
+    connection = _Connection(
+        rows_by_statement={
+            "FROM policy_evaluation_idempotency": snapshot["idempotency"],
+            "FROM policy_evaluation_records": [
+                {
+                    "evaluation_id": "pev_txn_001",
+                    "record_json": _json_text(snapshot["records"]["pev_txn_001"]),
+                }
+            ],
+            "FROM policy_evaluation_audit_events": [
+                {
+                    "evaluation_id": "pev_txn_001",
+                    "event_json": _json_text(snapshot["events"]["pev_txn_001"][0]),
+                }
+            ],
+        }
+    )
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    loaded = store.load_finalize_snapshot(idempotency_keys=["idem_txn_001", "idem_txn_new"])
+
+    (idempotency_sql, idempotency_args), (record_sql, record_args), (event_sql, event_args) = (
+        connection.executed
+    )
+    assert "WHERE idempotency_key = ANY(%s)" in idempotency_sql
+    assert idempotency_args == (["idem_txn_001", "idem_txn_new"],)
+    assert "WHERE evaluation_id = ANY(%s)" in record_sql
+    assert "WHERE evaluation_id = ANY(%s)" in event_sql
+    assert record_args == event_args == (["pev_txn_001"],)
+    assert loaded == {**snapshot, "identity_index": []}
+    assert connection.closed is True
+
+
+def test_policy_evaluation_postgres_finalize_snapshot_skips_records_without_known_keys() -> None:
+    connection = _Connection()
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    loaded = store.load_finalize_snapshot(idempotency_keys=["idem_txn_new"])
+
+    assert len(connection.executed) == 1
+    assert loaded["records"] == {} and loaded["events"] == {} and loaded["idempotency"] == []
+
+
+def test_policy_evaluation_postgres_finalized_rows_write_only_the_batch() -> None:
+    snapshot = _policy_evaluation_snapshot()
+    untouched = {**snapshot["records"]["pev_txn_001"], "evaluation_id": "pev_txn_other"}
+    snapshot["records"]["pev_txn_other"] = untouched
+    snapshot["events"]["pev_txn_other"] = []
+    snapshot["idempotency"].append(
+        {
+            "idempotency_key": "idem_txn_other",
+            "request_hash": "sha256:other",
+            "evaluation_id": "pev_txn_other",
+            "event_id": "peev_000001",
+        }
+    )
+    connection = _Connection()
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    store.save_finalized_rows(
+        snapshot, evaluation_ids=["pev_txn_001"], idempotency_keys=["idem_txn_001"]
+    )
+
+    assert connection.executed == []
+    (record_sql, record_rows), (event_sql, event_rows), (idem_sql, idem_rows) = connection.batches
+    assert "INSERT INTO policy_evaluation_records" in record_sql
+    assert [row[0] for row in record_rows] == ["pev_txn_001"]
+    assert record_rows[0][-1] == 1
+    assert "INSERT INTO policy_evaluation_audit_events" in event_sql
+    assert [(row[0], row[1]) for row in event_rows] == [("pev_txn_001", "peev_000001")]
+    assert "INSERT INTO policy_evaluation_idempotency" in idem_sql
+    assert idem_rows == [
+        (
+            "idem_txn_001",
+            "sha256:request",
+            "pev_txn_001",
+            "peev_000001",
+            "2026-05-26T00:00:00+00:00",
+        )
+    ]
+    assert connection.commits == 1
+    assert connection.rollbacks == 0
+    assert connection.closed is True
+
+
+def test_policy_evaluation_postgres_finalized_rows_roll_back_on_conflict() -> None:
+    connection = _Connection(conflict_statement="INSERT INTO policy_evaluation_idempotency")
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    with pytest.raises(
+        ProposalIdempotencyConflictError,
+        match="POLICY_EVALUATION_IDEMPOTENCY_KEY_CONFLICT",
+    ):
+        store.save_finalized_rows(
+            _policy_evaluation_snapshot(),
+            evaluation_ids=["pev_txn_001"],
+            idempotency_keys=["idem_txn_001"],
+        )
+
+    assert connection.commits == 0
+    assert connection.rollbacks == 1
+    assert connection.closed is True
+
+
+def test_policy_evaluation_postgres_record_page_filters_pages_and_counts_in_sql() -> None:
+    record = _policy_evaluation_snapshot()["records"]["pev_txn_001"]
+    later_record = {**record, "evaluation_id": "pev_txn_002"}
+    connection = _Connection(
+        rows_by_statement={
+            "SELECT record_json FROM policy_evaluation_records": [
+                {"record_json": _json_text(record)},
+                {"record_json": _json_text(later_record)},
+            ],
+            "GROUP BY evaluation_status": [
+                {"evaluation_status": "READY", "record_count": 4},
+                {"evaluation_status": "PENDING_REVIEW", "record_count": 7},
+            ],
+        }
+    )
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    page = store.load_record_page(
+        query=normalize_policy_evaluation_record_query(
+            evaluation_status="PENDING_REVIEW",
+            portfolio_id="PB_SG_GLOBAL_BAL_001",
+            jurisdiction="sg",
+            generated_before=datetime(2026, 6, 1, tzinfo=UTC),
+            limit=1,
+            cursor=encode_policy_evaluation_record_cursor(
+                PolicyEvaluationRecord.model_validate(record)
+            ),
+        )
+    )
+
+    (page_sql, page_args), (count_sql, count_args) = connection.executed
+    assert "(generated_at, evaluation_id) > (%s, %s)" in page_sql
+    assert "ORDER BY generated_at ASC, evaluation_id ASC LIMIT %s" in page_sql
+    assert " ".join(POLICY_EVALUATION_JURISDICTION_SQL.split()) in page_sql
+    assert page_args == (
+        "PB_SG_GLOBAL_BAL_001",
+        "SG",
+        "2026-06-01T00:00:00+00:00",
+        "PENDING_REVIEW",
+        "2026-05-26T00:00:00+00:00",
+        "pev_txn_001",
+        2,
+    )
+    assert "evaluation_status = %s" not in count_sql
+    assert count_args == ("PB_SG_GLOBAL_BAL_001", "SG", "2026-06-01T00:00:00+00:00")
+    assert [item.evaluation_id for item in page.items] == ["pev_txn_001"]
+    assert page.next_cursor is not None
+    assert page.total_count == 7
+    assert page.status_counts == {"PENDING_REVIEW": 7, "READY": 4}
+    assert connection.closed is True
+
+
+def test_policy_evaluation_postgres_record_page_filters_by_policy_pack() -> None:
+    connection = _Connection()
+    store = PostgresPolicyEvaluationStateStore(connect=lambda: connection)
+
+    store.load_record_page(
+        query=normalize_policy_evaluation_record_query(
+            policy_pack_id="GLOBAL_PRIVATE_BANKING_BASELINE",
+            limit=100,
+        )
+    )
+
+    (page_sql, page_args), (count_sql, count_args) = connection.executed
+    assert "WHERE policy_pack_id = %s ORDER BY generated_at ASC" in page_sql
+    assert page_args == ("GLOBAL_PRIVATE_BANKING_BASELINE", 101)
+    assert count_args == ("GLOBAL_PRIVATE_BANKING_BASELINE",)
+
+
+def test_policy_evaluation_jurisdiction_filter_matches_review_queue_index() -> None:
+    migration = (
+        REPO_ROOT
+        / "src"
+        / "infrastructure"
+        / "postgres_migrations"
+        / "policy_packs"
+        / "0005_policy_evaluation_review_queue_keyset_indexes.sql"
+    ).read_text(encoding="utf-8")
+    expression = POLICY_EVALUATION_JURISDICTION_SQL.removeprefix("(").removesuffix(")")
+
+    assert " ".join(expression.split()) in " ".join(migration.split())
+
+
 def test_policy_pack_catalog_postgres_snapshot_loads_durable_rows() -> None:
     connection = _Connection(
         rows_by_statement={
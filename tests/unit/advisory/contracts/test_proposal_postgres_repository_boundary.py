@@ -7,6 +7,9 @@ POSTGRES_HELPERS = {
     "postgres_async_operations.py",
     "postgres_cockpit_acknowledgements.py",
     "postgres_idempotency.py",
+    "postgres_event_journal.py",
+    "postgres_history_import.py",
+    "postgres_memo_evidence_packs.py",
     "postgres_memos.py",
     "postgres_records.py",
     "postgres_versions.py",
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from src.core.advisory_copilot import (
+    CopilotEvidencePacket,
+    CopilotEvidencePacketSection,
+    CopilotSourceRef,
+)
+from src.core.advisory_copilot.draft_cache import (
+    AdvisoryCopilotDraftCache,
+    advisory_copilot_draft_cache_hit_lineage,
+    advisory_copilot_draft_cache_outcome,
+    build_advisory_copilot_draft_cache_key,
+)
+from src.core.advisory_copilot.run_persistence import persist_advisory_copilot_run
+from src.core.advisory_copilot.run_records import AdvisoryCopilotRunRecord
+from src.infrastructure.advisory_copilot import InMemoryAdvisoryCopilotRepository
+
+_NOW = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+_CACHE_KEY = "sha256:draft-cache-001"
+
+
+def _packet() -> CopilotEvidencePacket:
+    return CopilotEvidencePacket(
+        evidence_packet_id="copilot_packet_pb_sg_001",
+        evidence_packet_hash="sha256:copilot-evidence-packet-001",
+        action_family="PROPOSAL_EXPLANATION",
+        portfolio_id="PB_SG_GLOBAL_BAL_001",
+        proposal_id="proposal_sg_structured_note_001",
+        sections=(
+            CopilotEvidencePacketSection(
+                section_key="POLICY_POSTURE",
+                title="Policy posture",
+                evidence_class="COMPLIANCE_REVIEW_EVIDENCE",
+                source_refs=(
+                    CopilotSourceRef(
+                        source_system="lotus-advise",
+                        source_type="POLICY_EVALUATION",
+                        source_id="policy_eval_sg_001",
+                        content_hash="sha256:policy-evaluation",
+                        access_class="COMPLIANCE_REVIEW_EVIDENCE",
+                    ),
+                ),
+                summary_items=("Policy evaluation requires compliance review.",),
+            ),
+        ),
+        retention_class="ADVISORY_REVIEW_RECORD",
+    )
+
+
+def _lineage(**overrides: Any) -> dict[str, Any]:
+    lineage: dict[str, Any] = {
+        "workflow_pack_id": "advisory_copilot_proposal_explanation.pack",
+        "workflow_pack_version": "v1",
+        "workflow_run_id": "packrun_copilot_001",
+        "model_version": "lotus-ai-governed-model.v1",
+        "claim_grounding_summary": {"ready_for_review": True},
+        "runtime_budget_telemetry": {
+            "latency_ms": 1800,
+            "input_token_estimate": 900,
+            "output_token_estimate": 240,
+        },
+        "draft_cache_key": _CACHE_KEY,
+    }
+    lineage.update(overrides)
+    return lineage
+
+
+def _persist(
+    repository: InMemoryAdvisoryCopilotRepository,
+    *,
+    requested_by: str = "advisor_001",
+    lineage: dict[str, Any] | None = None,
+    created_at: datetime = _NOW,
+) -> AdvisoryCopilotRunRecord:
+    return persist_advisory_copilot_run(
+        repository=repository,
+        evidence_packet=_packet(),
+        audience="ADVISOR",
+        requested_outputs=("advisor_review_summary",),
+        requested_by=requested_by,
+        reason={"business_reason": "Prepare advisor review."},
+        draft_status="REVIEW_REQUIRED",
+        output_sections=(
+            {
+                "section_key": "POLICY_POSTURE",
+                "title": "Policy posture",
+                "text": "Policy evaluation requires compliance review.",
+            },
+        ),
+        lineage=lineage if lineage is not None else _lineage(),
+        review_guidance=("Review source evidence before internal use.",),
+        guardrail_reasons=(),
+        correlation_id=f"corr-{requested_by}",
+        created_at=created_at,
+    ).run
+
+
+def _cache_key(**overrides: Any) -> str:
+    arguments: dict[str, Any] = {
+        "evidence_packet_hash": "sha256:copilot-evidence-packet-001",
+        "action_family": "PROPOSAL_EXPLANATION",
+        "audience": "ADVISOR",
+        "requested_outputs": ("advisor_review_summary",),
+        "workflow_pack_id": "advisory_copilot_proposal_explanation.pack",
+        "workflow_pack_version": "v1",
+        "approved_instruction_set": "advisory-copilot-instructions.v1",
+        "prompt_template_version": "advisory-copilot-prompt-template.v1",
+        "output_schema_version": "advisory-copilot-output-schema.v1",
+        "evaluation_pack_ref": "advisory-copilot-eval-pack.v1",
+        "model_provider_id": "lotus-ai",
+        "model_version": "lotus-ai-governed-model.v1",
+        "model_approval_reference": "MODEL-RISK-APPROVAL-ADVISORY-COPILOT-V1",
+    }
+    arguments.update(overrides)
+    return build_advisory_copilot_draft_cache_key(**arguments)
+
+
+def test_draft_cache_key_changes_with_evidence_and_model_version() -> None:
+    assert _cache_key() == _cache_key()
+    assert _cache_key().startswith("sha256:")
+    assert _cache_key(evidence_packet_hash="sha256:copilot-evidence-packet-002") != _cache_key()
+    assert _cache_key(model_version="lotus-ai-governed-model.v2") != _cache_key()
+    assert _cache_key(workflow_pack_version="v2") != _cache_key()
+
+
+def test_draft_cache_returns_latest_reusable_run_within_ttl() -> None:
+    repository = InMemoryAdvisoryCopilotRepository()
+    _persist(repository, requested_by="advisor_001", created_at=_NOW - timedelta(hours=3))
+    latest = _persist(repository, requested_by="advisor_002", created_at=_NOW - timedelta(hours=1))
+    cache = AdvisoryCopilotDraftCache(repository=repository, now=lambda: _NOW)
+
+    hit = cache.lookup(draft_cache_key=_CACHE_KEY)
+
+    assert hit is not None
+    assert hit.run_id == latest.run_id
+    assert cache.lookup(draft_cache_key="sha256:other-draft") is None
+    expired_window = AdvisoryCopilotDraftCache(
+        repository=repository,
+        ttl=timedelta(minutes=30),
+        now=lambda: _NOW,
+    )
+    assert expired_window.lookup(draft_cache_key=_CACHE_KEY) is None
+
+
+def test_draft_cache_respects_review_state_and_retention() -> None:
+    repository = InMemoryAdvisoryCopilotRepository()
+    run = _persist(repository)
+    cache = AdvisoryCopilotDraftCache(
+        repository=repository,
+        ttl=timedelta(days=365 * 8),
+        now=lambda: _NOW,
+    )
+
+    repository.update_run(run.model_copy(update={"review_posture": "SUPERSEDED"}))
+    assert cache.lookup(draft_cache_key=_CACHE_KEY) is None
+
+    repository.update_run(run.model_copy(update={"review_posture": "APPROVED_FOR_INTERNAL_USE"}))
+    assert cache.lookup(draft_cache_key=_CACHE_KEY) is not None
+
+    repository.update_run(run.model_copy(update={"retention_expires_at": _NOW}))
+    assert cache.lookup(draft_cache_key=_CACHE_KEY) is None
+
+
+def test_draft_cache_ignores_ungrounded_runs() -> None:
+    repository = InMemoryAdvisoryCopilotRepository()
+    _persist(repository, lineage=_lineage(claim_grounding_summary={"ready_for_review": False}))
+    cache = AdvisoryCopilotDraftCache(repository=repository, now=lambda: _NOW)
+
+    assert cache.lookup(draft_cache_key=_CACHE_KEY) is None
+
+
+def test_draft_cache_hit_lineage_reports_source_run_and_avoided_cost() -> None:
+    repository = InMemoryAdvisoryCopilotRepository()
+    run = _persist(repository)
+
+    hit = advisory_copilot_draft_cache_hit_lineage(run)
+
+    assert hit == {
+        "contract_version": "advisory-copilot-draft-cache.v1",
+        "status": "HIT",
+        "source_run_id": run.run_id,
+        "source_workflow_run_id": "packrun_copilot_001",
+        "source_created_at": _NOW.isoformat(),
+        "source_review_posture": "REVIEW_REQUIRED",
+        "avoided_token_estimate": 1140,
+        "avoided_latency_ms": 1800,
+    }
+    assert advisory_copilot_draft_cache_outcome({"draft_cache": hit}) == "hit"
+    assert advisory_copilot_draft_cache_outcome({"draft_cache_key": _CACHE_KEY}) == "stored"
+    assert advisory_copilot_draft_cache_outcome({}) == "bypass"
+
+
+def test_draft_cache_rejects_non_positive_ttl() -> None:
+    with pytest.raises(ValueError, match="COPILOT_DRAFT_CACHE_TTL_INVALID"):
+        AdvisoryCopilotDraftCache(
+            repository=InMemoryAdvisoryCopilotRepository(),
+            ttl=timedelta(0),
+        )
@@ -649,6 +649,18 @@ class _FakePostgresConnection:
             run_id = str(args[-1])
             self.runs[run_id] = dict(zip(_RUN_COLUMNS, (run_id, *args[:-1]), strict=True))
             return self
+        if sql.startswith("SELECT * FROM advisory_copilot_runs WHERE (lineage_json::jsonb"):
+            draft_cache_key, review_postures, created_after = args
+            rows = [
+                row
+                for row in self.runs.values()
+                if _json_value(row["lineage_json"]).get("draft_cache_key") == draft_cache_key
+                and row["review_posture"] in review_postures
+                and row["created_at"] >= created_after
+            ]
+            rows.sort(key=lambda row: (row["created_at"], row["run_id"]), reverse=True)
+            self._one = rows[0] if rows else None
+            return self
         if sql.startswith("SELECT * FROM advisory_copilot_runs WHERE proposal_id"):
             self._all = self._list_runs(sql=sql, args=args)
             return self
@@ -1855,6 +1867,45 @@ def test_postgres_repository_rejects_idempotency_conflicts_and_orphans() -> None
         )
 
 
+def test_postgres_repository_finds_latest_reusable_run_by_draft_cache_key() -> None:
+    connection = _FakePostgresConnection()
+    repository = _postgres_repository(connection)
+    lineage = {
+        "workflow_pack_id": "advisory_copilot_proposal_explanation.pack",
+        "workflow_pack_version": "v1",
+        "draft_cache_key": "sha256:draft-cache-001",
+    }
+    first = _persist_run(
+        repository,
+        lineage=lineage,
+        idempotency_key="copilot-cache-idem-001",
+        created_at=datetime(2026, 5, 28, 9, 0, tzinfo=timezone.utc),
+    ).run
+    second = _persist_run(
+        repository,
+        lineage=lineage,
+        idempotency_key="copilot-cache-idem-002",
+        user_instruction="Summarize the advisory evidence again.",
+        created_at=datetime(2026, 5, 28, 10, 0, tzinfo=timezone.utc),
+    ).run
+
+    found = repository.find_reusable_run(
+        draft_cache_key="sha256:draft-cache-001",
+        review_postures=("REVIEW_REQUIRED",),
+        created_after=datetime(2026, 5, 28, 8, 0, tzinfo=timezone.utc),
+    )
+    stale = repository.find_reusable_run(
+        draft_cache_key="sha256:draft-cache-001",
+        review_postures=("REVIEW_REQUIRED",),
+        created_after=datetime(2026, 5, 28, 11, 0, tzinfo=timezone.utc),
+    )
+
+    assert first.run_id != second.run_id
+    assert found is not None
+    assert found.run_id == second.run_id
+    assert stale is None
+
+
 def test_postgres_repository_refreshes_source_projection_packet_only_when_safe() -> None:
     connection = _FakePostgresConnection()
     repository = _postgres_repository(connection)
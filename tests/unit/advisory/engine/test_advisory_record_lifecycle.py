@@ -38,6 +38,8 @@ def test_advisory_record_retention_policies_cover_required_record_families() ->
         "ADVISORY_COPILOT_EVIDENCE_PACKET",
         "ADVISORY_COPILOT_RUN",
         "ADVISORY_COPILOT_REVIEW",
+        "ADVISORY_WORKSPACE_EVENT",
+        "IDEMPOTENCY_REPLAY",
     }
     assert all(
         policy.jurisdiction_period_source == "approved-bank-policy-required"
@@ -0,0 +1,131 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+from decimal import Decimal
+
+import pytest
+
+import src.core.common.cpu_offload as cpu_offload
+from src.core.advisory_engine import run_proposal_simulation
+from src.core.common.canonical import hash_canonical_payload
+from src.core.common.cpu_offload import (
+    advisory_cpu_offload_workers,
+    configure_cpu_offload_observer,
+    run_cpu_bound,
+    shutdown_cpu_offload_pool,
+)
+from src.core.models import EngineOptions
+from tests.shared.factories import (
+    cash,
+    market_data_snapshot,
+    portfolio_snapshot,
+    position,
+    price,
+    shelf_entry,
+)
+
+
+@pytest.fixture
+def observed_tasks():
+    tasks: list[dict] = []
+    configure_cpu_offload_observer(lambda **task: tasks.append(task))
+    yield tasks
+    configure_cpu_offload_observer(None)
+    shutdown_cpu_offload_pool()
+
+
+def _simulation_kwargs() -> dict:
+    return {
+        "portfolio": portfolio_snapshot(
+            portfolio_id="pf_offload_1",
+            base_currency="USD",
+            positions=[position("EQ_A", "7"), position("EQ_B", "2")],
+            cash_balances=[cash("USD", "100")],
+        ),
+        "market_data": market_data_snapshot(
+            prices=[price("EQ_A", "100", "USD"), price("EQ_B", "100", "USD")],
+            fx_rates=[],
+        ),
+        "shelf": [
+            shelf_entry("EQ_A", asset_class="EQUITY", issuer_id="ISS_A"),
+            shelf_entry("EQ_B", asset_class="EQUITY", issuer_id="ISS_B"),
+        ],
+        "options": EngineOptions(
+            enable_proposal_simulation=True,
+            single_position_max_weight=Decimal("0.80"),
+        ),
+        "proposed_cash_flows": [],
+        "proposed_trades": [{"side": "BUY", "instrument_id": "EQ_B", "quantity": "1"}],
+        "request_hash": "proposal_hash_offload",
+        "correlation_id": "corr-offload-1",
+    }
+
+
+def test_cpu_offload_runs_inline_by_default(monkeypatch, observed_tasks):
+    monkeypatch.delenv("ADVISORY_CPU_OFFLOAD_WORKERS", raising=False)
+
+    digest = run_cpu_bound("proposal_artifact", hash_canonical_payload, {"a": 1})
+
+    assert digest == hash_canonical_payload({"a": 1})
+    assert [(task["stage"], task["mode"], task["queue_seconds"]) for task in observed_tasks] == [
+        ("proposal_artifact", "inline", 0.0)
+    ]
+
+
+def test_cpu_offload_process_pool_matches_inline_simulation(monkeypatch, observed_tasks):
+    inline = run_proposal_simulation(**_simulation_kwargs())
+    monkeypatch.setenv("ADVISORY_CPU_OFFLOAD_WORKERS", "1")
+
+    offloaded = run_cpu_bound("simulation", run_proposal_simulation, **_simulation_kwargs())
+
+    assert offloaded.model_dump(mode="json") == inline.model_dump(mode="json")
+    assert [(task["stage"], task["mode"]) for task in observed_tasks] == [("simulation", "process")]
+    assert observed_tasks[0]["queue_seconds"] >= 0
+    assert observed_tasks[0]["run_seconds"] > 0
+
+
+def test_cpu_offload_process_pool_propagates_worker_errors(monkeypatch, observed_tasks):
+    monkeypatch.setenv("ADVISORY_CPU_OFFLOAD_WORKERS", "1")
+
+    with pytest.raises(ValueError):
+        run_cpu_bound("memo_evidence_pack", int, "not-a-number")
+
+    assert observed_tasks == []
+
+
+def test_cpu_offload_rebuilds_pool_after_worker_is_killed(monkeypatch, observed_tasks):
+    monkeypatch.setenv("ADVISORY_CPU_OFFLOAD_WORKERS", "1")
+    run_cpu_bound("proposal_artifact", hash_canonical_payload, {"a": 1})
+    broken_pool = cpu_offload._POOL
+    assert broken_pool is not None
+    for process in list(broken_pool._processes.values()):
+        process.kill()
+        process.join()
+
+    digest = run_cpu_bound("proposal_artifact", hash_canonical_payload, {"a": 2})
+
+    assert digest == hash_canonical_payload({"a": 2})
+    assert cpu_offload._POOL is not None
+    assert cpu_offload._POOL is not broken_pool
+    assert [task["mode"] for task in observed_tasks] == ["process", "process"]
+
+
+def test_cpu_offload_raises_when_retry_also_breaks_and_recovers_next_call(
+    monkeypatch, observed_tasks
+):
+    monkeypatch.setenv("ADVISORY_CPU_OFFLOAD_WORKERS", "1")
+
+    with pytest.raises(BrokenProcessPool):
+        run_cpu_bound("simulation", os._exit, 1)
+
+    assert cpu_offload._POOL is None
+    digest = run_cpu_bound("proposal_artifact", hash_canonical_payload, {"a": 1})
+    assert digest == hash_canonical_payload({"a": 1})
+    assert [task["mode"] for task in observed_tasks] == ["process"]
+
+
+@pytest.mark.parametrize("raw_value", ["-1", "many"])
+def test_cpu_offload_workers_rejects_invalid_configuration(monkeypatch, raw_value):
+    monkeypatch.setenv("ADVISORY_CPU_OFFLOAD_WORKERS", raw_value)
+
+    with pytest.raises(RuntimeError, match="ADVISORY_CPU_OFFLOAD_WORKERS_INVALID"):
+        advisory_cpu_offload_workers()
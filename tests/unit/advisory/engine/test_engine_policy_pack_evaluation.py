@@ -124,7 +124,7 @@ def test_policy_pack_applicability_selection_stays_in_focused_module() -> None:
     evaluation = (SOURCE_ROOT / "evaluation.py").read_text(encoding="utf-8")
     applicability = (SOURCE_ROOT / "evaluation_applicability.py").read_text(encoding="utf-8")
 
-    assert "evaluate_policy_pack_applicability" in evaluation
+    assert "evaluate_compiled_policy_pack_applicability" in evaluation
     assert "def _matches_scope" not in evaluation
     assert "def _client_segment_matches_scope" not in evaluation
     assert "PRIVATE_BANKING_CLIENT_CLASSIFICATIONS" not in evaluation
@@ -142,7 +142,7 @@ def test_policy_pack_material_rule_evaluators_stay_in_focused_module() -> None:
     review_rules = (SOURCE_ROOT / "evaluation_review_rules.py").read_text(encoding="utf-8")
     source_rules = (SOURCE_ROOT / "evaluation_source_rules.py").read_text(encoding="utf-8")
 
-    assert "evaluate_policy_rule" in evaluation
+    assert "evaluate_compiled_policy_rule" in evaluation
     assert "def evaluate_sg_product_eligibility" not in evaluation
     assert "def evaluate_sg_complex_product_disclosure" not in evaluation
     assert "def evaluate_best_interest_cost" not in evaluation
@@ -0,0 +1,133 @@
+from src.core.policy_packs import (
+    configure_policy_pack_catalog_repository,
+    evaluate_policy_pack_version,
+    get_policy_pack_catalog_repository,
+    get_policy_pack_version,
+    reset_policy_pack_catalog_for_tests,
+)
+from src.core.policy_packs.evaluation_applicability import (
+    compile_policy_pack_applicability,
+    evaluate_policy_pack_applicability,
+)
+from src.core.policy_packs.evaluation_plan import (
+    compile_policy_pack_evaluation_plan,
+    policy_pack_evaluation_plan,
+)
+from src.core.policy_packs.evaluation_rules import evaluate_policy_rule
+from src.core.proposals.policy_source_readiness import build_policy_source_readiness
+from tests.unit.advisory.engine.test_engine_policy_pack_evaluation import (
+    _activate_sg_policy_pack,
+    _base_evidence_bundle,
+)
+
+SG_POLICY_PACK_ID = "SG_PRIVATE_BANKING_REFERENCE"
+SG_POLICY_VERSION = "2026.05"
+
+
+def setup_function() -> None:
+    reset_policy_pack_catalog_for_tests()
+
+
+def _sg_detail():
+    return get_policy_pack_version(
+        policy_pack_id=SG_POLICY_PACK_ID, policy_version=SG_POLICY_VERSION
+    )
+
+
+def test_activation_compiles_shared_plan_for_policy_pack_version() -> None:
+    _activate_sg_policy_pack()
+
+    plan = policy_pack_evaluation_plan(_sg_detail())
+
+    assert policy_pack_evaluation_plan(_sg_detail()) is plan
+    assert plan.policy_pack_id == SG_POLICY_PACK_ID
+    assert plan.policy_version == SG_POLICY_VERSION
+    assert plan.content_hash == _sg_detail().policy_pack.content_hash
+    assert [compiled.rule["rule_id"] for compiled in plan.rules] == [
+        rule["rule_id"] for rule in _sg_detail().rules
+    ]
+    assert plan.applicability.jurisdictions == frozenset({"SG"})
+
+
+def test_plan_is_recompiled_when_catalog_content_hash_changes() -> None:
+    _activate_sg_policy_pack()
+    plan = policy_pack_evaluation_plan(_sg_detail())
+    detail = _sg_detail()
+    changed = detail.model_copy(
+        update={
+            "policy_pack": detail.policy_pack.model_copy(update={"content_hash": "sha256:changed"}),
+            "rules": detail.rules[:1],
+        }
+    )
+
+    recompiled = policy_pack_evaluation_plan(changed)
+
+    assert recompiled is not plan
+    assert recompiled.content_hash == "sha256:changed"
+    assert len(recompiled.rules) == 1
+
+
+def test_plan_is_isolated_from_later_detail_mutation() -> None:
+    detail = _sg_detail()
+    plan = compile_policy_pack_evaluation_plan(detail)
+
+    detail.rules[0]["rule_id"] = "MUTATED"
+    detail.applicability["jurisdiction_scope"].append("HK")
+
+    assert plan.rules[0].rule["rule_id"] != "MUTATED"
+    assert "HK" not in plan.applicability.jurisdictions
+
+
+def test_replacing_catalog_repository_drops_cached_plans() -> None:
+    _activate_sg_policy_pack()
+    plan = policy_pack_evaluation_plan(_sg_detail())
+
+    configure_policy_pack_catalog_repository(get_policy_pack_catalog_repository())
+
+    assert policy_pack_evaluation_plan(_sg_detail()) is not plan
+
+
+def test_compiled_evaluation_matches_per_rule_dispatch() -> None:
+    _activate_sg_policy_pack()
+    evidence_bundle = _base_evidence_bundle()
+    evidence_bundle["conflict_evidence"] = {"material_conflict": True}
+    detail = _sg_detail()
+
+    result = evaluate_policy_pack_version(
+        evidence_bundle=evidence_bundle,
+        policy_pack_id=SG_POLICY_PACK_ID,
+        policy_version=SG_POLICY_VERSION,
+    )
+
+    applicability = evaluate_policy_pack_applicability(
+        evidence_bundle=evidence_bundle, applicability=detail.applicability
+    )
+    source_posture = build_policy_source_readiness(evidence_bundle)
+    expected = [
+        evaluate_policy_rule(
+            rule=rule,
+            evidence_bundle=evidence_bundle,
+            source_posture=source_posture,
+            jurisdiction=applicability.matched_selectors["jurisdiction"],
+            client_segment=applicability.matched_selectors["client_segment"],
+        )
+        for rule in detail.rules
+    ]
+    assert result.applicability == applicability
+    assert result.rule_results == expected
+
+
+def test_compiled_applicability_normalizes_selector_scopes_once() -> None:
+    scope = compile_policy_pack_applicability(
+        {
+            "jurisdiction_scope": ["SG"],
+            "booking_center_code_scope": ["GLOBAL"],
+            "client_segment_scope": ["PRIVATE_BANKING"],
+            "product_scope": [],
+        }
+    )
+
+    assert scope.jurisdictions == frozenset({"SG"})
+    assert scope.booking_location_codes == frozenset({"GLOBAL"})
+    assert scope.legal_entity_codes == frozenset()
+    assert scope.required_scope_keys == frozenset({"jurisdiction_scope", "client_segment_scope"})
@@ -20,6 +20,7 @@ from src.core.policy_packs import (
     get_policy_evaluation_record,
     get_policy_pack_version,
     list_policy_evaluation_events,
+    list_policy_evaluation_record_page,
     list_policy_evaluation_records,
     replay_policy_evaluation_record,
     reset_policy_evaluation_store_for_tests,
@@ -1443,7 +1444,7 @@ def test_policy_evaluation_persists_disclosure_consent_and_approval_dependencies
     assert "client_consent:SG_STRUCTURED_NOTE" in persisted.record.consent_requirements
 
 
-def test_policy_evaluation_record_listing_filters_orders_and_returns_copies() -> None:
+def _finalize_listing_records() -> tuple[Any, Any, Any]:
     first = finalize_policy_evaluation_record(
         evidence_bundle=_base_evidence_bundle(),
         policy_pack_id="GLOBAL_PRIVATE_BANKING_BASELINE",
@@ -1486,6 +1487,11 @@ def test_policy_evaluation_record_listing_filters_orders_and_returns_copies() ->
         reason=_trusted_reason("record listing pending"),
     )
 
+    return first, second, pending
+
+
+def test_policy_evaluation_record_listing_filters_orders_and_returns_copies() -> None:
+    first, second, pending = _finalize_listing_records()
     all_records = list_policy_evaluation_records()
     filtered_records = list_policy_evaluation_records(
         evaluation_status="PENDING_REVIEW",
@@ -1509,3 +1515,69 @@ def test_policy_evaluation_record_listing_filters_orders_and_returns_copies() ->
         pending.record.evaluation_id,
     ]
     assert reloaded_first.portfolio_id == "PB_SG_GLOBAL_BAL_001"
+
+
+def test_policy_evaluation_record_page_walks_keyset_cursor_with_status_counts() -> None:
+    first, second, pending = _finalize_listing_records()
+
+    first_page = list_policy_evaluation_record_page(
+        evaluation_status="PENDING_REVIEW", jurisdiction="sg", limit=2
+    )
+    second_page = list_policy_evaluation_record_page(
+        evaluation_status="PENDING_REVIEW",
+        jurisdiction="sg",
+        limit=2,
+        cursor=first_page.next_cursor,
+    )
+    portfolio_page = list_policy_evaluation_record_page(
+        evaluation_status="READY", portfolio_id="PB_SG_GLOBAL_BAL_001"
+    )
+
+    assert [record.evaluation_id for record in first_page.items] == [
+        first.record.evaluation_id,
+        second.record.evaluation_id,
+    ]
+    assert [record.evaluation_id for record in second_page.items] == [pending.record.evaluation_id]
+    assert first_page.next_cursor is not None
+    assert second_page.next_cursor is None
+    assert first_page.total_count == second_page.total_count == 3
+    assert first_page.status_counts == {"PENDING_REVIEW": 3}
+    assert portfolio_page.items == []
+    assert portfolio_page.total_count == 0
+    assert portfolio_page.status_counts == {"PENDING_REVIEW": 2}
+    assert list_policy_evaluation_record_page(jurisdiction="HK").status_counts == {}
+
+
+def test_policy_evaluation_record_page_filters_by_generation_window() -> None:
+    first, _second, pending = _finalize_listing_records()
+    first_generated_at = datetime.fromisoformat(first.record.generated_at)
+    pending_generated_at = datetime.fromisoformat(pending.record.generated_at)
+
+    older = list_policy_evaluation_record_page(generated_before=pending_generated_at)
+    newer = list_policy_evaluation_record_page(generated_after=pending_generated_at)
+    naive_upper = list_policy_evaluation_record_page(
+        generated_before=first_generated_at.astimezone(UTC).replace(tzinfo=None)
+    )
+
+    assert pending.record.evaluation_id not in [record.evaluation_id for record in older.items]
+    assert [record.evaluation_id for record in newer.items] == [pending.record.evaluation_id]
+    assert naive_upper.items == []
+    with pytest.raises(ProposalValidationError, match="POLICY_EVALUATION_GENERATED_WINDOW_INVALID"):
+        list_policy_evaluation_record_page(
+            generated_after=pending_generated_at, generated_before=first_generated_at
+        )
+
+
+@pytest.mark.parametrize(
+    ("limit", "cursor", "error"),
+    [
+        (0, None, "POLICY_EVALUATION_PAGE_SIZE_INVALID"),
+        (None, "not-a-cursor", "POLICY_EVALUATION_CURSOR_INVALID"),
+        (None, "W10", "POLICY_EVALUATION_CURSOR_INVALID"),
+    ],
+)
+def test_policy_evaluation_record_page_rejects_invalid_page_requests(
+    limit: int | None, cursor: str | None, error: str
+) -> None:
+    with pytest.raises(ProposalValidationError, match=error):
+        list_policy_evaluation_record_page(limit=limit, cursor=cursor)
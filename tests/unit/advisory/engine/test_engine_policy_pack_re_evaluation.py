@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+import pytest
+
+from src.core.policy_packs import (
+    DurablePolicyEvaluationRepository,
+    InMemoryPolicyEvaluationStateStore,
+    PolicyEvaluationFinalizeItem,
+    PolicyPackCatalogStore,
+    PolicyReEvaluationCheckpoint,
+    PolicyReEvaluationPrincipal,
+    PolicyReEvaluationSettings,
+    activate_policy_pack_version,
+    configure_policy_evaluation_repository,
+    configure_policy_pack_catalog_repository,
+    finalize_policy_evaluation_record,
+    get_policy_pack_version,
+    list_policy_evaluation_records,
+    reset_policy_evaluation_store_for_tests,
+    reset_policy_pack_catalog_for_tests,
+    run_policy_re_evaluation,
+    validate_policy_pack_version,
+)
+from src.core.policy_packs.evaluation_applicability import policy_pack_selectors_may_apply
+from src.core.proposals.exceptions import ProposalValidationError
+from tests.unit.advisory.engine.test_engine_policy_pack_persistence import (
+    _base_evidence_bundle,
+    _trusted_reason,
+    _two_version_global_policy_pack_definitions,
+)
+
+_PACK_ID = "GLOBAL_PRIVATE_BANKING_BASELINE"
+_PRINCIPAL = PolicyReEvaluationPrincipal(
+    tenant_id="tenant_sg_001",
+    legal_entity_code="REFERENCE",
+    service_identity="lotus-advise",
+    correlation_id="corr-policy-re-evaluation-test",
+)
+
+
+class _CountingStateStore(InMemoryPolicyEvaluationStateStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.saves = 0
+
+    def save_snapshot(self, snapshot: dict[str, Any]) -> None:
+        self.saves += 1
+        super().save_snapshot(snapshot)
+
+
+def setup_function() -> None:
+    reset_policy_pack_catalog_for_tests()
+    reset_policy_evaluation_store_for_tests()
+
+
+def _configure_superseded_records(
+    proposal_ids: list[str],
+    *,
+    new_applicability: dict[str, Any] | None = None,
+) -> tuple[_CountingStateStore, dict[str, dict[str, Any]]]:
+    definitions = _two_version_global_policy_pack_definitions()
+    if new_applicability is not None:
+        definitions[1]["applicability"] = new_applicability
+    configure_policy_pack_catalog_repository(PolicyPackCatalogStore(definitions))
+    state_store = _CountingStateStore()
+    configure_policy_evaluation_repository(
+        DurablePolicyEvaluationRepository(state_store=state_store)
+    )
+    evidence_by_proposal: dict[str, dict[str, Any]] = {}
+    for proposal_id in proposal_ids:
+        evidence = _base_evidence_bundle()
+        evidence_by_proposal[proposal_id] = evidence
+        finalize_policy_evaluation_record(
+            evidence_bundle=deepcopy(evidence),
+            policy_pack_id=_PACK_ID,
+            policy_version="2026.05",
+            proposal_id=proposal_id,
+            proposal_version_id=f"{proposal_id}_v1",
+            created_by="advisor_1",
+            idempotency_key=f"policy-eval-{proposal_id}",
+            reason=_trusted_reason("superseded record"),
+        )
+    new_detail = get_policy_pack_version(policy_pack_id=_PACK_ID, policy_version="2026.06")
+    validate_policy_pack_version(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        requested_by="policy_steward_1",
+        idempotency_key="validate-global-2026-06-re-evaluation",
+        reason={"purpose": "activate superseding policy"},
+    )
+    activate_policy_pack_version(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        activated_by="policy_checker_1",
+        source_content_hash=new_detail.policy_pack.content_hash,
+        idempotency_key="activate-global-2026-06-re-evaluation",
+        reason={"purpose": "activate superseding policy"},
+    )
+    state_store.saves = 0
+    return state_store, evidence_by_proposal
+
+
+def _evidence_loader(
+    evidence_by_proposal: dict[str, dict[str, Any]], calls: list[str] | None = None
+) -> Any:
+    def load(proposal_id: str, proposal_version_id: str) -> dict[str, Any] | None:
+        if calls is not None:
+            calls.append(proposal_version_id)
+        evidence = evidence_by_proposal.get(proposal_id)
+        return deepcopy(evidence) if evidence is not None else None
+
+    return load
+
+
+def test_policy_re_evaluation_resumes_from_checkpoint_and_writes_one_save_per_chunk() -> None:
+    state_store, evidence = _configure_superseded_records(["pp_re_1", "pp_re_2", "pp_re_3"])
+    del evidence["pp_re_3"]
+    checkpoints: list[PolicyReEvaluationCheckpoint] = []
+
+    first = run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=_PRINCIPAL,
+        load_evidence=_evidence_loader(evidence),
+        settings=PolicyReEvaluationSettings(chunk_size=2, max_workers=2, max_chunks=1),
+        on_checkpoint=checkpoints.append,
+    )
+    resumed = run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=_PRINCIPAL,
+        load_evidence=_evidence_loader(evidence),
+        settings=PolicyReEvaluationSettings(chunk_size=2, max_workers=0),
+        checkpoint=PolicyReEvaluationCheckpoint.from_dict(checkpoints[-1].to_dict()),
+        on_checkpoint=checkpoints.append,
+    )
+
+    assert first.outcome_counts == {"created": 2}
+    assert first.checkpoint.completed is False
+    assert resumed.checkpoint.completed is True
+    assert resumed.outcome_counts == {"current": 2, "missing_evidence": 1}
+    assert resumed.checkpoint.outcome_counts == {"created": 2, "current": 2, "missing_evidence": 1}
+    assert resumed.checkpoint.chunks == len(checkpoints) == 3
+    assert state_store.saves == 1
+    records = list_policy_evaluation_records(evaluation_status=None, portfolio_id=None)
+    re_evaluated = [record for record in records if record.policy_version == "2026.06"]
+    assert sorted(record.proposal_id for record in re_evaluated) == ["pp_re_1", "pp_re_2"]
+    assert {record.created_by for record in re_evaluated} == {"system:policy-re-evaluation"}
+
+
+def test_policy_re_evaluation_rerun_replays_without_writing() -> None:
+    state_store, evidence = _configure_superseded_records(["pp_re_replay"])
+    run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=_PRINCIPAL,
+        load_evidence=_evidence_loader(evidence),
+    )
+    saves_after_first_run = state_store.saves
+
+    rerun = run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=PolicyReEvaluationPrincipal(
+            tenant_id="tenant_sg_001",
+            legal_entity_code="REFERENCE",
+            service_identity="lotus-advise",
+            correlation_id="corr-policy-re-evaluation-rerun",
+        ),
+        load_evidence=_evidence_loader(evidence),
+    )
+
+    assert rerun.outcome_counts == {"current": 1, "replayed": 1}
+    assert state_store.saves == saves_after_first_run == 1
+    assert rerun.scanned == 2
+    assert rerun.worker_count == 4
+
+
+def test_policy_re_evaluation_skips_out_of_scope_records_before_loading_evidence() -> None:
+    new_applicability = {
+        "jurisdiction_scope": ["CH"],
+        "booking_center_code_scope": ["GLOBAL"],
+        "legal_entity_scope": ["REFERENCE"],
+        "client_segment_scope": ["PRIVATE_BANKING"],
+        "product_scope": ["MULTI_ASSET"],
+    }
+    _, evidence = _configure_superseded_records(
+        ["pp_re_scope"], new_applicability=new_applicability
+    )
+    calls: list[str] = []
+
+    skipped = run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=_PRINCIPAL,
+        load_evidence=_evidence_loader(evidence, calls),
+    )
+    other_entity = run_policy_re_evaluation(
+        policy_pack_id=_PACK_ID,
+        policy_version="2026.06",
+        principal=PolicyReEvaluationPrincipal(
+            tenant_id="tenant_sg_001",
+            legal_entity_code="OTHER_ENTITY",
+            service_identity="lotus-advise",
+            correlation_id="corr-policy-re-evaluation-other",
+        ),
+        load_evidence=_evidence_loader(evidence, calls),
+    )
+
+    assert skipped.outcome_counts == {"not_applicable": 1}
+    assert other_entity.outcome_counts == {"out_of_scope": 1}
+    assert calls == []
+
+
+def test_policy_re_evaluation_requires_active_version_and_matching_checkpoint() -> None:
+    _, evidence = _configure_superseded_records(["pp_re_guard"])
+
+    with pytest.raises(ProposalValidationError, match="NOT_ACTIVE_FOR_EVALUATION"):
+        run_policy_re_evaluation(
+            policy_pack_id=_PACK_ID,
+            policy_version="2026.05",
+            principal=_PRINCIPAL,
+            load_evidence=_evidence_loader(evidence),
+        )
+    with pytest.raises(ValueError, match="POLICY_RE_EVALUATION_CHECKPOINT_MISMATCH"):
+        run_policy_re_evaluation(
+            policy_pack_id=_PACK_ID,
+            policy_version="2026.06",
+            principal=_PRINCIPAL,
+            load_evidence=_evidence_loader(evidence),
+            checkpoint=PolicyReEvaluationCheckpoint(
+                policy_pack_id=_PACK_ID, policy_version="2026.07"
+            ),
+        )
+    with pytest.raises(ValueError, match="POLICY_RE_EVALUATION_CHECKPOINT_INVALID"):
+        PolicyReEvaluationCheckpoint.from_dict(
+            {"policy_pack_id": _PACK_ID, "policy_version": "2026.06", "cursor": "%%%"}
+        )
+    with pytest.raises(ValueError, match="POLICY_RE_EVALUATION_CHUNK_SIZE_INVALID"):
+        PolicyReEvaluationSettings(chunk_size=0)
+    with pytest.raises(ValueError, match="POLICY_RE_EVALUATION_MAX_WORKERS_INVALID"):
+        PolicyReEvaluationSettings(max_workers=-1)
+
+
+def test_policy_evaluation_batch_finalize_isolates_rejected_items_in_one_save() -> None:
+    configure_policy_pack_catalog_repository(
+        PolicyPackCatalogStore(_two_version_global_policy_pack_definitions())
+    )
+    state_store = _CountingStateStore()
+    repository = DurablePolicyEvaluationRepository(state_store=state_store)
+    missing_portfolio = _base_evidence_bundle()
+    del missing_portfolio["inputs"]["portfolio_snapshot"]["portfolio_id"]
+
+    outcomes = repository.finalize_policy_evaluation_records(
+        items=[
+            PolicyEvaluationFinalizeItem(
+                evidence_bundle=evidence,
+                policy_pack_id=_PACK_ID,
+                policy_version="2026.05",
+                proposal_id=f"pp_batch_{index}",
+                proposal_version_id=f"pp_batch_{index}_v1",
+                created_by="advisor_1",
+                idempotency_key=f"policy-eval-batch-{index}",
+                reason=_trusted_reason("batch finalize"),
+            )
+            for index, evidence in enumerate([_base_evidence_bundle(), missing_portfolio])
+        ]
+    )
+
+    assert outcomes[0].result is not None and outcomes[0].result.created is True
+    assert outcomes[1].result is None
+    assert outcomes[1].error_code == "POLICY_EVALUATION_PORTFOLIO_ID_REQUIRED"
+    assert state_store.saves == 1
+    assert [
+        record.proposal_id
+        for record in repository.list_policy_evaluation_records(
+            evaluation_status=None, portfolio_id=None
+        )
+    ] == ["pp_batch_0"]
+
+
+def test_policy_pack_selectors_may_apply_mirrors_applicability_scope() -> None:
+    applicability = {
+        "jurisdiction_scope": ["SG"],
+        "booking_center_code_scope": ["GLOBAL"],
+        "legal_entity_scope": ["REFERENCE"],
+        "client_segment_scope": ["PRIVATE_BANKING"],
+        "product_scope": ["MULTI_ASSET", "STRUCTURED_PRODUCT"],
+    }
+    selectors = {
+        "jurisdiction": "SG",
+        "booking_center_code": "SG",
+        "legal_entity_code": "REFERENCE",
+        "client_segment": "ACCREDITED_INVESTOR",
+        "product_scope": "EQUITY|MULTI_ASSET",
+    }
+
+    assert policy_pack_selectors_may_apply(matched_selectors=selectors, applicability=applicability)
+    assert policy_pack_selectors_may_apply(matched_selectors={}, applicability=applicability)
+    assert not policy_pack_selectors_may_apply(
+        matched_selectors={**selectors, "jurisdiction": "HK"}, applicability=applicability
+    )
+    assert not policy_pack_selectors_may_apply(
+        matched_selectors={**selectors, "client_segment": "RETAIL"}, applicability=applicability
+    )
+    assert not policy_pack_selectors_may_apply(
+        matched_selectors={**selectors, "product_scope": "EQUITY"}, applicability=applicability
+    )
@@ -0,0 +1,98 @@
+import pytest
+
+from src.core.proposals.bulk_simulation import (
+    BulkSimulationProgress,
+    bulk_simulation_fingerprint,
+    bulk_simulation_item_idempotency_key,
+    decode_bulk_simulation_cursor,
+    encode_bulk_simulation_cursor,
+)
+from src.core.proposals.bulk_simulation_models import ProposalBulkSimulationRequest
+
+
+def _request(cursor: str | None = None) -> ProposalBulkSimulationRequest:
+    return ProposalBulkSimulationRequest.model_validate(
+        {
+            "template": {
+                "market_data_snapshot": {"prices": [], "fx_rates": []},
+                "shelf_entries": [],
+            },
+            "portfolios": [
+                {"portfolio_snapshot": {"portfolio_id": "pf_1", "base_currency": "USD"}},
+                {"stateful_input": {"portfolio_id": "pf_2", "as_of": "2026-03-25"}},
+            ],
+            "cursor": cursor,
+        }
+    )
+
+
+def test_bulk_fingerprint_ignores_cursor_but_binds_idempotency_key() -> None:
+    fingerprint = bulk_simulation_fingerprint(request=_request(), idempotency_key="bulk-1")
+
+    assert fingerprint == bulk_simulation_fingerprint(
+        request=_request(cursor="anything"),
+        idempotency_key="bulk-1",
+    )
+    assert fingerprint != bulk_simulation_fingerprint(request=_request(), idempotency_key="bulk-2")
+
+
+def test_bulk_item_idempotency_keys_are_stable_and_bounded() -> None:
+    key = bulk_simulation_item_idempotency_key(idempotency_key="k" * 128, portfolio_id="pf_1")
+
+    assert key == bulk_simulation_item_idempotency_key(
+        idempotency_key="k" * 128,
+        portfolio_id="pf_1",
+    )
+    assert key.startswith("bulk_")
+    assert len(key) == 45
+    assert key != bulk_simulation_item_idempotency_key(
+        idempotency_key="k" * 128,
+        portfolio_id="pf_2",
+    )
+
+
+def test_bulk_cursor_round_trips_and_rejects_foreign_or_malformed_cursors() -> None:
+    cursor = encode_bulk_simulation_cursor(fingerprint="sha256:a", next_sequence=1)
+
+    assert decode_bulk_simulation_cursor(None, fingerprint="sha256:a", portfolio_count=2) == 0
+    assert decode_bulk_simulation_cursor(cursor, fingerprint="sha256:a", portfolio_count=2) == 1
+    with pytest.raises(ValueError, match="PROPOSAL_BULK_SIMULATION_CURSOR_MISMATCH"):
+        decode_bulk_simulation_cursor(cursor, fingerprint="sha256:b", portfolio_count=2)
+    out_of_range = encode_bulk_simulation_cursor(fingerprint="sha256:a", next_sequence=3)
+    for invalid in ("%%%", "bm90LWpzb24", out_of_range):
+        with pytest.raises(ValueError, match="PROPOSAL_BULK_SIMULATION_CURSOR_INVALID"):
+            decode_bulk_simulation_cursor(invalid, fingerprint="sha256:a", portfolio_count=2)
+
+
+def test_bulk_progress_cursor_only_advances_over_contiguous_completions() -> None:
+    progress = BulkSimulationProgress(fingerprint="sha256:a", start_sequence=1, portfolio_count=5)
+
+    def _next_sequence(cursor: str) -> int:
+        return decode_bulk_simulation_cursor(cursor, fingerprint="sha256:a", portfolio_count=5)
+
+    assert _next_sequence(progress.complete(3, status="READY")) == 1
+    assert _next_sequence(progress.complete(1, status=None)) == 2
+    assert _next_sequence(progress.complete(2, status="BLOCKED")) == 4
+    assert _next_sequence(progress.complete(4, status="READY")) == 5
+
+    summary = progress.summary()
+    assert summary.skipped_count == 1
+    assert summary.status_counts == {"BLOCKED": 1, "READY": 2}
+    assert summary.error_count == 1
+    assert _next_sequence(summary.cursor) == 5
+
+
+def test_bulk_request_requires_shared_market_data_for_stateless_portfolios() -> None:
+    with pytest.raises(ValueError, match="require template market_data_snapshot"):
+        ProposalBulkSimulationRequest.model_validate(
+            {
+                "template": {},
+                "portfolios": [
+                    {"portfolio_snapshot": {"portfolio_id": "pf_1", "base_currency": "USD"}}
+                ],
+            }
+        )
+    with pytest.raises(ValueError, match="exactly one of portfolio_snapshot or stateful_input"):
+        ProposalBulkSimulationRequest.model_validate(
+            {"template": {}, "portfolios": [{}]},
+        )
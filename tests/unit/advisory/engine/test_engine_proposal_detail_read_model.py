@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 
 from src.core.proposals.detail_read_model import load_proposal_detail_read_model
 from src.core.proposals.models import ProposalRecord, ProposalVersionRecord
+from src.core.proposals.projections import version_detail_sections
 from src.infrastructure.proposals.in_memory import InMemoryProposalRepository
 
 
@@ -35,8 +36,8 @@ def _version(*, version_no: int) -> ProposalVersionRecord:
         simulation_hash=f"sha256:sim-detail-{version_no}",
         status_at_creation="READY",
         proposal_result_json={"status": "READY"},
-        artifact_json={},
-        evidence_bundle_json={},
+        artifact_json={"artifact_id": f"pa_detail_{version_no}"},
+        evidence_bundle_json={"hashes": {"artifact_hash": f"sha256:artifact-detail-{version_no}"}},
         gate_decision_json=None,
     )
 
@@ -58,6 +59,23 @@ def test_load_proposal_detail_read_model_returns_proposal_and_current_version():
     assert read_model.current_version.version_no == 2
 
 
+def test_load_proposal_detail_read_model_fetches_only_requested_sections():
+    repository = InMemoryProposalRepository()
+    repository.create_proposal(_proposal(current_version_no=1))
+    repository.create_version(_version(version_no=1))
+
+    read_model = load_proposal_detail_read_model(
+        repository=repository,
+        proposal_id="pp_detail",
+        sections=version_detail_sections(include_evidence=False),
+    )
+
+    assert read_model.current_version is not None
+    assert read_model.current_version.artifact_json == {"artifact_id": "pa_detail_1"}
+    assert read_model.current_version.proposal_result_json == {"status": "READY"}
+    assert read_model.current_version.evidence_bundle_json == {}
+
+
 def test_load_proposal_detail_read_model_preserves_missing_proposal_boundary():
     read_model = load_proposal_detail_read_model(
         repository=InMemoryProposalRepository(),
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.core.advisory_copilot.records import AdvisoryCopilotRunRecord
+from src.core.policy_packs.persistence_models import PolicyEvaluationRecord
+from src.core.policy_packs.persistence_store import PolicyEvaluationRecordStore
+from src.core.proposals.exceptions import ProposalValidationError
+from src.core.replay.evidence_export import (
+    EVIDENCE_EXPORT_GENESIS_HASH,
+    iter_evidence_export_entries,
+    normalize_evidence_export_scope,
+    render_evidence_export_ndjson,
+    render_evidence_export_tar,
+    report_evidence_export_head,
+    verify_evidence_export_ndjson,
+)
+from src.infrastructure.proposals.in_memory import InMemoryProposalRepository
+from tests.unit.advisory.engine.test_engine_proposal_repository_postgres import (
+    _memo_create_records,
+    _proposal_create_records,
+)
+
+EXPORTED_AT = datetime(2026, 6, 1, 8, 0, tzinfo=UTC)
+
+
+def _seed_proposal(repository: InMemoryProposalRepository, *, suffix: str, portfolio_id: str):
+    proposal, version, event, idempotency = _proposal_create_records()
+    proposal_id = f"pp_export_{suffix}"
+    proposal = proposal.model_copy(
+        update={"proposal_id": proposal_id, "portfolio_id": portfolio_id}
+    )
+    version = version.model_copy(
+        update={"proposal_id": proposal_id, "proposal_version_id": f"ppv_export_{suffix}"}
+    )
+    event = event.model_copy(update={"proposal_id": proposal_id, "event_id": f"pwe_{suffix}"})
+    idempotency = idempotency.model_copy(
+        update={"proposal_id": proposal_id, "idempotency_key": f"idem_export_{suffix}"}
+    )
+    repository.create_proposal_with_version_event_idempotency(
+        proposal=proposal, version=version, event=event, idempotency=idempotency
+    )
+    return proposal
+
+
+def _seed_memo(repository: InMemoryProposalRepository, *, proposal_id: str) -> None:
+    memo, idempotency, event = _memo_create_records()
+    repository.create_memo_with_idempotency_event(
+        memo=memo.model_copy(update={"proposal_id": proposal_id}),
+        idempotency=idempotency,
+        event=event,
+    )
+
+
+def _policy_store(*portfolio_ids: str) -> PolicyEvaluationRecordStore:
+    records = {
+        f"pev_{index}": PolicyEvaluationRecord(
+            evaluation_id=f"pev_{index}",
+            proposal_id="pp_export_a",
+            proposal_version_id="ppv_export_a",
+            portfolio_id=portfolio_id,
+            policy_pack_id="SG_PRIVATE_BANKING_REFERENCE",
+            policy_version="2026.05",
+            generated_at=(EXPORTED_AT - timedelta(days=index + 1)).isoformat(),
+            created_by="advisor_123",
+            evaluation_status="PENDING_REVIEW",
+            policy_content_hash="sha256:policy-content",
+            source_evidence_hash="sha256:source-evidence",
+            evaluation_hash="sha256:policy-evaluation",
+            evaluation_json={"evaluation_status": "PENDING_REVIEW"},
+            approval_dependencies=["COMPLIANCE_REVIEW"],
+        ).model_dump(mode="json")
+        for index, portfolio_id in enumerate(portfolio_ids)
+    }
+    return PolicyEvaluationRecordStore.from_snapshot(
+        {"records": records, "events": {evaluation_id: [] for evaluation_id in records}}
+    )
+
+
+class _PagedCopilotRuns:
+    def __init__(self, run_ids_by_proposal: dict[str, list[str]]):
+        self._run_ids = run_ids_by_proposal
+        self.calls: list[tuple[str, str | None]] = []
+
+    def list_runs_for_proposal_version(
+        self, *, proposal_id, proposal_version_id, proposal_version_no, limit, cursor
+    ):
+        self.calls.append((proposal_id, cursor))
+        run_ids = self._run_ids.get(proposal_id, [])
+        start = int(cursor or 0)
+        page = run_ids[start : start + limit]
+        next_cursor = str(start + limit) if start + limit < len(run_ids) else None
+        return (
+            [
+                AdvisoryCopilotRunRecord.model_construct(run_id=run_id, proposal_id=proposal_id)
+                for run_id in page
+            ],
+            next_cursor,
+        )
+
+
+def _ndjson(entries) -> bytes:
+    return b"".join(render_evidence_export_ndjson(entries))
+
+
+def test_portfolio_export_is_hash_chained_and_verifiable() -> None:
+    repository = InMemoryProposalRepository()
+    proposal = _seed_proposal(repository, suffix="a", portfolio_id="pf_export")
+    _seed_proposal(repository, suffix="other", portfolio_id="pf_other")
+    _seed_memo(repository, proposal_id=proposal.proposal_id)
+    copilot = _PagedCopilotRuns({proposal.proposal_id: ["run_1", "run_2", "run_3"]})
+    scope = normalize_evidence_export_scope(
+        portfolio_id="pf_export", created_from=None, created_to=None, page_size=2
+    )
+
+    entries = list(
+        iter_evidence_export_entries(
+            scope=scope,
+            proposals=repository,
+            exported_at=EXPORTED_AT,
+            policy_evaluations=_policy_store("pf_export", "pf_other"),
+            copilot_runs=copilot,
+        )
+    )
+
+    assert [entry.record_type for entry in entries] == [
+        "export_header",
+        "proposal",
+        "proposal_version",
+        "workflow_event",
+        "memo",
+        "memo_event",
+        "copilot_run",
+        "copilot_run",
+        "copilot_run",
+        "policy_evaluation",
+        "export_trailer",
+    ]
+    assert entries[0].previous_hash == EVIDENCE_EXPORT_GENESIS_HASH
+    assert all(
+        entry.previous_hash == previous.entry_hash for previous, entry in zip(entries, entries[1:])
+    )
+    assert entries[1].payload["proposal_id"] == "pp_export_a"
+    assert entries[0].payload["scope"]["portfolio_id"] == "pf_export"
+    assert entries[-1].payload["entry_count"] == 10
+    assert entries[-1].payload["record_counts"]["copilot_run"] == 3
+    assert copilot.calls == [("pp_export_a", None), ("pp_export_a", "2")]
+
+    verification = verify_evidence_export_ndjson(_ndjson(entries).splitlines())
+    assert verification.valid is True
+    assert verification.entry_count == 11
+    assert verification.head_hash == entries[-1].entry_hash
+
+
+def test_verification_reports_tampered_and_truncated_exports() -> None:
+    repository = InMemoryProposalRepository()
+    _seed_proposal(repository, suffix="a", portfolio_id="pf_export")
+    scope = normalize_evidence_export_scope(
+        portfolio_id="pf_export", created_from=None, created_to=None
+    )
+    lines = _ndjson(
+        iter_evidence_export_entries(scope=scope, proposals=repository, exported_at=EXPORTED_AT)
+    ).splitlines()
+
+    tampered = json.loads(lines[1])
+    tampered["payload"]["title"] = "Edited after export"
+    broken = verify_evidence_export_ndjson([lines[0], json.dumps(tampered), *lines[2:]])
+    truncated = verify_evidence_export_ndjson(lines[:-1])
+    reordered = verify_evidence_export_ndjson([lines[0], lines[2], lines[1], *lines[3:]])
+
+    assert broken.broken_at_sequence == 1
+    assert broken.valid is False
+    assert truncated.complete is False
+    assert truncated.broken_at_sequence is None
+    assert reordered.broken_at_sequence == 1
+
+
+def test_head_report_matches_verified_head_and_precedes_the_trailer() -> None:
+    repository = InMemoryProposalRepository()
+    _seed_proposal(repository, suffix="a", portfolio_id="pf_export")
+    scope = normalize_evidence_export_scope(
+        portfolio_id="pf_export", created_from=None, created_to=None
+    )
+    reported = []
+    entries = report_evidence_export_head(
+        iter_evidence_export_entries(
+            scope=scope, proposals=repository, exported_at=EXPORTED_AT, export_id="evx_test"
+        ),
+        on_complete=reported.append,
+    )
+
+    delivered = []
+    for entry in entries:
+        if entry.record_type == "export_trailer":
+            assert len(reported) == 1
+        delivered.append(entry)
+
+    verification = verify_evidence_export_ndjson(_ndjson(delivered).splitlines())
+    assert delivered[0].payload["export_id"] == "evx_test"
+    assert reported[0].head_hash == verification.head_hash
+    assert reported[0].entry_count == verification.entry_count
+    assert reported[0].valid is True
+
+
+def test_date_window_export_walks_every_page_across_portfolios() -> None:
+    repository = InMemoryProposalRepository()
+    for index in range(5):
+        _seed_proposal(repository, suffix=str(index), portfolio_id=f"pf_{index % 2}")
+    now = datetime.now(UTC)
+    scope = normalize_evidence_export_scope(
+        portfolio_id=None,
+        created_from=now - timedelta(hours=1),
+        created_to=now + timedelta(hours=1),
+        page_size=2,
+    )
+
+    entries = list(
+        iter_evidence_export_entries(scope=scope, proposals=repository, exported_at=EXPORTED_AT)
+    )
+
+    exported = {
+        entry.payload["proposal_id"] for entry in entries if entry.record_type == "proposal"
+    }
+    assert exported == {f"pp_export_{index}" for index in range(5)}
+    assert entries[0].payload["sections"] == {"copilot_runs": False, "policy_evaluations": False}
+
+
+class _BatchedPolicyEvents(PolicyEvaluationRecordStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.event_batches: list[list[str]] = []
+
+    def list_policy_evaluation_events(self, *, evaluation_id):
+        raise AssertionError("policy events must be read once per page, not per record")
+
+    def list_policy_evaluation_events_by_evaluation(self, *, evaluation_ids):
+        self.event_batches.append(list(evaluation_ids))
+        return {evaluation_id: [] for evaluation_id in evaluation_ids}
+
+
+def test_policy_evaluation_events_are_read_once_per_record_page() -> None:
+    policy_evaluations = _BatchedPolicyEvents.from_snapshot(
+        _policy_store(*["pf_export"] * 5).snapshot()
+    )
+    scope = normalize_evidence_export_scope(
+        portfolio_id="pf_export", created_from=None, created_to=None, page_size=2
+    )
+
+    entries = list(
+        iter_evidence_export_entries(
+            scope=scope,
+            proposals=InMemoryProposalRepository(),
+            exported_at=EXPORTED_AT,
+            policy_evaluations=policy_evaluations,
+        )
+    )
+
+    assert [len(batch) for batch in policy_evaluations.event_batches] == [2, 2, 1]
+    assert [entry.record_type for entry in entries].count("policy_evaluation") == 5
+
+
+def test_tar_export_holds_one_member_per_entry() -> None:
+    repository = InMemoryProposalRepository()
+    _seed_proposal(repository, suffix="a", portfolio_id="pf_export")
+    scope = normalize_evidence_export_scope(
+        portfolio_id="pf_export", created_from=None, created_to=None
+    )
+    entries = list(
+        iter_evidence_export_entries(scope=scope, proposals=repository, exported_at=EXPORTED_AT)
+    )
+
+    archive_bytes = b"".join(render_evidence_export_tar(entries, exported_at=EXPORTED_AT))
+
+    with tarfile.open(fileobj=io.BytesIO(archive_bytes), mode="r:") as archive:
+        members = archive.getmembers()
+        contents = [archive.extractfile(member).read() for member in members]
+    assert [member.name for member in members] == [
+        "evidence/00000000-export_header.json",
+        "evidence/00000001-proposal.json",
+        "evidence/00000002-proposal_version.json",
+        "evidence/00000003-workflow_event.json",
+        "evidence/00000004-export_trailer.json",
+    ]
+    assert b"".join(contents) == _ndjson(entries)
+    assert members[0].mtime == int(EXPORTED_AT.timestamp())
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "reason_code"),
+    [
+        ({"portfolio_id": " "}, "EVIDENCE_EXPORT_SCOPE_REQUIRED"),
+        (
+            {"created_from": datetime(2026, 1, 1, tzinfo=UTC)},
+            "EVIDENCE_EXPORT_SCOPE_REQUIRED",
+        ),
+        (
+            {
+                "created_from": datetime(2026, 2, 1, tzinfo=UTC),
+                "created_to": datetime(2026, 1, 1, tzinfo=UTC),
+            },
+            "EVIDENCE_EXPORT_DATE_RANGE_INVALID",
+        ),
+        ({"portfolio_id": "pf_1", "page_size": 0}, "EVIDENCE_EXPORT_PAGE_SIZE_INVALID"),
+    ],
+)
+def test_export_scope_validation(kwargs, reason_code) -> None:
+    arguments = {"portfolio_id": None, "created_from": None, "created_to": None, **kwargs}
+
+    with pytest.raises(ProposalValidationError, match=reason_code):
+        normalize_evidence_export_scope(**arguments)
@@ -1,7 +1,11 @@
 from datetime import datetime, timezone
 
 from src.core.proposals.lineage_read_model import load_proposal_lineage_read_model
-from src.core.proposals.models import ProposalRecord, ProposalVersionRecord
+from src.core.proposals.models import (
+    ProposalRecord,
+    ProposalVersionHeaderRecord,
+    ProposalVersionRecord,
+)
 from src.infrastructure.proposals.in_memory import InMemoryProposalRepository
 
 
@@ -57,6 +61,7 @@ def test_load_proposal_lineage_read_model_returns_proposal_and_versions_by_numbe
     assert sorted(read_model.versions_by_number) == [1, 2]
     assert read_model.versions_by_number[2] is not None
     assert read_model.versions_by_number[2].proposal_version_id == "ppv_lineage_read_2"
+    assert type(read_model.versions_by_number[2]) is ProposalVersionHeaderRecord
 
 
 def test_load_proposal_lineage_read_model_preserves_missing_proposal_boundary():
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.proposals import memo_materialization
+from src.core.proposals.memo_materialization import (
+    configure_memo_materialization_observer,
+    load_materialized_memo_evidence_pack,
+    materialize_memo_evidence_pack,
+    memo_materialization_workers,
+    reset_memo_materialization_for_tests,
+    schedule_memo_evidence_pack_materialization,
+    shutdown_memo_evidence_pack_materializer,
+)
+from src.core.proposals.memo_persistence import (
+    build_memo_persistence_request_hash,
+    create_or_replay_proposal_memo,
+)
+from src.infrastructure.proposals.in_memory import InMemoryProposalRepository
+from tests.unit.advisory.engine.test_engine_proposal_memo_persistence import _now, _version
+
+
+@pytest.fixture(autouse=True)
+def _reset_materializer(monkeypatch):
+    monkeypatch.delenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", raising=False)
+    observed: list[tuple[str, str]] = []
+    configure_memo_materialization_observer(
+        lambda *, event, outcome: observed.append((event, outcome))
+    )
+    yield observed
+    configure_memo_materialization_observer(None)
+    reset_memo_materialization_for_tests()
+
+
+def _create_memo(repository: InMemoryProposalRepository, *, idempotency_key: str, event_id: str):
+    return create_or_replay_proposal_memo(
+        repository=repository,
+        version=_version(),
+        idempotency_key=idempotency_key,
+        created_by="advisor_1",
+        created_at=_now(),
+        event_id=event_id,
+    )
+
+
+def _fail_build(**_kwargs):
+    raise AssertionError("memo evidence pack should not be rebuilt")
+
+
+def test_materialized_pack_produces_the_on_demand_memo_without_rebuilding(
+    monkeypatch, _reset_materializer
+) -> None:
+    on_demand = _create_memo(
+        InMemoryProposalRepository(), idempotency_key="memo-idem-a", event_id="pme_a"
+    ).memo
+    assert _reset_materializer == []
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    repository = InMemoryProposalRepository()
+    record = materialize_memo_evidence_pack(repository=repository, version=_version())
+    monkeypatch.setattr(
+        memo_materialization, "build_advisory_proposal_memo_evidence_pack", _fail_build
+    )
+
+    materialized = _create_memo(repository, idempotency_key="memo-idem-a", event_id="pme_a").memo
+    replayed = _create_memo(repository, idempotency_key="memo-idem-a", event_id="pme_replay")
+
+    assert record.source_input_hash == on_demand.source_input_hash
+    assert materialized.memo_hash == on_demand.memo_hash
+    assert materialized.memo_json == on_demand.memo_json
+    assert materialized.replay_metadata_json == on_demand.replay_metadata_json
+    assert replayed.replayed is True
+    assert replayed.memo.memo_id == materialized.memo_id
+    assert _reset_materializer == [("lookup", "hit"), ("lookup", "hit")]
+
+
+def test_materialized_evidence_bundle_hash_matches_request_hash() -> None:
+    version = _version()
+    record = materialize_memo_evidence_pack(
+        repository=InMemoryProposalRepository(), version=version
+    )
+
+    assert build_memo_persistence_request_hash(
+        version=version,
+        lifecycle_status="DRAFT",
+        evidence_bundle_hash=record.evidence_bundle_hash,
+    ) == build_memo_persistence_request_hash(version=version, lifecycle_status="DRAFT")
+
+
+def test_mismatched_materialized_pack_falls_back_to_on_demand_build(
+    monkeypatch, _reset_materializer
+) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    repository = InMemoryProposalRepository()
+    version = _version()
+    version.artifact_hash = "sha256:other-artifact"
+    materialize_memo_evidence_pack(repository=repository, version=version)
+
+    assert load_materialized_memo_evidence_pack(repository=repository, version=_version()) is None
+    memo = _create_memo(repository, idempotency_key="memo-idem-b", event_id="pme_b").memo
+
+    assert memo.replay_metadata_json["proposal_artifact_hash"] == "sha256:proposal-artifact"
+    assert _reset_materializer == [("lookup", "stale"), ("lookup", "stale")]
+
+
+def test_pack_from_another_builder_version_is_stale(monkeypatch, _reset_materializer) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    repository = InMemoryProposalRepository()
+    record = materialize_memo_evidence_pack(repository=repository, version=_version())
+
+    assert load_materialized_memo_evidence_pack(repository=repository, version=_version()) == (
+        record
+    )
+    monkeypatch.setattr(
+        memo_materialization,
+        "MEMO_EVIDENCE_PACK_BUILDER_VERSION",
+        "advisory-proposal-memo-evidence-pack.v1+builder.next",
+    )
+
+    assert load_materialized_memo_evidence_pack(repository=repository, version=_version()) is None
+    assert _reset_materializer == [("lookup", "hit"), ("lookup", "stale")]
+
+
+def test_lookup_is_skipped_while_materialization_is_disabled(monkeypatch, _reset_materializer):
+    repository = InMemoryProposalRepository()
+    materialize_memo_evidence_pack(repository=repository, version=_version())
+
+    def _fail_lookup(**_kwargs):
+        raise AssertionError("materialized pack lookup should be skipped")
+
+    monkeypatch.setattr(repository, "get_memo_evidence_pack", _fail_lookup)
+
+    assert load_materialized_memo_evidence_pack(repository=repository, version=_version()) is None
+    assert _create_memo(repository, idempotency_key="memo-idem-c", event_id="pme_c").memo
+    assert _reset_materializer == []
+
+
+def test_first_materialized_pack_wins_for_a_proposal_version() -> None:
+    repository = InMemoryProposalRepository()
+    first = materialize_memo_evidence_pack(repository=repository, version=_version())
+    materialize_memo_evidence_pack(
+        repository=repository, version=_version(), materialized_at=_now()
+    )
+
+    stored = repository.get_memo_evidence_pack(
+        proposal_id=first.proposal_id, proposal_version_no=first.proposal_version_no
+    )
+
+    assert stored is not None
+    assert stored.materialized_at == first.materialized_at
+
+
+def test_schedule_is_disabled_by_default() -> None:
+    repository = InMemoryProposalRepository()
+
+    assert memo_materialization_workers() == 0
+    assert not schedule_memo_evidence_pack_materialization(
+        repository=repository, version=_version()
+    )
+    assert (
+        repository.get_memo_evidence_pack(proposal_id="pp_memo_persist_001", proposal_version_no=1)
+        is None
+    )
+
+
+def test_scheduled_materialization_stores_pack_in_background(
+    monkeypatch, _reset_materializer
+) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    repository = InMemoryProposalRepository()
+
+    assert schedule_memo_evidence_pack_materialization(repository=repository, version=_version())
+    shutdown_memo_evidence_pack_materializer()
+
+    stored = repository.get_memo_evidence_pack(
+        proposal_id="pp_memo_persist_001", proposal_version_no=1
+    )
+    assert stored is not None
+    assert stored.pack_json["source_input_hash"] == stored.source_input_hash
+    assert _reset_materializer == [("materialization", "materialized")]
+
+
+def test_scheduled_materialization_skips_when_backlog_is_full(
+    monkeypatch, _reset_materializer
+) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    monkeypatch.setattr(memo_materialization, "MEMO_MATERIALIZATION_PENDING_PER_WORKER", 0)
+
+    assert not schedule_memo_evidence_pack_materialization(
+        repository=InMemoryProposalRepository(), version=_version()
+    )
+    assert _reset_materializer == [("materialization", "skipped_backlog")]
+
+
+def test_failed_background_materialization_is_counted(monkeypatch, _reset_materializer) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", "1")
+    monkeypatch.setattr(
+        memo_materialization, "build_advisory_proposal_memo_evidence_pack", _fail_build
+    )
+
+    assert schedule_memo_evidence_pack_materialization(
+        repository=InMemoryProposalRepository(), version=_version()
+    )
+    shutdown_memo_evidence_pack_materializer()
+
+    assert _reset_materializer == [("materialization", "failed")]
+
+
+@pytest.mark.parametrize("raw_value", ["-1", "two"])
+def test_materialization_workers_reject_invalid_values(monkeypatch, raw_value) -> None:
+    monkeypatch.setenv("PROPOSAL_MEMO_MATERIALIZATION_WORKERS", raw_value)
+
+    with pytest.raises(RuntimeError, match="PROPOSAL_MEMO_MATERIALIZATION_WORKERS_INVALID"):
+        memo_materialization_workers()
@@ -14,6 +14,7 @@ from src.core.proposals.models import (
     ProposalRecord,
     ProposalSimulationIdempotencyRecord,
     ProposalTransitionResult,
+    ProposalVersionHeaderRecord,
     ProposalVersionRecord,
     ProposalWorkflowEventRecord,
 )
@@ -347,6 +348,59 @@ def test_repository_versions_and_transition_transaction_path():
     assert result.event.event_id == "pwe_repo_txn"
 
 
+def test_repository_version_headers_and_sections_omit_unrequested_payloads():
+    repo = InMemoryProposalRepository()
+    for version_no in (2, 1):
+        repo.create_version(
+            ProposalVersionRecord(
+                proposal_version_id=f"ppv_repo_sections_{version_no}",
+                proposal_id="pp_repo_sections",
+                version_no=version_no,
+                created_at=_now(),
+                request_hash=f"sha256:req-{version_no}",
+                artifact_hash=f"sha256:artifact-{version_no}",
+                simulation_hash=f"sha256:sim-{version_no}",
+                status_at_creation="READY",
+                proposal_result_json={"status": "READY"},
+                artifact_json={"artifact_id": f"pa_{version_no}"},
+                evidence_bundle_json={"hashes": {"artifact_hash": f"sha256:artifact-{version_no}"}},
+                gate_decision_json={"gate": "CLIENT_CONSENT_REQUIRED"},
+            )
+        )
+
+    headers = repo.list_version_headers(proposal_id="pp_repo_sections")
+    assert [type(header) for header in headers] == [ProposalVersionHeaderRecord] * 2
+    assert [header.version_no for header in headers] == [1, 2]
+    assert repo.list_version_headers(proposal_id="pp_missing") == []
+
+    artifact_only = repo.get_version_sections(
+        proposal_id="pp_repo_sections", version_no=1, sections=("artifact",)
+    )
+    assert artifact_only is not None
+    assert artifact_only.artifact_json == {"artifact_id": "pa_1"}
+    assert artifact_only.proposal_result_json == {}
+    assert artifact_only.evidence_bundle_json == {}
+    assert artifact_only.gate_decision_json is None
+
+    current = repo.get_current_version_sections(
+        proposal_id="pp_repo_sections", sections=("evidence_bundle", "gate_decision")
+    )
+    assert current is not None
+    assert current.version_no == 2
+    assert current.evidence_bundle_json["hashes"]["artifact_hash"] == "sha256:artifact-2"
+    assert current.gate_decision_json == {"gate": "CLIENT_CONSENT_REQUIRED"}
+    assert current.artifact_json == {}
+
+    current.evidence_bundle_json["hashes"] = {}
+    stored = repo.get_version(proposal_id="pp_repo_sections", version_no=2)
+    assert stored is not None
+    assert stored.evidence_bundle_json["hashes"] == {"artifact_hash": "sha256:artifact-2"}
+    assert (
+        repo.get_version_sections(proposal_id="pp_repo_sections", version_no=3, sections=()) is None
+    )
+    assert repo.get_current_version_sections(proposal_id="pp_missing", sections=()) is None
+
+
 def test_in_memory_repository_transition_rejects_stale_expected_state():
     repo = InMemoryProposalRepository()
     proposal = _proposal("pp_repo_stale_txn", "advisor_txn")
@@ -589,3 +643,80 @@ def test_repository_recoverable_operations_preserve_retry_policy_edges() -> None
         "pop_repo_pending",
         "pop_repo_running_expired",
     ]
+
+
+def _version(proposal_id: str, version_no: int) -> ProposalVersionRecord:
+    return ProposalVersionRecord(
+        proposal_version_id=f"ppv_{proposal_id}_{version_no}",
+        proposal_id=proposal_id,
+        version_no=version_no,
+        created_at=_now(),
+        request_hash=f"sha256:req_{version_no}",
+        artifact_hash="sha256:artifact",
+        simulation_hash="sha256:sim",
+        status_at_creation="READY",
+        proposal_result_json={"lineage": {"request_hash": f"sha256:req_{version_no}"}},
+        artifact_json={"evidence_bundle": {"hashes": {"artifact_hash": "sha256:artifact"}}},
+        evidence_bundle_json={},
+        gate_decision_json=None,
+    )
+
+
+def test_repository_copies_on_write_and_shares_snapshots_on_read() -> None:
+    repo = InMemoryProposalRepository()
+    version = _version("pp_repo_cow", 1)
+    repo.create_version(version)
+    version.artifact_json["evidence_bundle"]["hashes"]["artifact_hash"] = "sha256:caller"
+
+    first = repo.get_version(proposal_id="pp_repo_cow", version_no=1)
+    second = repo.get_version(proposal_id="pp_repo_cow", version_no=1)
+    assert first is not None and second is not None
+    first.status_at_creation = "BLOCKED"
+
+    assert first is not second
+    assert first.artifact_json is second.artifact_json
+    assert second.artifact_json["evidence_bundle"]["hashes"]["artifact_hash"] == "sha256:artifact"
+    assert second.status_at_creation == "READY"
+
+
+def test_repository_indexes_versions_portfolios_and_proposal_batches() -> None:
+    repo = InMemoryProposalRepository()
+    for version_no in (2, 3, 1):
+        repo.create_version(_version("pp_repo_idx", version_no))
+    repo.create_version(_version("pp_repo_other", 7))
+
+    current = repo.get_current_version(proposal_id="pp_repo_idx")
+    sections = repo.get_current_version_sections(proposal_id="pp_repo_idx", sections={"artifact"})
+
+    assert [row.version_no for row in repo.list_versions(proposal_id="pp_repo_idx")] == [1, 2, 3]
+    assert current is not None and current.version_no == 3
+    assert sections is not None and sections.version_no == 3
+    assert sections.proposal_result_json == {}
+
+    moved = _proposal("pp_repo_moved", "advisor_idx")
+    repo.create_proposal(moved)
+    repo.create_proposal(_proposal("pp_repo_stays", "advisor_idx"))
+    moved.portfolio_id = "pf_repo_other"
+    repo.update_proposal(moved)
+
+    page, _ = repo.list_proposals(
+        portfolio_id="pf_repo",
+        state=None,
+        created_by=None,
+        created_from=None,
+        created_to=None,
+        limit=10,
+        cursor=None,
+    )
+    other_page, _ = repo.list_proposals(
+        portfolio_id="pf_repo_other",
+        state=None,
+        created_by=None,
+        created_from=None,
+        created_to=None,
+        limit=10,
+        cursor=None,
+    )
+
+    assert [row.proposal_id for row in page] == ["pp_repo_stays"]
+    assert [row.proposal_id for row in other_page] == ["pp_repo_moved"]
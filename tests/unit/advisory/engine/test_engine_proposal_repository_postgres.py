@@ -16,6 +16,7 @@ from src.core.proposals.models import (
     ProposalAsyncOperationRecord,
     ProposalIdempotencyRecord,
     ProposalMemoEventRecord,
+    ProposalMemoEvidencePackRecord,
     ProposalMemoIdempotencyRecord,
     ProposalMemoRecord,
     ProposalRecord,
@@ -52,11 +53,14 @@ class _FakeConnection:
         self.memos = {}
         self.memo_idempotency = {}
         self.memo_events = {}
+        self.memo_evidence_packs = {}
         self.cockpit_acknowledgements = {}
         self.cockpit_acknowledgement_idempotency = {}
         self.schema_migrations = {}
         self.executed_sql = []
         self.executed_args = []
+        self.executemany_batch_sizes = []
+        self.event_identity_locks = []
         self.rollback_count = 0
         self._transaction_snapshot = None
 
@@ -110,6 +114,19 @@ class _FakeConnection:
             return _FakeCursor()
         if sql.startswith("ALTER TABLE"):
             return _FakeCursor()
+        if sql.startswith(("ALTER INDEX", "DROP INDEX", "DROP TABLE")):
+            return _FakeCursor()
+        if _is_partition_maintenance_sql(sql):
+            return _FakeCursor()
+        if sql == "SELECT pg_advisory_xact_lock(hashtext(%s))":
+            return _FakeCursor()
+        if sql.startswith("SELECT pg_advisory_xact_lock(hashtext(lock_key)) FROM unnest"):
+            self.event_identity_locks.extend(args[0])
+            return _FakeCursor()
+        if sql.startswith("SELECT DISTINCT LEFT(occurred_at, 7) AS partition_month"):
+            return _FakeCursor(rows=[])
+        if sql == "SELECT to_regclass(%s) AS partition_oid":
+            return _FakeCursor({"partition_oid": None})
         if "FROM schema_migrations" in sql:
             namespace = args[0]
             rows = [
@@ -158,6 +175,36 @@ class _FakeConnection:
             return _FakeCursor()
         if "FROM proposal_memo_idempotency WHERE idempotency_key = %s" in sql:
             return _FakeCursor(self.memo_idempotency.get(args[0]))
+        if "INSERT INTO proposal_memo_evidence_packs" in sql:
+            columns = (
+                "source_input_hash",
+                "proposal_id",
+                "proposal_version_no",
+                "proposal_version_id",
+                "artifact_hash",
+                "simulation_hash",
+                "evidence_bundle_hash",
+                "memo_hash",
+                "builder_version",
+                "pack_json",
+                "materialized_at",
+            )
+            if not any(
+                row["proposal_id"] == args[1] and row["proposal_version_no"] == args[2]
+                for row in self.memo_evidence_packs.values()
+            ):
+                self.memo_evidence_packs.setdefault(args[0], dict(zip(columns, args)))
+            return _FakeCursor()
+        if "FROM proposal_memo_evidence_packs" in sql:
+            row = next(
+                (
+                    pack
+                    for pack in self.memo_evidence_packs.values()
+                    if pack["proposal_id"] == args[0] and pack["proposal_version_no"] == args[1]
+                ),
+                None,
+            )
+            return _FakeCursor(row)
         if "INSERT INTO proposal_memos" in sql:
             self.memos.setdefault(
                 args[0],
@@ -184,7 +231,7 @@ class _FakeConnection:
                 },
             )
             return _FakeCursor()
-        if "FROM proposal_memos WHERE memo_id = %s" in sql:
+        if "FROM proposal_memos WHERE memo_id = %s" in sql and "proposal_memo_events" not in sql:
             return _FakeCursor(self.memos.get(args[0]))
         if "FROM proposal_memos WHERE proposal_id = %s AND proposal_version_no = %s" in sql:
             row = next(
@@ -638,6 +685,26 @@ class _FakeConnection:
     def close(self):
         return None
 
+    def cursor(self):
+        return _FakeBatchCursor(self)
+
+
+class _FakeBatchCursor:
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        return None
+
+    def executemany(self, query, params_seq):
+        params_seq = list(params_seq)
+        self._connection.executemany_batch_sizes.append(len(params_seq))
+        for params in params_seq:
+            self._connection.execute(query, params)
+
 
 class _NoOperationReturnedConnection(_FakeConnection):
     def execute(self, query, args=None):
@@ -660,11 +727,15 @@ class _FailingAfterWriteConnection(_FakeConnection):
     def execute(self, query, args=None):
         sql = " ".join(str(query).split())
         cursor = super().execute(query, args)
-        if self._fail_sql_fragment in sql:
+        if self._fail_sql_fragment in sql and not _is_partition_maintenance_sql(sql):
             raise RuntimeError(f"fault injected after {self._fail_sql_fragment}")
         return cursor
 
 
+def _is_partition_maintenance_sql(sql: str) -> bool:
+    return "_unpartitioned" in sql or sql.startswith("WITH moved AS")
+
+
 def _is_transactional_write_sql(sql: str) -> bool:
     return sql.startswith(("INSERT ", "UPDATE ", "DELETE ", "CREATE ", "ALTER "))
 
@@ -1300,6 +1371,72 @@ def test_postgres_repository_versions_are_replay_safe_and_immutable(monkeypatch)
     assert stored == version
 
 
+def test_postgres_repository_version_headers_and_sections_select_only_requested_columns(
+    monkeypatch,
+):
+    repository, connection = _build_repository(monkeypatch)
+    now = datetime.now(timezone.utc)
+    for version_no in (1, 2):
+        repository.create_version(
+            ProposalVersionRecord(
+                proposal_version_id=f"ppv_sections_{version_no}",
+                proposal_id="pp_sections",
+                version_no=version_no,
+                created_at=now,
+                request_hash=f"sha256:req{version_no}",
+                artifact_hash=f"sha256:artifact{version_no}",
+                simulation_hash=f"sha256:sim{version_no}",
+                status_at_creation="READY",
+                proposal_result_json={"status": "READY"},
+                artifact_json={"artifact_id": f"a{version_no}"},
+                evidence_bundle_json={"hashes": {"artifact_hash": f"sha256:artifact{version_no}"}},
+                gate_decision_json={"gate": "CLIENT_CONSENT_REQUIRED"},
+            )
+        )
+    connection.executed_sql.clear()
+
+    headers = repository.list_version_headers(proposal_id="pp_sections")
+    assert [header.proposal_version_id for header in headers] == [
+        "ppv_sections_1",
+        "ppv_sections_2",
+    ]
+    assert not hasattr(headers[0], "artifact_json")
+
+    evidence_only = repository.get_version_sections(
+        proposal_id="pp_sections",
+        version_no=1,
+        sections=("evidence_bundle",),
+    )
+    assert evidence_only is not None
+    assert evidence_only.evidence_bundle_json == {"hashes": {"artifact_hash": "sha256:artifact1"}}
+    assert evidence_only.artifact_json == {}
+    assert evidence_only.proposal_result_json == {}
+    assert evidence_only.gate_decision_json is None
+
+    current = repository.get_current_version_sections(
+        proposal_id="pp_sections",
+        sections=("artifact", "gate_decision"),
+    )
+    assert current is not None
+    assert current.version_no == 2
+    assert current.artifact_json == {"artifact_id": "a2"}
+    assert current.gate_decision_json == {"gate": "CLIENT_CONSENT_REQUIRED"}
+    assert current.evidence_bundle_json == {}
+
+    header_sql, evidence_sql, current_sql = connection.executed_sql
+    assert "_json" not in header_sql
+    assert "evidence_bundle_json" in evidence_sql
+    assert "artifact_json" not in evidence_sql
+    assert "proposal_result_json" not in evidence_sql
+    assert "artifact_json" in current_sql
+    assert "gate_decision_json" in current_sql
+    assert "evidence_bundle_json" not in current_sql
+    assert (
+        repository.get_version_sections(proposal_id="pp_sections", version_no=9, sections=())
+        is None
+    )
+
+
 def test_postgres_repository_memo_idempotency_memo_and_events_roundtrip(monkeypatch):
     repository, connection = _build_repository(monkeypatch)
     now = datetime.now(timezone.utc)
@@ -1442,6 +1579,40 @@ def test_postgres_repository_atomic_memo_create_commits_all_records(monkeypatch)
     assert repository.list_memo_events(memo_id=memo.memo_id) == [event]
 
 
+def test_postgres_repository_memo_evidence_pack_roundtrip_keeps_first_write(monkeypatch):
+    repository, connection = _build_repository(monkeypatch)
+    now = datetime.now(timezone.utc)
+    record = ProposalMemoEvidencePackRecord(
+        source_input_hash="sha256:source",
+        proposal_id="pp_pg_memo",
+        proposal_version_no=1,
+        proposal_version_id="ppv_pg_memo_001",
+        artifact_hash="sha256:artifact",
+        simulation_hash="sha256:simulation",
+        evidence_bundle_hash="sha256:evidence",
+        memo_hash="sha256:memo",
+        builder_version="advisory-proposal-memo-evidence-pack.v1+builder.1",
+        pack_json={"memo_id": "memo_pg_001", "status": "BLOCKED"},
+        materialized_at=now,
+    )
+
+    assert (
+        repository.get_memo_evidence_pack(proposal_id="pp_pg_memo", proposal_version_no=1) is None
+    )
+    repository.save_memo_evidence_pack(record)
+    repository.save_memo_evidence_pack(
+        record.model_copy(update={"source_input_hash": "sha256:other", "memo_hash": "sha256:x"})
+    )
+
+    assert repository.get_memo_evidence_pack(proposal_id="pp_pg_memo", proposal_version_no=1) == (
+        record
+    )
+    assert any(
+        "INSERT INTO proposal_memo_evidence_packs" in sql and "ON CONFLICT DO NOTHING" in sql
+        for sql in connection.executed_sql
+    )
+
+
 def test_postgres_repository_cockpit_acknowledgement_roundtrip(monkeypatch):
     repository, connection = _build_repository(monkeypatch)
     now = datetime.now(timezone.utc)
@@ -1513,7 +1684,7 @@ def test_postgres_repository_cockpit_acknowledgement_roundtrip(monkeypatch):
 
 
 def test_postgres_repository_workflow_events_and_approvals_roundtrip(monkeypatch):
-    repository, _ = _build_repository(monkeypatch)
+    repository, connection = _build_repository(monkeypatch)
     first_at = datetime.now(timezone.utc)
     second_at = datetime.now(timezone.utc)
 
@@ -1558,6 +1729,13 @@ def test_postgres_repository_workflow_events_and_approvals_roundtrip(monkeypatch
         row.event_id
         for row in repository.list_events_for_proposals(proposal_ids=["pp_002", "pp_001"])
     ] == ["pwe_003", "pwe_001", "pwe_002"]
+    assert "created_at" not in connection.executed_sql[-1]
+    assert connection.executed_args[-1] == (["pp_002", "pp_001"],)
+    assert connection.event_identity_locks == [
+        "proposal_workflow_events:pwe_001",
+        "proposal_workflow_events:pwe_002",
+        "proposal_workflow_events:pwe_003",
+    ]
     assert repository.list_events_for_proposals(proposal_ids=[]) == []
 
     approval_at = datetime.now(timezone.utc)
@@ -30,6 +30,7 @@ from src.core.proposals.models import (
     ProposalIdempotencyRecord,
     ProposalRecord,
     ProposalStateTransitionRequest,
+    ProposalVersionHeaderRecord,
     ProposalVersionRecord,
     ProposalVersionRequest,
     ProposalWorkflowEventRecord,
@@ -63,6 +64,7 @@ class CountingLineageRepository(InMemoryProposalRepository):
         super().__init__()
         self.get_version_calls = 0
         self.list_versions_calls = 0
+        self.list_version_headers_calls = 0
 
     def get_version(self, *, proposal_id: str, version_no: int) -> ProposalVersionRecord | None:
         self.get_version_calls += 1
@@ -72,6 +74,10 @@ class CountingLineageRepository(InMemoryProposalRepository):
         self.list_versions_calls += 1
         return super().list_versions(proposal_id=proposal_id)
 
+    def list_version_headers(self, *, proposal_id: str) -> list[ProposalVersionHeaderRecord]:
+        self.list_version_headers_calls += 1
+        return super().list_version_headers(proposal_id=proposal_id)
+
 
 def test_service_delegates_async_operations_to_focused_module() -> None:
     service_text = Path(proposal_service_module.__file__).read_text(encoding="utf-8")
@@ -2035,7 +2041,8 @@ def test_service_lineage_skips_missing_version_rows():
     assert lineage.lineage_complete is False
     assert lineage.missing_version_numbers == [2]
     assert [version.version_no for version in lineage.versions] == [1]
-    assert repo.list_versions_calls == 1
+    assert repo.list_version_headers_calls == 1
+    assert repo.list_versions_calls == 0
     assert repo.get_version_calls == 0
 
 
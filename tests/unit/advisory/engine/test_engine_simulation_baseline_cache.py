@@ -0,0 +1,146 @@
+from decimal import Decimal
+
+import pytest
+
+from src.core.advisory.simulation_baseline import (
+    SimulationBaselineCache,
+    simulation_baseline_cache_max_entries,
+)
+from src.core.advisory_engine import run_proposal_simulation
+from src.core.models import EngineOptions
+from tests.shared.factories import (
+    cash,
+    market_data_snapshot,
+    portfolio_snapshot,
+    position,
+    price,
+    shelf_entry,
+)
+
+_REFERENCE_MODEL = {
+    "model_id": "mdl_baseline_1",
+    "as_of": "2026-02-18",
+    "base_currency": "USD",
+    "asset_class_targets": [
+        {"asset_class": "EQUITY", "weight": "0.90"},
+        {"asset_class": "CASH", "weight": "0.10"},
+    ],
+    "instrument_targets": [
+        {"instrument_id": "EQ_A", "weight": "0.50"},
+        {"instrument_id": "EQ_B", "weight": "0.40"},
+    ],
+}
+
+
+def _portfolio(snapshot_id: str = "ps_baseline_1", eq_a_quantity: str = "7"):
+    portfolio = portfolio_snapshot(
+        portfolio_id="pf_baseline_1",
+        base_currency="USD",
+        positions=[
+            position("EQ_A", eq_a_quantity),
+            position("EQ_B", "2"),
+            position("EQ_UNPRICED", "5"),
+        ],
+        cash_balances=[cash("USD", "100")],
+    )
+    return portfolio.model_copy(update={"snapshot_id": snapshot_id})
+
+
+def _market_data():
+    market_data = market_data_snapshot(
+        prices=[price("EQ_A", "100", "USD"), price("EQ_B", "100", "USD")],
+        fx_rates=[],
+    )
+    return market_data.model_copy(update={"snapshot_id": "md_baseline_1"})
+
+
+def _simulate(*, cache: SimulationBaselineCache, portfolio=None, trade_quantity: str = "1"):
+    return run_proposal_simulation(
+        portfolio=portfolio or _portfolio(),
+        market_data=_market_data(),
+        shelf=[
+            shelf_entry("EQ_A", asset_class="EQUITY", issuer_id="ISS_A"),
+            shelf_entry("EQ_B", asset_class="EQUITY", issuer_id="ISS_A"),
+            shelf_entry("EQ_UNPRICED", asset_class="EQUITY"),
+        ],
+        options=EngineOptions(
+            enable_proposal_simulation=True,
+            enable_instrument_drift=True,
+            block_on_missing_prices=False,
+            single_position_max_weight=Decimal("0.50"),
+        ),
+        proposed_cash_flows=[],
+        proposed_trades=[{"side": "BUY", "instrument_id": "EQ_B", "quantity": trade_quantity}],
+        reference_model=_REFERENCE_MODEL,
+        request_hash="proposal_hash_baseline",
+        baseline_cache=cache,
+    )
+
+
+def test_cached_baseline_produces_byte_identical_simulation_results():
+    uncached = SimulationBaselineCache(max_entries=lambda: 0)
+    cache = SimulationBaselineCache(max_entries=lambda: 8)
+
+    expected = _simulate(cache=uncached).model_dump_json()
+    first = _simulate(cache=cache)
+    second = _simulate(cache=cache)
+
+    assert first.model_dump_json() == expected
+    assert second.model_dump_json() == expected
+    assert "EQ_UNPRICED" in second.diagnostics.data_quality["price_missing"]
+    assert second.suitability is not None
+    assert second.drift_analysis is not None
+    assert second.drift_analysis.instrument is not None
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+    assert uncached.stats().bypasses == 1
+
+
+def test_cached_baseline_serves_different_trades_without_leaking_state():
+    cache = SimulationBaselineCache(max_entries=lambda: 8)
+
+    small = _simulate(cache=cache, trade_quantity="1")
+    large = _simulate(cache=cache, trade_quantity="3")
+    fresh = _simulate(cache=SimulationBaselineCache(max_entries=lambda: 0), trade_quantity="3")
+
+    assert large.model_dump_json() == fresh.model_dump_json()
+    assert small.before.model_dump_json() == large.before.model_dump_json()
+    assert small.before is not large.before
+    assert cache.stats().hits == 1
+
+
+def test_baseline_cache_key_covers_snapshot_content_not_only_snapshot_ids():
+    cache = SimulationBaselineCache(max_entries=lambda: 8)
+
+    original = _simulate(cache=cache)
+    reused_id = _simulate(cache=cache, portfolio=_portfolio(eq_a_quantity="9"))
+
+    assert cache.stats().misses == 2
+    assert reused_id.before.total_value.amount != original.before.total_value.amount
+
+
+def test_baseline_cache_evicts_least_recently_used_entries():
+    cache = SimulationBaselineCache(max_entries=lambda: 2)
+
+    _simulate(cache=cache, portfolio=_portfolio("ps_1"))
+    _simulate(cache=cache, portfolio=_portfolio("ps_2"))
+    _simulate(cache=cache, portfolio=_portfolio("ps_1"))
+    _simulate(cache=cache, portfolio=_portfolio("ps_3"))
+    _simulate(cache=cache, portfolio=_portfolio("ps_1"))
+    _simulate(cache=cache, portfolio=_portfolio("ps_2"))
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+def test_baseline_cache_max_entries_reads_environment(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("SIMULATION_BASELINE_CACHE_MAX_ENTRIES", raising=False)
+    assert simulation_baseline_cache_max_entries() == 256
+
+    monkeypatch.setenv("SIMULATION_BASELINE_CACHE_MAX_ENTRIES", "0")
+    assert simulation_baseline_cache_max_entries() == 0
+
+    for invalid in ("-1", "many"):
+        monkeypatch.setenv("SIMULATION_BASELINE_CACHE_MAX_ENTRIES", invalid)
+        with pytest.raises(RuntimeError, match="SIMULATION_BASELINE_CACHE_MAX_ENTRIES_INVALID"):
+            simulation_baseline_cache_max_entries()
@@ -0,0 +1,194 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from src.core import target_batch
+from src.core.target_batch import (
+    stream_target_batch,
+    target_batch_max_workers,
+)
+from src.core.target_batch_models import (
+    TargetBatchPortfolioError,
+    TargetBatchPortfolioResult,
+    TargetBatchRequest,
+    TargetBatchSummary,
+)
+
+
+def _portfolio(portfolio_id: str, eq_a: str, eq_b: str, bond_a: str) -> dict:
+    return {
+        "portfolio_id": portfolio_id,
+        "total_value": {"amount": "1000", "currency": "USD"},
+        "eligible_targets": {"EQ_A": eq_a, "EQ_B": eq_b, "BOND_A": bond_a},
+        "buy_list": ["EQ_A", "EQ_B", "BOND_A"],
+    }
+
+
+def _request(*portfolios: dict) -> TargetBatchRequest:
+    return TargetBatchRequest.model_validate(
+        {
+            "model": {
+                "targets": [
+                    {"instrument_id": "EQ_A", "weight": "0.40"},
+                    {"instrument_id": "EQ_B", "weight": "0.40"},
+                    {"instrument_id": "BOND_A", "weight": "0.20"},
+                ]
+            },
+            "shelf": [
+                {"instrument_id": "EQ_A", "status": "APPROVED", "attributes": {"sector": "TECH"}},
+                {"instrument_id": "EQ_B", "status": "APPROVED", "attributes": {"sector": "TECH"}},
+                {"instrument_id": "BOND_A", "status": "APPROVED", "attributes": {"sector": "BOND"}},
+            ],
+            "options": {
+                "target_method": "SOLVER",
+                "cash_band_min_weight": "0",
+                "cash_band_max_weight": "0",
+                "single_position_max_weight": "0.50",
+                "group_constraints": {"sector:TECH": {"max_weight": "0.60"}},
+            },
+            "portfolios": list(portfolios),
+        }
+    )
+
+
+def _split(
+    records: list,
+) -> tuple[dict[str, TargetBatchPortfolioResult], TargetBatchSummary]:
+    *results, summary = records
+    assert isinstance(summary, TargetBatchSummary)
+    assert all(isinstance(result, TargetBatchPortfolioResult) for result in results)
+    return {result.portfolio_id: result for result in results}, summary
+
+
+def test_target_batch_streams_per_portfolio_traces_and_summary() -> None:
+    request = _request(
+        _portfolio("PF_READY", "0.40", "0.40", "0.20"),
+        _portfolio("PF_LOCKED", "0.40", "0.40", "0.05"),
+    )
+    request.portfolios[1].buy_list = ["EQ_A"]
+
+    results, summary = _split(list(stream_target_batch(request, max_workers=0)))
+
+    ready = results["PF_READY"]
+    assert ready.sequence == 0
+    assert ready.status == "READY"
+    assert {target.instrument_id: target.final_weight for target in ready.targets} == {
+        "EQ_A": Decimal("0.3000"),
+        "EQ_B": Decimal("0.3000"),
+        "BOND_A": Decimal("0.4000"),
+    }
+    blocked = results["PF_LOCKED"]
+    assert blocked.sequence == 1
+    assert blocked.status == "BLOCKED"
+    assert blocked.targets == []
+    assert blocked.warnings == [
+        "INFEASIBLE_INFEASIBLE",
+        "INFEASIBILITY_HINT_SINGLE_POSITION_CAPACITY",
+    ]
+    assert summary.portfolio_count == 2
+    assert summary.status_counts == {"BLOCKED": 1, "READY": 1}
+    assert summary.worker_count == 0
+    assert summary.portfolios_per_second > 0
+
+
+def test_target_batch_process_pool_matches_in_process_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", "2")
+    request = _request(
+        _portfolio("PF_001", "0.40", "0.40", "0.20"),
+        _portfolio("PF_002", "0.50", "0.30", "0.20"),
+        _portfolio("PF_003", "0.20", "0.20", "0.60"),
+    )
+
+    in_process, _ = _split(list(stream_target_batch(request, max_workers=0)))
+    pooled, summary = _split(list(stream_target_batch(request)))
+    pool = target_batch._POOL
+    _split(list(stream_target_batch(request)))
+
+    assert summary.worker_count == 2
+    assert summary.portfolio_count == 3
+    assert summary.error_count == 0
+    assert {result.sequence for result in pooled.values()} == {0, 1, 2}
+    for portfolio_id, result in in_process.items():
+        assert pooled[portfolio_id].model_dump(exclude={"solve_ms"}) == result.model_dump(
+            exclude={"solve_ms"}
+        )
+    assert pool is not None
+    assert target_batch._POOL is pool
+
+
+def test_target_batch_isolates_failed_portfolio_as_error_record(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    solve = target_batch.solve_target_batch_portfolio
+
+    def _fail_second(*, shared, sequence, portfolio):
+        if portfolio.portfolio_id == "PF_FAIL":
+            raise ArithmeticError("solver blew up")
+        return solve(shared=shared, sequence=sequence, portfolio=portfolio)
+
+    monkeypatch.setattr(target_batch, "solve_target_batch_portfolio", _fail_second)
+    request = _request(
+        _portfolio("PF_001", "0.40", "0.40", "0.20"),
+        _portfolio("PF_FAIL", "0.40", "0.40", "0.20"),
+        _portfolio("PF_003", "0.20", "0.20", "0.60"),
+    )
+
+    *records, summary = list(stream_target_batch(request, max_workers=0))
+
+    assert [record.record_type for record in records] == ["PORTFOLIO", "ERROR", "PORTFOLIO"]
+    assert records[1] == TargetBatchPortfolioError(
+        sequence=1, portfolio_id="PF_FAIL", error_code="TARGET_BATCH_ITEM_FAILED"
+    )
+    assert (summary.portfolio_count, summary.error_count) == (3, 1)
+    assert summary.status_counts == {"READY": 2}
+
+
+def test_target_batch_broken_worker_chunk_yields_error_records_and_discards_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", "2")
+    pool = target_batch._resolve_pool(2)
+    request = _request(
+        _portfolio("PF_001", "0.40", "0.40", "0.20"),
+        _portfolio("PF_002", "0.50", "0.30", "0.20"),
+    )
+    broken: Future = Future()
+    broken.set_exception(BrokenProcessPool("worker died"))
+
+    records = list(
+        target_batch._chunk_records(
+            pool=pool, future=broken, chunk=list(enumerate(request.portfolios))
+        )
+    )
+
+    assert [(record.record_type, record.sequence) for record in records] == [
+        ("ERROR", 0),
+        ("ERROR", 1),
+    ]
+    assert target_batch._POOL is None
+
+
+def test_target_batch_request_rejects_duplicate_portfolio_ids() -> None:
+    with pytest.raises(ValidationError, match="unique portfolio_id"):
+        _request(
+            _portfolio("PF_001", "0.40", "0.40", "0.20"),
+            _portfolio("PF_001", "0.40", "0.40", "0.20"),
+        )
+
+
+def test_target_batch_max_workers_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", "3")
+    assert target_batch_max_workers() == 3
+
+    monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", "0")
+    assert target_batch_max_workers() == 0
+
+    for invalid in ("-1", "many"):
+        monkeypatch.setenv("TARGET_BATCH_MAX_WORKERS", invalid)
+        with pytest.raises(RuntimeError, match="TARGET_BATCH_MAX_WORKERS_INVALID"):
+            target_batch_max_workers()
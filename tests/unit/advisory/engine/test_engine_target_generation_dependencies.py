@@ -2,8 +2,11 @@ import importlib
 from decimal import Decimal
 from types import SimpleNamespace
 
+import pytest
+
 from src.core import target_generation
 from src.core.models import DiagnosticsData, EngineOptions, ShelfEntry
+from src.core.target_solver_cache import TargetSolverProblemCache
 
 
 class _FakeSolverError(Exception):
@@ -293,3 +296,113 @@ def test_build_target_trace_projects_model_and_implicit_holding_tags() -> None:
     assert trace[2].tags == []
     assert trace[3].tags == ["LOCKED_POSITION"]
     assert trace[4].tags == ["IMPLICIT_SELL_TO_ZERO"]
+
+
+def _solve_equity_targets(
+    *,
+    problem_cache: TargetSolverProblemCache,
+    model_weights: tuple[str, str, str],
+    group_constraints: dict[str, dict[str, str]] | None = None,
+) -> tuple[dict[str, Decimal], str]:
+    model = SimpleNamespace(
+        targets=[
+            SimpleNamespace(instrument_id=instrument_id, weight=Decimal(weight))
+            for instrument_id, weight in zip(("EQ_A", "EQ_B", "BOND_A"), model_weights)
+        ]
+    )
+    eligible_targets = {
+        "EQ_A": Decimal(model_weights[0]),
+        "EQ_B": Decimal(model_weights[1]),
+        "BOND_A": Decimal(model_weights[2]),
+    }
+    _, status = target_generation.generate_targets_solver(
+        model=model,
+        eligible_targets=eligible_targets,
+        buy_list=["EQ_A", "EQ_B", "BOND_A"],
+        sell_only_excess=Decimal("0"),
+        shelf=[
+            ShelfEntry(instrument_id="EQ_A", status="APPROVED", attributes={"sector": "TECH"}),
+            ShelfEntry(instrument_id="EQ_B", status="APPROVED", attributes={"sector": "TECH"}),
+            ShelfEntry(instrument_id="BOND_A", status="APPROVED", attributes={"sector": "BOND"}),
+        ],
+        options=EngineOptions(
+            cash_band_min_weight=Decimal("0"),
+            cash_band_max_weight=Decimal("0"),
+            single_position_max_weight=Decimal("0.50"),
+            group_constraints=group_constraints or {"sector:TECH": {"max_weight": "0.60"}},
+        ),
+        total_val=Decimal("1000"),
+        base_ccy="USD",
+        diagnostics=DiagnosticsData(data_quality={}),
+        problem_cache=problem_cache,
+    )
+    return eligible_targets, status
+
+
+def test_generate_targets_solver_reuses_compiled_problem_for_same_structure() -> None:
+    problem_cache = TargetSolverProblemCache()
+
+    first, first_status = _solve_equity_targets(
+        problem_cache=problem_cache,
+        model_weights=("0.40", "0.40", "0.20"),
+    )
+    second, second_status = _solve_equity_targets(
+        problem_cache=problem_cache,
+        model_weights=("0.50", "0.30", "0.20"),
+    )
+    uncached, _ = _solve_equity_targets(
+        problem_cache=TargetSolverProblemCache(),
+        model_weights=("0.50", "0.30", "0.20"),
+    )
+
+    assert first_status == second_status == "READY"
+    assert first == {
+        "EQ_A": Decimal("0.3000"),
+        "EQ_B": Decimal("0.3000"),
+        "BOND_A": Decimal("0.4000"),
+    }
+    assert second == uncached
+    assert sum(second.values()) == Decimal("1.0000")
+    assert second["EQ_A"] + second["EQ_B"] <= Decimal("0.6000")
+    stats = problem_cache.stats()
+    assert (stats.hits, stats.misses, stats.size, stats.solves) == (1, 1, 1, 2)
+    assert stats.solve_seconds > 0
+
+
+def test_generate_targets_solver_result_does_not_depend_on_previous_solve() -> None:
+    problem_cache = TargetSolverProblemCache()
+    weights_a = ("0.3244", "0.6321", "0.0435")
+    weights_b = ("0.1919", "0.3790", "0.4291")
+
+    first_a, _ = _solve_equity_targets(problem_cache=problem_cache, model_weights=weights_a)
+    _solve_equity_targets(problem_cache=problem_cache, model_weights=weights_b)
+    second_a, _ = _solve_equity_targets(problem_cache=problem_cache, model_weights=weights_a)
+    uncached_a, _ = _solve_equity_targets(
+        problem_cache=TargetSolverProblemCache(), model_weights=weights_a
+    )
+
+    assert first_a == second_a == uncached_a
+    assert problem_cache.stats().hits == 2
+
+
+def test_generate_targets_solver_compiles_new_problem_for_new_group_layout() -> None:
+    problem_cache = TargetSolverProblemCache(max_entries=1)
+
+    _solve_equity_targets(problem_cache=problem_cache, model_weights=("0.40", "0.40", "0.20"))
+    _, status = _solve_equity_targets(
+        problem_cache=problem_cache,
+        model_weights=("0.40", "0.40", "0.20"),
+        group_constraints={
+            "sector:TECH": {"max_weight": "0.60"},
+            "sector:BOND": {"max_weight": "0.10"},
+        },
+    )
+
+    assert status == "BLOCKED"
+    stats = problem_cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (0, 2, 1, 1)
+
+
+def test_target_solver_problem_cache_rejects_non_positive_bound() -> None:
+    with pytest.raises(ValueError, match="TARGET_SOLVER_PROBLEM_CACHE_MAX_ENTRIES_INVALID"):
+        TargetSolverProblemCache(max_entries=0)
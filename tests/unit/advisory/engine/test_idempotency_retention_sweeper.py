@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.record_lifecycle import (
+    IdempotencyRetentionCandidate,
+    IdempotencyRetentionSettings,
+    IdempotencyRetentionTable,
+    sweep_idempotency_records,
+)
+
+_NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class _FakeRetentionStore:
+    def __init__(
+        self, records: dict[IdempotencyRetentionTable, list[IdempotencyRetentionCandidate]]
+    ):
+        self.records = {table: list(rows) for table, rows in records.items()}
+        self.list_calls: list[tuple[str, str, str | None, int]] = []
+        self.deleted: list[tuple[str, tuple[str, ...]]] = []
+
+    def idempotency_retention_tables(self) -> tuple[IdempotencyRetentionTable, ...]:
+        return tuple(self.records)
+
+    def list_idempotency_retention_candidates(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        created_before: str,
+        after: IdempotencyRetentionCandidate | None,
+        limit: int,
+    ) -> list[IdempotencyRetentionCandidate]:
+        self.list_calls.append(
+            (table, created_before, after.idempotency_key if after else None, limit)
+        )
+        cursor = (after.created_at, after.idempotency_key) if after else ("", "")
+        rows = sorted(
+            (
+                row
+                for row in self.records[table]
+                if row.created_at < created_before
+                and (row.created_at, row.idempotency_key) > cursor
+            ),
+            key=lambda row: (row.created_at, row.idempotency_key),
+        )
+        return rows[:limit]
+
+    def delete_idempotency_records(
+        self,
+        *,
+        table: IdempotencyRetentionTable,
+        idempotency_keys: Sequence[str],
+        created_before: str,
+    ) -> int:
+        self.deleted.append((table, tuple(idempotency_keys)))
+        before = len(self.records[table])
+        self.records[table] = [
+            row
+            for row in self.records[table]
+            if row.idempotency_key not in idempotency_keys or row.created_at >= created_before
+        ]
+        return before - len(self.records[table])
+
+
+def _candidate(key: str, *, age_days: int, **kwargs: object) -> IdempotencyRetentionCandidate:
+    return IdempotencyRetentionCandidate(
+        idempotency_key=key,
+        created_at=(_NOW - timedelta(days=age_days)).isoformat(),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_sweeper_purges_expired_records_in_bounded_batches() -> None:
+    store = _FakeRetentionStore(
+        {
+            "proposal_simulation_idempotency": [
+                _candidate(f"sim-{index}", age_days=10 + index) for index in range(5)
+            ]
+            + [_candidate("sim-fresh", age_days=1)]
+        }
+    )
+
+    report = sweep_idempotency_records(
+        stores=[store],
+        settings=IdempotencyRetentionSettings(batch_size=2),
+        now=lambda: _NOW,
+    )
+
+    [table_report] = report.tables
+    assert table_report.purged == 5
+    assert table_report.batches == 3
+    assert table_report.exhausted is True
+    assert table_report.decision_counts == {"PURGE_ELIGIBLE": 5}
+    assert [len(keys) for _, keys in store.deleted] == [2, 2, 1]
+    assert [row.idempotency_key for row in store.records["proposal_simulation_idempotency"]] == [
+        "sim-fresh"
+    ]
+    assert table_report.created_before == (_NOW - timedelta(days=7)).isoformat()
+    assert report.purged == 5
+    assert len(report.audit_events) == 3
+    assert report.audit_events[0]["event_type"] == "ADVISORY_RECORD_PURGE_EXECUTED"
+    assert report.audit_events[0]["record_table"] == "proposal_simulation_idempotency"
+    assert "sim-0" not in str(report.audit_events)
+
+
+def test_sweeper_skips_legal_hold_and_dependent_records_without_rescanning_them() -> None:
+    store = _FakeRetentionStore(
+        {
+            "advisory_copilot_run_idempotency": [
+                _candidate("held", age_days=90, legal_hold=True),
+                _candidate("in-flight", age_days=80, dependent_record_refs=("op-1",)),
+                _candidate("expired", age_days=70),
+            ]
+        }
+    )
+
+    report = sweep_idempotency_records(
+        stores=[store],
+        settings=IdempotencyRetentionSettings(batch_size=2),
+        now=lambda: _NOW,
+    )
+
+    [table_report] = report.tables
+    assert table_report.purged == 1
+    assert table_report.decision_counts == {
+        "PURGE_BLOCKED_BY_DEPENDENCIES": 1,
+        "PURGE_BLOCKED_BY_LEGAL_HOLD": 1,
+        "PURGE_ELIGIBLE": 1,
+    }
+    assert store.deleted == [("advisory_copilot_run_idempotency", ("expired",))]
+    assert [call[2] for call in store.list_calls] == [None, "in-flight"]
+    assert {row.idempotency_key for row in store.records["advisory_copilot_run_idempotency"]} == {
+        "held",
+        "in-flight",
+    }
+
+
+def test_sweeper_stops_at_max_batches_and_honours_configured_ttls() -> None:
+    store = _FakeRetentionStore(
+        {
+            "proposal_idempotency": [_candidate(f"p-{index}", age_days=3) for index in range(4)],
+            "policy_pack_catalog_idempotency": [_candidate("catalog", age_days=3)],
+        }
+    )
+
+    report = sweep_idempotency_records(
+        stores=[store],
+        settings=IdempotencyRetentionSettings(
+            ttl_by_table={"proposal_idempotency": timedelta(days=2)},
+            batch_size=1,
+            max_batches_per_table=2,
+        ),
+        now=lambda: _NOW,
+    )
+
+    [table_report] = report.tables
+    assert table_report.table == "proposal_idempotency"
+    assert table_report.purged == 2
+    assert table_report.exhausted is False
+    assert len(store.records["policy_pack_catalog_idempotency"]) == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"batch_size": 0}, "IDEMPOTENCY_RETENTION_BATCH_SIZE_INVALID"),
+        ({"max_batches_per_table": 0}, "IDEMPOTENCY_RETENTION_MAX_BATCHES_INVALID"),
+        (
+            {"ttl_by_table": {"proposal_idempotency": timedelta(0)}},
+            "IDEMPOTENCY_RETENTION_TTL_INVALID",
+        ),
+    ],
+)
+def test_retention_settings_reject_unbounded_configuration(
+    kwargs: dict[str, object], error: str
+) -> None:
+    with pytest.raises(ValueError, match=error):
+        IdempotencyRetentionSettings(**kwargs)  # type: ignore[arg-type]
@@ -1,11 +1,29 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
+from src.core.common.canonical import (
+    canonical_json,
+    hash_canonical_mapping,
+    hash_canonical_payload,
+    strip_keys,
+)
 from src.core.tactical_house_view import (
+    InMemoryTacticalHouseViewCohortRepository,
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewCohortBuilder,
     TacticalHouseViewCohortRequest,
+    TacticalHouseViewCohortStreamHeader,
     build_tactical_house_view_affected_cohort,
+    clear_tactical_house_view_affected_cohorts_for_tests,
+    configure_tactical_house_view_cohort_repository,
+    get_tactical_house_view_cohort_repository,
+    list_tactical_house_view_affected_cohorts,
+    page_tactical_house_view_affected_portfolios,
+    page_tactical_house_view_excluded_portfolios,
+    record_tactical_house_view_affected_cohort,
 )
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
@@ -87,9 +105,14 @@ def test_tactical_house_view_facade_delegates_models_and_rules() -> None:
         encoding="utf-8"
     )
     rule_source = (REPO_ROOT / "src/core/tactical_house_view_rules.py").read_text(encoding="utf-8")
+    builder_source = (REPO_ROOT / "src/core/tactical_house_view_cohort_builder.py").read_text(
+        encoding="utf-8"
+    )
 
     assert "from src.core.tactical_house_view_models import" in facade_source
-    assert "from src.core.tactical_house_view_rules import" in facade_source
+    assert "from src.core.tactical_house_view_cohort_builder import" in facade_source
+    assert "from src.core.tactical_house_view_rules import" in builder_source
+    assert "def candidate_exclusion_reasons(" not in builder_source
     assert "class TacticalHouseViewCohortRequest(" not in facade_source
     assert "class TacticalHouseViewAffectedCohort(" not in facade_source
     assert "def candidate_exclusion_reasons(" not in facade_source
@@ -205,3 +228,187 @@ def test_tactical_house_view_candidate_requires_source_refs() -> None:
 
     with pytest.raises(ValueError, match="source_refs"):
         TacticalHouseViewCohortRequest.model_validate(payload)
+
+
+def _legacy_cohort_identity(cohort: TacticalHouseViewAffectedCohort) -> tuple[str, str]:
+    payload = cohort.model_dump(mode="json")
+    cohort_id = hash_canonical_payload(
+        strip_keys(payload, exclude={"cohort_id", "content_hash", "generated_at"})
+    )
+    payload["cohort_id"] = cohort_id
+    return cohort_id, hash_canonical_payload(strip_keys(payload, exclude={"content_hash"}))
+
+
+def test_tactical_house_view_incremental_hashes_match_canonical_payload_hashes() -> None:
+    payload = _request().model_dump(mode="json")
+    template = payload["candidate_portfolios"][0]
+    payload["candidate_portfolios"] = [
+        {
+            **template,
+            "portfolio_id": f"PB_SG_DPM_{index:03d}_é",
+            "alignment_signal": ["OVERWEIGHT", "ALIGNED", "UNDERWEIGHT"][index % 3],
+            "current_exposure_weight": str(Decimal("0.04") * (index % 5)),
+        }
+        for index in reversed(range(40))
+    ] + payload["candidate_portfolios"]
+    request = TacticalHouseViewCohortRequest.model_validate(payload)
+
+    cohort = build_tactical_house_view_affected_cohort(
+        request,
+        generated_at=datetime(2026, 5, 14, 8, 0, tzinfo=timezone.utc),
+    )
+
+    assert (cohort.cohort_id, cohort.content_hash) == _legacy_cohort_identity(cohort)
+    assert cohort.affected_portfolios and cohort.excluded_portfolios
+
+
+def test_tactical_house_view_streamed_builder_matches_request_cohort() -> None:
+    request = _request()
+    builder = TacticalHouseViewCohortBuilder.from_stream_header(
+        TacticalHouseViewCohortStreamHeader.model_validate(
+            request.model_dump(exclude={"candidate_portfolios"})
+        )
+    )
+    for candidate in request.candidate_portfolios:
+        builder.add_candidate(candidate)
+    generated_at = datetime(2026, 5, 14, 8, 0, tzinfo=timezone.utc)
+
+    assert builder.build(generated_at=generated_at) == build_tactical_house_view_affected_cohort(
+        request,
+        generated_at=generated_at,
+    )
+
+
+def test_hash_canonical_mapping_matches_hash_canonical_payload() -> None:
+    items = [{"b": [1, 2], "a": "é"}, {"z": None}]
+
+    assert hash_canonical_mapping(
+        {"name": "cohort", "zeta": {"y": 1, "x": 2}},
+        encoded_sequences={
+            "items": (canonical_json(item).encode("utf-8") for item in items),
+            "empty": iter(()),
+        },
+    ) == hash_canonical_payload(
+        {"name": "cohort", "zeta": {"y": 1, "x": 2}, "items": items, "empty": []}
+    )
+
+
+def test_tactical_house_view_stored_cohort_pages_follow_portfolio_order() -> None:
+    clear_tactical_house_view_affected_cohorts_for_tests()
+    payload = _request().model_dump(mode="json")
+    template = payload["candidate_portfolios"][0]
+    payload["candidate_portfolios"] = [
+        {**template, "portfolio_id": f"PB_{index}"} for index in (3, 1, 4, 0, 2)
+    ]
+    cohort = record_tactical_house_view_affected_cohort(
+        build_tactical_house_view_affected_cohort(
+            TacticalHouseViewCohortRequest.model_validate(payload)
+        )
+    )
+
+    first = page_tactical_house_view_affected_portfolios(
+        cohort_id=cohort.cohort_id,
+        limit=2,
+        cursor=None,
+    )
+    assert first is not None
+    second = page_tactical_house_view_affected_portfolios(
+        cohort_id=cohort.cohort_id,
+        limit=3,
+        cursor=first.next_cursor,
+    )
+    assert second is not None
+
+    assert [item.portfolio_id for item in first.items + second.items] == [
+        "PB_0",
+        "PB_1",
+        "PB_2",
+        "PB_3",
+        "PB_4",
+    ]
+    assert second.next_cursor is None
+    assert first.total_count == 5
+    assert (
+        page_tactical_house_view_excluded_portfolios(cohort_id="missing", limit=1, cursor=None)
+        is None
+    )
+    with pytest.raises(ValueError, match="TACTICAL_HOUSE_VIEW_COHORT_CURSOR_INVALID"):
+        page_tactical_house_view_excluded_portfolios(
+            cohort_id=cohort.cohort_id,
+            limit=1,
+            cursor=first.next_cursor,
+        )
+    clear_tactical_house_view_affected_cohorts_for_tests()
+
+
+def _cohort_for(portfolio_ids: list[str], *, generated_at: str) -> TacticalHouseViewAffectedCohort:
+    payload = _request().model_dump(mode="json")
+    template = payload["candidate_portfolios"][0]
+    payload["candidate_portfolios"] = [
+        {**template, "portfolio_id": portfolio_id} for portfolio_id in portfolio_ids
+    ]
+    return build_tactical_house_view_affected_cohort(
+        TacticalHouseViewCohortRequest.model_validate(payload),
+        generated_at=datetime.fromisoformat(generated_at),
+    )
+
+
+def test_in_memory_cohort_repository_lists_portfolio_projections_by_recency() -> None:
+    repository = InMemoryTacticalHouseViewCohortRepository()
+    older = _cohort_for(["PB_A", "PB_B"], generated_at="2026-05-14T08:00:00+00:00")
+    newer = _cohort_for(["PB_B", "PB_C"], generated_at="2026-05-14T09:00:00+00:00")
+    unrelated = _cohort_for(["PB_D"], generated_at="2026-05-14T10:00:00+00:00")
+    for cohort in (older, newer, unrelated):
+        repository.save_cohort(cohort)
+
+    listed = repository.list_cohorts(portfolio_id="PB_B", limit=10)
+
+    assert [cohort.cohort_id for cohort in listed] == [newer.cohort_id, older.cohort_id]
+    assert [[item.portfolio_id for item in cohort.affected_portfolios] for cohort in listed] == [
+        ["PB_B"],
+        ["PB_B"],
+    ]
+    assert all(cohort.excluded_portfolios == [] for cohort in listed)
+    assert listed[0].content_hash == newer.content_hash
+    assert [cohort.cohort_id for cohort in repository.list_cohorts(portfolio_id=None, limit=2)] == [
+        unrelated.cohort_id,
+        newer.cohort_id,
+    ]
+    assert repository.list_cohorts(portfolio_id="PB_UNKNOWN", limit=10) == []
+
+
+def test_in_memory_cohort_repository_resave_refreshes_recency_without_duplicates() -> None:
+    repository = InMemoryTacticalHouseViewCohortRepository()
+    first = _cohort_for(["PB_A"], generated_at="2026-05-14T08:00:00+00:00")
+    other = _cohort_for(["PB_A", "PB_B"], generated_at="2026-05-14T09:00:00+00:00")
+    regenerated = _cohort_for(["PB_A"], generated_at="2026-05-14T10:00:00+00:00")
+    assert regenerated.cohort_id == first.cohort_id
+    for cohort in (first, other, regenerated):
+        repository.save_cohort(cohort)
+
+    listed = repository.list_cohorts(portfolio_id="PB_A", limit=10)
+
+    assert [cohort.cohort_id for cohort in listed] == [first.cohort_id, other.cohort_id]
+    assert listed[0].generated_at == regenerated.generated_at
+    stored = repository.get_cohort(cohort_id=first.cohort_id)
+    assert stored is not None
+    assert stored.content_hash == regenerated.content_hash
+
+
+def test_tactical_house_view_facade_uses_configured_cohort_repository() -> None:
+    repository = InMemoryTacticalHouseViewCohortRepository()
+    configure_tactical_house_view_cohort_repository(repository)
+    try:
+        cohort = record_tactical_house_view_affected_cohort(
+            _cohort_for(["PB_A"], generated_at="2026-05-14T08:00:00+00:00")
+        )
+
+        assert get_tactical_house_view_cohort_repository() is repository
+        assert repository.get_cohort(cohort_id=cohort.cohort_id) == cohort
+        assert [
+            item.cohort_id
+            for item in list_tactical_house_view_affected_cohorts(portfolio_id="PB_A", limit=5)
+        ] == [cohort.cohort_id]
+    finally:
+        clear_tactical_house_view_affected_cohorts_for_tests()
+    assert get_tactical_house_view_cohort_repository() is not repository
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.tactical_house_view import (
+    InMemoryTacticalHouseViewCohortRepository,
+    TacticalHouseViewAffectedCohort,
+    TacticalHouseViewCohortRequest,
+    build_tactical_house_view_affected_cohort,
+)
+from src.infrastructure.tactical_house_view.postgres import (
+    PostgresTacticalHouseViewCohortRepository,
+)
+
+
+class _Cursor:
+    def __init__(self, rows: list[dict] | None = None) -> None:
+        self._rows = rows or []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _BatchCursor:
+    def __init__(self, connection: _Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> _BatchCursor:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+    def executemany(self, query, rows) -> None:
+        sql = " ".join(str(query).split())
+        assert sql.startswith("INSERT INTO tactical_house_view_cohort_portfolios")
+        assert sql.endswith("ON CONFLICT (cohort_id, membership, ordinal) DO NOTHING")
+        self._connection.executemany_calls += 1
+        existing = {
+            (row["cohort_id"], row["membership"], row["ordinal"])
+            for row in self._connection.members
+        }
+        for cohort_id, membership, ordinal, portfolio_id, portfolio_json in rows:
+            if (cohort_id, membership, ordinal) in existing:
+                continue
+            self._connection.members.append(
+                {
+                    "cohort_id": cohort_id,
+                    "membership": membership,
+                    "ordinal": ordinal,
+                    "portfolio_id": portfolio_id,
+                    "portfolio_json": portfolio_json,
+                }
+            )
+
+
+class _Connection:
+    """Evaluates the repository's statements against in-process rows."""
+
+    def __init__(self) -> None:
+        self.cohorts: dict[str, dict] = {}
+        self.members: list[dict] = []
+        self.executed: list[str] = []
+        self.executemany_calls = 0
+        self.commits = 0
+
+    def cursor(self) -> _BatchCursor:
+        return _BatchCursor(self)
+
+    def execute(self, query, args=None):
+        sql = " ".join(str(query).split())
+        self.executed.append(sql)
+        if sql.startswith("INSERT INTO tactical_house_view_cohorts"):
+            assert sql.endswith("RETURNING (xmax = 0) AS inserted")
+            keys = (
+                "cohort_id",
+                "tactical_view_id",
+                "tactical_view_version",
+                "content_hash",
+                "generated_at",
+                "affected_count",
+                "excluded_count",
+                "summary_json",
+            )
+            inserted = args[0] not in self.cohorts
+            self.cohorts[args[0]] = dict(zip(keys, args, strict=True))
+            return _Cursor([{"inserted": inserted}])
+        if sql.startswith("SELECT summary_json FROM tactical_house_view_cohorts WHERE"):
+            return _Cursor([self.cohorts[args[0]]] if args[0] in self.cohorts else [])
+        if sql.startswith("SELECT affected_count, excluded_count"):
+            return _Cursor([self.cohorts[args[0]]] if args[0] in self.cohorts else [])
+        if sql.startswith("SELECT membership, portfolio_json"):
+            return _Cursor(
+                sorted(
+                    (row for row in self.members if row["cohort_id"] == args[0]),
+                    key=lambda row: (row["membership"], row["ordinal"]),
+                )
+            )
+        if sql.startswith("SELECT portfolio_json FROM tactical_house_view_cohort_portfolios"):
+            cohort_id, membership, offset, limit = args
+            rows = sorted(
+                (
+                    row
+                    for row in self.members
+                    if row["cohort_id"] == cohort_id
+                    and row["membership"] == membership
+                    and row["ordinal"] >= offset
+                ),
+                key=lambda row: row["ordinal"],
+            )
+            return _Cursor(rows[:limit])
+        if sql.startswith("SELECT cohort_id, summary_json FROM tactical_house_view_cohorts"):
+            return _Cursor(self._by_recency(self.cohorts.values())[: args[0]])
+        if sql.startswith("SELECT cohort.cohort_id, cohort.summary_json"):
+            portfolio_id, limit = args
+            cohort_ids = {
+                row["cohort_id"]
+                for row in self.members
+                if row["portfolio_id"] == portfolio_id and row["membership"] == "affected"
+            }
+            return _Cursor(
+                self._by_recency(
+                    row for row in self.cohorts.values() if row["cohort_id"] in cohort_ids
+                )[:limit]
+            )
+        if sql.startswith("SELECT cohort_id, portfolio_json"):
+            portfolio_id = args[0] if len(args) == 2 else None
+            cohort_ids = args[-1]
+            return _Cursor(
+                sorted(
+                    (
+                        row
+                        for row in self.members
+                        if row["cohort_id"] in cohort_ids
+                        and row["membership"] == "affected"
+                        and (portfolio_id is None or row["portfolio_id"] == portfolio_id)
+                    ),
+                    key=lambda row: (row["cohort_id"], row["ordinal"]),
+                )
+            )
+        raise AssertionError(f"unexpected statement: {sql}")
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def close(self) -> None:
+        return None
+
+    @staticmethod
+    def _by_recency(rows) -> list[dict]:
+        return sorted(rows, key=lambda row: (row["generated_at"], row["cohort_id"]), reverse=True)
+
+
+def _cohort(portfolio_ids: list[str], *, generated_at: str) -> TacticalHouseViewAffectedCohort:
+    template = {
+        "mandate_id": "MANDATE_PB",
+        "portfolio_type": "DISCRETIONARY",
+        "discretionary_mandate": True,
+        "current_exposure_weight": "0.18",
+        "alignment_signal": "OVERWEIGHT",
+        "source_refs": [
+            {
+                "source_system": "lotus-core",
+                "source_type": "HoldingsAsOf",
+                "source_id": "holdings:2026-05-14",
+            }
+        ],
+    }
+    request = TacticalHouseViewCohortRequest.model_validate(
+        {
+            "tactical_view": {
+                "tactical_view_id": "thv_2026_05_asia_duration",
+                "tactical_view_version": "2026.05",
+                "theme_id": "asia_duration_reduce",
+                "as_of_date": "2026-05-14",
+                "target_action": "REDUCE",
+                "rationale": "Reduce duration exposure in Asia balanced discretionary books.",
+                "source_refs": [
+                    {
+                        "source_system": "lotus-advise",
+                        "source_type": "TACTICAL_HOUSE_VIEW",
+                        "source_id": "thv_2026_05_asia_duration",
+                    }
+                ],
+            },
+            "candidate_portfolios": [
+                {**template, "portfolio_id": portfolio_id} for portfolio_id in portfolio_ids
+            ]
+            + [{**template, "portfolio_id": "PB_ADVISORY", "portfolio_type": "ADVISORY"}],
+            "eligible_portfolio_types": ["DISCRETIONARY"],
+            "correlation_id": "corr-thv-pg",
+        }
+    )
+    return build_tactical_house_view_affected_cohort(
+        request,
+        generated_at=datetime.fromisoformat(generated_at),
+    )
+
+
+def _repository(connection: _Connection) -> PostgresTacticalHouseViewCohortRepository:
+    return PostgresTacticalHouseViewCohortRepository(
+        connect=lambda: connection,
+        apply_migrations=False,
+    )
+
+
+def test_postgres_cohort_repository_round_trips_cohort_and_pages_members() -> None:
+    connection = _Connection()
+    repository = _repository(connection)
+    cohort = _cohort(["PB_C", "PB_A", "PB_B"], generated_at="2026-05-14T08:00:00+00:00")
+
+    repository.save_cohort(cohort)
+
+    assert repository.get_cohort(cohort_id=cohort.cohort_id) == cohort
+    assert repository.get_cohort(cohort_id="missing") is None
+    page = repository.page_affected_portfolios(cohort_id=cohort.cohort_id, offset=1, limit=5)
+    assert page is not None
+    assert [item.portfolio_id for item in page[0]] == ["PB_B", "PB_C"]
+    assert page[1] == 3
+    excluded = repository.page_excluded_portfolios(cohort_id=cohort.cohort_id, offset=0, limit=5)
+    assert excluded is not None
+    assert [item.portfolio_id for item in excluded[0]] == ["PB_ADVISORY"]
+    assert repository.page_affected_portfolios(cohort_id="missing", offset=0, limit=5) is None
+    assert connection.commits == 1
+
+
+def test_postgres_cohort_repository_saves_members_without_a_pre_read() -> None:
+    connection = _Connection()
+    repository = _repository(connection)
+    cohort = _cohort(["PB_A", "PB_B"], generated_at="2026-05-14T08:00:00+00:00")
+
+    repository.save_cohort(cohort)
+    repository.save_cohort(cohort)
+
+    assert all(not sql.startswith("SELECT") for sql in connection.executed)
+    assert connection.executemany_calls == 1
+    assert len(connection.members) == 3
+    assert repository.get_cohort(cohort_id=cohort.cohort_id) == cohort
+
+
+def test_postgres_cohort_repository_matches_in_memory_listing_projections() -> None:
+    connection = _Connection()
+    postgres = _repository(connection)
+    in_memory = InMemoryTacticalHouseViewCohortRepository()
+    cohorts = [
+        _cohort(["PB_A", "PB_B"], generated_at="2026-05-14T08:00:00+00:00"),
+        _cohort(["PB_B", "PB_C"], generated_at="2026-05-14T09:00:00+00:00"),
+        _cohort(["PB_D"], generated_at="2026-05-14T10:00:00+00:00"),
+        _cohort(["PB_A", "PB_B"], generated_at="2026-05-14T11:00:00+00:00"),
+    ]
+    for cohort in cohorts:
+        postgres.save_cohort(cohort)
+        in_memory.save_cohort(cohort)
+
+    for portfolio_id in ("PB_A", "PB_B", "PB_D", "PB_UNKNOWN", None):
+        assert postgres.list_cohorts(portfolio_id=portfolio_id, limit=2) == (
+            in_memory.list_cohorts(portfolio_id=portfolio_id, limit=2)
+        )
+    assert connection.executemany_calls == 3
+    assert len(connection.cohorts) == 3
+    assert connection.cohorts[cohorts[0].cohort_id]["generated_at"] == cohorts[3].generated_at
+
+
+def test_postgres_cohort_repository_requires_dsn_without_connection_factory() -> None:
+    with pytest.raises(RuntimeError, match="TACTICAL_HOUSE_VIEW_POSTGRES_DSN_REQUIRED"):
+        PostgresTacticalHouseViewCohortRepository(dsn="")
+
+
+def test_tactical_house_view_cohort_migration_indexes_portfolio_and_recency() -> None:
+    sql = " ".join(
+        (
+            Path("src")
+            / "infrastructure"
+            / "postgres_migrations"
+            / "proposals"
+            / "0013_tactical_house_view_cohorts.sql"
+        )
+        .read_text(encoding="utf-8")
+        .split()
+    )
+
+    assert "ON tactical_house_view_cohorts (generated_at DESC, cohort_id DESC)" in sql
+    assert "ON tactical_house_view_cohort_portfolios (portfolio_id, membership, cohort_id)" in sql
+    assert "PRIMARY KEY (cohort_id, membership, ordinal)" in sql
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.event_partitions import (
+    run_event_partition_maintenance,
+    start_event_partition_maintenance,
+)
+from src.api.observability import EVENT_PARTITION_MAINTENANCE_TOTAL
+from src.infrastructure.postgres_event_partitions import EventPartitionMaintenanceReport
+from src.runtime.event_partitions import event_partition_retention_months
+
+_NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+class _Maintainer:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    def maintain(self, *, as_of, months_ahead, retention_months_by_table):
+        self.calls.append(
+            {
+                "as_of": as_of,
+                "months_ahead": months_ahead,
+                "retention_months_by_table": dict(retention_months_by_table),
+            }
+        )
+        return [
+            EventPartitionMaintenanceReport(
+                table="advisory_workspace_events",
+                created_partitions=("advisory_workspace_events_p202611",),
+                dropped_partitions=("advisory_workspace_events_p202401",),
+                audit_events=(
+                    {
+                        "event_type": "ADVISORY_RECORD_PURGE_EXECUTED",
+                        "record_table": "advisory_workspace_events",
+                        "partition_month": "2024-01",
+                    },
+                ),
+            )
+        ]
+
+
+def _metric_value(outcome: str) -> float:
+    return EVENT_PARTITION_MAINTENANCE_TOTAL.labels(
+        record_table="advisory_workspace_events",
+        outcome=outcome,
+    )._value.get()
+
+
+def test_partition_maintenance_emits_purge_audit_events_and_metrics(caplog) -> None:
+    maintainer = _Maintainer()
+    created_before = _metric_value("created")
+    dropped_before = _metric_value("dropped")
+
+    with caplog.at_level(logging.INFO, logger="enterprise_readiness"):
+        reports = run_event_partition_maintenance(
+            maintainers=[maintainer],
+            months_ahead=2,
+            retention_months_by_table={"advisory_workspace_events": 18},
+            as_of=_NOW,
+        )
+
+    assert [report.table for report in reports] == ["advisory_workspace_events"]
+    assert maintainer.calls == [
+        {
+            "as_of": _NOW,
+            "months_ahead": 2,
+            "retention_months_by_table": {"advisory_workspace_events": 18},
+        }
+    ]
+    assert _metric_value("created") == created_before + 1
+    assert _metric_value("dropped") == dropped_before + 1
+    [audit_record] = [
+        record for record in caplog.records if record.getMessage() == "enterprise_audit_event"
+    ]
+    audit = audit_record.audit  # type: ignore[attr-defined]
+    assert audit["action"] == "ADVISORY_RECORD_PURGE_EXECUTED"
+    assert audit["metadata"]["partition_month"] == "2024-01"
+
+
+def test_partition_maintenance_is_disabled_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("EVENT_PARTITION_MAINTENANCE_ENABLED", raising=False)
+
+    assert asyncio.run(_start_maintenance()) is None
+
+
+async def _start_maintenance():
+    return start_event_partition_maintenance()
+
+
+def test_partition_retention_is_opt_in_per_table(monkeypatch) -> None:
+    monkeypatch.setenv("EVENT_PARTITION_RETENTION_MONTHS_PROPOSAL_WORKFLOW_EVENTS", "84")
+
+    assert event_partition_retention_months() == {"proposal_workflow_events": 84}
+
+
+def test_partition_retention_rejects_invalid_months(monkeypatch) -> None:
+    monkeypatch.setenv("EVENT_PARTITION_RETENTION_MONTHS_ADVISORY_WORKSPACE_EVENTS", "0")
+
+    with pytest.raises(
+        RuntimeError, match="EVENT_PARTITION_RETENTION_MONTHS_ADVISORY_WORKSPACE_EVENTS_INVALID"
+    ):
+        event_partition_retention_months()
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.api.idempotency_retention import (
+    run_idempotency_retention_sweep,
+    start_idempotency_retention_sweeper,
+)
+from src.api.observability import IDEMPOTENCY_RETENTION_RECORDS_TOTAL
+from src.core.record_lifecycle import (
+    IdempotencyRetentionCandidate,
+    IdempotencyRetentionSettings,
+)
+from src.runtime.idempotency_retention import idempotency_retention_settings
+
+_NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class _SingleTableStore:
+    def __init__(self) -> None:
+        self.rows = [
+            IdempotencyRetentionCandidate(
+                idempotency_key="workspace-secret-key",
+                created_at=(_NOW - timedelta(days=40)).isoformat(),
+            )
+        ]
+
+    def idempotency_retention_tables(self):
+        return ("advisory_workspace_idempotency",)
+
+    def list_idempotency_retention_candidates(self, *, table, created_before, after, limit):
+        return [] if after is not None else list(self.rows)
+
+    def delete_idempotency_records(self, *, table, idempotency_keys, created_before):
+        self.rows = [row for row in self.rows if row.idempotency_key not in idempotency_keys]
+        return len(idempotency_keys)
+
+
+def _metric_value(decision: str) -> float:
+    return IDEMPOTENCY_RETENTION_RECORDS_TOTAL.labels(
+        record_table="advisory_workspace_idempotency",
+        decision=decision,
+    )._value.get()
+
+
+def test_retention_sweep_emits_purge_audit_events_and_metrics(caplog) -> None:
+    purged_before = _metric_value("purged")
+    eligible_before = _metric_value("purge_eligible")
+
+    with caplog.at_level(logging.INFO, logger="enterprise_readiness"):
+        report = run_idempotency_retention_sweep(
+            stores=[_SingleTableStore()],
+            settings=IdempotencyRetentionSettings(),
+            now=lambda: _NOW,
+        )
+
+    assert report.purged == 1
+    assert _metric_value("purged") == purged_before + 1
+    assert _metric_value("purge_eligible") == eligible_before + 1
+    [audit_record] = [
+        record for record in caplog.records if record.getMessage() == "enterprise_audit_event"
+    ]
+    audit = audit_record.audit  # type: ignore[attr-defined]
+    assert audit["action"] == "ADVISORY_RECORD_PURGE_EXECUTED"
+    assert audit["metadata"]["record_table"] == "advisory_workspace_idempotency"
+    assert audit["metadata"]["purged_count"] == 1
+    assert "workspace-secret-key" not in str(audit)
+
+
+def test_retention_sweeper_is_disabled_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("IDEMPOTENCY_RETENTION_SWEEPER_ENABLED", raising=False)
+
+    assert asyncio.run(_start_sweeper()) is None
+
+
+async def _start_sweeper():
+    return start_idempotency_retention_sweeper()
+
+
+def test_retention_settings_read_per_table_ttl_overrides(monkeypatch) -> None:
+    monkeypatch.setenv("IDEMPOTENCY_RETENTION_TTL_HOURS_PROPOSAL_SIMULATION_IDEMPOTENCY", "12")
+    monkeypatch.setenv("IDEMPOTENCY_RETENTION_BATCH_SIZE", "250")
+
+    settings = idempotency_retention_settings()
+
+    assert settings.ttl_by_table["proposal_simulation_idempotency"] == timedelta(hours=12)
+    assert settings.ttl_by_table["proposal_idempotency"] == timedelta(days=30)
+    assert settings.batch_size == 250
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "error"),
+    [
+        (
+            "IDEMPOTENCY_RETENTION_TTL_HOURS_PROPOSAL_IDEMPOTENCY",
+            "0",
+            "IDEMPOTENCY_RETENTION_TTL_INVALID",
+        ),
+        ("IDEMPOTENCY_RETENTION_MAX_BATCHES", "many", "IDEMPOTENCY_RETENTION_MAX_BATCHES_INVALID"),
+    ],
+)
+def test_retention_settings_reject_invalid_environment(monkeypatch, name, value, error) -> None:
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(RuntimeError, match=error):
+        idempotency_retention_settings()
@@ -1,10 +1,21 @@
 import json
 import logging
+import time
+
+from prometheus_client import REGISTRY
 
 import src.api.observability as observability
 from src.api.observability import (
+    ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_TOKENS_TOTAL,
+    ADVISORY_COPILOT_DRAFT_CACHE_TOTAL,
+    ADVISORY_COPILOT_STREAM_LATENCY_SECONDS,
     JsonFormatter,
     correlation_id_var,
+    record_advisory_copilot_draft_cache,
+    record_advisory_copilot_stream_latency,
+    record_cpu_offload_task,
+    record_event_journal_events,
+    record_memo_materialization,
     record_policy_evaluation_operation,
     request_id_var,
     trace_id_var,
@@ -13,6 +24,11 @@ from src.api.observability_contracts import (
     POLICY_EVALUATION_OPERATION_FORBIDDEN_LABEL_FIELDS,
     POLICY_EVALUATION_OPERATION_METRIC_LABELS,
 )
+from src.core.advisory.simulation_baseline import reset_simulation_baseline_cache_for_tests
+from src.core.target_solver_cache import (
+    TARGET_SOLVER_PROBLEM_CACHE,
+    reset_target_solver_problem_cache_for_tests,
+)
 
 
 def test_json_formatter_includes_context_extra_and_audit_fields(monkeypatch):
@@ -134,3 +150,117 @@ def test_policy_evaluation_operation_metric_uses_bounded_safe_labels(monkeypatch
         fake_counter.labels_seen
     )
     assert caplog.records[-1].extra_fields == fake_counter.labels_seen
+
+
+def test_record_advisory_copilot_draft_cache_counts_outcome_and_avoided_tokens():
+    hits_before = ADVISORY_COPILOT_DRAFT_CACHE_TOTAL.labels(outcome="hit")._value.get()
+    tokens_before = ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_TOKENS_TOTAL._value.get()
+
+    record_advisory_copilot_draft_cache(
+        outcome="hit",
+        avoided_token_estimate=1140,
+        avoided_latency_ms=1800,
+    )
+    record_advisory_copilot_draft_cache(outcome="stored")
+
+    assert ADVISORY_COPILOT_DRAFT_CACHE_TOTAL.labels(outcome="hit")._value.get() == (
+        hits_before + 1
+    )
+    assert ADVISORY_COPILOT_DRAFT_CACHE_AVOIDED_TOKENS_TOTAL._value.get() == tokens_before + 1140
+
+
+def test_record_advisory_copilot_stream_latency_observes_phase_histogram():
+    histogram = ADVISORY_COPILOT_STREAM_LATENCY_SECONDS.labels(phase="first_byte")
+    sum_before = histogram._sum.get()
+
+    record_advisory_copilot_stream_latency(phase="first_byte", seconds=0.25)
+
+    assert histogram._sum.get() == sum_before + 0.25
+
+
+def test_simulation_baseline_cache_collector_exposes_lookup_outcomes():
+    reset_simulation_baseline_cache_for_tests()
+
+    assert (
+        REGISTRY.get_sample_value(
+            "lotus_advise_simulation_baseline_cache_lookups_total",
+            {"outcome": "hit"},
+        )
+        == 0
+    )
+    assert REGISTRY.get_sample_value("lotus_advise_simulation_baseline_cache_entries") == 0
+
+
+def test_target_solver_problem_cache_collector_exposes_lookups_and_solve_time():
+    reset_target_solver_problem_cache_for_tests()
+    TARGET_SOLVER_PROBLEM_CACHE.record_solve(started_at=time.perf_counter())
+
+    assert (
+        REGISTRY.get_sample_value(
+            "lotus_advise_target_solver_problem_cache_lookups_total",
+            {"outcome": "miss"},
+        )
+        == 0
+    )
+    assert REGISTRY.get_sample_value("lotus_advise_target_solver_problem_cache_entries") == 0
+    assert REGISTRY.get_sample_value("lotus_advise_target_solver_solve_seconds_count") == 1
+
+
+def test_cpu_offload_metrics_record_queue_time_only_for_process_tasks():
+    def sample(name: str, labels: dict[str, str]) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    queue_before = sample("lotus_advise_cpu_offload_queue_seconds_count", {"stage": "simulation"})
+    process_before = sample(
+        "lotus_advise_cpu_offload_run_seconds_count", {"stage": "simulation", "mode": "process"}
+    )
+    inline_before = sample(
+        "lotus_advise_cpu_offload_run_seconds_count", {"stage": "simulation", "mode": "inline"}
+    )
+
+    record_cpu_offload_task(stage="simulation", mode="process", queue_seconds=0.02, run_seconds=0.3)
+    record_cpu_offload_task(stage="simulation", mode="inline", queue_seconds=0.0, run_seconds=0.2)
+
+    assert (
+        sample("lotus_advise_cpu_offload_queue_seconds_count", {"stage": "simulation"})
+        == queue_before + 1
+    )
+    assert (
+        sample(
+            "lotus_advise_cpu_offload_run_seconds_count",
+            {"stage": "simulation", "mode": "process"},
+        )
+        == process_before + 1
+    )
+    assert (
+        sample(
+            "lotus_advise_cpu_offload_run_seconds_count", {"stage": "simulation", "mode": "inline"}
+        )
+        == inline_before + 1
+    )
+
+
+def test_memo_materialization_metric_counts_event_and_outcome():
+    labels = {"event": "lookup", "outcome": "hit"}
+    before = (
+        REGISTRY.get_sample_value("lotus_advise_memo_evidence_pack_materialization_total", labels)
+        or 0.0
+    )
+
+    record_memo_materialization(event="lookup", outcome="hit")
+
+    assert (
+        REGISTRY.get_sample_value("lotus_advise_memo_evidence_pack_materialization_total", labels)
+        == before + 1
+    )
+
+
+def test_event_journal_metric_counts_events_by_family_and_outcome():
+    labels = {"family": "memo_event", "outcome": "flushed"}
+    before = REGISTRY.get_sample_value("lotus_advise_event_journal_events_total", labels) or 0.0
+
+    record_event_journal_events(family="memo_event", outcome="flushed", count=3)
+
+    assert REGISTRY.get_sample_value("lotus_advise_event_journal_events_total", labels) == (
+        before + 3
+    )
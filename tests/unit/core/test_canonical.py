@@ -1,3 +1,10 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
 from src.core.common.canonical import canonical_json, hash_canonical_payload, strip_keys
 
 
@@ -32,3 +39,81 @@ def test_strip_keys_removes_excluded_keys_recursively_without_mutating_source()
     }
     assert payload["content_hash"] == "sha256:old"
     assert payload["nested"]["value"]["content_hash"] == "sha256:nested"
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_STORED_FIXTURES = sorted(
+    path
+    for pattern in (
+        "tests/fixtures/**/*.json",
+        "tests/unit/**/golden_data/*.json",
+        "docs/**/*.json",
+        "contracts/**/*.json",
+    )
+    for path in _REPO_ROOT.glob(pattern)
+)
+_HASH_EXCLUDED_KEYS = {"created_at", "correlation_id", "generated_at", "artifact_hash"}
+
+
+def _reference_hash(payload: Any, *, exclude: set[str]) -> str:
+    stripped = strip_keys(payload, exclude=exclude)
+    encoded = json.dumps(stripped, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+
+
+def test_hash_canonical_payload_streams_large_containers_identically() -> None:
+    payload = {
+        "created_at": "2026-06-19T00:00:00Z",
+        "rows": [
+            {"id": f"row_{index}", "weight": index / 7, "label": "caf\u00e9", "tags": ("a", index)}
+            for index in range(100)
+        ],
+        "weights": {f"EQ_{index:03d}": str(index) for index in range(64)},
+        "ordinals": {index: index for index in range(40)},
+        "empty": {"list": [], "map": {}},
+    }
+
+    assert hash_canonical_payload(payload) == _reference_hash(payload, exclude=set())
+    assert hash_canonical_payload(payload, exclude={"created_at", "label"}) == _reference_hash(
+        payload, exclude={"created_at", "label"}
+    )
+    assert canonical_json(payload, exclude={"created_at"}) == canonical_json(
+        strip_keys(payload, exclude={"created_at"})
+    )
+    assert "created_at" in payload
+
+
+def test_stored_fixtures_exist_for_canonical_hash_parity() -> None:
+    assert len(_STORED_FIXTURES) >= 20
+
+
+@pytest.mark.parametrize(
+    "fixture_path",
+    _STORED_FIXTURES,
+    ids=[str(path.relative_to(_REPO_ROOT)) for path in _STORED_FIXTURES],
+)
+def test_hash_canonical_payload_matches_reference_on_stored_fixtures(fixture_path: Path) -> None:
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+
+    assert hash_canonical_payload(payload) == _reference_hash(payload, exclude=set())
+    assert hash_canonical_payload(payload, exclude=_HASH_EXCLUDED_KEYS) == _reference_hash(
+        payload, exclude=_HASH_EXCLUDED_KEYS
+    )
+
+
+def test_hash_canonical_payload_skips_excluded_keys_inside_small_containers() -> None:
+    payload = {
+        "created_at": "2026-06-19T00:00:00Z",
+        "legs": [{"created_at": "2026-06-19T00:00:00Z", "side": "BUY", "weights": {2: "0.5"}}],
+        "ordinals": {1: {"label": "a", "created_at": "x"}, 10: "b"},
+        "flat": {"amount": "100.00", "tags": ("created_at", 1)},
+    }
+    exclude = {"created_at"}
+
+    assert hash_canonical_payload(payload, exclude=exclude) == _reference_hash(
+        payload, exclude=exclude
+    )
+    assert canonical_json(payload, exclude=exclude) == canonical_json(
+        strip_keys(payload, exclude=exclude)
+    )
+    assert payload["legs"][0]["created_at"] == "2026-06-19T00:00:00Z"
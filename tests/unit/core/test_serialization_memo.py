@@ -0,0 +1,70 @@
+from pydantic import BaseModel
+
+from src.core.common.canonical import hash_canonical_payload
+from src.core.common.serialization_memo import (
+    SerializationCounts,
+    dump_model_json,
+    hash_model_json,
+    request_serialization_scope,
+    seal_request_models,
+)
+
+
+class _Holding(BaseModel):
+    instrument_id: str
+    quantity: str
+
+
+def test_serialization_memo_dumps_every_call_outside_a_scope() -> None:
+    holding = _Holding(instrument_id="EQ_1", quantity="10")
+    seal_request_models(holding)
+
+    first = dump_model_json(holding)
+    second = dump_model_json(holding)
+
+    assert first == second == {"instrument_id": "EQ_1", "quantity": "10"}
+    assert first is not second
+    assert hash_model_json(holding) == hash_canonical_payload(first)
+
+
+def test_serialization_memo_reuses_sealed_model_dumps_and_hashes() -> None:
+    holding = _Holding(instrument_id="EQ_1", quantity="10")
+
+    with request_serialization_scope() as memo:
+        seal_request_models(holding, None)
+        first = dump_model_json(holding)
+        second = dump_model_json(holding)
+        digest = hash_model_json(holding)
+        assert hash_model_json(holding) == digest
+
+    assert first is second
+    assert digest == hash_canonical_payload(first)
+    assert memo.counts() == SerializationCounts(serialized=1, reused=3)
+
+
+def test_serialization_memo_never_reuses_unsealed_models() -> None:
+    holding = _Holding(instrument_id="EQ_1", quantity="10")
+
+    with request_serialization_scope() as memo:
+        first = dump_model_json(holding)
+        holding.quantity = "11"
+        second = dump_model_json(holding)
+
+    assert first["quantity"] == "10"
+    assert second["quantity"] == "11"
+    assert memo.counts() == SerializationCounts(serialized=2, reused=0)
+
+
+def test_nested_serialization_scope_adds_counts_to_enclosing_scope() -> None:
+    holding = _Holding(instrument_id="EQ_1", quantity="10")
+
+    with request_serialization_scope() as outer:
+        with request_serialization_scope() as inner:
+            seal_request_models(holding)
+            dump_model_json(holding)
+            dump_model_json(holding)
+        # The inner memo is released, so the outer scope has not seen this model sealed.
+        dump_model_json(holding)
+
+    assert inner.counts() == SerializationCounts(serialized=1, reused=1)
+    assert outer.counts() == SerializationCounts(serialized=2, reused=1)
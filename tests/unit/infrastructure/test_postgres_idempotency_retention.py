@@ -0,0 +1,132 @@
+import pytest
+
+from src.core.record_lifecycle import IdempotencyRetentionCandidate
+from src.infrastructure.postgres_idempotency_retention import (
+    ADVISORY_COPILOT_IDEMPOTENCY_RETENTION_TABLES,
+    POLICY_IDEMPOTENCY_RETENTION_TABLES,
+    PROPOSAL_IDEMPOTENCY_RETENTION_TABLES,
+    WORKSPACE_IDEMPOTENCY_RETENTION_TABLES,
+    PostgresIdempotencyRetentionStore,
+)
+
+
+class _Cursor:
+    def __init__(self, rows=None, rowcount=0):
+        self._rows = rows or []
+        self.rowcount = rowcount
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _Connection:
+    def __init__(self, *, rows=None, rowcount=0) -> None:
+        self.rows = rows or []
+        self.rowcount = rowcount
+        self.executed: list[tuple[str, tuple]] = []
+        self.commits = 0
+
+    def execute(self, query, args=None):
+        self.executed.append((" ".join(str(query).split()), args))
+        return _Cursor(rows=self.rows, rowcount=self.rowcount)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def close(self) -> None:
+        return None
+
+
+def test_candidate_query_pages_by_indexed_created_at_keyset() -> None:
+    connection = _Connection(
+        rows=[
+            {
+                "idempotency_key": "idem-2",
+                "created_at": "2026-01-02T00:00:00+00:00",
+                "legal_hold": False,
+                "dependent_record_refs": ["pop_1"],
+            }
+        ]
+    )
+    store = PostgresIdempotencyRetentionStore(
+        tables=PROPOSAL_IDEMPOTENCY_RETENTION_TABLES,
+        connect=lambda: connection,
+    )
+
+    candidates = store.list_idempotency_retention_candidates(
+        table="proposal_idempotency",
+        created_before="2026-02-01T00:00:00+00:00",
+        after=IdempotencyRetentionCandidate(
+            idempotency_key="idem-1",
+            created_at="2026-01-01T00:00:00+00:00",
+        ),
+        limit=100,
+    )
+
+    [(sql, args)] = connection.executed
+    assert "FROM proposal_idempotency i" in sql
+    assert "FROM proposal_async_operations o" in sql
+    assert "o.status IN ('PENDING', 'RUNNING')" in sql
+    assert "(i.created_at, i.idempotency_key) > (%s, %s)" in sql
+    assert "ORDER BY i.created_at ASC, i.idempotency_key ASC LIMIT %s" in sql
+    assert args == ("2026-02-01T00:00:00+00:00", "2026-01-01T00:00:00+00:00", "idem-1", 100)
+    assert candidates == [
+        IdempotencyRetentionCandidate(
+            idempotency_key="idem-2",
+            created_at="2026-01-02T00:00:00+00:00",
+            dependent_record_refs=("pop_1",),
+        )
+    ]
+
+
+def test_copilot_candidates_inherit_run_legal_hold() -> None:
+    connection = _Connection()
+    store = PostgresIdempotencyRetentionStore(
+        tables=ADVISORY_COPILOT_IDEMPOTENCY_RETENTION_TABLES,
+        connect=lambda: connection,
+    )
+
+    store.list_idempotency_retention_candidates(
+        table="advisory_copilot_run_idempotency",
+        created_before="2026-02-01T00:00:00+00:00",
+        after=None,
+        limit=10,
+    )
+
+    [(sql, args)] = connection.executed
+    assert "LEFT JOIN advisory_copilot_runs r ON r.run_id = i.run_id" in sql
+    assert "COALESCE(r.legal_hold, FALSE) AS legal_hold" in sql
+    assert args == ("2026-02-01T00:00:00+00:00", "", "", 10)
+
+
+def test_delete_rechecks_cutoff_and_commits_chunk() -> None:
+    connection = _Connection(rowcount=2)
+    store = PostgresIdempotencyRetentionStore(
+        tables=WORKSPACE_IDEMPOTENCY_RETENTION_TABLES,
+        connect=lambda: connection,
+    )
+
+    deleted = store.delete_idempotency_records(
+        table="advisory_workspace_idempotency",
+        idempotency_keys=("a", "b"),
+        created_before="2026-02-01T00:00:00+00:00",
+    )
+
+    [(sql, args)] = connection.executed
+    assert deleted == 2
+    assert connection.commits == 1
+    assert sql == (
+        "DELETE FROM advisory_workspace_idempotency "
+        "WHERE idempotency_key = ANY(%s) AND created_at < %s"
+    )
+    assert args == (["a", "b"], "2026-02-01T00:00:00+00:00")
+
+
+def test_store_rejects_unsupported_tables_and_missing_dsn() -> None:
+    with pytest.raises(ValueError, match="IDEMPOTENCY_RETENTION_TABLE_UNSUPPORTED"):
+        PostgresIdempotencyRetentionStore(
+            tables=("proposal_records",),  # type: ignore[arg-type]
+            connect=lambda: _Connection(),
+        )
+    with pytest.raises(RuntimeError, match="IDEMPOTENCY_RETENTION_POSTGRES_DSN_REQUIRED"):
+        PostgresIdempotencyRetentionStore(tables=POLICY_IDEMPOTENCY_RETENTION_TABLES)
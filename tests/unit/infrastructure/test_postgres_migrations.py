@@ -246,3 +246,88 @@ def test_proposal_lifecycle_integrity_migration_adds_relational_guards() -> None
     assert "current_state IN (" in sql
     assert "event_type IN (" in sql
     assert "approval_type IN ('RISK', 'COMPLIANCE', 'CLIENT_CONSENT')" in sql
+
+
+@pytest.mark.parametrize(
+    ("namespace", "migration_name", "tables"),
+    [
+        (
+            "proposals",
+            "0011_idempotency_retention_indexes.sql",
+            (
+                "proposal_idempotency",
+                "proposal_simulation_idempotency",
+                "proposal_memo_idempotency",
+                "advisor_cockpit_acknowledgement_idempotency",
+            ),
+        ),
+        (
+            "workspace",
+            "0002_idempotency_retention_indexes.sql",
+            ("advisory_workspace_idempotency",),
+        ),
+        (
+            "policy_packs",
+            "0003_idempotency_retention_indexes.sql",
+            ("policy_evaluation_idempotency", "policy_pack_catalog_idempotency"),
+        ),
+        (
+            "advisory_copilot",
+            "0004_idempotency_retention_indexes.sql",
+            ("advisory_copilot_run_idempotency",),
+        ),
+    ],
+)
+def test_idempotency_retention_migrations_index_created_at_keyset(
+    namespace: str, migration_name: str, tables: tuple[str, ...]
+) -> None:
+    migration_path = Path("src") / "infrastructure" / "postgres_migrations" / namespace
+    sql = " ".join((migration_path / migration_name).read_text(encoding="utf-8").split())
+
+    for table in tables:
+        assert (
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_retention "
+            f"ON {table} (created_at ASC, idempotency_key ASC)"
+        ) in sql
+
+
+@pytest.mark.parametrize(
+    ("namespace", "file_name", "table_name", "primary_key"),
+    [
+        (
+            "proposals",
+            "0012_partition_event_tables.sql",
+            "proposal_workflow_events",
+            "event_id, occurred_at",
+        ),
+        (
+            "proposals",
+            "0012_partition_event_tables.sql",
+            "proposal_memo_events",
+            "event_id, occurred_at",
+        ),
+        (
+            "policy_packs",
+            "0004_partition_policy_evaluation_audit_events.sql",
+            "policy_evaluation_audit_events",
+            "evaluation_id, event_id, occurred_at",
+        ),
+        (
+            "workspace",
+            "0003_partition_workspace_events.sql",
+            "advisory_workspace_events",
+            "workspace_id, event_id, occurred_at",
+        ),
+    ],
+)
+def test_event_partition_migrations_copy_rows_into_monthly_partitioned_tables(
+    namespace: str, file_name: str, table_name: str, primary_key: str
+) -> None:
+    migration_path = Path("src") / "infrastructure" / "postgres_migrations" / namespace / file_name
+    sql = " ".join(migration_path.read_text(encoding="utf-8").split())
+
+    assert f"ALTER TABLE {table_name} RENAME TO {table_name}_unpartitioned" in sql
+    assert f"PRIMARY KEY ({primary_key}) ) PARTITION BY RANGE (occurred_at)" in sql
+    assert f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT" in sql
+    assert f"INSERT INTO {table_name} SELECT * FROM {table_name}_unpartitioned" in sql
+    assert f"DROP TABLE {table_name}_unpartitioned" in sql
@@ -43,13 +43,19 @@ def test_cutover_contract_includes_persistence_migration_namespaces():
     assert "workspace" in production_cutover_contract.CUTOVER_MIGRATION_NAMESPACES
     assert production_cutover_contract.expected_migration_versions(
         namespace="advisory_copilot"
-    ) == ["0001", "0002", "0003"]
+    ) == ["0001", "0002", "0003", "0004", "0005"]
     assert production_cutover_contract.expected_migration_versions(namespace="policy_packs") == [
         "0001",
         "0002",
+        "0003",
+        "0004",
+        "0005",
+        "0006",
     ]
     assert production_cutover_contract.expected_migration_versions(namespace="workspace") == [
-        "0001"
+        "0001",
+        "0002",
+        "0003",
     ]
 
 
@@ -63,7 +63,8 @@ def test_rfc0025_slice15_supportability_truth_is_centralized_and_current() -> No
     assert "policy_runtime_supportability()" in catalog_definitions
     assert "policy_runtime_supportability()" in evaluation
     assert "PolicyEvaluationRecordStore" in persistence
-    assert "policy_evaluation_api_posture()" in persistence_store
+    assert "build_policy_evaluation_review_queue_response(" in persistence_store
+    assert "queue_posture=policy_evaluation_api_posture()" in persistence_projection
     assert "policy_runtime_supportability()" in persistence_projection
     assert "policy_sign_off_package_posture()" in workflow
 